@@ -0,0 +1,246 @@
+from sqlalchemy import select, insert, update
+from src.db import (
+    Database, User, ProjectEntry, HistoricalProject, ProjectUser,
+    _encode_notes
+)
+
+import argparse
+import importlib.util
+import random
+import statistics
+import time
+import json
+import os
+
+
+DIMENSIONS = ("users", "projects", "revisions", "members")
+BATCH_SIZE = 1000
+
+
+def _batched(rows):
+    rows = iter(rows)
+    while batch := [row for _, row in zip(range(BATCH_SIZE), rows)]:
+        yield batch
+
+
+def _history(notes, revisions, keyframe_interval):
+    lines = notes.splitlines(keepends=True)
+    previous, depth = notes, 0
+    for seq in range(2, revisions + 1):
+        lines[seq % len(lines)] = f"edit {seq}\n"
+        stored, delta, depth = _encode_notes(
+            current := "".join(lines), previous, depth, keyframe_interval
+        )
+        previous = current
+        yield seq, stored, delta, depth
+
+
+def _seed(database, rng, users, projects, revisions, members, notes):
+    with database._session_factory() as session, session.begin():
+        for batch in _batched(
+            {"username": f"user{i}", "password_hash": "-"}
+            for i in range(users)
+        ):
+            session.execute(insert(User), batch)
+        user_ids = [*session.scalars(select(User.id).order_by(User.id))]
+    owner = user_ids[0]
+    database.create_projects([{
+        "owner_id": owner,
+        "users": rng.sample(user_ids[1:], members),
+        "notes": notes,
+    } for _ in range(projects)])
+    if revisions == 1:
+        return owner, user_ids
+    with database._session_factory() as session, session.begin():
+        first = {
+            revision.project_id: revision for revision in session.scalars(
+                select(HistoricalProject)
+            )
+        }
+        history = [
+            *_history(notes, revisions, database.notes_keyframe_interval)
+        ]
+        for batch in _batched(
+            {
+                "project_id": project_id, "seq": seq, "created_by": owner,
+                "urgency": f"level {seq}", "notes": stored,
+                "notes_delta": delta, "notes_depth": depth,
+            }
+            for project_id in first
+            for seq, stored, delta, depth in history
+        ):
+            session.execute(insert(HistoricalProject), batch)
+        member_ids = {
+            revision.id: [user.user_id for user in revision.project_users]
+            for revision in first.values()
+        }
+        latest = {}
+        added = session.execute(
+            select(
+                HistoricalProject.id, HistoricalProject.project_id,
+                HistoricalProject.seq
+            ).where(HistoricalProject.seq > 1)
+        ).all()
+        for batch in _batched(
+            {"project_id": id, "user_id": user_id}
+            for id, project_id, _ in added
+            for user_id in member_ids[first[project_id].id]
+        ):
+            session.execute(insert(ProjectUser), batch)
+        for id, project_id, seq in added:
+            if seq == revisions:
+                latest[project_id] = id
+        session.execute(update(ProjectEntry), [
+            {"id": project_id, "latest_revision_id": id,
+             "revision_seq": revisions}
+            for project_id, id in latest.items()
+        ])
+    return owner, user_ids
+
+
+def _measure(fn, repeat, setup=None):
+    samples = []
+    for i in range(repeat):
+        args = setup(i) if setup is not None else ()
+        start = time.perf_counter()
+        fn(*args)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def _operations(database, owner, user_ids, projects, members, notes):
+    def project(i):
+        return (projects[i % len(projects)],)
+
+    def revision_to_remove(i):
+        project = projects[i % len(projects)]
+        project.update(owner, urgency=f"remove {i}")
+        return project, project.get_latest().id
+
+    def has_user_cold(project):
+        database.memberships.clear()
+        project.has_user(user_ids[-1])
+
+    return {
+        "create_project": (lambda: database.create_project(
+            owner, users=user_ids[1:members + 1], notes=notes
+        ), None),
+        "update": (
+            lambda project: project.update(owner, urgency="bench"), project
+        ),
+        "get_history": (lambda project: project.get_history(), project),
+        "get_latest": (lambda project: project.get_latest(), project),
+        "get_users": (lambda project: project.get_users(), project),
+        "has_user": (
+            lambda project: project.has_user(user_ids[-1]), project
+        ),
+        "has_user_cold": (has_user_cold, project),
+        "remove": (
+            lambda project, id: project.remove(HistoricalProject.id == id),
+            revision_to_remove
+        ),
+        "get_projects": (database.get_projects, None),
+        "users.get_all": (database.users.get_all, None),
+    }
+
+
+def run(uri, base, sweeps, repeat, note_lines):
+    notes = "".join(f"note line {i}\n" for i in range(note_lines))
+    datasets = [("base", dict(base))] + [
+        (dimension, dict(base, **{dimension: value}))
+        for dimension, values in sweeps.items() for value in values
+        if value != base[dimension]
+    ]
+    results = []
+    for dimension, sizes in datasets:
+        if sizes["members"] >= sizes["users"]:
+            print(f"skipping {sizes}: members must be fewer than users")
+            continue
+        database = Database(uri, drop_before_load=True)
+        owner, user_ids = _seed(
+            database, random.Random(0), notes=notes, **sizes
+        )
+        projects = database.get_projects()
+        for name, (fn, setup) in _operations(
+            database, owner, user_ids, projects, sizes["members"], notes
+        ).items():
+            results.append({
+                "operation": name,
+                "sweep": dimension,
+                **sizes,
+                "time_s": _measure(fn, repeat, setup),
+            })
+            print(json.dumps(results[-1]))
+        database.engine.dispose()
+    return results
+
+
+def plot(results, base, directory):
+    import matplotlib
+    matplotlib.use("Agg")
+    from matplotlib import pyplot
+
+    os.makedirs(directory, exist_ok=True)
+    operations = sorted({result["operation"] for result in results})
+    for dimension in DIMENSIONS:
+        points = [
+            result for result in results
+            if result["sweep"] in ("base", dimension)
+        ]
+        if len({result[dimension] for result in points}) < 2:
+            continue
+        figure, axes = pyplot.subplots()
+        for operation in operations:
+            series = sorted(
+                (result[dimension], result["time_s"]) for result in points
+                if result["operation"] == operation
+            )
+            axes.plot(*zip(*series), marker="o", label=operation)
+        axes.set_xscale("log")
+        axes.set_yscale("log")
+        axes.set_xlabel(dimension)
+        axes.set_ylabel("median time [s]")
+        axes.set_title(", ".join(
+            f"{key}={value}" for key, value in base.items()
+            if key != dimension
+        ))
+        axes.legend(fontsize="small")
+        figure.savefig(os.path.join(directory, f"{dimension}.png"))
+        pyplot.close(figure)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Measure Database and _Project operations on synthetic "
+                    "datasets, sweeping one dataset dimension at a time"
+    )
+    parser.add_argument(
+        "--uri", default=os.environ.get(
+            "SQL_BENCH_URI", "sqlite:///bench_database.db"
+        )
+    )
+    parser.add_argument("--users", type=int, nargs="+", default=[100, 1000])
+    parser.add_argument("--projects", type=int, nargs="+", default=[10, 100])
+    parser.add_argument(
+        "--revisions", type=int, nargs="+", default=[1, 10, 100]
+    )
+    parser.add_argument("--members", type=int, nargs="+", default=[5, 50])
+    parser.add_argument("--note-lines", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--output", help="write results as JSON")
+    parser.add_argument("--plot", help="write scaling plots to a directory")
+    args = parser.parse_args(argv)
+    if args.plot and importlib.util.find_spec("matplotlib") is None:
+        parser.error("--plot requires matplotlib")
+    sweeps = {dimension: getattr(args, dimension) for dimension in DIMENSIONS}
+    base = {dimension: values[0] for dimension, values in sweeps.items()}
+    results = run(args.uri, base, sweeps, args.repeat, args.note_lines)
+    if args.output:
+        with open(args.output, "w") as out:
+            json.dump(results, out, indent=2)
+    if args.plot:
+        plot(results, base, args.plot)
+
+
+if __name__ == '__main__':
+    main()
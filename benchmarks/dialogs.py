@@ -0,0 +1,68 @@
+from PyQt5.QtWidgets import QApplication, QDialog, QMainWindow
+from PyQt5 import uic
+from src import utils
+
+import argparse
+import glob
+import json
+import os
+import statistics
+import time
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RES = os.path.join(ROOT, "src", "res")
+
+
+def _measure(load, ui_file, base, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        widget = load(ui_file, base())
+        samples.append(time.perf_counter() - start)
+        widget.deleteLater()
+    QApplication.processEvents()
+    return statistics.median(samples)
+
+
+def run(repeat):
+    implementations = {
+        "loadUi": uic.loadUi,
+        "compiled": utils.load_ui,
+    }
+    results = []
+    for ui_file in sorted(glob.glob(os.path.join(RES, "*.ui"))):
+        with open(ui_file) as f_ui:
+            base = QMainWindow if 'class="QMainWindow"' in f_ui.read(
+                4096
+            ) else QDialog
+        if utils._compiled_form(ui_file) is None:
+            print(f"skipping {ui_file}: no up-to-date compiled form")
+            continue
+        for name, implementation in implementations.items():
+            results.append({
+                "form": os.path.basename(ui_file),
+                "implementation": name,
+                "open_s": _measure(implementation, ui_file, base, repeat),
+            })
+            print(json.dumps(results[-1]))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Compare form construction with uic.loadUi against "
+                    "the precompiled pyuic5 modules in src/ui"
+    )
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--output", help="write results as JSON")
+    args = parser.parse_args(argv)
+    app = QApplication([])
+    results = run(args.repeat)
+    if args.output:
+        with open(args.output, "w") as out:
+            json.dump(results, out, indent=2)
+
+
+if __name__ == '__main__':
+    main()
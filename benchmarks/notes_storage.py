@@ -0,0 +1,94 @@
+from sqlalchemy import select, func
+from src.db import Database, HistoricalProject
+
+import argparse
+import random
+import time
+import json
+import os
+
+
+def _stored_bytes(database, project):
+    with database._session_factory() as session:
+        return session.execute(
+            select(
+                func.coalesce(func.sum(func.length(HistoricalProject.notes)), 0)
+                + func.coalesce(
+                    func.sum(func.length(HistoricalProject.notes_delta)), 0
+                )
+            ).where(HistoricalProject.project_id == project.id)
+        ).scalar_one()
+
+
+def _timed(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def run(uri, history_lengths, keyframe_intervals, note_lines, repeat):
+    rng = random.Random(0)
+    results = []
+    for keyframe_interval in keyframe_intervals:
+        database = Database(
+            uri, drop_before_load=True,
+            notes_keyframe_interval=keyframe_interval
+        )
+        user = database.users.create(username="bench", password_hash="-")
+        for history_length in history_lengths:
+            lines = [f"note line {i}\n" for i in range(note_lines)]
+            project = database.create_project(user, notes="".join(lines))
+            full_bytes = len("".join(lines))
+            for revision in range(history_length - 1):
+                lines[rng.randrange(note_lines)] = f"edit {revision}\n"
+                project.update(user, notes="".join(lines))
+                full_bytes += len("".join(lines))
+            history = project.get_history()
+            results.append({
+                "keyframe_interval": keyframe_interval,
+                "history_length": history_length,
+                "full_copy_bytes": full_bytes,
+                "stored_bytes": _stored_bytes(database, project),
+                "get_latest_s": _timed(project.get_latest, repeat),
+                "get_oldest_s": _timed(
+                    lambda: project.get(history[0].id), repeat
+                ),
+                "get_history_s": _timed(project.get_history, repeat),
+            })
+            print(json.dumps(results[-1]))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Measure notes storage and reconstruction cost versus "
+                    "history length"
+    )
+    parser.add_argument(
+        "--uri", default=os.environ.get(
+            "SQL_BENCH_URI", "sqlite:///bench_notes.db"
+        )
+    )
+    parser.add_argument(
+        "--history", type=int, nargs="+", default=[10, 100, 1000]
+    )
+    parser.add_argument(
+        "--keyframe-interval", type=int, nargs="+", default=[1, 16, 64],
+        help="1 stores a full copy in every revision"
+    )
+    parser.add_argument("--note-lines", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="write results as JSON")
+    args = parser.parse_args(argv)
+    results = run(
+        args.uri, args.history, args.keyframe_interval, args.note_lines,
+        args.repeat
+    )
+    if args.output:
+        with open(args.output, "w") as out:
+            json.dump(results, out, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+import argparse
+import compileall
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RES = os.path.join(ROOT, "src", "res")
+
+_PROBE = """
+import sys, time
+start = time.perf_counter()
+from PyQt5.QtCore import QResource
+from PyQt5.QtGui import QGuiApplication, QFontDatabase
+app = QGuiApplication([])
+qt_ready = time.perf_counter()
+{load}
+loaded = time.perf_counter()
+assert QFontDatabase.addApplicationFont(":/fonts/cmunss.ttf") != -1
+print(qt_ready - start, loaded - qt_ready, time.perf_counter() - loaded)
+"""
+_LOADERS = {
+    "module": "import resources",
+    "bundle": "assert QResource.registerResource({bundle!r})",
+}
+
+
+def _probe(loader, directory, bundle):
+    output = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(
+            load=_LOADERS[loader].format(bundle=bundle)
+        )],
+        cwd=directory, check=True, capture_output=True, text=True,
+        env={
+            **os.environ,
+            "QT_QPA_PLATFORM": "offscreen",
+            "PYTHONDONTWRITEBYTECODE": "1"
+        }
+    ).stdout.split()
+    return [float(value) for value in output]
+
+
+def run(repeat, bundle):
+    with tempfile.TemporaryDirectory() as directory:
+        module = os.path.join(directory, "resources.py")
+        subprocess.run(
+            ["pyrcc5", os.path.join(RES, "resources.qrc"), "-o", module],
+            check=True
+        )
+        scenarios = {
+            "module_cold": ("module", False),
+            "module_warm": ("module", True),
+            "bundle": ("bundle", False),
+        }
+        results = []
+        for name, (loader, precompiled) in scenarios.items():
+            if precompiled:
+                compileall.compile_file(module, quiet=1)
+            samples = [
+                _probe(loader, directory, bundle) for _ in range(repeat)
+            ]
+            results.append({
+                "scenario": name,
+                "qt_init_s": statistics.median(s[0] for s in samples),
+                "load_resources_s": statistics.median(s[1] for s in samples),
+                "add_font_s": statistics.median(s[2] for s in samples),
+            })
+            print(json.dumps(results[-1]))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Compare making the embedded font available from the "
+                    "pyrcc5 Python module and from the binary .rcc bundle"
+    )
+    parser.add_argument(
+        "--bundle", default=os.path.join(RES, "resources.rcc")
+    )
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--output", help="write results as JSON")
+    args = parser.parse_args(argv)
+    results = run(args.repeat, args.bundle)
+    if args.output:
+        with open(args.output, "w") as out:
+            json.dump(results, out, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,171 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PHASES = (
+    "import_qt", "import_sqlalchemy", "import_db", "database_init",
+    "import_main", "qapplication", "font", "load_ui", "startup_dialog",
+    "first_show", "total"
+)
+
+_PROBE = """
+import time
+started = time.perf_counter()
+import json, sys
+sys.path.insert(0, "src")
+phases = {}
+
+
+def phase(name, start):
+    phases[name] = phases.get(name, 0) + time.perf_counter() - start
+
+
+def timed(name, fn):
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            phase(name, start)
+    return wrapper
+
+
+start = time.perf_counter()
+from PyQt5 import QtCore, QtGui, QtWidgets
+phase("import_qt", start)
+start = time.perf_counter()
+import sqlalchemy, sqlalchemy.orm
+phase("import_sqlalchemy", start)
+start = time.perf_counter()
+import db, utils
+phase("import_db", start)
+db.Database.__init__ = timed("database_init", db.Database.__init__)
+utils.add_font_resource = timed("font", utils.add_font_resource)
+utils.load_ui = timed("load_ui", utils.load_ui)
+start = time.perf_counter()
+import main
+phase("import_main", start)
+phases["import_main"] -= phases["database_init"]
+start = time.perf_counter()
+app = QtWidgets.QApplication([])
+phase("qapplication", start)
+start = time.perf_counter()
+window = main.StartupDialog(just_logged_out=True)
+phase("startup_dialog", start)
+phases["startup_dialog"] -= phases["font"] + phases["load_ui"]
+start = time.perf_counter()
+window.show()
+while not window.isVisible() or not window.windowHandle().isExposed():
+    app.processEvents()
+app.processEvents()
+phase("first_show", start)
+phases["total"] = time.perf_counter() - started
+print(json.dumps(phases))
+"""
+
+
+def _probe(uri):
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _PROBE],
+        cwd=ROOT, check=True, capture_output=True, text=True,
+        env={**os.environ, "QT_QPA_PLATFORM": "offscreen", "SQL_URI": uri}
+    )
+    phases = json.loads(process.stdout.splitlines()[-1])
+    imports = []
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        imports.append({
+            "module": name.strip(),
+            "self_s": int(self_us) / 1e6,
+            "cumulative_s": int(cumulative_us) / 1e6,
+        })
+    return phases, imports
+
+
+def run(uri, repeat, top):
+    samples, imports = [], []
+    for _ in range(repeat + 1):
+        phases, imports = _probe(uri)
+        samples.append(phases)
+    samples = samples[1:]
+    result = {
+        "phases_s": {
+            name: statistics.median(sample[name] for sample in samples)
+            for name in samples[0]
+        },
+        "imports": sorted(
+            (entry for entry in imports if "." not in entry["module"]),
+            key=lambda entry: entry["cumulative_s"], reverse=True
+        )[:top],
+    }
+    return result
+
+
+def _budget(value):
+    name, _, limit = value.rpartition("=")
+    return name or "total", float(limit) / 1000
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Measure headless startup of StartupDialog per phase "
+                    "and fail when a time budget is exceeded"
+    )
+    parser.add_argument(
+        "--uri", default=os.environ.get(
+            "SQL_BENCH_URI", "sqlite:///bench_startup.db"
+        )
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--top", type=int, default=15,
+        help="number of top-level imports to report from -X importtime"
+    )
+    parser.add_argument(
+        "--budget", type=_budget, action="append", default=[],
+        metavar="[PHASE=]MS",
+        help="fail when the median of PHASE (default: total) exceeds MS "
+             "milliseconds; may be repeated"
+    )
+    parser.add_argument("--output", help="write results as JSON")
+    args = parser.parse_args(argv)
+    if unknown := [name for name, _ in args.budget if name not in PHASES]:
+        parser.error(
+            f"unknown phase {', '.join(unknown)} in --budget, expected one "
+            f"of {', '.join(PHASES)}"
+        )
+    result = run(args.uri, args.repeat, args.top)
+    for name, seconds in result["phases_s"].items():
+        print(f"{name:>18} {seconds * 1000:8.1f} ms")
+    for entry in result["imports"]:
+        print(
+            f"{entry['module']:>18} {entry['cumulative_s'] * 1000:8.1f} ms "
+            "(import)"
+        )
+    result["budget_s"] = dict(args.budget)
+    result["over_budget"] = {
+        name: result["phases_s"][name]
+        for name, limit in args.budget
+        if result["phases_s"][name] > limit
+    }
+    if args.output:
+        with open(args.output, "w") as out:
+            json.dump(result, out, indent=2)
+    for name, seconds in result["over_budget"].items():
+        print(
+            f"{name} took {seconds * 1000:.1f} ms, over its budget of "
+            f"{result['budget_s'][name] * 1000:.1f} ms", file=sys.stderr
+        )
+    if result["over_budget"]:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
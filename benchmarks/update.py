@@ -0,0 +1,165 @@
+from sqlalchemy import select, insert, update, inspect
+from src.db import (
+    Database, ProjectEntry, HistoricalProject, ProjectUser,
+    _resolve_notes, _store_notes
+)
+
+import argparse
+import time
+import json
+import os
+
+
+def legacy_update(project, updated_by, **kwargs):
+    with project._session_factory() as session:
+        project_entry = session.get(ProjectEntry, project.id)
+        latest_version = session.get(
+            HistoricalProject, project_entry.latest_revision_id
+        )
+        _resolve_notes(session, [latest_version])
+        new_version = HistoricalProject()
+
+        for column in inspect(latest_version.__class__).c:
+            if any(getattr(column, attr, None) for attr in (
+                "server_default", "onupdate"
+            )):
+                continue
+            elif column.primary_key and not column.foreign_keys:
+                continue
+            setattr(
+                new_version, column.name,
+                kwargs.get(column.name) or getattr(
+                    latest_version, column.name
+                )
+            )
+        new_version.created_by = updated_by
+        new_version.seq = project_entry.revision_seq + 1
+        _store_notes(
+            new_version, new_version.notes, latest_version.notes,
+            latest_version.notes_depth, project.notes_keyframe_interval
+        )
+        session.add(new_version)
+        session.flush()
+        project_entry.revision_seq = new_version.seq
+        project_entry.latest_revision_id = new_version.id
+        session.commit()
+
+        if (users := kwargs.get("users")) is not None:
+            kwargs["users"] = [ProjectUser(
+                user_id=user,
+            ) for user in set(users) | set([project.owner_id])]
+
+        new_version.project_users = [
+            ProjectUser(
+                project_id=new_version.id,
+                user_id=project_user.user_id
+            )
+            for project_user in kwargs.get(
+                "users", latest_version.project_users
+            )
+        ]
+
+        session.add_all(new_version.project_users)
+        session.commit()
+
+
+def _seed_history(database, owner_id, members, revisions, notes):
+    project = database.create_project(owner_id, users=[*members], notes=notes)
+    if revisions == 1:
+        return project
+    with database._session_factory() as session, session.begin():
+        for start in range(2, revisions + 1, 1000):
+            session.execute(insert(HistoricalProject), [{
+                "project_id": project.id, "seq": seq, "created_by": owner_id,
+                "notes": notes, "notes_depth": 0,
+            } for seq in range(start, min(start + 1000, revisions + 1))])
+        latest_id = session.scalar(
+            select(HistoricalProject.id).where(
+                HistoricalProject.project_id == project.id,
+                HistoricalProject.seq == revisions
+            )
+        )
+        session.execute(insert(ProjectUser), [
+            {"project_id": latest_id, "user_id": user_id}
+            for user_id in {owner_id, *members}
+        ])
+        session.execute(
+            update(ProjectEntry)
+            .where(ProjectEntry.id == project.id)
+            .values(latest_revision_id=latest_id, revision_seq=revisions)
+        )
+    return project
+
+
+def _measure(fn, project, user_id, repeat, **kwargs):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn(project, user_id, **kwargs)
+    return (time.perf_counter() - start) / repeat
+
+
+def run(uri, history_lengths, member_count, repeat):
+    database = Database(uri, drop_before_load=True)
+    owner = database.users.create(username="owner", password_hash="-")
+    members = [
+        database.users.create(username=f"member{i}", password_hash="-")
+        for i in range(member_count)
+    ]
+    notes = "".join(f"note line {i}\n" for i in range(100))
+    implementations = {
+        "legacy": legacy_update,
+        "current": lambda project, *args, **kwargs: project.update(
+            *args, **kwargs
+        ),
+    }
+    scenarios = {
+        "unchanged": {},
+        "urgency": {"urgency": "High"},
+        "notes": {"notes": notes + "one more line\n"},
+        "members": {"users": members[:member_count // 2]},
+    }
+    results = []
+    for history_length in history_lengths:
+        for name, implementation in implementations.items():
+            project = _seed_history(
+                database, owner, members, history_length, notes
+            )
+            for scenario, kwargs in scenarios.items():
+                results.append({
+                    "implementation": name,
+                    "history_length": history_length,
+                    "members": member_count,
+                    "scenario": scenario,
+                    "update_s": _measure(
+                        implementation, project, owner, repeat, **kwargs
+                    ),
+                })
+                print(json.dumps(results[-1]))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Compare _Project.update against the previous "
+                    "two-commit ORM implementation"
+    )
+    parser.add_argument(
+        "--uri", default=os.environ.get(
+            "SQL_BENCH_URI", "sqlite:///bench_update.db"
+        )
+    )
+    parser.add_argument(
+        "--history", type=int, nargs="+", default=[1000, 10000]
+    )
+    parser.add_argument("--members", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--output", help="write results as JSON")
+    args = parser.parse_args(argv)
+    results = run(args.uri, args.history, args.members, args.repeat)
+    if args.output:
+        with open(args.output, "w") as out:
+            json.dump(results, out, indent=2)
+
+
+if __name__ == '__main__':
+    main()
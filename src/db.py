@@ -1,14 +1,29 @@
 from sqlalchemy import (
-   create_engine, select, inspect,
-   String, Integer, DateTime, ForeignKey, Text, UniqueConstraint
+   create_engine, event, select, insert, update, inspect, text, literal,
+   null, String, Integer, DateTime, ForeignKey, Text, UniqueConstraint, Index,
+   DDL
 )
 from sqlalchemy.orm import (
-    sessionmaker, relationship, mapped_column, make_transient,
+    sessionmaker, relationship, mapped_column, make_transient, aliased,
     DeclarativeBase, Mapped,
 )
+from sqlalchemy.orm.attributes import set_committed_value, flag_modified
+from sqlalchemy.engine import make_url
 from sqlalchemy.sql import func
 from sqlalchemy_utils import database_exists, create_database, drop_database
+from collections import OrderedDict, deque
+from dataclasses import dataclass
 from copy import deepcopy
+from datetime import datetime
+from difflib import SequenceMatcher
+import threading
+import json
+import re
+
+
+IN_CLAUSE_CHUNK_SIZE = 500
+NOTES_KEYFRAME_INTERVAL = 16
+_PENDING_REVISION_SEQ = -1
 
 
 class Base(DeclarativeBase):
@@ -27,15 +42,37 @@ class User(Base):
     created_at: Mapped[DateTime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
     )
+    row_version: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=1
+    )
 
 
 class ProjectEntry(Base):
     __tablename__ = 'project_entries'
+    __table_args__ = (
+        Index(
+            'ix_project_entries_latest_revision', 'latest_revision_id'
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     owner_id: Mapped[int] = mapped_column(
         Integer, ForeignKey('users.id'), nullable=False
     )
+    latest_revision_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey(
+            'historical_projects.id', use_alter=True,
+            name='fk_project_entries_latest_revision'
+        ),
+        nullable=True
+    )
+    revision_seq: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0
+    )
+    row_version: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=1
+    )
     changes: Mapped[list["HistoricalProject"]] = relationship(
         "HistoricalProject",
         primaryjoin="ProjectEntry.id == HistoricalProject.project_id"
@@ -44,16 +81,31 @@ class ProjectEntry(Base):
 
 class HistoricalProject(Base):
     __tablename__ = 'historical_projects'
+    __table_args__ = (
+        Index(
+            'ix_historical_projects_project_seq', 'project_id', 'seq',
+            unique=True
+        ),
+        Index(
+            'ix_historical_projects_project_created_at',
+            'project_id', 'created_at'
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     project_id: Mapped[int] = mapped_column(
         Integer, ForeignKey('project_entries.id'), nullable=False
     )
+    seq: Mapped[int] = mapped_column(Integer, nullable=False)
     created_by: Mapped[int] = mapped_column(
         Integer, ForeignKey('users.id'), nullable=False
     )
     urgency: Mapped[str] = mapped_column(String(32), nullable=True)
     notes: Mapped[Text] = mapped_column(Text(), nullable=True)
+    notes_delta: Mapped[Text] = mapped_column(Text(), nullable=True)
+    notes_depth: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0
+    )
     deadline: Mapped[DateTime] = mapped_column(DateTime, nullable=True)
     project_users: Mapped[list["ProjectUser"]] = relationship(
         "ProjectUser",
@@ -70,6 +122,7 @@ class ProjectUser(Base):
     __tablename__ = 'project_users'
     __table_args__ = (
         UniqueConstraint('project_id', 'user_id', name='uq_project_user'),
+        Index('ix_project_users_user_project', 'user_id', 'project_id'),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
@@ -79,43 +132,510 @@ class ProjectUser(Base):
     user_id: Mapped[int] = mapped_column(Integer, ForeignKey('users.id'))
 
 
+event.listen(Base.metadata, "after_create", DDL(
+    "CREATE VIRTUAL TABLE IF NOT EXISTS project_search USING fts5(notes)"
+).execute_if(dialect="sqlite"))
+event.listen(Base.metadata, "after_create", DDL(
+    "CREATE TABLE IF NOT EXISTS project_search ("
+    "project_id INTEGER PRIMARY KEY, notes TEXT, "
+    "FULLTEXT KEY ft_project_search_notes (notes)"
+    ") ENGINE=InnoDB"
+).execute_if(dialect="mysql"))
+event.listen(Base.metadata, "before_drop", DDL(
+    "DROP TABLE IF EXISTS project_search"
+))
+
+
+def _index_notes(session, notes_by_project):
+    if not notes_by_project:
+        return
+    sqlite = session.get_bind().dialect.name == "sqlite"
+    key = "rowid" if sqlite else "project_id"
+    session.execute(
+        text(f"DELETE FROM project_search WHERE {key} = :project_id"),
+        [{"project_id": id} for id in notes_by_project]
+    )
+    if rows := [
+        {"project_id": id, "notes": notes}
+        for id, notes in notes_by_project.items() if notes
+    ]:
+        session.execute(text(
+            f"INSERT INTO project_search ({key}, notes) "
+            "VALUES (:project_id, :notes)"
+        ), rows)
+
+
+def _insert_entries(session, owner_ids):
+    last_id = session.scalar(select(func.max(ProjectEntry.id))) or 0
+    session.execute(insert(ProjectEntry), [
+        {"owner_id": owner_id, "revision_seq": _PENDING_REVISION_SEQ}
+        for owner_id in owner_ids
+    ])
+    return [*session.scalars(
+        select(ProjectEntry.id)
+        .where(
+            ProjectEntry.id > last_id,
+            ProjectEntry.revision_seq == _PENDING_REVISION_SEQ
+        )
+        .order_by(ProjectEntry.id)
+    )]
+
+
+def _point_to_latest(session, project_ids):
+    project_ids = sorted(project_ids)
+    for start in range(0, len(project_ids), IN_CLAUSE_CHUNK_SIZE):
+        chunk = project_ids[start:start + IN_CLAUSE_CHUNK_SIZE]
+        session.execute(
+            update(ProjectEntry)
+            .where(ProjectEntry.id.in_(chunk))
+            .values(
+                latest_revision_id=select(HistoricalProject.id)
+                .where(HistoricalProject.project_id == ProjectEntry.id)
+                .order_by(HistoricalProject.seq.desc())
+                .limit(1)
+                .scalar_subquery(),
+                revision_seq=select(
+                    func.coalesce(func.max(HistoricalProject.seq), 0)
+                )
+                .where(HistoricalProject.project_id == ProjectEntry.id)
+                .scalar_subquery(),
+                row_version=ProjectEntry.row_version + 1
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+
+def _revision_ids(session, keys):
+    project_ids = sorted({project_id for project_id, _ in keys})
+    ids = {}
+    for start in range(0, len(project_ids), IN_CLAUSE_CHUNK_SIZE):
+        chunk = project_ids[start:start + IN_CLAUSE_CHUNK_SIZE]
+        for id, project_id, seq in session.execute(
+            select(
+                HistoricalProject.id, HistoricalProject.project_id,
+                HistoricalProject.seq
+            ).where(HistoricalProject.project_id.in_(chunk))
+        ):
+            if (project_id, seq) in keys:
+                ids[project_id, seq] = id
+    return ids
+
+
+def _search_statement(dialect, query, limit):
+    terms = re.findall(r"\w+", query)
+    if not terms:
+        return None
+    if dialect.name == "sqlite":
+        return text(
+            "SELECT rowid AS project_id FROM project_search "
+            "WHERE project_search MATCH :query "
+            "ORDER BY bm25(project_search) LIMIT :limit"
+        ).bindparams(
+            query=" ".join(f'"{term}"' for term in terms) + "*", limit=limit
+        )
+    return text(
+        "SELECT project_id FROM project_search "
+        "WHERE MATCH (notes) AGAINST (:query IN BOOLEAN MODE) "
+        "ORDER BY MATCH (notes) AGAINST (:query IN BOOLEAN MODE) DESC "
+        "LIMIT :limit"
+    ).bindparams(
+        query=" ".join(f"+{term}" for term in terms) + "*", limit=limit
+    )
+
+
+_REVISION_COPY_COLUMNS = tuple(
+    column.name for column in HistoricalProject.__table__.c
+    if not (
+        column.server_default or column.onupdate
+        or (column.primary_key and not column.foreign_keys)
+        or column.name in (
+            "project_id", "seq", "created_by",
+            "notes", "notes_delta", "notes_depth"
+        )
+    )
+)
+
+
+_CREATE_REVISION_COLUMNS = ("notes", *_REVISION_COPY_COLUMNS)
+
+
+_EXPORT_REVISION_COLUMNS = (
+    "id", "project_id", "seq", "created_by", "created_at",
+    *_REVISION_COPY_COLUMNS
+)
+
+
+def _diff_notes(base, notes):
+    base_lines = base.splitlines(keepends=True)
+    lines = notes.splitlines(keepends=True)
+    matcher = SequenceMatcher(None, base_lines, lines, autojunk=False)
+    return json.dumps([
+        [i1, i2, lines[j1:j2]]
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes()
+        if tag != "equal"
+    ], separators=(",", ":"))
+
+
+def _patch_notes(base, delta):
+    base_lines = base.splitlines(keepends=True)
+    lines, position = [], 0
+    for start, end, replacement in json.loads(delta):
+        lines.extend(base_lines[position:start])
+        lines.extend(replacement)
+        position = end
+    lines.extend(base_lines[position:])
+    return "".join(lines)
+
+
+def _encode_notes(notes, base, base_depth, keyframe_interval):
+    if notes is None or base is None or base_depth + 1 >= keyframe_interval:
+        return notes, None, 0
+    if len(delta := _diff_notes(base, notes)) < len(notes):
+        return None, delta, base_depth + 1
+    return notes, None, 0
+
+
+def _store_notes(revision, notes, base, base_depth, keyframe_interval):
+    revision.notes, revision.notes_delta, revision.notes_depth = (
+        _encode_notes(notes, base, base_depth, keyframe_interval)
+    )
+
+
+def _notes_before(session, project_id, seq):
+    keyframe_seq = (
+        select(func.max(HistoricalProject.seq))
+        .where(
+            HistoricalProject.project_id == project_id,
+            HistoricalProject.seq < seq,
+            HistoricalProject.notes_delta.is_(None)
+        )
+        .scalar_subquery()
+    )
+    notes = None
+    for row in session.execute(
+        select(HistoricalProject.notes, HistoricalProject.notes_delta)
+        .where(
+            HistoricalProject.project_id == project_id,
+            HistoricalProject.seq < seq,
+            HistoricalProject.seq >= keyframe_seq
+        )
+        .order_by(HistoricalProject.seq)
+    ):
+        notes = row.notes if row.notes_delta is None else _patch_notes(
+            notes or "", row.notes_delta
+        )
+    return notes
+
+
+def _resolve_notes(session, revisions):
+    if not revisions:
+        return revisions
+    first, notes = revisions[0], None
+    if first.notes_delta is not None:
+        notes = _notes_before(session, first.project_id, first.seq)
+    for revision in revisions:
+        if revision.notes_delta is not None:
+            notes = _patch_notes(notes or "", revision.notes_delta)
+            set_committed_value(revision, "notes", notes)
+        else:
+            notes = revision.notes
+    return revisions
+
+
+def _export_value(value):
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def _export_row(row, columns):
+    return {name: _export_value(row._mapping[name]) for name in columns}
+
+
+def _import_row(table, record, columns):
+    values = {}
+    for name in columns:
+        if name not in record:
+            continue
+        if (value := record[name]) is not None and isinstance(
+            table.c[name].type, DateTime
+        ):
+            value = datetime.fromisoformat(value)
+        values[name] = value
+    return values
+
+
+class DatabaseEvent:
+    table = None
+
+
+@dataclass(frozen=True)
+class ProjectCreated(DatabaseEvent):
+    table = "projects"
+    project_id: int
+    revision_id: int
+    owner_id: int
+
+
+@dataclass(frozen=True)
+class RevisionAdded(DatabaseEvent):
+    table = "projects"
+    project_id: int
+    revision_id: int
+    created_by: int
+
+
+@dataclass(frozen=True)
+class RevisionRemoved(DatabaseEvent):
+    table = "projects"
+    project_id: int
+    revision_id: int
+
+
+@dataclass(frozen=True)
+class MembershipChanged(DatabaseEvent):
+    table = "projects"
+    project_id: int
+    revision_id: int
+    user_ids: frozenset
+
+
+@dataclass(frozen=True)
+class UserCreated(DatabaseEvent):
+    table = "users"
+    user_id: int
+
+
+@dataclass(frozen=True)
+class UserUpdated(DatabaseEvent):
+    table = "users"
+    user_id: int
+
+
+class _EventBus:
+    def __init__(self):
+        self._subscribers = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, event_type, callback):
+        with self._lock:
+            self._subscribers.setdefault(event_type, []).append(callback)
+        return lambda: self.unsubscribe(event_type, callback)
+
+    def unsubscribe(self, event_type, callback):
+        with self._lock:
+            callbacks = self._subscribers.get(event_type, [])
+            if callback in callbacks:
+                callbacks.remove(callback)
+
+    def publish(self, event):
+        with self._lock:
+            callbacks = [
+                callback
+                for event_type in type(event).__mro__
+                for callback in self._subscribers.get(event_type, ())
+            ]
+        for callback in callbacks:
+            callback(event)
+
+
+class _ChangeLog:
+    TABLES = ("projects", "users")
+
+    def __init__(self, max_entries=4096):
+        self.version = 0
+        self._entries = deque()
+        self._max_entries = max_entries
+        self._floor = 0
+        self._lock = threading.Lock()
+
+    def record(self, table, id):
+        with self._lock:
+            self.version += 1
+            self._entries.append((self.version, table, id))
+            if len(self._entries) > self._max_entries:
+                self._floor = self._entries.popleft()[0]
+
+    def on_event(self, event):
+        if event.table == "projects":
+            self.record(event.table, event.project_id)
+        else:
+            self.record(event.table, event.user_id)
+
+    def changes_since(self, version):
+        with self._lock:
+            if version is None or version < self._floor:
+                return self.version, None
+            changes = {table: set() for table in self.TABLES}
+            for entry_version, table, id in reversed(self._entries):
+                if entry_version <= version:
+                    break
+                changes[table].add(id)
+            return self.version, changes
+
+
+class _MembershipCache:
+    def __init__(self, max_size=4096):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.generation = 0
+        self._members = OrderedDict()
+        self._latest = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._members)
+
+    def get(self, project_id, revision_id):
+        with self._lock:
+            key = (project_id, revision_id)
+            if (members := self._members.get(key)) is None:
+                self.misses += 1
+                return None
+            self._members.move_to_end(key)
+            self.hits += 1
+            return members
+
+    def put(self, project_id, revision_id, members):
+        with self._lock:
+            self._store(self._members, (project_id, revision_id), members)
+
+    def latest(self, project_id):
+        with self._lock:
+            return self._latest.get(project_id)
+
+    def set_latest(self, project_id, revision_id, generation=None):
+        with self._lock:
+            if generation is None or generation == self.generation:
+                self._store(self._latest, project_id, revision_id)
+
+    def clear(self):
+        with self._lock:
+            self.generation += 1
+            self._members.clear()
+            self._latest.clear()
+
+    def forget_latest(self):
+        with self._lock:
+            self.generation += 1
+            self._latest.clear()
+
+    def on_event(self, event):
+        with self._lock:
+            self.generation += 1
+            if isinstance(event, RevisionAdded):
+                self._store(self._latest, event.project_id, event.revision_id)
+            elif isinstance(event, MembershipChanged):
+                self._store(
+                    self._members, (event.project_id, event.revision_id),
+                    frozenset(event.user_ids)
+                )
+            elif isinstance(event, (ProjectCreated, RevisionRemoved)):
+                self._latest.pop(event.project_id, None)
+            if isinstance(event, RevisionRemoved):
+                self._members.pop((event.project_id, event.revision_id), None)
+
+    def _store(self, entries, key, value):
+        if self.max_size <= 0:
+            return
+        entries[key] = value
+        entries.move_to_end(key)
+        while len(entries) > self.max_size:
+            entries.popitem(last=False)
+
+
 class _Project:
-    def __init__(self, engine, id, owner_id):
-        self.engine = engine
-        self._session_factory = sessionmaker(bind=self.engine)
+    def __init__(
+        self, session_factory, id, owner_id, *,
+        notes_keyframe_interval=NOTES_KEYFRAME_INTERVAL, events=None,
+        memberships=None
+    ):
+        self._session_factory = session_factory
         self.id = id
         self.owner_id = owner_id
+        self.notes_keyframe_interval = notes_keyframe_interval
+        self._events = events or _EventBus()
+        self._memberships = (
+            _MembershipCache() if memberships is None else memberships
+        )
 
     def has_user(self, id, historical_project=None):
-        if historical_project is None:
-            historical_project = self.get_latest()
-        else:
-            historical_project = self.get(historical_project)
-        return any(
-            project_user.user_id == id
-            for project_user in historical_project.project_users
-        )
-                
+        return id in self.get_user_ids(historical_project)
+
+    def get_user_ids(self, historical_project=None):
+        generation = self._memberships.generation
+        if (revision_id := historical_project) is None:
+            revision_id = self._memberships.latest(self.id)
+        if revision_id is not None and (
+            users := self._memberships.get(self.id, revision_id)
+        ) is not None:
+            return users
+        with self._session_factory() as session:
+            if revision_id is None:
+                revision_id = session.scalars(
+                    select(ProjectEntry.latest_revision_id)
+                    .where(ProjectEntry.id == self.id)
+                ).one()
+                self._memberships.set_latest(
+                    self.id, revision_id, generation
+                )
+                if (
+                    users := self._memberships.get(self.id, revision_id)
+                ) is not None:
+                    return users
+            users = frozenset(session.scalars(
+                select(ProjectUser.user_id)
+                .join(
+                    HistoricalProject,
+                    HistoricalProject.id == ProjectUser.project_id
+                )
+                .where(
+                    HistoricalProject.id == revision_id,
+                    HistoricalProject.project_id == self.id
+                )
+            ))
+        self._memberships.put(self.id, revision_id, users)
+        return users
 
     def get(self, id):
         with self._session_factory() as session:
-            return session.scalars(
+            return _resolve_notes(session, [session.scalars(
                 select(HistoricalProject)
                 .where(
                     HistoricalProject.id == id,
                     HistoricalProject.project_id == self.id
                 )
-            ).one()
+            ).one()])[0]
 
     def get_latest(self):
-        return self.get_history()[-1]
+        with self._session_factory() as session:
+            return _resolve_notes(session, [session.scalars(
+                select(HistoricalProject)
+                .join(
+                    ProjectEntry,
+                    ProjectEntry.latest_revision_id == HistoricalProject.id
+                )
+                .where(ProjectEntry.id == self.id)
+            ).one()])[0]
 
     def get_history(self):
         with self._session_factory() as session:
-            return session.scalars(
+            return _resolve_notes(session, session.scalars(
                 select(HistoricalProject)
                 .where(HistoricalProject.project_id == self.id)
-            ).all()
+                .order_by(HistoricalProject.seq)
+            ).all())
+
+    def get_history_page(self, before_seq=None, limit=50):
+        stmt = (
+            select(HistoricalProject)
+            .where(HistoricalProject.project_id == self.id)
+            .order_by(HistoricalProject.seq.desc())
+            .limit(limit)
+        )
+        if before_seq is not None:
+            stmt = stmt.where(HistoricalProject.seq < before_seq)
+        with self._session_factory() as session:
+            return _resolve_notes(session, session.scalars(stmt).all()[::-1])
 
     def get_users(self, historical_project=None):
         with self._session_factory() as session:
@@ -132,45 +652,130 @@ class _Project:
             return session.scalars(stmt).all()
 
     def update(self, updated_by, **kwargs):
-        with self._session_factory() as session:
-            latest_version = self.get_latest()
-            new_version = HistoricalProject()
-            session.add(latest_version)
-
-            for column in inspect(latest_version.__class__).c:
-                if any(getattr(column, attr, None) for attr in (
-                    "server_default", "onupdate"
-                )):
-                    continue
-                elif column.primary_key and not column.foreign_keys:
-                    continue
-                setattr(
-                    new_version, column.name,
-                    kwargs.get(column.name) or getattr(
-                        latest_version, column.name
+        with self._session_factory() as session, session.begin():
+            latest = session.execute(
+                select(
+                    ProjectEntry.latest_revision_id,
+                    ProjectEntry.revision_seq,
+                    HistoricalProject.seq,
+                    HistoricalProject.notes_depth,
+                    HistoricalProject.notes_delta.is_(None)
+                        .label("is_keyframe"),
+                    (
+                        HistoricalProject.notes_delta.is_(None)
+                        & HistoricalProject.notes.is_(None)
+                    ).label("notes_is_null")
+                )
+                .join(
+                    HistoricalProject,
+                    HistoricalProject.id == ProjectEntry.latest_revision_id
+                )
+                .where(ProjectEntry.id == self.id)
+                .with_for_update()
+            ).one()
+            seq = latest.revision_seq + 1
+
+            values = {
+                "project_id": literal(self.id),
+                "seq": literal(seq),
+                "created_by": literal(updated_by),
+                **{
+                    name: (
+                        HistoricalProject.__table__.c[name]
+                        if not kwargs.get(name)
+                        else literal(
+                            kwargs[name],
+                            HistoricalProject.__table__.c[name].type
+                        )
                     )
+                    for name in _REVISION_COPY_COLUMNS
+                },
+                **self._notes_values(session, latest, kwargs.get("notes"))
+            }
+            revision_id = session.execute(
+                insert(HistoricalProject).from_select(
+                    [*values],
+                    select(*values.values())
+                    .where(HistoricalProject.id == latest.latest_revision_id)
                 )
-            new_version.created_by = updated_by
-            session.add(new_version)
-            session.commit()
+            ).lastrowid
 
             if (users := kwargs.get("users")) is not None:
-                kwargs["users"] = [ProjectUser(
-                    user_id=user,
-                ) for user in set(users) | set([self.owner_id])]
-
-            new_version.project_users = [
-                ProjectUser(
-                    project_id=new_version.id,
-                    user_id=project_user.user_id
+                previous_users = frozenset(session.scalars(
+                    select(ProjectUser.user_id).where(
+                        ProjectUser.project_id == latest.latest_revision_id
+                    )
+                ))
+                current_users = frozenset(users) | {self.owner_id}
+                session.execute(insert(ProjectUser), [
+                    {"project_id": revision_id, "user_id": user_id}
+                    for user_id in current_users
+                ])
+            else:
+                previous_users = current_users = None
+                session.execute(
+                    insert(ProjectUser).from_select(
+                        ["project_id", "user_id"],
+                        select(literal(revision_id), ProjectUser.user_id)
+                        .where(
+                            ProjectUser.project_id
+                            == latest.latest_revision_id
+                        )
+                    )
                 )
-                for project_user in kwargs.get(
-                    "users", latest_version.project_users
+
+            session.execute(
+                update(ProjectEntry)
+                .where(ProjectEntry.id == self.id)
+                .values(
+                    latest_revision_id=revision_id, revision_seq=seq,
+                    row_version=ProjectEntry.row_version + 1
                 )
-            ]
+            )
+            if kwargs.get("notes"):
+                _index_notes(session, {self.id: kwargs["notes"]})
+        self._events.publish(RevisionAdded(self.id, revision_id, updated_by))
+        if current_users != previous_users:
+            self._events.publish(
+                MembershipChanged(self.id, revision_id, current_users)
+            )
+        return revision_id
 
-            session.add_all(new_version.project_users)
-            session.commit()
+    def _notes_values(self, session, latest, notes):
+        if notes:
+            notes, notes_delta, notes_depth = _encode_notes(
+                notes,
+                _notes_before(session, self.id, latest.seq + 1),
+                latest.notes_depth, self.notes_keyframe_interval
+            )
+            return {
+                "notes": literal(notes, Text()),
+                "notes_delta": literal(notes_delta, Text()),
+                "notes_depth": literal(notes_depth),
+            }
+        if latest.notes_is_null:
+            return {
+                "notes": null(), "notes_delta": null(),
+                "notes_depth": literal(0),
+            }
+        if latest.notes_depth + 1 < self.notes_keyframe_interval:
+            return {
+                "notes": null(),
+                "notes_delta": literal(_diff_notes("", "")),
+                "notes_depth": literal(latest.notes_depth + 1),
+            }
+        if latest.is_keyframe:
+            return {
+                "notes": HistoricalProject.notes, "notes_delta": null(),
+                "notes_depth": literal(0),
+            }
+        return {
+            "notes": literal(
+                _notes_before(session, self.id, latest.seq + 1), Text()
+            ),
+            "notes_delta": null(),
+            "notes_depth": literal(0),
+        }
 
     def remove(self, expr):
         with self._session_factory() as session:
@@ -188,14 +793,102 @@ class _Project:
                     "Cannot delete the last historical project of a "
                     "project entry"
                 )
+            project_entry = session.get(ProjectEntry, project_id)
+            project_entry.row_version = ProjectEntry.row_version + 1
+            if is_latest := (
+                project_entry.latest_revision_id == historical_project.id
+            ):
+                project_entry.latest_revision_id = session.scalars(
+                    select(HistoricalProject.id)
+                    .where(
+                        HistoricalProject.project_id == project_id,
+                        HistoricalProject.id != historical_project.id
+                    )
+                    .order_by(HistoricalProject.seq.desc())
+                    .limit(1)
+                ).one()
+                session.flush()
+            successor = session.scalars(
+                select(HistoricalProject)
+                .where(
+                    HistoricalProject.project_id == project_id,
+                    HistoricalProject.seq > historical_project.seq
+                )
+                .order_by(HistoricalProject.seq)
+                .limit(1)
+            ).first()
+            if successor is not None and successor.notes_delta is not None:
+                _resolve_notes(session, [successor])
+                successor.notes_delta, successor.notes_depth = None, 0
+                flag_modified(successor, "notes")
+                session.flush()
             session.delete(historical_project)
+            revision_id = historical_project.id
+            if is_latest:
+                _index_notes(session, {
+                    project_id: _notes_before(
+                        session, project_id, historical_project.seq
+                    )
+                })
             session.commit()
+        self._events.publish(RevisionRemoved(project_id, revision_id))
+
+
+class _UserCache:
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._users = OrderedDict()
+        self._usernames = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._users)
+
+    def get(self, id=None, username=None):
+        with self._lock:
+            if username is not None:
+                id = self._usernames.get(username)
+            if (user := self._users.get(id)) is None:
+                self.misses += 1
+                return None
+            self._users.move_to_end(id)
+            self.hits += 1
+            return user
+
+    def put(self, user):
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._discard(user.id)
+            self._users[user.id] = user
+            self._usernames[user.username] = user.id
+            while len(self._users) > self.max_size:
+                _, evicted = self._users.popitem(last=False)
+                del self._usernames[evicted.username]
+
+    def invalidate(self, id=None, username=None):
+        with self._lock:
+            if username is not None:
+                id = self._usernames.get(username)
+            self._discard(id)
+
+    def clear(self):
+        with self._lock:
+            self._users.clear()
+            self._usernames.clear()
+
+    def _discard(self, id):
+        if (user := self._users.pop(id, None)) is not None:
+            del self._usernames[user.username]
 
 
 class UserDatabase:
-    def __init__(self, engine):
-        self.engine = engine
-        self._session_factory = sessionmaker(bind=self.engine)
+    def __init__(self, session_factory, *, cache_size=1024, events=None):
+        self._session_factory = session_factory
+        self.cache = _UserCache(cache_size)
+        self._events = events or _EventBus()
 
     def get_all(self):
         with self._session_factory() as session:
@@ -205,72 +898,832 @@ class UserDatabase:
         with self._session_factory() as session:
             return session.scalars(select(User).where(expr)).all()[0]
 
+    def get_by_id(self, id):
+        if (user := self.cache.get(id=id)) is None:
+            self.cache.put(user := self.get(User.id == id))
+        return user
+
+    def get_by_username(self, username):
+        if (user := self.cache.get(username=username)) is None:
+            self.cache.put(user := self.get(User.username == username))
+        return user
+
+    def get_many(self, ids):
+        users, missing = {}, []
+        for id in set(ids):
+            if (user := self.cache.get(id=id)) is None:
+                missing.append(id)
+            else:
+                users[id] = user
+        with self._session_factory() as session:
+            for start in range(0, len(missing), IN_CLAUSE_CHUNK_SIZE):
+                chunk = missing[start:start + IN_CLAUSE_CHUNK_SIZE]
+                for user in session.scalars(
+                    select(User).where(User.id.in_(chunk))
+                ):
+                    self.cache.put(user)
+                    users[user.id] = user
+        return users
+
     def create(self, *args, **kwargs):
         with self._session_factory() as session:
             user = User(*args, **kwargs)
             session.add(user)
+            session.flush()
+            id, username = user.id, user.username
             session.commit()
-            return user.id
+        self.cache.invalidate(username=username)
+        self._events.publish(UserCreated(id))
+        return id
 
     def update(self, id, **kwargs):
         with self._session_factory() as session:
             session.query(User)\
                    .filter(User.id == id)\
-                   .update(kwargs)
+                   .update(kwargs | {"row_version": User.row_version + 1})
             session.commit()
+        self.cache.invalidate(id=id)
+        self._events.publish(UserUpdated(id))
+
+
+class _PoolStatistics:
+    def __init__(self, engine):
+        self.checkouts = 0
+        self.checkins = 0
+        self.connects = 0
+        self.invalidations = 0
+        self.peak_checked_out = 0
+        self._checked_out = 0
+        self._lock = threading.Lock()
+        event.listen(engine, "connect", self._on_connect)
+        event.listen(engine, "checkout", self._on_checkout)
+        event.listen(engine, "checkin", self._on_checkin)
+        event.listen(engine, "invalidate", self._on_invalidate)
+
+    def _on_connect(self, dbapi_connection, connection_record):
+        with self._lock:
+            self.connects += 1
+
+    def _on_checkout(self, dbapi_connection, connection_record, proxy):
+        with self._lock:
+            self.checkouts += 1
+            self._checked_out += 1
+            self.peak_checked_out = max(
+                self.peak_checked_out, self._checked_out
+            )
+
+    def _on_checkin(self, dbapi_connection, connection_record):
+        with self._lock:
+            self.checkins += 1
+            self._checked_out = max(self._checked_out - 1, 0)
+
+    def _on_invalidate(self, dbapi_connection, connection_record, exception):
+        with self._lock:
+            self.invalidations += 1
+
+
+def _engine_options(
+    pool_size=None, max_overflow=None, pool_timeout=None,
+    pool_recycle=3600, pool_pre_ping=True
+):
+    return {
+        "pool_recycle": pool_recycle,
+        "pool_pre_ping": pool_pre_ping,
+        **{
+            name: value for name, value in (
+                ("pool_size", pool_size),
+                ("max_overflow", max_overflow),
+                ("pool_timeout", pool_timeout),
+            ) if value is not None
+        }
+    }
 
 
 class Database:
-    def __init__(self, uri, *, drop_before_load=False):
-        self.engine = create_engine(uri)
-        if not database_exists(self.engine.url):
-            create_database(self.engine.url)
-        elif drop_before_load:
-            drop_database(self.engine.url)
-            create_database(self.engine.url)
+    def __init__(
+        self, uri=None, *, engine=None, drop_before_load=False, create=True,
+        user_cache_size=1024, membership_cache_size=4096,
+        notes_keyframe_interval=NOTES_KEYFRAME_INTERVAL, **pool_options
+    ):
+        if engine is None:
+            engine = create_engine(uri, **_engine_options(**pool_options))
+            if not database_exists(engine.url):
+                if not create:
+                    raise ValueError(
+                        f"Database does not exist: {engine.url!r}"
+                    )
+                create_database(engine.url)
+            elif drop_before_load:
+                drop_database(engine.url)
+                create_database(engine.url)
+        self.engine = engine
+        self._pool_statistics = _PoolStatistics(self.engine)
+        self.notes_keyframe_interval = notes_keyframe_interval
         self._session_factory = sessionmaker(bind=self.engine)
-        self.users = UserDatabase(self.engine)
-        Base.metadata.create_all(self.engine)
+        self._events = _EventBus()
+        self._change_log = _ChangeLog()
+        self._events.subscribe(DatabaseEvent, self._change_log.on_event)
+        self.memberships = _MembershipCache(membership_cache_size)
+        self._events.subscribe(DatabaseEvent, self.memberships.on_event)
+        self.users = UserDatabase(
+            self._session_factory,
+            cache_size=user_cache_size,
+            events=self._events
+        )
+        if create:
+            Base.metadata.create_all(self.engine)
+
+    @property
+    def version(self):
+        return self._change_log.version
 
-    def create_project(self, owner_id, users=None, *args, **kwargs):
-        users = users or []
+    def changes_since(self, version):
+        return self._change_log.changes_since(version)
+
+    def watermark(self):
         with self._session_factory() as session:
-            project_entry = ProjectEntry(
-                changes=[
-                    historical_project := HistoricalProject(
-                        created_by=owner_id,
-                        *args, **kwargs
+            return {
+                name: int(version) for name, version in session.execute(
+                    select(
+                        select(func.coalesce(
+                            func.sum(ProjectEntry.row_version), 0
+                        )).scalar_subquery().label("projects"),
+                        select(func.coalesce(
+                            func.sum(User.row_version), 0
+                        )).scalar_subquery().label("users")
                     )
-                ],
-                owner_id=owner_id
-            )
-            session.add(project_entry)
-            session.flush()
+                ).one()._asdict().items()
+            }
 
-            users.append(self.users.get(User.id == owner_id))
-            for idx, user in enumerate(users):
-                if isinstance(user, int):
-                    users[idx] = self.users.get(User.id == user)
-            converted_users = [ProjectUser(
-                project_id=historical_project.id,
-                user_id=user.id
-            ) for user in users]
+    def subscribe(self, event_type, callback):
+        return self._events.subscribe(event_type, callback)
 
-            session.add_all(converted_users)
-            session.commit()
+    def unsubscribe(self, event_type, callback):
+        self._events.unsubscribe(event_type, callback)
+
+    def _project(self, id, owner_id):
+        return _Project(
+            self._session_factory, id, owner_id,
+            notes_keyframe_interval=self.notes_keyframe_interval,
+            events=self._events,
+            memberships=self.memberships
+        )
+
+    def create_project(self, owner_id, users=None, **kwargs):
+        return self.create_projects(
+            [dict(kwargs, owner_id=owner_id, users=users)]
+        )[0]
 
-            return _Project(self.engine, project_entry.id, owner_id)
+    def create_projects(self, specs):
+        if not (specs := [dict(spec) for spec in specs]):
+            return []
+        for spec in specs:
+            spec["users"] = [
+                user if isinstance(user, int) else user.id
+                for user in spec.get("users") or []
+            ] + [spec["owner_id"]]
+
+        user_ids = sorted({id for spec in specs for id in spec["users"]})
+        with self._session_factory() as session:
+            known = set()
+            for start in range(0, len(user_ids), IN_CLAUSE_CHUNK_SIZE):
+                chunk = user_ids[start:start + IN_CLAUSE_CHUNK_SIZE]
+                known.update(session.scalars(
+                    select(User.id).where(User.id.in_(chunk))
+                ))
+            if unknown := [id for id in user_ids if id not in known]:
+                raise ValueError(f"Unknown user ids: {unknown}")
+
+            fields = {key for spec in specs for key in spec} - {
+                "owner_id", "users"
+            }
+            if unknown := fields.difference(_CREATE_REVISION_COLUMNS):
+                raise ValueError(f"Unknown revision fields: {sorted(unknown)}")
+            project_ids = _insert_entries(
+                session, [spec["owner_id"] for spec in specs]
+            )
+            session.execute(insert(HistoricalProject), [
+                {
+                    "project_id": project_id, "created_by": spec["owner_id"],
+                    "seq": 1, **{key: spec.get(key) for key in fields}
+                }
+                for project_id, spec in zip(project_ids, specs)
+            ])
+            revision_ids = _revision_ids(
+                session, {(project_id, 1) for project_id in project_ids}
+            )
+            created = [
+                (project_id, revision_ids[project_id, 1], spec["owner_id"])
+                for project_id, spec in zip(project_ids, specs)
+            ]
+
+            session.execute(insert(ProjectUser), [
+                {"project_id": revision_id, "user_id": user_id}
+                for (_, revision_id, _), spec in zip(created, specs)
+                for user_id in spec["users"]
+            ])
+            _point_to_latest(session, project_ids)
+            _index_notes(session, {
+                project_id: spec.get("notes")
+                for project_id, spec in zip(project_ids, specs)
+            })
+            session.commit()
+        for project_id, revision_id, owner_id in created:
+            self._events.publish(
+                ProjectCreated(project_id, revision_id, owner_id)
+            )
+        return [
+            self._project(project_id, owner_id)
+            for project_id, _, owner_id in created
+        ]
 
     def get_project(self, expr):
         with self._session_factory() as session:
             project = session.scalars(
                 select(ProjectEntry).where(expr)
             ).all()[0]
-            return _Project(self.engine, project.id, project.owner_id)
+            return self._project(project.id, project.owner_id)
 
     def get_projects(self):
         with self._session_factory() as session:
             return [*map(
-                lambda p: _Project(self.engine, p.id, p.owner_id),
+                lambda p: self._project(p.id, p.owner_id),
                 session.scalars(select(ProjectEntry)).all()
             )]
+
+    def iter_projects(self, after_id=None, limit=100):
+        stmt = select(ProjectEntry).order_by(ProjectEntry.id).limit(limit)
+        if after_id is not None:
+            stmt = stmt.where(ProjectEntry.id > after_id)
+        with self._session_factory() as session:
+            return [
+                self._project(project.id, project.owner_id)
+                for project in session.scalars(stmt)
+            ]
+
+    def projects_for_user(self, user_id):
+        with self._session_factory() as session:
+            return [
+                self._project(project.id, project.owner_id)
+                for project in session.execute(
+                    select(ProjectEntry.id, ProjectEntry.owner_id)
+                    .join(
+                        ProjectUser,
+                        ProjectUser.project_id
+                        == ProjectEntry.latest_revision_id
+                    )
+                    .where(ProjectUser.user_id == user_id)
+                    .order_by(ProjectEntry.id)
+                )
+            ]
+
+    def list_project_summaries(self, after_id=None, limit=None, ids=None):
+        first_revision = aliased(HistoricalProject)
+        stmt = (
+            select(
+                ProjectEntry.id,
+                ProjectEntry.owner_id,
+                select(first_revision.created_at)
+                    .where(first_revision.project_id == ProjectEntry.id)
+                    .order_by(first_revision.seq)
+                    .limit(1)
+                    .correlate(ProjectEntry)
+                    .scalar_subquery()
+                    .label("created_at"),
+                HistoricalProject.created_at.label("updated_at"),
+                func.coalesce(User.username, User.full_name)
+                    .label("owner_name"),
+                HistoricalProject.urgency,
+                HistoricalProject.deadline
+            )
+            .join(
+                HistoricalProject,
+                HistoricalProject.id == ProjectEntry.latest_revision_id
+            )
+            .join(User, User.id == ProjectEntry.owner_id)
+            .order_by(ProjectEntry.id)
+            .limit(limit)
+        )
+        if after_id is not None:
+            stmt = stmt.where(ProjectEntry.id > after_id)
+        if ids is not None:
+            stmt = stmt.where(ProjectEntry.id.in_(ids))
+        with self._session_factory() as session:
+            return session.execute(stmt).all()
+
+    def search_projects(self, query, limit=50):
+        if (stmt := _search_statement(self.engine.dialect, query, limit)) \
+                is None:
+            return []
+        with self._session_factory() as session:
+            ranked = session.scalars(stmt).all()
+        summaries = {
+            summary.id: summary
+            for summary in self.list_project_summaries(ids=ranked)
+        }
+        return [summaries[id] for id in ranked if id in summaries]
+
+    def rebuild_search_index(self):
+        with self._session_factory() as session:
+            session.execute(text("DELETE FROM project_search"))
+            projects = session.execute(
+                select(ProjectEntry.id, HistoricalProject.seq)
+                .join(
+                    HistoricalProject,
+                    HistoricalProject.id == ProjectEntry.latest_revision_id
+                )
+                .order_by(ProjectEntry.id)
+            ).all()
+            for start in range(0, len(projects), IN_CLAUSE_CHUNK_SIZE):
+                _index_notes(session, {
+                    project_id: _notes_before(session, project_id, seq + 1)
+                    for project_id, seq in projects[
+                        start:start + IN_CLAUSE_CHUNK_SIZE
+                    ]
+                })
+            session.commit()
+        return len(projects)
+
+    def pool_statistics(self):
+        pool, stats = self.engine.pool, self._pool_statistics
+
+        def attribute(name):
+            value = getattr(pool, name, None)
+            return value() if callable(value) else value
+
+        return {
+            "pool": pool.__class__.__name__,
+            "size": attribute("size"),
+            "checked_in": attribute("checkedin"),
+            "checked_out": attribute("checkedout"),
+            "overflow": attribute("overflow"),
+            "timeout": attribute("timeout"),
+            "checkouts": stats.checkouts,
+            "checkins": stats.checkins,
+            "connects": stats.connects,
+            "invalidations": stats.invalidations,
+            "peak_checked_out": stats.peak_checked_out,
+        }
+
+    def upgrade_schema(self):
+        inspector = inspect(self.engine)
+        with self.engine.begin() as connection:
+            for table in Base.metadata.sorted_tables:
+                existing = {
+                    column["name"]
+                    for column in inspector.get_columns(table.name)
+                }
+                for column in table.columns:
+                    if column.name in existing:
+                        continue
+                    column_type = column.type.compile(
+                        dialect=self.engine.dialect
+                    )
+                    connection.execute(text(
+                        f"ALTER TABLE {table.name} ADD COLUMN {column.name} "
+                        f"{column_type}"
+                        + ("" if column.nullable else " NOT NULL DEFAULT 0")
+                    ))
+
+        with self._session_factory() as session:
+            project_entries = session.scalars(
+                select(ProjectEntry)
+                .where(ProjectEntry.latest_revision_id.is_(None))
+            ).all()
+            for project_entry in project_entries:
+                revision_ids = session.scalars(
+                    select(HistoricalProject.id)
+                    .where(HistoricalProject.project_id == project_entry.id)
+                    .order_by(HistoricalProject.id)
+                ).all()
+                session.execute(update(HistoricalProject), [
+                    {"id": revision_id, "seq": seq}
+                    for seq, revision_id in enumerate(revision_ids, 1)
+                ])
+                project_entry.revision_seq = len(revision_ids)
+                project_entry.latest_revision_id = revision_ids[-1]
+            session.commit()
+
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(self.engine, checkfirst=True)
+        return len(project_entries)
+
+    def repack_notes(self):
+        repacked = 0
+        with self._session_factory() as session:
+            project_ids = session.scalars(
+                select(ProjectEntry.id).order_by(ProjectEntry.id)
+            ).all()
+        for project_id in project_ids:
+            with self._session_factory() as session:
+                revisions = _resolve_notes(session, session.scalars(
+                    select(HistoricalProject)
+                    .where(HistoricalProject.project_id == project_id)
+                    .order_by(HistoricalProject.seq)
+                ).all())
+                base, base_depth = None, 0
+                for revision in revisions:
+                    notes = revision.notes
+                    _store_notes(
+                        revision, notes, base, base_depth,
+                        self.notes_keyframe_interval
+                    )
+                    flag_modified(revision, "notes")
+                    base, base_depth = notes, revision.notes_depth
+                session.commit()
+                repacked += len(revisions)
+        return repacked
+
+    def export_records(self, batch_size=1000):
+        users = User.__table__
+        revisions = HistoricalProject.__table__
+        with self.engine.connect() as connection, \
+                self.engine.connect() as lookup:
+            connection = connection.execution_options(
+                stream_results=True, yield_per=batch_size
+            )
+            for row in connection.execute(select(users).order_by(users.c.id)):
+                yield {"type": "user", **_export_row(row, users.c.keys())}
+
+            project_id = notes = None
+            for partition in connection.execute(
+                select(revisions, ProjectEntry.owner_id)
+                .join(ProjectEntry, ProjectEntry.id == revisions.c.project_id)
+                .order_by(revisions.c.project_id, revisions.c.seq)
+            ).partitions():
+                members = {}
+                ids = [row.id for row in partition]
+                for start in range(0, len(ids), IN_CLAUSE_CHUNK_SIZE):
+                    for member in lookup.execute(
+                        select(ProjectUser.project_id, ProjectUser.user_id)
+                        .where(ProjectUser.project_id.in_(
+                            ids[start:start + IN_CLAUSE_CHUNK_SIZE]
+                        ))
+                        .order_by(ProjectUser.user_id)
+                    ):
+                        members.setdefault(
+                            member.project_id, []
+                        ).append(member.user_id)
+                for row in partition:
+                    if row.project_id != project_id:
+                        project_id, notes = row.project_id, None
+                        yield {
+                            "type": "project",
+                            "id": project_id,
+                            "owner_id": row.owner_id
+                        }
+                    if row.notes_delta is None:
+                        notes = row.notes
+                    else:
+                        notes = _patch_notes(notes or "", row.notes_delta)
+                    yield {
+                        "type": "revision",
+                        **_export_row(row, _EXPORT_REVISION_COLUMNS),
+                        "notes": notes,
+                        "users": members.get(row.id, [])
+                    }
+
+    def import_records(self, records, batch_size=1000):
+        counts = dict.fromkeys(("users", "projects", "revisions"), 0)
+        user_ids, users, batch, carry = {}, [], [], {}
+
+        def flush_users():
+            counts["users"] += self._import_users(users, user_ids)
+            users.clear()
+
+        def flush_projects():
+            nonlocal carry
+            carry, projects, revisions = self._import_projects(
+                batch, user_ids, carry
+            )
+            counts["projects"] += projects
+            counts["revisions"] += revisions
+            batch.clear()
+
+        for record in records:
+            if (kind := record.get("type")) == "user":
+                users.append(record)
+                if len(users) >= batch_size:
+                    flush_users()
+            elif kind in ("project", "revision"):
+                if users:
+                    flush_users()
+                batch.append(record)
+                if kind == "revision" and len(batch) >= batch_size:
+                    flush_projects()
+            else:
+                raise ValueError(f"Unknown record type: {kind!r}")
+        if users:
+            flush_users()
+        if batch:
+            flush_projects()
+        return counts
+
+    def _import_users(self, records, user_ids):
+        table = User.__table__
+        columns = [name for name in table.c.keys() if name != "id"]
+        usernames = [record["username"] for record in records]
+        with self._session_factory() as session:
+            existing = {}
+            for start in range(0, len(usernames), IN_CLAUSE_CHUNK_SIZE):
+                existing.update(session.execute(
+                    select(User.username, User.id).where(User.username.in_(
+                        usernames[start:start + IN_CLAUSE_CHUNK_SIZE]
+                    ))
+                ).all())
+            new = [r for r in records if r["username"] not in existing]
+            created = [User(**_import_row(table, r, columns)) for r in new]
+            session.add_all(created)
+            session.flush()
+            user_ids.update(
+                (record["id"], existing[record["username"]])
+                for record in records if record["username"] in existing
+            )
+            user_ids.update(
+                (record["id"], user.id) for record, user in zip(new, created)
+            )
+            created = [user.id for user in created]
+            session.commit()
+        for user_id in created:
+            self._events.publish(UserCreated(user_id))
+        return len(created)
+
+    def _import_projects(self, records, user_ids, carry):
+        table = HistoricalProject.__table__
+        columns = [
+            name for name in _EXPORT_REVISION_COLUMNS
+            if name not in ("id", "project_id", "created_by", "notes")
+        ]
+
+        def remap(ids, id, kind):
+            if id not in ids:
+                raise ValueError(f"Unknown {kind} id in import: {id}")
+            return ids[id]
+
+        with self._session_factory() as session:
+            new = [record for record in records if record["type"] == "project"]
+            owner_ids = [remap(user_ids, r["owner_id"], "user") for r in new]
+            entry_ids = _insert_entries(session, owner_ids) if new else []
+            projects = dict(carry)
+            projects.update(
+                (record["id"], (entry_id, None, 0))
+                for record, entry_id in zip(new, entry_ids)
+            )
+
+            revisions = []
+            for record in records:
+                if record["type"] != "revision":
+                    continue
+                project_id, base, base_depth = remap(
+                    projects, record["project_id"], "project"
+                )
+                stored, delta, depth = _encode_notes(
+                    notes := record.get("notes"), base, base_depth,
+                    self.notes_keyframe_interval
+                )
+                projects[record["project_id"]] = (project_id, notes, depth)
+                created_by = remap(user_ids, record["created_by"], "user")
+                revisions.append((record, {
+                    **_import_row(table, record, columns),
+                    "project_id": project_id, "created_by": created_by,
+                    "notes": stored, "notes_delta": delta,
+                    "notes_depth": depth,
+                }))
+            if revisions:
+                session.execute(
+                    insert(HistoricalProject),
+                    [revision for _, revision in revisions]
+                )
+            revision_ids = _revision_ids(session, {
+                (revision["project_id"], revision["seq"])
+                for _, revision in revisions
+            })
+            for _, revision in revisions:
+                revision["id"] = revision_ids[
+                    revision["project_id"], revision["seq"]
+                ]
+
+            if members := [
+                {
+                    "project_id": revision["id"],
+                    "user_id": remap(user_ids, user_id, "user")
+                }
+                for record, revision in revisions
+                for user_id in record.get("users", [])
+            ]:
+                session.execute(insert(ProjectUser), members)
+            latest = {revision["project_id"] for _, revision in revisions}
+            _point_to_latest(session, latest | {*entry_ids})
+            _index_notes(session, {
+                project_id: notes
+                for project_id, notes, _ in projects.values()
+                if project_id in latest
+            })
+
+            first = {}
+            for _, revision in revisions:
+                first.setdefault(revision["project_id"], revision["id"])
+            new_ids = {*entry_ids}
+            events = [
+                ProjectCreated(entry_id, first.get(entry_id), owner_id)
+                for entry_id, owner_id in zip(entry_ids, owner_ids)
+            ] + [
+                RevisionAdded(
+                    revision["project_id"], revision["id"],
+                    revision["created_by"]
+                )
+                for _, revision in revisions
+                if revision["project_id"] not in new_ids
+            ]
+            last = records[-1]
+            last_id = last["id" if last["type"] == "project" else "project_id"]
+            carry = {last_id: projects[last_id]}
+            session.commit()
+        for event in events:
+            self._events.publish(event)
+        return carry, len(entry_ids), len(revisions)
+
+
+_ASYNC_DRIVERS = {"sqlite": "aiosqlite", "mysql": "aiomysql"}
+
+
+def _async_url(uri):
+    url = make_url(uri)
+    if url.get_dialect().is_async:
+        return url
+    return url.set(drivername=(
+        f"{url.get_backend_name()}+{_ASYNC_DRIVERS[url.get_backend_name()]}"
+    ))
+
+
+class _AsyncFacade:
+    def __init__(self, engine):
+        self._engine = engine
+
+    async def _run(self, fn, *args, **kwargs):
+        from sqlalchemy.ext.asyncio import AsyncSession
+
+        async with AsyncSession(self._engine) as session:
+            return await session.run_sync(lambda _: fn(*args, **kwargs))
+
+    def _projects(self, projects):
+        return [_AsyncProject(self._engine, project) for project in projects]
+
+
+class _AsyncProject(_AsyncFacade):
+    def __init__(self, engine, project):
+        super().__init__(engine)
+        self._project = project
+        self.id = project.id
+        self.owner_id = project.owner_id
+
+    async def has_user(self, id, historical_project=None):
+        return await self._run(
+            self._project.has_user, id, historical_project
+        )
+
+    async def get(self, id):
+        return await self._run(self._project.get, id)
+
+    async def get_latest(self):
+        return await self._run(self._project.get_latest)
+
+    async def get_history(self):
+        return await self._run(self._project.get_history)
+
+    async def get_history_page(self, before_seq=None, limit=50):
+        return await self._run(
+            self._project.get_history_page, before_seq, limit
+        )
+
+    async def get_users(self, historical_project=None):
+        return await self._run(self._project.get_users, historical_project)
+
+    async def get_user_ids(self, historical_project=None):
+        return await self._run(
+            self._project.get_user_ids, historical_project
+        )
+
+    async def update(self, updated_by, **kwargs):
+        return await self._run(self._project.update, updated_by, **kwargs)
+
+    async def remove(self, expr):
+        return await self._run(self._project.remove, expr)
+
+
+class AsyncUserDatabase(_AsyncFacade):
+    def __init__(self, engine, users):
+        super().__init__(engine)
+        self._users = users
+        self.cache = users.cache
+
+    async def get_all(self):
+        return await self._run(self._users.get_all)
+
+    async def get(self, expr):
+        return await self._run(self._users.get, expr)
+
+    async def get_by_id(self, id):
+        return await self._run(self._users.get_by_id, id)
+
+    async def get_by_username(self, username):
+        return await self._run(self._users.get_by_username, username)
+
+    async def get_many(self, ids):
+        return await self._run(self._users.get_many, ids)
+
+    async def create(self, *args, **kwargs):
+        return await self._run(self._users.create, *args, **kwargs)
+
+    async def update(self, id, **kwargs):
+        return await self._run(self._users.update, id, **kwargs)
+
+
+class AsyncDatabase(_AsyncFacade):
+    def __init__(
+        self, uri, *, user_cache_size=1024, membership_cache_size=4096,
+        notes_keyframe_interval=NOTES_KEYFRAME_INTERVAL, **pool_options
+    ):
+        from sqlalchemy.ext.asyncio import create_async_engine
+
+        self.engine = create_async_engine(
+            _async_url(uri), **_engine_options(**pool_options)
+        )
+        super().__init__(self.engine)
+        self._database = Database(
+            engine=self.engine.sync_engine, create=False,
+            user_cache_size=user_cache_size,
+            membership_cache_size=membership_cache_size,
+            notes_keyframe_interval=notes_keyframe_interval
+        )
+        self.users = AsyncUserDatabase(self.engine, self._database.users)
+
+    @classmethod
+    async def open(cls, uri, *, drop_before_load=False, **options):
+        database = cls(uri, **options)
+        async with database.engine.begin() as connection:
+            if drop_before_load:
+                await connection.run_sync(Base.metadata.drop_all)
+            await connection.run_sync(Base.metadata.create_all)
+        return database
+
+    async def dispose(self):
+        await self.engine.dispose()
+
+    async def create_project(self, owner_id, users=None, **kwargs):
+        return _AsyncProject(self._engine, await self._run(
+            self._database.create_project, owner_id, users, **kwargs
+        ))
+
+    async def create_projects(self, specs):
+        return self._projects(
+            await self._run(self._database.create_projects, specs)
+        )
+
+    async def get_project(self, expr):
+        return _AsyncProject(
+            self._engine, await self._run(self._database.get_project, expr)
+        )
+
+    async def get_projects(self):
+        return self._projects(await self._run(self._database.get_projects))
+
+    async def iter_projects(self, after_id=None, limit=100):
+        return self._projects(
+            await self._run(self._database.iter_projects, after_id, limit)
+        )
+
+    async def projects_for_user(self, user_id):
+        return self._projects(
+            await self._run(self._database.projects_for_user, user_id)
+        )
+
+    async def list_project_summaries(
+        self, after_id=None, limit=None, ids=None
+    ):
+        return await self._run(
+            self._database.list_project_summaries, after_id, limit, ids
+        )
+
+    async def search_projects(self, query, limit=50):
+        return await self._run(self._database.search_projects, query, limit)
+
+    def pool_statistics(self):
+        return self._database.pool_statistics()
+
+    @property
+    def version(self):
+        return self._database.version
+
+    def changes_since(self, version):
+        return self._database.changes_since(version)
+
+    async def watermark(self):
+        return await self._run(self._database.watermark)
+
+    def subscribe(self, event_type, callback):
+        return self._database.subscribe(event_type, callback)
+
+    def unsubscribe(self, event_type, callback):
+        self._database.unsubscribe(event_type, callback)
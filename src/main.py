@@ -1,14 +1,18 @@
 from PyQt5.QtWidgets import (
-    QApplication, QMainWindow, QListWidgetItem, QTableWidgetItem, QDialog
+    QApplication, QMainWindow, QListWidgetItem, QTableWidgetItem, QDialog,
+    QProgressBar
 )
-from PyQt5.QtCore import QTimer, QDate
-from PyQt5 import uic
+from PyQt5.QtCore import Qt, QTimer, QDate
+from sqlalchemy.exc import IntegrityError
 
 from db import (
-    Database, User, ProjectEntry, HistoricalProject
+    Database, User, ProjectEntry, HistoricalProject, DatabaseEvent
 )
 
+import workers
+import models
 import utils
+import functools
 import os
 
 
@@ -23,81 +27,76 @@ def ui_path(s):
 
 
 class ChangeProjectUsers(QDialog):
-    def __init__(self, user_id, project_id, revision_id, parent=None):
+    def __init__(self, parent=None):
         super().__init__(parent)
-        uic.loadUi(ui_path("modify-users"), self)
+        utils.load_ui(ui_path("modify_users"), self)
         
         self.btn_cancel.clicked.connect(self.cancel)
         self.btn_confirm.clicked.connect(self.close)
         self.btn_add.clicked.connect(self.add_user)
         self.btn_remove.clicked.connect(self.remove_user)
 
+        self._members = models.UserListModel(self)
+        self._others = models.UserListModel(self)
+        for view, filter_edit, model in (
+            (self.list_allowed, self.filter_allowed, self._members),
+            (self.list_all, self.filter_all, self._others),
+        ):
+            filter_edit.textChanged.connect(model.set_filter)
+            view.setModel(model)
+
+    def reset(self, user_id, owner_id, member_ids, names):
         self.cancelled = False
         self.user_id = user_id
+        self.owner_id = owner_id
+        self.filter_allowed.clear()
+        self.filter_all.clear()
+        self._members.set_users(names, member_ids)
+        self._others.set_users(names, names.keys() - set(member_ids))
 
-        self.project = g_database.get_project(
-            ProjectEntry.id == project_id
-        )
-        self.revision = self.project.get(revision_id)
-        self.current_users = set(
-            user.user_id for user in self.revision.project_users
-        )
-        self.all_users = set(
-            user.id for user in g_database.users.get_all()
-        ) - self.current_users
+    def set_names(self, names):
+        members = self._members.ids()
+        self._members.set_users(names, members)
+        self._others.set_users(names, names.keys() - members)
 
-        self._populate_tables()
+    @property
+    def current_users(self):
+        return self._members.ids()
 
     def cancel(self):
         self.cancelled = True
         self.close()
 
     def remove_user(self):
-        if not self.current_users:
-            return
-        user_to_remove = self.list_allowed.selectedItems()[0]
-        if (id := user_to_remove.value) == self.project.owner_id:
-            return
-        if id == self.user_id:
-            return
-        self.all_users.add(id)
-        self.current_users -= self.all_users
-        self._populate_tables()
+        ids = self._selected(self.list_allowed) - {self.owner_id, self.user_id}
+        self._members.remove_ids(ids)
+        self._others.add_ids(ids)
 
     def add_user(self):
-        if not self.all_users:
-            return
-        user_to_add = self.list_all.selectedItems()[0]
-        self.current_users.add(user_to_add.value)
-        self.all_users -= self.current_users
-        self._populate_tables()
-
-    def _populate_tables(self):
-        self.list_all.clear()
-        self.list_allowed.clear()
-
-        for id in self.current_users:
-            user = g_database.users.get(User.id == id)
-            list_item = QListWidgetItem(user.full_name or user.username)
-            list_item.value = id
-            self.list_allowed.addItem(list_item)
+        ids = self._selected(self.list_all)
+        self._others.remove_ids(ids)
+        self._members.add_ids(ids)
 
-        for id in self.all_users:
-            user = g_database.users.get(User.id == id)
-            list_item = QListWidgetItem(user.full_name or user.username)
-            list_item.value = id
-            self.list_all.addItem(list_item)
+    @staticmethod
+    def _selected(view):
+        return {
+            index.data(Qt.UserRole)
+            for index in view.selectionModel().selectedRows()
+        }
 
 
 class ConfirmDialog(QDialog):
-    def __init__(self, text, parent=None):
+    def __init__(self, parent=None):
         super().__init__(parent)
-        uic.loadUi(ui_path("dialog"), self)
-        self.label_confirm.setText(text)
+        utils.load_ui(ui_path("dialog"), self)
         self.btn_cancel.clicked.connect(lambda: self.submitted(False))
         self.btn_confirm.clicked.connect(lambda: self.submitted(True))
         self.confirmed = None
 
+    def reset(self, text):
+        self.label_confirm.setText(text)
+        self.confirmed = None
+
     def submitted(self, value):
         self.confirmed = value
         self.close()
@@ -106,7 +105,7 @@ class ConfirmDialog(QDialog):
 class HelpDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
-        uic.loadUi(ui_path("help"), self)
+        utils.load_ui(ui_path("help"), self)
         self.btn_close.clicked.connect(self.close)
 
 
@@ -124,15 +123,43 @@ class MainForm(QMainWindow):
         "view_entry_modified": "Created new revision successfully",
         "view_users_modified": "Changed project userlist",
         "view_modify_permissions": "You don't have permissions to modify "
-            "this project"
+            "this project",
+        "db_error": "The database request failed"
+    }
+    _watched_tables = {
+        "entries": ("projects", "users"),
+        "create_users": ("users",),
     }
 
     def __init__(self, user_object):
         super().__init__()
-        uic.loadUi(ui_path("interface"), self)
+        utils.load_ui(ui_path("interface"), self)
 
         self.user_object = user_object
         self.logs = []
+        self._logs_rendered = 0
+        self._versions = {}
+        self._watermarks = {}
+        self._refresh_scheduled = False
+        self._search_query = ""
+        self._dialogs = {}
+        self._user_names = {}
+        self._edit_owner_id = None
+
+        self._busy_indicator = QProgressBar(self)
+        self._busy_indicator.setRange(0, 0)
+        self._busy_indicator.setMaximumWidth(120)
+        self._busy_indicator.hide()
+        self.status_bar.addPermanentWidget(self._busy_indicator)
+
+        self._tasks = workers.TaskRunner(self)
+        self._tasks.busy_changed.connect(self._set_busy)
+        self._tasks.failed.connect(
+            lambda _: self.set_status_message("db_error")
+        )
+
+        self._db_events = workers.EventBridge(g_database, DatabaseEvent, self)
+        self._db_events.received.connect(self._database_changed)
 
         self._register_tab("action_create_entry", 2)
         self._register_tab("action_logs", 4)
@@ -141,7 +168,9 @@ class MainForm(QMainWindow):
 
         self.action_help.triggered.connect(self.open_help)
         self.action_logout.triggered.connect(self.logout)
-        self.action_refresh.triggered.connect(self._refresh_db_components)
+        self.action_refresh.triggered.connect(
+            lambda: self._refresh_db_components(full=True)
+        )
 
         self.btn_create_entry.clicked.connect(self.create_entry)
         self.btn_update_pref.clicked.connect(self.update_preferences)
@@ -151,68 +180,162 @@ class MainForm(QMainWindow):
         self.btn_view_modify_users.clicked.connect(self.edit_modify_users)
         self.btn_view_confirm.clicked.connect(self.edit_confirm_changes)
 
-        self.table_entries.cellDoubleClicked.connect(self.row_double_clicked)
+        self._entries_model = models.ProjectTableModel(
+            g_database.list_project_summaries, self._tasks, parent=self
+        )
+        self.table_entries.setModel(self._entries_model)
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(300)
+        self._search_timer.timeout.connect(self._view__search)
+        self.search_entries.textChanged.connect(
+            lambda _: self._search_timer.start()
+        )
+        self.table_entries.doubleClicked.connect(
+            lambda index: self.row_double_clicked(index.row())
+        )
         self.table_revision.itemSelectionChanged.connect(self.revision_selected)
 
         self._refresh_db_components()
+        QTimer.singleShot(0, self._prepare_dialogs)
+
+    def _set_busy(self, busy):
+        self._busy_indicator.setVisible(busy)
+        if busy:
+            QApplication.setOverrideCursor(Qt.BusyCursor)
+        else:
+            QApplication.restoreOverrideCursor()
+
+    def _submit_change(self, buttons, fn, *args, on_result, **kwargs):
+        enabled = {button: button.isEnabled() for button in buttons}
+        for button in buttons:
+            button.setEnabled(False)
+
+        def finish(handler, value):
+            for button, state in enabled.items():
+                button.setEnabled(state)
+            handler(value)
+
+        self._tasks.submit(
+            fn, *args,
+            on_result=lambda result: finish(on_result, result),
+            on_error=lambda error: finish(self._tasks.failed.emit, error),
+            **kwargs
+        )
+
+    def _edit__buttons(self):
+        return (
+            self.btn_view_modify_users, self.btn_view_remove,
+            self.btn_view_confirm
+        )
 
-    def _refresh_db_components(self):
-        self._view__populate_projects()
-        self._create__populate_users()
+    def _refresh_db_components(self, *, full=False):
+        if full:
+            g_database.memberships.forget_latest()
+        self._view__refresh(full=full)
+        self._create__refresh_users(full=full)
         self._pref__populate()
         self._logs_populate()
+        for component in self._watched_tables:
+            self._check_watermark(component, baseline=True)
+
+    def _database_changed(self, event):
+        if self._refresh_scheduled:
+            return
+        self._refresh_scheduled = True
+        QTimer.singleShot(0, self._apply_database_changes)
+
+    def _apply_database_changes(self):
+        self._refresh_scheduled = False
+        self._view__refresh()
+        self._create__refresh_users()
+
+    def _check_watermark(self, component, *, baseline=False):
+        def compare(watermark):
+            watermark = {
+                table: watermark[table]
+                for table in self._watched_tables[component]
+            }
+            previous = self._watermarks.get(component)
+            self._watermarks[component] = watermark
+            if not baseline and previous not in (None, watermark):
+                g_database.memberships.forget_latest()
+                {
+                    "entries": self._view__refresh,
+                    "create_users": self._create__refresh_users,
+                }[component](full=True)
+
+        self._tasks.submit(
+            g_database.watermark, on_result=compare,
+            key=f"watermark_{component}"
+        )
+
+    def _pending_changes(self, component):
+        version, changes = g_database.changes_since(
+            self._versions.get(component)
+        )
+        self._versions[component] = version
+        return changes
+
+    def _view__refresh(self, *, full=False):
+        changes = self._pending_changes("entries")
+        if full or changes is None or changes["users"] or (
+            changes["projects"] and self._search_query
+        ):
+            self._entries_model.reset()
+        elif changes["projects"]:
+            self._entries_model.refresh_rows(changes["projects"])
+
+    def _view__search(self):
+        if (query := self.search_entries.text().strip()) == self._search_query:
+            return
+        self._search_query = query
+        self._entries_model.set_fetch(
+            functools.partial(self._view__search_results, query)
+            if query else g_database.list_project_summaries
+        )
+
+    @staticmethod
+    def _view__search_results(query, after_id=None, limit=None, ids=None):
+        if ids is not None:
+            return g_database.list_project_summaries(ids=ids)
+        if after_id is not None:
+            return []
+        return g_database.search_projects(query, limit)
+
+    def _create__refresh_users(self, *, full=False):
+        changes = self._pending_changes("create_users")
+        if full or changes is None or changes["users"]:
+            self._tasks.submit(
+                g_database.users.get_all,
+                on_result=self._create__populate_users, key="create_users"
+            )
 
     def _pref__populate(self):
         self.pref_username.setText(self.user_object.username)
         self.pref_name.setText(self.user_object.full_name or "")
 
     def _logs_populate(self):
-        self.list_logs.clear()
-        self.list_logs.addItems(self.logs)
+        self.list_logs.addItems(self.logs[self._logs_rendered:])
+        self._logs_rendered = len(self.logs)
 
     def clear_logs(self):
         self.logs = []
-        self._refresh_db_components()
+        self._logs_rendered = 0
+        self.list_logs.clear()
 
-    def _create__populate_users(self):
+    def _create__populate_users(self, users):
+        self._user_names = {
+            user.id: user.full_name or user.username for user in users
+        }
         self.create_project_users.clear()
-        for user in g_database.users.get_all():
+        for user in users:
             if user.id == self.user_object.id:
                 continue
             item = QListWidgetItem(user.full_name or user.username)
             item.value = user.id
             self.create_project_users.addItem(item)
 
-    def _view__populate_projects(self):
-        self.table_entries.setRowCount(
-            len(projects := g_database.get_projects())
-        )
-
-        for idx, project in enumerate(projects):
-            created_at = QTableWidgetItem(
-                str(project.get_history()[0].created_at)
-            )
-            latest_project = project.get_latest()
-            created_at.value = project.id
-            self.table_entries.setItem(idx, 0, created_at)
-            self.table_entries.setItem(
-                idx,
-                1, QTableWidgetItem(str(latest_project.created_at))
-            )
-            author = g_database.users.get(User.id == project.owner_id)
-            self.table_entries.setItem(
-                idx,
-                2, QTableWidgetItem(author.username or author.full_name)
-            )
-            self.table_entries.setItem(
-                idx,
-                3, QTableWidgetItem(latest_project.urgency)
-            )
-            self.table_entries.setItem(
-                idx,
-                4, QTableWidgetItem(str(latest_project.deadline))
-            )
-
     def _edit__clear(self, *, clear_revisions=True):
         if clear_revisions:
             self.table_revision.itemSelectionChanged.disconnect()
@@ -230,15 +353,26 @@ class MainForm(QMainWindow):
 
     def _edit__load_project(self, id):
         self._edit__clear()
-        project = g_database.get_project(ProjectEntry.id == id)
-        base_project = g_database.get_project(
-            ProjectEntry.id == id
+        self._tasks.submit(
+            self._edit__fetch_project, id, self.user_object.id,
+            on_result=self._edit__show_project, key="edit_project"
         )
-        self.table_revision.setRowCount(
-            len(history := project.get_history())
+
+    @staticmethod
+    def _edit__fetch_project(id, user_id):
+        project = g_database.get_project(ProjectEntry.id == id)
+        history = project.get_history()
+        authors = g_database.users.get_many(
+            revision.created_by for revision in history
         )
+        can_edit = project.has_user(user_id, history[-1].id)
+        return history, authors, can_edit, project.owner_id
+
+    def _edit__show_project(self, result):
+        history, authors, can_edit, self._edit_owner_id = result
+        self.table_revision.setRowCount(len(history))
         for idx, revision in enumerate(history):
-            user = g_database.users.get(User.id == revision.created_by)
+            user = authors[revision.created_by]
             created = QTableWidgetItem(str(revision.created_at))
             created.value = revision
             self.table_revision.setItem(idx, 0, created)
@@ -247,7 +381,7 @@ class MainForm(QMainWindow):
                 1, QTableWidgetItem(user.full_name or user.username)
             )
         self.table_revision.selectRow(idx)
-        if not base_project.has_user(self.user_object.id):
+        if not can_edit:
             self.btn_view_edit.setEnabled(False)
             self.btn_view_edit.setText("Read-only")
         else:
@@ -278,68 +412,117 @@ class MainForm(QMainWindow):
         self.list_project_users.setEnabled(to)
 
     def edit_remove_entry(self):
-        confirm_dialog = ConfirmDialog(
-            "Are you sure you want to remove this revision?",
-            self
-        )
+        confirm_dialog = self._dialog(ConfirmDialog)
+        confirm_dialog.reset("Are you sure you want to remove this revision?")
         confirm_dialog.exec_()
         if not confirm_dialog.confirmed:
             return
-        project = self._edit__get_selected_revision()
+        self._submit_change(
+            self._edit__buttons(), self._edit__remove_revision,
+            self._edit__get_selected_revision(), self.user_object.id,
+            on_result=self._edit__revision_removed
+        )
+
+    @staticmethod
+    def _edit__remove_revision(project, user_id):
         base_project = g_database.get_project(
             ProjectEntry.id == project.project_id
         )
-        if self.user_object.id != base_project.owner_id:
-            self.set_status_message("view_remove_entry_permission")
-            return
+        if user_id != base_project.owner_id:
+            return base_project.id, "view_remove_entry_permission"
         try:
             base_project.remove(HistoricalProject.id == project.id)
         except ValueError:
-            self.set_status_message("view_remove_entry_last")
+            return base_project.id, "view_remove_entry_last"
+        return base_project.id, "view_remove_entry_ok"
+
+    def _edit__revision_removed(self, result):
+        project_id, message = result
+        self.set_status_message(message)
+        if message != "view_remove_entry_ok":
             return
-        self.set_status_message("view_remove_entry_ok")
-        self._refresh_db_components()
-        self._edit__load_project(base_project.id)
+        self._edit__load_project(project_id)
 
     def edit_modify_users(self):
         project = self._edit__get_selected_revision()
-        base_project = g_database.get_project(
-            ProjectEntry.id == project.project_id
+        change_dialog = self._dialog(ChangeProjectUsers)
+        change_dialog.reset(
+            self.user_object.id, self._edit_owner_id,
+            {user.user_id for user in project.project_users},
+            self._user_names
         )
-        change_dialog = ChangeProjectUsers(
-            self.user_object.id, base_project.id, project.id, self
+        self._tasks.submit(
+            g_database.users.get_all,
+            on_result=self._edit__refresh_user_names, key="modify_users"
         )
         change_dialog.exec_()
 
         if change_dialog.cancelled:
             return
 
+        self._edit__show_project_users([*change_dialog.current_users])
+        self.set_status_message("view_users_modified")
+
+    def _edit__refresh_user_names(self, users):
+        self._user_names = {
+            user.id: user.full_name or user.username for user in users
+        }
+        self._dialog(ChangeProjectUsers).set_names(self._user_names)
+
+    def _edit__show_project_users(self, user_ids):
         self.list_project_users.clear()
-        for allowed_id in change_dialog.current_users:
-            user = g_database.users.get(User.id == allowed_id)
-            list_item = QListWidgetItem(user.full_name or user.username)
-            list_item.value = user.id
+        for user_id in user_ids:
+            list_item = QListWidgetItem(
+                self._user_names.get(user_id, str(user_id))
+            )
+            list_item.value = user_id
             self.list_project_users.addItem(list_item)
+        if missing := [
+            user_id for user_id in user_ids
+            if user_id not in self._user_names
+        ]:
+            self._tasks.submit(
+                g_database.users.get_many, missing,
+                on_result=self._edit__name_project_users,
+                key="edit_project_users"
+            )
 
-        self.set_status_message("view_users_modified")
+    def _edit__name_project_users(self, users):
+        self._user_names = {**self._user_names, **{
+            user.id: user.full_name or user.username
+            for user in users.values()
+        }}
+        for i in range(self.list_project_users.count()):
+            list_item = self.list_project_users.item(i)
+            if (name := self._user_names.get(list_item.value)) is not None:
+                list_item.setText(name)
 
     def edit_confirm_changes(self):
         project = self._edit__get_selected_revision()
-        base_project = g_database.get_project(
-            ProjectEntry.id == project.project_id
+        self._submit_change(
+            self._edit__buttons(), self._edit__save_revision,
+            project.project_id, self.user_object.id, {
+                "notes": self.view_notes.toPlainText(),
+                "deadline": self.view_deadline.dateTime().toPyDateTime(),
+                "urgency": self.view_urgency.text(),
+                "users": [
+                    self.list_project_users.item(i).value
+                    for i in range(self.list_project_users.count())
+                ]
+            },
+            on_result=self._edit__revision_saved
         )
-        base_project.update(self.user_object.id, **{
-            "notes": self.view_notes.toPlainText(),
-            "deadline": self.view_deadline.dateTime().toPyDateTime(),
-            "urgency": self.view_urgency.text(),
-            "users": [
-                self.list_project_users.item(i).value
-                for i in range(self.list_project_users.count())
-            ]
-        })
+
+    @staticmethod
+    def _edit__save_revision(project_id, user_id, changes):
+        g_database.get_project(
+            ProjectEntry.id == project_id
+        ).update(user_id, **changes)
+        return project_id
+
+    def _edit__revision_saved(self, project_id):
         self.set_status_message("view_entry_modified")
-        self._refresh_db_components()
-        self._edit__load_project(base_project.id)
+        self._edit__load_project(project_id)
 
     def revision_selected(self):
         self._edit__clear(clear_revisions=False)
@@ -350,28 +533,47 @@ class MainForm(QMainWindow):
         self.view_urgency.setText(project.urgency)
         self.view_deadline.setDate(QDate(project.deadline))
         self.view_notes.setPlainText(project.notes)
-        for project_user in project.project_users:
-            user = g_database.users.get(User.id == project_user.user_id)
-            list_item = QListWidgetItem(
-                user.full_name or user.username
-            )
-            list_item.value = user.id
-            self.list_project_users.addItem(list_item)
+        self._edit__show_project_users([
+            project_user.user_id for project_user in project.project_users
+        ])
 
     def update_preferences(self):
-        full_name = self.pref_name.text()
-        g_database.users.update(self.user_object.id, full_name=full_name)
+        self._submit_change(
+            (self.btn_update_pref,),
+            self._pref__save, self.user_object.id, self.pref_name.text(),
+            on_result=self._pref__saved
+        )
+
+    @staticmethod
+    def _pref__save(user_id, full_name):
+        g_database.users.update(user_id, full_name=full_name)
+        return g_database.users.get_by_id(user_id)
+
+    def _pref__saved(self, user_object):
+        self.user_object = user_object
         self.set_status_message("updated_name")
-        self._refresh_db_components()
+        self._pref__populate()
 
     def row_double_clicked(self, which):
-        project_id = self.table_entries.item(which, 0).value
+        project_id = self._entries_model.project_id(which)
         self._edit__load_project(project_id)
         self.change_tab(1)
 
     def open_help(self):
-        self._help_dialog = HelpDialog(self)
-        self._help_dialog.exec_()
+        self._dialog(HelpDialog).exec_()
+
+    def _dialog(self, dialog_class):
+        if (dialog := self._dialogs.get(dialog_class)) is None:
+            dialog = self._dialogs[dialog_class] = dialog_class(self)
+        return dialog
+
+    def _prepare_dialogs(self):
+        for dialog_class in (ConfirmDialog, HelpDialog, ChangeProjectUsers):
+            self._dialog(dialog_class)
+
+    def closeEvent(self, event):
+        self._db_events.close()
+        super().closeEvent(event)
 
     def logout(self):
         self.user_object = None
@@ -386,18 +588,28 @@ class MainForm(QMainWindow):
         notes = self.create_notes.toPlainText()
         urgency = self.create_urgency.text()
         deadline = self.create_deadline.dateTime().toPyDateTime()
-        project = g_database.create_project(
+        self._submit_change(
+            (self.btn_create_entry,), g_database.create_project,
             self.user_object.id,
             notes=notes, urgency=urgency, deadline=deadline,
-            users=selected_user_ids
+            users=selected_user_ids,
+            on_result=self._create__entry_created
         )
-        self._refresh_db_components()
+
+    def _create__entry_created(self, project):
         self._edit__load_project(project.id)
         self.set_status_message("created_entry")
         self.change_tab(1)
 
     def change_tab(self, to):
-        self._refresh_db_components()
+        {
+            0: self._view__refresh,
+            2: self._create__refresh_users,
+            3: self._pref__populate,
+            4: self._logs_populate,
+        }.get(to, lambda: None)()
+        if component := {0: "entries", 2: "create_users"}.get(to):
+            self._check_watermark(component)
         self.tab_widget.setCurrentIndex(to)
 
 
@@ -408,35 +620,84 @@ class StartupDialog(QMainWindow):
         "reg_verify": "The passwords do not match",
         "reg_existing": "Username already exists",
         "cache_invalid": "Saved login is invalid",
+        "login_progress": "Signing in...",
+        "reg_progress": "Creating account...",
+        "db_error": "The database request failed",
     }
     LOGIN_CACHE_PATH = "./.mgmt-login"
 
     def __init__(self, *, just_logged_out=False):
         super().__init__()
         utils.add_font_resource(":/fonts/cmunss.ttf")
-        uic.loadUi(ui_path("start"), self)
+        utils.load_ui(ui_path("start"), self)
 
         self.user_object = None
 
+        self._busy_indicator = QProgressBar(self)
+        self._busy_indicator.setRange(0, 0)
+        self._busy_indicator.setMaximumWidth(120)
+        self._busy_indicator.hide()
+        self.status_bar.addPermanentWidget(self._busy_indicator)
+
+        self._tasks = workers.TaskRunner(self, max_threads=1)
+        self._tasks.busy_changed.connect(self._set_busy)
+        self._tasks.failed.connect(
+            lambda _: self.set_status_message("db_error")
+        )
+
         self.btn_login.clicked.connect(self.on_login)
         self.btn_register.clicked.connect(self.on_register)
 
         if not just_logged_out:
-            self._try_login_from_cache()
+            QTimer.singleShot(0, self._try_login_from_cache)
 
-    def _login(self, username, password):
+    def _set_busy(self, busy):
+        self._busy_indicator.setVisible(busy)
+        self.btn_login.setEnabled(not busy)
+        self.btn_register.setEnabled(not busy)
+        if not busy:
+            self.status_bar.clearMessage()
+
+    @staticmethod
+    def _authenticate(username, password):
         try:
             potential = g_database.users.get(User.username == username)
         except IndexError:
-            self.set_status_message("login_fail")
-            return False
+            return None
         if utils.hash_password(password) != potential.password_hash:
-            self.set_status_message("login_fail")
-            return False
-        self.user_object = potential
+            return None
+        return potential
+
+    @staticmethod
+    def _register(username, password):
+        values = {
+            "username": username,
+            "password_hash": utils.hash_password(password)
+        }
+        try:
+            user_id = g_database.users.create(**values)
+        except IntegrityError:
+            return None
+        return User(id=user_id, **values)
+
+    def _login(self, username, password, *, failure="login_fail"):
+        self.status_bar.showMessage(self._s["login_progress"])
+        self._tasks.submit(
+            self._authenticate, username, password,
+            on_result=lambda user: self._logged_in(
+                user, username, password, failure
+            ),
+            key="login"
+        )
+
+    def _logged_in(self, user, username, password, failure):
+        if user is None:
+            self.set_status_message(failure)
+            return
+        self.user_object = user
         if self.is_remember_me_checked():
             self._create_login_cache(username, password)
-        return True
+        self.open_main_interface()
 
     def _create_login_cache(self, username, password):
         with open(self.LOGIN_CACHE_PATH, "w") as out:
@@ -447,10 +708,7 @@ class StartupDialog(QMainWindow):
             return
         with open(self.LOGIN_CACHE_PATH) as f_login:
             username, password = f_login.read().splitlines()
-        if not self._login(username, password):
-            self.set_status_message("cache_invalid")
-            return
-        self.open_main_interface()
+        self._login(username, password, failure="cache_invalid")
 
     def is_remember_me_checked(self):
         return self.cb_remember_me.isChecked()
@@ -465,8 +723,7 @@ class StartupDialog(QMainWindow):
         if not username or not password:
             self.set_status_message("fields_empty")
             return
-        if self._login(username, password):
-            self.open_main_interface()
+        self._login(username, password)
 
     def on_register(self):
         self.user_object
@@ -479,18 +736,14 @@ class StartupDialog(QMainWindow):
         if password != verify_password:
             self.set_status_message("reg_verify")
             return
-        try:
-            g_database.users.get(User.username == username)
-            self.set_status_message("reg_existing")
-            return
-        except IndexError:
-            pass
-        g_database.users.create(
-            username=username,
-            password_hash=utils.hash_password(password)
+        self.status_bar.showMessage(self._s["reg_progress"])
+        self._tasks.submit(
+            self._register, username, password,
+            on_result=lambda user: self._logged_in(
+                user, username, password, "reg_existing"
+            ),
+            key="login"
         )
-        if self._login(username, password):
-            self.open_main_interface()
 
     def open_main_interface(self):
         self.main_form = MainForm(self.user_object)
@@ -0,0 +1,111 @@
+from db import Database, NOTES_KEYFRAME_INTERVAL
+
+import argparse
+import json
+import os
+import sys
+
+
+def migrate(database, args):
+    upgraded = database.upgrade_schema()
+    print(f"backfilled revision sequences for {upgraded} projects")
+    repacked = database.repack_notes()
+    print(f"repacked notes of {repacked} revisions")
+    indexed = database.rebuild_search_index()
+    print(f"indexed notes of {indexed} projects for search")
+
+
+def export(database, args):
+    output = sys.stdout if args.output == "-" else open(
+        args.output, "w", encoding="utf-8"
+    )
+    with output:
+        for record in database.export_records(batch_size=args.batch_size):
+            output.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+
+def import_(database, args):
+    source = sys.stdin if args.input == "-" else open(
+        args.input, encoding="utf-8"
+    )
+    with source:
+        counts = database.import_records(
+            (json.loads(line) for line in source if line.strip()),
+            batch_size=args.batch_size
+        )
+    print(
+        f"imported {counts['users']} users, {counts['projects']} projects "
+        f"and {counts['revisions']} revisions"
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Maintenance commands for the project database"
+    )
+    parser.add_argument(
+        "--uri", default=os.environ.get("SQL_URI"),
+        help="database URI (defaults to $SQL_URI)"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    migrate_parser = commands.add_parser(
+        "migrate",
+        help="upgrade an existing database to the current schema, "
+             "re-encode revision notes as keyframes and deltas and "
+             "rebuild the search index"
+    )
+    migrate_parser.add_argument(
+        "--keyframe-interval", type=int, default=NOTES_KEYFRAME_INTERVAL,
+        help="store full notes every N revisions"
+    )
+    migrate_parser.set_defaults(handler=migrate)
+
+    export_parser = commands.add_parser(
+        "export",
+        help="stream users, projects and revisions with their members "
+             "as JSON lines"
+    )
+    export_parser.add_argument(
+        "-o", "--output", default="-",
+        help="file to write to (defaults to standard output)"
+    )
+    export_parser.add_argument(
+        "--batch-size", type=int, default=1000,
+        help="rows fetched per round trip"
+    )
+    export_parser.set_defaults(handler=export)
+
+    import_parser = commands.add_parser(
+        "import",
+        help="load JSON lines written by export, assigning new ids; "
+             "users whose username already exists are reused"
+    )
+    import_parser.add_argument(
+        "-i", "--input", default="-",
+        help="file to read from (defaults to standard input)"
+    )
+    import_parser.add_argument(
+        "--batch-size", type=int, default=1000,
+        help="records inserted per transaction"
+    )
+    import_parser.set_defaults(handler=import_)
+
+    args = parser.parse_args(argv)
+    if args.uri is None:
+        parser.error("no database URI given and SQL_URI is not set")
+    try:
+        database = Database(
+            args.uri,
+            create=args.handler is not export,
+            notes_keyframe_interval=getattr(
+                args, "keyframe_interval", NOTES_KEYFRAME_INTERVAL
+            )
+        )
+    except ValueError as e:
+        parser.error(str(e))
+    args.handler(database, args)
+
+
+if __name__ == '__main__':
+    main()
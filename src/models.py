@@ -0,0 +1,182 @@
+from PyQt5.QtCore import (
+    Qt, QAbstractTableModel, QAbstractListModel, QModelIndex
+)
+
+
+class ProjectTableModel(QAbstractTableModel):
+    HEADERS = ("Created at", "Last revision", "Author", "Urgency", "Deadline")
+
+    def __init__(self, fetch, tasks, *, page_size=200, parent=None):
+        super().__init__(parent)
+        self._fetch = fetch
+        self._tasks = tasks
+        self.page_size = page_size
+        self._rows = []
+        self._row_index = {}
+        self._exhausted = False
+        self._fetching = False
+        self._generation = 0
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        summary = self._rows[index.row()]
+        return (
+            str(summary.created_at),
+            str(summary.updated_at),
+            summary.owner_name,
+            summary.urgency,
+            str(summary.deadline),
+        )[index.column()]
+
+    def project_id(self, row):
+        return self._rows[row].id
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not (parent.isValid() or self._exhausted or self._fetching)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if not self.canFetchMore(parent):
+            return
+        self._fetching = True
+        generation = self._generation
+        self._tasks.submit(
+            self._fetch,
+            after_id=self._rows[-1].id if self._rows else None,
+            limit=self.page_size,
+            on_result=lambda page: self._append_page(generation, page),
+            on_error=lambda error: self._page_failed(generation, error)
+        )
+
+    def refresh_rows(self, ids):
+        generation = self._generation
+        self._tasks.submit(
+            self._fetch, ids=sorted(ids),
+            on_result=lambda rows: self._patch_rows(generation, rows),
+            on_error=lambda error: self._tasks.failed.emit(error)
+        )
+
+    def set_fetch(self, fetch):
+        self._fetch = fetch
+        self.reset()
+
+    def reset(self):
+        self.beginResetModel()
+        self._rows = []
+        self._row_index = {}
+        self._exhausted = False
+        self._fetching = False
+        self._generation += 1
+        self.endResetModel()
+        self.fetchMore()
+
+    def _append_page(self, generation, page):
+        if generation != self._generation:
+            return
+        self._fetching = False
+        self._exhausted = len(page) < self.page_size
+        if not page:
+            return
+        self._insert_rows(page)
+
+    def _patch_rows(self, generation, rows):
+        if generation != self._generation:
+            return
+        appended = []
+        for summary in rows:
+            if (row := self._row_index.get(summary.id)) is not None:
+                self._rows[row] = summary
+                self.dataChanged.emit(
+                    self.index(row, 0),
+                    self.index(row, len(self.HEADERS) - 1)
+                )
+            elif self._exhausted and (
+                not self._rows or summary.id > self._rows[-1].id
+            ):
+                appended.append(summary)
+        if appended:
+            self._insert_rows(appended)
+
+    def _insert_rows(self, rows):
+        self.beginInsertRows(
+            QModelIndex(), len(self._rows), len(self._rows) + len(rows) - 1
+        )
+        for summary in rows:
+            self._row_index[summary.id] = len(self._rows)
+            self._rows.append(summary)
+        self.endInsertRows()
+
+    def _page_failed(self, generation, error):
+        if generation == self._generation:
+            self._fetching = False
+        self._tasks.failed.emit(error)
+
+
+class UserListModel(QAbstractListModel):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._names = {}
+        self._folded = {}
+        self._ids = []
+        self._visible = []
+        self._filter = ""
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._visible)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        id = self._visible[index.row()]
+        if role == Qt.DisplayRole:
+            return self._names.get(id, str(id))
+        if role == Qt.UserRole:
+            return id
+        return None
+
+    def ids(self):
+        return set(self._ids)
+
+    def set_users(self, names, ids):
+        if names is not self._names:
+            self._names, self._folded = names, {}
+        self._ids = sorted(ids, key=self._sort_key)
+        self._apply_filter()
+
+    def set_filter(self, text):
+        self._filter = text.casefold()
+        self._apply_filter()
+
+    def add_ids(self, ids):
+        if ids:
+            self.set_users(self._names, [*self._ids, *ids])
+
+    def remove_ids(self, ids):
+        if ids:
+            self._ids = [id for id in self._ids if id not in ids]
+            self._apply_filter()
+
+    def _sort_key(self, id):
+        if (folded := self._folded.get(id)) is None:
+            folded = self._folded[id] = (
+                self._names.get(id, str(id)).casefold()
+            )
+        return folded, id
+
+    def _apply_filter(self):
+        self.beginResetModel()
+        self._visible = [
+            id for id in self._ids if self._filter in self._folded[id]
+        ] if self._filter else self._ids
+        self.endResetModel()
@@ -1,9395 +0,0 @@
-# -*- coding: utf-8 -*-
-
-# Resource object code
-#
-# Created by: The Resource Compiler for PyQt5 (Qt v5.15.2)
-#
-# WARNING! All changes made in this file will be lost!
-
-from PyQt5 import QtCore
-
-qt_resource_data = b"\
-\x00\x02\x47\xa8\
-\x00\
-\x01\x00\x00\x00\x13\x01\x00\x00\x04\x00\x30\x46\x46\x54\x4d\x5c\
-\x4d\x19\x55\x00\x00\x01\x3c\x00\x00\x00\x1c\x47\x44\x45\x46\x0b\
-\xfa\x09\x03\x00\x00\x01\x58\x00\x00\x00\x56\x47\x50\x4f\x53\x4b\
-\x96\x0a\xd8\x00\x00\x01\xb0\x00\x00\x20\x30\x47\x53\x55\x42\xa6\
-\xad\x97\x0b\x00\x00\x21\xe0\x00\x00\x01\x08\x4f\x53\x2f\x32\x53\
-\x17\x98\x8c\x00\x00\x22\xe8\x00\x00\x00\x56\x63\x6d\x61\x70\x61\
-\x47\xbd\xae\x00\x00\x23\x40\x00\x00\x04\x5e\x63\x76\x74\x20\x0d\
-\x2c\x0b\x07\x00\x00\x27\xa0\x00\x00\x00\x3e\x66\x70\x67\x6d\x53\
-\xb4\x2f\xa7\x00\x00\x27\xe0\x00\x00\x02\x65\x67\x61\x73\x70\x00\
-\x00\x00\x10\x00\x00\x2a\x48\x00\x00\x00\x08\x67\x6c\x79\x66\x9d\
-\x07\x9c\x79\x00\x00\x2a\x50\x00\x01\xf2\xc0\x68\x65\x61\x64\xfa\
-\xbf\xf7\xf1\x00\x02\x1d\x10\x00\x00\x00\x36\x68\x68\x65\x61\x0a\
-\x12\x0a\x83\x00\x02\x1d\x48\x00\x00\x00\x24\x68\x6d\x74\x78\x13\
-\xc8\xee\x14\x00\x02\x1d\x6c\x00\x00\x0a\xae\x6c\x6f\x63\x61\xfe\
-\x30\x82\x54\x00\x02\x28\x1c\x00\x00\x05\x5a\x6d\x61\x78\x70\x03\
-\xcd\x02\xc1\x00\x02\x2d\x78\x00\x00\x00\x20\x6e\x61\x6d\x65\x5d\
-\x6d\x82\x4a\x00\x02\x2d\x98\x00\x00\x04\x22\x70\x6f\x73\x74\x47\
-\xc6\x57\x07\x00\x02\x31\xbc\x00\x00\x14\xa8\x70\x72\x65\x70\x4a\
-\x03\x08\x30\x00\x02\x46\x64\x00\x00\x01\x3c\x77\x65\x62\x66\x4d\
-\x27\x50\x3e\x00\x02\x47\xa0\x00\x00\x00\x06\x00\x00\x00\x01\x00\
-\x00\x00\x00\xc9\x89\x6f\x31\x00\x00\x00\x00\xc6\x5f\xac\x7d\x00\
-\x00\x00\x00\xcc\x63\xfd\xa6\x00\x01\x00\x00\x00\x0e\x00\x00\x00\
-\x4e\x00\x00\x00\x00\x00\x02\x00\x0a\x00\x01\x00\xa4\x00\x01\x00\
-\xa5\x00\xa8\x00\x02\x00\xa9\x00\xbc\x00\x01\x00\xbd\x00\xbd\x00\
-\x02\x00\xbe\x00\xdc\x00\x01\x00\xdd\x00\xdd\x00\x02\x00\xde\x00\
-\xe0\x00\x01\x00\xe1\x00\xe1\x00\x02\x00\xe2\x02\xa6\x00\x01\x02\
-\xa7\x02\xab\x00\x02\x00\x04\x00\x00\x00\x02\x00\x00\x00\x00\x00\
-\x01\x00\x00\x00\x0a\x00\x54\x00\x6e\x00\x04\x44\x46\x4c\x54\x00\
-\x1a\x63\x79\x72\x6c\x00\x26\x67\x72\x65\x6b\x00\x32\x6c\x61\x74\
-\x6e\x00\x3e\x00\x04\x00\x00\x00\x00\xff\xff\x00\x01\x00\x00\x00\
-\x04\x00\x00\x00\x00\xff\xff\x00\x01\x00\x01\x00\x04\x00\x00\x00\
-\x00\xff\xff\x00\x01\x00\x01\x00\x04\x00\x00\x00\x00\xff\xff\x00\
-\x01\x00\x01\x00\x02\x6b\x65\x72\x6e\x00\x0e\x6b\x65\x72\x6e\x00\
-\x14\x00\x00\x00\x01\x00\x00\x00\x00\x00\x01\x00\x01\x00\x02\x00\
-\x06\x00\x0e\x00\x02\x00\x00\x00\x01\x00\x10\x00\x02\x00\x00\x00\
-\x01\x01\x52\x00\x01\x01\x42\x00\x04\x00\x00\x00\x02\x00\x0e\x00\
-\xa4\x00\x25\x00\x26\xff\xc7\x00\x2a\xff\xc7\x00\x32\xff\xc7\x00\
-\x34\xff\xc7\x00\x39\xff\x1d\x00\x3a\xff\x56\x00\x3c\xff\x56\x00\
-\x4a\x00\x73\x00\x4d\x00\xe3\x00\x59\xff\x56\x00\x5a\xff\x8d\x00\
-\x5c\x00\x73\x00\x81\xff\xc7\x00\x8c\xff\xc7\x00\x8d\xff\xc7\x00\
-\x8e\xff\xc7\x00\x8f\xff\xc7\x00\x90\xff\xc7\x00\x91\xff\xc7\x00\
-\x96\xff\x56\x00\xb6\x00\x73\x00\xb8\x00\x73\x00\xbf\xff\xc7\x00\
-\xc1\xff\xc7\x00\xc3\xff\xc7\x00\xc5\xff\xc7\x00\xd3\xff\xc7\x00\
-\xd4\x00\x73\x00\xd5\xff\xc7\x00\xd6\x00\x73\x00\xd7\xff\xc7\x00\
-\xd8\x00\x73\x00\xe1\x00\xe3\x00\xec\xff\xc7\x00\xee\xff\xc7\x01\
-\x08\xff\x56\x02\x86\x00\xe3\x00\x27\x00\x0f\x00\xe3\x00\x26\xff\
-\xc7\x00\x2a\xff\xc7\x00\x32\xff\xc7\x00\x34\xff\xc7\x00\x39\xff\
-\x1d\x00\x3a\xff\x56\x00\x3c\xff\x56\x00\x4a\x00\x73\x00\x4d\x00\
-\xe3\x00\x59\xff\x56\x00\x5a\xff\x8d\x00\x5c\x00\x73\x00\x81\xff\
-\xc7\x00\x8c\xff\xc7\x00\x8d\xff\xc7\x00\x8e\xff\xc7\x00\x8f\xff\
-\xc7\x00\x90\xff\xc7\x00\x91\xff\xc7\x00\x96\xff\x56\x00\xb6\x00\
-\x73\x00\xb8\x00\x73\x00\xbf\xff\xc7\x00\xc1\xff\xc7\x00\xc3\xff\
-\xc7\x00\xc5\xff\xc7\x00\xd3\xff\xc7\x00\xd4\x00\x73\x00\xd5\xff\
-\xc7\x00\xd6\x00\x73\x00\xd7\xff\xc7\x00\xd8\x00\x73\x00\xe1\x00\
-\xe3\x00\xec\xff\xc7\x00\xee\xff\xc7\x01\x08\xff\x56\x02\x82\x00\
-\xe3\x02\x86\x00\xe3\x00\x01\x00\x02\x02\x82\x02\x86\x00\x01\x1c\
-\x66\x00\x04\x00\x00\x00\xfc\x02\x02\x03\x2c\x03\x72\x04\x60\x04\
-\x6a\x04\xc0\x03\x2c\x04\xe2\x05\x8c\x03\x72\x03\x72\x05\xfe\x06\
-\x50\x06\xea\x07\x00\x07\x82\x07\x88\x07\xaa\x07\xb0\x07\x00\x07\
-\x00\x08\x46\x08\x58\x08\x5e\x08\xec\x02\x02\x02\x02\x02\x02\x02\
-\x02\x02\x02\x02\x02\x03\x2c\x03\x2c\x03\x2c\x03\x2c\x03\x2c\x03\
-\x2c\x03\x2c\x06\x50\x06\xea\x06\xea\x06\xea\x06\xea\x06\xea\x06\
-\xea\x07\x00\x07\x00\x07\x00\x07\x00\x07\x00\x07\x00\x08\x58\x08\
-\x58\x08\x58\x08\x58\x08\xec\x08\xec\x09\x6a\x06\xea\x02\x02\x06\
-\xea\x08\x58\x0a\x6c\x03\x2c\x0b\x8a\x07\x82\x07\x82\x07\xaa\x07\
-\xaa\x0b\xcc\x04\xc0\x04\xc0\x04\xc0\x0b\xd2\x03\x2c\x07\x00\x05\
-\x8c\x08\x46\x05\x8c\x08\x46\x08\x58\x08\x58\x08\x58\x08\x58\x06\
-\x50\x0c\x28\x0c\x36\x0c\x60\x0c\x7e\x0c\x90\x0c\x9a\x0c\xa0\x0c\
-\xa6\x0c\x9a\x0c\xb0\x0c\xba\x0c\xc0\x0c\x9a\x0c\xc6\x0c\x9a\x0c\
-\xd8\x0c\xc6\x0c\xde\x0c\x36\x0c\xde\x0c\x36\x0c\xe4\x0c\xf6\x0d\
-\x08\x0d\x0e\x0d\x24\x0d\x2a\x0c\x36\x0d\x0e\x0d\x44\x0d\xba\x0e\
-\x04\x0e\x0a\x0d\x44\x0d\x44\x0e\x10\x0e\x36\x0e\x9c\x0f\x02\x0f\
-\x50\x0f\x50\x0f\x86\x0f\xb8\x0f\x02\x0e\x36\x0f\x86\x0f\x50\x0d\
-\x44\x0d\x44\x0f\x86\x0f\x86\x0f\xee\x10\x0c\x10\x2a\x10\x40\x10\
-\x40\x10\x0c\x10\x0c\x10\x0c\x10\x2a\x10\x62\x10\x0c\x10\x40\x10\
-\x98\x10\x98\x10\x0c\x10\x0c\x10\xd6\x10\xe0\x10\x98\x10\x98\x10\
-\xe6\x10\x62\x11\x14\x11\x3e\x11\x4c\x11\x82\x11\xa4\x11\xde\x11\
-\xa4\x11\xde\x12\x18\x12\x36\x11\x14\x11\x3e\x0f\x86\x11\x3e\x12\
-\x74\x12\x92\x12\xa4\x13\x06\x11\x14\x11\x3e\x11\x14\x11\x3e\x11\
-\x14\x11\x3e\x13\x3c\x13\x46\x13\x4c\x10\x2a\x0f\x02\x10\x2a\x0f\
-\x50\x10\x40\x0f\x50\x10\x40\x0f\x50\x10\x40\x13\xb6\x13\xd4\x0f\
-\x50\x10\x40\x0f\x02\x10\x2a\x11\x4c\x11\x82\x13\xe2\x13\xec\x13\
-\xf6\x14\x08\x14\x16\x10\x62\x14\x16\x10\x62\x0f\x50\x10\x40\x0d\
-\x44\x14\x54\x0e\x10\x10\xe6\x11\xa4\x14\x9a\x11\xa4\x14\x9a\x0f\
-\x86\x10\x0c\x11\x14\x11\x3e\x0e\x10\x10\xe6\x11\x14\x11\x3e\x0f\
-\x86\x10\x0c\x11\x14\x11\x3e\x11\x14\x11\x3e\x14\xac\x13\x06\x14\
-\xac\x13\x06\x14\xac\x13\x06\x13\xf6\x14\x08\x13\xb6\x13\xd4\x15\
-\x12\x15\x20\x15\x2e\x18\xa8\x18\xb2\x18\xbc\x0c\x90\x07\x88\x00\
-\x4a\x00\x26\xff\xc7\x00\x2a\xff\xc7\x00\x32\xff\xc7\x00\x34\xff\
-\xc7\x00\x37\xff\x56\x00\x38\xff\xc7\x00\x39\xff\x1d\x00\x3a\xff\
-\x1d\x00\x3c\xff\x56\x00\x46\xff\xc7\x00\x47\xff\xc7\x00\x48\xff\
-\xc7\x00\x52\xff\xc7\x00\x54\xff\xc7\x00\x57\xff\xc7\x00\x59\xff\
-\xc7\x00\x5a\xff\xc7\x00\x5c\xff\xc7\x00\x81\xff\xc7\x00\x8c\xff\
-\xc7\x00\x8d\xff\xc7\x00\x8e\xff\xc7\x00\x8f\xff\xc7\x00\x90\xff\
-\xc7\x00\x91\xff\xc7\x00\x92\xff\xc7\x00\x93\xff\xc7\x00\x94\xff\
-\xc7\x00\x95\xff\xc7\x00\x96\xff\x56\x00\xa0\xff\xc7\x00\xa1\xff\
-\xc7\x00\xa2\xff\xc7\x00\xa3\xff\xc7\x00\xa4\xff\xc7\x00\xa9\xff\
-\xc7\x00\xab\xff\xc7\x00\xac\xff\xc7\x00\xad\xff\xc7\x00\xae\xff\
-\xc7\x00\xaf\xff\xc7\x00\xb1\xff\xc7\x00\xb6\xff\xc7\x00\xb8\xff\
-\xc7\x00\xbf\xff\xc7\x00\xc0\xff\xc7\x00\xc1\xff\xc7\x00\xc2\xff\
-\xc7\x00\xc3\xff\xc7\x00\xc4\xff\xc7\x00\xc5\xff\xc7\x00\xc6\xff\
-\xc7\x00\xc8\xff\xc7\x00\xca\xff\xc7\x00\xcc\xff\xc7\x00\xce\xff\
-\xc7\x00\xd0\xff\xc7\x00\xd2\xff\xc7\x00\xd3\xff\xc7\x00\xd5\xff\
-\xc7\x00\xd7\xff\xc7\x00\xec\xff\xc7\x00\xed\xff\xc7\x00\xee\xff\
-\xc7\x00\xef\xff\xc7\x00\xfc\xff\x56\x00\xfd\xff\xc7\x00\xfe\xff\
-\x56\x00\xff\xff\xc7\x01\x00\xff\xc7\x01\x02\xff\xc7\x01\x04\xff\
-\xc7\x01\x06\xff\xc7\x01\x08\xff\x56\x00\x11\x00\x24\xff\xc7\x00\
-\x39\xff\xc7\x00\x3a\xff\xc7\x00\x3b\xff\xc7\x00\x3c\xff\xc7\x00\
-\x7a\xff\xc7\x00\x7b\xff\xc7\x00\x7c\xff\xc7\x00\x7d\xff\xc7\x00\
-\x7e\xff\xc7\x00\x7f\xff\xc7\x00\x80\xff\xc7\x00\x96\xff\xc7\x00\
-\xb9\xff\xc7\x00\xbb\xff\xc7\x00\xbd\xff\xc7\x01\x08\xff\xc7\x00\
-\x3b\x00\x24\xff\x56\x00\x26\xff\xc7\x00\x2a\xff\xc7\x00\x32\xff\
-\xc7\x00\x34\xff\xc7\x00\x44\xff\xc7\x00\x46\xff\xc7\x00\x47\xff\
-\xc7\x00\x48\xff\xc7\x00\x4a\xff\xc7\x00\x50\xff\xc7\x00\x51\xff\
-\xc7\x00\x52\xff\xc7\x00\x53\xff\xc7\x00\x55\xff\xc7\x00\x56\xff\
-\xc7\x00\x58\xff\xc7\x00\x59\xff\xc7\x00\x5a\xff\xc7\x00\x5c\xff\
-\xc7\x00\x5d\xff\xc7\x00\x7a\xff\x56\x00\x7b\xff\x56\x00\x7c\xff\
-\x56\x00\x7d\xff\x56\x00\x7e\xff\x56\x00\x7f\xff\x56\x00\x80\xff\
-\x56\x00\x81\xff\xc7\x00\x8c\xff\xc7\x00\x8d\xff\xc7\x00\x8e\xff\
-\xc7\x00\x8f\xff\xc7\x00\x90\xff\xc7\x00\x91\xff\xc7\x00\x9f\xff\
-\xc7\x00\xb1\xff\xc7\x00\xb9\xff\x56\x00\xba\xff\xc7\x00\xbb\xff\
-\x56\x00\xbd\xff\x56\x00\xbf\xff\xc7\x00\xc1\xff\xc7\x00\xc2\xff\
-\xc7\x00\xc3\xff\xc7\x00\xc4\xff\xc7\x00\xc5\xff\xc7\x00\xcc\xff\
-\xc7\x00\xce\xff\xc7\x00\xd3\xff\xc7\x00\xd4\xff\xc7\x00\xd5\xff\
-\xc7\x00\xd7\xff\xc7\x00\xd8\xff\xc7\x00\xec\xff\xc7\x00\xee\xff\
-\xc7\x00\xf7\xff\xc7\x01\x01\xff\xc7\x01\x03\xff\xc7\x00\x02\x00\
-\x2c\x00\x39\x00\xdc\x00\x39\x00\x15\x00\x26\xff\xc7\x00\x2a\xff\
-\xc7\x00\x34\xff\xc7\x00\x52\xff\xc7\x00\x59\xff\xc7\x00\x81\xff\
-\xc7\x00\xab\xff\xc7\x00\xac\xff\xc7\x00\xad\xff\xc7\x00\xae\xff\
-\xc7\x00\xaf\xff\xc7\x00\xb1\xff\xc7\x00\xbf\xff\xc7\x00\xc1\xff\
-\xc7\x00\xc3\xff\xc7\x00\xc5\xff\xc7\x00\xd3\xff\xc7\x00\xd5\xff\
-\xc7\x00\xd7\xff\xc7\x00\xed\xff\xc7\x00\xef\xff\xc7\x00\x08\x00\
-\x37\xff\x56\x00\x39\xff\x1d\x00\x3a\xff\x1d\x00\x3c\xff\x56\x00\
-\x96\xff\x56\x00\xfc\xff\x56\x00\xfe\xff\x56\x01\x08\xff\x56\x00\
-\x2a\x00\x0f\xff\x56\x00\x11\xff\x56\x00\x24\xff\x56\x00\x44\xff\
-\xc7\x00\x48\xff\xc7\x00\x52\xff\xc7\x00\x7a\xff\x56\x00\x7b\xff\
-\x56\x00\x7c\xff\x56\x00\x7d\xff\x56\x00\x7e\xff\x56\x00\x7f\xff\
-\x56\x00\x80\xff\x56\x00\x99\xff\xc7\x00\x9a\xff\xc7\x00\x9b\xff\
-\xc7\x00\x9c\xff\xc7\x00\x9d\xff\xc7\x00\x9e\xff\xc7\x00\x9f\xff\
-\xc7\x00\xa1\xff\xc7\x00\xa2\xff\xc7\x00\xa3\xff\xc7\x00\xa4\xff\
-\xc7\x00\xab\xff\xc7\x00\xac\xff\xc7\x00\xad\xff\xc7\x00\xae\xff\
-\xc7\x00\xaf\xff\xc7\x00\xb1\xff\xc7\x00\xb9\xff\x56\x00\xba\xff\
-\xc7\x00\xbb\xff\x56\x00\xbc\xff\xc7\x00\xbd\xff\x56\x00\xbe\xff\
-\xc7\x00\xcc\xff\xc7\x00\xce\xff\xc7\x00\xd0\xff\xc7\x00\xd2\xff\
-\xc7\x00\xed\xff\xc7\x00\xef\xff\xc7\x00\x1c\x00\x24\xff\x56\x00\
-\x44\xff\x56\x00\x46\xff\x56\x00\x47\xff\x56\x00\x48\xff\x56\x00\
-\x4a\xff\x56\x00\x51\xff\x56\x00\x52\xff\x56\x00\x53\xff\x56\x00\
-\x55\xff\x56\x00\x56\xff\x56\x00\x58\xff\x56\x00\x59\xff\x56\x00\
-\x5a\xff\x56\x00\x5b\xff\x56\x00\x5c\xff\x56\x00\x5d\xff\x56\x00\
-\x7a\xff\x56\x00\x7b\xff\x56\x00\x7c\xff\x56\x00\x7d\xff\x56\x00\
-\x7e\xff\x56\x00\x7f\xff\x56\x00\x80\xff\x56\x00\xb9\xff\x56\x00\
-\xbb\xff\x56\x00\xbd\xff\x56\x00\xdf\xff\x56\x00\x14\x00\x26\xff\
-\xc7\x00\x2a\xff\xc7\x00\x32\xff\xc7\x00\x34\xff\xc7\x00\x81\xff\
-\xc7\x00\x8c\xff\xc7\x00\x8d\xff\xc7\x00\x8e\xff\xc7\x00\x8f\xff\
-\xc7\x00\x90\xff\xc7\x00\x91\xff\xc7\x00\xbf\xff\xc7\x00\xc1\xff\
-\xc7\x00\xc3\xff\xc7\x00\xc5\xff\xc7\x00\xd3\xff\xc7\x00\xd5\xff\
-\xc7\x00\xd7\xff\xc7\x00\xec\xff\xc7\x00\xee\xff\xc7\x00\x26\x00\
-\x24\xff\x56\x00\x44\xff\x56\x00\x46\xff\x56\x00\x47\xff\x56\x00\
-\x48\xff\x56\x00\x4a\xff\x56\x00\x51\xff\x56\x00\x52\xff\x56\x00\
-\x53\xff\x56\x00\x55\xff\x56\x00\x56\xff\x56\x00\x58\xff\x56\x00\
-\x59\xff\x56\x00\x5a\xff\x56\x00\x5b\xff\x56\x00\x5d\xff\x56\x00\
-\x7a\xff\x56\x00\x7b\xff\x56\x00\x7c\xff\x56\x00\x7d\xff\x56\x00\
-\x7e\xff\x56\x00\x7f\xff\x56\x00\x80\xff\x56\x00\xb9\xff\x56\x00\
-\xba\xff\x56\x00\xbb\xff\x56\x00\xbd\xff\x56\x00\xc2\xff\x56\x00\
-\xc4\xff\x56\x00\xcc\xff\x56\x00\xce\xff\x56\x00\xd4\xff\x56\x00\
-\xd8\xff\x56\x00\xdd\xff\x56\x00\xdf\xff\x56\x00\xf7\xff\x56\x01\
-\x01\xff\x56\x01\x03\xff\x56\x00\x05\x00\x55\xff\xc7\x00\x5a\xff\
-\xc7\x00\x5c\xff\xc7\x00\xb6\xff\xc7\x00\xb8\xff\xc7\x00\x20\x00\
-\x46\x00\x39\x00\x47\x00\x39\x00\x48\x00\x39\x00\x52\x00\x39\x00\
-\x54\x00\x39\x00\x55\xff\xc7\x00\x5a\xff\xc7\x00\x5b\xff\xc7\x00\
-\x5c\xff\xc7\x00\xa0\x00\x39\x00\xa1\x00\x39\x00\xa2\x00\x39\x00\
-\xa3\x00\x39\x00\xa4\x00\x39\x00\xab\x00\x39\x00\xac\x00\x39\x00\
-\xad\x00\x39\x00\xae\x00\x39\x00\xaf\x00\x39\x00\xb1\x00\x39\x00\
-\xb6\xff\xc7\x00\xb8\xff\xc7\x00\xc0\x00\x39\x00\xc2\x00\x39\x00\
-\xc4\x00\x39\x00\xc6\x00\x39\x00\xcc\x00\x39\x00\xce\x00\x39\x00\
-\xd0\x00\x39\x00\xd2\x00\x39\x00\xed\x00\x39\x00\xef\x00\x39\x00\
-\x01\x00\x39\xff\x56\x00\x08\x00\x04\x00\x8d\x00\x0c\x00\x8d\x00\
-\x22\x00\x8d\x00\x40\x00\x8d\x02\x80\x00\x8d\x02\x81\x00\x8d\x02\
-\x84\x00\x8d\x02\x85\x00\x8d\x00\x01\x00\x4d\x00\x39\x00\x25\x00\
-\x39\xff\x56\x00\x3a\xff\x56\x00\x44\xff\xc7\x00\x46\xff\xc7\x00\
-\x48\xff\xc7\x00\x52\xff\xc7\x00\x99\xff\xc7\x00\x9a\xff\xc7\x00\
-\x9b\xff\xc7\x00\x9c\xff\xc7\x00\x9d\xff\xc7\x00\x9e\xff\xc7\x00\
-\x9f\xff\xc7\x00\xa0\xff\xc7\x00\xa1\xff\xc7\x00\xa2\xff\xc7\x00\
-\xa3\xff\xc7\x00\xa4\xff\xc7\x00\xab\xff\xc7\x00\xac\xff\xc7\x00\
-\xad\xff\xc7\x00\xae\xff\xc7\x00\xaf\xff\xc7\x00\xb1\xff\xc7\x00\
-\xba\xff\xc7\x00\xbc\xff\xc7\x00\xbe\xff\xc7\x00\xc0\xff\xc7\x00\
-\xc2\xff\xc7\x00\xc4\xff\xc7\x00\xc6\xff\xc7\x00\xcc\xff\xc7\x00\
-\xce\xff\xc7\x00\xd0\xff\xc7\x00\xd2\xff\xc7\x00\xed\xff\xc7\x00\
-\xef\xff\xc7\x00\x04\x00\x5a\xff\xc7\x00\x5c\xff\xc7\x00\xb6\xff\
-\xc7\x00\xb8\xff\xc7\x00\x01\x00\x5a\xff\xc7\x00\x23\x00\x44\xff\
-\xc7\x00\x46\xff\xc7\x00\x48\xff\xc7\x00\x52\xff\xc7\x00\x99\xff\
-\xc7\x00\x9a\xff\xc7\x00\x9b\xff\xc7\x00\x9c\xff\xc7\x00\x9d\xff\
-\xc7\x00\x9e\xff\xc7\x00\x9f\xff\xc7\x00\xa0\xff\xc7\x00\xa1\xff\
-\xc7\x00\xa2\xff\xc7\x00\xa3\xff\xc7\x00\xa4\xff\xc7\x00\xab\xff\
-\xc7\x00\xac\xff\xc7\x00\xad\xff\xc7\x00\xae\xff\xc7\x00\xaf\xff\
-\xc7\x00\xb1\xff\xc7\x00\xba\xff\xc7\x00\xbc\xff\xc7\x00\xbe\xff\
-\xc7\x00\xc0\xff\xc7\x00\xc2\xff\xc7\x00\xc4\xff\xc7\x00\xc6\xff\
-\xc7\x00\xcc\xff\xc7\x00\xce\xff\xc7\x00\xd0\xff\xc7\x00\xd2\xff\
-\xc7\x00\xed\xff\xc7\x00\xef\xff\xc7\x00\x1f\x00\x0f\xff\x56\x00\
-\x11\xff\x56\x00\x44\xff\xc7\x00\x48\xff\xc7\x00\x52\xff\xc7\x00\
-\x99\xff\xc7\x00\x9a\xff\xc7\x00\x9b\xff\xc7\x00\x9c\xff\xc7\x00\
-\x9d\xff\xc7\x00\x9e\xff\xc7\x00\x9f\xff\xc7\x00\xa1\xff\xc7\x00\
-\xa2\xff\xc7\x00\xa3\xff\xc7\x00\xa4\xff\xc7\x00\xab\xff\xc7\x00\
-\xac\xff\xc7\x00\xad\xff\xc7\x00\xae\xff\xc7\x00\xaf\xff\xc7\x00\
-\xb1\xff\xc7\x00\xba\xff\xc7\x00\xbc\xff\xc7\x00\xbe\xff\xc7\x00\
-\xcc\xff\xc7\x00\xce\xff\xc7\x00\xd0\xff\xc7\x00\xd2\xff\xc7\x00\
-\xed\xff\xc7\x00\xef\xff\xc7\x00\x40\x00\x26\xff\xc7\x00\x2a\xff\
-\xc7\x00\x32\xff\xc7\x00\x34\xff\xc7\x00\x37\xff\x56\x00\x38\xff\
-\xc7\x00\x39\xff\x1d\x00\x3a\xff\x1d\x00\x3c\xff\x56\x00\x46\xff\
-\xc7\x00\x47\xff\xc7\x00\x48\xff\xc7\x00\x52\xff\xc7\x00\x54\xff\
-\xc7\x00\x57\xff\xc7\x00\x59\xff\xc7\x00\x5a\xff\xc7\x00\x5c\xff\
-\xc7\x00\x81\xff\xc7\x00\x8c\xff\xc7\x00\x8d\xff\xc7\x00\x8e\xff\
-\xc7\x00\x8f\xff\xc7\x00\x90\xff\xc7\x00\x91\xff\xc7\x00\x92\xff\
-\xc7\x00\x93\xff\xc7\x00\x94\xff\xc7\x00\x95\xff\xc7\x00\x96\xff\
-\x56\x00\xa0\xff\xc7\x00\xa1\xff\xc7\x00\xa2\xff\xc7\x00\xa3\xff\
-\xc7\x00\xa4\xff\xc7\x00\xa9\xff\xc7\x00\xab\xff\xc7\x00\xac\xff\
-\xc7\x00\xad\xff\xc7\x00\xae\xff\xc7\x00\xaf\xff\xc7\x00\xb1\xff\
-\xc7\x00\xb6\xff\xc7\x00\xb8\xff\xc7\x00\xbf\xff\xc7\x00\xc0\xff\
-\xc7\x00\xc5\xff\xc7\x00\xc6\xff\xc7\x00\xc8\xff\xc7\x00\xca\xff\
-\xc7\x00\xd0\xff\xc7\x00\xd2\xff\xc7\x00\xd5\xff\xc7\x00\xec\xff\
-\xc7\x00\xed\xff\xc7\x00\xee\xff\xc7\x00\xef\xff\xc7\x00\xfc\xff\
-\x56\x00\xfd\xff\xc7\x00\xfe\xff\x56\x00\xff\xff\xc7\x01\x04\xff\
-\xc7\x01\x06\xff\xc7\x01\x08\xff\x56\x00\x47\x00\x26\xff\xc7\x00\
-\x2a\xff\xc7\x00\x32\xff\xc7\x00\x34\xff\xc7\x00\x37\xff\x56\x00\
-\x38\xff\xc7\x00\x39\xff\x1d\x00\x3a\xff\x1d\x00\x3c\xff\x56\x00\
-\x46\xff\xc7\x00\x47\xff\xc7\x00\x48\xff\xc7\x00\x52\xff\xc7\x00\
-\x54\xff\xc7\x00\x57\xff\xc7\x00\x59\xff\xc7\x00\x5a\xff\xc7\x00\
-\x81\xff\xc7\x00\x8c\xff\xc7\x00\x8d\xff\xc7\x00\x8e\xff\xc7\x00\
-\x8f\xff\xc7\x00\x90\xff\xc7\x00\x91\xff\xc7\x00\x92\xff\xc7\x00\
-\x93\xff\xc7\x00\x94\xff\xc7\x00\x95\xff\xc7\x00\x96\xff\x56\x00\
-\xa0\xff\xc7\x00\xa1\xff\xc7\x00\xa2\xff\xc7\x00\xa3\xff\xc7\x00\
-\xa4\xff\xc7\x00\xa9\xff\xc7\x00\xab\xff\xc7\x00\xac\xff\xc7\x00\
-\xad\xff\xc7\x00\xae\xff\xc7\x00\xaf\xff\xc7\x00\xb1\xff\xc7\x00\
-\xbf\xff\xc7\x00\xc0\xff\xc7\x00\xc1\xff\xc7\x00\xc2\xff\xc7\x00\
-\xc3\xff\xc7\x00\xc4\xff\xc7\x00\xc5\xff\xc7\x00\xc6\xff\xc7\x00\
-\xc8\xff\xc7\x00\xca\xff\xc7\x00\xcc\xff\xc7\x00\xce\xff\xc7\x00\
-\xd0\xff\xc7\x00\xd2\xff\xc7\x00\xd3\xff\xc7\x00\xd5\xff\xc7\x00\
-\xd7\xff\xc7\x00\xec\xff\xc7\x00\xed\xff\xc7\x00\xee\xff\xc7\x00\
-\xef\xff\xc7\x00\xfc\xff\x56\x00\xfd\xff\xc7\x00\xfe\xff\x56\x00\
-\xff\xff\xc7\x01\x00\xff\xc7\x01\x02\xff\xc7\x01\x04\xff\xc7\x01\
-\x06\xff\xc7\x01\x08\xff\x56\x00\x10\x00\x24\xff\xc7\x00\x39\xff\
-\xc7\x00\x3a\xff\xc7\x00\x3b\xff\xc7\x00\x3c\xff\xc7\x00\x7a\xff\
-\xc7\x00\x7b\xff\xc7\x00\x7c\xff\xc7\x00\x7d\xff\xc7\x00\x7e\xff\
-\xc7\x00\x7f\xff\xc7\x00\x80\xff\xc7\x00\x96\xff\xc7\x00\xbb\xff\
-\xc7\x00\xbd\xff\xc7\x01\x08\xff\xc7\x00\x01\x00\x2c\x00\x39\x00\
-\x15\x00\x44\xff\xc7\x00\x46\xff\xc7\x00\x47\xff\xc7\x00\x48\xff\
-\xc7\x00\x4a\xff\xc7\x00\x52\xff\xc7\x00\x56\xff\xc7\x00\xac\xff\
-\xc7\x00\xba\xff\xc7\x00\xbe\xff\xc7\x00\xc0\xff\xc7\x00\xc2\xff\
-\xc7\x00\xc4\xff\xc7\x00\xcc\xff\xc7\x00\xce\xff\xc7\x00\xd0\xff\
-\xc7\x00\xd4\xff\xc7\x00\xd8\xff\xc7\x00\xf5\xff\xc7\x00\xf7\xff\
-\xc7\x02\x81\x00\x39\x00\x03\x01\x2b\xff\x1d\x01\x39\xff\x8d\x01\
-\x42\xff\xc7\x00\x0a\x01\x4c\xff\x1d\x01\x50\xff\xdd\x01\x51\xff\
-\xdd\x01\x56\xff\x56\x01\x58\xff\xc7\x01\x5b\xff\xc7\x01\x5c\xff\
-\xc7\x01\x5d\xff\xc7\x01\x60\xff\xc7\x01\x68\xff\xdd\x00\x07\x01\
-\x32\xff\x56\x01\x39\xff\x56\x01\x3d\xff\x56\x01\x3e\xfe\xe3\x01\
-\x3f\xff\x56\x01\x41\xff\x06\x01\x44\xfe\xe3\x00\x04\x01\x2b\xfe\
-\xf0\x01\x2e\xff\x1d\x01\x35\xff\x06\x02\xa4\xff\x1d\x00\x02\x01\
-\x39\xff\xbc\x01\x3e\xfe\xe3\x00\x01\x01\x2b\xff\x56\x00\x01\x01\
-\x39\xff\x56\x00\x02\x01\x39\xff\xbc\x01\x3e\xff\x33\x00\x02\x01\
-\x2b\xff\x56\x01\x3c\xff\x8d\x00\x01\x01\x2b\xfe\xaa\x00\x01\x01\
-\x2b\xff\xc7\x00\x04\x01\x2b\xfe\xe3\x01\x2e\xfe\xe3\x01\x35\xfe\
-\xe3\x02\xa4\xfe\xe3\x00\x01\x01\x2b\xff\x06\x00\x01\x01\x56\xff\
-\xa6\x00\x04\x01\x45\xff\xa6\x01\x4a\xff\xa6\x01\x58\xff\xa6\x01\
-\x65\xff\xa6\x00\x04\x01\x47\xff\x56\x01\x50\xff\x56\x01\x5e\xff\
-\x83\x01\x66\xff\x83\x00\x01\x01\x5d\x00\x50\x00\x05\x01\x4c\xff\
-\xc7\x01\x54\xff\xc7\x01\x56\xff\xd3\x01\x5d\xff\xd3\x01\x60\xff\
-\xc7\x00\x01\x01\x5d\x00\x7d\x00\x06\x01\x45\xff\xc7\x01\x4a\xff\
-\xc7\x01\x58\xff\xc7\x01\x62\xff\xc7\x01\x65\xff\xc7\x01\x67\xff\
-\xc7\x00\x1d\x01\x74\xff\x56\x01\x76\xff\xc7\x01\x7d\xff\x56\x01\
-\x80\xff\xc7\x01\x88\xff\xc7\x01\x90\xff\xc7\x01\x93\xff\xc7\x01\
-\x94\xff\x56\x01\x95\xff\xc7\x01\x96\xff\xc7\x01\x97\xff\xc7\x01\
-\x99\xff\x56\x01\x9c\xff\x56\x01\xb4\xff\xc7\x01\xb9\xff\x56\x01\
-\xbc\xff\xc7\x01\xe4\xff\xc7\x02\x05\xff\xc7\x02\x0f\xff\x56\x02\
-\x10\xff\xc7\x02\x19\xff\xc7\x02\x1d\xff\x56\x02\x1f\xff\x56\x02\
-\x21\xff\xc7\x02\x25\xff\x56\x02\x26\xff\x56\x02\x27\xff\x56\x02\
-\x28\xff\x56\x02\x56\xff\xc7\x00\x12\x01\xd3\xff\x56\x01\xd8\xff\
-\x56\x01\xd9\xff\x56\x01\xe3\xff\x56\x01\xe5\xff\x56\x01\xeb\xff\
-\x56\x01\xed\xff\x56\x01\xef\xff\x56\x01\xf1\xff\x56\x02\x34\xff\
-\x8d\x02\x35\xff\x56\x02\x3e\xff\x56\x02\x3f\xff\x56\x02\x40\xff\
-\x56\x02\x41\xff\x56\x02\x45\xff\x56\x02\x55\xff\x56\x02\x59\xff\
-\x56\x00\x01\x01\x78\x00\x39\x00\x01\x01\x79\x00\x39\x00\x09\x01\
-\xd2\xff\xc7\x01\xe2\xff\xc7\x01\xea\xff\xc7\x01\xec\xff\xc7\x01\
-\xee\xff\xc7\x01\xf0\xff\xc7\x02\x54\xff\xc7\x02\x58\xff\xc7\x02\
-\x63\xff\xc7\x00\x19\x01\x76\xff\xc7\x01\x7b\xff\x8d\x01\x82\xff\
-\xc7\x01\x86\xff\x8d\x01\x8d\xff\x8d\x01\x90\xff\xc7\x01\x93\xff\
-\xc7\x01\x96\xff\xc7\x01\xa2\xff\xc7\x01\xa6\xff\x56\x01\xa7\xff\
-\xc7\x01\xad\xff\x56\x01\xb0\xff\xc7\x01\xb3\xff\xc7\x01\xc1\xff\
-\x56\x01\xc3\xff\xc7\x01\xc6\xff\xc7\x01\xcb\xff\x56\x01\xe4\xff\
-\xc7\x02\x19\xff\xc7\x02\x1a\xff\xc7\x02\x42\xff\xc7\x02\x43\xff\
-\x56\x02\x56\xff\xc7\x02\x57\xff\xc7\x00\x19\x01\x74\xff\x56\x01\
-\x76\xff\xc7\x01\x7d\xff\x56\x01\x80\xff\xc7\x01\x90\xff\xc7\x01\
-\x93\xff\xc7\x01\x94\xff\x56\x01\x95\xff\xc7\x01\x96\xff\xc7\x01\
-\x99\xff\x56\x01\x9c\xff\x56\x01\xb4\xff\xc7\x01\xb9\xff\x56\x01\
-\xbc\xff\xc7\x01\xe4\xff\xc7\x02\x0f\xff\x56\x02\x10\xff\xc7\x02\
-\x19\xff\xc7\x02\x1d\xff\x56\x02\x1f\xff\x56\x02\x25\xff\x56\x02\
-\x26\xff\x56\x02\x27\xff\x56\x02\x28\xff\x56\x02\x56\xff\xc7\x00\
-\x13\x01\x7b\xff\x8d\x01\x82\xff\x56\x01\x86\xff\x56\x01\x8d\xff\
-\x8d\x01\xa2\xff\x56\x01\xa6\xff\x56\x01\xa7\xff\x56\x01\xad\xff\
-\x56\x01\xb0\xff\x56\x01\xb3\xff\x56\x01\xb6\xff\x56\x01\xc1\xff\
-\x56\x01\xc3\xff\x56\x01\xc6\xff\x56\x01\xcb\xff\x56\x02\x1a\xff\
-\x56\x02\x42\xff\x56\x02\x43\xff\x56\x02\x57\xff\x56\x00\x0d\x01\
-\x76\xff\xc7\x01\x90\xff\xc7\x01\x93\xff\xc7\x01\x96\xff\xc7\x01\
-\xb4\xff\xc7\x01\xb9\xff\xc7\x01\xbc\xff\xc7\x01\xe4\xff\xc7\x02\
-\x10\xff\xc7\x02\x19\xff\xc7\x02\x26\xff\xc7\x02\x28\xff\xc7\x02\
-\x56\xff\xc7\x00\x0c\x01\x80\xff\xc7\x01\x82\xff\xc7\x01\x86\xff\
-\xc7\x01\x88\xff\xc7\x01\x95\xff\xc7\x01\x97\xff\xc7\x02\x05\xff\
-\xc7\x02\x1d\xff\xc7\x02\x1f\xff\xc7\x02\x21\xff\xc7\x02\x42\xff\
-\xc7\x02\x43\xff\xc7\x00\x0d\x01\x7b\xff\x56\x01\x82\xff\x56\x01\
-\x86\xff\x56\x01\x8d\xff\x56\x01\xa2\xff\xc7\x01\xa6\xff\x56\x01\
-\xa7\xff\xc7\x01\xad\xff\x56\x01\xb0\xff\xc7\x01\xc3\xff\xc7\x01\
-\xcb\xff\x56\x02\x42\xff\x56\x02\x57\xff\xc7\x00\x07\x01\xb5\xff\
-\xc7\x01\xb9\xff\xc7\x01\xd0\xff\xc7\x02\x1e\xff\xc7\x02\x20\xff\
-\xc7\x02\x26\xff\xc7\x02\x28\xff\xc7\x00\x07\x01\xa6\xff\xc7\x01\
-\xa8\xff\xc7\x01\xb7\xff\xc7\x01\xc1\xff\xc7\x02\x06\xff\xc7\x02\
-\x22\xff\xc7\x02\x43\xff\xc7\x00\x05\x01\xa6\xff\xc7\x01\xad\xff\
-\xc7\x01\xc1\xff\xc7\x01\xcb\xff\xc7\x02\x43\xff\xc7\x00\x08\x01\
-\xa2\xff\xc7\x01\xa7\xff\xc7\x01\xb0\xff\xc7\x01\xb3\xff\xc7\x01\
-\xc3\xff\xc7\x01\xc6\xff\xc7\x02\x1a\xff\xc7\x02\x57\xff\xc7\x00\
-\x0d\x01\xa2\xff\xc7\x01\xa6\xff\x8d\x01\xa7\xff\xc7\x01\xad\xff\
-\x8d\x01\xb0\xff\xc7\x01\xb3\xff\xc7\x01\xc1\xff\xc7\x01\xc3\xff\
-\xc7\x01\xc6\xff\xc7\x01\xcb\xff\x8d\x02\x1a\xff\xc7\x02\x43\xff\
-\x56\x02\x57\xff\xc7\x00\x0f\x01\xb0\xff\xc7\x01\xb4\xff\xc7\x01\
-\xb5\xff\x8d\x01\xb6\xff\xc7\x01\xb9\xff\x56\x01\xbc\xff\xc7\x01\
-\xc6\xff\xc7\x01\xd0\xff\x8d\x02\x10\xff\xc7\x02\x1a\xff\xc7\x02\
-\x1e\xff\x8d\x02\x20\xff\x8d\x02\x26\xff\x56\x02\x28\xff\x56\x02\
-\x57\xff\xc7\x00\x02\x01\xd9\xff\xc7\x02\x35\xff\xc7\x00\x01\x01\
-\xc9\x00\xaa\x00\x0b\x01\xd3\xff\xc7\x01\xe5\xff\xc7\x01\xeb\xff\
-\xc7\x01\xed\xff\xc7\x01\xef\xff\xc7\x01\xf1\xff\xc7\x02\x3f\xff\
-\xc7\x02\x41\xff\xc7\x02\x45\xff\xc7\x02\x55\xff\xc7\x02\x59\xff\
-\xc7\x00\x0a\x01\xd8\xff\xc7\x01\xd9\xff\xc7\x01\xe8\xff\xc7\x02\
-\x30\xff\xc7\x02\x3e\xff\xc7\x02\x40\xff\xc7\x02\x4a\xff\xc7\x02\
-\x5c\xff\xc7\x02\x5e\xff\xc7\x02\x60\xff\xc7\x00\x03\x01\xd9\xff\
-\xc7\x02\x31\xff\xc7\x02\x4b\xff\xc7\x00\x0d\x01\xd4\xff\x56\x01\
-\xd5\xff\xc7\x01\xe6\xff\x56\x02\x17\xff\xc7\x02\x1b\xff\x56\x02\
-\x1c\xff\xc7\x02\x23\xff\x56\x02\x24\xff\xc7\x02\x2b\xff\x56\x02\
-\x2d\xff\x56\x02\x3a\xff\x56\x02\x3b\xff\x56\x02\x68\xff\xc7\x00\
-\x08\x01\xd5\xff\xc7\x01\xe7\xff\x8d\x02\x18\xff\xc7\x02\x1c\xff\
-\xc7\x02\x24\xff\xc7\x02\x2c\xff\x56\x02\x2e\xff\x56\x02\x3b\xff\
-\x56\x00\x0e\x01\xd2\xff\xc7\x01\xe2\xff\xc7\x01\xe8\xff\x56\x01\
-\xea\xff\xc7\x01\xec\xff\xc7\x01\xee\xff\xc7\x01\xf0\xff\xc7\x02\
-\x54\xff\xc7\x02\x58\xff\xc7\x02\x5c\xff\xc7\x02\x5e\xff\xc7\x02\
-\x60\xff\xc7\x02\x62\xff\x56\x02\x63\xff\x56\x00\x0e\x01\xd3\xff\
-\xc7\x01\xe3\xff\xc7\x01\xe5\xff\xc7\x01\xe9\xff\x8d\x01\xeb\xff\
-\xc7\x01\xed\xff\xc7\x01\xef\xff\xc7\x01\xf1\xff\xc7\x02\x55\xff\
-\xc7\x02\x59\xff\xc7\x02\x5d\xff\x8d\x02\x5f\xff\x8d\x02\x61\xff\
-\x8d\x02\x63\xff\x56\x00\x07\x01\xd5\xff\xc7\x01\xe7\xff\xc7\x02\
-\x18\xff\xc7\x02\x1c\xff\xc7\x02\x24\xff\xc7\x02\x2c\xff\xc7\x02\
-\x2e\xff\xc7\x00\x0f\x01\xd3\xff\xc7\x01\xe5\xff\xc7\x01\xe9\xff\
-\xc7\x01\xeb\xff\xc7\x01\xed\xff\xc7\x01\xef\xff\xc7\x01\xf1\xff\
-\xc7\x02\x3f\xff\xc7\x02\x41\xff\xc7\x02\x45\xff\xc7\x02\x55\xff\
-\xc7\x02\x59\xff\xc7\x02\x5d\xff\xc7\x02\x5f\xff\xc7\x02\x61\xff\
-\xc7\x00\x07\x01\xdd\xff\x56\x02\x17\xff\xc7\x02\x18\xff\xc7\x02\
-\x2b\xff\xc7\x02\x2c\xff\xc7\x02\x2d\xff\xc7\x02\x2e\xff\xc7\x00\
-\x04\x01\xdd\xff\xc7\x02\x18\xff\xc7\x02\x2c\xff\xc7\x02\x2e\xff\
-\xc7\x00\x18\x01\xd2\xff\xc7\x01\xd3\xff\xc7\x01\xd8\xff\x56\x01\
-\xd9\xff\x56\x01\xe2\xff\xc7\x01\xe5\xff\xc7\x01\xea\xff\xc7\x01\
-\xeb\xff\xc7\x01\xec\xff\xc7\x01\xed\xff\xc7\x01\xee\xff\xc7\x01\
-\xef\xff\xc7\x01\xf0\xff\xc7\x02\x34\xff\x8d\x02\x35\xff\x56\x02\
-\x3e\xff\x56\x02\x3f\xff\xc7\x02\x40\xff\x56\x02\x41\xff\xc7\x02\
-\x45\xff\xc7\x02\x54\xff\xc7\x02\x55\xff\xc7\x02\x58\xff\xc7\x02\
-\x59\xff\xc7\x00\x0d\x01\xd3\xff\xc7\x01\xd9\xff\x56\x01\xe5\xff\
-\xc7\x01\xeb\xff\xc7\x01\xed\xff\xc7\x01\xef\xff\xc7\x01\xf1\xff\
-\xc7\x02\x35\xff\x8d\x02\x3f\xff\xc7\x02\x41\xff\xc7\x02\x45\xff\
-\xc7\x02\x55\xff\xc7\x02\x59\xff\xc7\x00\x02\x01\xfb\xff\x56\x01\
-\xfc\xff\xc7\x00\x01\x01\xfc\xff\xc7\x00\x1a\x01\x76\xff\xc7\x01\
-\x7b\xff\x8d\x01\x82\xff\x56\x01\x86\xff\x56\x01\x8d\xff\x8d\x01\
-\x90\xff\xc7\x01\x93\xff\xc7\x01\x96\xff\xc7\x01\xa2\xff\x56\x01\
-\xa6\xff\x56\x01\xa7\xff\x56\x01\xad\xff\x56\x01\xb0\xff\x56\x01\
-\xb3\xff\x56\x01\xb6\xff\x56\x01\xc1\xff\x56\x01\xc3\xff\x56\x01\
-\xc6\xff\x56\x01\xcb\xff\x56\x01\xe4\xff\xc7\x02\x19\xff\xc7\x02\
-\x1a\xff\x56\x02\x42\xff\x56\x02\x43\xff\x56\x02\x56\xff\xc7\x02\
-\x57\xff\x56\x00\x07\x01\xd5\xff\xc7\x02\x17\xff\xc7\x02\x1c\xff\
-\xc7\x02\x24\xff\xc7\x02\x2b\xff\xc7\x02\x2d\xff\xc7\x02\x3b\xff\
-\xc7\x00\x03\x02\x18\xff\xc7\x02\x2c\xff\xc7\x02\x2e\xff\xc7\x00\
-\x02\x01\xe6\xff\xc7\x02\x68\xff\xc7\x00\x02\x01\xdd\xff\xc7\x02\
-\x69\xff\xc7\x00\x04\x01\xdd\xff\x56\x02\x18\xff\x56\x02\x2c\xff\
-\x56\x02\x2e\xff\x56\x00\x03\x01\xdd\xff\xc7\x02\x2c\xff\xc7\x02\
-\x2e\xff\xc7\x00\x0f\x01\x7b\xff\x8d\x01\x82\xff\x56\x01\x86\xff\
-\x56\x01\x8d\xff\x8d\x01\xa2\xff\x56\x01\xa6\xff\x56\x01\xa7\xff\
-\x56\x01\xad\xff\x56\x01\xb0\xff\x56\x01\xc1\xff\x56\x01\xc3\xff\
-\x56\x01\xcb\xff\x56\x02\x42\xff\x56\x02\x43\xff\x56\x02\x57\xff\
-\x56\x00\x11\x01\x76\xff\xc7\x01\x80\xff\x56\x01\x86\x00\xaa\x01\
-\x90\xff\xc7\x01\x93\xff\xc7\x01\x95\xff\x56\x01\x96\xff\xc7\x01\
-\xa6\x00\xaa\x01\xb5\x00\x73\x01\xd0\x00\x73\x01\xe4\xff\xc7\x02\
-\x19\xff\xc7\x02\x1d\xff\x56\x02\x1e\xff\x56\x02\x1f\xff\x56\x02\
-\x20\xff\x56\x02\x56\xff\xc7\x00\x04\x02\x5d\xff\xc7\x02\x5f\xff\
-\xc7\x02\x61\xff\xc7\x02\x63\xff\xc7\x00\x19\x01\xd2\xff\xc7\x01\
-\xd3\xff\xc7\x01\xd8\xff\xc7\x01\xd9\xff\x56\x01\xe2\xff\xc7\x01\
-\xe5\xff\xc7\x01\xea\xff\xc7\x01\xeb\xff\xc7\x01\xec\xff\xc7\x01\
-\xed\xff\xc7\x01\xee\xff\xc7\x01\xef\xff\xc7\x01\xf0\xff\xc7\x01\
-\xf1\xff\xc7\x02\x34\xff\x8d\x02\x35\xff\x56\x02\x3e\xff\xc7\x02\
-\x3f\xff\xc7\x02\x40\xff\xc7\x02\x41\xff\xc7\x02\x45\xff\xc7\x02\
-\x54\xff\xc7\x02\x55\xff\xc7\x02\x58\xff\xc7\x02\x59\xff\xc7\x00\
-\x03\x00\x04\x00\xe3\x00\x22\x00\xe3\x02\x84\x00\xe3\x00\x03\x00\
-\x04\x00\xe3\x00\x22\x00\xe3\x02\x85\x00\xe3\x00\xde\x00\x26\xff\
-\xc7\x00\x26\xff\xc7\x00\x26\xff\xc7\x00\x26\xff\xc7\x00\x26\xff\
-\xc7\x00\x26\xff\xc7\x00\x2a\xff\xc7\x00\x2a\xff\xc7\x00\x2a\xff\
-\xc7\x00\x2a\xff\xc7\x00\x2a\xff\xc7\x00\x2a\xff\xc7\x00\x32\xff\
-\xc7\x00\x32\xff\xc7\x00\x32\xff\xc7\x00\x32\xff\xc7\x00\x32\xff\
-\xc7\x00\x32\xff\xc7\x00\x34\xff\xc7\x00\x34\xff\xc7\x00\x34\xff\
-\xc7\x00\x34\xff\xc7\x00\x34\xff\xc7\x00\x34\xff\xc7\x00\x39\xff\
-\x1d\x00\x39\xff\x1d\x00\x39\xff\x1d\x00\x39\xff\x1d\x00\x39\xff\
-\x1d\x00\x39\xff\x1d\x00\x3a\xff\x56\x00\x3a\xff\x56\x00\x3a\xff\
-\x56\x00\x3a\xff\x56\x00\x3a\xff\x56\x00\x3a\xff\x56\x00\x3c\xff\
-\x56\x00\x3c\xff\x56\x00\x3c\xff\x56\x00\x3c\xff\x56\x00\x3c\xff\
-\x56\x00\x3c\xff\x56\x00\x4a\x00\x73\x00\x4a\x00\x73\x00\x4a\x00\
-\x73\x00\x4a\x00\x73\x00\x4a\x00\x73\x00\x4a\x00\x73\x00\x4d\x00\
-\xe3\x00\x4d\x00\xe3\x00\x4d\x00\xe3\x00\x4d\x00\xe3\x00\x4d\x00\
-\xe3\x00\x4d\x00\xe3\x00\x59\xff\x56\x00\x59\xff\x56\x00\x59\xff\
-\x56\x00\x59\xff\x56\x00\x59\xff\x56\x00\x59\xff\x56\x00\x5a\xff\
-\x8d\x00\x5a\xff\x8d\x00\x5a\xff\x8d\x00\x5a\xff\x8d\x00\x5a\xff\
-\x8d\x00\x5a\xff\x8d\x00\x5c\x00\x73\x00\x5c\x00\x73\x00\x5c\x00\
-\x73\x00\x5c\x00\x73\x00\x5c\x00\x73\x00\x5c\x00\x73\x00\x81\xff\
-\xc7\x00\x81\xff\xc7\x00\x81\xff\xc7\x00\x81\xff\xc7\x00\x81\xff\
-\xc7\x00\x81\xff\xc7\x00\x8c\xff\xc7\x00\x8c\xff\xc7\x00\x8c\xff\
-\xc7\x00\x8c\xff\xc7\x00\x8c\xff\xc7\x00\x8c\xff\xc7\x00\x8d\xff\
-\xc7\x00\x8d\xff\xc7\x00\x8d\xff\xc7\x00\x8d\xff\xc7\x00\x8d\xff\
-\xc7\x00\x8d\xff\xc7\x00\x8e\xff\xc7\x00\x8e\xff\xc7\x00\x8e\xff\
-\xc7\x00\x8e\xff\xc7\x00\x8e\xff\xc7\x00\x8e\xff\xc7\x00\x8f\xff\
-\xc7\x00\x8f\xff\xc7\x00\x8f\xff\xc7\x00\x8f\xff\xc7\x00\x8f\xff\
-\xc7\x00\x8f\xff\xc7\x00\x90\xff\xc7\x00\x90\xff\xc7\x00\x90\xff\
-\xc7\x00\x90\xff\xc7\x00\x90\xff\xc7\x00\x90\xff\xc7\x00\x91\xff\
-\xc7\x00\x91\xff\xc7\x00\x91\xff\xc7\x00\x91\xff\xc7\x00\x91\xff\
-\xc7\x00\x91\xff\xc7\x00\x96\xff\x56\x00\x96\xff\x56\x00\x96\xff\
-\x56\x00\x96\xff\x56\x00\x96\xff\x56\x00\x96\xff\x56\x00\xb6\x00\
-\x73\x00\xb6\x00\x73\x00\xb6\x00\x73\x00\xb6\x00\x73\x00\xb6\x00\
-\x73\x00\xb6\x00\x73\x00\xb8\x00\x73\x00\xb8\x00\x73\x00\xb8\x00\
-\x73\x00\xb8\x00\x73\x00\xb8\x00\x73\x00\xb8\x00\x73\x00\xbf\xff\
-\xc7\x00\xbf\xff\xc7\x00\xbf\xff\xc7\x00\xbf\xff\xc7\x00\xbf\xff\
-\xc7\x00\xbf\xff\xc7\x00\xc1\xff\xc7\x00\xc1\xff\xc7\x00\xc1\xff\
-\xc7\x00\xc1\xff\xc7\x00\xc1\xff\xc7\x00\xc1\xff\xc7\x00\xc3\xff\
-\xc7\x00\xc3\xff\xc7\x00\xc3\xff\xc7\x00\xc3\xff\xc7\x00\xc3\xff\
-\xc7\x00\xc3\xff\xc7\x00\xc5\xff\xc7\x00\xc5\xff\xc7\x00\xc5\xff\
-\xc7\x00\xc5\xff\xc7\x00\xc5\xff\xc7\x00\xc5\xff\xc7\x00\xd3\xff\
-\xc7\x00\xd3\xff\xc7\x00\xd3\xff\xc7\x00\xd3\xff\xc7\x00\xd3\xff\
-\xc7\x00\xd3\xff\xc7\x00\xd4\x00\x73\x00\xd4\x00\x73\x00\xd4\x00\
-\x73\x00\xd4\x00\x73\x00\xd4\x00\x73\x00\xd4\x00\x73\x00\xd5\xff\
-\xc7\x00\xd5\xff\xc7\x00\xd5\xff\xc7\x00\xd5\xff\xc7\x00\xd5\xff\
-\xc7\x00\xd5\xff\xc7\x00\xd6\x00\x73\x00\xd6\x00\x73\x00\xd6\x00\
-\x73\x00\xd6\x00\x73\x00\xd6\x00\x73\x00\xd6\x00\x73\x00\xd7\xff\
-\xc7\x00\xd7\xff\xc7\x00\xd7\xff\xc7\x00\xd7\xff\xc7\x00\xd7\xff\
-\xc7\x00\xd7\xff\xc7\x00\xd8\x00\x73\x00\xd8\x00\x73\x00\xd8\x00\
-\x73\x00\xd8\x00\x73\x00\xd8\x00\x73\x00\xd8\x00\x73\x00\xe1\x00\
-\xe3\x00\xe1\x00\xe3\x00\xe1\x00\xe3\x00\xe1\x00\xe3\x00\xe1\x00\
-\xe3\x00\xe1\x00\xe3\x00\xec\xff\xc7\x00\xec\xff\xc7\x00\xec\xff\
-\xc7\x00\xec\xff\xc7\x00\xec\xff\xc7\x00\xec\xff\xc7\x00\xee\xff\
-\xc7\x00\xee\xff\xc7\x00\xee\xff\xc7\x00\xee\xff\xc7\x00\xee\xff\
-\xc7\x00\xee\xff\xc7\x01\x08\xff\x56\x01\x08\xff\x56\x01\x08\xff\
-\x56\x01\x08\xff\x56\x01\x08\xff\x56\x01\x08\xff\x56\x02\x86\x00\
-\xe3\x02\x86\x00\xe3\x02\x86\x00\xe3\x02\x86\x00\xe3\x02\x86\x00\
-\xe3\x02\x86\x00\xe3\x00\x02\x02\x80\x00\xe3\x02\x84\x00\xe3\x00\
-\x02\x02\x81\x00\xe3\x02\x85\x00\xe3\x00\xea\x00\x0f\x00\xe3\x00\
-\x0f\x00\xe3\x00\x0f\x00\xe3\x00\x0f\x00\xe3\x00\x0f\x00\xe3\x00\
-\x0f\x00\xe3\x00\x26\xff\xc7\x00\x26\xff\xc7\x00\x26\xff\xc7\x00\
-\x26\xff\xc7\x00\x26\xff\xc7\x00\x26\xff\xc7\x00\x2a\xff\xc7\x00\
-\x2a\xff\xc7\x00\x2a\xff\xc7\x00\x2a\xff\xc7\x00\x2a\xff\xc7\x00\
-\x2a\xff\xc7\x00\x32\xff\xc7\x00\x32\xff\xc7\x00\x32\xff\xc7\x00\
-\x32\xff\xc7\x00\x32\xff\xc7\x00\x32\xff\xc7\x00\x34\xff\xc7\x00\
-\x34\xff\xc7\x00\x34\xff\xc7\x00\x34\xff\xc7\x00\x34\xff\xc7\x00\
-\x34\xff\xc7\x00\x39\xff\x1d\x00\x39\xff\x1d\x00\x39\xff\x1d\x00\
-\x39\xff\x1d\x00\x39\xff\x1d\x00\x39\xff\x1d\x00\x3a\xff\x56\x00\
-\x3a\xff\x56\x00\x3a\xff\x56\x00\x3a\xff\x56\x00\x3a\xff\x56\x00\
-\x3a\xff\x56\x00\x3c\xff\x56\x00\x3c\xff\x56\x00\x3c\xff\x56\x00\
-\x3c\xff\x56\x00\x3c\xff\x56\x00\x3c\xff\x56\x00\x4a\x00\x73\x00\
-\x4a\x00\x73\x00\x4a\x00\x73\x00\x4a\x00\x73\x00\x4a\x00\x73\x00\
-\x4a\x00\x73\x00\x4d\x00\xe3\x00\x4d\x00\xe3\x00\x4d\x00\xe3\x00\
-\x4d\x00\xe3\x00\x4d\x00\xe3\x00\x4d\x00\xe3\x00\x59\xff\x56\x00\
-\x59\xff\x56\x00\x59\xff\x56\x00\x59\xff\x56\x00\x59\xff\x56\x00\
-\x59\xff\x56\x00\x5a\xff\x8d\x00\x5a\xff\x8d\x00\x5a\xff\x8d\x00\
-\x5a\xff\x8d\x00\x5a\xff\x8d\x00\x5a\xff\x8d\x00\x5c\x00\x73\x00\
-\x5c\x00\x73\x00\x5c\x00\x73\x00\x5c\x00\x73\x00\x5c\x00\x73\x00\
-\x5c\x00\x73\x00\x81\xff\xc7\x00\x81\xff\xc7\x00\x81\xff\xc7\x00\
-\x81\xff\xc7\x00\x81\xff\xc7\x00\x81\xff\xc7\x00\x8c\xff\xc7\x00\
-\x8c\xff\xc7\x00\x8c\xff\xc7\x00\x8c\xff\xc7\x00\x8c\xff\xc7\x00\
-\x8c\xff\xc7\x00\x8d\xff\xc7\x00\x8d\xff\xc7\x00\x8d\xff\xc7\x00\
-\x8d\xff\xc7\x00\x8d\xff\xc7\x00\x8d\xff\xc7\x00\x8e\xff\xc7\x00\
-\x8e\xff\xc7\x00\x8e\xff\xc7\x00\x8e\xff\xc7\x00\x8e\xff\xc7\x00\
-\x8e\xff\xc7\x00\x8f\xff\xc7\x00\x8f\xff\xc7\x00\x8f\xff\xc7\x00\
-\x8f\xff\xc7\x00\x8f\xff\xc7\x00\x8f\xff\xc7\x00\x90\xff\xc7\x00\
-\x90\xff\xc7\x00\x90\xff\xc7\x00\x90\xff\xc7\x00\x90\xff\xc7\x00\
-\x90\xff\xc7\x00\x91\xff\xc7\x00\x91\xff\xc7\x00\x91\xff\xc7\x00\
-\x91\xff\xc7\x00\x91\xff\xc7\x00\x91\xff\xc7\x00\x96\xff\x56\x00\
-\x96\xff\x56\x00\x96\xff\x56\x00\x96\xff\x56\x00\x96\xff\x56\x00\
-\x96\xff\x56\x00\xb6\x00\x73\x00\xb6\x00\x73\x00\xb6\x00\x73\x00\
-\xb6\x00\x73\x00\xb6\x00\x73\x00\xb6\x00\x73\x00\xb8\x00\x73\x00\
-\xb8\x00\x73\x00\xb8\x00\x73\x00\xb8\x00\x73\x00\xb8\x00\x73\x00\
-\xb8\x00\x73\x00\xbf\xff\xc7\x00\xbf\xff\xc7\x00\xbf\xff\xc7\x00\
-\xbf\xff\xc7\x00\xbf\xff\xc7\x00\xbf\xff\xc7\x00\xc1\xff\xc7\x00\
-\xc1\xff\xc7\x00\xc1\xff\xc7\x00\xc1\xff\xc7\x00\xc1\xff\xc7\x00\
-\xc1\xff\xc7\x00\xc3\xff\xc7\x00\xc3\xff\xc7\x00\xc3\xff\xc7\x00\
-\xc3\xff\xc7\x00\xc3\xff\xc7\x00\xc3\xff\xc7\x00\xc5\xff\xc7\x00\
-\xc5\xff\xc7\x00\xc5\xff\xc7\x00\xc5\xff\xc7\x00\xc5\xff\xc7\x00\
-\xc5\xff\xc7\x00\xd3\xff\xc7\x00\xd3\xff\xc7\x00\xd3\xff\xc7\x00\
-\xd3\xff\xc7\x00\xd3\xff\xc7\x00\xd3\xff\xc7\x00\xd4\x00\x73\x00\
-\xd4\x00\x73\x00\xd4\x00\x73\x00\xd4\x00\x73\x00\xd4\x00\x73\x00\
-\xd4\x00\x73\x00\xd5\xff\xc7\x00\xd5\xff\xc7\x00\xd5\xff\xc7\x00\
-\xd5\xff\xc7\x00\xd5\xff\xc7\x00\xd5\xff\xc7\x00\xd6\x00\x73\x00\
-\xd6\x00\x73\x00\xd6\x00\x73\x00\xd6\x00\x73\x00\xd6\x00\x73\x00\
-\xd6\x00\x73\x00\xd7\xff\xc7\x00\xd7\xff\xc7\x00\xd7\xff\xc7\x00\
-\xd7\xff\xc7\x00\xd7\xff\xc7\x00\xd7\xff\xc7\x00\xd8\x00\x73\x00\
-\xd8\x00\x73\x00\xd8\x00\x73\x00\xd8\x00\x73\x00\xd8\x00\x73\x00\
-\xd8\x00\x73\x00\xe1\x00\xe3\x00\xe1\x00\xe3\x00\xe1\x00\xe3\x00\
-\xe1\x00\xe3\x00\xe1\x00\xe3\x00\xe1\x00\xe3\x00\xec\xff\xc7\x00\
-\xec\xff\xc7\x00\xec\xff\xc7\x00\xec\xff\xc7\x00\xec\xff\xc7\x00\
-\xec\xff\xc7\x00\xee\xff\xc7\x00\xee\xff\xc7\x00\xee\xff\xc7\x00\
-\xee\xff\xc7\x00\xee\xff\xc7\x00\xee\xff\xc7\x01\x08\xff\x56\x01\
-\x08\xff\x56\x01\x08\xff\x56\x01\x08\xff\x56\x01\x08\xff\x56\x01\
-\x08\xff\x56\x02\x82\x00\xe3\x02\x82\x00\xe3\x02\x82\x00\xe3\x02\
-\x82\x00\xe3\x02\x82\x00\xe3\x02\x82\x00\xe3\x02\x86\x00\xe3\x02\
-\x86\x00\xe3\x02\x86\x00\xe3\x02\x86\x00\xe3\x02\x86\x00\xe3\x02\
-\x86\x00\xe3\x00\x01\x00\xfc\x00\x24\x00\x27\x00\x29\x00\x2c\x00\
-\x2e\x00\x2f\x00\x32\x00\x33\x00\x37\x00\x39\x00\x3a\x00\x3b\x00\
-\x3c\x00\x44\x00\x45\x00\x48\x00\x49\x00\x4a\x00\x4e\x00\x52\x00\
-\x53\x00\x57\x00\x58\x00\x5a\x00\x5c\x00\x7a\x00\x7b\x00\x7c\x00\
-\x7d\x00\x7e\x00\x7f\x00\x8a\x00\x8c\x00\x8d\x00\x8e\x00\x8f\x00\
-\x90\x00\x91\x00\x96\x00\x99\x00\x9a\x00\x9b\x00\x9c\x00\x9d\x00\
-\x9e\x00\xab\x00\xac\x00\xad\x00\xae\x00\xaf\x00\xb1\x00\xb2\x00\
-\xb3\x00\xb4\x00\xb5\x00\xb6\x00\xb8\x00\xb9\x00\xba\x00\xbb\x00\
-\xbc\x00\xbe\x00\xbf\x00\xc7\x00\xc9\x00\xcc\x00\xce\x00\xd4\x00\
-\xd8\x00\xdc\x00\xe2\x00\xe4\x00\xe6\x00\xe7\x00\xec\x00\xed\x00\
-\xfc\x00\xfd\x00\xfe\x00\xff\x01\x01\x01\x03\x01\x05\x01\x07\x01\
-\x08\x01\x20\x01\x2a\x01\x2b\x01\x2d\x01\x2e\x01\x32\x01\x34\x01\
-\x35\x01\x37\x01\x39\x01\x3b\x01\x3c\x01\x3d\x01\x3e\x01\x3f\x01\
-\x41\x01\x44\x01\x46\x01\x48\x01\x4e\x01\x52\x01\x53\x01\x55\x01\
-\x56\x01\x58\x01\x5c\x01\x5d\x01\x63\x01\x65\x01\x74\x01\x75\x01\
-\x78\x01\x79\x01\x7b\x01\x7c\x01\x7e\x01\x80\x01\x82\x01\x85\x01\
-\x88\x01\x8c\x01\x90\x01\x92\x01\x94\x01\x95\x01\x96\x01\x97\x01\
-\x9c\x01\x9e\x01\x9f\x01\xa0\x01\xa2\x01\xa3\x01\xa5\x01\xa8\x01\
-\xac\x01\xb0\x01\xb2\x01\xb3\x01\xb4\x01\xb5\x01\xb6\x01\xb7\x01\
-\xbc\x01\xbe\x01\xbf\x01\xc0\x01\xc5\x01\xc9\x01\xcb\x01\xcc\x01\
-\xce\x01\xd0\x01\xd2\x01\xd3\x01\xd4\x01\xd5\x01\xd8\x01\xd9\x01\
-\xda\x01\xdb\x01\xdd\x01\xdf\x01\xe2\x01\xe3\x01\xe4\x01\xe5\x01\
-\xe6\x01\xe7\x01\xe8\x01\xe9\x01\xea\x01\xeb\x01\xec\x01\xed\x01\
-\xee\x01\xef\x01\xfb\x01\xfc\x01\xff\x02\x00\x02\x01\x02\x02\x02\
-\x05\x02\x06\x02\x09\x02\x0a\x02\x0b\x02\x0c\x02\x0d\x02\x0e\x02\
-\x0f\x02\x10\x02\x13\x02\x14\x02\x15\x02\x16\x02\x17\x02\x18\x02\
-\x1b\x02\x1c\x02\x1d\x02\x1e\x02\x1f\x02\x20\x02\x21\x02\x22\x02\
-\x29\x02\x2f\x02\x30\x02\x31\x02\x3e\x02\x3f\x02\x40\x02\x41\x02\
-\x46\x02\x47\x02\x48\x02\x49\x02\x4a\x02\x4b\x02\x54\x02\x55\x02\
-\x56\x02\x57\x02\x58\x02\x59\x02\x5a\x02\x5b\x02\x5c\x02\x5d\x02\
-\x5e\x02\x5f\x02\x60\x02\x61\x02\x64\x02\x65\x02\x68\x02\x69\x02\
-\x80\x02\x81\x02\x82\x02\x84\x02\x85\x02\x86\x02\xa4\x02\xa7\x00\
-\x01\x00\x00\x00\x0a\x00\x6e\x00\x8a\x00\x04\x44\x46\x4c\x54\x00\
-\x1a\x63\x79\x72\x6c\x00\x24\x67\x72\x65\x6b\x00\x2e\x6c\x61\x74\
-\x6e\x00\x38\x00\x04\x00\x00\x00\x00\xff\xff\x00\x00\x00\x04\x00\
-\x00\x00\x00\xff\xff\x00\x00\x00\x04\x00\x00\x00\x00\xff\xff\x00\
-\x00\x00\x1c\x00\x04\x41\x5a\x45\x20\x00\x24\x4e\x4c\x44\x20\x00\
-\x1c\x54\x52\x4b\x20\x00\x24\x56\x49\x54\x20\x00\x1c\x00\x00\xff\
-\xff\x00\x01\x00\x00\x00\x00\xff\xff\x00\x01\x00\x01\x00\x02\x6c\
-\x69\x67\x61\x00\x0e\x6c\x69\x67\x61\x00\x16\x00\x00\x00\x02\x00\
-\x00\x00\x01\x00\x00\x00\x01\x00\x01\x00\x02\x00\x06\x00\x0e\x00\
-\x04\x00\x00\x00\x01\x00\x10\x00\x04\x00\x00\x00\x01\x00\x38\x00\
-\x01\x00\x28\x00\x02\x00\x0a\x00\x1e\x00\x02\x00\x06\x00\x0e\x02\
-\xaa\x00\x03\x00\x49\x00\x4c\x02\xa8\x00\x02\x00\x4c\x00\x01\x00\
-\x04\x02\xaa\x00\x02\x00\x4c\x00\x01\x00\x02\x00\x49\x02\xa7\x00\
-\x01\x00\x30\x00\x02\x00\x0a\x00\x26\x00\x03\x00\x08\x00\x10\x00\
-\x16\x02\xab\x00\x03\x00\x49\x00\x4f\x02\xa9\x00\x02\x00\x4f\x02\
-\xa7\x00\x02\x00\x49\x00\x01\x00\x04\x02\xab\x00\x02\x00\x4f\x00\
-\x01\x00\x02\x00\x49\x02\xa7\x00\x01\x03\x5d\x01\xf4\x00\x05\x00\
-\x04\x05\x33\x05\x9a\x00\x00\x01\x1f\x05\x33\x05\x9a\x00\x00\x03\
-\xd7\x00\x64\x02\x10\x00\x00\x02\x00\x06\x03\x00\x00\x00\x00\x00\
-\x00\xe1\x00\x02\xff\x52\x01\xe9\xeb\x00\x02\x00\x04\x00\x00\x00\
-\x00\x50\x66\x45\x64\x00\x40\x00\x0d\xfb\x04\x06\x66\xfe\x66\x00\
-\x00\x07\x4a\x02\xfd\x00\x00\x01\x1f\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x03\x00\x00\x00\x03\x00\x00\x00\x1c\x00\x01\x00\x00\x00\
-\x00\x02\x54\x00\x03\x00\x01\x00\x00\x00\x1c\x00\x04\x02\x38\x00\
-\x00\x00\x8a\x00\x80\x00\x06\x00\x0a\x00\x00\x00\x0d\x00\x7e\x00\
-\xa3\x00\xa5\x00\xb1\x00\xb8\x00\xbb\x00\xd6\x01\x13\x01\x21\x01\
-\x25\x01\x27\x01\x2b\x01\x31\x01\x35\x01\x3a\x01\x3e\x01\x44\x01\
-\x48\x01\x55\x01\x65\x01\x71\x01\x7e\x01\x92\x02\x1b\x02\xc7\x02\
-\xdd\x03\x75\x03\x7a\x03\x7e\x03\x8a\x03\x8c\x03\xa1\x03\xce\x03\
-\xd1\x03\xdd\x03\xe1\x04\x77\x04\x86\x04\xce\x04\xf9\x04\xff\x20\
-\x0d\x20\x14\x20\x16\x20\x22\x20\x26\x20\x29\x20\x31\x20\x3b\x20\
-\x3d\x20\x40\x20\x46\x20\x52\x20\x54\x20\x5f\x20\xa1\x20\xa4\x20\
-\xa6\x20\xa9\x20\xac\x20\xb2\x21\x22\x22\x06\x22\x1a\xe0\x00\xfb\
-\x04\xff\xff\x00\x00\x00\x00\x00\x0d\x00\x20\x00\xa0\x00\xa5\x00\
-\xa7\x00\xb4\x00\xba\x00\xbf\x00\xd8\x01\x16\x01\x24\x01\x27\x01\
-\x2a\x01\x30\x01\x34\x01\x39\x01\x3d\x01\x41\x01\x47\x01\x50\x01\
-\x58\x01\x6a\x01\x78\x01\x92\x02\x18\x02\xc6\x02\xd8\x03\x74\x03\
-\x7a\x03\x7e\x03\x84\x03\x8c\x03\x8e\x03\xa3\x03\xd1\x03\xd8\x03\
-\xdf\x04\x00\x04\x7a\x04\x88\x04\xd0\x04\xfc\x20\x00\x20\x10\x20\
-\x16\x20\x18\x20\x26\x20\x29\x20\x2f\x20\x39\x20\x3d\x20\x3f\x20\
-\x44\x20\x52\x20\x54\x20\x5f\x20\xa1\x20\xa4\x20\xa6\x20\xa9\x20\
-\xab\x20\xb2\x21\x22\x22\x06\x22\x1a\xe0\x00\xfb\x00\xff\xff\x00\
-\x00\xff\xf5\xff\xe3\xff\xc2\xff\xc1\xff\xc0\xff\xbe\xff\xbd\xff\
-\xba\xff\xb9\xff\xb7\xff\xb5\xff\xb4\xff\xb2\xff\xae\xff\xac\xff\
-\xa9\xff\xa7\xff\xa5\xff\xa3\xff\x9c\xff\x9a\xff\x96\xff\x90\xff\
-\x7d\xfe\xf8\xfe\x4e\xfe\x3e\xfd\xa8\xfd\xa4\xfd\xa1\xfd\x9c\xfd\
-\x9b\xfd\x9a\xfd\x99\xfd\x97\xfd\x91\xfd\x90\xfd\x72\xfd\x70\xfd\
-\x6f\xfd\x6e\xfd\x6c\xe2\x6c\xe2\x6a\xe2\x69\xe2\x68\xe2\x65\xe2\
-\x63\xe2\x5e\xe2\x57\xe2\x56\xe2\x55\xe2\x52\xe2\x47\xe2\x46\xe2\
-\x3c\xe1\xfb\xe1\xf9\xe1\xf8\xe1\xf6\xe1\xf5\xe1\xf0\xe1\x81\xe0\
-\x9e\xe0\x8b\x22\xa6\x07\xa7\x00\x01\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x06\x02\x0a\x00\x00\x00\x00\x01\x00\x00\x01\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\
-\x02\x00\x00\x00\x00\x00\x00\x00\x02\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x03\x00\
-\x04\x00\x05\x00\x06\x00\x07\x00\x08\x00\x09\x00\x0a\x00\x0b\x00\
-\x0c\x00\x0d\x00\x0e\x00\x0f\x00\x10\x00\x11\x00\x12\x00\x13\x00\
-\x14\x00\x15\x00\x16\x00\x17\x00\x18\x00\x19\x00\x1a\x00\x1b\x00\
-\x1c\x00\x1d\x00\x1e\x00\x1f\x00\x20\x00\x21\x00\x22\x00\x23\x00\
-\x24\x00\x25\x00\x26\x00\x27\x00\x28\x00\x29\x00\x2a\x00\x2b\x00\
-\x2c\x00\x2d\x00\x2e\x00\x2f\x00\x30\x00\x31\x00\x32\x00\x33\x00\
-\x34\x00\x35\x00\x36\x00\x37\x00\x38\x00\x39\x00\x3a\x00\x3b\x00\
-\x3c\x00\x3d\x00\x3e\x00\x3f\x00\x40\x00\x41\x00\x42\x00\x43\x00\
-\x44\x00\x45\x00\x46\x00\x47\x00\x48\x00\x49\x00\x4a\x00\x4b\x00\
-\x4c\x00\x4d\x00\x4e\x00\x4f\x00\x50\x00\x51\x00\x52\x00\x53\x00\
-\x54\x00\x55\x00\x56\x00\x57\x00\x58\x00\x59\x00\x5a\x00\x5b\x00\
-\x5c\x00\x5d\x00\x5e\x00\x5f\x00\x60\x00\x61\x00\x00\x00\x7e\x00\
-\x7f\x00\x81\x00\x83\x00\x8b\x00\x90\x00\x95\x00\x9a\x00\x99\x00\
-\x9b\x00\x9d\x00\x9c\x00\x9e\x00\xa0\x00\xa2\x00\xa1\x00\xa3\x00\
-\xa4\x00\xa6\x00\xa5\x00\xa7\x00\xa8\x00\xaa\x00\xac\x00\xab\x00\
-\xad\x00\xaf\x00\xae\x00\xb3\x00\xb2\x00\xb4\x00\xb5\x02\x88\x00\
-\x70\x00\x64\x00\x65\x00\x67\x02\x8a\x00\x74\x00\x98\x00\x6e\x00\
-\x69\x02\xa3\x00\x72\x00\x68\x00\x00\x00\x80\x00\x91\x00\x00\x00\
-\x71\x00\x00\x00\x00\x00\x66\x00\x73\x00\x00\x00\x00\x00\x00\x01\
-\x59\x00\x00\x00\x6a\x00\x77\x01\x42\x00\x9f\x00\xb1\x00\x79\x00\
-\x63\x00\x6c\x02\xa5\x01\x0f\x00\x00\x02\xa4\x00\x6b\x00\x78\x02\
-\x8b\x00\x62\x00\x7a\x00\x7d\x00\x8f\x00\xee\x00\xef\x02\x7d\x02\
-\x7e\x02\x84\x02\x85\x02\x80\x02\x81\x00\xb0\x00\x00\x00\xb8\x01\
-\x08\x02\x96\x02\xa1\x02\x90\x02\x91\x02\xa8\x02\xa9\x02\x89\x00\
-\x75\x02\x82\x02\x86\x02\x8e\x00\x7c\x00\x84\x00\x7b\x00\x85\x00\
-\x82\x00\x87\x00\x88\x00\x89\x00\x86\x00\x8d\x00\x8e\x00\x00\x00\
-\x8c\x00\x93\x00\x94\x00\x92\x00\xdf\x01\x14\x01\x1a\x00\x6f\x01\
-\x16\x01\x17\x01\x18\x00\x76\x01\x1b\x01\x19\x01\x15\x00\x00\x00\
-\x00\x03\x8f\x05\x83\x00\x7f\x00\xb7\x00\x72\x00\x78\x00\x7b\x00\
-\x83\x00\x87\x00\x8d\x00\x91\x00\x65\x00\xa0\x00\xb8\x00\x8f\x00\
-\x93\x00\x99\x00\xa0\x00\xa6\x00\xac\x00\xb2\x00\x6d\x00\x9e\x00\
-\x9b\x00\x76\x00\x4e\x00\x68\x00\x97\x00\x58\x00\x81\x00\x00\xb0\
-\x00\x2c\xb0\x00\x13\x4b\xb0\x4c\x50\x58\xb0\x4a\x76\x59\xb0\x00\
-\x23\x3f\x18\xb0\x06\x2b\x58\x3d\x59\x4b\xb0\x4c\x50\x58\x7d\x59\
-\x20\xd4\xb0\x01\x13\x2e\x18\x2d\xb0\x01\x2c\x20\xda\xb0\x0c\x2b\
-\x2d\xb0\x02\x2c\x4b\x52\x58\x45\x23\x59\x21\x2d\xb0\x03\x2c\x69\
-\x18\x20\xb0\x40\x50\x58\x21\xb0\x40\x59\x2d\xb0\x04\x2c\xb0\x06\
-\x2b\x58\x21\x23\x21\x7a\x58\xdd\x1b\xcd\x59\x1b\x4b\x52\x58\x58\
-\xfd\x1b\xed\x59\x1b\x23\x21\xb0\x05\x2b\x58\xb0\x46\x76\x59\x58\
-\xdd\x1b\xcd\x59\x59\x59\x18\x2d\xb0\x05\x2c\x0d\x5c\x5a\x2d\xb0\
-\x06\x2c\xb1\x22\x01\x88\x50\x58\xb0\x20\x88\x5c\x5c\x1b\xb0\x00\
-\x59\x2d\xb0\x07\x2c\xb1\x24\x01\x88\x50\x58\xb0\x40\x88\x5c\x5c\
-\x1b\xb0\x00\x59\x2d\xb0\x08\x2c\x12\x11\x20\x39\x2f\x2d\xb0\x09\
-\x2c\x20\x7d\xb0\x06\x2b\x58\xc4\x1b\xcd\x59\x20\xb0\x03\x25\x49\
-\x23\x20\xb0\x04\x26\x4a\xb0\x00\x50\x58\x8a\x65\x8a\x61\x20\xb0\
-\x00\x50\x58\x38\x1b\x21\x21\x59\x1b\x8a\x8a\x61\x20\xb0\x00\x52\
-\x58\x38\x1b\x21\x21\x59\x59\x18\x2d\xb0\x0a\x2c\xb0\x06\x2b\x58\
-\x21\x10\x1b\x10\x21\x59\x2d\xb0\x0b\x2c\x20\xd2\xb0\x0c\x2b\x2d\
-\xb0\x0c\x2c\x20\x2f\xb0\x07\x2b\x5c\x58\x20\x20\x47\x23\x46\x61\
-\x6a\x20\x58\x20\x64\x62\x38\x1b\x21\x21\x59\x1b\x21\x59\x2d\xb0\
-\x0d\x2c\x12\x11\x20\x20\x39\x2f\x20\x8a\x20\x47\x8a\x46\x61\x23\
-\x8a\x20\x8a\x23\x4a\xb0\x00\x50\x58\x23\xb0\x00\x52\x58\xb0\x40\
-\x38\x1b\x21\x59\x1b\x23\xb0\x00\x50\x58\xb0\x40\x65\x38\x1b\x21\
-\x59\x59\x2d\xb0\x0e\x2c\xb0\x06\x2b\x58\x3d\xd6\x18\x21\x21\x1b\
-\x20\xd6\x8a\x4b\x52\x58\x20\x8a\x23\x49\x20\xb0\x00\x55\x58\x38\
-\x1b\x21\x21\x59\x1b\x21\x21\x59\x59\x2d\xb0\x0f\x2c\x23\x20\xd6\
-\x20\x2f\xb0\x07\x2b\x5c\x58\x23\x20\x58\x4b\x53\x1b\x21\xb0\x01\
-\x59\x58\x8a\xb0\x04\x26\x49\x23\x8a\x23\x20\x8a\x49\x8a\x23\x61\
-\x38\x1b\x21\x21\x21\x21\x59\x1b\x21\x21\x21\x21\x21\x59\x2d\xb0\
-\x10\x2c\x20\xda\xb0\x12\x2b\x2d\xb0\x11\x2c\x20\xd2\xb0\x12\x2b\
-\x2d\xb0\x12\x2c\x20\x2f\xb0\x07\x2b\x5c\x58\x20\x20\x47\x23\x46\
-\x61\x6a\x8a\x20\x47\x23\x46\x23\x61\x6a\x60\x20\x58\x20\x64\x62\
-\x38\x1b\x21\x21\x59\x1b\x21\x21\x59\x2d\xb0\x13\x2c\x20\x8a\x20\
-\x8a\x87\x20\xb0\x03\x25\x4a\x64\x23\x8a\x07\xb0\x20\x50\x58\x3c\
-\x1b\xc0\x59\x2d\xb0\x14\x2c\xb3\x00\x40\x01\x40\x42\x42\x01\x4b\
-\xb8\x10\x00\x63\x00\x4b\xb8\x10\x00\x63\x20\x8a\x20\x8a\x55\x58\
-\x20\x8a\x20\x8a\x52\x58\x23\x62\x20\xb0\x00\x23\x42\x1b\x62\x20\
-\xb0\x01\x23\x42\x59\x20\xb0\x40\x52\x58\xb2\x00\x20\x00\x43\x63\
-\x42\xb2\x01\x20\x01\x43\x63\x42\xb0\x20\x63\xb0\x19\x65\x1c\x21\
-\x59\x1b\x21\x21\x59\x2d\xb0\x15\x2c\xb0\x01\x43\x63\x23\xb0\x00\
-\x43\x63\x23\x2d\x00\x00\x00\x00\x01\x00\x01\xff\xff\x00\x0f\x00\
-\x05\x00\x14\x00\x14\x06\x00\x06\x1f\x00\x03\x00\x06\x00\x09\x00\
-\x0c\x00\x0f\x00\xee\x00\xb2\x0a\x05\x00\x2b\xb0\x0c\x33\xb1\x01\
-\x07\xe9\xb0\x00\x2f\xb1\x07\x07\xe9\xb0\x08\x32\x01\xb0\x10\x2f\
-\xb0\x00\xd6\xb4\x04\x0d\x00\x20\x04\x2b\xb0\x06\x32\xb0\x04\x10\
-\xb2\x00\x0e\x10\x2b\xb0\x0f\x32\xb4\x03\x0d\x00\x20\x04\x2b\xb0\
-\x11\xd6\xb0\x36\x1a\xb1\x04\x0c\x87\x04\xb0\x04\x2e\x05\xb0\x0c\
-\xc0\xb1\x07\x10\xf9\x04\xb0\x0f\xc0\xb1\x06\x08\x87\x05\xb0\x08\
-\x2e\x04\xb0\x06\xc0\xb1\x0e\x10\xf9\x05\xb0\x0a\xc0\xb0\x06\x10\
-\xb3\x05\x06\x08\x13\x2b\xb1\x06\x08\x08\xb0\x04\x10\xb3\x05\x04\
-\x0c\x13\x2b\x05\xb0\x06\x10\xb3\x09\x06\x08\x13\x2b\xb1\x06\x08\
-\x08\xb0\x07\x10\xb3\x09\x07\x0f\x13\x2b\x05\xb0\x0a\x10\xb3\x0b\
-\x0a\x0e\x13\x2b\xb1\x0a\x0e\x08\xb0\x04\x10\xb3\x0b\x04\x0c\x13\
-\x2b\x05\xb0\x0a\x10\xb3\x0d\x0a\x0e\x13\x2b\xb1\x0a\x0e\x08\xb0\
-\x07\x10\xb3\x0d\x07\x0f\x13\x2b\x00\xb7\x04\x05\x06\x09\x0b\x0d\
-\x0e\x0f\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x01\xb7\x05\x07\x08\x09\
-\x0a\x0b\x0c\x0d\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\xb0\x40\x1a\x01\
-\x00\x30\x31\x37\x11\x21\x11\x25\x09\x01\x13\x21\x09\x05\x11\x14\
-\x05\xec\xfa\x8f\x02\x36\xfd\xca\x48\x04\x66\xfd\xcd\xfd\xcd\x02\
-\x33\x02\x33\xfe\x13\x02\x35\x14\x06\x0b\xf9\xf5\xd1\x02\x36\x02\
-\x33\xfb\x41\x02\x36\x02\xdf\xfd\xcb\x02\x35\xfd\x77\xfd\xca\x04\
-\x69\x00\x00\x00\x02\x00\xf0\x00\x00\x01\x9c\x05\xc7\x00\x03\x00\
-\x08\x00\x3d\x00\xb2\x00\x00\x00\x2b\xb1\x01\x04\xe9\xb2\x04\x02\
-\x00\x2b\x01\xb0\x09\x2f\xb0\x00\xd6\xb0\x04\x32\xb1\x03\x14\xe9\
-\xb0\x05\x32\xb1\x03\x14\xe9\xb3\x07\x03\x00\x08\x2b\xb1\x06\x0f\
-\xe9\xb1\x0a\x01\x2b\x00\xb1\x04\x01\x11\x12\xb0\x06\x39\x30\x31\
-\x33\x35\x33\x15\x03\x33\x03\x23\x03\xf0\xac\xac\xac\x13\x89\x0e\
-\xac\xac\x05\xc7\xfb\x9f\x03\xf8\x00\x00\x00\x00\x02\x01\x02\x02\
-\xe5\x02\xfa\x05\xc7\x00\x04\x00\x09\x00\x4a\x00\xb2\x00\x02\x00\
-\x2b\xb0\x05\x33\x01\xb0\x0a\x2f\xb0\x04\xd6\xb4\x03\x16\x00\x32\
-\x04\x2b\xb0\x03\x10\xb3\x20\x03\x01\x0e\x2b\xb1\x00\x0d\xe9\xb0\
-\x00\x2f\xb1\x01\x0d\xe9\xb0\x03\x10\xb1\x08\x01\x2b\xb4\x07\x16\
-\x00\x32\x04\x2b\xb3\x20\x08\x05\x0e\x2b\xb1\x06\x0d\xe9\xb1\x0b\
-\x01\x2b\x00\x30\x31\x01\x33\x03\x15\x23\x01\x33\x03\x23\x35\x01\
-\x02\xa0\x11\x7d\x01\x46\xa0\x13\x7d\x05\xc7\xfd\x20\x02\x02\xe2\
-\xfd\x1e\x02\x00\x02\x00\x73\xfe\x39\x06\x35\x05\xc7\x00\x5e\x00\
-\x62\x02\x29\x00\xb2\x13\x02\x00\x2b\xb0\x22\x33\xb2\x1e\x02\x00\
-\x2b\xb0\x5b\x2f\xb3\x39\x49\x4a\x5a\x24\x17\x33\xb1\x02\x03\xe9\
-\xb3\x03\x31\x5f\x60\x24\x17\x32\xb2\x5b\x02\x0a\x2b\xb3\x40\x5b\
-\x54\x09\x2b\xb0\x43\x32\xb0\x05\x2f\xb3\x04\x30\x61\x62\x24\x17\
-\x33\xb1\x09\x03\xe9\xb3\x0a\x19\x1a\x28\x24\x17\x32\x01\xb0\x63\
-\x2f\xb1\x64\x01\x2b\xb0\x36\x1a\xba\x3e\x44\xf1\x32\x00\x15\x2b\
-\x0a\x0e\xb0\x59\x10\xb0\x0f\xc0\xb1\x4e\x03\xf9\xb0\x18\xc0\xba\
-\x3e\x27\xf0\xbd\x00\x15\x2b\x0a\x05\xb0\x1e\x2e\x0e\xb0\x48\xc0\
-\xb1\x27\x03\xf9\xb0\x3d\xc0\x05\xb0\x59\x10\xb3\x03\x59\x0f\x13\
-\x2b\xb3\x04\x59\x0f\x13\x2b\xb3\x0a\x59\x0f\x13\x2b\xba\x3e\x1c\
-\xf0\x8f\x00\x15\x2b\x0b\xb3\x0b\x59\x0f\x13\x2b\xb3\x0d\x59\x0f\
-\x13\x2b\xb3\x0e\x59\x0f\x13\x2b\x05\xb0\x4e\x10\xb3\x19\x4e\x18\
-\x13\x2b\xb0\x48\x10\xb3\x1a\x48\x1e\x13\x2b\xba\x3e\x22\xf0\xa9\
-\x00\x15\x2b\x0b\xb3\x1b\x48\x1e\x13\x2b\xb3\x1c\x48\x1e\x13\x2b\
-\xb3\x1d\x48\x1e\x13\x2b\x05\xb0\x3d\x10\xb3\x28\x3d\x27\x13\x2b\
-\xb3\x30\x3d\x27\x13\x2b\xb3\x31\x3d\x27\x13\x2b\xb3\x39\x3d\x27\
-\x13\x2b\xba\x3e\x1b\xf0\x89\x00\x15\x2b\x0b\xb3\x3a\x3d\x27\x13\
-\x2b\xb3\x3b\x3d\x27\x13\x2b\xb3\x3c\x3d\x27\x13\x2b\x05\xb0\x48\
-\x10\xb3\x49\x48\x1e\x13\x2b\xb0\x4e\x10\xb3\x4a\x4e\x18\x13\x2b\
-\xba\x3e\x1d\xf0\x92\x00\x15\x2b\x0b\xb3\x4b\x4e\x18\x13\x2b\xb3\
-\x4c\x4e\x18\x13\x2b\xb3\x4d\x4e\x18\x13\x2b\x05\xb0\x59\x10\xb3\
-\x5a\x59\x0f\x13\x2b\xb0\x4e\x10\xb3\x5f\x4e\x18\x13\x2b\xb0\x48\
-\x10\xb3\x60\x48\x1e\x13\x2b\xb3\x61\x48\x1e\x13\x2b\xb0\x4e\x10\
-\xb3\x62\x4e\x18\x13\x2b\xb2\x0b\x59\x0f\x20\x8a\x20\x8a\x23\x06\
-\x0e\x11\x12\x39\xb0\x0d\x39\xb0\x0e\x39\xb2\x4d\x4e\x18\x11\x12\
-\x39\xb0\x4c\x39\xb0\x4b\x39\xb2\x1b\x48\x1e\x11\x12\x39\xb0\x1c\
-\x39\xb0\x1d\x39\xb2\x3c\x3d\x27\x11\x12\x39\xb0\x3b\x39\xb0\x3a\
-\x39\x00\x40\x13\x0b\x0d\x18\x1b\x1c\x27\x3a\x3b\x48\x4b\x4c\x59\
-\x0e\x0f\x1d\x3c\x3d\x4d\x4e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\
-\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x01\x40\x24\x03\x04\x0a\
-\x0b\x0d\x18\x19\x1a\x1b\x1c\x27\x28\x30\x31\x39\x3a\x3b\x48\x49\
-\x4a\x4b\x4c\x59\x5a\x5f\x60\x61\x62\x0e\x0f\x1d\x1e\x3c\x3d\x4d\
-\x4e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\
-\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\
-\x2e\x2e\x2e\x2e\x2e\xb0\x40\x1a\x01\x00\x30\x31\x13\x34\x37\x21\
-\x13\x21\x26\x37\x34\x33\x21\x13\x30\x37\x3e\x04\x33\x32\x16\x17\
-\x14\x07\x03\x21\x13\x37\x3e\x04\x33\x32\x16\x17\x14\x07\x03\x21\
-\x32\x17\x16\x07\x14\x07\x21\x03\x21\x32\x1e\x01\x15\x14\x23\x21\
-\x03\x07\x0e\x06\x23\x22\x26\x27\x34\x37\x13\x21\x03\x07\x0e\x06\
-\x23\x22\x26\x27\x34\x37\x13\x21\x22\x27\x26\x25\x21\x13\x21\x73\
-\x4b\x01\x52\x44\xfe\x66\x48\x01\x52\x01\xb0\x99\x04\x02\x03\x0c\
-\x0c\x17\x0e\x19\x22\x02\x08\x93\x01\x41\x98\x02\x04\x02\x0c\x0d\
-\x16\x0e\x19\x23\x02\x06\x94\x01\x17\x39\x13\x1b\x01\x4c\xfe\xaf\
-\x46\x01\x9c\x1d\x22\x08\x52\xfe\x50\x99\x02\x02\x03\x06\x06\x0a\
-\x0c\x13\x0a\x19\x22\x02\x08\x91\xfe\xc1\x9a\x02\x02\x02\x06\x06\
-\x0b\x0c\x12\x0b\x19\x22\x02\x08\x94\xfe\xe7\x3b\x11\x18\x02\x1e\
-\x01\x40\x46\xfe\xc0\x01\x33\x3d\x01\x01\x1e\x02\x3c\x3f\x02\x6b\
-\x0a\x0a\x0f\x14\x0e\x0b\x23\x19\x12\x1d\xfd\xb0\x02\x6b\x0a\x0a\
-\x0f\x14\x0e\x0b\x25\x19\x19\x14\xfd\xb0\x0c\x14\x1f\x3d\x01\xfe\
-\xe2\x1b\x17\x0c\x3f\xfd\x95\x06\x08\x0a\x11\x0a\x0e\x09\x06\x25\
-\x19\x10\x1d\x02\x50\xfd\x95\x06\x08\x0a\x11\x0a\x0e\x09\x06\x25\
-\x19\x10\x1d\x02\x50\x0c\x12\x5f\x01\x1e\x00\x00\x03\x00\x5a\xff\
-\xc7\x03\x8b\x06\x00\x00\x22\x00\x2a\x00\x30\x00\x94\x00\xb2\x21\
-\x00\x00\x2b\xb1\x04\x08\xe9\xb0\x2b\x32\xb2\x21\x04\x0a\x2b\xb3\
-\x40\x21\x20\x09\x2b\xb2\x1e\x00\x00\x2b\xb0\x27\x2f\xb0\x15\x33\
-\xb1\x0d\x09\xe9\xb0\x10\x32\xb2\x0d\x27\x0a\x2b\xb3\x40\x0d\x0e\
-\x09\x2b\x01\xb0\x31\x2f\xb0\x0a\xd6\xb1\x23\x10\xe9\xb0\x23\x10\
-\xb1\x20\x01\x2b\xb2\x04\x0d\x26\x32\x32\x32\xb1\x1f\x16\xe9\xb2\
-\x0f\x15\x2b\x32\x32\x32\xb0\x1f\x10\xb1\x2e\x01\x2b\xb1\x1b\x10\
-\xe9\xb1\x32\x01\x2b\xb1\x23\x0a\x11\x12\xb0\x01\x39\xb1\x1b\x2e\
-\x11\x12\xb1\x13\x12\x39\x39\x00\xb1\x27\x04\x11\x12\xb7\x00\x01\
-\x0a\x13\x16\x1b\x26\x30\x24\x17\x39\xb0\x0d\x11\xb0\x12\x39\x30\
-\x31\x3f\x01\x1e\x01\x17\x11\x23\x2e\x02\x35\x34\x36\x37\x35\x33\
-\x15\x16\x17\x07\x26\x27\x11\x1e\x03\x15\x14\x06\x07\x15\x23\x35\
-\x26\x13\x14\x16\x17\x11\x23\x0e\x01\x01\x3e\x01\x34\x26\x27\x5a\
-\x19\x5e\x89\x69\x02\x7d\x9e\x35\xb6\x9c\x78\xa4\x8b\x18\x89\x8e\
-\x5e\x8c\x45\x21\xbe\x92\x78\xc9\x0c\x5c\x61\x02\x62\x59\x01\x35\
-\x64\x57\x54\x67\x7d\x8d\x4c\x3f\x0e\x02\x41\x1d\x93\x96\x4e\x91\
-\xe5\x1d\x27\x25\x10\x65\x87\x6a\x0d\xfd\xfa\x17\x64\x7f\x79\x3d\
-\xa4\xf6\x16\x29\x25\x14\x04\x60\x4c\x87\x1c\x01\xe1\x21\x87\xfb\
-\xcd\x21\x9b\xa4\x98\x24\x00\x00\x05\x00\x71\xff\xc7\x06\x37\x06\
-\x00\x00\x0a\x00\x17\x00\x2b\x00\x35\x00\x42\x00\x8e\x00\xb0\x3f\
-\x2f\xb1\x2f\x03\xe9\xb0\x14\x2f\xb1\x03\x03\xe9\xb0\x1d\x32\x01\
-\xb0\x43\x2f\xb0\x01\xd6\xb1\x0b\x11\xe9\xb0\x0b\x10\xb1\x18\x01\
-\x2b\xb4\x23\x16\x00\x14\x04\x2b\xb2\x23\x18\x0a\x2b\xb3\x00\x23\
-\x20\x09\x2b\xb0\x23\x10\xb1\x11\x01\x2b\xb1\x06\x0f\xe9\xb0\x06\
-\x10\xb1\x2d\x01\x2b\xb1\x36\x11\xe9\xb0\x36\x10\xb1\x3c\x01\x2b\
-\xb1\x31\x0f\xe9\xb1\x44\x01\x2b\xb1\x23\x18\x11\x12\xb2\x09\x14\
-\x03\x39\x39\x39\xb1\x3c\x36\x11\x12\xb2\x2e\x2f\x34\x39\x39\x39\
-\x00\xb1\x2f\x3f\x11\x12\xb0\x09\x39\xb0\x14\x11\xb2\x01\x06\x0e\
-\x39\x39\x39\xb0\x03\x12\xb0\x20\x39\x30\x31\x12\x10\x36\x33\x32\
-\x16\x15\x14\x06\x23\x22\x03\x14\x1f\x01\x3e\x01\x35\x34\x26\x27\
-\x0e\x01\x15\x13\x34\x37\x01\x36\x33\x32\x16\x15\x14\x07\x01\x14\
-\x0e\x03\x23\x22\x26\x24\x10\x36\x32\x16\x15\x14\x06\x23\x22\x03\
-\x14\x1f\x01\x3e\x01\x35\x34\x26\x27\x0e\x01\x15\x71\xb0\x6e\x73\
-\xa8\xa6\x75\x71\x14\x77\x15\x37\x4e\x50\x44\x35\x48\x5e\x13\x03\
-\x7b\x0e\x19\x10\x17\x19\xfc\x9a\x0f\x04\x0c\x0c\x09\x10\x19\x02\
-\x96\xb0\xe1\xa8\xa6\x74\x71\x14\x76\x15\x37\x4e\x50\x44\x35\x47\
-\x03\xc5\x01\x5c\xdf\xe7\xa8\xa6\xe8\x01\x7f\xdb\x23\x02\x04\x98\
-\x75\x71\x9b\x02\x06\x7f\x89\xfb\x7f\x04\x25\x05\xca\x19\x17\x10\
-\x12\x27\xfa\x58\x02\x13\x06\x0e\x04\x19\xc6\x01\x5c\xdf\xe7\xa8\
-\xa6\xe7\x01\x7f\xdb\x23\x02\x04\x97\x75\x71\x9b\x02\x06\x7f\x89\
-\x00\x00\x00\x00\x03\x00\x54\xff\xd3\x05\x9c\x05\xf4\x00\x2a\x00\
-\x39\x00\x43\x00\x99\x00\xb2\x28\x00\x00\x2b\xb0\x23\x33\xb1\x2e\
-\x08\xe9\xb0\x1e\x32\xb2\x21\x00\x00\x2b\xb1\x20\x09\xe9\xb0\x41\
-\x2f\xb1\x0d\x03\xe9\x01\xb0\x44\x2f\xb0\x00\xd6\xb1\x2b\x0d\xe9\
-\xb0\x2b\x10\xb1\x0a\x01\x2b\xb1\x3a\x0f\xe9\xb0\x3a\x10\xb1\x3e\
-\x01\x2b\xb1\x10\x0f\xe9\xb0\x10\x10\xb1\x17\x01\x2b\xb1\x18\x0f\
-\xe9\xb1\x45\x01\x2b\xb1\x3a\x0a\x11\x12\xb4\x07\x08\x28\x2e\x32\
-\x24\x17\x39\xb0\x3e\x11\xb1\x0d\x13\x39\x39\xb0\x10\x12\xb2\x25\
-\x26\x30\x39\x39\x39\xb0\x17\x11\xb3\x15\x1a\x1e\x23\x24\x17\x39\
-\x00\xb1\x2e\x21\x11\x12\xb1\x25\x26\x39\x39\xb1\x41\x20\x11\x12\
-\xb7\x00\x10\x08\x1a\x2b\x30\x32\x3c\x24\x17\x39\x30\x31\x13\x34\
-\x3e\x05\x37\x26\x37\x34\x36\x33\x32\x16\x15\x14\x06\x07\x16\x13\
-\x36\x13\x17\x02\x01\x16\x17\x16\x33\x32\x37\x15\x06\x23\x22\x27\
-\x23\x06\x23\x22\x26\x37\x14\x16\x33\x32\x37\x02\x27\x0e\x06\x13\
-\x14\x17\x36\x35\x34\x26\x23\x22\x06\x54\x0c\x25\x19\x49\x25\x6b\
-\x16\x44\x01\x9d\x7f\x79\x90\x7f\xb9\x62\xe4\xf0\x64\x83\x60\xfe\
-\xeb\x62\x30\x1f\x22\x62\x88\x71\x79\xb0\x9a\x02\xb8\xe3\xa4\xd3\
-\xa0\x72\x69\x9a\x99\xe3\x5c\x10\x44\x19\x2f\x13\x18\x08\xdb\x37\
-\xdb\x3b\x42\x37\x5e\x01\x33\x27\x42\x43\x2b\x4a\x23\x60\x15\xb8\
-\xb0\xb6\xea\xcd\x7b\x54\xd5\xa6\xd1\xfe\xf4\xd1\x01\x6c\x20\xfe\
-\x89\xff\x00\x3f\x0b\x06\x25\x89\x1f\x79\x79\xd3\x9e\x5c\x92\x54\
-\x01\x0a\xbd\x0e\x3c\x19\x2f\x1e\x30\x30\x03\x3b\x91\xaf\xc7\x8b\
-\x48\x81\x6a\x00\x01\x00\xcb\x02\xe5\x01\x6a\x05\xc7\x00\x06\x00\
-\x33\x00\xb2\x00\x02\x00\x2b\x01\xb0\x07\x2f\xb0\x00\xd6\xb1\x01\
-\x0d\xe9\xb1\x01\x0d\xe9\xb3\x03\x01\x00\x08\x2b\xb4\x06\x0f\x00\
-\x20\x04\x2b\xb0\x06\x2f\xb4\x03\x0f\x00\x20\x04\x2b\xb1\x08\x01\
-\x2b\x00\x30\x31\x13\x33\x03\x07\x15\x23\x27\xcb\x9f\x0c\x04\x7d\
-\x02\x05\xc7\xfd\xf1\xd1\x02\x02\x00\x00\x00\x00\x01\x00\xa4\xfe\
-\x00\x02\xaa\x06\x00\x00\x0c\x00\x13\x00\x01\xb0\x0d\x2f\xb0\x00\
-\xd6\xb1\x07\x0d\xe9\xb1\x0e\x01\x2b\x00\x30\x31\x13\x10\x01\x33\
-\x06\x07\x02\x13\x10\x01\x17\x23\x00\xa4\x01\x87\x7f\x73\x33\xc1\
-\x01\x01\x24\x42\x7f\xfe\x79\x02\x00\x02\xa2\x01\x5e\x7b\x56\xfe\
-\xbc\xfe\x15\xfd\x98\xfe\xae\x46\x01\x62\x00\x00\x01\x00\x71\xfe\
-\x00\x02\x77\x06\x00\x00\x11\x00\x13\x00\x01\xb0\x12\x2f\xb0\x06\
-\xd6\xb1\x0f\x0d\xe9\xb1\x13\x01\x2b\x00\x30\x31\x13\x3e\x03\x12\
-\x35\x34\x02\x2e\x02\x27\x33\x00\x11\x10\x01\x71\x35\x41\x75\x44\
-\x37\x3d\x44\x81\x2f\x35\x7d\x01\x89\xfe\x77\xfe\x00\x39\x4e\xbf\
-\xc4\x01\x40\xb6\xbe\x01\x4c\xc1\xc6\x36\x39\xfe\xa0\xfd\x62\xfd\
-\x5e\xfe\xa0\x00\x01\x00\x83\x02\x73\x03\x7b\x06\x00\x00\x47\x00\
-\x26\x00\x01\xb0\x48\x2f\xb0\x3b\xd6\xb0\x13\x32\xb1\x35\x0f\xe9\
-\xb0\x19\x32\xb1\x49\x01\x2b\xb1\x35\x3b\x11\x12\xb3\x11\x1b\x33\
-\x41\x24\x17\x39\x00\x30\x31\x13\x34\x36\x37\x36\x37\x35\x26\x27\
-\x2e\x01\x35\x34\x36\x33\x32\x1f\x01\x26\x27\x34\x36\x33\x32\x16\
-\x15\x14\x03\x36\x37\x36\x33\x32\x16\x15\x14\x06\x07\x06\x07\x15\
-\x16\x17\x1e\x01\x15\x14\x06\x23\x22\x2f\x01\x16\x17\x14\x06\x23\
-\x22\x26\x35\x3c\x01\x3e\x02\x37\x06\x07\x06\x23\x22\x26\x83\x31\
-\x83\x3b\x26\x2b\x42\x75\x33\x25\x1f\x19\x20\xc9\x10\x01\x2f\x19\
-\x17\x2f\x11\xdb\x11\x08\x08\x1f\x2b\x31\x83\x3b\x26\x2b\x42\x75\
-\x33\x25\x1f\x1d\x1a\xcb\x10\x01\x2d\x19\x1d\x2b\x04\x02\x07\x04\
-\xdd\x0d\x08\x0a\x1f\x2b\x03\x7b\x21\x25\x43\x1f\x14\x02\x17\x23\
-\x3d\x25\x21\x19\x2e\x14\x8d\xfc\x1c\x29\x23\x23\x25\x08\xfe\xec\
-\x9a\x05\x02\x2b\x1c\x21\x25\x43\x1f\x15\x02\x17\x22\x3d\x25\x21\
-\x19\x2d\x13\x8f\xfc\x1d\x27\x24\x29\x1c\x04\x15\x2b\x37\x69\x3b\
-\x9c\x04\x04\x2b\x00\x00\x00\x00\x01\x00\x71\xff\x56\x05\xc5\x04\
-\xaa\x00\x1e\x00\x5d\x00\xb0\x1b\x2f\xb0\x10\x33\xb1\x04\x07\xe9\
-\xb0\x0b\x32\xb2\x1b\x04\x0a\x2b\xb3\x40\x1b\x14\x09\x2b\xb2\x04\
-\x1b\x0a\x2b\xb3\x40\x04\x08\x09\x2b\x01\xb0\x1f\x2f\xb0\x19\xd6\
-\xb0\x05\x32\xb4\x12\x16\x00\x32\x04\x2b\xb0\x0a\x32\xb2\x12\x19\
-\x0a\x2b\xb3\x40\x12\x0e\x09\x2b\xb2\x19\x12\x0a\x2b\xb3\x40\x19\
-\x01\x09\x2b\xb1\x20\x01\x2b\x00\xb1\x04\x1b\x11\x12\xb0\x00\x39\
-\x30\x31\x12\x34\x3e\x01\x33\x21\x11\x34\x33\x32\x15\x11\x21\x32\
-\x15\x14\x23\x21\x11\x14\x23\x22\x26\x27\x26\x35\x11\x21\x06\x23\
-\x22\x71\x1c\x21\x23\x02\x0c\x3e\x3f\x02\x15\x56\x52\xfd\xe7\x3d\
-\x19\x21\x04\x02\xfd\xf0\x08\x09\x27\x01\xe7\x32\x1e\x08\x02\x0f\
-\x5c\x5c\xfd\xf1\x3f\x3d\xfd\xef\x5c\x1f\x10\x08\x25\x02\x11\x02\
-\x00\x00\x00\x00\x01\x00\xc5\xff\x00\x01\x71\x00\xac\x00\x07\x00\
-\x36\x00\xb0\x06\x2f\xb4\x01\x04\x00\x0a\x04\x2b\x01\xb0\x08\x2f\
-\xb0\x01\xd6\xb0\x06\x32\xb1\x02\x14\xe9\xb0\x04\x32\xb1\x03\x14\
-\xe9\xb4\x05\x16\x00\x14\x04\x2b\xb1\x09\x01\x2b\xb1\x05\x01\x11\
-\x12\xb0\x07\x39\x00\x30\x31\x33\x35\x33\x15\x07\x03\x23\x13\xc5\
-\xac\x02\x54\x56\x35\xac\x8f\x1d\xff\x00\x01\x00\x00\x00\x00\x00\
-\x01\x00\x14\x01\x8b\x02\x35\x02\x04\x00\x03\x00\x22\x00\xb0\x00\
-\x2f\xb1\x01\x06\xe9\xb1\x01\x06\xe9\x01\xb0\x04\x2f\xb1\x00\x01\
-\x2b\xb4\x03\x0e\x00\x08\x04\x2b\xb1\x05\x01\x2b\x00\x30\x31\x13\
-\x35\x21\x15\x14\x02\x21\x01\x8b\x79\x79\x00\x00\x01\x00\xc5\x00\
-\x00\x01\x71\x00\xac\x00\x03\x00\x29\x00\xb2\x00\x00\x00\x2b\xb1\
-\x01\x04\xe9\xb2\x00\x00\x00\x2b\xb1\x01\x04\xe9\x01\xb0\x04\x2f\
-\xb0\x00\xd6\xb1\x03\x14\xe9\xb1\x03\x14\xe9\xb1\x05\x01\x2b\x00\
-\x30\x31\x33\x35\x33\x15\xc5\xac\xac\xac\x00\x00\x01\x00\x73\xfe\
-\x00\x03\x8b\x05\xfe\x00\x0f\x00\x21\x00\x01\xb0\x10\x2f\xb0\x03\
-\xd6\xb4\x08\x0f\x00\x20\x04\x2b\xb2\x03\x08\x0a\x2b\xb3\x00\x03\
-\x00\x09\x2b\xb1\x11\x01\x2b\x00\x30\x31\x13\x34\x37\x01\x36\x33\
-\x32\x16\x15\x14\x07\x01\x06\x23\x22\x26\x73\x12\x02\x87\x14\x2e\
-\x19\x24\x0e\xfd\x75\x19\x29\x19\x24\xfe\x3f\x0e\x36\x07\x40\x3b\
-\x23\x1a\x0e\x2c\xf8\xb6\x3d\x24\x00\x00\x00\x00\x02\x00\x54\xff\
-\xd3\x03\xaa\x05\x6d\x00\x1d\x00\x33\x00\x36\x00\xb2\x18\x00\x00\
-\x2b\xb1\x24\x03\xe9\xb0\x2f\x2f\xb1\x09\x03\xe9\x01\xb0\x34\x2f\
-\xb0\x00\xd6\xb1\x1e\x0d\xe9\xb0\x1e\x10\xb1\x29\x01\x2b\xb1\x10\
-\x0d\xe9\xb1\x35\x01\x2b\xb1\x29\x1e\x11\x12\xb0\x09\x39\x00\x30\
-\x31\x13\x35\x34\x3e\x03\x37\x36\x33\x32\x1e\x03\x1d\x01\x14\x0e\
-\x03\x07\x06\x27\x22\x2e\x03\x37\x14\x1e\x03\x33\x32\x3e\x02\x3d\
-\x01\x34\x2e\x02\x22\x0e\x02\x15\x54\x06\x21\x39\x77\x52\x3f\x42\
-\x39\x6b\x77\x58\x39\x06\x21\x3b\x77\x52\x44\x3d\x39\x69\x79\x56\
-\x39\xa0\x25\x35\x4c\x41\x25\x2f\x52\x56\x33\x33\x58\x52\x5e\x52\
-\x56\x33\x02\x7b\x23\x50\x76\xc3\x89\x85\x1f\x19\x1f\x5c\x90\xfc\
-\xa3\x2b\x4e\x7b\xbd\x89\x81\x1f\x17\x01\x1d\x58\x8f\xfe\xa6\x89\
-\xcf\x75\x48\x16\x2b\x6c\xec\xaa\x79\x9c\xd4\x63\x25\x25\x63\xd7\
-\x99\x00\x00\x00\x01\x00\xb8\x00\x00\x03\x66\x05\x6d\x00\x0c\x00\
-\x57\x00\xb2\x08\x00\x00\x2b\xb1\x09\x06\xe9\xb0\x05\x32\xb0\x00\
-\x2f\xb1\x01\x06\xe9\xb2\x01\x00\x0a\x2b\xb3\x40\x01\x03\x09\x2b\
-\x01\xb0\x0d\x2f\xb0\x0a\xd6\xb1\x05\x0d\xe9\xb2\x05\x0a\x0a\x2b\
-\xb3\x40\x05\x07\x09\x2b\xb2\x0a\x05\x0a\x2b\xb3\x40\x0a\x01\x09\
-\x2b\xb1\x0e\x01\x2b\xb1\x05\x0a\x11\x12\xb0\x03\x39\x00\xb1\x01\
-\x00\x11\x12\xb0\x0b\x39\x30\x31\x13\x35\x32\x37\x33\x11\x21\x15\
-\x21\x35\x21\x11\x06\xb8\xf6\x91\x27\x01\x00\xfd\x5d\x01\x00\x7a\
-\x04\x6f\x76\x88\xfb\x0c\x79\x79\x04\x25\x2f\x00\x01\x00\x54\x00\
-\x00\x03\x98\x05\x6d\x00\x23\x00\x51\x00\xb2\x0f\x00\x00\x2b\xb1\
-\x0c\x0a\xe9\xb0\x23\x2f\xb0\x1a\x33\xb0\x1d\x2f\xb1\x02\x09\xe9\
-\x01\xb0\x24\x2f\xb0\x1a\xd6\xb1\x05\x14\xe9\xb0\x0d\x32\xb2\x1a\
-\x05\x0a\x2b\xb3\x40\x1a\x0f\x09\x2b\xb1\x25\x01\x2b\x00\xb1\x0c\
-\x0f\x11\x12\xb0\x10\x39\xb0\x23\x11\xb2\x0a\x13\x17\x39\x39\x39\
-\xb0\x1d\x12\xb1\x05\x00\x39\x39\x30\x31\x13\x12\x21\x32\x12\x15\
-\x14\x0e\x02\x07\x06\x01\x25\x15\x21\x35\x01\x3e\x07\x35\x34\x26\
-\x23\x22\x0e\x02\x0f\x01\x54\x64\x01\x29\xc5\xf2\x27\x71\x56\x68\
-\x37\xfe\xed\x02\xa0\xfc\xcc\x01\x0b\x10\x6d\x24\x58\x21\x3c\x14\
-\x15\xa6\x81\x46\x6d\x37\x23\x06\x08\x04\x1d\x01\x50\xfe\xfd\xb4\
-\x48\x76\x85\x52\x5c\x31\xfe\xfb\x02\x91\x85\x01\x08\x10\x63\x23\
-\x58\x2f\x50\x3d\x50\x29\x83\xb4\x3f\x5c\x5c\x21\x23\x00\x00\x00\
-\x01\x00\x54\xff\xd3\x03\xa8\x05\x6d\x00\x2a\x00\x52\x00\xb2\x29\
-\x00\x00\x2b\xb1\x05\x03\xe9\xb0\x0c\x2f\xb1\x0d\x03\xe9\xb0\x11\
-\x32\xb0\x17\x2f\xb1\x1e\x07\xe9\x01\xb0\x2b\x2f\xb0\x08\xd6\xb1\
-\x26\x0e\xe9\xb0\x14\x20\xd6\x11\xb1\x21\x13\xe9\xb1\x2c\x01\x2b\
-\x00\xb1\x0c\x05\x11\x12\xb2\x00\x01\x26\x39\x39\x39\xb0\x0d\x11\
-\xb0\x23\x39\xb0\x17\x12\xb2\x1b\x1c\x21\x39\x39\x39\x30\x31\x3f\
-\x01\x1e\x02\x33\x32\x36\x35\x34\x26\x2b\x01\x35\x3e\x02\x33\x3e\
-\x01\x35\x34\x26\x23\x22\x07\x06\x07\x27\x36\x37\x32\x16\x15\x14\
-\x07\x1e\x01\x15\x14\x06\x23\x22\x54\x16\x42\xb2\x67\x2f\x71\x8b\
-\x86\x81\x95\x31\x48\x14\x06\x62\x7e\x73\x5c\xb4\x69\x0c\x15\x49\
-\x8d\xfe\x9c\xd7\xe4\x8d\x90\xf8\xba\xfc\xa6\x7d\x58\x67\x12\xa4\
-\x7f\x77\xaa\x7e\x04\x07\x02\x12\xa0\x60\x56\x69\x9a\x12\x29\x70\
-\xdf\x01\xb9\x81\xdd\x81\x31\xc1\x72\xa6\xf8\x00\x02\x00\x37\x00\
-\x00\x03\xc5\x05\x3d\x00\x0d\x00\x15\x00\x54\x00\xb2\x0c\x00\x00\
-\x2b\xb0\x00\x2f\xb0\x09\x33\xb1\x0e\x03\xe9\xb0\x07\x32\xb2\x0e\
-\x00\x0a\x2b\xb3\x40\x0e\x06\x09\x2b\x01\xb0\x16\x2f\xb0\x0f\xd6\
-\xb0\x0c\x32\xb1\x07\x11\xe9\xb0\x0a\x32\xb2\x07\x0f\x0a\x2b\xb3\
-\x40\x07\x09\x09\x2b\xb2\x0f\x07\x0a\x2b\xb3\x40\x0f\x00\x09\x2b\
-\xb1\x17\x01\x2b\x00\xb1\x0e\x00\x11\x12\xb0\x02\x39\x30\x31\x13\
-\x30\x35\x34\x37\x01\x33\x11\x33\x15\x23\x11\x23\x11\x25\x21\x11\
-\x0e\x02\x07\x06\x37\x17\x01\xef\xbd\xcb\xcb\xa4\xfe\x81\x01\x8b\
-\x0c\x5c\x52\x8b\x2d\x01\x5e\x63\x19\x26\x03\x3d\xfc\x9e\x7d\xfe\
-\xa2\x01\x5e\x7d\x03\x17\x4c\xd1\x91\xf0\x4e\x00\x01\x00\x4e\xff\
-\xd3\x03\x98\x05\x3d\x00\x1b\x00\x6f\x00\xb2\x19\x00\x00\x2b\xb1\
-\x03\x03\xe9\xb0\x09\x2f\xb1\x13\x07\xe9\xb2\x09\x13\x0a\x2b\xb3\
-\x40\x09\x0c\x09\x2b\xb0\x10\x2f\xb1\x0d\x08\xe9\x01\xb0\x1c\x2f\
-\xb0\x0c\xd6\xb1\x11\x10\xe9\xb2\x11\x0c\x0a\x2b\xb3\x40\x11\x0f\
-\x09\x2b\xb0\x11\x10\xb1\x06\x01\x2b\xb1\x16\x0e\xe9\xb1\x1d\x01\
-\x2b\xb1\x11\x0c\x11\x12\xb0\x0b\x39\xb0\x06\x11\xb2\x03\x09\x19\
-\x39\x39\x39\x00\xb1\x09\x03\x11\x12\xb2\x00\x01\x16\x39\x39\x39\
-\xb0\x13\x11\xb0\x11\x39\x30\x31\x3f\x01\x16\x33\x32\x36\x35\x34\
-\x26\x23\x22\x07\x23\x11\x21\x15\x21\x11\x36\x17\x32\x12\x15\x14\
-\x00\x23\x22\x26\x4e\x45\x73\xcd\x66\xa6\x79\x58\x8b\x56\x8b\x02\
-\xb2\xfd\xe3\x68\x73\x9e\xe8\xfe\xf3\xb6\x75\xd0\x9c\x72\xbc\x9e\
-\xb4\xa8\xa2\xa4\x02\xf3\x83\xfe\x5d\x54\x01\xfe\xf8\xc0\xc5\xfe\
-\xf6\x6d\x00\x00\x02\x00\x56\xff\xd3\x03\xa8\x05\x6d\x00\x1c\x00\
-\x2d\x00\x69\x00\xb2\x17\x00\x00\x2b\xb1\x1f\x03\xe9\xb0\x28\x2f\
-\xb1\x0f\x03\xe9\xb0\x08\x2f\xb1\x03\x06\xe9\xb0\x03\x10\xb0\x05\
-\x20\xd6\x11\xb1\x06\x07\xe9\x01\xb0\x2e\x2f\xb0\x00\xd6\xb1\x2b\
-\x15\xe9\xb1\x0c\x1d\x32\x32\xb0\x2b\x10\xb1\x24\x01\x2b\xb1\x13\
-\x13\xe9\xb1\x2f\x01\x2b\xb1\x24\x2b\x11\x12\xb5\x08\x03\x0f\x1f\
-\x17\x2d\x24\x17\x39\xb0\x13\x11\xb1\x06\x05\x39\x39\x00\xb1\x28\
-\x1f\x11\x12\xb2\x00\x13\x0c\x39\x39\x39\x30\x31\x13\x10\x00\x33\
-\x32\x17\x15\x26\x23\x22\x0e\x01\x07\x3e\x01\x33\x32\x17\x16\x15\
-\x14\x07\x06\x23\x22\x2e\x02\x02\x17\x12\x33\x32\x36\x37\x36\x35\
-\x34\x27\x26\x23\x22\x06\x15\x14\x17\x56\x01\x37\xec\x6a\x71\x75\
-\x66\x77\xb0\x4a\x06\x3f\xb9\x62\x87\x58\x6d\x8d\x77\xa0\x39\x6d\
-\x77\x58\x39\xae\x27\xd7\x68\x79\x13\x0a\x39\x44\x77\x73\x93\x04\
-\x02\x96\x01\x33\x01\xa4\x29\x7b\x2b\xa6\xd3\x71\x50\x58\x7d\x98\
-\xd2\xe3\x96\x7f\x21\x5e\x95\x01\x05\x29\xfe\x8f\x8d\x56\x2d\x5c\
-\xb2\x5b\x6a\xba\x81\x12\x25\x00\x01\x00\x54\xff\xe9\x03\xa8\x05\
-\x3f\x00\x0a\x00\x3d\x00\xb2\x07\x00\x00\x2b\xb0\x00\x2f\xb1\x01\
-\x0b\xe9\x01\xb0\x0b\x2f\xb0\x07\xd6\xb1\x06\x14\xe9\xb2\x06\x07\
-\x0a\x2b\xb3\x40\x06\x03\x09\x2b\xb2\x07\x06\x0a\x2b\xb3\x40\x07\
-\x00\x09\x2b\xb1\x0c\x01\x2b\x00\xb1\x01\x00\x11\x12\xb0\x03\x39\
-\x30\x31\x13\x35\x05\x15\x06\x02\x11\x23\x10\x12\x13\x54\x03\x54\
-\xd9\xec\xae\xee\xfa\x04\xae\x91\x02\x85\xfa\xfd\x7d\xfe\xae\x01\
-\x44\x02\x75\x01\x0c\x00\x00\x00\x03\x00\x54\xff\xd3\x03\xa8\x05\
-\x6d\x00\x17\x00\x23\x00\x2f\x00\x72\x00\xb2\x15\x00\x00\x2b\xb1\
-\x1b\x03\xe9\xb0\x21\x2f\xb1\x27\x03\xe9\xb0\x2d\x2f\xb1\x09\x06\
-\xe9\x01\xb0\x30\x2f\xb0\x00\xd6\xb1\x18\x13\xe9\xb0\x24\x32\xb0\
-\x18\x10\xb1\x06\x0f\xe9\xb0\x06\x2f\xb0\x18\x10\xb1\x1e\x01\x2b\
-\xb0\x2a\x32\xb1\x12\x13\xe9\xb1\x0c\x0f\xe9\xb1\x31\x01\x2b\xb1\
-\x1e\x18\x11\x12\xb5\x09\x0f\x15\x03\x1b\x21\x24\x17\x39\x00\xb1\
-\x21\x1b\x11\x12\xb1\x12\x00\x39\x39\xb0\x27\x11\xb1\x0f\x03\x39\
-\x39\xb0\x2d\x12\xb1\x0c\x06\x39\x39\x30\x31\x13\x34\x36\x37\x2e\
-\x01\x35\x34\x36\x33\x32\x16\x15\x14\x06\x07\x1e\x01\x15\x14\x06\
-\x23\x22\x26\x37\x14\x16\x33\x32\x36\x35\x34\x26\x23\x22\x06\x13\
-\x14\x16\x33\x32\x36\x35\x34\x26\x23\x22\x06\x54\x8b\x92\x62\x9e\
-\xe5\xa8\xaa\xe3\x7f\x81\x71\xac\xf6\xb4\xb2\xf8\xa6\x8f\x75\x71\
-\x93\x91\x73\x64\xa0\x06\x8d\x6f\x73\x8d\x8d\x71\x73\x8b\x01\x71\
-\x73\xbc\x35\x1f\x9d\x75\x8f\xd8\xda\x8d\x60\xa2\x2f\x23\xba\x89\
-\xa4\xf8\xf6\xaa\x83\x9e\x9c\x87\x81\xa0\x92\x02\x00\x6d\x83\x86\
-\x6a\x6d\x83\x86\x00\x00\x00\x00\x02\x00\x56\xff\xd3\x03\xa8\x05\
-\x6d\x00\x20\x00\x35\x00\x67\x00\xb2\x0c\x00\x00\x2b\xb1\x18\x03\
-\xe9\xb0\x1d\x2f\xb1\x26\x03\xe9\xb0\x31\x2f\xb1\x04\x07\xe9\x01\
-\xb0\x36\x2f\xb0\x00\xd6\xb1\x21\x13\xe9\xb0\x21\x10\xb1\x29\x01\
-\x2b\xb0\x1b\x32\xb1\x09\x15\xe9\xb1\x37\x01\x2b\xb1\x21\x00\x11\
-\x12\xb1\x0e\x12\x39\x39\xb0\x29\x11\xb3\x0c\x04\x1a\x1d\x24\x17\
-\x39\x00\xb1\x18\x0c\x11\x12\xb0\x0e\x39\xb0\x1d\x11\xb0\x0f\x39\
-\xb1\x31\x26\x11\x12\xb2\x09\x00\x1b\x39\x39\x39\x30\x31\x13\x34\
-\x37\x36\x33\x32\x1e\x01\x12\x15\x10\x00\x23\x22\x27\x37\x1e\x07\
-\x33\x36\x12\x37\x06\x23\x22\x27\x26\x37\x14\x16\x17\x16\x33\x32\
-\x36\x35\x34\x27\x33\x2e\x03\x23\x22\x06\x07\x06\x56\x93\x79\xa2\
-\x48\x85\x85\x52\xfe\xd3\xd7\x93\x7e\x40\x02\x1f\x0a\x1d\x12\x21\
-\x1f\x26\x15\x8b\xb9\x10\x8f\xcb\x85\x58\x6f\xa8\x19\x28\x42\x71\
-\x73\x93\x02\x04\x04\x19\x33\x62\x42\x6a\x7d\x15\x0c\x03\x7b\xe1\
-\x96\x7b\x3c\x8d\xfe\xd7\xd1\xfe\xc5\xfe\x64\x5e\x6f\x02\x15\x08\
-\x10\x09\x0c\x06\x04\x02\x01\x06\xdb\xaa\x7d\x9c\xd7\x5e\x79\x3c\
-\x5e\xbb\x83\x23\x12\x3d\x71\x7d\x4a\x90\x54\x31\x00\x00\x00\x00\
-\x02\x00\xc5\x00\x00\x01\x71\x03\x8f\x00\x03\x00\x07\x00\x2f\x00\
-\xb2\x00\x00\x00\x2b\xb1\x01\x04\xe9\xb2\x05\x01\x00\x2b\xb1\x04\
-\x04\xe9\x01\xb0\x08\x2f\xb0\x00\xd6\xb0\x04\x32\xb1\x03\x14\xe9\
-\xb0\x06\x32\xb1\x03\x14\xe9\xb1\x09\x01\x2b\x00\x30\x31\x33\x35\
-\x33\x15\x03\x35\x33\x15\xc5\xac\xac\xac\xac\xac\x02\xe3\xac\xac\
-\x00\x00\x00\x00\x02\x00\xc5\xff\x00\x01\x71\x03\x8f\x00\x07\x00\
-\x0b\x00\x39\x00\xb2\x09\x01\x00\x2b\xb1\x08\x04\xe9\x01\xb0\x0c\
-\x2f\xb0\x01\xd6\xb1\x06\x08\x32\x32\xb1\x02\x14\xe9\xb1\x04\x0a\
-\x32\x32\xb1\x03\x14\xe9\xb4\x05\x16\x00\x14\x04\x2b\xb1\x0d\x01\
-\x2b\xb1\x05\x01\x11\x12\xb0\x07\x39\x00\x30\x31\x33\x35\x33\x15\
-\x07\x03\x23\x13\x03\x35\x33\x15\xc5\xac\x02\x54\x56\x35\x35\xac\
-\xac\x8f\x1d\xff\x00\x01\x00\x02\xe3\xac\xac\x00\x01\x00\xaa\xff\
-\x89\x05\x8b\x04\x77\x00\x21\x00\x00\x13\x3e\x01\x37\x01\x36\x37\
-\x32\x16\x15\x14\x0e\x03\x0f\x01\x09\x01\x17\x1e\x04\x15\x14\x06\
-\x23\x22\x27\x01\x2e\x01\xaa\x04\x17\x2b\x04\x35\x1d\x0c\x1b\x22\
-\x08\x06\x17\x06\x0c\x0e\xfc\x2f\x03\xd1\x0e\x0c\x06\x17\x06\x08\
-\x23\x1a\x0e\x42\xfb\xf2\x2b\x17\x02\x00\x19\x1a\x17\x02\x20\x0c\
-\x01\x25\x19\x0a\x14\x0d\x0e\x04\x08\x06\xfe\x12\xfe\x12\x06\x08\
-\x04\x0e\x0d\x14\x0a\x19\x25\x21\x02\x0c\x17\x16\x00\x00\x00\x00\
-\x02\x00\x73\x00\xf4\x05\xc5\x03\x0c\x00\x0b\x00\x19\x00\x1a\x00\
-\xb0\x0b\x2f\xb1\x05\x03\xe9\xb0\x16\x2f\xb1\x0e\x03\xe9\x01\xb0\
-\x1a\x2f\xb1\x1b\x01\x2b\x00\x30\x31\x36\x34\x33\x32\x16\x33\x21\
-\x32\x15\x14\x23\x21\x03\x34\x33\x21\x32\x15\x14\x0e\x01\x23\x21\
-\x22\x2e\x01\x73\x49\x04\x0d\x04\x04\xa6\x4e\x54\xfb\x52\x50\x52\
-\x04\xae\x52\x09\x24\x1f\xfb\x45\x1f\x24\x08\xf4\x7f\x02\x3e\x3f\
-\x01\xd9\x3f\x3f\x0c\x17\x1b\x1b\x17\x00\x00\x00\x01\x00\xaa\xff\
-\x89\x05\x8b\x04\x77\x00\x21\x00\x00\x17\x34\x3e\x04\x37\x09\x01\
-\x2e\x05\x35\x34\x36\x33\x32\x17\x01\x1e\x01\x17\x0e\x01\x07\x01\
-\x06\x07\x22\x26\xaa\x08\x08\x15\x08\x19\x02\x03\xd1\xfc\x2f\x02\
-\x19\x08\x15\x08\x08\x25\x1a\x0e\x42\x04\x0f\x29\x16\x04\x04\x14\
-\x2b\xfb\xcc\x21\x0a\x1b\x24\x39\x0a\x14\x0d\x0e\x04\x0c\x02\x01\
-\xee\x01\xee\x02\x0c\x04\x0e\x0d\x14\x0a\x19\x25\x21\xfd\xf4\x14\
-\x1b\x1b\x1b\x18\x17\xfd\xe2\x0e\x01\x25\x00\x00\x02\x00\x71\x00\
-\x00\x03\x54\x05\xdd\x00\x1f\x00\x23\x00\x62\x00\xb2\x20\x00\x00\
-\x2b\xb1\x21\x04\xe9\xb0\x1d\x2f\xb1\x02\x03\xe9\x01\xb0\x24\x2f\
-\xb0\x12\xd6\xb1\x11\x0f\xe9\xb3\x3c\x12\x20\x0e\x2b\xb1\x23\x14\
-\xe9\xb0\x11\x10\xb1\x1b\x01\x2b\xb1\x07\x0d\xe9\xb1\x25\x01\x2b\
-\xb1\x11\x12\x11\x12\xb1\x02\x1d\x39\x39\xb1\x1b\x23\x11\x12\xb0\
-\x18\x39\xb0\x07\x11\xb0\x0d\x39\x00\xb1\x1d\x21\x11\x12\xb2\x07\
-\x11\x1f\x39\x39\x39\xb0\x02\x11\xb0\x00\x39\x30\x31\x13\x36\x33\
-\x32\x1e\x02\x15\x14\x0e\x04\x07\x06\x03\x15\x23\x35\x34\x3e\x03\
-\x37\x36\x35\x34\x23\x22\x07\x13\x35\x33\x15\x71\x9e\xba\x73\xa5\
-\x50\x23\x10\x19\x25\x18\x23\x04\xbc\x01\x89\x2b\x4a\x3f\x4e\x08\
-\x29\xeb\xa4\x85\xd1\xac\x05\x6a\x73\x3f\x6b\x68\x3a\x2b\x4b\x34\
-\x33\x18\x1f\x04\xb6\xfe\xf5\x52\x42\x77\xc4\x85\x54\x4c\x08\x37\
-\x4c\xcd\x77\xfb\x17\xac\xac\x00\x02\x00\x71\xff\xe9\x04\xe1\x05\
-\xdd\x00\x26\x00\x31\x00\x78\x00\xb2\x24\x00\x00\x2b\xb1\x1e\x03\
-\xe9\xb2\x1e\x24\x0a\x2b\xb3\x40\x1e\x21\x09\x2b\xb0\x0e\x2f\xb1\
-\x2a\x03\xe9\xb0\x2f\x2f\xb1\x14\x03\xe9\xb0\x18\x2f\xb1\x03\x03\
-\xe9\x01\xb0\x32\x2f\xb0\x00\xd6\xb1\x1b\x11\xe9\xb0\x1b\x10\xb1\
-\x11\x01\x2b\xb1\x27\x11\xe9\xb0\x27\x10\xb1\x2d\x01\x2b\xb1\x0b\
-\x11\xe9\xb0\x22\x32\xb1\x33\x01\x2b\xb1\x2d\x27\x11\x12\xb6\x03\
-\x14\x0e\x18\x1e\x24\x16\x24\x17\x39\x00\xb1\x2f\x2a\x11\x12\xb3\
-\x0b\x00\x1b\x11\x24\x17\x39\xb0\x14\x11\xb0\x16\x39\x30\x31\x13\
-\x10\x00\x21\x32\x1e\x05\x15\x14\x02\x23\x22\x02\x35\x34\x12\x33\
-\x32\x17\x26\x23\x22\x00\x11\x10\x00\x33\x32\x36\x3b\x01\x06\x21\
-\x20\x00\x01\x14\x16\x33\x32\x36\x10\x26\x23\x22\x06\x71\x01\x95\
-\x01\x0e\x5e\x96\x5e\x44\x23\x12\x02\xe1\x9a\x9c\xde\xdd\x9d\x4c\
-\x62\x4c\xb1\xcb\xfe\xbe\x01\x35\xe2\x73\xd6\x0d\x6a\xb4\xfe\xee\
-\xfe\xec\xfe\x6a\x02\x14\x89\x5a\x54\x8c\x8a\x5a\x56\x89\x02\xe5\
-\x01\x42\x01\xb6\x3f\x5a\x92\x79\xa8\x5e\x41\xe1\xfe\xf1\x01\x17\
-\xca\xc7\x01\x1d\x38\xd1\xfe\x98\xfe\xeb\xfe\xf8\xfe\x8d\x4c\xcb\
-\x01\xb8\x01\x44\x9e\xc8\xc5\x01\x3b\xc9\xc7\x00\x02\x00\x37\x00\
-\x00\x05\x19\x05\x8d\x00\x07\x00\x0c\x00\x2c\x00\xb2\x00\x00\x00\
-\x2b\xb0\x03\x33\xb2\x01\x02\x00\x2b\xb4\x06\x08\x00\x01\x0d\x2b\
-\xb1\x06\x05\xe9\x01\xb0\x0d\x2f\xb1\x0e\x01\x2b\x00\xb1\x01\x08\
-\x11\x12\xb0\x0b\x39\x30\x31\x33\x01\x33\x01\x23\x03\x21\x03\x13\
-\x21\x02\x27\x06\x37\x02\x17\xb6\x02\x15\xbd\x9e\xfd\xaf\x9c\xc7\
-\x01\xfb\xf2\x0b\x1b\x05\x8d\xfa\x73\x01\xa2\xfe\x5e\x02\x14\x02\
-\x9e\x4c\x7d\x00\x03\x00\xc5\x00\x00\x04\xe1\x05\x8d\x00\x12\x00\
-\x1e\x00\x28\x00\x63\x00\xb2\x00\x00\x00\x2b\xb1\x13\x05\xe9\xb2\
-\x01\x02\x00\x2b\xb1\x27\x05\xe9\xb4\x1f\x1d\x00\x01\x0d\x2b\xb1\
-\x1f\x03\xe9\x01\xb0\x29\x2f\xb0\x00\xd6\xb1\x13\x14\xe9\xb0\x1f\
-\x32\xb0\x13\x10\xb1\x17\x01\x2b\xb1\x0d\x13\xe9\xb0\x23\x20\xd6\
-\x11\xb1\x07\x0d\xe9\xb1\x2a\x01\x2b\xb1\x23\x13\x11\x12\xb0\x0a\
-\x39\x00\xb1\x1d\x13\x11\x12\xb0\x0d\x39\xb0\x1f\x11\xb0\x0a\x39\
-\xb0\x27\x12\xb0\x07\x39\x30\x31\x33\x11\x21\x32\x1e\x02\x15\x14\
-\x06\x07\x1e\x01\x15\x14\x04\x07\x06\x23\x25\x21\x32\x36\x35\x34\
-\x26\x27\x26\x2b\x01\x07\x35\x33\x32\x36\x35\x34\x26\x2b\x01\x07\
-\xc5\x01\xc6\x8d\xdc\x79\x3b\xb0\xa8\xa4\xed\xfe\xfc\xb4\x23\x45\
-\xfe\xb0\x01\x22\xd1\xd5\xd5\x95\x12\x57\xf3\x02\xf5\xc1\xdf\xd3\
-\xd7\xe9\x02\x05\x8d\x45\x6f\x77\x39\x66\xb1\x2b\x1b\xc2\x89\x96\
-\xd4\x13\x04\x73\xac\x64\x71\x9f\x0f\x02\x4c\xcb\xa0\x64\x5a\x9a\
-\x48\x00\x00\x00\x01\x00\x87\xff\xd3\x04\xb4\x05\xba\x00\x22\x00\
-\x3d\x00\xb2\x20\x00\x00\x2b\xb1\x13\x08\xe9\xb2\x05\x02\x00\x2b\
-\xb1\x0d\x08\xe9\x01\xb0\x23\x2f\xb0\x00\xd6\xb1\x10\x0e\xe9\xb1\
-\x24\x01\x2b\x00\xb1\x13\x20\x11\x12\xb0\x1d\x39\xb0\x0d\x11\xb2\
-\x00\x0a\x1c\x39\x39\x39\xb0\x05\x12\xb0\x09\x39\x30\x31\x13\x34\
-\x12\x3e\x01\x33\x32\x1e\x01\x17\x07\x2e\x01\x23\x22\x00\x11\x10\
-\x00\x33\x32\x3e\x06\x37\x17\x0e\x01\x23\x20\x00\x87\x75\xbc\xe2\
-\x6e\x50\x5c\x94\x56\x1f\x5c\x92\x6e\xcd\xfe\xe9\x01\x19\xd1\x27\
-\x46\x31\x3b\x1d\x37\x0e\x3e\x06\x0c\x6f\x9f\x7f\xfe\xdb\xfe\x85\
-\x02\xc7\xa8\x01\x22\xbd\x6c\x06\x1e\x21\xaa\x37\x35\xfe\x94\xfe\
-\xfc\xfe\xfa\xfe\x95\x06\x06\x15\x08\x21\x08\x27\x04\x8f\x42\x2f\
-\x01\xc3\x00\x00\x02\x00\xc3\x00\x00\x05\x54\x05\x8d\x00\x0c\x00\
-\x16\x00\x38\x00\xb2\x00\x00\x00\x2b\xb1\x0d\x05\xe9\xb2\x01\x02\
-\x00\x2b\xb1\x16\x05\xe9\x01\xb0\x17\x2f\xb0\x00\xd6\xb1\x0d\x15\
-\xe9\xb0\x0d\x10\xb1\x12\x01\x2b\xb1\x07\x15\xe9\xb1\x18\x01\x2b\
-\x00\xb1\x16\x0d\x11\x12\xb0\x07\x39\x30\x31\x33\x11\x21\x32\x17\
-\x16\x12\x15\x10\x00\x07\x06\x23\x25\x21\x20\x37\x36\x35\x10\x00\
-\x23\x21\xc3\x01\xf7\xcd\x94\x96\xa3\xfe\xb0\xe3\x21\x42\xfe\xb7\
-\x01\x25\x01\x00\x8f\x79\xfe\xef\xf7\xfe\xdb\x05\x8d\x60\x62\xfe\
-\xae\xbd\xfe\xe3\xfe\x80\x1b\x04\x73\xbc\x9e\xed\x01\x04\x01\x5d\
-\x00\x00\x00\x00\x01\x00\xc1\x00\x00\x04\x71\x05\x87\x00\x12\x00\
-\x4a\x00\xb2\x00\x00\x00\x2b\xb1\x0e\x0b\xe9\xb2\x01\x02\x00\x2b\
-\xb1\x06\x08\xe9\xb4\x08\x0b\x00\x01\x0d\x2b\xb1\x08\x03\xe9\x01\
-\xb0\x13\x2f\xb0\x00\xd6\xb1\x0c\x0e\xe9\xb0\x07\x32\xb2\x0c\x00\
-\x0a\x2b\xb3\x40\x0c\x12\x09\x2b\xb3\x40\x0c\x02\x09\x2b\xb3\x40\
-\x0c\x0a\x09\x2b\xb1\x14\x01\x2b\x00\x30\x31\x33\x11\x21\x15\x23\
-\x27\x21\x27\x11\x21\x15\x21\x11\x33\x37\x21\x37\x33\x15\xc1\x03\
-\x93\x75\x33\xfe\x15\x48\x02\xa4\xfd\x5c\xae\x31\x01\x8d\x2d\x5f\
-\x05\x87\x87\x02\x02\xfe\x1b\x7d\xfd\xed\x02\x02\x93\x00\x00\x00\
-\x01\x00\xc1\x00\x00\x04\x37\x05\x87\x00\x0c\x00\x40\x00\xb2\x00\
-\x00\x00\x2b\xb2\x01\x02\x00\x2b\xb1\x06\x08\xe9\xb4\x0b\x08\x00\
-\x01\x0d\x2b\xb1\x0b\x03\xe9\x01\xb0\x0d\x2f\xb0\x00\xd6\xb1\x0c\
-\x0e\xe9\xb0\x07\x32\xb2\x0c\x00\x0a\x2b\xb3\x40\x0c\x02\x09\x2b\
-\xb3\x40\x0c\x0a\x09\x2b\xb1\x0e\x01\x2b\x00\x30\x31\x33\x11\x21\
-\x15\x23\x27\x21\x27\x11\x21\x15\x21\x11\xc1\x03\x76\x70\x31\xfe\
-\x24\x41\x02\x68\xfd\x98\x05\x87\x87\x02\x02\xfd\xfe\x7d\xfd\x7b\
-\x00\x00\x00\x00\x01\x00\x87\xff\xd3\x04\xcb\x05\xba\x00\x1b\x00\
-\x74\x00\xb2\x19\x00\x00\x2b\xb1\x10\x08\xe9\xb2\x03\x02\x00\x2b\
-\xb1\x0a\x08\xe9\xb4\x14\x15\x19\x03\x0d\x2b\xb1\x14\x03\xe9\x01\
-\xb0\x1c\x2f\xb0\x00\xd6\xb1\x0d\x0e\xe9\xb0\x0d\x10\xb1\x12\x01\
-\x2b\xb1\x17\x0d\xe9\xb2\x12\x17\x0a\x2b\xb3\x40\x12\x14\x09\x2b\
-\xb1\x1d\x01\x2b\xb1\x12\x0d\x11\x12\xb2\x0a\x03\x19\x39\x39\x39\
-\xb0\x17\x11\xb1\x06\x05\x39\x39\x00\xb1\x10\x19\x11\x12\xb0\x17\
-\x39\xb1\x0a\x15\x11\x12\xb2\x00\x06\x0d\x39\x39\x39\xb0\x03\x11\
-\xb0\x05\x39\x30\x31\x13\x10\x00\x21\x32\x17\x07\x2e\x02\x23\x22\
-\x00\x15\x10\x00\x33\x32\x37\x11\x21\x35\x21\x11\x06\x23\x20\x00\
-\x87\x01\x83\x01\x17\xd5\xc4\x1e\x3b\x4f\x95\x58\xd3\xfe\xed\x01\
-\x19\xcb\x6a\x9e\xfe\xf0\x01\xb0\xcd\xdd\xfe\xe7\xfe\x7f\x02\xc7\
-\x01\x3b\x01\xb8\x62\xaa\x2d\x2f\x2d\xfe\x8e\xfc\xfe\xfa\xfe\x93\
-\x2b\x01\x64\x7f\xfd\xd1\x62\x01\xbb\x00\x00\x00\x01\x00\xc1\x00\
-\x00\x04\xe9\x05\x8d\x00\x0b\x00\x3f\x00\xb2\x00\x00\x00\x2b\xb0\
-\x07\x33\xb2\x01\x02\x00\x2b\xb0\x05\x33\xb4\x03\x0a\x00\x01\x0d\
-\x2b\xb1\x03\x03\xe9\x01\xb0\x0c\x2f\xb0\x00\xd6\xb1\x0b\x0e\xe9\
-\xb0\x02\x32\xb0\x0b\x10\xb1\x08\x01\x2b\xb0\x04\x32\xb1\x07\x0e\
-\xe9\xb1\x0d\x01\x2b\x00\x30\x31\x33\x11\x33\x11\x21\x11\x33\x11\
-\x23\x11\x21\x11\xc1\xb8\x02\xb8\xb8\xb8\xfd\x48\x05\x8d\xfd\x96\
-\x02\x6a\xfa\x73\x02\xa4\xfd\x5c\x00\x00\x00\x00\x01\x00\xc1\x00\
-\x00\x01\x79\x05\x8d\x00\x03\x00\x21\x00\xb2\x00\x00\x00\x2b\xb2\
-\x01\x02\x00\x2b\x01\xb0\x04\x2f\xb0\x00\xd6\xb1\x03\x0e\xe9\xb1\
-\x03\x0e\xe9\xb1\x05\x01\x2b\x00\x30\x31\x33\x11\x33\x11\xc1\xb8\
-\x05\x8d\xfa\x73\x00\x00\x00\x00\x01\x00\x54\xff\xd3\x03\x1b\x05\
-\x8d\x00\x11\x00\x2f\x00\xb2\x10\x00\x00\x2b\xb1\x05\x03\xe9\xb2\
-\x09\x02\x00\x2b\x01\xb0\x12\x2f\xb0\x08\xd6\xb1\x0b\x15\xe9\xb1\
-\x13\x01\x2b\x00\xb1\x05\x10\x11\x12\xb0\x00\x39\xb0\x09\x11\xb0\
-\x01\x39\x30\x31\x3f\x01\x1e\x02\x33\x32\x36\x35\x11\x33\x11\x14\
-\x0e\x02\x23\x22\x54\x1b\x25\x22\x7d\x44\x66\x8b\xb3\x40\x6e\x77\
-\x44\xb4\x29\x9a\x21\x1d\x33\x6c\x84\x04\x4b\xfb\xb0\x68\x96\x4b\
-\x21\x00\x00\x00\x01\x00\xc3\x00\x00\x05\x35\x05\x8d\x00\x0c\x00\
-\x30\x00\xb2\x00\x00\x00\x2b\xb0\x08\x33\xb2\x01\x02\x00\x2b\xb0\
-\x04\x33\x01\xb0\x0d\x2f\xb0\x00\xd6\xb1\x0c\x15\xe9\xb0\x02\x32\
-\xb1\x0e\x01\x2b\x00\xb1\x01\x00\x11\x12\xb1\x03\x0a\x39\x39\x30\
-\x31\x33\x11\x33\x11\x01\x33\x01\x15\x01\x23\x09\x01\x11\xc3\xb0\
-\x02\xe7\xbf\xfd\xdb\x02\x41\xc0\xfe\x0e\xfe\xf0\x05\x8d\xfd\x09\
-\x02\xf7\xfd\xcf\x02\xfc\xa6\x02\xe7\xfe\xec\xfe\x2d\x00\x00\x00\
-\x01\x00\xc1\x00\x00\x03\xfe\x05\x8d\x00\x06\x00\x2c\x00\xb2\x00\
-\x00\x00\x2b\xb1\x03\x08\xe9\xb2\x01\x02\x00\x2b\x01\xb0\x07\x2f\
-\xb0\x00\xd6\xb1\x03\x0e\xe9\xb2\x03\x00\x0a\x2b\xb3\x40\x03\x06\
-\x09\x2b\xb1\x08\x01\x2b\x00\x30\x31\x33\x11\x33\x11\x21\x37\x15\
-\xc1\xb8\x01\x8f\xf6\x05\x8d\xfa\xf8\x02\x87\x00\x01\x00\xcd\x00\
-\x00\x06\x33\x05\x8d\x00\x16\x00\x42\x00\xb2\x00\x00\x00\x2b\xb0\
-\x0b\x33\xb2\x01\x02\x00\x2b\xb0\x09\x33\x01\xb0\x17\x2f\xb0\x00\
-\xd6\xb1\x16\x0d\xe9\xb0\x16\x10\xb1\x0c\x01\x2b\xb1\x0b\x0d\xe9\
-\xb1\x18\x01\x2b\xb1\x0c\x16\x11\x12\xb1\x02\x09\x39\x39\x00\xb1\
-\x01\x00\x11\x12\xb1\x05\x0e\x39\x39\x30\x31\x33\x11\x33\x01\x12\
-\x17\x33\x36\x13\x01\x33\x11\x23\x11\x27\x07\x03\x01\x23\x01\x02\
-\x27\x11\xcd\xe9\x01\x3c\x83\x0a\x02\x0a\x81\x01\x3c\xeb\xa0\x02\
-\x14\x7b\xfe\xc5\x94\xfe\xcd\x83\x10\x05\x8d\xfc\xcb\xfe\x9c\x38\
-\x48\x01\x52\x03\x37\xfa\x73\x04\xbc\x42\x4c\xfe\xb0\xfc\xcb\x03\
-\x1d\x01\x64\x50\xfb\x02\x00\x00\x01\x00\xc3\x00\x00\x04\xe3\x05\
-\x8d\x00\x0b\x00\x42\x00\xb2\x00\x00\x00\x2b\xb0\x07\x33\xb2\x01\
-\x02\x00\x2b\xb0\x05\x33\x01\xb0\x0c\x2f\xb0\x00\xd6\xb1\x0b\x0d\
-\xe9\xb0\x0b\x10\xb1\x04\x01\x2b\xb1\x07\x0d\xe9\xb1\x0d\x01\x2b\
-\xb1\x04\x0b\x11\x12\xb1\x02\x08\x39\x39\x00\xb1\x01\x00\x11\x12\
-\xb1\x04\x0a\x39\x39\x30\x31\x33\x11\x21\x01\x17\x11\x33\x11\x21\
-\x01\x27\x11\xc3\x01\x00\x02\x31\x50\x9f\xff\x00\xfd\xcf\x50\x05\
-\x8d\xfb\xa6\xa4\x04\xfe\xfa\x73\x04\x5a\xa4\xfb\x02\x00\x00\x00\
-\x02\x00\x71\xff\xd3\x05\x6f\x05\xba\x00\x0b\x00\x16\x00\x44\x00\
-\xb2\x09\x00\x00\x2b\xb1\x0f\x08\xe9\xb2\x03\x02\x00\x2b\xb1\x15\
-\x08\xe9\x01\xb0\x17\x2f\xb0\x00\xd6\xb1\x0d\x0e\xe9\xb0\x0d\x10\
-\xb1\x12\x01\x2b\xb1\x06\x0e\xe9\xb1\x18\x01\x2b\xb1\x12\x0d\x11\
-\x12\xb1\x03\x09\x39\x39\x00\xb1\x15\x0f\x11\x12\xb1\x06\x00\x39\
-\x39\x30\x31\x13\x10\x00\x21\x20\x00\x11\x10\x00\x21\x20\x00\x12\
-\x10\x12\x33\x32\x00\x11\x10\x00\x23\x22\x71\x01\x7b\x01\x06\x01\
-\x02\x01\x7b\xfe\x81\xff\x00\xfe\xfe\xfe\x83\xb8\xfe\xc9\xc3\x01\
-\x05\xfe\xf2\xba\xb8\x02\xc3\x01\x3d\x01\xba\xfe\x46\xfe\xc3\xfe\
-\xbe\xfe\x52\x01\xb1\x02\x68\xfd\xe7\xfe\x85\x01\x77\x01\x10\x01\
-\x0c\x01\x4c\x00\x02\x00\xc3\x00\x00\x04\xa8\x05\x8d\x00\x0f\x00\
-\x1c\x00\x4a\x00\xb2\x00\x00\x00\x2b\xb2\x01\x02\x00\x2b\xb1\x1c\
-\x05\xe9\xb4\x0e\x10\x00\x01\x0d\x2b\xb1\x0e\x06\xe9\x01\xb0\x1d\
-\x2f\xb0\x01\xd6\xb1\x10\x15\xe9\xb0\x0e\x32\xb0\x10\x10\xb1\x16\
-\x01\x2b\xb1\x07\x13\xe9\xb1\x1e\x01\x2b\xb1\x16\x10\x11\x12\xb0\
-\x0a\x39\x00\xb1\x1c\x10\x11\x12\xb0\x07\x39\x30\x31\x33\x11\x21\
-\x32\x17\x1e\x01\x15\x14\x00\x23\x22\x26\x2b\x01\x11\x03\x21\x32\
-\x3e\x02\x35\x34\x2e\x02\x23\x21\xc3\x01\xe3\xbc\x7f\x5e\x69\xfe\
-\xf8\xf2\x0a\x2d\x0d\xef\x06\x01\x10\x6a\xa0\x4e\x25\x21\x4b\xa0\
-\x71\xfe\xf0\x05\x8d\x50\x3b\xac\x64\xa0\xfe\xfc\x02\xfd\xb0\x02\
-\xc7\x39\x60\x61\x31\x2d\x5c\x62\x3e\x00\x00\x00\x02\x00\x71\xff\
-\x00\x05\x71\x05\xba\x00\x0f\x00\x21\x00\x53\x00\xb2\x0d\x00\x00\
-\x2b\xb1\x13\x08\xe9\xb2\x03\x02\x00\x2b\xb1\x1f\x08\xe9\x01\xb0\
-\x22\x2f\xb0\x00\xd6\xb1\x10\x15\xe9\xb0\x10\x10\xb1\x1b\x01\x2b\
-\xb1\x06\x15\xe9\xb1\x23\x01\x2b\xb1\x1b\x10\x11\x12\xb3\x03\x0a\
-\x0d\x08\x24\x17\x39\xb0\x06\x11\xb0\x09\x39\x00\xb1\x13\x0d\x11\
-\x12\xb0\x08\x39\xb0\x1f\x11\xb1\x06\x00\x39\x39\x30\x31\x13\x10\
-\x00\x21\x20\x00\x11\x10\x05\x13\x23\x27\x06\x23\x20\x00\x13\x10\
-\x00\x33\x32\x37\x03\x33\x17\x33\x36\x11\x10\x00\x2b\x01\x06\x00\
-\x71\x01\x7f\x01\x00\x01\x04\x01\x7d\xfe\xd3\xf3\xd7\xac\x6d\x57\
-\xfe\xfa\xfe\x87\xb2\x01\x0a\xc5\x21\x51\xce\xb6\xa0\x02\xd0\xfe\
-\xf4\xc4\x02\xc7\xfe\xfe\x02\xc3\x01\x46\x01\xb1\xfe\x46\xfe\xc3\
-\xfe\x73\xf2\xfe\xbc\xf6\x23\x01\xb5\x01\x39\xfe\xf8\xfe\x9d\x12\
-\x01\x27\xd7\xbb\x01\x4b\x01\x13\x01\x66\x04\xfe\x98\x00\x00\x00\
-\x02\x00\xc3\x00\x00\x04\xf0\x05\x8d\x00\x0f\x00\x1a\x00\x5b\x00\
-\xb2\x00\x00\x00\x2b\xb0\x0b\x33\xb2\x01\x02\x00\x2b\xb1\x1a\x05\
-\xe9\xb4\x0e\x10\x00\x01\x0d\x2b\xb1\x0e\x03\xe9\x01\xb0\x1b\x2f\
-\xb0\x00\xd6\xb1\x0f\x15\xe9\xb0\x10\x32\xb0\x0f\x10\xb1\x14\x01\
-\x2b\xb1\x07\x13\xe9\xb1\x1c\x01\x2b\xb1\x14\x0f\x11\x12\xb1\x0d\
-\x0a\x39\x39\xb0\x07\x11\xb0\x0c\x39\x00\xb1\x10\x0e\x11\x12\xb0\
-\x0a\x39\xb0\x1a\x11\xb0\x07\x39\x30\x31\x33\x11\x21\x32\x1e\x02\
-\x15\x14\x06\x07\x01\x23\x01\x21\x19\x01\x21\x32\x36\x35\x34\x2e\
-\x02\x23\x21\xc3\x01\xce\x93\xe0\x79\x39\xb4\xaa\x01\x98\xb9\xfe\
-\x81\xfe\xbd\x01\x0e\xd7\xb6\x24\x52\xa2\x6f\xfe\xec\x05\x8d\x4b\
-\x79\x7d\x3c\x77\xcc\x31\xfd\x64\x02\x87\xfd\x79\x03\x06\xa2\x66\
-\x2d\x56\x54\x36\x00\x00\x00\x00\x01\x00\x5a\xff\xd3\x03\xfe\x05\
-\xba\x00\x27\x00\xae\x00\xb2\x26\x00\x00\x2b\xb1\x03\x0a\xe9\xb2\
-\x11\x02\x00\x2b\xb1\x17\x09\xe9\x01\xb0\x28\x2f\xb0\x0e\xd6\xb1\
-\x1a\x0d\xe9\xb0\x1a\x10\xb1\x06\x01\x2b\xb1\x23\x13\xe9\xb1\x29\
-\x01\x2b\xb0\x36\x1a\xba\xee\xec\xc2\x52\x00\x15\x2b\x0a\x0e\xb0\
-\x0b\x10\xb0\x09\xc0\xb1\x1d\x04\xf9\xb0\x1f\xc0\xb3\x1e\x1d\x1f\
-\x13\x2b\xb2\x1e\x1d\x1f\x20\x8a\x20\x8a\x23\x06\x0e\x11\x12\x39\
-\x00\xb4\x09\x0b\x1d\x1e\x1f\x2e\x2e\x2e\x2e\x2e\x01\xb4\x09\x0b\
-\x1d\x1e\x1f\x2e\x2e\x2e\x2e\x2e\xb0\x40\x1a\x01\xb1\x1a\x0e\x11\
-\x12\xb0\x01\x39\xb0\x06\x11\xb3\x03\x11\x17\x26\x24\x17\x39\xb0\
-\x23\x12\xb1\x13\x14\x39\x39\x00\xb1\x03\x26\x11\x12\xb0\x00\x39\
-\xb0\x17\x11\xb3\x01\x0e\x14\x23\x24\x17\x39\xb0\x11\x12\xb0\x13\
-\x39\x30\x31\x3f\x01\x16\x33\x32\x36\x35\x34\x26\x27\x26\x27\x2e\
-\x01\x35\x34\x24\x33\x32\x17\x07\x2e\x01\x23\x22\x06\x15\x14\x16\
-\x17\x1e\x01\x17\x1e\x01\x15\x14\x00\x23\x22\x5a\x1f\xd7\xdf\x85\
-\xa6\x60\x50\x04\xfa\x7d\xbe\x01\x00\xce\xc1\xb6\x1c\x56\x94\x73\
-\x85\xa4\x5d\x47\x1d\xf0\x27\x71\xa1\xfe\xfc\xcb\xf6\x60\xaa\xaa\
-\xa4\x6b\x50\x85\x20\x02\x42\x21\xca\x94\x9e\xf5\x62\xaa\x42\x41\
-\x91\x61\x48\x76\x1d\x0c\x39\x11\x2f\xcf\x8d\xae\xfe\xfe\x00\x00\
-\x01\x00\x48\x00\x00\x05\x25\x05\x83\x00\x09\x00\x3a\x00\xb2\x07\
-\x00\x00\x2b\xb2\x01\x02\x00\x2b\xb1\x00\x09\xe9\xb0\x03\x32\x01\
-\xb0\x0a\x2f\xb0\x07\xd6\xb1\x06\x0e\xe9\xb2\x06\x07\x0a\x2b\xb3\
-\x40\x06\x02\x09\x2b\xb2\x07\x06\x0a\x2b\xb3\x40\x07\x01\x09\x2b\
-\xb1\x0b\x01\x2b\x00\x30\x31\x13\x35\x21\x15\x21\x27\x11\x23\x11\
-\x07\x48\x04\xdd\xfe\xdd\xf0\xb6\xf2\x04\xfc\x87\x87\x02\xfb\x02\
-\x04\xfe\x02\x00\x01\x00\xc1\xff\xd3\x04\xbe\x05\x8d\x00\x1f\x00\
-\x39\x00\xb2\x1b\x00\x00\x2b\xb1\x0b\x05\xe9\xb2\x01\x02\x00\x2b\
-\xb0\x14\x33\x01\xb0\x20\x2f\xb0\x00\xd6\xb1\x03\x0e\xe9\xb0\x03\
-\x10\xb1\x13\x01\x2b\xb1\x16\x0d\xe9\xb1\x21\x01\x2b\xb1\x13\x03\
-\x11\x12\xb1\x0b\x1b\x39\x39\x00\x30\x31\x13\x11\x33\x11\x14\x06\
-\x15\x14\x1e\x02\x33\x32\x3e\x02\x35\x34\x26\x35\x11\x33\x11\x14\
-\x0e\x02\x23\x22\x2e\x02\xc1\xb8\x02\x43\x6d\x68\x36\x39\x71\x6c\
-\x44\x02\xa1\x5c\x95\xb0\x58\x5a\xb1\x99\x60\x01\xf6\x03\x97\xfc\
-\xae\x0c\x2f\x0c\x7d\xb4\x59\x24\x29\x5a\xae\x75\x06\x18\x06\x03\
-\x7d\xfc\x61\x83\xd5\x7f\x44\x41\x7f\xda\x00\x00\x01\x00\x1d\x00\
-\x00\x05\x37\x05\x8d\x00\x0a\x00\x21\x00\xb2\x0a\x00\x00\x2b\xb2\
-\x00\x02\x00\x2b\xb0\x07\x33\x01\xb0\x0b\x2f\xb1\x0c\x01\x2b\x00\
-\xb1\x00\x0a\x11\x12\xb0\x04\x39\x30\x31\x13\x33\x01\x12\x17\x36\
-\x13\x01\x33\x01\x23\x1d\xbe\x01\x39\x96\x10\x0c\x94\x01\x3e\x9f\
-\xfd\xd1\xbc\x05\x8d\xfc\xd9\xfe\x6d\x44\x50\x01\x7d\x03\x31\xfa\
-\x73\x00\x00\x00\x01\x00\x1d\x00\x00\x07\x6f\x05\x8d\x00\x1b\x01\
-\x07\x00\xb2\x1b\x00\x00\x2b\xb0\x12\x33\xb2\x00\x02\x00\x2b\xb2\
-\x01\x07\x0f\x33\x33\x33\x01\xb0\x1c\x2f\xb0\x00\xd6\xb1\x01\x15\
-\xe9\xb0\x01\x10\xb1\x0f\x01\x2b\xb1\x10\x10\xe9\xb1\x1d\x01\x2b\
-\xb0\x36\x1a\xba\xc2\x71\xee\x7c\x00\x15\x2b\x0a\xb0\x00\x10\xb0\
-\x1b\xc0\x0e\xb0\x01\x10\xb0\x02\xc0\xba\x3d\xf2\xef\xea\x00\x15\
-\x2b\x0a\x05\xb0\x07\x2e\x0e\xb0\x06\xc0\xb1\x16\x03\xf9\xb0\x19\
-\xc0\xba\xc2\x7a\xee\x5f\x00\x15\x2b\x0a\x05\xb0\x12\x2e\x0e\xb0\
-\x13\xc0\xb1\x0b\x11\xf9\xb0\x09\xc0\xb0\x09\x10\xb3\x0a\x09\x0b\
-\x13\x2b\xba\x3d\xde\xef\x9f\x00\x15\x2b\x0b\xb0\x19\x10\xb3\x17\
-\x19\x16\x13\x2b\xb3\x18\x19\x16\x13\x2b\xb2\x17\x19\x16\x20\x8a\
-\x20\x8a\x23\x06\x0e\x11\x12\x39\xb0\x18\x39\xb2\x0a\x09\x0b\x20\
-\x8a\x20\x8a\x23\x06\x0e\x11\x12\x39\x00\x40\x0a\x02\x06\x09\x0a\
-\x0b\x13\x19\x16\x17\x18\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\
-\x01\x40\x0d\x02\x06\x07\x09\x0a\x0b\x12\x13\x19\x1b\x16\x17\x18\
-\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\xb0\x40\x1a\
-\x01\xb1\x0f\x01\x11\x12\xb0\x11\x39\x00\xb1\x00\x1b\x11\x12\xb2\
-\x04\x0c\x15\x39\x39\x39\x30\x31\x13\x33\x13\x12\x17\x36\x1b\x01\
-\x33\x13\x1f\x02\x36\x1b\x01\x33\x01\x23\x03\x02\x27\x0e\x02\x07\
-\x03\x23\x1d\xb2\xed\x5e\x0b\x08\x62\xec\xa8\xf1\x3c\x27\x08\x04\
-\x69\xef\x94\xfe\x60\xb2\xdb\x71\x10\x04\x3c\x37\x02\xe6\xa4\x05\
-\x8d\xfc\xbf\xfe\xa4\x61\x5a\x01\x69\x03\x3b\xfc\xb7\xde\xa1\x36\
-\x44\x01\x7d\x03\x3d\xfa\x73\x02\xf4\x01\xa0\x6a\x29\xf0\xc6\x04\
-\xfc\xe5\x00\x00\x01\x00\x1d\x00\x00\x05\x37\x05\x8d\x00\x0d\x00\
-\x26\x00\xb2\x00\x00\x00\x2b\xb0\x0a\x33\xb2\x03\x02\x00\x2b\xb0\
-\x06\x33\x01\xb0\x0e\x2f\xb1\x0f\x01\x2b\x00\xb1\x03\x00\x11\x12\
-\xb1\x05\x0c\x39\x39\x30\x31\x33\x01\x35\x01\x33\x09\x01\x33\x01\
-\x15\x01\x23\x09\x01\x1d\x02\x25\xfd\xf7\xd7\x01\x8c\x01\x81\xc4\
-\xfe\x13\x02\x43\xd7\xfe\x3c\xfe\x45\x02\xec\x02\x02\x9f\xfd\xea\
-\x02\x16\xfd\x61\x02\xfd\x14\x02\x71\xfd\x8f\x00\x01\x00\x04\x00\
-\x00\x05\x4c\x05\x8d\x00\x0b\x00\x30\x00\xb2\x0a\x00\x00\x2b\xb2\
-\x00\x02\x00\x2b\xb0\x06\x33\x01\xb0\x0c\x2f\xb0\x0a\xd6\xb1\x09\
-\x15\xe9\xb1\x0d\x01\x2b\xb1\x09\x0a\x11\x12\xb0\x04\x39\x00\xb1\
-\x00\x0a\x11\x12\xb0\x04\x39\x30\x31\x13\x33\x01\x16\x17\x36\x01\
-\x33\x01\x11\x23\x11\x04\xd7\x01\x2d\xa4\x0e\x48\x01\x96\xb4\xfd\
-\xb6\xb2\x05\x8d\xfe\x4c\xf6\x1a\x7f\x02\x45\xfc\xac\xfd\xc7\x02\
-\x39\x00\x00\x00\x01\x00\x71\x00\x00\x04\x7b\x05\x8d\x00\x19\x00\
-\x26\x00\xb2\x00\x00\x00\x2b\xb1\x15\x08\xe9\xb2\x08\x02\x00\x2b\
-\xb1\x07\x03\xe9\x01\xb0\x1a\x2f\xb1\x1b\x01\x2b\x00\xb1\x08\x07\
-\x11\x12\xb0\x13\x39\x30\x31\x33\x35\x34\x36\x37\x01\x05\x21\x35\
-\x21\x15\x1c\x01\x06\x14\x0e\x04\x07\x01\x21\x37\x21\x15\x71\x06\
-\x14\x02\xfa\xfe\xb0\xfe\x58\x03\xe4\x02\x02\x03\x06\x02\x0a\x02\
-\xfd\x06\x01\xaa\x2f\x01\x46\x33\x1d\x14\x1d\x04\x8d\x02\x81\x31\
-\x06\x0a\x0a\x05\x08\x04\x0a\x04\x0f\x04\xfb\x75\x02\x87\x00\x00\
-\x01\x00\xcd\xfe\x00\x02\x21\x06\x00\x00\x07\x00\x37\x00\xb2\x04\
-\x02\x00\x2b\xb1\x01\x03\xe9\xb0\x00\x2f\xb1\x05\x03\xe9\x01\xb0\
-\x08\x2f\xb0\x00\xd6\xb4\x07\x0e\x00\x0c\x04\x2b\xb0\x02\x32\xb1\
-\x05\x11\xe9\xb4\x07\x0e\x00\x0c\x04\x2b\xb0\x03\x32\xb1\x09\x01\
-\x2b\x00\x30\x31\x13\x11\x21\x15\x23\x11\x33\x15\xcd\x01\x54\xbb\
-\xbb\xfe\x00\x08\x00\x7d\xf8\xfa\x7d\x00\x00\x00\x01\x00\x73\xfe\
-\x02\x03\x8b\x05\xfe\x00\x13\x00\x21\x00\x01\xb0\x14\x2f\xb0\x00\
-\xd6\xb1\x06\x16\xe9\xb0\x06\x10\xb1\x10\x01\x2b\xb4\x0a\x16\x00\
-\x32\x04\x2b\xb1\x15\x01\x2b\x00\x30\x31\x13\x34\x36\x33\x32\x1e\
-\x01\x17\x01\x16\x15\x14\x06\x23\x22\x2e\x01\x27\x01\x26\x73\x25\
-\x18\x17\x1e\x09\x0a\x02\x89\x0a\x1e\x1f\x19\x21\x08\x0a\xfd\x73\
-\x02\x05\xc1\x19\x24\x1d\x16\x1b\xf8\xbd\x23\x0b\x14\x29\x21\x18\
-\x1f\x07\x52\x09\x00\x00\x00\x00\x01\x00\x2b\xfe\x00\x01\x7f\x06\
-\x00\x00\x07\x00\x40\x00\xb2\x03\x02\x00\x2b\xb1\x04\x03\xe9\xb0\
-\x07\x2f\xb1\x00\x03\xe9\x01\xb0\x08\x2f\xb0\x07\xd6\xb0\x03\x32\
-\xb4\x06\x0e\x00\x0c\x04\x2b\xb0\x06\x10\xb1\x01\x11\xe9\xb0\x01\
-\x2f\xb0\x06\x10\xb4\x07\x0e\x00\x0c\x04\x2b\xb0\x07\x2f\xb1\x09\
-\x01\x2b\x00\x30\x31\x13\x33\x11\x23\x35\x21\x11\x21\x2b\xb8\xb8\
-\x01\x54\xfe\xac\xfe\x7d\x07\x06\x7d\xf8\x00\x00\x01\x01\x10\x03\
-\x8f\x03\xd1\x05\x0a\x00\x06\x00\x23\x00\xb2\x00\x01\x00\x2b\xb0\
-\x03\x33\xb4\x01\x04\x00\x0b\x04\x2b\x01\xb0\x07\x2f\xb1\x08\x01\
-\x2b\x00\xb1\x01\x00\x11\x12\xb0\x05\x39\x30\x31\x09\x01\x33\x01\
-\x23\x0b\x01\x01\x10\x01\x21\x7f\x01\x21\x7d\xe3\xe4\x03\x8f\x01\
-\x7b\xfe\x85\x01\x17\xfe\xe9\x00\x01\x00\xac\xfe\x04\x05\x8b\xfe\
-\x56\x00\x08\x00\x1d\x00\xb0\x08\x2f\xb4\x02\x0c\x00\x17\x04\x2b\
-\xb4\x02\x0c\x00\x17\x04\x2b\x01\xb0\x09\x2f\xb1\x0a\x01\x2b\x00\
-\x30\x31\x12\x34\x33\x21\x32\x07\x14\x23\x21\xac\x37\x04\x65\x44\
-\x01\x39\xfb\x93\xfe\x04\x52\x2b\x27\x00\x00\x00\x01\x00\xc7\x04\
-\x14\x02\x77\x05\x1f\x00\x03\x00\x28\x00\xb0\x03\x2f\xb4\x01\x04\
-\x00\x10\x04\x2b\x01\xb0\x04\x2f\xb0\x00\xd6\xb4\x02\x0e\x00\x0a\
-\x04\x2b\xb1\x05\x01\x2b\x00\xb1\x01\x03\x11\x12\xb0\x00\x39\x30\
-\x31\x13\x33\x01\x23\xc7\x9f\x01\x11\x7d\x05\x1f\xfe\xf5\x00\x00\
-\x02\x00\x5a\xff\xe9\x03\x33\x03\xb0\x00\x1b\x00\x27\x00\x75\x00\
-\xb2\x14\x00\x00\x2b\xb2\x19\x00\x00\x2b\xb1\x1f\x03\xe9\xb2\x0f\
-\x01\x00\x2b\xb1\x0a\x07\xe9\xb4\x23\x05\x19\x0f\x0d\x2b\xb1\x23\
-\x0c\xe9\x01\xb0\x28\x2f\xb0\x00\xd6\xb1\x1c\x10\xe9\xb0\x1c\x10\
-\xb1\x22\x01\x2b\xb1\x05\x14\x32\x32\xb1\x13\x0d\xe9\xb1\x29\x01\
-\x2b\xb1\x1c\x00\x11\x12\xb1\x0c\x0d\x39\x39\xb0\x22\x11\xb2\x0a\
-\x0f\x19\x39\x39\x39\xb0\x13\x12\xb0\x11\x39\x00\xb1\x05\x19\x11\
-\x12\xb1\x00\x15\x39\x39\xb0\x0a\x11\xb0\x0c\x39\xb0\x0f\x12\xb0\
-\x0d\x39\x30\x31\x37\x34\x3e\x02\x33\x35\x26\x27\x26\x23\x22\x07\
-\x27\x36\x33\x32\x16\x17\x11\x23\x35\x0e\x02\x23\x22\x26\x37\x14\
-\x16\x33\x32\x36\x3d\x01\x22\x0e\x02\x5a\x73\xba\xb2\x5a\x04\x31\
-\x33\x4e\x9e\x95\x0c\x9a\xa7\x8d\xbf\x08\x9b\x08\x3c\xac\x64\x75\
-\x75\x96\x6c\x52\x58\x8d\x3f\x83\x8b\x56\xe7\x4c\x71\x37\x1b\x45\
-\x83\x3a\x3d\x68\x89\x5a\xba\x85\xfd\x8f\x48\x08\x25\x32\xa6\x5a\
-\x37\x4a\x4a\x58\x81\x10\x21\x44\x00\x00\x00\x00\x02\x00\xa6\xff\
-\xe9\x03\xd7\x05\xc7\x00\x0e\x00\x22\x00\x5d\x00\xb2\x00\x00\x00\
-\x2b\xb2\x0b\x00\x00\x2b\xb1\x17\x03\xe9\xb2\x01\x02\x00\x2b\xb2\
-\x05\x01\x00\x2b\xb1\x1f\x03\xe9\x01\xb0\x23\x2f\xb0\x00\xd6\xb1\
-\x0e\x0d\xe9\xb1\x02\x0f\x32\x32\xb0\x0e\x10\xb1\x1a\x01\x2b\xb1\
-\x08\x0d\xe9\xb1\x24\x01\x2b\xb1\x1a\x0e\x11\x12\xb1\x05\x0b\x39\
-\x39\x00\xb1\x17\x00\x11\x12\xb0\x0d\x39\xb0\x1f\x11\xb0\x08\x39\
-\xb0\x05\x12\xb0\x03\x39\x30\x31\x33\x11\x33\x11\x36\x33\x32\x12\
-\x15\x14\x02\x23\x22\x27\x15\x11\x14\x1e\x03\x17\x16\x33\x32\x36\
-\x35\x34\x2e\x02\x23\x22\x06\x15\xa6\x99\x96\xb2\x93\xbd\xe3\x9c\
-\x91\x81\x02\x06\x06\x0e\x06\x44\x64\x6d\xb8\x35\x58\x5a\x2d\x50\
-\x8b\x05\xc7\xfd\x66\x77\xfe\xe5\xbe\xcf\xfe\xed\x75\x5e\x01\x10\
-\x10\x12\x11\x08\x14\x09\x52\xac\xb7\x60\x91\x4a\x23\x5e\x3a\x00\
-\x01\x00\x48\xff\xe9\x03\x52\x03\xb0\x00\x18\x00\x3d\x00\xb2\x16\
-\x00\x00\x2b\xb1\x11\x08\xe9\xb2\x03\x01\x00\x2b\xb1\x0b\x08\xe9\
-\x01\xb0\x19\x2f\xb0\x00\xd6\xb1\x0e\x0d\xe9\xb1\x1a\x01\x2b\x00\
-\xb1\x11\x16\x11\x12\xb0\x14\x39\xb0\x0b\x11\xb2\x00\x07\x13\x39\
-\x39\x39\xb0\x03\x12\xb0\x06\x39\x30\x31\x13\x34\x12\x33\x32\x16\
-\x17\x07\x26\x27\x26\x23\x22\x06\x15\x14\x16\x33\x32\x37\x17\x06\
-\x07\x22\x00\x48\xf5\xcd\x60\x7f\x5f\x19\x64\x35\x3b\x53\x8b\x96\
-\xa0\x7f\xa0\xa2\x0a\xa2\xac\xbc\xff\x00\x01\xc9\xbe\x01\x29\x25\
-\x35\x87\x3f\x0f\x10\xd3\x91\x98\xc4\x6e\x89\x68\x01\x01\x19\x00\
-\x02\x00\x48\xff\xe9\x03\x79\x05\xc7\x00\x0e\x00\x1f\x00\x59\x00\
-\xb2\x09\x00\x00\x2b\xb2\x0c\x00\x00\x2b\xb1\x12\x03\xe9\xb2\x06\
-\x02\x00\x2b\xb2\x03\x01\x00\x2b\xb1\x1b\x03\xe9\x01\xb0\x20\x2f\
-\xb0\x00\xd6\xb1\x0f\x0d\xe9\xb0\x0f\x10\xb1\x09\x01\x2b\xb1\x05\
-\x15\x32\x32\xb1\x08\x0d\xe9\xb1\x21\x01\x2b\xb1\x09\x0f\x11\x12\
-\xb1\x03\x0c\x39\x39\x00\xb1\x1b\x12\x11\x12\xb1\x00\x0a\x39\x39\
-\xb0\x03\x11\xb0\x05\x39\x30\x31\x13\x34\x12\x33\x32\x17\x11\x33\
-\x11\x23\x35\x06\x23\x22\x02\x37\x14\x16\x33\x32\x36\x35\x11\x34\
-\x27\x26\x27\x23\x22\x0e\x02\x48\xd5\x97\x9c\x8d\x9c\xa2\x85\xaa\
-\x98\xc8\x9f\xac\x69\x56\x85\x2b\x42\x56\x04\x31\x60\x5e\x3a\x01\
-\xc5\xcb\x01\x16\x71\x02\x92\xfa\x39\x6a\x81\x01\x1e\xc0\xb6\xa9\
-\x75\x35\x01\x88\x27\x28\x3d\x01\x25\x4c\x8f\x00\x02\x00\x46\xff\
-\xe9\x03\x50\x03\xb0\x00\x14\x00\x1d\x00\x4f\x00\xb2\x12\x00\x00\
-\x2b\xb1\x0d\x03\xe9\xb2\x03\x01\x00\x2b\xb1\x1b\x03\xe9\xb4\x15\
-\x0a\x12\x03\x0d\x2b\xb1\x15\x05\xe9\x01\xb0\x1e\x2f\xb0\x00\xd6\
-\xb1\x0a\x0f\xe9\xb2\x0a\x00\x0a\x2b\xb3\x40\x0a\x09\x09\x2b\xb1\
-\x1f\x01\x2b\x00\xb1\x0d\x12\x11\x12\xb0\x10\x39\xb0\x0a\x11\xb0\
-\x0f\x39\xb0\x15\x12\xb0\x00\x39\x30\x31\x13\x34\x12\x33\x32\x1e\
-\x02\x17\x15\x21\x1e\x01\x33\x32\x37\x17\x06\x07\x22\x02\x13\x21\
-\x2e\x03\x23\x22\x06\x46\xf7\xa6\x3d\x6f\x71\x4a\x06\xfd\x85\x06\
-\xb0\x79\x9c\x9b\x0d\x9c\xa8\xc3\xfb\x99\x01\xfc\x0c\x40\x50\x3f\
-\x1d\x68\x88\x01\xcf\xcb\x01\x16\x27\x5a\xb4\x7d\x3b\x9a\xc1\x71\
-\x87\x68\x01\x01\x21\x01\x29\x50\x6f\x2f\x10\xa0\x00\x00\x00\x00\
-\x01\x00\x37\x00\x00\x02\xc7\x05\xdd\x00\x18\x00\x5a\x00\xb2\x17\
-\x00\x00\x2b\xb2\x01\x01\x00\x2b\xb0\x12\x33\xb1\x00\x06\xe9\xb0\
-\x14\x32\xb0\x0e\x2f\xb1\x09\x03\xe9\x01\xb0\x19\x2f\xb0\x17\xd6\
-\xb0\x02\x32\xb1\x16\x11\xe9\xb0\x11\x32\xb2\x16\x17\x0a\x2b\xb3\
-\x40\x16\x14\x09\x2b\xb2\x17\x16\x0a\x2b\xb3\x40\x17\x00\x09\x2b\
-\xb1\x1a\x01\x2b\x00\xb1\x0e\x01\x11\x12\xb1\x06\x0c\x39\x39\xb0\
-\x09\x11\xb0\x0b\x39\x30\x31\x13\x35\x33\x35\x34\x26\x35\x34\x36\
-\x33\x32\x17\x15\x26\x23\x22\x06\x15\x11\x33\x15\x23\x11\x23\x11\
-\x37\x98\x02\xcf\x89\x4c\x56\x58\x4e\x46\x79\xe8\xe2\x99\x03\x17\
-\x78\x96\x08\x21\x08\xbc\xcb\x16\x8a\x23\x52\x68\xfe\xe9\x78\xfc\
-\xe9\x03\x17\x00\x03\x00\x37\xfe\x5a\x03\xe1\x03\xa4\x00\x30\x00\
-\x3e\x00\x4a\x00\xc0\x00\xb2\x3b\x00\x00\x2b\xb1\x23\x0b\xe9\xb2\
-\x01\x00\x00\x2b\xb2\x0c\x01\x00\x2b\xb0\x11\x33\xb1\x48\x05\xe9\
-\xb0\x12\x32\xb0\x2e\x2f\xb1\x35\x05\xe9\xb4\x1c\x42\x01\x0c\x0d\
-\x2b\xb1\x1c\x06\xe9\x01\xb0\x4b\x2f\xb0\x09\xd6\xb0\x04\x32\xb1\
-\x3f\x0f\xe9\xb0\x3f\x10\xb0\x31\x20\xd6\x11\xb1\x00\x0f\xe9\xb0\
-\x00\x2f\xb1\x31\x0f\xe9\xb0\x09\x10\xb1\x20\x16\xe9\xb0\x3f\x10\
-\xb1\x45\x01\x2b\xb1\x19\x0f\xe9\xb0\x19\x10\xb1\x38\x01\x2b\xb1\
-\x2b\x0f\xe9\xb1\x4c\x01\x2b\xb1\x3f\x09\x11\x12\xb2\x02\x06\x1e\
-\x39\x39\x39\xb1\x45\x20\x11\x12\xb5\x1c\x0c\x24\x2e\x35\x3b\x24\
-\x17\x39\xb0\x19\x11\xb3\x0f\x16\x0e\x17\x24\x17\x39\x00\xb1\x3b\
-\x35\x11\x12\xb0\x00\x39\xb0\x23\x11\xb0\x02\x39\xb0\x1c\x12\xb0\
-\x04\x39\xb0\x42\x11\xb0\x1e\x39\xb0\x48\x12\xb3\x06\x09\x16\x19\
-\x24\x17\x39\x30\x31\x17\x34\x37\x26\x35\x34\x37\x35\x26\x35\x34\
-\x36\x33\x32\x17\x27\x36\x37\x17\x26\x23\x22\x07\x27\x16\x15\x14\
-\x06\x23\x22\x27\x06\x17\x14\x16\x3b\x01\x32\x1e\x02\x17\x16\x17\
-\x14\x04\x23\x22\x24\x37\x14\x1e\x01\x33\x32\x36\x35\x34\x21\x23\
-\x07\x0e\x01\x13\x14\x16\x33\x32\x36\x35\x34\x26\x23\x22\x06\x37\
-\x83\x33\x3c\x44\xc3\x83\x68\x60\x04\x98\xaa\x16\x3d\x3c\x06\x93\
-\x13\x50\xbc\x8b\x5a\x61\x17\x01\x31\x41\x9a\x48\x64\x96\x64\x14\
-\x0a\x01\xfe\xf5\xbc\xbe\xfe\xf7\x90\x6e\x87\x40\x81\xb8\xfe\xcf\
-\x81\x3b\x3b\x46\x47\x65\x54\x46\x70\x64\x54\x46\x71\x91\x85\x4e\
-\x4a\x51\x5c\x50\x02\x58\x73\x91\xbd\x44\x04\x3f\x01\x81\x06\x08\
-\x10\x6d\x6e\x85\xc9\x3e\x2d\x1f\x29\x44\x0a\x23\x5c\x48\x29\x22\
-\x77\xa0\xa0\x75\x35\x4c\x1f\x58\x46\x8d\x02\x06\x52\x02\xb6\x62\
-\x75\x64\x75\x62\x75\x64\x00\x00\x01\x00\xa4\x00\x00\x03\x7d\x05\
-\xc7\x00\x18\x00\x47\x00\xb2\x00\x00\x00\x2b\xb0\x0c\x33\xb2\x01\
-\x02\x00\x2b\xb2\x05\x01\x00\x2b\xb1\x14\x03\xe9\x01\xb0\x19\x2f\
-\xb0\x01\xd6\xb1\x03\x11\xe9\xb0\x17\x32\xb0\x03\x10\xb1\x0d\x01\
-\x2b\xb1\x0c\x0d\xe9\xb1\x1a\x01\x2b\xb1\x0c\x0d\x11\x12\xb0\x09\
-\x39\x00\xb1\x14\x00\x11\x12\xb0\x03\x39\x30\x31\x33\x11\x33\x11\
-\x36\x37\x32\x1e\x03\x15\x11\x23\x11\x34\x2e\x03\x23\x22\x06\x15\
-\x11\xa4\x99\x7b\xac\x4e\x6f\x37\x1f\x06\xa0\x02\x16\x27\x50\x3a\
-\x6d\x63\x05\xc7\xfd\x4b\x91\x01\x31\x44\x68\x48\x31\xfd\xb2\x02\
-\x3f\x23\x29\x4c\x2d\x23\xb8\x83\xfe\x14\x00\x00\x02\x00\x98\x00\
-\x00\x01\x50\x05\x6f\x00\x03\x00\x07\x00\x2f\x00\xb2\x04\x00\x00\
-\x2b\xb2\x05\x01\x00\x2b\xb0\x00\x2f\xb1\x01\x04\xe9\x01\xb0\x08\
-\x2f\xb0\x00\xd6\xb0\x04\x32\xb1\x03\x0e\xe9\xb1\x07\x11\xe9\xb1\
-\x03\x0e\xe9\xb1\x09\x01\x2b\x00\x30\x31\x13\x35\x33\x15\x03\x11\
-\x33\x11\x98\xb8\xaa\x99\x04\xb8\xb7\xb7\xfb\x48\x03\x8f\xfc\x71\
-\x00\x00\x00\x00\x02\xff\x83\xfe\x5c\x01\x7d\x05\x6f\x00\x0f\x00\
-\x13\x00\x41\x00\xb2\x09\x01\x00\x2b\xb0\x0e\x2f\xb1\x03\x08\xe9\
-\xb0\x10\x2f\xb1\x11\x04\xe9\x01\xb0\x14\x2f\xb0\x08\xd6\xb1\x0b\
-\x11\xe9\xb0\x12\x32\xb0\x0b\x10\xb1\x10\x0e\xe9\xb0\x10\x2f\xb1\
-\x15\x01\x2b\x00\xb1\x03\x0e\x11\x12\xb0\x00\x39\xb0\x09\x11\xb0\
-\x01\x39\x30\x31\x03\x37\x16\x17\x32\x36\x37\x36\x35\x11\x33\x11\
-\x14\x06\x23\x22\x13\x35\x33\x15\x7d\x1f\x50\x50\x3b\x54\x0c\x04\
-\x9a\xa0\x62\x7d\xc9\xb8\xfe\xa2\x7d\x3f\x01\x3c\x2b\x12\x23\x04\
-\x14\xfc\x0b\xaa\x94\x06\x5c\xb7\xb7\x00\x00\x00\x01\x00\xaa\x00\
-\x00\x03\xc5\x05\xc7\x00\x0b\x00\x32\x00\xb2\x00\x00\x00\x2b\xb0\
-\x07\x33\xb2\x01\x02\x00\x2b\xb2\x04\x01\x00\x2b\x01\xb0\x0c\x2f\
-\xb0\x00\xd6\xb1\x03\x10\xe9\xb0\x0a\x32\xb1\x0d\x01\x2b\x00\xb1\
-\x04\x00\x11\x12\xb1\x03\x09\x39\x39\x30\x31\x33\x11\x33\x11\x01\
-\x33\x09\x01\x23\x01\x07\x11\xaa\x93\x01\xa2\xb9\xfe\xa7\x01\x86\
-\xa8\xfe\xc0\xa4\x05\xc7\xfc\x1c\x01\xac\xfe\xa0\xfd\xd1\x01\xcb\
-\xa8\xfe\xdd\x00\x01\x00\xa6\x00\x00\x01\x3f\x05\xc7\x00\x03\x00\
-\x21\x00\xb2\x00\x00\x00\x2b\xb2\x01\x02\x00\x2b\x01\xb0\x04\x2f\
-\xb0\x00\xd6\xb1\x03\x11\xe9\xb1\x03\x11\xe9\xb1\x05\x01\x2b\x00\
-\x30\x31\x33\x11\x33\x11\xa6\x99\x05\xc7\xfa\x39\x00\x00\x00\x00\
-\x01\x00\xa4\x00\x00\x05\xb6\x03\xa4\x00\x2a\x00\x65\x00\xb2\x00\
-\x00\x00\x2b\xb1\x10\x1e\x33\x33\xb2\x05\x01\x00\x2b\xb1\x01\x09\
-\x33\x33\xb1\x26\x03\xe9\xb0\x1a\x32\x01\xb0\x2b\x2f\xb0\x00\xd6\
-\xb1\x2a\x0d\xe9\xb0\x02\x32\xb0\x2a\x10\xb1\x1f\x01\x2b\xb1\x1e\
-\x0d\xe9\xb0\x1e\x10\xb1\x11\x01\x2b\xb1\x10\x0d\xe9\xb1\x2c\x01\
-\x2b\xb1\x1f\x2a\x11\x12\xb0\x05\x39\xb0\x1e\x11\xb0\x07\x39\xb0\
-\x11\x12\xb0\x09\x39\x00\xb1\x26\x00\x11\x12\xb1\x03\x07\x39\x39\
-\x30\x31\x33\x11\x33\x15\x36\x33\x32\x17\x36\x33\x32\x1e\x03\x15\
-\x11\x23\x11\x3c\x01\x2e\x04\x23\x22\x06\x15\x11\x23\x11\x34\x2e\
-\x03\x23\x22\x06\x15\x11\xa4\x95\x77\xb4\xc7\x3d\x7d\xb9\x4e\x70\
-\x37\x1f\x04\xa2\x08\x0e\x1d\x29\x41\x29\x6d\x64\xa0\x02\x16\x27\
-\x50\x3a\x6d\x63\x03\x9a\x90\x9a\xa6\xa6\x33\x44\x6a\x44\x31\xfd\
-\xb2\x02\x3f\x04\x11\x31\x2b\x35\x27\x1b\xb8\x83\xfe\x14\x02\x3f\
-\x23\x29\x4c\x2d\x23\xb8\x83\xfe\x14\x00\x00\x00\x01\x00\xa4\x00\
-\x00\x03\x7d\x03\xa4\x00\x18\x00\x45\x00\xb2\x00\x00\x00\x2b\xb0\
-\x0c\x33\xb2\x05\x01\x00\x2b\xb0\x01\x33\xb1\x14\x03\xe9\x01\xb0\
-\x19\x2f\xb0\x00\xd6\xb1\x18\x0d\xe9\xb0\x02\x32\xb0\x18\x10\xb1\
-\x0d\x01\x2b\xb1\x0c\x0d\xe9\xb1\x1a\x01\x2b\xb1\x0d\x18\x11\x12\
-\xb0\x05\x39\x00\xb1\x14\x00\x11\x12\xb0\x03\x39\x30\x31\x33\x11\
-\x33\x15\x36\x33\x32\x1e\x03\x15\x11\x23\x11\x34\x2e\x03\x23\x22\
-\x06\x15\x11\xa4\x95\x77\xb4\x4c\x6d\x39\x1f\x08\xa0\x02\x16\x27\
-\x50\x3a\x6d\x63\x03\x9a\x90\x9a\x2d\x42\x64\x4e\x35\xfd\xb2\x02\
-\x3f\x23\x29\x4c\x2d\x23\xb8\x83\xfe\x14\x00\x00\x02\x00\x3d\xff\
-\xe9\x03\xc1\x03\xb0\x00\x0a\x00\x15\x00\x46\x00\xb2\x09\x00\x00\
-\x2b\xb1\x0e\x08\xe9\xb2\x03\x01\x00\x2b\xb1\x13\x03\xe9\x01\xb0\
-\x16\x2f\xb0\x00\xd6\xb1\x0b\x0d\xe9\xb0\x0b\x10\xb1\x10\x01\x2b\
-\xb1\x06\x0d\xe9\xb1\x17\x01\x2b\xb1\x10\x0b\x11\x12\xb2\x08\x09\
-\x03\x39\x39\x39\x00\xb1\x13\x0e\x11\x12\xb1\x06\x00\x39\x39\x30\
-\x31\x13\x34\x00\x33\x32\x00\x15\x14\x00\x20\x00\x37\x14\x16\x32\
-\x36\x35\x34\x26\x23\x22\x06\x3d\x01\x09\xb8\xc1\x01\x02\xfe\xf1\
-\xfe\x98\xfe\xf3\xa0\xae\xe6\xae\xae\x73\x71\xb0\x01\xc5\xcf\x01\
-\x1c\xfe\xd7\xc4\xcb\xfe\xf1\x01\x11\xdf\xb4\xb8\xba\xb2\xac\xac\
-\xac\x00\x00\x00\x02\x00\xa6\xfe\x71\x03\xd7\x03\xa4\x00\x0e\x00\
-\x22\x00\x5b\x00\xb2\x0b\x00\x00\x2b\xb1\x12\x03\xe9\xb2\x01\x01\
-\x00\x2b\xb2\x05\x01\x00\x2b\xb1\x18\x08\xe9\xb0\x00\x2f\x01\xb0\
-\x23\x2f\xb0\x00\xd6\xb1\x0e\x0d\xe9\xb1\x02\x0f\x32\x32\xb0\x0e\
-\x10\xb1\x15\x01\x2b\xb1\x08\x0d\xe9\xb1\x24\x01\x2b\xb1\x15\x0e\
-\x11\x12\xb1\x05\x0b\x39\x39\x00\xb1\x12\x0b\x11\x12\xb0\x0d\x39\
-\xb0\x18\x11\xb0\x08\x39\xb0\x01\x12\xb0\x03\x39\x30\x31\x13\x11\
-\x33\x15\x36\x33\x32\x12\x15\x14\x02\x23\x22\x27\x19\x01\x14\x16\
-\x33\x32\x36\x35\x34\x26\x23\x22\x0e\x06\x0f\x01\xa6\x99\x96\xbe\
-\x8d\xb7\xe3\x9a\x98\x7c\x74\x52\x73\xb6\x9b\x7b\x17\x29\x23\x1e\
-\x1b\x14\x13\x0a\x06\x06\xfe\x71\x05\x1e\x64\x79\xfe\xe5\xbe\xd3\
-\xfe\xf1\x75\xfe\x13\x02\x91\x2d\x6f\xc5\x9c\x8b\xcf\x06\x0f\x0e\
-\x12\x11\x14\x0d\x06\x08\x00\x00\x02\x00\x48\xfe\x71\x03\x79\x03\
-\xa4\x00\x0d\x00\x1a\x00\x55\x00\xb2\x0b\x00\x00\x2b\xb1\x11\x03\
-\xe9\xb2\x03\x01\x00\x2b\xb0\x05\x33\xb1\x18\x08\xe9\xb0\x08\x2f\
-\x01\xb0\x1b\x2f\xb0\x00\xd6\xb1\x0e\x0d\xe9\xb0\x0e\x10\xb1\x14\
-\x01\x2b\xb1\x04\x08\x32\x32\xb1\x06\x11\xe9\xb1\x1c\x01\x2b\xb1\
-\x14\x0e\x11\x12\xb1\x02\x0b\x39\x39\x00\xb1\x11\x0b\x11\x12\xb0\
-\x09\x39\xb0\x18\x11\xb1\x00\x04\x39\x39\x30\x31\x13\x34\x12\x20\
-\x17\x35\x33\x11\x23\x11\x06\x23\x22\x02\x37\x14\x16\x33\x32\x36\
-\x35\x11\x34\x26\x23\x22\x06\x48\xe1\x01\x37\x7d\x9c\xa2\x89\xac\
-\x91\xc9\x9f\xa4\x73\x54\x8b\x6c\x5f\x75\xb6\x01\xc5\xcf\x01\x10\
-\x89\x89\xfa\xcd\x01\xf5\x7d\x01\x17\xc5\x91\xcc\x73\x40\x01\x2d\
-\x3f\x9a\xc4\x00\x01\x00\xa6\x00\x00\x02\x9c\x03\xa4\x00\x0e\x00\
-\x2f\x00\xb2\x00\x00\x00\x2b\xb2\x07\x01\x00\x2b\xb0\x01\x33\xb1\
-\x08\x09\xe9\x01\xb0\x0f\x2f\xb0\x00\xd6\xb1\x0e\x11\xe9\xb0\x02\
-\x32\xb1\x10\x01\x2b\x00\xb1\x08\x00\x11\x12\xb0\x03\x39\x30\x31\
-\x33\x11\x33\x15\x3e\x02\x37\x15\x0e\x03\x15\x11\xa6\x8f\x19\x45\
-\xa6\x63\x35\x6b\x75\x48\x03\x9a\xb9\x27\x48\x52\x02\x89\x02\x23\
-\x4c\x9c\x68\xfe\x5a\x00\x00\x00\x01\x00\x37\xff\xe9\x02\xe1\x03\
-\xb0\x00\x38\x00\x67\x00\xb2\x37\x00\x00\x2b\xb1\x09\x03\xe9\xb2\
-\x1a\x01\x00\x2b\xb1\x28\x07\xe9\x01\xb0\x39\x2f\xb0\x15\xd6\xb1\
-\x2b\x0f\xe9\xb0\x2b\x10\xb1\x0c\x01\x2b\xb1\x32\x0f\xe9\xb1\x3a\
-\x01\x2b\xb1\x2b\x15\x11\x12\xb1\x03\x01\x39\x39\xb0\x0c\x11\xb4\
-\x09\x11\x1a\x22\x2e\x24\x17\x39\xb0\x32\x12\xb1\x1c\x20\x39\x39\
-\x00\xb1\x09\x37\x11\x12\xb0\x00\x39\xb0\x28\x11\xb3\x01\x15\x1d\
-\x32\x24\x17\x39\xb0\x1a\x12\xb0\x1c\x39\x30\x31\x3f\x01\x1e\x06\
-\x33\x32\x36\x35\x34\x26\x27\x2e\x01\x27\x2e\x01\x35\x34\x3e\x02\
-\x33\x32\x17\x07\x2e\x09\x23\x22\x06\x15\x14\x1e\x01\x17\x1e\x01\
-\x15\x14\x0e\x02\x23\x26\x37\x19\x04\x2d\x17\x33\x2b\x39\x40\x22\
-\x66\x59\x4a\x29\x14\x8e\x22\x54\x81\x1c\x44\x8d\x62\x93\x98\x16\
-\x02\x2b\x06\x27\x0f\x24\x15\x27\x1e\x29\x17\x5e\x4e\x6d\xc4\x29\
-\x4a\x68\x1c\x44\x8d\x61\xb4\x46\x8b\x02\x1b\x0c\x19\x0e\x10\x07\
-\x57\x35\x33\x44\x0c\x06\x1d\x0a\x1b\x81\x60\x2f\x54\x58\x33\x3f\
-\x88\x02\x13\x04\x10\x05\x0e\x02\x0a\x02\x02\x4c\x31\x44\x3b\x22\
-\x13\x21\x83\x5c\x2f\x5a\x5a\x38\x01\x00\x00\x00\x01\x00\x25\xff\
-\xe9\x02\xa8\x04\x91\x00\x13\x00\x60\x00\xb2\x10\x00\x00\x2b\xb1\
-\x0b\x08\xe9\xb2\x01\x01\x00\x2b\xb0\x05\x33\xb1\x00\x06\xe9\xb0\
-\x07\x32\xb2\x01\x00\x0a\x2b\xb3\x40\x01\x04\x09\x2b\x01\xb0\x14\
-\x2f\xb0\x12\xd6\xb0\x02\x32\xb1\x09\x10\xe9\xb0\x04\x32\xb2\x09\
-\x12\x0a\x2b\xb3\x40\x09\x07\x09\x2b\xb2\x12\x09\x0a\x2b\xb3\x40\
-\x12\x00\x09\x2b\xb1\x15\x01\x2b\x00\xb1\x0b\x10\x11\x12\xb0\x0e\
-\x39\xb0\x00\x11\xb0\x0d\x39\x30\x31\x13\x35\x33\x11\x33\x11\x21\
-\x15\x21\x11\x14\x33\x32\x37\x17\x06\x23\x22\x19\x01\x25\xb0\x8f\
-\x01\x21\xfe\xdf\x6f\x56\x5e\x21\x91\x9e\xa8\x03\x17\x78\x01\x02\
-\xfe\xfe\x78\xfe\x08\xb2\x43\x79\x4e\x01\x07\x02\x27\x00\x00\x00\
-\x01\x00\xa4\xff\xe9\x03\x7d\x03\x8f\x00\x17\x00\x47\x00\xb2\x0f\
-\x00\x00\x2b\xb2\x12\x00\x00\x2b\xb1\x06\x05\xe9\xb2\x01\x01\x00\
-\x2b\xb0\x0c\x33\x01\xb0\x18\x2f\xb0\x00\xd6\xb1\x03\x0d\xe9\xb0\
-\x03\x10\xb1\x0b\x01\x2b\xb0\x0f\x32\xb1\x0e\x0d\xe9\xb1\x19\x01\
-\x2b\xb1\x0b\x03\x11\x12\xb0\x12\x39\x00\xb1\x01\x06\x11\x12\xb0\
-\x10\x39\x30\x31\x37\x11\x33\x11\x1e\x01\x33\x32\x36\x37\x36\x35\
-\x11\x33\x11\x23\x35\x06\x23\x22\x2e\x03\xa4\xa0\x02\x3f\x62\x6a\
-\x82\x08\x02\xa0\x9c\x8b\xdb\x3d\x57\x2b\x16\x02\xfa\x02\x95\xfd\
-\x52\x48\x3d\x71\x4a\x14\x27\x02\x3d\xfc\x71\x62\x79\x27\x32\x58\
-\x33\x00\x00\x00\x01\x00\x1d\x00\x00\x03\x91\x03\x8f\x00\x09\x00\
-\x21\x00\xb2\x09\x00\x00\x2b\xb2\x00\x01\x00\x2b\xb0\x06\x33\x01\
-\xb0\x0a\x2f\xb1\x0b\x01\x2b\x00\xb1\x00\x09\x11\x12\xb0\x04\x39\
-\x30\x31\x13\x33\x13\x16\x17\x36\x01\x33\x01\x23\x1d\x9d\xbf\x58\
-\x0a\x10\x01\x0f\x97\xfe\xa0\xb4\x03\x8f\xfe\x0d\xfa\x3c\x68\x02\
-\xc1\xfc\x71\x00\x01\x00\x1d\x00\x00\x05\x5a\x03\x8f\x00\x14\x00\
-\x31\x00\xb2\x14\x00\x00\x2b\xb0\x0d\x33\xb2\x00\x01\x00\x2b\xb1\
-\x05\x0b\x33\x33\x01\xb0\x15\x2f\xb0\x0b\xd6\xb1\x0c\x10\xe9\xb1\
-\x16\x01\x2b\x00\xb1\x00\x14\x11\x12\xb2\x03\x09\x11\x39\x39\x39\
-\x30\x31\x13\x33\x12\x17\x36\x13\x33\x13\x12\x17\x36\x13\x33\x01\
-\x23\x02\x26\x27\x06\x03\x23\x1d\x99\xc7\x16\x06\xd4\x91\x95\x48\
-\x06\x0a\xda\x95\xfe\xe5\xb2\x8b\x41\x0f\x04\xd5\xa2\x03\x8f\xfd\
-\x89\xb2\x7f\x02\xaa\xfe\x0d\xfe\xfe\x34\x64\x02\xc5\xfc\x71\x01\
-\xcd\xeb\x6f\x68\xfd\x41\x00\x00\x01\x00\x00\x00\x00\x03\xae\x03\
-\x8f\x00\x0e\x00\x26\x00\xb2\x00\x00\x00\x2b\xb0\x0b\x33\xb2\x03\
-\x01\x00\x2b\xb0\x07\x33\x01\xb0\x0f\x2f\xb1\x10\x01\x2b\x00\xb1\
-\x03\x00\x11\x12\xb1\x05\x0d\x39\x39\x30\x31\x31\x01\x35\x01\x33\
-\x01\x33\x01\x33\x01\x15\x01\x23\x09\x01\x01\x8d\xfe\x7f\xaa\x01\
-\x1b\x02\x01\x10\xaa\xfe\x87\x01\x9a\xaa\xfe\xcd\xfe\xd9\x01\xd3\
-\x04\x01\xb8\xfe\xae\x01\x52\xfe\x48\x02\xfe\x2b\x01\x81\xfe\x7f\
-\x00\x00\x00\x00\x01\x00\x1d\xfe\x5c\x03\x91\x03\x8f\x00\x19\x00\
-\x2b\x00\xb2\x00\x01\x00\x2b\xb0\x07\x33\xb0\x0c\x2f\xb1\x11\x05\
-\xe9\x01\xb0\x1a\x2f\xb1\x1b\x01\x2b\x00\xb1\x11\x0c\x11\x12\xb0\
-\x0e\x39\xb0\x00\x11\xb1\x05\x0f\x39\x39\x30\x31\x13\x33\x1a\x01\
-\x16\x17\x36\x01\x33\x01\x0e\x01\x23\x22\x2f\x01\x16\x33\x32\x36\
-\x37\x36\x37\x36\x34\x27\x1d\xa1\x83\x84\x16\x0c\x04\x01\x0d\x99\
-\xfe\x44\x3b\x67\x4a\x54\x41\x0a\x6d\x28\x37\x38\x39\x0e\x09\x08\
-\x0a\x03\x8f\xfe\xd3\xfe\xac\x58\x50\x8f\x02\x9a\xfb\xb9\x89\x63\
-\x11\x85\x23\x50\x8b\x23\x14\x12\x1d\x15\x00\x00\x01\x00\x37\x00\
-\x00\x03\x35\x03\x8f\x00\x0c\x00\x2e\x00\xb2\x00\x00\x00\x2b\xb1\
-\x08\x03\xe9\xb2\x05\x01\x00\x2b\xb1\x04\x07\xe9\x01\xb0\x0d\x2f\
-\xb1\x0e\x01\x2b\x00\xb1\x08\x00\x11\x12\xb0\x01\x39\xb1\x05\x04\
-\x11\x12\xb0\x07\x39\x30\x31\x33\x35\x01\x07\x21\x35\x21\x15\x01\
-\x21\x37\x33\x15\x37\x02\x21\x3d\xfe\x39\x02\xdb\xfd\xe1\x01\x9c\
-\x2b\x5e\x54\x02\xc3\x03\x7b\x52\xfd\x42\x02\x81\x00\x00\x00\x00\
-\x01\x00\x6a\xfe\x00\x03\x91\x06\x00\x00\x36\x00\x63\x00\xb2\x0e\
-\x02\x00\x2b\xb1\x0b\x03\xe9\xb0\x26\x2f\xb1\x23\x03\xe9\xb0\x00\
-\x2f\xb1\x01\x03\xe9\x01\xb0\x37\x2f\xb0\x30\xd6\xb0\x04\x32\xb1\
-\x20\x0d\xe9\xb0\x13\x32\xb2\x20\x30\x0a\x2b\xb3\x40\x20\x25\x09\
-\x2b\xb0\x0c\x32\xb2\x30\x20\x0a\x2b\xb3\x40\x30\x01\x09\x2b\xb1\
-\x38\x01\x2b\x00\xb1\x00\x23\x11\x12\xb1\x1f\x30\x39\x39\xb0\x01\
-\x11\xb1\x19\x1b\x39\x39\xb0\x0e\x12\xb1\x05\x14\x39\x39\x30\x31\
-\x13\x35\x32\x36\x37\x11\x34\x3e\x03\x3b\x01\x15\x23\x22\x0e\x02\
-\x15\x11\x14\x0e\x03\x07\x1e\x03\x15\x11\x14\x16\x3b\x01\x15\x23\
-\x22\x27\x2e\x06\x3d\x01\x11\x26\x27\x2e\x01\x6a\x77\xc3\x0a\x0a\
-\x2b\x4c\x94\x62\x6c\x31\x60\x77\x2f\x0c\x33\x48\x60\x4c\x23\x2f\
-\x63\x70\x48\x6e\xa4\x31\x5c\x91\x62\x1d\x2d\x1f\x16\x0b\x08\x02\
-\x04\x0a\x21\xad\x01\xc1\x7e\x73\x6b\x01\xe5\x19\x31\x50\x39\x2b\
-\x7d\x14\x30\x26\x21\xfe\x50\x4c\x77\x43\x30\x10\x02\x02\x1f\x43\
-\x88\x5c\xfe\x48\x42\x41\x7d\x2b\x0c\x21\x1d\x25\x18\x27\x10\x11\
-\x12\x01\xa8\x52\x19\x4e\x54\x00\x01\x00\xf2\xfe\x02\x01\x44\x05\
-\xfe\x00\x07\x00\x1d\x00\x01\xb0\x08\x2f\xb0\x00\xd6\xb4\x05\x16\
-\x00\x14\x04\x2b\xb4\x05\x16\x00\x14\x04\x2b\xb1\x09\x01\x2b\x00\
-\x30\x31\x13\x11\x34\x32\x15\x11\x14\x22\xf2\x52\x52\xfe\x3d\x07\
-\x86\x3b\x3b\xf8\x7a\x3b\x00\x00\x01\x00\x6a\xfe\x00\x03\x91\x06\
-\x00\x00\x3a\x00\x58\x00\xb2\x19\x02\x00\x2b\xb1\x1a\x03\xe9\xb0\
-\x3a\x2f\xb1\x00\x03\xe9\xb0\x2f\x2f\xb1\x2e\x03\xe9\x01\xb0\x3b\
-\x2f\xb0\x09\xd6\xb0\x14\x32\xb1\x34\x0d\xe9\xb0\x28\x32\xb2\x09\
-\x34\x0a\x2b\xb3\x40\x09\x19\x09\x2b\xb0\x00\x32\xb1\x3c\x01\x2b\
-\x00\xb1\x2f\x00\x11\x12\xb1\x0a\x35\x39\x39\xb0\x2e\x11\xb1\x0e\
-\x10\x39\x39\xb0\x19\x12\xb1\x14\x26\x39\x39\x30\x31\x13\x32\x33\
-\x32\x3e\x02\x37\x36\x35\x11\x34\x3e\x02\x37\x2e\x03\x35\x11\x34\
-\x26\x2b\x01\x35\x33\x1e\x02\x17\x1e\x06\x14\x15\x11\x16\x17\x1e\
-\x01\x33\x15\x22\x06\x0f\x01\x11\x06\x07\x0e\x01\x2b\x01\x6a\x04\
-\x09\x3b\x48\x6c\x3e\x08\x02\x48\x70\x63\x2f\x2f\x63\x70\x48\x6f\
-\xa5\x30\x65\x3b\x33\x52\x27\x1d\x31\x1f\x16\x0b\x08\x02\x04\x0c\
-\x21\xaa\x68\x77\xc0\x0a\x02\x04\x0f\x27\xbe\x7f\x6d\xfe\x7d\x04\
-\x0e\x2b\x21\x0a\x2d\x01\xa6\x5c\x88\x43\x1f\x02\x02\x1f\x43\x88\
-\x5c\x01\xb8\x42\x41\x7d\x02\x02\x10\x13\x0c\x21\x1d\x27\x18\x27\
-\x10\x23\x02\xfe\x58\x4c\x1f\x4e\x54\x7e\x73\x6b\x2f\xfe\x58\x52\
-\x1e\x4e\x4e\x00\x01\x00\xaa\x04\x75\x04\x37\x05\x68\x00\x13\x00\
-\x45\x00\xb0\x0d\x2f\xb0\x00\x33\xb1\x06\x03\xe9\xb3\x10\x06\x0d\
-\x08\x2b\xb1\x03\x07\xe9\xb0\x09\x32\x01\xb0\x14\x2f\xb0\x00\xd6\
-\xb4\x13\x16\x00\x32\x04\x2b\xb0\x13\x10\xb1\x09\x01\x2b\xb4\x0a\
-\x16\x00\x32\x04\x2b\xb1\x15\x01\x2b\xb1\x09\x13\x11\x12\xb1\x03\
-\x0d\x39\x39\x00\x30\x31\x13\x3e\x01\x33\x32\x16\x33\x32\x36\x37\
-\x33\x0e\x01\x23\x22\x26\x23\x22\x06\x07\xaa\x04\x98\x68\x48\xfc\
-\x3f\x35\x4e\x06\x7d\x04\x97\x69\x48\xfb\x40\x35\x4e\x06\x04\x75\
-\x6d\x86\x74\x39\x3b\x6d\x86\x77\x3c\x3b\x00\x00\x02\x00\xf0\xfe\
-\x71\x01\x9c\x04\x39\x00\x04\x00\x08\x00\x3c\x00\xb0\x00\x2f\xb0\
-\x05\x2f\xb1\x06\x04\xe9\x01\xb0\x09\x2f\xb0\x00\xd6\xb0\x05\x32\
-\xb1\x04\x14\xe9\xb0\x07\x32\xb1\x08\x14\xe9\xb0\x03\x32\xb3\x01\
-\x08\x00\x08\x2b\xb1\x02\x0f\xe9\xb1\x0a\x01\x2b\x00\xb1\x05\x00\
-\x11\x12\xb0\x01\x39\x30\x31\x1b\x01\x33\x13\x17\x03\x35\x33\x15\
-\xf0\x10\x89\x11\x02\xac\xac\xfe\x71\x04\x62\xfc\x08\x6a\x05\x1c\
-\xac\xac\x00\x00\x02\x00\x48\xff\x39\x03\xc5\x04\x60\x00\x20\x00\
-\x27\x00\x77\x00\xb2\x1b\x00\x00\x2b\xb0\x1e\x33\xb1\x16\x08\xe9\
-\xb0\x24\x32\xb2\x1b\x16\x0a\x2b\xb3\x40\x1b\x1d\x09\x2b\xb2\x06\
-\x01\x00\x2b\xb0\x03\x33\xb1\x15\x08\xe9\xb0\x25\x32\xb2\x06\x15\
-\x0a\x2b\xb3\x40\x06\x04\x09\x2b\x01\xb0\x28\x2f\xb0\x00\xd6\xb1\
-\x21\x0d\xe9\xb0\x21\x10\xb1\x1d\x01\x2b\xb1\x03\x24\x32\x32\xb4\
-\x1c\x16\x00\x33\x04\x2b\xb1\x05\x15\x32\x32\xb1\x29\x01\x2b\x00\
-\xb1\x16\x1b\x11\x12\xb0\x19\x39\xb0\x15\x11\xb2\x00\x0a\x18\x39\
-\x39\x39\xb0\x06\x12\xb0\x09\x39\x30\x31\x13\x34\x12\x37\x35\x33\
-\x15\x1e\x01\x17\x07\x2e\x09\x27\x11\x36\x37\x17\x06\x07\x15\x23\
-\x35\x26\x02\x37\x14\x16\x17\x11\x0e\x01\x48\xeb\xc7\x79\x60\x7d\
-\x68\x16\x04\x2f\x09\x29\x0c\x25\x14\x25\x1f\x2b\x16\xa4\xa1\x0d\
-\xa6\xac\x79\xc3\xef\x9f\x98\x7b\x89\x8a\x01\xc7\xb0\x01\x1a\x1b\
-\xb4\xb2\x02\x23\x33\x87\x02\x18\x05\x12\x04\x0e\x05\x0a\x04\x04\
-\x02\xfd\x44\x0e\x5e\x89\x5a\x0c\xb3\xb5\x19\x01\x12\xb0\x87\xb9\
-\x16\x02\xb4\x19\xca\x00\x00\x00\x02\x00\x71\xff\xe9\x04\xe1\x06\
-\x1b\x00\x38\x00\x45\x00\xcb\x00\xb2\x36\x00\x00\x2b\xb0\x31\x33\
-\xb1\x3b\x03\xe9\xb0\x2b\x32\xb2\x1b\x02\x00\x2b\xb1\x0f\x03\xe9\
-\xb2\x1b\x0f\x0a\x2b\xb3\x00\x1b\x15\x09\x2b\xb4\x44\x03\x36\x1b\
-\x0d\x2b\xb0\x2d\x33\xb1\x44\x03\xe9\xb4\x0a\x09\x36\x1b\x0d\x2b\
-\xb0\x21\x33\xb1\x0a\x06\xe9\xb0\x1f\x32\x01\xb0\x46\x2f\xb0\x00\
-\xd6\xb1\x39\x11\xe9\xb0\x39\x10\xb1\x07\x01\x2b\xb0\x0b\x32\xb1\
-\x23\x0d\xe9\xb0\x1e\x32\xb2\x23\x07\x0a\x2b\xb3\x40\x23\x21\x09\
-\x2b\xb2\x07\x23\x0a\x2b\xb3\x40\x07\x09\x09\x2b\xb0\x23\x10\xb1\
-\x18\x01\x2b\xb1\x13\x0d\xe9\xb0\x13\x10\xb0\x2e\x20\xd6\x11\xb1\
-\x2d\x0d\xe9\xb0\x2d\x2f\xb1\x2e\x0d\xe9\xb1\x47\x01\x2b\xb1\x07\
-\x39\x11\x12\xb2\x03\x36\x42\x39\x39\x39\xb0\x23\x11\xb1\x25\x34\
-\x39\x39\xb0\x18\x12\xb3\x0f\x27\x2b\x31\x24\x17\x39\x00\xb1\x44\
-\x3b\x11\x12\xb1\x00\x34\x39\x39\xb0\x03\x11\xb1\x25\x27\x39\x39\
-\x30\x31\x37\x34\x36\x33\x32\x17\x36\x35\x11\x23\x35\x33\x11\x34\
-\x36\x33\x32\x1e\x01\x15\x14\x23\x22\x27\x23\x2e\x01\x23\x22\x06\
-\x15\x11\x33\x15\x23\x11\x14\x07\x1e\x04\x33\x32\x37\x33\x0e\x01\
-\x23\x22\x26\x27\x06\x23\x22\x26\x37\x14\x17\x32\x3e\x03\x3f\x01\
-\x26\x23\x22\x71\x97\x6f\x21\x47\x08\x93\x93\xe6\x85\x6f\xa3\x44\
-\x48\x3b\x0c\x11\x02\x6c\x46\x4e\x7f\xcd\xcd\x16\x06\x4e\x41\x5c\
-\x5a\x25\x60\x01\x9f\x04\xbc\x81\x4a\x89\xa6\x6d\x9b\x48\x66\x99\
-\x1d\x0e\x1f\x16\x19\x0e\x07\x06\x39\x23\x38\x77\x4e\x64\x0e\x4a\
-\x28\x01\x1b\x77\x01\x1c\xf0\xf0\x96\xc2\x63\x52\x46\xb6\x94\x9c\
-\xbe\xfe\xdb\x77\xfe\xe3\x5e\x48\x02\x27\x1c\x25\x15\xc3\x8f\xb1\
-\x32\x4d\x7f\x51\x43\x14\x01\x09\x08\x0e\x0a\x07\x04\x0e\x00\x00\
-\x02\xff\xc9\x00\x00\x05\x8d\x05\x8d\x00\x32\x00\x35\x00\x7c\x00\
-\xb2\x2d\x00\x00\x2b\xb2\x13\x02\x00\x2b\xb0\x17\x33\xb4\x2f\x02\
-\x2d\x13\x0d\x2b\xb0\x23\x33\xb1\x2f\x03\xe9\xb0\x28\x32\xb4\x11\
-\x06\x2d\x13\x0d\x2b\xb1\x20\x33\x33\x33\xb1\x11\x03\xe9\xb1\x15\
-\x19\x32\x32\x01\xb0\x36\x2f\xb0\x2d\xd6\xb0\x03\x32\xb1\x2c\x15\
-\xe9\xb0\x22\x32\xb2\x2c\x2d\x0a\x2b\xb3\x40\x2c\x26\x09\x2b\xb0\
-\x1c\x32\xb2\x2d\x2c\x0a\x2b\xb3\x40\x2d\x00\x09\x2b\xb0\x0b\x32\
-\xb1\x37\x01\x2b\xb1\x2c\x2d\x11\x12\xb2\x15\x33\x35\x39\x39\x39\
-\x00\xb1\x06\x02\x11\x12\xb0\x34\x39\x30\x31\x03\x34\x37\x21\x35\
-\x27\x21\x22\x26\x27\x26\x35\x34\x3b\x01\x32\x36\x33\x21\x01\x33\
-\x01\x33\x01\x33\x01\x21\x32\x15\x14\x07\x06\x23\x21\x07\x15\x21\
-\x32\x15\x14\x07\x06\x23\x21\x11\x23\x11\x21\x22\x27\x26\x01\x17\
-\x37\x37\x52\x02\x37\x71\xfe\x44\x2b\x1d\x0e\x06\x54\x10\x02\x0a\
-\x02\x01\x50\xfe\x7b\xd9\x01\x7f\xbd\x01\x81\xb4\xfe\x7d\x01\x6c\
-\x54\x1e\x12\x2c\xfe\x46\x73\x02\x37\x52\x2d\x0e\x1d\xfd\xcf\xb2\
-\xfd\xcf\x1b\x0e\x2f\x02\xe9\x0a\x0d\x01\x83\x3f\x01\x76\xa4\x0f\
-\x16\x0c\x0d\x3f\x02\x02\x31\xfd\xcf\x02\x31\xfd\xcf\x41\x25\x0f\
-\x0a\xa4\x76\x40\x2d\x0e\x04\xfe\xbc\x01\x44\x04\x0e\x01\x87\x14\
-\x14\x00\x00\x00\x02\x00\x5a\xfe\x5c\x02\xfe\x05\xdd\x00\x3d\x00\
-\x4f\x00\x6c\x00\xb0\x3c\x2f\xb1\x05\x03\xe9\xb0\x23\x2f\xb1\x1b\
-\x03\xe9\x01\xb0\x50\x2f\xb0\x14\xd6\xb0\x18\x32\xb1\x3e\x0d\xe9\
-\xb0\x26\x32\xb0\x3e\x10\xb1\x08\x01\x2b\xb0\x47\x32\xb1\x39\x0d\
-\xe9\xb1\x1d\x33\x32\x32\xb1\x51\x01\x2b\xb1\x3e\x14\x11\x12\xb0\
-\x16\x39\xb0\x08\x11\xb4\x05\x0e\x1b\x23\x2d\x24\x17\x39\xb0\x39\
-\x12\xb1\x1f\x35\x39\x39\x00\xb1\x23\x05\x11\x12\xb6\x00\x01\x18\
-\x1f\x39\x44\x4d\x24\x17\x39\xb0\x1b\x11\xb0\x1d\x39\x30\x31\x13\
-\x37\x16\x17\x16\x33\x32\x36\x35\x34\x2e\x04\x27\x2e\x03\x35\x34\
-\x37\x26\x35\x34\x36\x33\x32\x17\x0f\x01\x26\x27\x26\x23\x22\x06\
-\x15\x14\x1e\x05\x17\x1e\x03\x15\x14\x07\x1e\x02\x15\x14\x06\x23\
-\x26\x13\x14\x1e\x03\x33\x32\x36\x35\x34\x2e\x03\x23\x22\x06\x5a\
-\x19\x4e\x3b\x56\x6a\x56\x4a\x18\x23\x33\x23\x2f\x02\x23\x44\x66\
-\x40\x96\x96\xac\x92\xa2\x8b\x0c\x0d\x4e\x4f\x35\x3e\x54\x4c\x10\
-\x21\x21\x2d\x1b\x27\x02\x23\x43\x66\x40\x96\x2b\x38\x33\xac\x96\
-\xc6\x39\x25\x35\x3c\x27\x06\x25\x45\x25\x35\x3b\x27\x06\x25\x46\
-\xfe\xf0\x8b\x54\x21\x2d\x8d\x50\x29\x48\x2d\x2b\x12\x17\x02\x12\
-\x32\x60\x8d\x50\xb6\x71\x91\x9e\x87\xd5\x77\x4b\x3c\x54\x1b\x12\
-\x8f\x4e\x23\x3f\x2d\x25\x1d\x10\x11\x02\x12\x31\x60\x8e\x50\xb8\
-\x71\x2b\x43\x7b\x44\x87\xd5\x01\x03\xd0\x33\x56\x33\x27\x0f\x7f\
-\x52\x33\x57\x33\x25\x0e\x7d\x00\x02\x00\xdc\x04\x91\x03\x23\x05\
-\x48\x00\x03\x00\x07\x00\x2f\x00\xb0\x00\x2f\xb0\x04\x33\xb1\x01\
-\x04\xe9\xb0\x05\x32\xb1\x01\x04\xe9\x01\xb0\x08\x2f\xb0\x00\xd6\
-\xb1\x03\x0e\xe9\xb0\x03\x10\xb1\x04\x01\x2b\xb1\x07\x0e\xe9\xb1\
-\x09\x01\x2b\x00\x30\x31\x13\x35\x33\x15\x33\x35\x33\x15\xdc\xb8\
-\xd7\xb8\x04\x91\xb7\xb7\xb7\xb7\x00\x00\x00\x00\x03\x00\x71\xfd\
-\xd3\x08\x6f\x06\x2d\x00\x0f\x00\x1f\x00\x3f\x00\x87\x00\xb2\x3d\
-\x00\x00\x2b\xb1\x35\x08\xe9\xb0\x0d\x2f\xb4\x14\x0c\x00\x17\x04\
-\x2b\xb0\x2f\x2f\xb1\x23\x08\xe9\xb0\x23\x10\xb0\x25\x20\xd6\x11\
-\xb1\x26\x04\xe9\xb0\x1d\x2f\xb4\x04\x0c\x00\x17\x04\x2b\x01\xb0\
-\x40\x2f\xb0\x01\xd6\xb4\x10\x16\x00\x14\x04\x2b\xb0\x10\x10\xb1\
-\x20\x01\x2b\xb1\x32\x0e\xe9\xb0\x32\x10\xb1\x18\x01\x2b\xb4\x09\
-\x16\x00\x14\x04\x2b\xb1\x41\x01\x2b\xb1\x18\x32\x11\x12\xb7\x0d\
-\x14\x04\x1d\x23\x25\x3a\x3d\x24\x17\x39\x00\xb1\x35\x3d\x11\x12\
-\xb0\x3a\x39\xb0\x26\x11\xb7\x01\x00\x10\x18\x09\x20\x32\x39\x24\
-\x17\x39\x30\x31\x36\x10\x08\x01\x21\x32\x04\x00\x12\x15\x10\x08\
-\x01\x21\x20\x00\x03\x10\x08\x01\x33\x32\x08\x01\x11\x34\x02\x00\
-\x24\x23\x20\x00\x01\x34\x00\x21\x32\x17\x07\x2e\x07\x23\x22\x04\
-\x15\x14\x04\x33\x32\x3e\x01\x37\x17\x0e\x01\x23\x20\x00\x71\x01\
-\x18\x01\xd7\x01\x11\xc9\x01\x76\x01\x17\xa8\xfe\xe5\xfe\x2b\xfe\
-\xf0\xfe\xf2\xfe\x2a\xc8\x01\x04\x01\xae\xf8\xfe\x01\xb2\x01\x00\
-\x9c\xff\x00\xfe\xa8\xb6\xfe\x7b\xfd\xd5\x01\x8b\x01\x87\x01\x2f\
-\x8d\x9a\x1d\x06\x27\x10\x25\x16\x29\x23\x2f\x1b\xdb\xfe\xdf\x01\
-\x1d\xe5\x4c\x73\x2f\x41\x0d\x58\x77\x71\xfe\xd9\xfe\x73\xd7\x02\
-\x52\x01\xee\x01\x16\xa4\xfe\xe8\xfe\x6e\xdf\xfe\xd7\xfe\x10\xfe\
-\xec\x01\x16\x03\x17\xfe\xee\xfe\x37\xff\x00\x01\x04\x01\xc7\x01\
-\x10\xcf\x01\x73\x01\x02\x97\xfd\xbf\xfe\x58\xdb\x01\x43\x31\xaa\
-\x04\x19\x08\x15\x08\x0c\x06\x04\xfa\xa1\xa0\xfc\x1b\x18\x27\x8d\
-\x2f\x21\x01\x42\x00\x00\x00\x00\x03\x00\x33\x02\x2f\x03\x5a\x06\
-\x21\x00\x0e\x00\x2a\x00\x34\x00\x54\x00\xb2\x18\x02\x00\x2b\xb1\
-\x1f\x06\xe9\xb0\x08\x2f\xb1\x02\x03\xe9\xb0\x27\x2f\xb1\x2e\x03\
-\xe9\xb0\x32\x2f\xb1\x14\x0c\xe9\xb0\x1c\x2f\x01\xb0\x35\x2f\xb0\
-\x32\xd6\xb1\x14\x24\x32\x32\xb1\x22\x0d\xe9\xb2\x32\x22\x0a\x2b\
-\xb3\x40\x32\x0f\x09\x2b\xb1\x36\x01\x2b\x00\xb1\x2e\x27\x11\x12\
-\xb1\x23\x25\x39\x39\xb0\x32\x11\xb0\x0f\x39\x30\x31\x13\x34\x33\
-\x21\x32\x15\x14\x07\x21\x22\x06\x23\x22\x2e\x01\x13\x34\x3e\x02\
-\x33\x35\x34\x26\x23\x22\x0e\x01\x07\x27\x36\x33\x32\x16\x15\x11\
-\x23\x35\x06\x07\x22\x2e\x01\x37\x1e\x01\x33\x32\x36\x3f\x01\x0e\
-\x01\x33\x52\x02\x81\x54\x50\xfd\x90\x04\x11\x04\x1f\x25\x0a\x27\
-\x73\xb2\x73\x2f\x4a\x31\x3b\x69\x2f\x29\x0c\x7b\x8d\x77\xa6\x9c\
-\x87\x96\x3f\x56\x1b\x98\x02\x4e\x2f\x3f\x64\x0b\x02\xb4\x77\x02\
-\x6f\x3f\x3f\x3d\x01\x02\x1b\x19\x01\x55\x3b\x53\x1e\x0b\x49\x81\
-\x6f\x25\x23\x21\x8c\x56\xbb\xa5\xfe\x3f\x44\x5a\x01\x52\x56\x27\
-\x27\x29\x44\x39\x21\x08\x21\x00\x02\x00\xe1\x00\x00\x04\x85\x03\
-\x83\x00\x05\x00\x0b\x00\x14\x00\xb2\x05\x00\x00\x2b\xb0\x0a\x33\
-\x01\xb0\x0c\x2f\xb1\x0d\x01\x2b\x00\x30\x31\x13\x01\x33\x09\x01\
-\x23\x03\x01\x33\x09\x01\x23\xe1\x01\xd1\x7f\xfe\x50\x01\xb0\x7f\
-\x7d\x01\xd3\x7d\xfe\x52\x01\xae\x7d\x01\xc3\x01\xc0\xfe\x3e\xfe\
-\x3f\x01\xc3\x01\xc0\xfe\x3e\xfe\x3f\x00\x00\x00\x01\x00\x73\x00\
-\x58\x04\xe1\x02\xd1\x00\x0b\x00\x36\x00\xb0\x0b\x2f\xb4\x02\x0c\
-\x00\x17\x04\x2b\xb2\x0b\x02\x0a\x2b\xb3\x00\x0b\x08\x09\x2b\x01\
-\xb0\x0c\x2f\xb0\x09\xd6\xb4\x06\x16\x00\x14\x04\x2b\xb2\x09\x06\
-\x0a\x2b\xb3\x00\x09\x01\x09\x2b\xb1\x0d\x01\x2b\x00\x30\x31\x12\
-\x34\x33\x21\x32\x15\x11\x14\x22\x35\x11\x21\x73\x45\x03\xf2\x37\
-\x52\xfc\x25\x02\x7f\x52\x3b\xfd\xfb\x39\x3e\x01\xe9\x00\x00\x00\
-\x01\x00\x14\x01\x8b\x02\x35\x02\x04\x00\x03\x00\x00\x13\x35\x21\
-\x15\x14\x02\x21\x01\x8b\x79\x79\x00\x00\x00\x00\x04\x00\x71\xfd\
-\xd3\x08\x6f\x06\x2d\x00\x0f\x00\x1f\x00\x2e\x00\x3d\x00\x91\x00\
-\xb2\x20\x00\x00\x2b\xb0\x2a\x33\xb0\x0d\x2f\xb4\x14\x0c\x00\x17\
-\x04\x2b\xb0\x2d\x2f\xb1\x2f\x03\xe9\xb0\x3c\x2f\xb1\x21\x05\xe9\
-\xb0\x1d\x2f\xb4\x04\x0c\x00\x17\x04\x2b\x01\xb0\x3e\x2f\xb0\x01\
-\xd6\xb4\x10\x16\x00\x14\x04\x2b\xb0\x10\x10\xb1\x20\x01\x2b\xb1\
-\x2e\x15\xe9\xb0\x2f\x32\xb2\x2e\x20\x0a\x2b\xb3\x40\x2e\x26\x09\
-\x2b\xb0\x2e\x10\xb1\x18\x01\x2b\xb4\x09\x16\x00\x14\x04\x2b\xb1\
-\x3f\x01\x2b\xb1\x18\x2e\x11\x12\xb5\x0d\x14\x04\x1d\x2a\x34\x24\
-\x17\x39\x00\xb1\x2d\x20\x11\x12\xb0\x00\x39\xb0\x2f\x11\xb3\x10\
-\x18\x29\x09\x24\x17\x39\xb0\x3c\x12\xb1\x01\x26\x39\x39\x30\x31\
-\x36\x10\x08\x01\x21\x32\x04\x00\x12\x15\x10\x08\x01\x21\x20\x00\
-\x03\x10\x08\x01\x33\x32\x08\x01\x11\x34\x02\x00\x24\x23\x20\x00\
-\x01\x11\x21\x32\x17\x16\x15\x14\x06\x07\x01\x23\x01\x21\x19\x01\
-\x33\x32\x37\x36\x37\x2e\x03\x27\x26\x23\x21\x07\x71\x01\x18\x01\
-\xd7\x01\x11\xc9\x01\x76\x01\x17\xa8\xfe\xe5\xfe\x2b\xfe\xf0\xfe\
-\xf2\xfe\x2a\xc8\x01\x04\x01\xae\xf8\xfe\x01\xb2\x01\x00\x9c\xff\
-\x00\xfe\xa8\xb6\xfe\x7b\xfd\xd5\x02\x00\x01\xca\xd9\x90\xb2\xbf\
-\x8b\x01\x83\xb8\xfe\x98\xfe\xb2\xfc\xc3\x59\x6f\x08\x02\x04\x19\
-\x41\x33\x52\x98\xfe\xf0\x02\xd7\x02\x52\x01\xee\x01\x16\xa4\xfe\
-\xe8\xfe\x6e\xdf\xfe\xd7\xfe\x10\xfe\xec\x01\x16\x03\x17\xfe\xee\
-\xfe\x37\xff\x00\x01\x04\x01\xc7\x01\x10\xcf\x01\x73\x01\x02\x97\
-\xfd\xbf\xfc\x66\x03\xe3\x41\x54\x7d\x60\x8e\x1e\xfe\x3b\x01\xb2\
-\xfe\x4e\x02\x31\x23\x29\x52\x12\x13\x2b\x27\x10\x1b\x75\x00\x00\
-\x01\x00\x8d\x04\xf2\x03\x6f\x05\x75\x00\x03\x00\x17\x00\xb0\x00\
-\x2f\xb1\x01\x08\xe9\xb1\x01\x08\xe9\x01\xb0\x04\x2f\xb1\x05\x01\
-\x2b\x00\x30\x31\x13\x35\x21\x15\x8d\x02\xe2\x04\xf2\x83\x83\x00\
-\x02\x00\x71\x03\xc7\x02\x37\x05\x8d\x00\x0b\x00\x17\x00\x4e\x00\
-\xb2\x03\x02\x00\x2b\xb4\x15\x0c\x00\x17\x04\x2b\xb0\x09\x2f\xb4\
-\x0f\x0c\x00\x17\x04\x2b\x01\xb0\x18\x2f\xb0\x00\xd6\xb4\x0c\x16\
-\x00\x14\x04\x2b\xb0\x0c\x10\xb1\x12\x01\x2b\xb4\x06\x16\x00\x14\
-\x04\x2b\xb1\x19\x01\x2b\xb1\x12\x0c\x11\x12\xb1\x09\x03\x39\x39\
-\x00\xb1\x15\x0f\x11\x12\xb1\x06\x00\x39\x39\x30\x31\x13\x34\x36\
-\x33\x32\x16\x15\x14\x06\x23\x22\x26\x37\x14\x16\x33\x32\x36\x35\
-\x34\x26\x23\x22\x06\x71\x85\x5e\x60\x83\x85\x5e\x60\x83\x52\x51\
-\x40\x3b\x54\x52\x3d\x3b\x56\x04\xaa\x5e\x85\x89\x5a\x5e\x85\x89\
-\x5a\x39\x56\x52\x3d\x39\x58\x54\x00\x00\x00\x00\x01\x00\x73\x00\
-\x00\x05\xc5\x05\x52\x00\x1b\x00\x57\x00\xb2\x1a\x00\x00\x2b\xb4\
-\x02\x0c\x00\x17\x04\x2b\xb0\x14\x32\xb0\x05\x2f\xb0\x12\x33\xb4\
-\x08\x0c\x00\x17\x04\x2b\xb0\x0e\x32\x01\xb0\x1c\x2f\xb0\x03\xd6\
-\xb0\x09\x32\xb4\x14\x16\x00\x14\x04\x2b\xb0\x0d\x32\xb2\x14\x03\
-\x0a\x2b\xb3\x40\x14\x17\x09\x2b\xb0\x10\x32\xb2\x03\x14\x0a\x2b\
-\xb3\x40\x03\x00\x09\x2b\xb0\x06\x32\xb1\x1d\x01\x2b\x00\x30\x31\
-\x37\x34\x33\x21\x11\x21\x22\x34\x33\x21\x11\x34\x36\x15\x11\x21\
-\x32\x16\x23\x21\x11\x21\x16\x17\x14\x23\x21\x22\x73\x39\x02\x46\
-\xfd\xbe\x3d\x3b\x02\x44\x52\x02\x41\x3f\x01\x3e\xfd\xbd\x02\x4b\
-\x33\x01\x3a\xfb\x23\x39\x25\x2d\x02\x2f\x52\x02\x41\x3d\x01\x3b\
-\xfd\xbc\x52\xfd\xd1\x02\x27\x29\x00\x00\x00\x00\x01\x01\x85\x04\
-\x14\x03\x35\x05\x1f\x00\x03\x00\x20\x00\xb0\x00\x2f\xb4\x01\x04\
-\x00\x10\x04\x2b\x01\xb0\x04\x2f\xb0\x00\xd6\xb4\x02\x0e\x00\x0a\
-\x04\x2b\xb1\x05\x01\x2b\x00\x30\x31\x09\x01\x33\x01\x01\x85\x01\
-\x11\x9f\xfe\xcf\x04\x14\x01\x0b\xfe\xf5\x00\x00\x01\x00\xa4\xfe\
-\x71\x03\x7d\x03\x8f\x00\x15\x00\x4d\x00\xb2\x0f\x00\x00\x2b\xb2\
-\x12\x00\x00\x2b\xb1\x06\x05\xe9\xb2\x01\x01\x00\x2b\xb0\x0c\x33\
-\xb0\x00\x2f\x01\xb0\x16\x2f\xb0\x00\xd6\xb1\x15\x0d\xe9\xb0\x02\
-\x32\xb0\x15\x10\xb1\x0b\x01\x2b\xb0\x0f\x32\xb1\x0e\x0d\xe9\xb1\
-\x17\x01\x2b\xb1\x0b\x15\x11\x12\xb0\x12\x39\x00\xb1\x01\x06\x11\
-\x12\xb0\x10\x39\x30\x31\x13\x11\x33\x11\x1e\x01\x33\x32\x36\x37\
-\x36\x35\x11\x33\x11\x23\x35\x06\x23\x22\x27\x11\xa4\xa0\x02\x3f\
-\x62\x6a\x82\x08\x02\xa0\x9c\x8b\xd9\x14\x25\xfe\x71\x05\x1e\xfd\
-\x52\x48\x3d\x71\x4a\x14\x27\x02\x3d\xfc\x71\x62\x79\x05\xfe\x83\
-\x00\x00\x00\x00\x01\x00\x71\xfe\x72\x04\xa6\x05\xc7\x00\x19\x00\
-\x4c\x00\xb0\x11\x2f\xb0\x0a\x33\xb4\x05\x0c\x00\x17\x04\x2b\xb2\
-\x11\x05\x0a\x2b\xb3\x40\x11\x0e\x09\x2b\xb0\x13\x32\x01\xb0\x1a\
-\x2f\xb0\x15\xd6\xb4\x12\x16\x00\x14\x04\x2b\xb0\x12\x10\xb4\x00\
-\x0e\x00\x07\x04\x2b\xb0\x00\x2f\xb0\x12\x10\xb1\x0f\x01\x2b\xb4\
-\x0c\x16\x00\x14\x04\x2b\xb1\x1b\x01\x2b\x00\x30\x31\x13\x34\x3e\
-\x02\x33\x21\x32\x17\x16\x07\x23\x11\x14\x22\x35\x11\x23\x11\x14\
-\x26\x35\x11\x26\x24\x26\x71\x3d\x79\xd9\x8b\x01\xdd\x31\x0d\x06\
-\x39\x75\x52\x8d\x52\x91\xfe\xf7\xc2\x03\xdf\x4e\xa4\x95\x61\x1f\
-\x31\x02\xf9\x39\x3b\x3b\x06\xc7\xf9\x3f\x42\x01\x3b\x03\x46\x08\
-\x64\xe3\x00\x00\x01\x00\x96\x01\x66\x01\x4e\x02\x1d\x00\x03\x00\
-\x22\x00\xb0\x00\x2f\xb1\x01\x04\xe9\xb1\x01\x04\xe9\x01\xb0\x04\
-\x2f\xb0\x00\xd6\xb1\x03\x0e\xe9\xb1\x03\x0e\xe9\xb1\x05\x01\x2b\
-\x00\x30\x31\x13\x35\x33\x15\x96\xb8\x01\x66\xb7\xb7\x00\x00\x00\
-\x01\x00\xf0\xfe\x77\x02\x04\xff\xd1\x00\x03\x00\x20\x00\xb0\x00\
-\x2f\xb4\x01\x04\x00\x0c\x04\x2b\x01\xb0\x04\x2f\xb0\x00\xd6\xb4\
-\x02\x0e\x00\x0f\x04\x2b\xb1\x05\x01\x2b\x00\x30\x31\x1b\x01\x33\
-\x03\xf0\x97\x7d\x85\xfe\x77\x01\x5a\xfe\xa6\x00\x03\x00\x33\x02\
-\x2f\x03\x5a\x06\x21\x00\x0e\x00\x1a\x00\x26\x00\x5d\x00\xb2\x24\
-\x02\x00\x2b\xb1\x12\x03\xe9\xb0\x08\x2f\xb1\x02\x03\xe9\xb0\x18\
-\x2f\xb1\x1e\x08\xe9\x01\xb0\x27\x2f\xb0\x0f\xd6\xb1\x1b\x0d\xe9\
-\xb0\x1b\x10\xb1\x21\x01\x2b\xb1\x15\x0d\xe9\xb1\x28\x01\x2b\xb1\
-\x1b\x0f\x11\x12\xb0\x0b\x39\xb0\x21\x11\xb1\x18\x12\x39\x39\xb0\
-\x15\x12\xb0\x07\x39\x00\xb1\x02\x08\x11\x12\xb0\x00\x39\xb1\x24\
-\x1e\x11\x12\xb1\x15\x0f\x39\x39\x30\x31\x13\x34\x33\x21\x32\x15\
-\x14\x07\x21\x22\x06\x23\x22\x2e\x01\x13\x34\x36\x33\x32\x16\x15\
-\x14\x06\x23\x22\x26\x37\x14\x16\x33\x32\x36\x35\x34\x26\x23\x22\
-\x06\x33\x52\x02\x81\x54\x50\xfd\x90\x04\x11\x04\x1f\x25\x0a\x0a\
-\xe0\xaa\xa6\xe3\xec\x9d\xa0\xea\xa2\x81\x69\x56\x8f\x8f\x58\x5a\
-\x8e\x02\x6f\x3f\x3f\x3d\x01\x02\x1b\x19\x02\x1a\xa6\xfe\xfe\xa6\
-\xac\xe8\xe8\xbe\x85\x9d\x8b\x97\x91\x84\x86\x00\x02\x00\xcd\x00\
-\x00\x04\x71\x03\x83\x00\x05\x00\x0b\x00\x14\x00\xb2\x00\x00\x00\
-\x2b\xb0\x06\x33\x01\xb0\x0c\x2f\xb1\x0d\x01\x2b\x00\x30\x31\x33\
-\x09\x01\x33\x09\x01\x33\x09\x01\x33\x09\x01\xcd\x01\xae\xfe\x52\
-\x7d\x01\xd3\xfe\x2d\xd7\x01\xb0\xfe\x50\x7f\x01\xd1\xfe\x2f\x01\
-\xc3\x01\xc0\xfe\x3e\xfe\x3f\x01\xc3\x01\xc0\xfe\x3e\xfe\x3f\x00\
-\x02\x00\x71\xfe\x5c\x03\x54\x04\x39\x00\x1f\x00\x23\x00\x60\x00\
-\xb0\x1d\x2f\xb1\x18\x03\xe9\xb0\x20\x2f\xb1\x21\x04\xe9\x01\xb0\
-\x24\x2f\xb0\x00\xd6\xb1\x16\x0d\xe9\xb0\x16\x10\xb1\x09\x01\x2b\
-\xb1\x0c\x0f\xe9\xb3\x3c\x09\x20\x0e\x2b\xb1\x23\x14\xe9\xb1\x25\
-\x01\x2b\xb1\x16\x00\x11\x12\xb0\x05\x39\xb0\x20\x11\xb0\x0e\x39\
-\xb1\x0c\x09\x11\x12\xb1\x18\x1d\x39\x39\x00\xb1\x18\x1d\x11\x12\
-\xb0\x1b\x39\xb0\x20\x11\xb2\x00\x0a\x1a\x39\x39\x39\x30\x31\x17\
-\x34\x3e\x04\x37\x36\x03\x35\x33\x15\x10\x07\x0e\x06\x15\x14\x33\
-\x32\x37\x17\x06\x23\x22\x26\x01\x35\x33\x15\x71\x0c\x10\x21\x13\
-\x26\x05\x96\x01\x89\xa0\x08\x20\x0b\x14\x06\x0b\x02\xb9\xb4\xa8\
-\x2f\xb8\xd3\xba\x9e\x01\x00\xac\x58\x2b\x4a\x2f\x33\x14\x29\x07\
-\xb0\x01\x08\x58\x3d\xfe\xb8\xd7\x0a\x2b\x0f\x21\x12\x23\x25\x18\
-\xc7\x77\x83\x71\xc5\x04\x6c\xac\xac\x00\x00\x00\x03\x00\x37\x00\
-\x00\x05\x19\x06\xcd\x00\x07\x00\x13\x00\x18\x00\x2c\x00\xb2\x00\
-\x00\x00\x2b\xb0\x03\x33\xb2\x01\x02\x00\x2b\xb4\x06\x14\x00\x01\
-\x0d\x2b\xb1\x06\x05\xe9\x01\xb0\x19\x2f\xb1\x1a\x01\x2b\x00\xb1\
-\x01\x14\x11\x12\xb0\x17\x39\x30\x31\x33\x01\x33\x01\x23\x03\x21\
-\x03\x13\x33\x32\x16\x17\x23\x22\x23\x07\x22\x27\x26\x03\x21\x02\
-\x27\x06\x37\x02\x17\xb6\x02\x15\xbd\x9e\xfd\xaf\x9c\xb4\xcd\x17\
-\x58\xe9\x96\x02\x04\x04\x17\xce\x61\x2c\x01\xfb\xf2\x0b\x1b\x05\
-\x8d\xfa\x73\x01\xa2\xfe\x5e\x06\xcd\x2f\x8a\x02\x69\x31\xfb\x68\
-\x02\x9e\x4c\x7d\x00\x00\x00\x00\x03\x00\x37\x00\x00\x05\x19\x06\
-\xcd\x00\x07\x00\x0c\x00\x15\x00\x2c\x00\xb2\x00\x00\x00\x2b\xb0\
-\x03\x33\xb2\x01\x02\x00\x2b\xb4\x06\x08\x00\x01\x0d\x2b\xb1\x06\
-\x05\xe9\x01\xb0\x16\x2f\xb1\x17\x01\x2b\x00\xb1\x01\x08\x11\x12\
-\xb0\x0b\x39\x30\x31\x33\x01\x33\x01\x23\x03\x21\x03\x13\x21\x02\
-\x27\x06\x03\x24\x37\x36\x3b\x01\x05\x0f\x01\x37\x02\x17\xb6\x02\
-\x15\xbd\x9e\xfd\xaf\x9c\xc7\x01\xfb\xf2\x0b\x1b\xd3\x01\x31\x0c\
-\x0a\x13\xc9\xfe\xbc\x2d\x1f\x05\x8d\xfa\x73\x01\xa2\xfe\x5e\x02\
-\x14\x02\x9e\x4c\x7d\x01\x93\xb0\x05\x04\xa2\x14\x03\x00\x00\x00\
-\x03\x00\x37\x00\x00\x05\x19\x07\x33\x00\x07\x00\x0e\x00\x13\x00\
-\x2c\x00\xb2\x00\x00\x00\x2b\xb0\x03\x33\xb2\x01\x02\x00\x2b\xb4\
-\x06\x0f\x00\x01\x0d\x2b\xb1\x06\x05\xe9\x01\xb0\x14\x2f\xb1\x15\
-\x01\x2b\x00\xb1\x01\x0f\x11\x12\xb0\x12\x39\x30\x31\x33\x01\x33\
-\x01\x23\x03\x21\x03\x1b\x01\x33\x13\x23\x27\x07\x03\x21\x02\x27\
-\x06\x37\x02\x17\xb6\x02\x15\xbd\x9e\xfd\xaf\x9c\x8c\xfd\x9c\xe3\
-\x7c\xc1\xc1\x43\x01\xfb\xf2\x0b\x1b\x05\x8d\xfa\x73\x01\xa2\xfe\
-\x5e\x05\xd1\x01\x62\xfe\x9e\xfa\xfa\xfc\x43\x02\x9e\x4c\x7d\x00\
-\x03\x00\x37\x00\x00\x05\x19\x07\x1d\x00\x07\x00\x23\x00\x28\x00\
-\x7d\x00\xb2\x00\x00\x00\x2b\xb0\x03\x33\xb2\x01\x02\x00\x2b\xb4\
-\x06\x24\x00\x01\x0d\x2b\xb1\x06\x05\xe9\xb0\x19\x2f\xb0\x08\x33\
-\xb1\x10\x03\xe9\xb0\x1e\x2f\xb1\x0b\x03\xe9\xb0\x15\x32\x01\xb0\
-\x29\x2f\xb0\x08\xd6\xb4\x23\x16\x00\x32\x04\x2b\xb0\x23\x10\xb1\
-\x14\x01\x2b\xb1\x16\x0f\xe9\xb1\x2a\x01\x2b\xb1\x23\x08\x11\x12\
-\xb1\x06\x24\x39\x39\xb0\x14\x11\xb4\x02\x0b\x19\x01\x27\x24\x17\
-\x39\xb0\x16\x12\xb1\x05\x25\x39\x39\x00\xb1\x01\x24\x11\x12\xb0\
-\x27\x39\xb1\x1e\x10\x11\x12\xb1\x0e\x1c\x39\x39\x30\x31\x33\x01\
-\x33\x01\x23\x03\x21\x03\x13\x3e\x01\x33\x32\x1e\x02\x33\x32\x3e\
-\x02\x35\x33\x0e\x01\x23\x22\x2e\x02\x23\x22\x0e\x02\x15\x03\x21\
-\x02\x27\x06\x37\x02\x17\xb6\x02\x15\xbd\x9e\xfd\xaf\x9c\x83\x02\
-\x75\x4e\x2d\x4d\x30\x45\x29\x1b\x21\x0e\x04\x7f\x02\x77\x4e\x2d\
-\x4e\x2d\x47\x29\x1b\x21\x0e\x04\x39\x01\xfb\xf2\x0b\x1b\x05\x8d\
-\xfa\x73\x01\xa2\xfe\x5e\x05\xd1\xa6\xa6\x40\x4e\x3f\x1f\x3f\x40\
-\x2f\xa8\xa4\x3f\x4e\x40\x1f\x42\x3d\x2f\xfc\x43\x02\x9e\x4c\x7d\
-\x00\x00\x00\x00\x04\x00\x37\x00\x00\x05\x19\x06\xcd\x00\x07\x00\
-\x0b\x00\x10\x00\x14\x00\x65\x00\xb2\x00\x00\x00\x2b\xb0\x03\x33\
-\xb2\x01\x02\x00\x2b\xb4\x06\x0c\x00\x01\x0d\x2b\xb1\x06\x05\xe9\
-\xb0\x08\x2f\xb0\x11\x33\xb1\x09\x04\xe9\xb0\x12\x32\x01\xb0\x15\
-\x2f\xb0\x08\xd6\xb1\x0b\x0e\xe9\xb0\x0b\x10\xb1\x11\x01\x2b\xb1\
-\x14\x0e\xe9\xb1\x16\x01\x2b\xb1\x0b\x08\x11\x12\xb0\x0c\x39\xb0\
-\x11\x11\xb2\x01\x02\x0f\x39\x39\x39\xb0\x14\x12\xb1\x05\x0d\x39\
-\x39\x00\xb1\x01\x0c\x11\x12\xb0\x0f\x39\x30\x31\x33\x01\x33\x01\
-\x23\x03\x21\x03\x13\x35\x33\x15\x03\x21\x02\x27\x06\x13\x35\x33\
-\x15\x37\x02\x17\xb6\x02\x15\xbd\x9e\xfd\xaf\x9c\xb5\xb8\xa6\x01\
-\xfb\xf2\x0b\x1b\x9a\xb8\x05\x8d\xfa\x73\x01\xa2\xfe\x5e\x06\x16\
-\xb7\xb7\xfb\xfe\x02\x9e\x4c\x7d\x01\x95\xb7\xb7\x00\x00\x00\x00\
-\x03\x00\x37\x00\x00\x05\x19\x07\x1b\x00\x19\x00\x1e\x00\x29\x00\
-\x5b\x00\xb2\x00\x00\x00\x2b\xb0\x15\x33\xb0\x18\x2f\xb1\x1a\x05\
-\xe9\xb0\x27\x2f\xb1\x0f\x03\xe9\x01\xb0\x2a\x2f\xb0\x0c\xd6\xb1\
-\x1f\x16\xe9\xb0\x1f\x10\xb1\x24\x01\x2b\xb1\x12\x16\xe9\xb1\x2b\
-\x01\x2b\xb1\x1f\x0c\x11\x12\xb0\x03\x39\xb0\x24\x11\xb2\x01\x1d\
-\x0f\x39\x39\x39\xb0\x12\x12\xb0\x14\x39\x00\xb1\x27\x1a\x11\x12\
-\xb5\x0c\x12\x14\x01\x1d\x21\x24\x17\x39\x30\x31\x33\x01\x30\x27\
-\x2e\x07\x35\x34\x36\x33\x32\x16\x15\x14\x07\x01\x23\x03\x21\x03\
-\x13\x21\x02\x27\x06\x03\x14\x16\x32\x36\x35\x34\x26\x23\x22\x06\
-\x37\x01\xf4\x06\x04\x0d\x12\x12\x15\x10\x0d\x08\x83\x61\x62\x81\
-\x5c\x01\xf8\xbd\x9e\xfd\xaf\x9c\xc7\x01\xfb\xf2\x0b\x1b\x52\x44\
-\x5a\x45\x45\x2d\x2b\x46\x05\x31\x02\x04\x0d\x10\x16\x1b\x23\x25\
-\x31\x19\x68\x9c\x9e\x69\x77\x5b\xfa\xbe\x01\xa2\xfe\x5e\x02\x14\
-\x02\x9e\x4c\x7d\x01\x96\x4c\x3e\x3e\x49\x4c\x3e\x3d\x00\x00\x00\
-\x02\x00\x37\x00\x00\x06\x8b\x05\x8d\x00\x16\x00\x1a\x00\x5e\x00\
-\xb2\x13\x00\x00\x2b\xb0\x00\x33\xb1\x0e\x0b\xe9\xb2\x01\x02\x00\
-\x2b\xb1\x06\x08\xe9\xb0\x19\x32\xb4\x15\x17\x13\x01\x0d\x2b\xb1\
-\x15\x05\xe9\xb4\x08\x0b\x13\x01\x0d\x2b\xb1\x08\x03\xe9\x01\xb0\
-\x1b\x2f\xb0\x13\xd6\xb0\x18\x32\xb1\x0c\x0e\xe9\xb0\x07\x32\xb2\
-\x0c\x13\x0a\x2b\xb3\x40\x0c\x02\x09\x2b\xb3\x40\x0c\x0a\x09\x2b\
-\xb3\x40\x0c\x12\x09\x2b\xb1\x1c\x01\x2b\x00\x30\x31\x33\x01\x21\
-\x15\x23\x27\x21\x27\x11\x21\x15\x21\x11\x33\x37\x21\x37\x33\x15\
-\x21\x11\x21\x03\x13\x21\x11\x23\x37\x02\x46\x03\xf2\x61\x2f\xfe\
-\x5c\x2d\x02\x29\xfd\xd7\x85\x32\x01\x4b\x2b\x50\xfc\xcd\xfe\x33\
-\xba\xeb\x01\x9c\x77\x05\x8d\x87\x02\x02\xfe\x19\x7f\xfd\xeb\x02\
-\x02\x93\x01\xc7\xfe\x39\x02\x39\x02\xd1\x00\x00\x02\x00\x87\xfe\
-\x77\x04\xb4\x05\xba\x00\x20\x00\x24\x00\x3d\x00\xb2\x1e\x00\x00\
-\x2b\xb1\x11\x08\xe9\xb2\x03\x02\x00\x2b\xb1\x0b\x08\xe9\x01\xb0\
-\x25\x2f\xb0\x00\xd6\xb1\x0e\x0e\xe9\xb1\x26\x01\x2b\x00\xb1\x11\
-\x1e\x11\x12\xb0\x1b\x39\xb0\x0b\x11\xb2\x00\x08\x1a\x39\x39\x39\
-\xb0\x03\x12\xb0\x07\x39\x30\x31\x13\x10\x00\x21\x32\x1e\x01\x17\
-\x07\x2e\x01\x23\x22\x00\x11\x10\x00\x33\x32\x3e\x06\x37\x17\x0e\
-\x01\x23\x20\x00\x01\x13\x33\x03\x87\x01\x81\x01\x00\x50\x5c\x94\
-\x56\x1f\x5c\x94\x6c\xcd\xfe\xe9\x01\x19\xd1\x27\x46\x31\x3b\x1d\
-\x37\x0e\x3e\x06\x0c\x6f\x9f\x7f\xfe\xdb\xfe\x85\x01\xbf\x97\x7d\
-\x85\x02\xc7\x01\x3f\x01\xb4\x06\x1e\x21\xaa\x39\x33\xfe\x92\xfe\
-\xfe\xfe\xfa\xfe\x95\x06\x06\x15\x08\x21\x08\x27\x04\x8f\x42\x2f\
-\x01\xc3\xfc\xe1\x01\x5a\xfe\xa6\x00\x00\x00\x00\x02\x00\xc1\x00\
-\x00\x04\x71\x06\xcf\x00\x12\x00\x1b\x00\x52\x00\xb2\x00\x00\x00\
-\x2b\xb1\x0e\x0b\xe9\xb2\x01\x02\x00\x2b\xb1\x06\x08\xe9\xb4\x08\
-\x0b\x00\x01\x0d\x2b\xb1\x08\x03\xe9\x01\xb0\x1c\x2f\xb0\x00\xd6\
-\xb1\x0c\x0e\xe9\xb0\x07\x32\xb2\x0c\x00\x0a\x2b\xb3\x40\x0c\x12\
-\x09\x2b\xb3\x40\x0c\x02\x09\x2b\xb3\x40\x0c\x0a\x09\x2b\xb1\x1d\
-\x01\x2b\xb1\x0c\x00\x11\x12\xb0\x13\x39\x00\x30\x31\x33\x11\x21\
-\x15\x23\x27\x21\x27\x11\x21\x15\x21\x11\x33\x37\x21\x37\x33\x15\
-\x01\x33\x32\x16\x17\x23\x22\x27\x26\xc1\x03\x93\x75\x33\xfe\x15\
-\x48\x02\xa4\xfd\x5c\xae\x31\x01\x8d\x2d\x5f\xfc\xb2\xcd\x14\x4e\
-\xf6\xa0\x17\xce\x61\x05\x87\x87\x02\x02\xfe\x1b\x7d\xfd\xed\x02\
-\x02\x93\x06\xcf\x2b\x90\x69\x31\x00\x00\x00\x00\x02\x00\xc1\x00\
-\x00\x04\x71\x06\xcd\x00\x12\x00\x1c\x00\x4a\x00\xb2\x00\x00\x00\
-\x2b\xb1\x0e\x0b\xe9\xb2\x01\x02\x00\x2b\xb1\x06\x08\xe9\xb4\x08\
-\x0b\x00\x01\x0d\x2b\xb1\x08\x03\xe9\x01\xb0\x1d\x2f\xb0\x00\xd6\
-\xb1\x0c\x0e\xe9\xb0\x07\x32\xb2\x0c\x00\x0a\x2b\xb3\x40\x0c\x12\
-\x09\x2b\xb3\x40\x0c\x02\x09\x2b\xb3\x40\x0c\x0a\x09\x2b\xb1\x1e\
-\x01\x2b\x00\x30\x31\x33\x11\x21\x15\x23\x27\x21\x27\x11\x21\x15\
-\x21\x11\x33\x37\x21\x37\x33\x15\x01\x36\x37\x3e\x01\x3b\x01\x05\
-\x0f\x01\xc1\x03\x93\x75\x33\xfe\x15\x48\x02\xa4\xfd\x5c\xae\x31\
-\x01\x8d\x2d\x5f\xfd\x29\x44\x5b\x77\x2f\x17\xc8\xfe\xbd\x2d\x1f\
-\x05\x87\x87\x02\x02\xfe\x1b\x7d\xfd\xed\x02\x02\x93\x06\x14\x27\
-\x36\x46\x16\xa2\x14\x03\x00\x00\x02\x00\xc1\x00\x00\x04\x71\x07\
-\x33\x00\x12\x00\x19\x00\x52\x00\xb2\x00\x00\x00\x2b\xb1\x0e\x0b\
-\xe9\xb2\x01\x02\x00\x2b\xb1\x06\x08\xe9\xb4\x08\x0b\x00\x01\x0d\
-\x2b\xb1\x08\x03\xe9\x01\xb0\x1a\x2f\xb0\x00\xd6\xb1\x0c\x0e\xe9\
-\xb0\x07\x32\xb2\x0c\x00\x0a\x2b\xb3\x40\x0c\x12\x09\x2b\xb3\x40\
-\x0c\x02\x09\x2b\xb3\x40\x0c\x0a\x09\x2b\xb1\x1b\x01\x2b\xb1\x0c\
-\x00\x11\x12\xb0\x13\x39\x00\x30\x31\x33\x11\x21\x15\x23\x27\x21\
-\x27\x11\x21\x15\x21\x11\x33\x37\x21\x37\x33\x15\x09\x01\x33\x01\
-\x23\x27\x07\xc1\x03\x93\x75\x33\xfe\x15\x48\x02\xa4\xfd\x5c\xae\
-\x31\x01\x8d\x2d\x5f\xfc\x97\x01\x00\x7d\x01\x00\x7d\xc2\xc1\x05\
-\x87\x87\x02\x02\xfe\x1b\x7d\xfd\xed\x02\x02\x93\x05\xd1\x01\x62\
-\xfe\x9e\xfa\xfa\x00\x00\x00\x00\x03\x00\xc1\x00\x00\x04\x71\x06\
-\xcb\x00\x12\x00\x16\x00\x1a\x00\x6c\x00\xb2\x00\x00\x00\x2b\xb1\
-\x0e\x0b\xe9\xb2\x01\x02\x00\x2b\xb1\x06\x08\xe9\xb4\x08\x0b\x00\
-\x01\x0d\x2b\xb1\x08\x03\xe9\xb0\x13\x2f\xb0\x17\x33\xb1\x14\x04\
-\xe9\xb0\x18\x32\x01\xb0\x1b\x2f\xb0\x00\xd6\xb1\x0c\x0e\xe9\xb0\
-\x07\x32\xb2\x0c\x00\x0a\x2b\xb3\x40\x0c\x12\x09\x2b\xb3\x40\x0c\
-\x02\x09\x2b\xb3\x40\x0c\x0a\x09\x2b\xb3\x13\x0c\x00\x08\x2b\xb1\
-\x16\x0e\xe9\xb0\x0c\x10\xb1\x17\x01\x2b\xb1\x1a\x0e\xe9\xb1\x1c\
-\x01\x2b\x00\x30\x31\x33\x11\x21\x15\x23\x27\x21\x27\x11\x21\x15\
-\x21\x11\x33\x37\x21\x37\x33\x15\x01\x35\x33\x15\x33\x35\x33\x15\
-\xc1\x03\x93\x75\x33\xfe\x15\x48\x02\xa4\xfd\x5c\xae\x31\x01\x8d\
-\x2d\x5f\xfc\xb4\xb8\xd6\xb8\x05\x87\x87\x02\x02\xfe\x1b\x7d\xfd\
-\xed\x02\x02\x93\x06\x14\xb7\xb7\xb7\xb7\x00\x00\x02\xff\xdf\x00\
-\x00\x02\x02\x06\xcd\x00\x07\x00\x0b\x00\x1d\x00\xb2\x08\x00\x00\
-\x2b\xb2\x09\x02\x00\x2b\x01\xb0\x0c\x2f\xb0\x08\xd6\xb1\x0b\x0e\
-\xe9\xb1\x0d\x01\x2b\x00\x30\x31\x03\x33\x32\x16\x17\x23\x22\x26\
-\x03\x11\x33\x11\x21\xcf\x12\x5d\xe5\x9e\x17\x6c\x1e\xb8\x06\xcd\
-\x33\x86\x34\xf9\xb8\x05\x8d\xfa\x73\x00\x00\x00\x02\x00\x6f\x00\
-\x00\x02\x93\x06\xcd\x00\x08\x00\x0c\x00\x27\x00\xb2\x09\x00\x00\
-\x2b\xb2\x0a\x02\x00\x2b\x01\xb0\x0d\x2f\xb0\x09\xd6\xb1\x0c\x0e\
-\xe9\xb1\x0e\x01\x2b\xb1\x0c\x09\x11\x12\xb1\x08\x07\x39\x39\x00\
-\x30\x31\x13\x24\x37\x36\x3b\x01\x05\x0f\x01\x03\x11\x33\x11\x6f\
-\x01\x31\x0c\x0a\x13\xca\xfe\xbd\x2d\x1f\x43\xb8\x06\x14\xb0\x05\
-\x04\xa2\x14\x03\xf9\xec\x05\x8d\xfa\x73\x00\x00\x02\xff\xdf\x00\
-\x00\x02\x5c\x07\x33\x00\x06\x00\x0a\x00\x29\x00\xb2\x07\x00\x00\
-\x2b\xb2\x08\x02\x00\x2b\x01\xb0\x0b\x2f\xb0\x07\xd6\xb1\x0a\x0e\
-\xe9\xb1\x0c\x01\x2b\xb1\x0a\x07\x11\x12\xb2\x01\x02\x05\x39\x39\
-\x39\x00\x30\x31\x03\x01\x33\x01\x23\x27\x07\x13\x11\x33\x11\x21\
-\x01\x00\x7d\x01\x00\x7d\xc2\xbf\x65\xb8\x05\xd1\x01\x62\xfe\x9e\
-\xfa\xfa\xfa\x2f\x05\x8d\xfa\x73\x00\x00\x00\x00\x03\xff\xfa\x00\
-\x00\x02\x40\x06\xcb\x00\x03\x00\x07\x00\x0b\x00\x40\x00\xb2\x04\
-\x00\x00\x2b\xb2\x05\x02\x00\x2b\xb0\x00\x2f\xb0\x08\x33\xb1\x01\
-\x04\xe9\xb0\x09\x32\x01\xb0\x0c\x2f\xb0\x00\xd6\xb1\x03\x0e\xe9\
-\xb0\x03\x10\xb1\x04\x01\x2b\xb1\x07\x0e\xe9\xb0\x07\x10\xb1\x08\
-\x01\x2b\xb1\x0b\x0e\xe9\xb1\x0d\x01\x2b\x00\x30\x31\x03\x35\x33\
-\x15\x13\x11\x33\x11\x13\x35\x33\x15\x06\xb8\x0f\xb8\x0f\xb8\x06\
-\x14\xb7\xb7\xf9\xec\x05\x8d\xfa\x73\x06\x14\xb7\xb7\x00\x00\x00\
-\x02\x00\x00\x00\x00\x05\x54\x05\x8d\x00\x10\x00\x1f\x00\x67\x00\
-\xb2\x0f\x00\x00\x2b\xb1\x11\x05\xe9\xb2\x03\x02\x00\x2b\xb1\x1a\
-\x05\xe9\xb4\x00\x01\x0f\x03\x0d\x2b\xb0\x1c\x33\xb1\x00\x06\xe9\
-\xb0\x1e\x32\x01\xb0\x20\x2f\xb0\x0f\xd6\xb0\x02\x32\xb1\x11\x15\
-\xe9\xb0\x1a\x32\xb2\x11\x0f\x0a\x2b\xb3\x40\x11\x1e\x09\x2b\xb2\
-\x0f\x11\x0a\x2b\xb3\x40\x0f\x00\x09\x2b\xb0\x11\x10\xb1\x16\x01\
-\x2b\xb1\x09\x15\xe9\xb1\x21\x01\x2b\x00\xb1\x01\x00\x11\x12\xb1\
-\x09\x16\x39\x39\x30\x31\x11\x35\x33\x11\x21\x32\x17\x16\x12\x15\
-\x10\x00\x07\x06\x23\x21\x11\x13\x21\x20\x37\x36\x35\x10\x00\x23\
-\x21\x07\x11\x21\x15\x21\xc3\x01\xf7\xcd\x94\x96\xa3\xfe\xb2\xe3\
-\x21\x41\xfe\x02\xb2\x01\x27\x01\x00\x8f\x79\xfe\xf2\xfc\xfe\xdd\
-\x02\x01\x6e\xfe\x92\x02\x7d\x79\x02\x97\x60\x62\xfe\xae\xbd\xfe\
-\xe3\xfe\x80\x1b\x04\x02\x7d\xfd\xf6\xbc\x9e\xed\x01\x00\x01\x61\
-\x4c\xfe\x27\x79\x00\x00\x00\x00\x02\x00\xc3\x00\x00\x04\xe3\x07\
-\x1d\x00\x0b\x00\x25\x00\x85\x00\xb2\x00\x00\x00\x2b\xb0\x07\x33\
-\xb2\x01\x02\x00\x2b\xb0\x05\x33\xb0\x1d\x2f\xb0\x0c\x33\xb1\x14\
-\x03\xe9\xb0\x22\x2f\xb1\x0f\x03\xe9\xb0\x19\x32\x01\xb0\x26\x2f\
-\xb0\x00\xd6\xb1\x0b\x0d\xe9\xb0\x0b\x10\xb1\x0c\x01\x2b\xb4\x25\
-\x0f\x00\x20\x04\x2b\xb0\x25\x10\xb1\x18\x01\x2b\xb1\x1a\x0f\xe9\
-\xb0\x1a\x10\xb1\x04\x01\x2b\xb1\x07\x0d\xe9\xb1\x27\x01\x2b\xb1\
-\x25\x0c\x11\x12\xb0\x02\x39\xb0\x18\x11\xb1\x0f\x1d\x39\x39\xb0\
-\x1a\x12\xb0\x08\x39\x00\xb1\x01\x00\x11\x12\xb1\x04\x0a\x39\x39\
-\xb1\x22\x14\x11\x12\xb1\x12\x20\x39\x39\x30\x31\x33\x11\x21\x01\
-\x17\x11\x33\x11\x21\x01\x27\x11\x13\x3e\x01\x33\x32\x1e\x02\x33\
-\x32\x3e\x02\x35\x33\x0e\x01\x23\x22\x2e\x02\x23\x22\x06\x15\xc3\
-\x01\x00\x02\x31\x50\x9f\xff\x00\xfd\xcf\x50\x1b\x02\x75\x4e\x2d\
-\x4d\x30\x47\x29\x1b\x21\x0e\x04\x7f\x02\x77\x4c\x2d\x4e\x2f\x47\
-\x29\x2d\x21\x05\x8d\xfb\xa6\xa4\x04\xfe\xfa\x73\x04\x5a\xa4\xfb\
-\x02\x05\xd1\xa6\xa6\x40\x4e\x3f\x1f\x3f\x40\x2f\xa8\xa4\x3f\x4e\
-\x40\x61\x6c\x00\x03\x00\x71\xff\xd3\x05\x6f\x06\xcf\x00\x0b\x00\
-\x16\x00\x1f\x00\x47\x00\xb2\x09\x00\x00\x2b\xb1\x0f\x08\xe9\xb2\
-\x03\x02\x00\x2b\xb1\x15\x08\xe9\x01\xb0\x20\x2f\xb0\x00\xd6\xb1\
-\x0d\x0e\xe9\xb0\x0d\x10\xb1\x12\x01\x2b\xb1\x06\x0e\xe9\xb1\x21\
-\x01\x2b\xb1\x12\x0d\x11\x12\xb3\x03\x09\x17\x1b\x24\x17\x39\x00\
-\xb1\x15\x0f\x11\x12\xb1\x06\x00\x39\x39\x30\x31\x13\x10\x00\x21\
-\x20\x00\x11\x10\x00\x21\x20\x00\x12\x10\x12\x33\x32\x00\x11\x10\
-\x00\x23\x22\x03\x33\x32\x16\x17\x23\x22\x27\x26\x71\x01\x7b\x01\
-\x06\x01\x02\x01\x7b\xfe\x81\xff\x00\xfe\xfe\xfe\x83\xb8\xfe\xc9\
-\xc3\x01\x05\xfe\xf2\xba\xb8\x6b\xcd\x14\x4e\xf6\xa0\x17\xce\x61\
-\x02\xc3\x01\x3d\x01\xba\xfe\x46\xfe\xc3\xfe\xbe\xfe\x52\x01\xb1\
-\x02\x68\xfd\xe7\xfe\x85\x01\x77\x01\x10\x01\x0c\x01\x4c\x01\x98\
-\x2b\x90\x69\x31\x00\x00\x00\x00\x03\x00\x71\xff\xd3\x05\x6f\x06\
-\xcd\x00\x0b\x00\x16\x00\x1f\x00\x47\x00\xb2\x09\x00\x00\x2b\xb1\
-\x0f\x08\xe9\xb2\x03\x02\x00\x2b\xb1\x15\x08\xe9\x01\xb0\x20\x2f\
-\xb0\x00\xd6\xb1\x0d\x0e\xe9\xb0\x0d\x10\xb1\x12\x01\x2b\xb1\x06\
-\x0e\xe9\xb1\x21\x01\x2b\xb1\x12\x0d\x11\x12\xb3\x03\x09\x17\x1c\
-\x24\x17\x39\x00\xb1\x15\x0f\x11\x12\xb1\x06\x00\x39\x39\x30\x31\
-\x13\x10\x00\x21\x20\x00\x11\x10\x00\x21\x20\x00\x12\x10\x12\x33\
-\x32\x00\x11\x10\x00\x23\x22\x27\x24\x37\x36\x3b\x01\x05\x0f\x01\
-\x71\x01\x7b\x01\x06\x01\x02\x01\x7b\xfe\x81\xff\x00\xfe\xfe\xfe\
-\x83\xb8\xfe\xc9\xc3\x01\x05\xfe\xf2\xba\xb8\x48\x01\x31\x0c\x0a\
-\x13\xca\xfe\xbb\x2d\x1d\x02\xc3\x01\x3d\x01\xba\xfe\x46\xfe\xc3\
-\xfe\xbe\xfe\x52\x01\xb1\x02\x68\xfd\xe7\xfe\x85\x01\x77\x01\x10\
-\x01\x0c\x01\x4c\xdd\xb0\x05\x04\xa2\x14\x03\x00\x03\x00\x71\xff\
-\xd3\x05\x6f\x07\x33\x00\x0b\x00\x16\x00\x1d\x00\x47\x00\xb2\x09\
-\x00\x00\x2b\xb1\x0f\x08\xe9\xb2\x03\x02\x00\x2b\xb1\x15\x08\xe9\
-\x01\xb0\x1e\x2f\xb0\x00\xd6\xb1\x0d\x0e\xe9\xb0\x0d\x10\xb1\x12\
-\x01\x2b\xb1\x06\x0e\xe9\xb1\x1f\x01\x2b\xb1\x12\x0d\x11\x12\xb3\
-\x03\x09\x17\x1a\x24\x17\x39\x00\xb1\x15\x0f\x11\x12\xb1\x06\x00\
-\x39\x39\x30\x31\x13\x10\x00\x21\x20\x00\x11\x10\x00\x21\x20\x00\
-\x12\x10\x12\x33\x32\x00\x11\x10\x00\x23\x22\x27\x13\x33\x01\x23\
-\x27\x07\x71\x01\x7b\x01\x06\x01\x02\x01\x7b\xfe\x81\xff\x00\xfe\
-\xfe\xfe\x83\xb8\xfe\xc9\xc3\x01\x05\xfe\xf2\xba\xb8\x86\xfe\x7f\
-\x01\x00\x7d\xc2\xc1\x02\xc3\x01\x3d\x01\xba\xfe\x46\xfe\xc3\xfe\
-\xbe\xfe\x52\x01\xb1\x02\x68\xfd\xe7\xfe\x85\x01\x77\x01\x10\x01\
-\x0c\x01\x4c\x9a\x01\x62\xfe\x9e\xfa\xfa\x00\x00\x03\x00\x71\xff\
-\xd3\x05\x6f\x07\x1d\x00\x0b\x00\x16\x00\x39\x00\x95\x00\xb2\x09\
-\x00\x00\x2b\xb1\x0f\x08\xe9\xb2\x03\x02\x00\x2b\xb1\x15\x08\xe9\
-\xb0\x2c\x2f\xb0\x17\x33\xb1\x1f\x03\xe9\xb0\x31\x2f\xb1\x1b\x03\
-\xe9\xb0\x27\x32\x01\xb0\x3a\x2f\xb0\x00\xd6\xb1\x0d\x0e\xe9\xb0\
-\x0d\x10\xb1\x17\x01\x2b\xb4\x39\x0f\x00\x20\x04\x2b\xb0\x39\x10\
-\xb1\x27\x01\x2b\xb4\x28\x16\x00\x32\x04\x2b\xb0\x28\x10\xb1\x12\
-\x01\x2b\xb1\x06\x0e\xe9\xb1\x3b\x01\x2b\xb1\x39\x17\x11\x12\xb0\
-\x18\x39\xb0\x27\x11\xb5\x09\x0f\x15\x1a\x03\x2c\x24\x17\x39\xb0\
-\x28\x12\xb0\x29\x39\x00\xb1\x15\x0f\x11\x12\xb1\x06\x00\x39\x39\
-\xb1\x1f\x2c\x11\x12\xb0\x37\x39\xb0\x31\x11\xb1\x1d\x2f\x39\x39\
-\x30\x31\x13\x10\x00\x21\x20\x00\x11\x10\x00\x21\x20\x00\x12\x10\
-\x12\x33\x32\x00\x11\x10\x00\x23\x22\x27\x36\x37\x36\x32\x1e\x02\
-\x33\x32\x3e\x04\x34\x35\x33\x06\x07\x06\x23\x22\x2e\x02\x23\x22\
-\x0e\x04\x14\x15\x71\x01\x7b\x01\x06\x01\x02\x01\x7b\xfe\x81\xff\
-\x00\xfe\xfe\xfe\x83\xb8\xfe\xc9\xc3\x01\x05\xfe\xf2\xba\xb8\x9e\
-\x08\x5e\x31\x5a\x4e\x31\x48\x27\x12\x1b\x10\x0d\x04\x02\x7d\x0c\
-\x59\x29\x37\x2d\x4e\x31\x48\x27\x12\x1b\x10\x0a\x04\x02\x02\xc3\
-\x01\x3d\x01\xba\xfe\x46\xfe\xc3\xfe\xbe\xfe\x52\x01\xb1\x02\x68\
-\xfd\xe7\xfe\x85\x01\x77\x01\x10\x01\x0c\x01\x4c\x9a\xd5\x50\x27\
-\x40\x4e\x3f\x10\x1f\x1f\x2f\x1c\x2e\x06\xdd\x4a\x25\x3f\x4e\x40\
-\x11\x1e\x1f\x2f\x1f\x2b\x06\x00\x04\x00\x71\xff\xd3\x05\x6f\x06\
-\xcb\x00\x0b\x00\x16\x00\x1a\x00\x1e\x00\x6a\x00\xb2\x09\x00\x00\
-\x2b\xb1\x0f\x08\xe9\xb2\x03\x02\x00\x2b\xb1\x15\x08\xe9\xb0\x17\
-\x2f\xb0\x1b\x33\xb1\x18\x04\xe9\xb0\x1c\x32\x01\xb0\x1f\x2f\xb0\
-\x00\xd6\xb1\x0d\x0e\xe9\xb0\x0d\x10\xb1\x17\x01\x2b\xb1\x1a\x0e\
-\xe9\xb0\x1a\x10\xb1\x1b\x01\x2b\xb1\x1e\x0e\xe9\xb0\x1e\x10\xb1\
-\x12\x01\x2b\xb1\x06\x0e\xe9\xb1\x20\x01\x2b\xb1\x1b\x1a\x11\x12\
-\xb3\x09\x0f\x15\x03\x24\x17\x39\x00\xb1\x15\x0f\x11\x12\xb1\x06\
-\x00\x39\x39\x30\x31\x13\x10\x00\x21\x20\x00\x11\x10\x00\x21\x20\
-\x00\x12\x10\x12\x33\x32\x00\x11\x10\x00\x23\x22\x27\x35\x33\x15\
-\x33\x35\x33\x15\x71\x01\x7b\x01\x06\x01\x02\x01\x7b\xfe\x81\xff\
-\x00\xfe\xfe\xfe\x83\xb8\xfe\xc9\xc3\x01\x05\xfe\xf2\xba\xb8\x6a\
-\xb8\xd7\xb8\x02\xc3\x01\x3d\x01\xba\xfe\x46\xfe\xc3\xfe\xbe\xfe\
-\x52\x01\xb1\x02\x68\xfd\xe7\xfe\x85\x01\x77\x01\x10\x01\x0c\x01\
-\x4c\xdd\xb7\xb7\xb7\xb7\x00\x00\x03\x00\x71\xff\x7b\x05\xc5\x06\
-\x12\x00\x16\x00\x1e\x00\x29\x00\x69\x00\xb2\x0f\x00\x00\x2b\xb1\
-\x23\x03\xe9\xb2\x03\x02\x00\x2b\xb1\x1c\x03\xe9\x01\xb0\x2a\x2f\
-\xb0\x00\xd6\xb1\x17\x15\xe9\xb0\x17\x10\xb1\x26\x01\x2b\xb1\x0c\
-\x15\xe9\xb1\x2b\x01\x2b\xb1\x17\x00\x11\x12\xb0\x13\x39\xb0\x26\
-\x11\xb7\x07\x03\x0f\x12\x14\x09\x1a\x1f\x24\x17\x39\xb0\x0c\x12\
-\xb0\x08\x39\x00\xb1\x23\x0f\x11\x12\xb0\x11\x39\xb0\x1c\x11\xb6\
-\x09\x0c\x14\x00\x1a\x19\x28\x24\x17\x39\xb0\x03\x12\xb0\x05\x39\
-\x30\x31\x13\x10\x00\x21\x32\x17\x37\x33\x17\x07\x16\x12\x15\x10\
-\x00\x21\x22\x27\x07\x27\x37\x26\x02\x37\x10\x17\x01\x26\x07\x22\
-\x00\x01\x1e\x02\x33\x32\x00\x11\x10\x27\x23\x71\x01\x93\x01\x17\
-\xa0\x99\x62\x02\x71\x6b\x75\x92\xfe\x6a\xfe\xec\xa0\x9a\x62\x71\
-\x69\x81\x85\xb0\x9d\x02\x52\x7d\x78\xd3\xfe\xd9\x01\x04\x35\x2f\
-\x5e\x36\xcf\x01\x28\x9d\x02\x02\xc3\x01\x3f\x01\xb8\x54\xac\x41\
-\xb8\x62\xfe\xc4\xb8\xfe\xc1\xfe\x4f\x54\xac\x41\xb7\x6f\x01\x39\
-\xa6\xfe\xdd\xae\x04\x04\x4a\x01\xfe\xa3\xfc\xba\x1d\x15\x18\x01\
-\x54\x01\x21\x01\x17\xc0\x00\x00\x02\x00\xc1\xff\xd3\x04\xbe\x06\
-\xcf\x00\x1f\x00\x28\x00\x3c\x00\xb2\x1b\x00\x00\x2b\xb1\x0b\x05\
-\xe9\xb2\x01\x02\x00\x2b\xb0\x14\x33\x01\xb0\x29\x2f\xb0\x00\xd6\
-\xb1\x03\x0e\xe9\xb0\x03\x10\xb1\x13\x01\x2b\xb1\x16\x0d\xe9\xb1\
-\x2a\x01\x2b\xb1\x13\x03\x11\x12\xb3\x0b\x1b\x20\x24\x24\x17\x39\
-\x00\x30\x31\x13\x11\x33\x11\x14\x06\x15\x14\x1e\x02\x33\x32\x3e\
-\x02\x35\x34\x26\x35\x11\x33\x11\x14\x0e\x02\x23\x22\x2e\x02\x13\
-\x33\x32\x16\x17\x23\x22\x27\x26\xc1\xb8\x02\x43\x6d\x68\x36\x39\
-\x71\x6c\x44\x02\xa1\x5c\x95\xb0\x58\x5a\xb1\x99\x60\xdb\xcd\x14\
-\x4e\xf6\xa0\x17\xce\x61\x01\xf6\x03\x97\xfc\xae\x0c\x2f\x0c\x7d\
-\xb4\x59\x24\x29\x5a\xae\x75\x06\x18\x06\x03\x7d\xfc\x61\x83\xd5\
-\x7f\x44\x41\x7f\xda\x05\x62\x2b\x90\x69\x31\x00\x02\x00\xc1\xff\
-\xd3\x04\xbe\x06\xcd\x00\x1f\x00\x29\x00\x43\x00\xb2\x1b\x00\x00\
-\x2b\xb1\x0b\x05\xe9\xb2\x01\x02\x00\x2b\xb0\x14\x33\x01\xb0\x2a\
-\x2f\xb0\x00\xd6\xb1\x03\x0e\xe9\xb0\x03\x10\xb1\x13\x01\x2b\xb1\
-\x16\x0d\xe9\xb1\x2b\x01\x2b\xb1\x13\x03\x11\x12\xb4\x0b\x1b\x20\
-\x23\x28\x24\x17\x39\xb0\x16\x11\xb0\x26\x39\x00\x30\x31\x13\x11\
-\x33\x11\x14\x06\x15\x14\x1e\x02\x33\x32\x3e\x02\x35\x34\x26\x35\
-\x11\x33\x11\x14\x0e\x02\x23\x22\x2e\x02\x01\x36\x37\x3e\x01\x3b\
-\x01\x05\x0f\x01\xc1\xb8\x02\x43\x6d\x68\x36\x39\x71\x6c\x44\x02\
-\xa1\x5c\x95\xb0\x58\x5a\xb1\x99\x60\x01\x51\x44\x5c\x77\x2f\x17\
-\xc8\xfe\xbd\x2d\x1f\x01\xf6\x03\x97\xfc\xae\x0c\x2f\x0c\x7d\xb4\
-\x59\x24\x29\x5a\xae\x75\x06\x18\x06\x03\x7d\xfc\x61\x83\xd5\x7f\
-\x44\x41\x7f\xda\x04\xa7\x27\x36\x46\x16\xa2\x14\x03\x00\x00\x00\
-\x02\x00\xc1\xff\xd3\x04\xbe\x07\x33\x00\x1f\x00\x26\x00\x3c\x00\
-\xb2\x1b\x00\x00\x2b\xb1\x0b\x05\xe9\xb2\x01\x02\x00\x2b\xb0\x14\
-\x33\x01\xb0\x27\x2f\xb0\x00\xd6\xb1\x03\x0e\xe9\xb0\x03\x10\xb1\
-\x13\x01\x2b\xb1\x16\x0d\xe9\xb1\x28\x01\x2b\xb1\x13\x03\x11\x12\
-\xb3\x0b\x1b\x20\x23\x24\x17\x39\x00\x30\x31\x13\x11\x33\x11\x14\
-\x06\x15\x14\x1e\x02\x33\x32\x3e\x02\x35\x34\x26\x35\x11\x33\x11\
-\x14\x0e\x02\x23\x22\x2e\x02\x13\x01\x33\x01\x23\x27\x07\xc1\xb8\
-\x02\x43\x6d\x68\x36\x39\x71\x6c\x44\x02\xa1\x5c\x95\xb0\x58\x5a\
-\xb1\x99\x60\xc4\x01\x00\x75\x01\x0a\x7f\xc0\xc1\x01\xf6\x03\x97\
-\xfc\xae\x0c\x2f\x0c\x7d\xb4\x59\x24\x29\x5a\xae\x75\x06\x18\x06\
-\x03\x7d\xfc\x61\x83\xd5\x7f\x44\x41\x7f\xda\x04\x64\x01\x62\xfe\
-\x9e\xfa\xfa\x00\x03\x00\xc1\xff\xd3\x04\xbe\x06\xcd\x00\x1f\x00\
-\x23\x00\x27\x00\x5c\x00\xb2\x1b\x00\x00\x2b\xb1\x0b\x05\xe9\xb2\
-\x01\x02\x00\x2b\xb0\x14\x33\xb0\x20\x2f\xb0\x24\x33\xb1\x21\x04\
-\xe9\xb0\x25\x32\x01\xb0\x28\x2f\xb0\x00\xd6\xb1\x03\x0e\xe9\xb0\
-\x03\x10\xb1\x20\x01\x2b\xb1\x23\x0e\xe9\xb0\x23\x10\xb1\x24\x01\
-\x2b\xb1\x27\x0e\xe9\xb0\x27\x10\xb1\x13\x01\x2b\xb1\x16\x0d\xe9\
-\xb1\x29\x01\x2b\xb1\x24\x23\x11\x12\xb1\x1b\x0b\x39\x39\x00\x30\
-\x31\x13\x11\x33\x11\x14\x06\x15\x14\x1e\x02\x33\x32\x3e\x02\x35\
-\x34\x26\x35\x11\x33\x11\x14\x0e\x02\x23\x22\x2e\x02\x13\x35\x33\
-\x15\x33\x35\x33\x15\xc1\xb8\x02\x43\x6d\x68\x36\x39\x71\x6c\x44\
-\x02\xa1\x5c\x95\xb0\x58\x5a\xb1\x99\x60\xdc\xb8\xd7\xb8\x01\xf6\
-\x03\x97\xfc\xae\x0c\x2f\x0c\x7d\xb4\x59\x24\x29\x5a\xae\x75\x06\
-\x18\x06\x03\x7d\xfc\x61\x83\xd5\x7f\x44\x41\x7f\xda\x04\xa9\xb7\
-\xb7\xb7\xb7\x00\x02\x00\x04\x00\x00\x05\x4c\x06\xcd\x00\x0b\x00\
-\x15\x00\x35\x00\xb2\x0a\x00\x00\x2b\xb2\x00\x02\x00\x2b\xb0\x06\
-\x33\x01\xb0\x16\x2f\xb0\x0a\xd6\xb1\x09\x15\xe9\xb1\x17\x01\x2b\
-\xb1\x09\x0a\x11\x12\xb3\x04\x0e\x14\x15\x24\x17\x39\x00\xb1\x00\
-\x0a\x11\x12\xb0\x04\x39\x30\x31\x13\x33\x01\x16\x17\x36\x01\x33\
-\x01\x11\x23\x11\x03\x36\x37\x3e\x01\x3b\x01\x05\x0f\x01\x04\xd7\
-\x01\x2d\xa4\x0e\x48\x01\x96\xb4\xfd\xb6\xb2\x54\x44\x5c\x77\x2f\
-\x16\xc9\xfe\xbc\x2d\x1f\x05\x8d\xfe\x4c\xf6\x1a\x7f\x02\x45\xfc\
-\xac\xfd\xc7\x02\x39\x03\xdb\x27\x36\x46\x16\xa2\x14\x03\x00\x00\
-\x02\x00\xc5\x00\x00\x04\x35\x05\x8d\x00\x0e\x00\x1a\x00\x4b\x00\
-\xb2\x00\x00\x00\x2b\xb2\x01\x02\x00\x2b\xb4\x0d\x0f\x00\x01\x0d\
-\x2b\xb1\x0d\x05\xe9\xb4\x03\x19\x00\x01\x0d\x2b\xb1\x03\x05\xe9\
-\x01\xb0\x1b\x2f\xb0\x00\xd6\xb1\x0e\x14\xe9\xb1\x02\x0f\x32\x32\
-\xb0\x0e\x10\xb1\x13\x01\x2b\xb1\x09\x13\xe9\xb1\x1c\x01\x2b\x00\
-\xb1\x19\x0f\x11\x12\xb0\x09\x39\x30\x31\x33\x11\x33\x11\x33\x32\
-\x1e\x02\x15\x14\x06\x23\x21\x19\x01\x33\x32\x36\x35\x34\x2e\x02\
-\x2b\x01\x07\xc5\xac\xf9\x79\xbb\x66\x31\xe7\xd7\xfe\xfa\xd1\xa6\
-\xa7\x22\x4e\x9c\x6a\xa6\x02\x05\x8d\xfe\xfc\x4e\x7a\x84\x3f\x96\
-\xf7\xfe\x8f\x01\xe3\xb3\x66\x2b\x5a\x5c\x3a\x4e\x00\x00\x00\x00\
-\x01\x00\xa6\xff\xe9\x03\x91\x05\xdd\x00\x4c\x00\x85\x00\xb2\x00\
-\x00\x00\x2b\xb2\x1c\x00\x00\x2b\xb1\x27\x03\xe9\xb0\x45\x2f\xb1\
-\x06\x03\xe9\x01\xb0\x4d\x2f\xb0\x00\xd6\xb1\x4c\x11\xe9\xb0\x4c\
-\x10\xb1\x31\x01\x2b\xb0\x1e\x32\xb1\x11\x10\xe9\xb0\x11\x10\xb1\
-\x3f\x01\x2b\xb1\x09\x0d\xe9\xb0\x09\x10\xb0\x19\x20\xd6\x11\xb1\
-\x2a\x0f\xe9\xb0\x2a\x2f\xb1\x19\x0f\xe9\xb1\x4e\x01\x2b\xb1\x31\
-\x4c\x11\x12\xb0\x49\x39\xb0\x11\x11\xb3\x06\x22\x2e\x45\x24\x17\
-\x39\xb0\x3f\x12\xb4\x0e\x15\x1c\x27\x34\x24\x17\x39\x00\xb1\x27\
-\x00\x11\x12\xb0\x1e\x39\xb0\x45\x11\xb2\x19\x09\x1f\x39\x39\x39\
-\x30\x31\x33\x11\x34\x3e\x02\x33\x32\x16\x15\x14\x0e\x03\x07\x06\
-\x17\x14\x1e\x02\x17\x1e\x01\x15\x14\x06\x23\x22\x27\x37\x17\x1e\
-\x05\x33\x32\x36\x35\x34\x27\x2e\x01\x27\x26\x35\x34\x36\x37\x32\
-\x3e\x08\x35\x34\x2e\x03\x23\x22\x0e\x03\x15\x11\xa6\x3b\x69\x72\
-\x46\x93\xcf\x2f\x49\x46\x40\x04\x1f\x01\x14\x19\x4d\x1f\x44\x70\
-\x89\x7b\x79\x62\x19\x06\x06\x10\x17\x21\x25\x2d\x18\x42\x35\x4a\
-\x06\x81\x27\x56\x5e\x5d\x02\x16\x06\x13\x06\x0c\x06\x08\x05\x02\
-\x02\x15\x25\x4e\x35\x39\x52\x25\x14\x03\x04\x83\x62\x90\x47\x21\
-\x99\xb7\x66\x8f\x40\x1f\x0a\x04\x19\x6c\x35\x32\x0c\x0e\x0a\x17\
-\x8f\x71\x81\x9a\x5d\x8b\x08\x06\x11\x16\x15\x12\x0b\x57\x35\x64\
-\x23\x02\x21\x23\x50\x93\x6f\x8d\x0c\x02\x02\x06\x09\x10\x14\x21\
-\x27\x37\x21\x1f\x25\x47\x2d\x23\x25\x2d\x4d\x23\x21\xfb\x83\x00\
-\x03\x00\x5a\xff\xe9\x03\x33\x05\x1f\x00\x1b\x00\x27\x00\x2b\x00\
-\x7a\x00\xb2\x14\x00\x00\x2b\xb2\x19\x00\x00\x2b\xb1\x1f\x03\xe9\
-\xb2\x0f\x01\x00\x2b\xb1\x0a\x07\xe9\xb4\x23\x05\x19\x0f\x0d\x2b\
-\xb1\x23\x0c\xe9\x01\xb0\x2c\x2f\xb0\x00\xd6\xb1\x1c\x10\xe9\xb0\
-\x1c\x10\xb1\x22\x01\x2b\xb1\x05\x14\x32\x32\xb1\x13\x0d\xe9\xb1\
-\x2d\x01\x2b\xb1\x1c\x00\x11\x12\xb1\x0c\x0d\x39\x39\xb0\x22\x11\
-\xb5\x0a\x0f\x19\x28\x29\x2b\x24\x17\x39\xb0\x13\x12\xb1\x11\x2a\
-\x39\x39\x00\xb1\x05\x19\x11\x12\xb1\x00\x15\x39\x39\xb0\x0a\x11\
-\xb0\x0c\x39\xb0\x0f\x12\xb0\x0d\x39\x30\x31\x37\x34\x3e\x02\x33\
-\x35\x26\x27\x26\x23\x22\x07\x27\x36\x33\x32\x16\x17\x11\x23\x35\
-\x0e\x02\x23\x22\x26\x37\x14\x16\x33\x32\x36\x3d\x01\x22\x0e\x02\
-\x13\x33\x01\x23\x5a\x73\xba\xb2\x5a\x04\x31\x33\x4e\x9e\x95\x0c\
-\x9a\xa7\x8d\xbf\x08\x9b\x08\x3c\xac\x64\x75\x75\x96\x6c\x52\x58\
-\x8d\x3f\x83\x8b\x56\x4a\x9f\x01\x11\x7d\xe7\x4c\x71\x37\x1b\x45\
-\x83\x3a\x3d\x68\x89\x5a\xba\x85\xfd\x8f\x48\x08\x25\x32\xa6\x5a\
-\x37\x4a\x4a\x58\x81\x10\x21\x44\x04\x09\xfe\xf5\x00\x00\x00\x00\
-\x03\x00\x5a\xff\xe9\x03\x33\x05\x1f\x00\x1b\x00\x27\x00\x2b\x00\
-\x7a\x00\xb2\x14\x00\x00\x2b\xb2\x19\x00\x00\x2b\xb1\x1f\x03\xe9\
-\xb2\x0f\x01\x00\x2b\xb1\x0a\x07\xe9\xb4\x23\x05\x19\x0f\x0d\x2b\
-\xb1\x23\x0c\xe9\x01\xb0\x2c\x2f\xb0\x00\xd6\xb1\x1c\x10\xe9\xb0\
-\x1c\x10\xb1\x22\x01\x2b\xb1\x05\x14\x32\x32\xb1\x13\x0d\xe9\xb1\
-\x2d\x01\x2b\xb1\x1c\x00\x11\x12\xb1\x0c\x0d\x39\x39\xb0\x22\x11\
-\xb5\x0a\x0f\x19\x28\x29\x2b\x24\x17\x39\xb0\x13\x12\xb1\x11\x2a\
-\x39\x39\x00\xb1\x05\x19\x11\x12\xb1\x00\x15\x39\x39\xb0\x0a\x11\
-\xb0\x0c\x39\xb0\x0f\x12\xb0\x0d\x39\x30\x31\x37\x34\x3e\x02\x33\
-\x35\x26\x27\x26\x23\x22\x07\x27\x36\x33\x32\x16\x17\x11\x23\x35\
-\x0e\x02\x23\x22\x26\x37\x14\x16\x33\x32\x36\x3d\x01\x22\x0e\x02\
-\x13\x01\x33\x01\x5a\x73\xba\xb2\x5a\x04\x31\x33\x4e\x9e\x95\x0c\
-\x9a\xa7\x8d\xbf\x08\x9b\x08\x3c\xac\x64\x75\x75\x96\x6c\x52\x58\
-\x8d\x3f\x83\x8b\x56\x26\x01\x11\x9f\xfe\xcf\xe7\x4c\x71\x37\x1b\
-\x45\x83\x3a\x3d\x68\x89\x5a\xba\x85\xfd\x8f\x48\x08\x25\x32\xa6\
-\x5a\x37\x4a\x4a\x58\x81\x10\x21\x44\x02\xfe\x01\x0b\xfe\xf5\x00\
-\x03\x00\x5a\xff\xe9\x03\x33\x05\x33\x00\x1b\x00\x22\x00\x2e\x00\
-\x7f\x00\xb2\x14\x00\x00\x2b\xb2\x19\x00\x00\x2b\xb1\x26\x03\xe9\
-\xb2\x0f\x01\x00\x2b\xb1\x0a\x07\xe9\xb4\x2a\x05\x19\x0f\x0d\x2b\
-\xb1\x2a\x0c\xe9\x01\xb0\x2f\x2f\xb0\x00\xd6\xb1\x23\x10\xe9\xb0\
-\x23\x10\xb1\x29\x01\x2b\xb1\x05\x14\x32\x32\xb1\x13\x0d\xe9\xb1\
-\x30\x01\x2b\xb1\x23\x00\x11\x12\xb2\x0c\x0d\x1c\x39\x39\x39\xb0\
-\x29\x11\xb6\x0a\x0f\x19\x1d\x1e\x21\x22\x24\x17\x39\xb0\x13\x12\
-\xb2\x11\x1f\x20\x39\x39\x39\x00\xb1\x05\x19\x11\x12\xb1\x00\x15\
-\x39\x39\xb0\x0a\x11\xb0\x0c\x39\xb0\x0f\x12\xb0\x0d\x39\x30\x31\
-\x37\x34\x3e\x02\x33\x35\x26\x27\x26\x23\x22\x07\x27\x36\x33\x32\
-\x16\x17\x11\x23\x35\x0e\x02\x23\x22\x26\x13\x01\x33\x13\x23\x27\
-\x07\x03\x14\x16\x33\x32\x36\x3d\x01\x22\x0e\x02\x5a\x73\xba\xb2\
-\x5a\x04\x31\x33\x4e\x9e\x95\x0c\x9a\xa7\x8d\xbf\x08\x9b\x08\x3c\
-\xac\x64\x75\x75\x50\x01\x00\xac\xd1\x7d\xc1\xc2\x37\x6c\x52\x58\
-\x8d\x3f\x83\x8b\x56\xe7\x4c\x71\x37\x1b\x45\x83\x3a\x3d\x68\x89\
-\x5a\xba\x85\xfd\x8f\x48\x08\x25\x32\xa6\x03\x83\x01\x21\xfe\xdf\
-\xcb\xcb\xfc\xd7\x37\x4a\x4a\x58\x81\x10\x21\x44\x00\x00\x00\x00\
-\x03\x00\x5a\xff\xe9\x03\x54\x05\x1d\x00\x1b\x00\x2e\x00\x3a\x00\
-\xc4\x00\xb2\x14\x00\x00\x2b\xb2\x19\x00\x00\x2b\xb1\x32\x03\xe9\
-\xb2\x0f\x01\x00\x2b\xb1\x0a\x07\xe9\xb4\x36\x05\x19\x0f\x0d\x2b\
-\xb1\x36\x0c\xe9\xb0\x2c\x2f\xb1\x1f\x03\xe9\xb0\x25\x32\xb3\x22\
-\x1f\x2c\x08\x2b\xb1\x29\x03\xe9\xb0\x1c\x32\x01\xb0\x3b\x2f\xb0\
-\x00\xd6\xb1\x2f\x10\xe9\xb0\x2f\x10\xb0\x2e\x20\xd6\x11\xb4\x1c\
-\x16\x00\x32\x04\x2b\xb0\x1c\x2f\xb4\x2e\x16\x00\x32\x04\x2b\xb0\
-\x2f\x10\xb1\x35\x01\x2b\xb1\x05\x14\x32\x32\xb1\x13\x0d\xe9\xb0\
-\x13\x10\xb0\x26\x20\xd6\x11\xb4\x25\x16\x00\x32\x04\x2b\xb0\x25\
-\x2f\xb4\x26\x16\x00\x32\x04\x2b\xb1\x3c\x01\x2b\xb1\x2e\x1c\x11\
-\x12\xb0\x0c\x39\xb0\x35\x11\xb6\x0a\x0f\x19\x1f\x22\x29\x32\x24\
-\x17\x39\xb0\x13\x12\xb0\x11\x39\x00\xb1\x36\x14\x11\x12\xb2\x00\
-\x15\x2f\x39\x39\x39\xb1\x0a\x05\x11\x12\xb0\x0c\x39\xb0\x0f\x11\
-\xb0\x0d\x39\x30\x31\x37\x34\x3e\x02\x33\x35\x26\x27\x26\x23\x22\
-\x07\x27\x36\x33\x32\x16\x17\x11\x23\x35\x0e\x02\x23\x22\x26\x13\
-\x3e\x01\x33\x32\x16\x33\x32\x36\x37\x33\x0e\x01\x23\x22\x26\x23\
-\x22\x07\x03\x14\x16\x33\x32\x36\x3d\x01\x22\x0e\x02\x5a\x73\xba\
-\xb2\x5a\x04\x31\x33\x4e\x9e\x95\x0c\x9a\xa7\x8d\xbf\x08\x9b\x08\
-\x3c\xac\x64\x75\x75\x50\x02\x77\x50\x37\xae\x2b\x27\x2b\x02\x7d\
-\x02\x77\x50\x35\xb2\x29\x4c\x08\x37\x6c\x52\x58\x8d\x3f\x83\x8b\
-\x56\xe7\x4c\x71\x37\x1b\x45\x83\x3a\x3d\x68\x89\x5a\xba\x85\xfd\
-\x8f\x48\x08\x25\x32\xa6\x03\xac\x64\x7c\x63\x3a\x2b\x62\x80\x63\
-\x63\xfc\xae\x37\x4a\x4a\x58\x81\x10\x21\x44\x00\x04\x00\x5a\xff\
-\xe9\x03\x33\x05\x48\x00\x1b\x00\x1f\x00\x2b\x00\x2f\x00\x98\x00\
-\xb2\x14\x00\x00\x2b\xb2\x19\x00\x00\x2b\xb1\x23\x03\xe9\xb2\x0f\
-\x01\x00\x2b\xb1\x0a\x07\xe9\xb4\x27\x05\x19\x0f\x0d\x2b\xb1\x27\
-\x0c\xe9\xb0\x1c\x2f\xb0\x2c\x33\xb1\x1d\x04\xe9\xb0\x2d\x32\x01\
-\xb0\x30\x2f\xb0\x1c\xd6\xb1\x1f\x0e\xe9\xb3\x20\x1f\x1c\x08\x2b\
-\xb1\x00\x10\xe9\xb0\x00\x2f\xb1\x20\x10\xe9\xb0\x1f\x10\xb1\x26\
-\x01\x2b\xb1\x05\x14\x32\x32\xb1\x13\x0d\xe9\xb0\x2e\x32\xb0\x13\
-\x10\xb1\x2c\x0e\xe9\xb0\x2c\x2f\xb1\x31\x01\x2b\xb1\x2c\x00\x11\
-\x12\xb4\x0a\x0d\x0f\x19\x23\x24\x17\x39\x00\xb1\x27\x14\x11\x12\
-\xb2\x00\x15\x20\x39\x39\x39\xb1\x0a\x05\x11\x12\xb0\x0c\x39\xb0\
-\x0f\x11\xb0\x0d\x39\x30\x31\x37\x34\x3e\x02\x33\x35\x26\x27\x26\
-\x23\x22\x07\x27\x36\x33\x32\x16\x17\x11\x23\x35\x0e\x02\x23\x22\
-\x26\x13\x35\x33\x15\x03\x14\x16\x33\x32\x36\x3d\x01\x22\x0e\x02\
-\x01\x35\x33\x15\x5a\x73\xba\xb2\x5a\x04\x31\x33\x4e\x9e\x95\x0c\
-\x9a\xa7\x8d\xbf\x08\x9b\x08\x3c\xac\x64\x75\x75\x84\xb8\xa6\x6c\
-\x52\x58\x8d\x3f\x83\x8b\x56\x01\x7d\xb8\xe7\x4c\x71\x37\x1b\x45\
-\x83\x3a\x3d\x68\x89\x5a\xba\x85\xfd\x8f\x48\x08\x25\x32\xa6\x04\
-\x02\xb7\xb7\xfc\x58\x37\x4a\x4a\x58\x81\x10\x21\x44\x03\x7b\xb7\
-\xb7\x00\x00\x00\x04\x00\x5a\xff\xe9\x03\x33\x05\x1d\x00\x1b\x00\
-\x27\x00\x33\x00\x3e\x00\xa5\x00\xb2\x14\x00\x00\x2b\xb2\x19\x00\
-\x00\x2b\xb1\x1f\x03\xe9\xb2\x0f\x01\x00\x2b\xb1\x0a\x07\xe9\xb4\
-\x23\x05\x19\x0f\x0d\x2b\xb1\x23\x0c\xe9\xb0\x31\x2f\xb4\x37\x0c\
-\x00\x17\x04\x2b\xb0\x3c\x2f\xb4\x2b\x0c\x00\x17\x04\x2b\x01\xb0\
-\x3f\x2f\xb0\x00\xd6\xb1\x1c\x10\xe9\xb0\x1c\x10\xb1\x28\x01\x2b\
-\xb1\x34\x16\xe9\xb0\x34\x10\xb1\x22\x01\x2b\xb1\x05\x14\x32\x32\
-\xb1\x13\x0d\xe9\xb0\x39\x20\xd6\x11\xb1\x2e\x16\xe9\xb1\x40\x01\
-\x2b\xb1\x34\x28\x11\x12\xb0\x19\x39\xb0\x39\x11\xb4\x0a\x1f\x0f\
-\x31\x2b\x24\x17\x39\x00\xb1\x23\x14\x11\x12\xb2\x00\x15\x1c\x39\
-\x39\x39\xb1\x0a\x05\x11\x12\xb0\x0c\x39\xb0\x0f\x11\xb0\x0d\x39\
-\xb1\x3c\x37\x11\x12\xb1\x28\x2e\x39\x39\x30\x31\x37\x34\x3e\x02\
-\x33\x35\x26\x27\x26\x23\x22\x07\x27\x36\x33\x32\x16\x17\x11\x23\
-\x35\x0e\x02\x23\x22\x26\x37\x14\x16\x33\x32\x36\x3d\x01\x22\x0e\
-\x02\x13\x34\x36\x33\x32\x16\x15\x14\x06\x23\x22\x26\x37\x14\x16\
-\x32\x36\x35\x34\x26\x23\x22\x06\x5a\x73\xba\xb2\x5a\x04\x31\x33\
-\x4e\x9e\x95\x0c\x9a\xa7\x8d\xbf\x08\x9b\x08\x3c\xac\x64\x75\x75\
-\x96\x6c\x52\x58\x8d\x3f\x83\x8b\x56\x14\x87\x5e\x68\x7c\x87\x5f\
-\x5c\x87\x73\x33\x7b\x35\x33\x3e\x35\x3d\xe7\x4c\x71\x37\x1b\x45\
-\x83\x3a\x3d\x68\x89\x5a\xba\x85\xfd\x8f\x48\x08\x25\x32\xa6\x5a\
-\x37\x4a\x4a\x58\x81\x10\x21\x44\x03\x61\x46\x60\x6b\x3d\x46\x60\
-\x60\x46\x25\x3e\x3e\x27\x25\x3d\x37\x00\x00\x00\x03\x00\x5e\xff\
-\xe9\x05\x8b\x03\xb0\x00\x2e\x00\x45\x00\x4b\x00\x6e\x00\xb2\x2c\
-\x00\x00\x2b\xb0\x28\x33\xb1\x32\x03\xe9\xb0\x23\x32\xb2\x0d\x01\
-\x00\x2b\xb0\x11\x33\xb1\x08\x07\xe9\xb0\x49\x32\xb4\x3a\x03\x2c\
-\x0d\x0d\x2b\xb1\x3a\x05\xe9\xb4\x46\x17\x2c\x0d\x0d\x2b\xb1\x46\
-\x05\xe9\x01\xb0\x4c\x2f\xb0\x00\xd6\xb1\x2f\x10\xe9\xb1\x4d\x01\
-\x2b\xb1\x2f\x00\x11\x12\xb1\x0a\x0b\x39\x39\x00\xb1\x3a\x32\x11\
-\x12\xb3\x1b\x00\x25\x2a\x24\x17\x39\xb0\x03\x11\xb0\x1a\x39\xb1\
-\x08\x46\x11\x12\xb1\x0a\x0f\x39\x39\x30\x31\x37\x34\x24\x37\x35\
-\x26\x27\x26\x23\x22\x07\x27\x36\x33\x32\x17\x36\x33\x32\x1e\x02\
-\x15\x21\x14\x1e\x07\x17\x16\x33\x32\x37\x17\x06\x07\x22\x27\x06\
-\x21\x22\x26\x37\x1e\x01\x33\x32\x3e\x01\x35\x34\x2e\x01\x27\x06\
-\x07\x0e\x07\x15\x01\x21\x26\x23\x22\x06\x5e\x01\x40\xf3\x04\x2f\
-\x33\x4e\xa0\x95\x0c\xa2\xa1\xae\x73\x7d\xba\x3b\x6b\x6d\x41\xfd\
-\xa6\x02\x04\x06\x0b\x10\x19\x1c\x2b\x19\x3d\x4c\x93\x88\x0c\x87\
-\xa2\xc3\x8d\x6d\xfe\xab\x79\x6f\x96\x02\x6a\x50\x35\x61\x56\x02\
-\x04\x03\xba\x75\x12\x1f\x16\x13\x0a\x06\x04\x02\x02\x49\x01\xd5\
-\x29\xb0\x50\x91\xe9\x81\x8c\x04\x41\x83\x38\x3f\x68\x89\x5a\xa0\
-\xa0\x29\x62\xcf\x93\x02\x1f\x15\x29\x22\x2b\x29\x29\x25\x11\x27\
-\x71\x87\x68\x01\x9e\x9e\xaa\x59\x3b\x49\x15\x4a\x3b\x06\x13\x3f\
-\x2d\x04\x29\x06\x0e\x11\x0c\x10\x0b\x0e\x08\x06\x01\x41\xfe\x87\
-\x00\x00\x00\x00\x02\x00\x48\xfe\x77\x03\x52\x03\xb0\x00\x18\x00\
-\x1c\x00\x3d\x00\xb2\x16\x00\x00\x2b\xb1\x11\x08\xe9\xb2\x03\x01\
-\x00\x2b\xb1\x0b\x08\xe9\x01\xb0\x1d\x2f\xb0\x00\xd6\xb1\x0e\x0d\
-\xe9\xb1\x1e\x01\x2b\x00\xb1\x11\x16\x11\x12\xb0\x14\x39\xb0\x0b\
-\x11\xb2\x00\x07\x13\x39\x39\x39\xb0\x03\x12\xb0\x06\x39\x30\x31\
-\x13\x34\x12\x33\x32\x16\x17\x07\x26\x27\x26\x23\x22\x06\x15\x14\
-\x16\x33\x32\x37\x17\x06\x07\x22\x00\x1b\x01\x33\x03\x48\xf5\xcd\
-\x60\x7f\x5f\x19\x64\x35\x3b\x53\x8b\x96\xa0\x7f\xa0\xa2\x0a\xa2\
-\xac\xbc\xff\x00\xe1\x97\x7d\x85\x01\xc9\xbe\x01\x29\x25\x35\x87\
-\x3f\x0f\x10\xd3\x91\x98\xc4\x6e\x89\x68\x01\x01\x19\xfd\x75\x01\
-\x5a\xfe\xa6\x00\x03\x00\x46\xff\xe9\x03\x50\x05\x1f\x00\x14\x00\
-\x1d\x00\x21\x00\x4f\x00\xb2\x12\x00\x00\x2b\xb1\x0d\x03\xe9\xb2\
-\x03\x01\x00\x2b\xb1\x1b\x03\xe9\xb4\x15\x0a\x12\x03\x0d\x2b\xb1\
-\x15\x05\xe9\x01\xb0\x22\x2f\xb0\x00\xd6\xb1\x0a\x0f\xe9\xb2\x0a\
-\x00\x0a\x2b\xb3\x40\x0a\x09\x09\x2b\xb1\x23\x01\x2b\x00\xb1\x0d\
-\x12\x11\x12\xb0\x10\x39\xb0\x0a\x11\xb0\x0f\x39\xb0\x15\x12\xb0\
-\x00\x39\x30\x31\x13\x34\x12\x33\x32\x1e\x02\x17\x15\x21\x1e\x01\
-\x33\x32\x37\x17\x06\x07\x22\x02\x13\x21\x2e\x03\x23\x22\x06\x13\
-\x33\x01\x23\x46\xf7\xa6\x3d\x6f\x71\x4a\x06\xfd\x85\x06\xb0\x79\
-\x9c\x9b\x0d\x9c\xa8\xc3\xfb\x99\x01\xfc\x0c\x40\x50\x3f\x1d\x68\
-\x88\x45\x9f\x01\x11\x7d\x01\xcf\xcb\x01\x16\x27\x5a\xb4\x7d\x3b\
-\x9a\xc1\x71\x87\x68\x01\x01\x21\x01\x29\x50\x6f\x2f\x10\xa0\x02\
-\x8e\xfe\xf5\x00\x03\x00\x46\xff\xe9\x03\x50\x05\x1f\x00\x14\x00\
-\x18\x00\x21\x00\x4f\x00\xb2\x12\x00\x00\x2b\xb1\x0d\x03\xe9\xb2\
-\x03\x01\x00\x2b\xb1\x1f\x03\xe9\xb4\x19\x0a\x12\x03\x0d\x2b\xb1\
-\x19\x05\xe9\x01\xb0\x22\x2f\xb0\x00\xd6\xb1\x0a\x0f\xe9\xb2\x0a\
-\x00\x0a\x2b\xb3\x40\x0a\x09\x09\x2b\xb1\x23\x01\x2b\x00\xb1\x0d\
-\x12\x11\x12\xb0\x10\x39\xb0\x0a\x11\xb0\x0f\x39\xb0\x19\x12\xb0\
-\x00\x39\x30\x31\x13\x34\x12\x33\x32\x1e\x02\x17\x15\x21\x1e\x01\
-\x33\x32\x37\x17\x06\x07\x22\x02\x13\x01\x33\x01\x03\x21\x2e\x03\
-\x23\x22\x06\x46\xf7\xa6\x3d\x6f\x71\x4a\x06\xfd\x85\x06\xb0\x79\
-\x9c\x9b\x0d\x9c\xa8\xc3\xfb\x95\x01\x11\x9f\xfe\xcf\x7b\x01\xfc\
-\x0c\x40\x50\x3f\x1d\x68\x88\x01\xcf\xcb\x01\x16\x27\x5a\xb4\x7d\
-\x3b\x9a\xc1\x71\x87\x68\x01\x01\x21\x03\x0a\x01\x0b\xfe\xf5\xfe\
-\x1f\x50\x6f\x2f\x10\xa0\x00\x00\x03\x00\x46\xff\xe9\x03\x50\x05\
-\x33\x00\x14\x00\x1b\x00\x24\x00\x57\x00\xb2\x12\x00\x00\x2b\xb1\
-\x0d\x03\xe9\xb2\x03\x01\x00\x2b\xb1\x22\x03\xe9\xb4\x1c\x0a\x12\
-\x03\x0d\x2b\xb1\x1c\x05\xe9\x01\xb0\x25\x2f\xb0\x00\xd6\xb1\x0a\
-\x0f\xe9\xb2\x0a\x00\x0a\x2b\xb3\x40\x0a\x09\x09\x2b\xb1\x26\x01\
-\x2b\xb1\x0a\x00\x11\x12\xb0\x15\x39\x00\xb1\x0d\x12\x11\x12\xb0\
-\x10\x39\xb0\x0a\x11\xb0\x0f\x39\xb0\x1c\x12\xb0\x00\x39\x30\x31\
-\x13\x34\x12\x33\x32\x1e\x02\x17\x15\x21\x1e\x01\x33\x32\x37\x17\
-\x06\x07\x22\x02\x1b\x01\x33\x13\x23\x27\x07\x03\x21\x2e\x03\x23\
-\x22\x06\x46\xf7\xa6\x3d\x6f\x71\x4a\x06\xfd\x85\x06\xb0\x79\x9c\
-\x9b\x0d\x9c\xa8\xc3\xfb\x41\xfe\x81\xfe\x7d\xc2\xc1\x25\x01\xfc\
-\x0c\x40\x50\x3f\x1d\x68\x88\x01\xcf\xcb\x01\x16\x27\x5a\xb4\x7d\
-\x3b\x9a\xc1\x71\x87\x68\x01\x01\x21\x03\x08\x01\x21\xfe\xdf\xcb\
-\xcb\xfe\x21\x50\x6f\x2f\x10\xa0\x00\x00\x00\x00\x04\x00\x46\xff\
-\xe9\x03\x50\x05\x48\x00\x14\x00\x18\x00\x21\x00\x25\x00\x8b\x00\
-\xb2\x12\x00\x00\x2b\xb1\x0d\x03\xe9\xb2\x03\x01\x00\x2b\xb1\x1f\
-\x03\xe9\xb4\x19\x0a\x12\x03\x0d\x2b\xb1\x19\x05\xe9\xb0\x15\x2f\
-\xb0\x22\x33\xb1\x16\x04\xe9\xb0\x23\x32\x01\xb0\x26\x2f\xb0\x15\
-\xd6\xb1\x18\x0e\xe9\xb3\x0a\x18\x15\x08\x2b\xb1\x00\x0f\xe9\xb0\
-\x00\x2f\xb1\x0a\x0f\xe9\xb2\x0a\x00\x0a\x2b\xb3\x40\x0a\x09\x09\
-\x2b\xb0\x18\x10\xb1\x22\x01\x2b\xb1\x25\x0e\xe9\xb1\x27\x01\x2b\
-\xb1\x18\x0a\x11\x12\xb0\x19\x39\xb0\x22\x11\xb3\x0d\x12\x03\x1f\
-\x24\x17\x39\xb0\x25\x12\xb0\x1a\x39\x00\xb1\x0a\x0d\x11\x12\xb0\
-\x0f\x39\xb0\x19\x11\xb0\x00\x39\x30\x31\x13\x34\x12\x33\x32\x1e\
-\x02\x17\x15\x21\x1e\x01\x33\x32\x37\x17\x06\x07\x22\x02\x13\x35\
-\x33\x15\x03\x21\x2e\x03\x23\x22\x06\x01\x35\x33\x15\x46\xf7\xa6\
-\x3d\x6f\x71\x4a\x06\xfd\x85\x06\xb0\x79\x9c\x9b\x0d\x9c\xa8\xc3\
-\xfb\x5d\xb8\x7c\x01\xfc\x0c\x40\x50\x3f\x1d\x68\x88\x01\x3f\xb8\
-\x01\xcf\xcb\x01\x16\x27\x5a\xb4\x7d\x3b\x9a\xc1\x71\x87\x68\x01\
-\x01\x21\x03\x87\xb7\xb7\xfd\xa2\x50\x6f\x2f\x10\xa0\x02\x00\xb7\
-\xb7\x00\x00\x00\x02\xff\xbd\x00\x00\x01\x6d\x05\x1f\x00\x03\x00\
-\x07\x00\x25\x00\xb2\x04\x00\x00\x2b\xb2\x05\x01\x00\x2b\x01\xb0\
-\x08\x2f\xb0\x04\xd6\xb1\x07\x11\xe9\xb1\x09\x01\x2b\xb1\x07\x04\
-\x11\x12\xb0\x03\x39\x00\x30\x31\x03\x33\x01\x23\x03\x11\x33\x11\
-\x43\x9f\x01\x11\x7d\x48\x99\x05\x1f\xfe\xf5\xfb\xec\x03\x8f\xfc\
-\x71\x00\x00\x00\x02\x00\x41\x00\x00\x01\xf1\x05\x1f\x00\x03\x00\
-\x07\x00\x25\x00\xb2\x04\x00\x00\x2b\xb2\x05\x01\x00\x2b\x01\xb0\
-\x08\x2f\xb0\x04\xd6\xb1\x07\x11\xe9\xb1\x09\x01\x2b\xb1\x07\x04\
-\x11\x12\xb0\x03\x39\x00\x30\x31\x13\x01\x33\x01\x03\x11\x33\x11\
-\x41\x01\x11\x9f\xfe\xcf\x1a\x99\x04\x14\x01\x0b\xfe\xf5\xfb\xec\
-\x03\x8f\xfc\x71\x00\x00\x00\x00\x02\xff\xb7\x00\x00\x02\x33\x05\
-\x33\x00\x06\x00\x0a\x00\x29\x00\xb2\x07\x00\x00\x2b\xb2\x08\x01\
-\x00\x2b\x01\xb0\x0b\x2f\xb0\x07\xd6\xb1\x0a\x11\xe9\xb1\x0c\x01\
-\x2b\xb1\x0a\x07\x11\x12\xb2\x02\x01\x05\x39\x39\x39\x00\x30\x31\
-\x03\x01\x33\x01\x23\x27\x07\x13\x11\x33\x11\x49\x01\x00\x7c\x01\
-\x00\x7c\xc3\xc1\x75\x99\x04\x12\x01\x21\xfe\xdf\xcb\xcb\xfb\xee\
-\x03\x8f\xfc\x71\x00\x00\x00\x00\x03\x00\x0b\x00\x00\x02\x50\x05\
-\x48\x00\x03\x00\x07\x00\x0b\x00\x40\x00\xb2\x04\x00\x00\x2b\xb2\
-\x05\x01\x00\x2b\xb0\x00\x2f\xb0\x08\x33\xb1\x01\x04\xe9\xb0\x09\
-\x32\x01\xb0\x0c\x2f\xb0\x00\xd6\xb1\x03\x0e\xe9\xb0\x03\x10\xb1\
-\x04\x01\x2b\xb1\x07\x11\xe9\xb0\x07\x10\xb1\x08\x01\x2b\xb1\x0b\
-\x0e\xe9\xb1\x0d\x01\x2b\x00\x30\x31\x13\x35\x33\x15\x13\x11\x33\
-\x11\x13\x35\x33\x15\x0b\xb8\x1c\x99\x20\xb8\x04\x91\xb7\xb7\xfb\
-\x6f\x03\x8f\xfc\x71\x04\x91\xb7\xb7\x00\x00\x00\x02\x00\x3d\xff\
-\xe9\x03\xc1\x05\xc7\x00\x1f\x00\x2a\x00\x69\x00\xb2\x1d\x00\x00\
-\x2b\xb1\x23\x08\xe9\xb2\x0f\x02\x00\x2b\xb0\x12\x33\xb2\x03\x01\
-\x00\x2b\xb1\x28\x03\xe9\x01\xb0\x2b\x2f\xb0\x00\xd6\xb1\x20\x0d\
-\xe9\xb0\x20\x10\xb1\x26\x01\x2b\xb1\x18\x0d\xe9\xb1\x2c\x01\x2b\
-\xb1\x20\x00\x11\x12\xb1\x0b\x0e\x39\x39\xb0\x26\x11\xb6\x03\x05\
-\x0c\x0f\x13\x14\x1d\x24\x17\x39\x00\xb1\x28\x23\x11\x12\xb0\x00\
-\x39\xb0\x03\x11\xb0\x05\x39\xb0\x0f\x12\xb3\x08\x0a\x11\x14\x24\
-\x17\x39\x30\x31\x13\x34\x00\x33\x32\x17\x2e\x01\x27\x23\x07\x27\
-\x37\x26\x27\x37\x16\x17\x37\x17\x07\x16\x12\x1d\x01\x14\x07\x0e\
-\x01\x23\x22\x00\x37\x14\x16\x33\x32\x36\x10\x26\x23\x22\x06\x3d\
-\x01\x02\xbf\x60\x6f\x33\x61\x52\x02\xc2\x46\x8d\x81\x5c\x6d\x8b\
-\x67\xc8\x48\x96\x91\xca\x4c\x3f\xc7\x71\xb6\xfe\xf5\xa0\xae\x73\
-\x81\xa0\xa0\x81\x71\xb0\x01\xc3\xc5\x01\x28\x37\x66\x7d\x50\x71\
-\x7d\x52\x46\x1a\x5d\x29\x4a\x73\x7b\x56\x81\xfe\x7b\xf2\x1b\xb0\
-\x79\x62\x6f\x01\x0f\xe1\xb2\xba\xc8\x01\x33\xc9\xac\x00\x00\x00\
-\x02\x00\xa4\x00\x00\x03\x7d\x05\x1d\x00\x18\x00\x2b\x00\x7b\x00\
-\xb2\x00\x00\x00\x2b\xb0\x0c\x33\xb2\x05\x01\x00\x2b\xb0\x01\x33\
-\xb1\x14\x03\xe9\xb0\x29\x2f\xb1\x1c\x03\xe9\xb0\x22\x32\xb3\x1f\
-\x1c\x29\x08\x2b\xb1\x26\x03\xe9\xb0\x19\x32\x01\xb0\x2c\x2f\xb0\
-\x00\xd6\xb1\x18\x0d\xe9\xb1\x02\x2b\x32\x32\xb0\x18\x10\xb4\x19\
-\x16\x00\x32\x04\x2b\xb0\x19\x2f\xb0\x18\x10\xb1\x0d\x01\x2b\xb0\
-\x22\x32\xb1\x0c\x0d\xe9\xb4\x23\x16\x00\x32\x04\x2b\xb1\x2d\x01\
-\x2b\xb1\x0d\x18\x11\x12\xb4\x05\x1c\x1f\x26\x29\x24\x17\x39\x00\
-\xb1\x29\x00\x11\x12\xb0\x03\x39\x30\x31\x33\x11\x33\x15\x36\x33\
-\x32\x1e\x03\x15\x11\x23\x11\x34\x2e\x03\x23\x22\x06\x15\x11\x03\
-\x3e\x01\x33\x32\x16\x33\x32\x36\x37\x33\x0e\x01\x23\x22\x26\x23\
-\x22\x07\xa4\x95\x77\xb4\x4c\x6d\x39\x1f\x08\xa0\x02\x16\x27\x50\
-\x3a\x6d\x63\x8a\x02\x77\x50\x37\xae\x2b\x27\x2b\x02\x7d\x02\x77\
-\x50\x37\xae\x2b\x4c\x08\x03\x9a\x90\x9a\x2d\x42\x64\x4e\x35\xfd\
-\xb2\x02\x3f\x23\x29\x4c\x2d\x23\xb8\x83\xfe\x14\x04\x3b\x64\x7e\
-\x65\x3a\x2b\x62\x80\x63\x63\x00\x03\x00\x3d\xff\xe9\x03\xc1\x05\
-\x1f\x00\x0a\x00\x15\x00\x19\x00\x48\x00\xb2\x09\x00\x00\x2b\xb1\
-\x0e\x08\xe9\xb2\x03\x01\x00\x2b\xb1\x13\x03\xe9\x01\xb0\x1a\x2f\
-\xb0\x00\xd6\xb1\x0b\x0d\xe9\xb0\x0b\x10\xb1\x10\x01\x2b\xb1\x06\
-\x0d\xe9\xb1\x1b\x01\x2b\xb1\x10\x0b\x11\x12\xb4\x08\x09\x03\x16\
-\x18\x24\x17\x39\x00\xb1\x13\x0e\x11\x12\xb1\x06\x00\x39\x39\x30\
-\x31\x13\x34\x00\x33\x32\x00\x15\x14\x00\x20\x00\x37\x14\x16\x32\
-\x36\x35\x34\x26\x23\x22\x06\x13\x33\x01\x23\x3d\x01\x09\xb8\xc1\
-\x01\x02\xfe\xf1\xfe\x98\xfe\xf3\xa0\xae\xe6\xae\xae\x73\x71\xb0\
-\x5b\x9f\x01\x11\x7d\x01\xc5\xcf\x01\x1c\xfe\xd7\xc4\xcb\xfe\xf1\
-\x01\x11\xdf\xb4\xb8\xba\xb2\xac\xac\xac\x02\x9a\xfe\xf5\x00\x00\
-\x03\x00\x3d\xff\xe9\x03\xc1\x05\x1f\x00\x0a\x00\x15\x00\x19\x00\
-\x4f\x00\xb2\x09\x00\x00\x2b\xb1\x0e\x08\xe9\xb2\x03\x01\x00\x2b\
-\xb1\x13\x03\xe9\x01\xb0\x1a\x2f\xb0\x00\xd6\xb1\x0b\x0d\xe9\xb0\
-\x0b\x10\xb1\x10\x01\x2b\xb1\x06\x0d\xe9\xb1\x1b\x01\x2b\xb1\x10\
-\x0b\x11\x12\xb5\x08\x09\x03\x16\x17\x19\x24\x17\x39\xb0\x06\x11\
-\xb0\x18\x39\x00\xb1\x13\x0e\x11\x12\xb1\x06\x00\x39\x39\x30\x31\
-\x13\x34\x00\x33\x32\x00\x15\x14\x00\x20\x00\x37\x14\x16\x32\x36\
-\x35\x34\x26\x23\x22\x06\x13\x01\x33\x01\x3d\x01\x09\xb8\xc1\x01\
-\x02\xfe\xf1\xfe\x98\xfe\xf3\xa0\xae\xe6\xae\xae\x73\x71\xb0\xaa\
-\x01\x11\x9f\xfe\xcf\x01\xc5\xcf\x01\x1c\xfe\xd7\xc4\xcb\xfe\xf1\
-\x01\x11\xdf\xb4\xb8\xba\xb2\xac\xac\xac\x01\x8f\x01\x0b\xfe\xf5\
-\x00\x00\x00\x00\x03\x00\x3d\xff\xe9\x03\xc1\x05\x33\x00\x0a\x00\
-\x11\x00\x1c\x00\x56\x00\xb2\x09\x00\x00\x2b\xb1\x15\x08\xe9\xb2\
-\x03\x01\x00\x2b\xb1\x1a\x03\xe9\x01\xb0\x1d\x2f\xb0\x00\xd6\xb1\
-\x12\x0d\xe9\xb0\x12\x10\xb1\x17\x01\x2b\xb1\x06\x0d\xe9\xb1\x1e\
-\x01\x2b\xb1\x12\x00\x11\x12\xb0\x0b\x39\xb0\x17\x11\xb6\x08\x09\
-\x0c\x0d\x0f\x11\x03\x24\x17\x39\xb0\x06\x12\xb0\x0e\x39\x00\xb1\
-\x1a\x15\x11\x12\xb1\x06\x00\x39\x39\x30\x31\x13\x34\x00\x33\x32\
-\x00\x15\x14\x00\x20\x00\x13\x01\x33\x01\x23\x27\x07\x03\x14\x16\
-\x32\x36\x35\x34\x26\x23\x22\x06\x3d\x01\x09\xb8\xc1\x01\x02\xfe\
-\xf1\xfe\x98\xfe\xf3\x84\x01\x00\x7c\x01\x00\x7c\xc3\xc1\x60\xae\
-\xe6\xae\xae\x73\x71\xb0\x01\xc5\xcf\x01\x1c\xfe\xd7\xc4\xcb\xfe\
-\xf1\x01\x11\x03\x18\x01\x21\xfe\xdf\xcb\xcb\xfd\xc7\xb4\xb8\xba\
-\xb2\xac\xac\xac\x00\x00\x00\x00\x03\x00\x3d\xff\xe9\x03\xc1\x05\
-\x1d\x00\x0a\x00\x1d\x00\x28\x00\x86\x00\xb2\x09\x00\x00\x2b\xb1\
-\x21\x08\xe9\xb2\x03\x01\x00\x2b\xb1\x26\x03\xe9\xb0\x1b\x2f\xb1\
-\x0e\x03\xe9\xb0\x14\x32\xb3\x11\x0e\x1b\x08\x2b\xb1\x18\x03\xe9\
-\xb0\x0b\x32\x01\xb0\x29\x2f\xb0\x00\xd6\xb1\x1e\x0d\xe9\xb3\x0b\
-\x1e\x00\x08\x2b\xb4\x1d\x16\x00\x32\x04\x2b\xb0\x1e\x10\xb1\x23\
-\x01\x2b\xb1\x06\x0d\xe9\xb3\x15\x06\x23\x08\x2b\xb4\x14\x16\x00\
-\x32\x04\x2b\xb0\x14\x2f\xb4\x15\x16\x00\x32\x04\x2b\xb1\x2a\x01\
-\x2b\xb1\x14\x1d\x11\x12\xb7\x08\x09\x0e\x03\x18\x20\x21\x26\x24\
-\x17\x39\x00\xb1\x26\x21\x11\x12\xb1\x06\x00\x39\x39\x30\x31\x13\
-\x34\x00\x33\x32\x00\x15\x14\x00\x20\x00\x13\x3e\x01\x33\x32\x16\
-\x33\x32\x36\x37\x33\x0e\x01\x23\x22\x26\x23\x22\x07\x03\x14\x16\
-\x32\x36\x35\x34\x26\x23\x22\x06\x3d\x01\x09\xb8\xc1\x01\x02\xfe\
-\xf1\xfe\x98\xfe\xf3\x6d\x02\x77\x50\x37\xae\x2b\x27\x2b\x02\x7d\
-\x02\x77\x50\x37\xae\x2b\x4c\x08\x4a\xae\xe6\xae\xae\x73\x71\xb0\
-\x01\xc5\xcf\x01\x1c\xfe\xd7\xc4\xcb\xfe\xf1\x01\x11\x03\x41\x64\
-\x7e\x65\x3a\x2b\x62\x80\x63\x63\xfd\x9e\xb4\xb8\xba\xb2\xac\xac\
-\xac\x00\x00\x00\x04\x00\x3d\xff\xe9\x03\xc1\x05\x48\x00\x0a\x00\
-\x0e\x00\x19\x00\x1d\x00\x7c\x00\xb2\x09\x00\x00\x2b\xb1\x12\x08\
-\xe9\xb2\x03\x01\x00\x2b\xb1\x17\x03\xe9\xb0\x0b\x2f\xb0\x1a\x33\
-\xb1\x0c\x04\xe9\xb0\x1b\x32\x01\xb0\x1e\x2f\xb0\x00\xd6\xb1\x0f\
-\x0d\xe9\xb3\x0b\x0f\x00\x08\x2b\xb1\x0e\x0e\xe9\xb0\x0f\x10\xb1\
-\x14\x01\x2b\xb1\x06\x0d\xe9\xb3\x1d\x06\x14\x08\x2b\xb1\x1a\x0e\
-\xe9\xb0\x1a\x2f\xb1\x1d\x0e\xe9\xb1\x1f\x01\x2b\xb1\x0e\x0f\x11\
-\x12\xb1\x09\x11\x39\x39\xb0\x1a\x11\xb1\x03\x17\x39\x39\xb0\x1d\
-\x12\xb1\x08\x12\x39\x39\x00\xb1\x17\x12\x11\x12\xb1\x06\x00\x39\
-\x39\x30\x31\x13\x34\x00\x33\x32\x00\x15\x14\x00\x20\x00\x13\x35\
-\x33\x15\x03\x14\x16\x32\x36\x35\x34\x26\x23\x22\x06\x01\x35\x33\
-\x15\x3d\x01\x09\xb8\xc1\x01\x02\xfe\xf1\xfe\x98\xfe\xf3\x9f\xb8\
-\xb7\xae\xe6\xae\xae\x73\x71\xb0\x01\x8e\xb8\x01\xc5\xcf\x01\x1c\
-\xfe\xd7\xc4\xcb\xfe\xf1\x01\x11\x03\x97\xb7\xb7\xfd\x48\xb4\xb8\
-\xba\xb2\xac\xac\xac\x02\x0c\xb7\xb7\x00\x00\x00\x03\x00\x73\xff\
-\xba\x05\xc3\x04\x46\x00\x0b\x00\x1b\x00\x2b\x00\x3a\x00\xb0\x19\
-\x2f\xb4\x0f\x04\x00\x11\x04\x2b\xb0\x0b\x2f\xb4\x02\x0c\x00\x17\
-\x04\x2b\xb0\x29\x2f\xb4\x1f\x04\x00\x11\x04\x2b\x01\xb0\x2c\x2f\
-\xb0\x0c\xd6\xb0\x1c\x32\xb4\x14\x0e\x00\x11\x04\x2b\xb0\x23\x32\
-\xb1\x2d\x01\x2b\x00\x30\x31\x12\x34\x33\x21\x3a\x01\x1e\x01\x15\
-\x14\x23\x21\x01\x35\x26\x3b\x01\x32\x16\x1d\x01\x14\x0e\x01\x2b\
-\x01\x22\x26\x11\x35\x34\x37\x33\x32\x16\x1d\x01\x14\x0e\x01\x2b\
-\x01\x22\x26\x73\x3b\x04\xcb\x12\x0f\x1c\x0d\x3a\xfb\x21\x01\xf2\
-\x02\x39\x85\x2b\x17\x04\x19\x1f\x85\x25\x18\x37\x85\x21\x21\x04\
-\x19\x1d\x87\x1f\x1e\x01\xd7\x52\x08\x13\x0e\x29\xfe\x1d\x89\x39\
-\x1c\x21\x65\x27\x1c\x17\x1f\x03\xaa\x89\x39\x01\x15\x25\x68\x27\
-\x1d\x16\x16\x00\x03\x00\x3f\xff\x1b\x03\xbc\x04\x73\x00\x14\x00\
-\x1c\x00\x25\x00\x6e\x00\xb2\x0e\x00\x00\x2b\xb1\x1f\x03\xe9\xb2\
-\x03\x01\x00\x2b\xb1\x1a\x03\xe9\x01\xb0\x26\x2f\xb0\x00\xd6\xb1\
-\x15\x11\xe9\xb0\x15\x10\xb1\x22\x01\x2b\xb1\x0b\x11\xe9\xb1\x27\
-\x01\x2b\xb1\x15\x00\x11\x12\xb1\x11\x12\x39\x39\xb0\x22\x11\xb7\
-\x05\x03\x0e\x10\x09\x13\x18\x1d\x24\x17\x39\xb0\x0b\x12\xb1\x06\
-\x08\x39\x39\x00\xb1\x1f\x0e\x11\x12\xb1\x10\x13\x39\x39\xb0\x1a\
-\x11\xb3\x00\x18\x17\x24\x24\x17\x39\xb0\x03\x12\xb1\x05\x09\x39\
-\x39\x30\x31\x13\x34\x00\x33\x32\x17\x37\x33\x17\x07\x16\x07\x14\
-\x00\x23\x22\x27\x07\x27\x37\x26\x37\x14\x17\x01\x26\x07\x22\x06\
-\x13\x16\x33\x32\x36\x35\x34\x27\x23\x3f\x01\x03\xbc\x52\x62\x85\
-\x02\x6d\x8b\xa2\x01\xfe\xfc\xba\x52\x5e\x89\x6f\x8d\xa4\x9a\x4e\
-\x01\x4c\x48\x2d\x73\xb2\xb4\x39\x38\x77\xae\x4c\x02\x01\xc5\xc5\
-\x01\x26\x2b\xee\x3e\xf8\xa2\xd6\xc5\xfe\xe9\x27\xf5\x3d\xfc\x8e\
-\xe1\x83\x75\x02\x4c\x1b\x01\xb8\xfe\x06\x17\xb1\xa8\x98\x6c\x00\
-\x02\x00\xa4\xff\xe9\x03\x7d\x05\x1f\x00\x17\x00\x1b\x00\x52\x00\
-\xb2\x0f\x00\x00\x2b\xb2\x12\x00\x00\x2b\xb1\x06\x05\xe9\xb2\x01\
-\x01\x00\x2b\xb0\x0c\x33\x01\xb0\x1c\x2f\xb0\x00\xd6\xb1\x03\x0d\
-\xe9\xb0\x03\x10\xb1\x0b\x01\x2b\xb0\x0f\x32\xb1\x0e\x0d\xe9\xb1\
-\x1d\x01\x2b\xb1\x03\x00\x11\x12\xb0\x18\x39\xb0\x0b\x11\xb3\x12\
-\x19\x1a\x1b\x24\x17\x39\x00\xb1\x01\x06\x11\x12\xb0\x10\x39\x30\
-\x31\x37\x11\x33\x11\x1e\x01\x33\x32\x36\x37\x36\x35\x11\x33\x11\
-\x23\x35\x06\x23\x22\x2e\x03\x13\x33\x01\x23\xa4\xa0\x02\x3f\x62\
-\x6a\x82\x08\x02\xa0\x9c\x8b\xdb\x3d\x57\x2b\x16\x02\x89\x9f\x01\
-\x11\x7d\xfa\x02\x95\xfd\x52\x48\x3d\x71\x4a\x14\x27\x02\x3d\xfc\
-\x71\x62\x79\x27\x32\x58\x33\x04\x52\xfe\xf5\x00\x02\x00\xa4\xff\
-\xe9\x03\x7d\x05\x1f\x00\x17\x00\x1b\x00\x52\x00\xb2\x0f\x00\x00\
-\x2b\xb2\x12\x00\x00\x2b\xb1\x06\x05\xe9\xb2\x01\x01\x00\x2b\xb0\
-\x0c\x33\x01\xb0\x1c\x2f\xb0\x00\xd6\xb1\x03\x0d\xe9\xb0\x03\x10\
-\xb1\x0b\x01\x2b\xb0\x0f\x32\xb1\x0e\x0d\xe9\xb1\x1d\x01\x2b\xb1\
-\x03\x00\x11\x12\xb0\x18\x39\xb0\x0b\x11\xb3\x12\x19\x1a\x1b\x24\
-\x17\x39\x00\xb1\x01\x06\x11\x12\xb0\x10\x39\x30\x31\x37\x11\x33\
-\x11\x1e\x01\x33\x32\x36\x37\x36\x35\x11\x33\x11\x23\x35\x06\x23\
-\x22\x2e\x03\x13\x01\x33\x01\xa4\xa0\x02\x3f\x62\x6a\x82\x08\x02\
-\xa0\x9c\x8b\xdb\x3d\x57\x2b\x16\x02\x83\x01\x11\x9f\xfe\xcf\xfa\
-\x02\x95\xfd\x52\x48\x3d\x71\x4a\x14\x27\x02\x3d\xfc\x71\x62\x79\
-\x27\x32\x58\x33\x03\x47\x01\x0b\xfe\xf5\x00\x00\x02\x00\xa4\xff\
-\xe9\x03\x7d\x05\x33\x00\x17\x00\x1e\x00\x59\x00\xb2\x0f\x00\x00\
-\x2b\xb2\x12\x00\x00\x2b\xb1\x06\x05\xe9\xb2\x01\x01\x00\x2b\xb0\
-\x0c\x33\x01\xb0\x1f\x2f\xb0\x00\xd6\xb1\x03\x0d\xe9\xb0\x03\x10\
-\xb1\x0b\x01\x2b\xb0\x0f\x32\xb1\x0e\x0d\xe9\xb1\x20\x01\x2b\xb1\
-\x03\x00\x11\x12\xb0\x18\x39\xb0\x0b\x11\xb4\x12\x19\x1a\x1c\x1e\
-\x24\x17\x39\xb0\x0e\x12\xb0\x1b\x39\x00\xb1\x01\x06\x11\x12\xb0\
-\x10\x39\x30\x31\x37\x11\x33\x11\x1e\x01\x33\x32\x36\x37\x36\x35\
-\x11\x33\x11\x23\x35\x06\x23\x22\x2e\x03\x13\x01\x33\x01\x23\x27\
-\x07\xa4\xa0\x02\x3f\x62\x6a\x82\x08\x02\xa0\x9c\x8b\xdb\x3d\x57\
-\x2b\x16\x02\x2f\x01\x00\x7c\x01\x00\x7c\xc3\xc1\xfa\x02\x95\xfd\
-\x52\x48\x3d\x71\x4a\x14\x27\x02\x3d\xfc\x71\x62\x79\x27\x32\x58\
-\x33\x03\x45\x01\x21\xfe\xdf\xcb\xcb\x00\x00\x00\x03\x00\xa4\xff\
-\xe9\x03\x7d\x05\x48\x00\x17\x00\x1b\x00\x1f\x00\x76\x00\xb2\x0f\
-\x00\x00\x2b\xb2\x12\x00\x00\x2b\xb1\x06\x05\xe9\xb2\x01\x01\x00\
-\x2b\xb0\x0c\x33\xb0\x18\x2f\xb0\x1c\x33\xb1\x19\x04\xe9\xb0\x1d\
-\x32\x01\xb0\x20\x2f\xb0\x00\xd6\xb1\x03\x0d\xe9\xb0\x18\x20\xd6\
-\x11\xb1\x1b\x0e\xe9\xb0\x03\x10\xb1\x0b\x01\x2b\xb0\x0f\x32\xb1\
-\x0e\x0d\xe9\xb0\x0e\x10\xb0\x1f\x20\xd6\x11\xb1\x1c\x0e\xe9\xb0\
-\x1c\x2f\xb1\x1f\x0e\xe9\xb1\x21\x01\x2b\xb1\x1b\x18\x11\x12\xb0\
-\x12\x39\xb0\x1c\x11\xb0\x06\x39\x00\xb1\x01\x06\x11\x12\xb0\x10\
-\x39\x30\x31\x37\x11\x33\x11\x1e\x01\x33\x32\x36\x37\x36\x35\x11\
-\x33\x11\x23\x35\x06\x23\x22\x2e\x03\x13\x35\x33\x15\x33\x35\x33\
-\x15\xa4\xa0\x02\x3f\x62\x6a\x82\x08\x02\xa0\x9c\x8b\xdb\x3d\x57\
-\x2b\x16\x02\x4a\xb8\xd7\xb8\xfa\x02\x95\xfd\x52\x48\x3d\x71\x4a\
-\x14\x27\x02\x3d\xfc\x71\x62\x79\x27\x32\x58\x33\x03\xc4\xb7\xb7\
-\xb7\xb7\x00\x00\x02\x00\x1d\xfe\x5c\x03\x91\x05\x1f\x00\x19\x00\
-\x1d\x00\x2b\x00\xb2\x00\x01\x00\x2b\xb0\x07\x33\xb0\x0c\x2f\xb1\
-\x11\x05\xe9\x01\xb0\x1e\x2f\xb1\x1f\x01\x2b\x00\xb1\x11\x0c\x11\
-\x12\xb0\x0e\x39\xb0\x00\x11\xb1\x05\x0f\x39\x39\x30\x31\x13\x33\
-\x1a\x01\x16\x17\x36\x01\x33\x01\x0e\x01\x23\x22\x2f\x01\x16\x33\
-\x32\x36\x37\x36\x37\x36\x34\x27\x03\x01\x33\x01\x1d\xa1\x83\x84\
-\x16\x0c\x04\x01\x0d\x99\xfe\x44\x3b\x67\x4a\x54\x41\x0a\x6d\x28\
-\x37\x38\x39\x0e\x09\x08\x0a\x3e\x01\x11\x9f\xfe\xcf\x03\x8f\xfe\
-\xd3\xfe\xac\x58\x50\x8f\x02\x9a\xfb\xb9\x89\x63\x11\x85\x23\x50\
-\x8b\x23\x14\x12\x1d\x15\x03\xef\x01\x0b\xfe\xf5\x00\x00\x00\x00\
-\x02\x00\xa6\xfe\x71\x03\xd7\x05\xc7\x00\x0e\x00\x22\x00\x5b\x00\
-\xb2\x0b\x00\x00\x2b\xb1\x12\x03\xe9\xb2\x01\x02\x00\x2b\xb2\x05\
-\x01\x00\x2b\xb1\x18\x08\xe9\xb0\x00\x2f\x01\xb0\x23\x2f\xb0\x00\
-\xd6\xb1\x0e\x0d\xe9\xb1\x02\x0f\x32\x32\xb0\x0e\x10\xb1\x15\x01\
-\x2b\xb1\x08\x0d\xe9\xb1\x24\x01\x2b\xb1\x15\x0e\x11\x12\xb1\x05\
-\x0b\x39\x39\x00\xb1\x12\x0b\x11\x12\xb0\x0d\x39\xb0\x18\x11\xb0\
-\x08\x39\xb0\x05\x12\xb0\x03\x39\x30\x31\x13\x11\x33\x11\x36\x33\
-\x32\x12\x15\x14\x02\x23\x22\x27\x19\x01\x14\x16\x33\x32\x36\x35\
-\x34\x26\x23\x22\x0e\x06\x0f\x01\xa6\x99\x96\xbe\x8d\xb7\xe3\x9a\
-\x98\x7c\x74\x52\x73\xb6\x9b\x7b\x17\x29\x23\x1e\x1b\x14\x13\x0a\
-\x06\x06\xfe\x71\x07\x56\xfd\x64\x79\xfe\xe5\xbe\xd3\xfe\xf1\x75\
-\xfe\x13\x02\x91\x2d\x6f\xc5\x9c\x8b\xcf\x06\x0f\x0e\x12\x11\x14\
-\x0d\x06\x08\x00\x03\x00\x1d\xfe\x5c\x03\x91\x05\x48\x00\x19\x00\
-\x1d\x00\x21\x00\x68\x00\xb2\x00\x01\x00\x2b\xb0\x07\x33\xb0\x0c\
-\x2f\xb1\x11\x05\xe9\xb0\x1a\x2f\xb0\x1e\x33\xb1\x1b\x04\xe9\xb0\
-\x1f\x32\x01\xb0\x22\x2f\xb0\x1a\xd6\xb1\x1d\x0e\xe9\xb0\x1d\x10\
-\xb1\x1e\x01\x2b\xb1\x21\x0e\xe9\xb1\x23\x01\x2b\xb1\x1d\x1a\x11\
-\x12\xb2\x01\x11\x0c\x39\x39\x39\xb0\x1e\x11\xb4\x06\x14\x05\x18\
-\x17\x24\x17\x39\xb0\x21\x12\xb0\x07\x39\x00\xb1\x11\x0c\x11\x12\
-\xb0\x0e\x39\xb0\x00\x11\xb1\x05\x0f\x39\x39\x30\x31\x13\x33\x1a\
-\x01\x16\x17\x36\x01\x33\x01\x0e\x01\x23\x22\x2f\x01\x16\x33\x32\
-\x36\x37\x36\x37\x36\x34\x27\x03\x35\x33\x15\x33\x35\x33\x15\x1d\
-\xa1\x83\x84\x16\x0c\x04\x01\x0d\x99\xfe\x44\x3b\x67\x4a\x54\x41\
-\x0a\x6d\x28\x37\x38\x39\x0e\x09\x08\x0a\xe7\xb8\xd7\xb8\x03\x8f\
-\xfe\xd3\xfe\xac\x58\x50\x8f\x02\x9a\xfb\xb9\x89\x63\x11\x85\x23\
-\x50\x8b\x23\x14\x12\x1d\x15\x04\x6c\xb7\xb7\xb7\xb7\x00\x00\x00\
-\x03\x00\x37\x00\x00\x05\x19\x06\xb3\x00\x07\x00\x0b\x00\x10\x00\
-\x33\x00\xb2\x00\x00\x00\x2b\xb0\x03\x33\xb2\x01\x02\x00\x2b\xb4\
-\x06\x0c\x00\x01\x0d\x2b\xb1\x06\x05\xe9\xb0\x08\x2f\xb1\x09\x08\
-\xe9\x01\xb0\x11\x2f\xb1\x12\x01\x2b\x00\xb1\x01\x0c\x11\x12\xb0\
-\x0f\x39\x30\x31\x33\x01\x33\x01\x23\x03\x21\x03\x13\x35\x21\x15\
-\x01\x21\x02\x27\x06\x37\x02\x17\xb6\x02\x15\xbd\x9e\xfd\xaf\x9c\
-\x4a\x03\x1b\xfd\x62\x01\xfb\xf2\x0b\x1b\x05\x8d\xfa\x73\x01\xa2\
-\xfe\x5e\x06\x30\x83\x83\xfb\xe4\x02\x9e\x4c\x7d\x00\x00\x00\x00\
-\x03\x00\x5a\xff\xe9\x03\x50\x04\xee\x00\x1b\x00\x1f\x00\x2b\x00\
-\x83\x00\xb2\x14\x00\x00\x2b\xb2\x19\x00\x00\x2b\xb1\x23\x03\xe9\
-\xb2\x0f\x01\x00\x2b\xb1\x0a\x07\xe9\xb4\x27\x05\x19\x0f\x0d\x2b\
-\xb1\x27\x0c\xe9\xb0\x1c\x2f\xb1\x1d\x08\xe9\x01\xb0\x2c\x2f\xb0\
-\x00\xd6\xb1\x20\x10\xe9\xb0\x20\x10\xb1\x26\x01\x2b\xb1\x05\x14\
-\x32\x32\xb1\x13\x0d\xe9\xb1\x2d\x01\x2b\xb1\x20\x00\x11\x12\xb3\
-\x0c\x0d\x1c\x1d\x24\x17\x39\xb0\x26\x11\xb2\x0a\x0f\x19\x39\x39\
-\x39\xb0\x13\x12\xb0\x11\x39\x00\xb1\x27\x14\x11\x12\xb2\x00\x15\
-\x20\x39\x39\x39\xb1\x0a\x05\x11\x12\xb0\x0c\x39\xb0\x0f\x11\xb0\
-\x0d\x39\x30\x31\x37\x34\x3e\x02\x33\x35\x26\x27\x26\x23\x22\x07\
-\x27\x36\x33\x32\x16\x17\x11\x23\x35\x0e\x02\x23\x22\x26\x13\x35\
-\x21\x15\x01\x14\x16\x33\x32\x36\x3d\x01\x22\x0e\x02\x5a\x73\xba\
-\xb2\x5a\x04\x31\x33\x4e\x9e\x95\x0c\x9a\xa7\x8d\xbf\x08\x9b\x08\
-\x3c\xac\x64\x75\x75\x14\x02\xe2\xfd\xa0\x6c\x52\x58\x8d\x3f\x83\
-\x8b\x56\xe7\x4c\x71\x37\x1b\x45\x83\x3a\x3d\x68\x89\x5a\xba\x85\
-\xfd\x8f\x48\x08\x25\x32\xa6\x03\xdc\x83\x83\xfc\x7e\x37\x4a\x4a\
-\x58\x81\x10\x21\x44\x00\x00\x00\x03\x00\x37\x00\x00\x05\x19\x07\
-\x1d\x00\x07\x00\x14\x00\x19\x00\x76\x00\xb2\x00\x00\x00\x2b\xb0\
-\x03\x33\xb2\x01\x02\x00\x2b\xb4\x06\x15\x00\x01\x0d\x2b\xb1\x06\
-\x05\xe9\xb0\x12\x2f\xb1\x0c\x09\xe9\xb2\x0c\x12\x0a\x2b\xb3\x40\
-\x0c\x0f\x09\x2b\xb0\x08\x32\x01\xb0\x1a\x2f\xb0\x08\xd6\xb4\x09\
-\x16\x00\x32\x04\x2b\xb0\x09\x10\xb1\x0e\x01\x2b\xb4\x0f\x0f\x00\
-\x20\x04\x2b\xb1\x1b\x01\x2b\xb1\x09\x08\x11\x12\xb1\x06\x15\x39\
-\x39\xb0\x0e\x11\xb3\x02\x01\x12\x18\x24\x17\x39\xb0\x0f\x12\xb1\
-\x05\x16\x39\x39\x00\xb1\x01\x15\x11\x12\xb0\x18\x39\x30\x31\x33\
-\x01\x33\x01\x23\x03\x21\x03\x13\x33\x1e\x01\x32\x36\x37\x33\x0e\
-\x01\x23\x22\x26\x13\x21\x02\x27\x06\x37\x02\x17\xb6\x02\x15\xbd\
-\x9e\xfd\xaf\x9c\x6e\x7d\x06\x86\xa4\x85\x06\x7f\x04\xcf\x89\x8b\
-\xcc\x55\x01\xfb\xf2\x0b\x1b\x05\x8d\xfa\x73\x01\xa2\xfe\x5e\x07\
-\x1d\x5e\x65\x64\x5f\x93\xb9\xb9\xfb\x8a\x02\x9e\x4c\x7d\x00\x00\
-\x03\x00\x5a\xff\xe9\x03\x5c\x05\x1d\x00\x1b\x00\x2b\x00\x37\x00\
-\xc2\x00\xb2\x14\x00\x00\x2b\xb2\x19\x00\x00\x2b\xb1\x2f\x03\xe9\
-\xb2\x0f\x01\x00\x2b\xb1\x0a\x07\xe9\xb4\x33\x05\x19\x0f\x0d\x2b\
-\xb1\x33\x0c\xe9\xb0\x2a\x2f\xb1\x22\x09\xe9\xb2\x22\x2a\x0a\x2b\
-\xb3\x40\x22\x27\x09\x2b\xb0\x1c\x32\x01\xb0\x38\x2f\xb0\x00\xd6\
-\xb1\x2c\x10\xe9\xb0\x2c\x10\xb0\x1d\x20\xd6\x11\xb4\x1c\x16\x00\
-\x32\x04\x2b\xb0\x1c\x2f\xb4\x1d\x16\x00\x32\x04\x2b\xb0\x2c\x10\
-\xb1\x32\x01\x2b\xb1\x05\x14\x32\x32\xb1\x13\x0d\xe9\xb0\x13\x10\
-\xb0\x27\x20\xd6\x11\xb4\x26\x0f\x00\x20\x04\x2b\xb0\x26\x2f\xb4\
-\x27\x0f\x00\x20\x04\x2b\xb1\x39\x01\x2b\xb1\x1d\x1c\x11\x12\xb0\
-\x0c\x39\xb0\x32\x11\xb6\x0a\x0f\x19\x22\x29\x2a\x2f\x24\x17\x39\
-\xb0\x13\x12\xb0\x11\x39\x00\xb1\x33\x14\x11\x12\xb2\x00\x15\x2c\
-\x39\x39\x39\xb1\x0a\x05\x11\x12\xb0\x0c\x39\xb0\x0f\x11\xb0\x0d\
-\x39\x30\x31\x37\x34\x3e\x02\x33\x35\x26\x27\x26\x23\x22\x07\x27\
-\x36\x33\x32\x16\x17\x11\x23\x35\x0e\x02\x23\x22\x26\x13\x33\x1e\
-\x03\x32\x3e\x02\x37\x33\x0e\x01\x20\x26\x13\x14\x16\x33\x32\x36\
-\x3d\x01\x22\x0e\x02\x5a\x73\xba\xb2\x5a\x04\x31\x33\x4e\x9e\x95\
-\x0c\x9a\xa7\x8d\xbf\x08\x9b\x08\x3c\xac\x64\x75\x75\x4c\x7d\x04\
-\x35\x4e\x3d\x36\x3b\x4c\x35\x04\x7f\x04\xd1\xfe\xf2\xcf\x46\x6c\
-\x52\x58\x8d\x3f\x83\x8b\x56\xe7\x4c\x71\x37\x1b\x45\x83\x3a\x3d\
-\x68\x89\x5a\xba\x85\xfd\x8f\x48\x08\x25\x32\xa6\x04\x8e\x2f\x42\
-\x1d\x0a\x0a\x1d\x42\x2f\x85\x9c\x9c\xfc\x51\x37\x4a\x4a\x58\x81\
-\x10\x21\x44\x00\x02\x00\x37\xfe\x44\x05\x39\x05\x8d\x00\x20\x00\
-\x25\x00\x59\x00\xb2\x00\x00\x00\x2b\xb1\x03\x1d\x33\x33\xb2\x01\
-\x02\x00\x2b\xb0\x18\x2f\xb1\x13\x0a\xe9\xb4\x1f\x21\x00\x01\x0d\
-\x2b\xb1\x1f\x05\xe9\x01\xb0\x26\x2f\xb0\x1a\xd6\xb4\x10\x16\x00\
-\x32\x04\x2b\xb1\x27\x01\x2b\xb1\x10\x1a\x11\x12\xb1\x18\x1e\x39\
-\x39\x00\xb1\x13\x18\x11\x12\xb0\x16\x39\xb0\x00\x11\xb1\x15\x1a\
-\x39\x39\xb1\x01\x21\x11\x12\xb0\x24\x39\x30\x31\x33\x01\x33\x01\
-\x23\x30\x07\x0e\x08\x15\x14\x16\x33\x32\x37\x17\x06\x22\x26\x35\
-\x34\x36\x37\x03\x21\x03\x13\x21\x02\x27\x06\x37\x02\x17\xb6\x02\
-\x15\x3a\x06\x06\x12\x19\x19\x1c\x19\x18\x11\x0a\x33\x35\x2d\x5d\
-\x20\x6f\xaf\x6f\x60\x4e\x9c\xfd\xaf\x9c\xc7\x01\xfb\xf2\x0b\x1b\
-\x05\x8d\xfa\x73\x04\x04\x0a\x11\x12\x19\x18\x1f\x1f\x25\x10\x23\
-\x31\x1d\x79\x33\x64\x52\x4c\x8b\x2f\x01\xa2\xfe\x5e\x02\x14\x02\
-\x9e\x4c\x7d\x00\x02\x00\x5a\xfe\x44\x03\x77\x03\xb0\x00\x2e\x00\
-\x3c\x00\xa5\x00\xb2\x2c\x00\x00\x2b\xb1\x32\x03\xe9\xb2\x16\x00\
-\x00\x2b\xb2\x27\x00\x00\x2b\xb2\x11\x01\x00\x2b\xb1\x0a\x07\xe9\
-\xb0\x23\x2f\xb1\x1e\x0a\xe9\xb4\x38\x05\x2c\x11\x0d\x2b\xb1\x38\
-\x0c\xe9\x01\xb0\x3d\x2f\xb0\x00\xd6\xb1\x2f\x10\xe9\xb0\x2f\x10\
-\xb1\x25\x01\x2b\xb1\x1b\x16\xe9\xb0\x1b\x10\xb1\x37\x01\x2b\xb1\
-\x05\x27\x32\x32\xb1\x15\x0d\xe9\xb1\x3e\x01\x2b\xb1\x2f\x00\x11\
-\x12\xb1\x0e\x0f\x39\x39\xb0\x25\x11\xb3\x11\x0a\x2c\x32\x24\x17\
-\x39\xb0\x1b\x12\xb0\x23\x39\xb1\x15\x37\x11\x12\xb2\x13\x1e\x22\
-\x39\x39\x39\x00\xb1\x2c\x1e\x11\x12\xb2\x1b\x20\x25\x39\x39\x39\
-\xb0\x32\x11\xb0\x28\x39\xb0\x38\x12\xb1\x00\x2f\x39\x39\xb1\x0a\
-\x05\x11\x12\xb0\x0e\x39\x30\x31\x37\x34\x3e\x02\x33\x35\x26\x27\
-\x26\x23\x22\x0e\x01\x07\x27\x36\x33\x32\x16\x17\x11\x22\x07\x06\
-\x07\x06\x15\x14\x16\x33\x32\x37\x17\x06\x22\x26\x35\x34\x37\x35\
-\x0e\x02\x23\x22\x26\x37\x14\x16\x33\x32\x3e\x02\x3d\x01\x22\x0e\
-\x02\x5a\x73\xba\xb2\x5a\x04\x31\x33\x4e\x48\x81\x39\x31\x0c\x9a\
-\xa7\x8d\xbf\x08\x29\x14\x0c\x17\x77\x33\x3c\x23\x68\x21\x71\xb0\
-\x6d\xaf\x08\x3c\xac\x64\x73\x77\x96\x6c\x52\x25\x46\x4b\x2f\x3f\
-\x83\x8b\x56\xe7\x4c\x71\x37\x1b\x45\x83\x3a\x3d\x27\x20\x21\x89\
-\x5a\xba\x85\xfd\x8f\x0e\x06\x11\x52\x5e\x23\x35\x1d\x79\x33\x64\
-\x52\x98\x6e\x48\x08\x25\x32\xa4\x5c\x37\x4a\x0f\x1f\x45\x2f\x81\
-\x10\x21\x44\x00\x02\x00\x87\xff\xd3\x04\xb4\x06\xcd\x00\x22\x00\
-\x2b\x00\x3d\x00\xb2\x20\x00\x00\x2b\xb1\x13\x08\xe9\xb2\x05\x02\
-\x00\x2b\xb1\x0d\x08\xe9\x01\xb0\x2c\x2f\xb0\x00\xd6\xb1\x10\x0e\
-\xe9\xb1\x2d\x01\x2b\x00\xb1\x13\x20\x11\x12\xb0\x1d\x39\xb0\x0d\
-\x11\xb2\x00\x0a\x1c\x39\x39\x39\xb0\x05\x12\xb0\x09\x39\x30\x31\
-\x13\x34\x12\x3e\x01\x33\x32\x1e\x01\x17\x07\x2e\x01\x23\x22\x00\
-\x11\x10\x00\x33\x32\x3e\x06\x37\x17\x0e\x01\x23\x20\x00\x01\x24\
-\x37\x36\x3b\x01\x05\x0f\x01\x87\x75\xbc\xe2\x6e\x50\x5c\x94\x56\
-\x1f\x5c\x92\x6e\xcd\xfe\xe9\x01\x19\xd1\x27\x46\x31\x3b\x1d\x37\
-\x0e\x3e\x06\x0c\x6f\x9f\x7f\xfe\xdb\xfe\x85\x01\x5a\x01\x31\x0d\
-\x0a\x12\xc9\xfe\xbd\x2e\x1e\x02\xc7\xa8\x01\x22\xbd\x6c\x06\x1e\
-\x21\xaa\x37\x35\xfe\x94\xfe\xfc\xfe\xfa\xfe\x95\x06\x06\x15\x08\
-\x21\x08\x27\x04\x8f\x42\x2f\x01\xc3\x04\x7e\xb0\x05\x04\xa2\x14\
-\x03\x00\x00\x00\x02\x00\x48\xff\xe9\x03\x52\x05\x1f\x00\x18\x00\
-\x1c\x00\x3d\x00\xb2\x16\x00\x00\x2b\xb1\x11\x08\xe9\xb2\x03\x01\
-\x00\x2b\xb1\x0b\x08\xe9\x01\xb0\x1d\x2f\xb0\x00\xd6\xb1\x0e\x0d\
-\xe9\xb1\x1e\x01\x2b\x00\xb1\x11\x16\x11\x12\xb0\x14\x39\xb0\x0b\
-\x11\xb2\x00\x07\x13\x39\x39\x39\xb0\x03\x12\xb0\x06\x39\x30\x31\
-\x13\x34\x12\x33\x32\x16\x17\x07\x26\x27\x26\x23\x22\x06\x15\x14\
-\x16\x33\x32\x37\x17\x06\x07\x22\x00\x13\x01\x33\x01\x48\xf5\xcd\
-\x60\x7f\x5f\x19\x64\x35\x3b\x53\x8b\x96\xa0\x7f\xa0\xa2\x0a\xa2\
-\xac\xbc\xff\x00\xe9\x01\x11\x9f\xfe\xcf\x01\xc9\xbe\x01\x29\x25\
-\x35\x87\x3f\x0f\x10\xd3\x91\x98\xc4\x6e\x89\x68\x01\x01\x19\x03\
-\x12\x01\x0b\xfe\xf5\x00\x00\x00\x02\x00\x87\xff\xd3\x04\xb4\x07\
-\x33\x00\x22\x00\x29\x00\x3d\x00\xb2\x20\x00\x00\x2b\xb1\x13\x08\
-\xe9\xb2\x05\x02\x00\x2b\xb1\x0d\x08\xe9\x01\xb0\x2a\x2f\xb0\x00\
-\xd6\xb1\x10\x0e\xe9\xb1\x2b\x01\x2b\x00\xb1\x13\x20\x11\x12\xb0\
-\x1d\x39\xb0\x0d\x11\xb2\x00\x0a\x1c\x39\x39\x39\xb0\x05\x12\xb0\
-\x09\x39\x30\x31\x13\x34\x12\x3e\x01\x33\x32\x1e\x01\x17\x07\x2e\
-\x01\x23\x22\x00\x11\x10\x00\x33\x32\x3e\x06\x37\x17\x0e\x01\x23\
-\x20\x00\x01\x13\x33\x13\x23\x27\x07\x87\x75\xbc\xe2\x6e\x50\x5c\
-\x94\x56\x1f\x5c\x92\x6e\xcd\xfe\xe9\x01\x19\xd1\x27\x46\x31\x3b\
-\x1d\x37\x0e\x3e\x06\x0c\x6f\x9f\x7f\xfe\xdb\xfe\x85\x01\x40\xfd\
-\x9c\xe3\x7c\xc1\xc1\x02\xc7\xa8\x01\x22\xbd\x6c\x06\x1e\x21\xaa\
-\x37\x35\xfe\x94\xfe\xfc\xfe\xfa\xfe\x95\x06\x06\x15\x08\x21\x08\
-\x27\x04\x8f\x42\x2f\x01\xc3\x04\x3b\x01\x62\xfe\x9e\xfa\xfa\x00\
-\x02\x00\x48\xff\xe9\x03\x52\x05\x33\x00\x18\x00\x1f\x00\x45\x00\
-\xb2\x16\x00\x00\x2b\xb1\x11\x08\xe9\xb2\x03\x01\x00\x2b\xb1\x0b\
-\x08\xe9\x01\xb0\x20\x2f\xb0\x00\xd6\xb1\x0e\x0d\xe9\xb1\x21\x01\
-\x2b\xb1\x0e\x00\x11\x12\xb0\x19\x39\x00\xb1\x11\x16\x11\x12\xb0\
-\x14\x39\xb0\x0b\x11\xb2\x00\x07\x13\x39\x39\x39\xb0\x03\x12\xb0\
-\x06\x39\x30\x31\x13\x34\x12\x33\x32\x16\x17\x07\x26\x27\x26\x23\
-\x22\x06\x15\x14\x16\x33\x32\x37\x17\x06\x07\x22\x00\x13\x01\x33\
-\x01\x23\x27\x07\x48\xf5\xcd\x60\x7f\x5f\x19\x64\x35\x3b\x53\x8b\
-\x96\xa0\x7f\xa0\xa2\x0a\xa2\xac\xbc\xff\x00\x83\x01\x00\x7c\x01\
-\x00\x7c\xc3\xc1\x01\xc9\xbe\x01\x29\x25\x35\x87\x3f\x0f\x10\xd3\
-\x91\x98\xc4\x6e\x89\x68\x01\x01\x19\x03\x10\x01\x21\xfe\xdf\xcb\
-\xcb\x00\x00\x00\x02\x00\x87\xff\xd3\x04\xb4\x06\xd7\x00\x22\x00\
-\x26\x00\x5c\x00\xb2\x20\x00\x00\x2b\xb1\x13\x08\xe9\xb2\x05\x02\
-\x00\x2b\xb1\x0d\x08\xe9\xb0\x23\x2f\xb1\x24\x04\xe9\x01\xb0\x27\
-\x2f\xb0\x00\xd6\xb1\x10\x0e\xe9\xb0\x10\x10\xb1\x23\x01\x2b\xb1\
-\x26\x0e\xe9\xb1\x28\x01\x2b\xb1\x26\x23\x11\x12\xb3\x0d\x13\x20\
-\x05\x24\x17\x39\x00\xb1\x13\x20\x11\x12\xb0\x1d\x39\xb0\x0d\x11\
-\xb2\x00\x0a\x1c\x39\x39\x39\xb0\x05\x12\xb0\x09\x39\x30\x31\x13\
-\x34\x12\x3e\x01\x33\x32\x1e\x01\x17\x07\x2e\x01\x23\x22\x00\x11\
-\x10\x00\x33\x32\x3e\x06\x37\x17\x0e\x01\x23\x20\x00\x01\x35\x33\
-\x15\x87\x75\xbc\xe2\x6e\x50\x5c\x94\x56\x1f\x5c\x92\x6e\xcd\xfe\
-\xe9\x01\x19\xd1\x27\x46\x31\x3b\x1d\x37\x0e\x3e\x06\x0c\x6f\x9f\
-\x7f\xfe\xdb\xfe\x85\x02\x23\xb8\x02\xc7\xa8\x01\x22\xbd\x6c\x06\
-\x1e\x21\xaa\x37\x35\xfe\x94\xfe\xfc\xfe\xfa\xfe\x95\x06\x06\x15\
-\x08\x21\x08\x27\x04\x8f\x42\x2f\x01\xc3\x04\x8a\xb7\xb7\x00\x00\
-\x02\x00\x48\xff\xe9\x03\x52\x05\x6f\x00\x18\x00\x1c\x00\x5c\x00\
-\xb2\x16\x00\x00\x2b\xb1\x11\x08\xe9\xb2\x03\x01\x00\x2b\xb1\x0b\
-\x08\xe9\xb0\x19\x2f\xb1\x1a\x04\xe9\x01\xb0\x1d\x2f\xb0\x00\xd6\
-\xb1\x0e\x0d\xe9\xb0\x0e\x10\xb1\x19\x01\x2b\xb1\x1c\x0e\xe9\xb1\
-\x1e\x01\x2b\xb1\x1c\x19\x11\x12\xb3\x0b\x11\x16\x03\x24\x17\x39\
-\x00\xb1\x11\x16\x11\x12\xb0\x14\x39\xb0\x0b\x11\xb2\x00\x07\x13\
-\x39\x39\x39\xb0\x03\x12\xb0\x06\x39\x30\x31\x13\x34\x12\x33\x32\
-\x16\x17\x07\x26\x27\x26\x23\x22\x06\x15\x14\x16\x33\x32\x37\x17\
-\x06\x07\x22\x00\x01\x35\x33\x15\x48\xf5\xcd\x60\x7f\x5f\x19\x64\
-\x35\x3b\x53\x8b\x96\xa0\x7f\xa0\xa2\x0a\xa2\xac\xbc\xff\x00\x01\
-\x67\xb8\x01\xc9\xbe\x01\x29\x25\x35\x87\x3f\x0f\x10\xd3\x91\x98\
-\xc4\x6e\x89\x68\x01\x01\x19\x03\xb6\xb7\xb7\x00\x02\x00\x87\xff\
-\xd3\x04\xb4\x07\x1d\x00\x22\x00\x29\x00\x3d\x00\xb2\x20\x00\x00\
-\x2b\xb1\x13\x08\xe9\xb2\x05\x02\x00\x2b\xb1\x0d\x08\xe9\x01\xb0\
-\x2a\x2f\xb0\x00\xd6\xb1\x10\x0e\xe9\xb1\x2b\x01\x2b\x00\xb1\x13\
-\x20\x11\x12\xb0\x1d\x39\xb0\x0d\x11\xb2\x00\x0a\x1c\x39\x39\x39\
-\xb0\x05\x12\xb0\x09\x39\x30\x31\x13\x34\x12\x3e\x01\x33\x32\x1e\
-\x01\x17\x07\x2e\x01\x23\x22\x00\x11\x10\x00\x33\x32\x3e\x06\x37\
-\x17\x0e\x01\x23\x20\x00\x01\x33\x17\x37\x33\x03\x23\x87\x75\xbc\
-\xe2\x6e\x50\x5c\x94\x56\x1f\x5c\x92\x6e\xcd\xfe\xe9\x01\x19\xd1\
-\x27\x46\x31\x3b\x1d\x37\x0e\x3e\x06\x0c\x6f\x9f\x7f\xfe\xdb\xfe\
-\x85\x01\x50\x7d\xc7\xc6\x7d\xfa\x93\x02\xc7\xa8\x01\x22\xbd\x6c\
-\x06\x1e\x21\xaa\x37\x35\xfe\x94\xfe\xfc\xfe\xfa\xfe\x95\x06\x06\
-\x15\x08\x21\x08\x27\x04\x8f\x42\x2f\x01\xc3\x05\x87\xe4\xe4\xfe\
-\xb4\x00\x00\x00\x02\x00\x48\xff\xe9\x03\x52\x05\x1d\x00\x18\x00\
-\x27\x00\x45\x00\xb2\x16\x00\x00\x2b\xb1\x11\x08\xe9\xb2\x03\x01\
-\x00\x2b\xb1\x0b\x08\xe9\x01\xb0\x28\x2f\xb0\x00\xd6\xb1\x0e\x0d\
-\xe9\xb1\x29\x01\x2b\xb1\x0e\x00\x11\x12\xb0\x19\x39\x00\xb1\x11\
-\x16\x11\x12\xb0\x14\x39\xb0\x0b\x11\xb2\x00\x07\x13\x39\x39\x39\
-\xb0\x03\x12\xb0\x06\x39\x30\x31\x13\x34\x12\x33\x32\x16\x17\x07\
-\x26\x27\x26\x23\x22\x06\x15\x14\x16\x33\x32\x37\x17\x06\x07\x22\
-\x00\x13\x33\x17\x37\x33\x17\x06\x07\x06\x2b\x01\x22\x26\x27\x26\
-\x48\xf5\xcd\x60\x7f\x5f\x19\x64\x35\x3b\x53\x8b\x96\xa0\x7f\xa0\
-\xa2\x0a\xa2\xac\xbc\xff\x00\x6a\x7f\xcd\xcb\x47\x38\xfc\x0f\x0a\
-\x10\x4a\x17\x33\x6c\x44\x01\xc9\xbe\x01\x29\x25\x35\x87\x3f\x0f\
-\x10\xd3\x91\x98\xc4\x6e\x89\x68\x01\x01\x19\x04\x1b\x8c\x8c\x02\
-\xb4\x07\x04\x1f\x50\x31\x00\x00\x03\x00\xc3\x00\x00\x05\x54\x07\
-\x1d\x00\x0c\x00\x13\x00\x1d\x00\x4a\x00\xb2\x00\x00\x00\x2b\xb1\
-\x14\x05\xe9\xb2\x01\x02\x00\x2b\xb1\x1d\x05\xe9\x01\xb0\x1e\x2f\
-\xb0\x00\xd6\xb1\x14\x15\xe9\xb0\x14\x10\xb1\x19\x01\x2b\xb1\x07\
-\x15\xe9\xb1\x1f\x01\x2b\xb1\x14\x00\x11\x12\xb0\x0d\x39\xb0\x19\
-\x11\xb2\x0e\x13\x11\x39\x39\x39\x00\xb1\x1d\x14\x11\x12\xb0\x07\
-\x39\x30\x31\x33\x11\x21\x32\x17\x16\x12\x15\x10\x00\x07\x06\x23\
-\x01\x33\x17\x37\x33\x03\x23\x03\x21\x20\x37\x36\x35\x10\x00\x23\
-\x21\xc3\x01\xf7\xcd\x94\x96\xa3\xfe\xb0\xe3\x21\x42\xfe\x46\x7b\
-\xc9\xc5\x81\xfc\x94\x89\x01\x25\x01\x00\x8f\x79\xfe\xef\xf7\xfe\
-\xdb\x05\x8d\x60\x62\xfe\xae\xbd\xfe\xe3\xfe\x80\x1b\x04\x07\x1d\
-\xe4\xe4\xfe\xb4\xfa\xa2\xbc\x9e\xed\x01\x04\x01\x5d\x00\x00\x00\
-\x03\x00\x48\xff\xe9\x04\x96\x06\x1d\x00\x0e\x00\x1f\x00\x2a\x00\
-\x7a\x00\xb2\x09\x00\x00\x2b\xb2\x0c\x00\x00\x2b\xb1\x12\x03\xe9\
-\xb2\x06\x02\x00\x2b\xb2\x03\x01\x00\x2b\xb1\x1b\x03\xe9\x01\xb0\
-\x2b\x2f\xb0\x00\xd6\xb1\x0f\x0d\xe9\xb0\x0f\x10\xb1\x09\x01\x2b\
-\xb1\x05\x15\x32\x32\xb1\x08\x0d\xe9\xb0\x08\x10\xb1\x22\x01\x2b\
-\xb0\x20\x32\xb1\x25\x14\xe9\xb1\x2c\x01\x2b\xb1\x09\x0f\x11\x12\
-\xb1\x03\x0c\x39\x39\xb1\x25\x22\x11\x12\xb0\x21\x39\x00\xb1\x1b\
-\x12\x11\x12\xb1\x00\x0a\x39\x39\xb0\x03\x11\xb0\x05\x39\xb0\x06\
-\x12\xb3\x20\x21\x22\x29\x24\x17\x39\x30\x31\x13\x34\x12\x33\x32\
-\x17\x11\x33\x11\x23\x35\x06\x23\x22\x02\x37\x14\x16\x33\x32\x36\
-\x35\x11\x34\x27\x26\x27\x23\x22\x0e\x02\x01\x37\x23\x35\x33\x15\
-\x0e\x03\x07\x48\xd5\x97\x9c\x8d\x9c\xa2\x85\xaa\x98\xc8\x9f\xac\
-\x69\x56\x85\x2b\x42\x56\x04\x31\x60\x5e\x3a\x03\x02\x36\x36\xad\
-\x02\x0b\x0c\x29\x15\x01\xc5\xcb\x01\x16\x71\x02\x92\xfa\x39\x6a\
-\x81\x01\x1e\xc0\xb6\xa9\x75\x35\x01\x88\x27\x28\x3d\x01\x25\x4c\
-\x8f\x02\xa0\xaa\xac\x8e\x14\x21\x1b\x4d\x2b\x00\x02\x00\x00\x00\
-\x00\x05\x54\x05\x8d\x00\x10\x00\x1f\x00\x67\x00\xb2\x0f\x00\x00\
-\x2b\xb1\x11\x05\xe9\xb2\x03\x02\x00\x2b\xb1\x1a\x05\xe9\xb4\x00\
-\x01\x0f\x03\x0d\x2b\xb0\x1c\x33\xb1\x00\x06\xe9\xb0\x1e\x32\x01\
-\xb0\x20\x2f\xb0\x0f\xd6\xb0\x02\x32\xb1\x11\x15\xe9\xb0\x1a\x32\
-\xb2\x11\x0f\x0a\x2b\xb3\x40\x11\x1e\x09\x2b\xb2\x0f\x11\x0a\x2b\
-\xb3\x40\x0f\x00\x09\x2b\xb0\x11\x10\xb1\x16\x01\x2b\xb1\x09\x15\
-\xe9\xb1\x21\x01\x2b\x00\xb1\x01\x00\x11\x12\xb1\x09\x16\x39\x39\
-\x30\x31\x11\x35\x33\x11\x21\x32\x17\x16\x12\x15\x10\x00\x07\x06\
-\x23\x21\x11\x13\x21\x20\x37\x36\x35\x10\x00\x23\x21\x07\x11\x21\
-\x15\x21\xc3\x01\xf7\xcd\x94\x96\xa3\xfe\xb2\xe3\x21\x41\xfe\x02\
-\xb2\x01\x27\x01\x00\x8f\x79\xfe\xf2\xfc\xfe\xdd\x02\x01\x6e\xfe\
-\x92\x02\x7d\x79\x02\x97\x60\x62\xfe\xae\xbd\xfe\xe3\xfe\x80\x1b\
-\x04\x02\x7d\xfd\xf6\xbc\x9e\xed\x01\x00\x01\x61\x4c\xfe\x27\x79\
-\x00\x00\x00\x00\x02\x00\x48\xff\xe9\x04\x48\x05\xc7\x00\x16\x00\
-\x27\x00\x85\x00\xb2\x11\x00\x00\x2b\xb2\x14\x00\x00\x2b\xb1\x1a\
-\x03\xe9\xb2\x0a\x02\x00\x2b\xb2\x03\x01\x00\x2b\xb1\x23\x03\xe9\
-\xb4\x08\x07\x23\x0a\x0d\x2b\xb0\x0e\x33\xb1\x08\x06\xe9\xb0\x0c\
-\x32\x01\xb0\x28\x2f\xb0\x00\xd6\xb1\x17\x0d\xe9\xb0\x17\x10\xb1\
-\x11\x01\x2b\xb2\x05\x09\x1d\x32\x32\x32\xb1\x10\x0d\xe9\xb0\x0b\
-\x32\xb2\x10\x11\x0a\x2b\xb3\x40\x10\x0e\x09\x2b\xb2\x11\x10\x0a\
-\x2b\xb3\x40\x11\x07\x09\x2b\xb1\x29\x01\x2b\xb1\x11\x17\x11\x12\
-\xb1\x03\x14\x39\x39\x00\xb1\x23\x11\x11\x12\xb1\x00\x12\x39\x39\
-\xb0\x03\x11\xb0\x05\x39\x30\x31\x13\x34\x12\x33\x32\x17\x11\x21\
-\x35\x21\x35\x33\x15\x33\x15\x23\x11\x23\x35\x06\x23\x22\x02\x37\
-\x14\x16\x33\x32\x36\x35\x11\x34\x27\x26\x27\x23\x22\x0e\x02\x48\
-\xd5\x97\x9c\x8d\xfe\x79\x01\x87\x9c\xcf\xcf\xa2\x85\xaa\x98\xc8\
-\x9f\xac\x69\x56\x85\x2b\x42\x56\x04\x31\x60\x5e\x3a\x01\xc5\xcb\
-\x01\x16\x71\x01\x33\x79\xe6\xe6\x79\xfb\x98\x6a\x81\x01\x1e\xc0\
-\xb6\xa9\x75\x35\x01\x88\x27\x28\x3d\x01\x25\x4c\x8f\x00\x00\x00\
-\x02\x00\xc1\x00\x00\x04\x71\x06\xb3\x00\x12\x00\x16\x00\x5b\x00\
-\xb2\x00\x00\x00\x2b\xb1\x0e\x0b\xe9\xb2\x01\x02\x00\x2b\xb1\x06\
-\x08\xe9\xb4\x08\x0b\x00\x01\x0d\x2b\xb1\x08\x03\xe9\xb0\x13\x2f\
-\xb1\x14\x08\xe9\x01\xb0\x17\x2f\xb0\x00\xd6\xb1\x0c\x0e\xe9\xb0\
-\x07\x32\xb2\x0c\x00\x0a\x2b\xb3\x40\x0c\x12\x09\x2b\xb3\x40\x0c\
-\x02\x09\x2b\xb3\x40\x0c\x0a\x09\x2b\xb1\x18\x01\x2b\xb1\x0c\x00\
-\x11\x12\xb1\x13\x14\x39\x39\x00\x30\x31\x33\x11\x21\x15\x23\x27\
-\x21\x27\x11\x21\x15\x21\x11\x33\x37\x21\x37\x33\x15\x01\x35\x21\
-\x15\xc1\x03\x93\x75\x33\xfe\x15\x48\x02\xa4\xfd\x5c\xae\x31\x01\
-\x8d\x2d\x5f\xfc\x9a\x03\x1b\x05\x87\x87\x02\x02\xfe\x1b\x7d\xfd\
-\xed\x02\x02\x93\x06\x30\x83\x83\x00\x00\x00\x00\x03\x00\x46\xff\
-\xe9\x03\x54\x04\xee\x00\x14\x00\x18\x00\x21\x00\x5a\x00\xb2\x12\
-\x00\x00\x2b\xb1\x0d\x03\xe9\xb2\x03\x01\x00\x2b\xb1\x1f\x03\xe9\
-\xb4\x19\x0a\x12\x03\x0d\x2b\xb1\x19\x05\xe9\xb0\x15\x2f\xb1\x16\
-\x08\xe9\x01\xb0\x22\x2f\xb0\x00\xd6\xb1\x0a\x0f\xe9\xb2\x0a\x00\
-\x0a\x2b\xb3\x40\x0a\x09\x09\x2b\xb1\x23\x01\x2b\xb1\x0a\x00\x11\
-\x12\xb1\x15\x16\x39\x39\x00\xb1\x0a\x0d\x11\x12\xb0\x0f\x39\xb0\
-\x19\x11\xb0\x00\x39\x30\x31\x13\x34\x12\x33\x32\x1e\x02\x17\x15\
-\x21\x1e\x01\x33\x32\x37\x17\x06\x07\x22\x02\x13\x35\x21\x15\x01\
-\x21\x2e\x03\x23\x22\x06\x46\xf7\xa6\x3d\x6f\x71\x4a\x06\xfd\x85\
-\x06\xb0\x79\x9c\x9b\x0d\x9c\xa8\xc3\xfb\x2c\x02\xe2\xfd\x8b\x01\
-\xfc\x0c\x40\x50\x3f\x1d\x68\x88\x01\xcf\xcb\x01\x16\x27\x5a\xb4\
-\x7d\x3b\x9a\xc1\x71\x87\x68\x01\x01\x21\x03\x61\x83\x83\xfd\xc8\
-\x50\x6f\x2f\x10\xa0\x00\x00\x00\x02\x00\xc1\x00\x00\x04\x71\x06\
-\xd7\x00\x12\x00\x16\x00\x5c\x00\xb2\x00\x00\x00\x2b\xb1\x0e\x0b\
-\xe9\xb2\x01\x02\x00\x2b\xb1\x06\x08\xe9\xb4\x08\x0b\x00\x01\x0d\
-\x2b\xb1\x08\x03\xe9\xb0\x13\x2f\xb1\x14\x04\xe9\x01\xb0\x17\x2f\
-\xb0\x00\xd6\xb1\x0c\x0e\xe9\xb0\x07\x32\xb2\x0c\x00\x0a\x2b\xb3\
-\x40\x0c\x12\x09\x2b\xb3\x40\x0c\x02\x09\x2b\xb3\x40\x0c\x0a\x09\
-\x2b\xb0\x0c\x10\xb1\x13\x01\x2b\xb1\x16\x0e\xe9\xb1\x18\x01\x2b\
-\x00\x30\x31\x33\x11\x21\x15\x23\x27\x21\x27\x11\x21\x15\x21\x11\
-\x33\x37\x21\x37\x33\x15\x01\x35\x33\x15\xc1\x03\x93\x75\x33\xfe\
-\x15\x48\x02\xa4\xfd\x5c\xae\x31\x01\x8d\x2d\x5f\xfd\xcb\xb8\x05\
-\x87\x87\x02\x02\xfe\x1b\x7d\xfd\xed\x02\x02\x93\x06\x20\xb7\xb7\
-\x00\x00\x00\x00\x03\x00\x46\xff\xe9\x03\x50\x05\x6f\x00\x14\x00\
-\x1d\x00\x21\x00\x6e\x00\xb2\x12\x00\x00\x2b\xb1\x0d\x03\xe9\xb2\
-\x03\x01\x00\x2b\xb1\x1b\x03\xe9\xb4\x15\x0a\x12\x03\x0d\x2b\xb1\
-\x15\x05\xe9\xb0\x1e\x2f\xb1\x1f\x04\xe9\x01\xb0\x22\x2f\xb0\x00\
-\xd6\xb1\x0a\x0f\xe9\xb2\x0a\x00\x0a\x2b\xb3\x40\x0a\x09\x09\x2b\
-\xb0\x0a\x10\xb1\x1e\x01\x2b\xb1\x21\x0e\xe9\xb1\x23\x01\x2b\xb1\
-\x1e\x0a\x11\x12\xb0\x15\x39\xb0\x21\x11\xb3\x0d\x12\x1b\x03\x24\
-\x17\x39\x00\xb1\x0a\x0d\x11\x12\xb0\x0f\x39\xb0\x15\x11\xb0\x00\
-\x39\x30\x31\x13\x34\x12\x33\x32\x1e\x02\x17\x15\x21\x1e\x01\x33\
-\x32\x37\x17\x06\x07\x22\x02\x13\x21\x2e\x03\x23\x22\x06\x13\x35\
-\x33\x15\x46\xf7\xa6\x3d\x6f\x71\x4a\x06\xfd\x85\x06\xb0\x79\x9c\
-\x9b\x0d\x9c\xa8\xc3\xfb\x99\x01\xfc\x0c\x40\x50\x3f\x1d\x68\x88\
-\x95\xb8\x01\xcf\xcb\x01\x16\x27\x5a\xb4\x7d\x3b\x9a\xc1\x71\x87\
-\x68\x01\x01\x21\x01\x29\x50\x6f\x2f\x10\xa0\x02\x27\xb7\xb7\x00\
-\x01\x00\xc1\xfe\x44\x04\x71\x05\x87\x00\x24\x00\x74\x00\xb2\x24\
-\x00\x00\x2b\xb0\x12\x33\xb1\x0e\x0b\xe9\xb2\x01\x02\x00\x2b\xb1\
-\x06\x08\xe9\xb0\x20\x2f\xb1\x1b\x0a\xe9\xb4\x08\x0b\x24\x01\x0d\
-\x2b\xb1\x08\x03\xe9\x01\xb0\x25\x2f\xb0\x00\xd6\xb1\x0c\x0e\xe9\
-\xb0\x07\x32\xb0\x0c\x10\xb1\x22\x01\x2b\xb4\x19\x16\x00\x32\x04\
-\x2b\xb2\x19\x22\x0a\x2b\xb3\x40\x19\x12\x09\x2b\xb3\x40\x19\x02\
-\x09\x2b\xb3\x40\x19\x0a\x09\x2b\xb1\x26\x01\x2b\xb1\x19\x22\x11\
-\x12\xb0\x20\x39\x00\xb1\x24\x1b\x11\x12\xb1\x1d\x22\x39\x39\x30\
-\x31\x33\x11\x21\x15\x23\x27\x21\x27\x11\x21\x15\x21\x11\x33\x37\
-\x21\x37\x33\x15\x23\x22\x06\x07\x0e\x01\x15\x14\x33\x32\x37\x17\
-\x06\x22\x26\x35\x34\x37\xc1\x03\x93\x75\x33\xfe\x15\x48\x02\xa4\
-\xfd\x5c\xae\x31\x01\x8d\x2d\x5f\x52\x29\x1b\x2b\x2d\x4e\x69\x2f\
-\x5c\x1f\x6f\xb0\x6f\xae\x05\x87\x87\x02\x02\xfe\x1b\x7d\xfd\xed\
-\x02\x02\x93\x0a\x1d\x1f\x62\x31\x54\x1d\x79\x33\x64\x52\x93\x73\
-\x00\x00\x00\x00\x02\x00\x46\xfe\x44\x03\x50\x03\xb0\x00\x25\x00\
-\x2e\x00\x7f\x00\xb2\x23\x00\x00\x2b\xb1\x0c\x03\xe9\xb2\x03\x01\
-\x00\x2b\xb1\x2c\x03\xe9\xb0\x1c\x2f\xb1\x17\x0a\xe9\xb4\x26\x09\
-\x23\x03\x0d\x2b\xb1\x26\x05\xe9\x01\xb0\x2f\x2f\xb0\x00\xd6\xb1\
-\x09\x0f\xe9\xb2\x09\x00\x0a\x2b\xb3\x40\x09\x08\x09\x2b\xb0\x09\
-\x10\xb1\x1e\x01\x2b\xb1\x14\x16\xe9\xb1\x30\x01\x2b\xb1\x1e\x09\
-\x11\x12\xb0\x26\x39\xb0\x14\x11\xb4\x0c\x03\x1c\x23\x2c\x24\x17\
-\x39\x00\xb1\x23\x17\x11\x12\xb2\x14\x19\x1e\x39\x39\x39\xb0\x0c\
-\x11\xb0\x0f\x39\xb0\x09\x12\xb0\x0e\x39\xb0\x26\x11\xb0\x00\x39\
-\x30\x31\x13\x34\x12\x33\x32\x1e\x02\x15\x21\x1e\x01\x33\x32\x37\
-\x17\x0e\x03\x15\x14\x16\x33\x32\x37\x17\x06\x22\x26\x35\x34\x37\
-\x22\x06\x23\x22\x00\x13\x21\x2e\x03\x23\x22\x06\x46\xef\xae\x3d\
-\x73\x77\x46\xfd\x85\x06\xb2\x77\x98\x9f\x0d\x08\x94\x52\x54\x3c\
-\x2d\x2b\x64\x1f\x6f\xb0\x6f\x8e\x04\x15\x04\xb6\xfe\xfc\x99\x01\
-\xfc\x0c\x40\x50\x3f\x1d\x68\x88\x01\xcf\xc3\x01\x1e\x29\x64\xcf\
-\x91\x9c\xc1\x73\x87\x04\x54\x39\x67\x33\x2b\x29\x1d\x79\x33\x64\
-\x52\x7f\x73\x03\x01\x19\x01\x31\x50\x6f\x2f\x10\xa0\x00\x00\x00\
-\x02\x00\xc1\x00\x00\x04\x71\x07\x1d\x00\x12\x00\x19\x00\x52\x00\
-\xb2\x00\x00\x00\x2b\xb1\x0e\x0b\xe9\xb2\x01\x02\x00\x2b\xb1\x06\
-\x08\xe9\xb4\x08\x0b\x00\x01\x0d\x2b\xb1\x08\x03\xe9\x01\xb0\x1a\
-\x2f\xb0\x00\xd6\xb1\x0c\x0e\xe9\xb0\x07\x32\xb2\x0c\x00\x0a\x2b\
-\xb3\x40\x0c\x12\x09\x2b\xb3\x40\x0c\x02\x09\x2b\xb3\x40\x0c\x0a\
-\x09\x2b\xb1\x1b\x01\x2b\xb1\x0c\x00\x11\x12\xb0\x13\x39\x00\x30\
-\x31\x33\x11\x21\x15\x23\x27\x21\x27\x11\x21\x15\x21\x11\x33\x37\
-\x21\x37\x33\x15\x01\x33\x17\x37\x33\x03\x23\xc1\x03\x93\x75\x33\
-\xfe\x15\x48\x02\xa4\xfd\x5c\xae\x31\x01\x8d\x2d\x5f\xfc\xad\x7b\
-\xc9\xc5\x81\xfc\x94\x05\x87\x87\x02\x02\xfe\x1b\x7d\xfd\xed\x02\
-\x02\x93\x07\x1d\xe4\xe4\xfe\xb4\x00\x00\x00\x00\x03\x00\x46\xff\
-\xe9\x03\x50\x05\x1d\x00\x14\x00\x23\x00\x2c\x00\x57\x00\xb2\x12\
-\x00\x00\x2b\xb1\x0d\x03\xe9\xb2\x03\x01\x00\x2b\xb1\x2a\x03\xe9\
-\xb4\x24\x0a\x12\x03\x0d\x2b\xb1\x24\x05\xe9\x01\xb0\x2d\x2f\xb0\
-\x00\xd6\xb1\x0a\x0f\xe9\xb2\x0a\x00\x0a\x2b\xb3\x40\x0a\x09\x09\
-\x2b\xb1\x2e\x01\x2b\xb1\x0a\x00\x11\x12\xb0\x15\x39\x00\xb1\x0d\
-\x12\x11\x12\xb0\x10\x39\xb0\x0a\x11\xb0\x0f\x39\xb0\x24\x12\xb0\
-\x00\x39\x30\x31\x13\x34\x12\x33\x32\x1e\x02\x17\x15\x21\x1e\x01\
-\x33\x32\x37\x17\x06\x07\x22\x02\x13\x33\x17\x37\x33\x17\x06\x07\
-\x06\x2b\x01\x22\x26\x27\x26\x13\x21\x2e\x03\x23\x22\x06\x46\xf7\
-\xa6\x3d\x6f\x71\x4a\x06\xfd\x85\x06\xb0\x79\x9c\x9b\x0d\x9c\xa8\
-\xc3\xfb\x51\x7f\xcd\xcb\x47\x38\xfc\x0f\x0a\x10\x4a\x17\x33\x6c\
-\x44\x1b\x01\xfc\x0c\x40\x50\x3f\x1d\x68\x88\x01\xcf\xcb\x01\x16\
-\x27\x5a\xb4\x7d\x3b\x9a\xc1\x71\x87\x68\x01\x01\x21\x04\x13\x8c\
-\x8c\x02\xb4\x07\x04\x1f\x50\x31\xfd\x37\x50\x6f\x2f\x10\xa0\x00\
-\x02\x00\x87\xff\xd3\x04\xcb\x07\x33\x00\x1b\x00\x22\x00\x79\x00\
-\xb2\x19\x00\x00\x2b\xb1\x10\x08\xe9\xb2\x03\x02\x00\x2b\xb1\x0a\
-\x08\xe9\xb4\x14\x15\x19\x03\x0d\x2b\xb1\x14\x03\xe9\x01\xb0\x23\
-\x2f\xb0\x00\xd6\xb1\x0d\x0e\xe9\xb0\x0d\x10\xb1\x12\x01\x2b\xb1\
-\x17\x0d\xe9\xb2\x12\x17\x0a\x2b\xb3\x40\x12\x14\x09\x2b\xb1\x24\
-\x01\x2b\xb1\x12\x0d\x11\x12\xb5\x0a\x03\x19\x1c\x1e\x20\x24\x17\
-\x39\xb0\x17\x11\xb2\x06\x05\x1f\x39\x39\x39\x00\xb1\x10\x19\x11\
-\x12\xb0\x17\x39\xb1\x0a\x15\x11\x12\xb2\x00\x06\x0d\x39\x39\x39\
-\xb0\x03\x11\xb0\x05\x39\x30\x31\x13\x10\x00\x21\x32\x17\x07\x2e\
-\x02\x23\x22\x00\x15\x10\x00\x33\x32\x37\x11\x21\x35\x21\x11\x06\
-\x23\x20\x00\x01\x13\x33\x13\x23\x27\x07\x87\x01\x83\x01\x17\xd5\
-\xc4\x1e\x3b\x4f\x95\x58\xd3\xfe\xed\x01\x19\xcb\x6a\x9e\xfe\xf0\
-\x01\xb0\xcd\xdd\xfe\xe7\xfe\x7f\x01\x5b\xfd\x9c\xe3\x7c\xc1\xc1\
-\x02\xc7\x01\x3b\x01\xb8\x62\xaa\x2d\x2f\x2d\xfe\x8e\xfc\xfe\xfa\
-\xfe\x93\x2b\x01\x64\x7f\xfd\xd1\x62\x01\xbb\x04\x43\x01\x62\xfe\
-\x9e\xfa\xfa\x00\x04\x00\x37\xfe\x5a\x03\xe1\x05\x33\x00\x30\x00\
-\x37\x00\x45\x00\x51\x00\xc9\x00\xb2\x42\x00\x00\x2b\xb1\x23\x0b\
-\xe9\xb2\x01\x00\x00\x2b\xb2\x0c\x01\x00\x2b\xb0\x11\x33\xb1\x4f\
-\x05\xe9\xb0\x12\x32\xb0\x2e\x2f\xb1\x3c\x05\xe9\xb4\x1c\x49\x01\
-\x0c\x0d\x2b\xb1\x1c\x06\xe9\x01\xb0\x52\x2f\xb0\x09\xd6\xb1\x04\
-\x31\x32\x32\xb1\x46\x0f\xe9\xb0\x46\x10\xb0\x38\x20\xd6\x11\xb1\
-\x00\x0f\xe9\xb0\x00\x2f\xb1\x38\x0f\xe9\xb0\x09\x10\xb1\x20\x16\
-\xe9\xb0\x46\x10\xb1\x4c\x01\x2b\xb1\x19\x0f\xe9\xb0\x19\x10\xb1\
-\x3f\x01\x2b\xb1\x2b\x0f\xe9\xb1\x53\x01\x2b\xb1\x46\x09\x11\x12\
-\xb3\x02\x06\x1e\x37\x24\x17\x39\xb1\x4c\x20\x11\x12\x40\x09\x1c\
-\x0c\x24\x2e\x32\x33\x36\x3c\x42\x24\x17\x39\xb0\x19\x11\xb5\x0f\
-\x16\x0e\x17\x34\x35\x24\x17\x39\x00\xb1\x42\x3c\x11\x12\xb0\x00\
-\x39\xb0\x23\x11\xb0\x02\x39\xb0\x1c\x12\xb0\x04\x39\xb0\x49\x11\
-\xb0\x1e\x39\xb0\x4f\x12\xb3\x06\x09\x16\x19\x24\x17\x39\x30\x31\
-\x17\x34\x37\x26\x35\x34\x37\x35\x26\x35\x34\x36\x33\x32\x17\x27\
-\x36\x37\x17\x26\x23\x22\x07\x27\x16\x15\x14\x06\x23\x22\x27\x06\
-\x17\x14\x16\x3b\x01\x32\x1e\x02\x17\x16\x17\x14\x04\x23\x22\x24\
-\x13\x01\x33\x01\x23\x27\x07\x03\x14\x1e\x01\x33\x32\x36\x35\x34\
-\x21\x23\x07\x0e\x01\x13\x14\x16\x33\x32\x36\x35\x34\x26\x23\x22\
-\x06\x37\x83\x33\x3c\x44\xc3\x83\x68\x60\x04\x98\xaa\x16\x3d\x3c\
-\x06\x93\x13\x50\xbc\x8b\x5a\x61\x17\x01\x31\x41\x9a\x48\x64\x96\
-\x64\x14\x0a\x01\xfe\xf5\xbc\xbe\xfe\xf7\x4f\x01\x00\x7c\x01\x00\
-\x7c\xc3\xc1\x3b\x6e\x87\x40\x81\xb8\xfe\xcf\x81\x3b\x3b\x46\x47\
-\x65\x54\x46\x70\x64\x54\x46\x71\x91\x85\x4e\x4a\x51\x5c\x50\x02\
-\x58\x73\x91\xbd\x44\x04\x3f\x01\x81\x06\x08\x10\x6d\x6e\x85\xc9\
-\x3e\x2d\x1f\x29\x44\x0a\x23\x5c\x48\x29\x22\x77\xa0\xa0\x05\x18\
-\x01\x21\xfe\xdf\xcb\xcb\xfb\x5d\x35\x4c\x1f\x58\x46\x8d\x02\x06\
-\x52\x02\xb6\x62\x75\x64\x75\x62\x75\x64\x00\x00\x02\x00\x87\xff\
-\xd3\x04\xcb\x07\x1d\x00\x1b\x00\x28\x00\x98\x00\xb2\x19\x00\x00\
-\x2b\xb1\x10\x08\xe9\xb2\x03\x02\x00\x2b\xb1\x0a\x08\xe9\xb4\x14\
-\x15\x19\x03\x0d\x2b\xb1\x14\x03\xe9\xb0\x26\x2f\xb1\x20\x09\xe9\
-\xb2\x20\x26\x0a\x2b\xb3\x40\x20\x23\x09\x2b\xb0\x1c\x32\x01\xb0\
-\x29\x2f\xb0\x00\xd6\xb1\x0d\x0e\xe9\xb0\x0d\x10\xb1\x1c\x01\x2b\
-\xb4\x1d\x16\x00\x32\x04\x2b\xb0\x1d\x10\xb1\x12\x01\x2b\xb1\x17\
-\x0d\xe9\xb2\x12\x17\x0a\x2b\xb3\x40\x12\x14\x09\x2b\xb0\x12\x10\
-\xb0\x22\x20\xd6\x11\xb4\x23\x0f\x00\x20\x04\x2b\xb1\x2a\x01\x2b\
-\xb1\x22\x1d\x11\x12\xb4\x0a\x10\x03\x19\x26\x24\x17\x39\x00\xb1\
-\x0a\x15\x11\x12\xb2\x00\x06\x0d\x39\x39\x39\xb0\x03\x11\xb0\x05\
-\x39\x30\x31\x13\x10\x00\x21\x32\x17\x07\x2e\x02\x23\x22\x00\x15\
-\x10\x00\x33\x32\x37\x11\x21\x35\x21\x11\x06\x23\x20\x00\x01\x33\
-\x1e\x01\x32\x36\x37\x33\x0e\x01\x23\x22\x26\x87\x01\x83\x01\x17\
-\xd5\xc4\x1e\x3b\x4f\x95\x58\xd3\xfe\xed\x01\x19\xcb\x6a\x9e\xfe\
-\xf0\x01\xb0\xcd\xdd\xfe\xe7\xfe\x7f\x01\x3a\x7c\x06\x86\xa4\x85\
-\x06\x7f\x04\xcf\x89\x8b\xcb\x02\xc7\x01\x3b\x01\xb8\x62\xaa\x2d\
-\x2f\x2d\xfe\x8e\xfc\xfe\xfa\xfe\x93\x2b\x01\x64\x7f\xfd\xd1\x62\
-\x01\xbb\x05\x8f\x5e\x65\x64\x5f\x96\xb6\xb9\x00\x04\x00\x37\xfe\
-\x5a\x03\xe1\x05\x1d\x00\x30\x00\x40\x00\x4e\x00\x5a\x01\x10\x00\
-\xb2\x4b\x00\x00\x2b\xb1\x23\x0b\xe9\xb2\x01\x00\x00\x2b\xb2\x0c\
-\x01\x00\x2b\xb0\x11\x33\xb1\x58\x05\xe9\xb0\x12\x32\xb0\x2e\x2f\
-\xb1\x45\x05\xe9\xb4\x1c\x52\x01\x0c\x0d\x2b\xb1\x1c\x06\xe9\xb0\
-\x3f\x2f\xb1\x37\x09\xe9\xb2\x37\x3f\x0a\x2b\xb3\x40\x37\x3c\x09\
-\x2b\xb0\x31\x32\x01\xb0\x5b\x2f\xb0\x09\xd6\xb0\x04\x32\xb1\x4f\
-\x0f\xe9\xb0\x4f\x10\xb0\x41\x20\xd6\x11\xb1\x00\x0f\xe9\xb0\x00\
-\x2f\xb1\x41\x0f\xe9\xb0\x09\x10\xb1\x20\x16\xe9\xb0\x4f\x10\xb0\
-\x32\x20\xd6\x11\xb4\x31\x16\x00\x32\x04\x2b\xb0\x31\x2f\xb4\x32\
-\x16\x00\x32\x04\x2b\xb0\x4f\x10\xb1\x55\x01\x2b\xb1\x19\x0f\xe9\
-\xb3\x3b\x19\x55\x08\x2b\xb4\x3c\x0f\x00\x20\x04\x2b\xb0\x19\x10\
-\xb1\x48\x01\x2b\xb1\x2b\x0f\xe9\xb1\x5c\x01\x2b\xb1\x4f\x09\x11\
-\x12\xb2\x02\x06\x1e\x39\x39\x39\xb1\x32\x31\x11\x12\xb0\x07\x39\
-\xb0\x55\x11\x40\x0b\x1c\x23\x24\x2e\x0c\x37\x3f\x45\x4b\x52\x58\
-\x24\x17\x39\xb0\x19\x12\xb4\x0f\x16\x0e\x17\x3e\x24\x17\x39\x00\
-\xb1\x4b\x45\x11\x12\xb0\x00\x39\xb0\x23\x11\xb0\x02\x39\xb0\x1c\
-\x12\xb0\x04\x39\xb0\x52\x11\xb0\x1e\x39\xb0\x58\x12\xb3\x06\x09\
-\x16\x19\x24\x17\x39\xb0\x0c\x11\xb1\x0e\x17\x39\x39\x30\x31\x17\
-\x34\x37\x26\x35\x34\x37\x35\x26\x35\x34\x36\x33\x32\x17\x27\x36\
-\x37\x17\x26\x23\x22\x07\x27\x16\x15\x14\x06\x23\x22\x27\x06\x17\
-\x14\x16\x3b\x01\x32\x1e\x02\x17\x16\x17\x14\x04\x23\x22\x24\x13\
-\x33\x1e\x03\x32\x3e\x02\x37\x33\x0e\x01\x20\x26\x13\x14\x1e\x01\
-\x33\x32\x36\x35\x34\x21\x23\x07\x0e\x01\x13\x14\x16\x33\x32\x36\
-\x35\x34\x26\x23\x22\x06\x37\x83\x33\x3c\x44\xc3\x83\x68\x60\x04\
-\x98\xaa\x16\x3d\x3c\x06\x93\x13\x50\xbc\x8b\x5a\x61\x17\x01\x31\
-\x41\x9a\x48\x64\x96\x64\x14\x0a\x01\xfe\xf5\xbc\xbe\xfe\xf7\x6d\
-\x7d\x04\x35\x4e\x3d\x36\x3b\x4c\x35\x04\x7f\x04\xd1\xfe\xf2\xcf\
-\x1f\x6e\x87\x40\x81\xb8\xfe\xcf\x81\x3b\x3b\x46\x47\x65\x54\x46\
-\x70\x64\x54\x46\x71\x91\x85\x4e\x4a\x51\x5c\x50\x02\x58\x73\x91\
-\xbd\x44\x04\x3f\x01\x81\x06\x08\x10\x6d\x6e\x85\xc9\x3e\x2d\x1f\
-\x29\x44\x0a\x23\x5c\x48\x29\x22\x77\xa0\xa0\x06\x23\x2f\x42\x1d\
-\x0a\x0a\x1d\x42\x2f\x85\x9c\x9c\xfa\xd7\x35\x4c\x1f\x58\x46\x8d\
-\x02\x06\x52\x02\xb6\x62\x75\x64\x75\x62\x75\x64\x00\x00\x00\x00\
-\x02\x00\x87\xff\xd3\x04\xcb\x06\xd7\x00\x1b\x00\x1f\x00\x81\x00\
-\xb2\x19\x00\x00\x2b\xb1\x10\x08\xe9\xb2\x03\x02\x00\x2b\xb1\x0a\
-\x08\xe9\xb4\x14\x15\x19\x03\x0d\x2b\xb1\x14\x03\xe9\xb0\x1c\x2f\
-\xb1\x1d\x04\xe9\x01\xb0\x20\x2f\xb0\x00\xd6\xb1\x0d\x0e\xe9\xb0\
-\x0d\x10\xb1\x1c\x01\x2b\xb1\x1f\x0e\xe9\xb0\x1f\x10\xb1\x12\x01\
-\x2b\xb1\x17\x0d\xe9\xb2\x12\x17\x0a\x2b\xb3\x40\x12\x14\x09\x2b\
-\xb1\x21\x01\x2b\xb1\x1f\x1c\x11\x12\xb3\x0a\x10\x03\x19\x24\x17\
-\x39\xb1\x17\x12\x11\x12\xb1\x06\x05\x39\x39\x00\xb1\x0a\x15\x11\
-\x12\xb2\x00\x06\x0d\x39\x39\x39\xb0\x03\x11\xb0\x05\x39\x30\x31\
-\x13\x10\x00\x21\x32\x17\x07\x2e\x02\x23\x22\x00\x15\x10\x00\x33\
-\x32\x37\x11\x21\x35\x21\x11\x06\x23\x20\x00\x01\x35\x33\x15\x87\
-\x01\x83\x01\x17\xd5\xc4\x1e\x3b\x4f\x95\x58\xd3\xfe\xed\x01\x19\
-\xcb\x6a\x9e\xfe\xf0\x01\xb0\xcd\xdd\xfe\xe7\xfe\x7f\x02\x3e\xb8\
-\x02\xc7\x01\x3b\x01\xb8\x62\xaa\x2d\x2f\x2d\xfe\x8e\xfc\xfe\xfa\
-\xfe\x93\x2b\x01\x64\x7f\xfd\xd1\x62\x01\xbb\x04\x92\xb7\xb7\x00\
-\x04\x00\x37\xfe\x5a\x03\xe1\x05\x6f\x00\x30\x00\x3e\x00\x4a\x00\
-\x4e\x00\xe4\x00\xb2\x3b\x00\x00\x2b\xb1\x23\x0b\xe9\xb2\x01\x00\
-\x00\x2b\xb2\x0c\x01\x00\x2b\xb0\x11\x33\xb1\x48\x05\xe9\xb0\x12\
-\x32\xb0\x2e\x2f\xb1\x35\x05\xe9\xb4\x1c\x42\x01\x0c\x0d\x2b\xb1\
-\x1c\x06\xe9\xb0\x4b\x2f\xb1\x4c\x04\xe9\x01\xb0\x4f\x2f\xb0\x09\
-\xd6\xb0\x04\x32\xb1\x3f\x0f\xe9\xb0\x3f\x10\xb0\x31\x20\xd6\x11\
-\xb1\x00\x0f\xe9\xb0\x00\x2f\xb1\x31\x0f\xe9\xb0\x09\x10\xb1\x20\
-\x16\xe9\xb0\x3f\x10\xb1\x4b\x01\x2b\xb1\x4e\x0e\xe9\xb0\x4e\x10\
-\xb1\x45\x01\x2b\xb1\x19\x0f\xe9\xb0\x19\x10\xb1\x38\x01\x2b\xb1\
-\x2b\x0f\xe9\xb1\x50\x01\x2b\xb1\x3f\x09\x11\x12\xb2\x02\x06\x1e\
-\x39\x39\x39\xb1\x4b\x20\x11\x12\xb0\x23\x39\xb0\x4e\x11\xb7\x1c\
-\x24\x2e\x35\x3b\x42\x48\x0c\x24\x17\x39\xb1\x19\x45\x11\x12\xb3\
-\x0f\x16\x0e\x17\x24\x17\x39\x00\xb1\x3b\x35\x11\x12\xb0\x00\x39\
-\xb0\x23\x11\xb0\x02\x39\xb0\x1c\x12\xb0\x04\x39\xb0\x42\x11\xb0\
-\x1e\x39\xb0\x48\x12\xb3\x06\x09\x16\x19\x24\x17\x39\xb0\x0c\x11\
-\xb1\x0e\x17\x39\x39\x30\x31\x17\x34\x37\x26\x35\x34\x37\x35\x26\
-\x35\x34\x36\x33\x32\x17\x27\x36\x37\x17\x26\x23\x22\x07\x27\x16\
-\x15\x14\x06\x23\x22\x27\x06\x17\x14\x16\x3b\x01\x32\x1e\x02\x17\
-\x16\x17\x14\x04\x23\x22\x24\x37\x14\x1e\x01\x33\x32\x36\x35\x34\
-\x21\x23\x07\x0e\x01\x13\x14\x16\x33\x32\x36\x35\x34\x26\x23\x22\
-\x06\x13\x35\x33\x15\x37\x83\x33\x3c\x44\xc3\x83\x68\x60\x04\x98\
-\xaa\x16\x3d\x3c\x06\x93\x13\x50\xbc\x8b\x5a\x61\x17\x01\x31\x41\
-\x9a\x48\x64\x96\x64\x14\x0a\x01\xfe\xf5\xbc\xbe\xfe\xf7\x90\x6e\
-\x87\x40\x81\xb8\xfe\xcf\x81\x3b\x3b\x46\x47\x65\x54\x46\x70\x64\
-\x54\x46\x71\x5c\xb8\x91\x85\x4e\x4a\x51\x5c\x50\x02\x58\x73\x91\
-\xbd\x44\x04\x3f\x01\x81\x06\x08\x10\x6d\x6e\x85\xc9\x3e\x2d\x1f\
-\x29\x44\x0a\x23\x5c\x48\x29\x22\x77\xa0\xa0\x75\x35\x4c\x1f\x58\
-\x46\x8d\x02\x06\x52\x02\xb6\x62\x75\x64\x75\x62\x75\x64\x01\xed\
-\xb7\xb7\x00\x00\x02\x00\xc1\x00\x00\x04\xe9\x07\x33\x00\x0b\x00\
-\x12\x00\x49\x00\xb2\x00\x00\x00\x2b\xb0\x07\x33\xb2\x01\x02\x00\
-\x2b\xb0\x05\x33\xb4\x03\x0a\x00\x01\x0d\x2b\xb1\x03\x03\xe9\x01\
-\xb0\x13\x2f\xb0\x00\xd6\xb1\x0b\x0e\xe9\xb0\x02\x32\xb0\x0b\x10\
-\xb1\x08\x01\x2b\xb0\x04\x32\xb1\x07\x0e\xe9\xb1\x14\x01\x2b\xb1\
-\x08\x0b\x11\x12\xb1\x0c\x0f\x39\x39\x00\x30\x31\x33\x11\x33\x11\
-\x21\x11\x33\x11\x23\x11\x21\x11\x1b\x01\x33\x13\x23\x27\x07\xc1\
-\xb8\x02\xb8\xb8\xb8\xfd\x48\x1d\xfd\x9c\xe3\x7c\xc1\xc1\x05\x8d\
-\xfd\x96\x02\x6a\xfa\x73\x02\xa4\xfd\x5c\x05\xd1\x01\x62\xfe\x9e\
-\xfa\xfa\x00\x00\x02\x00\xa4\x00\x00\x03\x7d\x07\x4a\x00\x18\x00\
-\x1f\x00\x5a\x00\xb2\x00\x00\x00\x2b\xb0\x0c\x33\xb2\x01\x02\x00\
-\x2b\xb2\x05\x01\x00\x2b\xb1\x14\x03\xe9\x01\xb0\x20\x2f\xb0\x01\
-\xd6\xb1\x03\x11\xe9\xb0\x17\x32\xb0\x03\x10\xb1\x0d\x01\x2b\xb1\
-\x0c\x0d\xe9\xb1\x21\x01\x2b\xb1\x03\x01\x11\x12\xb0\x19\x39\xb0\
-\x0d\x11\xb3\x1a\x1b\x1d\x1f\x24\x17\x39\xb0\x0c\x12\xb1\x09\x1c\
-\x39\x39\x00\xb1\x14\x00\x11\x12\xb0\x03\x39\x30\x31\x33\x11\x33\
-\x11\x36\x37\x32\x1e\x03\x15\x11\x23\x11\x34\x2e\x03\x23\x22\x06\
-\x15\x11\x03\x01\x33\x01\x23\x27\x07\xa4\x99\x7b\xac\x4e\x6f\x37\
-\x1f\x06\xa0\x02\x16\x27\x50\x3a\x6d\x63\x73\x01\x00\x7c\x01\x00\
-\x7c\xc3\xc1\x05\xc7\xfd\x4b\x91\x01\x31\x44\x68\x48\x31\xfd\xb2\
-\x02\x3f\x23\x29\x4c\x2d\x23\xb8\x83\xfe\x14\x06\x29\x01\x21\xfe\
-\xdf\xcb\xcb\x00\x01\x00\x21\x00\x00\x03\xdd\x05\x8f\x00\x20\x00\
-\x6b\x00\xb2\x1f\x00\x00\x2b\xb0\x12\x33\xb2\x03\x02\x00\x2b\xb2\
-\x0b\x01\x00\x2b\xb1\x1a\x03\xe9\xb4\x00\x01\x1a\x03\x0d\x2b\xb0\
-\x05\x33\xb1\x00\x06\xe9\xb0\x07\x32\x01\xb0\x21\x2f\xb0\x20\xd6\
-\xb0\x02\x32\xb1\x09\x11\xe9\xb1\x04\x1d\x32\x32\xb2\x09\x20\x0a\
-\x2b\xb3\x40\x09\x07\x09\x2b\xb2\x20\x09\x0a\x2b\xb3\x40\x20\x00\
-\x09\x2b\xb0\x09\x10\xb1\x13\x01\x2b\xb1\x12\x0d\xe9\xb1\x22\x01\
-\x2b\x00\xb1\x1a\x1f\x11\x12\xb0\x09\x39\x30\x31\x13\x35\x33\x11\
-\x33\x11\x21\x15\x21\x11\x36\x37\x32\x1e\x03\x15\x11\x23\x11\x34\
-\x2e\x03\x23\x22\x06\x15\x11\x23\x11\x21\xe3\x9a\x01\x23\xfe\xdd\
-\x7b\xac\x4e\x70\x37\x1f\x04\xa0\x02\x16\x27\x50\x39\x6a\x67\xa0\
-\x04\x17\x78\x01\x00\xff\x00\x78\xfe\xfb\x91\x01\x35\x42\x6c\x42\
-\x31\xfd\xb2\x02\x3f\x23\x2b\x4a\x2d\x23\xb4\x87\xfe\x14\x04\x17\
-\x00\x00\x00\x00\x02\xff\xac\x00\x00\x02\x8e\x06\xa4\x00\x03\x00\
-\x07\x00\x24\x00\xb2\x04\x00\x00\x2b\xb2\x05\x02\x00\x2b\xb0\x00\
-\x2f\xb1\x01\x08\xe9\x01\xb0\x08\x2f\xb0\x04\xd6\xb1\x07\x0e\xe9\
-\xb1\x09\x01\x2b\x00\x30\x31\x03\x35\x21\x15\x01\x11\x33\x11\x54\
-\x02\xe2\xfe\x33\xb8\x06\x21\x83\x83\xf9\xdf\x05\x8d\xfa\x73\x00\
-\x02\xff\x81\x00\x00\x02\x63\x04\xee\x00\x03\x00\x07\x00\x24\x00\
-\xb2\x04\x00\x00\x2b\xb2\x05\x01\x00\x2b\xb0\x00\x2f\xb1\x01\x08\
-\xe9\x01\xb0\x08\x2f\xb0\x04\xd6\xb1\x07\x11\xe9\xb1\x09\x01\x2b\
-\x00\x30\x31\x03\x35\x21\x15\x01\x11\x33\x11\x7f\x02\xe2\xfe\x43\
-\x99\x04\x6b\x83\x83\xfb\x95\x03\x8f\xfc\x71\x00\x02\x00\xc1\x00\
-\x00\x01\x79\x06\xf0\x00\x03\x00\x07\x00\x2e\x00\xb2\x00\x00\x00\
-\x2b\xb2\x01\x02\x00\x2b\xb0\x04\x2f\xb1\x05\x04\xe9\x01\xb0\x08\
-\x2f\xb0\x00\xd6\xb0\x04\x32\xb1\x03\x0e\xe9\xb0\x06\x32\xb1\x03\
-\x0e\xe9\xb1\x09\x01\x2b\x00\x30\x31\x33\x11\x33\x11\x03\x35\x33\
-\x15\xc1\xb8\xb8\xb8\x05\x8d\xfa\x73\x06\x39\xb7\xb7\x00\x00\x00\
-\x01\x00\xa6\x00\x00\x01\x3f\x03\x8f\x00\x03\x00\x21\x00\xb2\x00\
-\x00\x00\x2b\xb2\x01\x01\x00\x2b\x01\xb0\x04\x2f\xb0\x00\xd6\xb1\
-\x03\x11\xe9\xb1\x03\x11\xe9\xb1\x05\x01\x2b\x00\x30\x31\x33\x11\
-\x33\x11\xa6\x99\x03\x8f\xfc\x71\x00\x00\x00\x00\x02\x00\x54\xff\
-\xd3\x03\xfe\x07\x33\x00\x11\x00\x18\x00\x3b\x00\xb2\x10\x00\x00\
-\x2b\xb1\x05\x03\xe9\xb2\x09\x02\x00\x2b\x01\xb0\x19\x2f\xb0\x08\
-\xd6\xb1\x0b\x15\xe9\xb1\x1a\x01\x2b\xb1\x0b\x08\x11\x12\xb2\x13\
-\x14\x17\x39\x39\x39\x00\xb1\x05\x10\x11\x12\xb0\x00\x39\xb0\x09\
-\x11\xb0\x01\x39\x30\x31\x3f\x01\x1e\x02\x33\x32\x36\x35\x11\x33\
-\x11\x14\x0e\x02\x23\x22\x1b\x01\x33\x13\x23\x27\x07\x54\x1b\x25\
-\x22\x7d\x44\x66\x8b\xb3\x40\x6e\x77\x44\xb4\x84\xfd\x9c\xe3\x7c\
-\xc1\xc1\x29\x9a\x21\x1d\x33\x6c\x84\x04\x4b\xfb\xb0\x68\x96\x4b\
-\x21\x05\xfe\x01\x62\xfe\x9e\xfa\xfa\x00\x00\x00\x02\xff\x83\xfe\
-\x5c\x02\x6c\x05\x33\x00\x0f\x00\x16\x00\x39\x00\xb2\x09\x01\x00\
-\x2b\xb0\x0e\x2f\xb1\x03\x08\xe9\x01\xb0\x17\x2f\xb0\x08\xd6\xb1\
-\x0b\x11\xe9\xb1\x18\x01\x2b\xb1\x0b\x08\x11\x12\xb2\x11\x12\x15\
-\x39\x39\x39\x00\xb1\x03\x0e\x11\x12\xb0\x00\x39\xb0\x09\x11\xb0\
-\x01\x39\x30\x31\x03\x37\x16\x17\x32\x36\x37\x36\x35\x11\x33\x11\
-\x14\x06\x23\x22\x03\x01\x33\x01\x23\x27\x07\x7d\x29\x4c\x4e\x3b\
-\x52\x0a\x04\x9a\xa0\x62\x7d\x0c\x01\x00\x7c\x01\x00\x7c\xc3\xc1\
-\xfe\xa2\x7d\x3f\x01\x3e\x2b\x10\x23\x04\x14\xfc\x0b\xaa\x94\x05\
-\xb6\x01\x21\xfe\xdf\xcb\xcb\x00\x02\x00\x12\x00\x00\x03\xfe\x06\
-\xcd\x00\x08\x00\x0f\x00\x34\x00\xb2\x09\x00\x00\x2b\xb1\x0c\x08\
-\xe9\xb2\x0a\x02\x00\x2b\x01\xb0\x10\x2f\xb0\x09\xd6\xb1\x0c\x0e\
-\xe9\xb2\x0c\x09\x0a\x2b\xb3\x40\x0c\x0f\x09\x2b\xb1\x11\x01\x2b\
-\xb1\x0c\x09\x11\x12\xb0\x07\x39\x00\x30\x31\x13\x24\x37\x36\x3b\
-\x01\x05\x0f\x01\x13\x11\x33\x11\x21\x37\x15\x12\x01\x31\x0d\x0a\
-\x13\xca\xfe\xbd\x2d\x1f\x19\xb8\x01\x8f\xf6\x06\x14\xb0\x05\x04\
-\xa2\x14\x03\xf9\xec\x05\x8d\xfa\xf8\x02\x87\x00\x02\x00\x46\x00\
-\x00\x02\x6a\x06\xcd\x00\x08\x00\x0c\x00\x27\x00\xb2\x09\x00\x00\
-\x2b\xb2\x0a\x02\x00\x2b\x01\xb0\x0d\x2f\xb0\x09\xd6\xb1\x0c\x11\
-\xe9\xb1\x0e\x01\x2b\xb1\x0c\x09\x11\x12\xb1\x08\x07\x39\x39\x00\
-\x30\x31\x13\x24\x37\x36\x3b\x01\x05\x0f\x01\x03\x11\x33\x11\x46\
-\x01\x31\x0c\x0a\x13\xca\xfe\xbd\x2d\x1f\x35\x99\x06\x14\xb0\x05\
-\x04\xa2\x14\x03\xf9\xec\x05\xc7\xfa\x39\x00\x00\x02\x00\xc1\x00\
-\x00\x03\xfe\x06\x39\x00\x06\x00\x11\x00\x4f\x00\xb2\x00\x00\x00\
-\x2b\xb1\x03\x08\xe9\xb2\x01\x02\x00\x2b\xb0\x08\x33\x01\xb0\x12\
-\x2f\xb0\x00\xd6\xb1\x03\x0e\xe9\xb2\x03\x00\x0a\x2b\xb3\x40\x03\
-\x06\x09\x2b\xb0\x03\x10\xb1\x09\x01\x2b\xb0\x07\x32\xb1\x0c\x14\
-\xe9\xb1\x13\x01\x2b\xb1\x0c\x09\x11\x12\xb0\x08\x39\x00\xb1\x01\
-\x03\x11\x12\xb1\x07\x10\x39\x39\x30\x31\x33\x11\x33\x11\x21\x37\
-\x15\x01\x37\x23\x35\x33\x15\x0e\x03\x07\xc1\xb8\x01\x8f\xf6\xfe\
-\xae\x35\x35\xac\x02\x0a\x0d\x28\x15\x05\x8d\xfa\xf8\x02\x87\x04\
-\xe3\xaa\xac\x8d\x14\x21\x1b\x4e\x2b\x00\x00\x00\x02\x00\xa6\x00\
-\x00\x02\x5e\x06\x1d\x00\x03\x00\x0e\x00\x40\x00\xb2\x00\x00\x00\
-\x2b\xb2\x01\x02\x00\x2b\x01\xb0\x0f\x2f\xb0\x00\xd6\xb1\x03\x11\
-\xe9\xb0\x03\x10\xb1\x06\x01\x2b\xb0\x04\x32\xb1\x09\x14\xe9\xb1\
-\x10\x01\x2b\xb1\x09\x06\x11\x12\xb0\x05\x39\x00\xb1\x01\x00\x11\
-\x12\xb3\x04\x05\x06\x0d\x24\x17\x39\x30\x31\x33\x11\x33\x11\x13\
-\x37\x23\x35\x33\x15\x0e\x03\x07\xa6\x99\x73\x33\x33\xac\x02\x0a\
-\x0c\x29\x15\x05\xc7\xfa\x39\x04\xc7\xaa\xac\x8e\x14\x21\x1b\x4d\
-\x2b\x00\x00\x00\x01\x00\x9e\x00\x00\x04\xa8\x05\x8d\x00\x0e\x00\
-\x3c\x00\xb2\x0c\x00\x00\x2b\xb1\x08\x08\xe9\xb2\x02\x02\x00\x2b\
-\x01\xb0\x0f\x2f\xb0\x0c\xd6\xb0\x01\x32\xb1\x08\x0e\xe9\xb0\x03\
-\x32\xb2\x08\x0c\x0a\x2b\xb3\x40\x08\x0b\x09\x2b\xb1\x10\x01\x2b\
-\x00\xb1\x02\x08\x11\x12\xb1\x0d\x0e\x39\x39\x30\x31\x13\x37\x11\
-\x33\x11\x25\x17\x01\x11\x21\x37\x15\x21\x11\x07\x9e\xcc\xb9\x01\
-\x02\x52\xfe\xac\x01\x8f\xf6\xfc\xc2\x7a\x02\x39\xae\x02\xa6\xfd\
-\xf8\xdb\x60\xfe\xdf\xfd\xa6\x02\x87\x02\x42\x69\x00\x00\x00\x00\
-\x01\x00\x37\x00\x00\x02\x75\x05\xc7\x00\x0b\x00\x23\x00\xb2\x09\
-\x00\x00\x2b\xb2\x02\x02\x00\x2b\x01\xb0\x0c\x2f\xb0\x09\xd6\xb0\
-\x01\x32\xb1\x08\x11\xe9\xb0\x03\x32\xb1\x0d\x01\x2b\x00\x30\x31\
-\x13\x37\x11\x33\x11\x37\x17\x07\x11\x23\x11\x07\x37\xc3\x9c\x91\
-\x4e\xdf\x9c\x75\x02\x4a\xa6\x02\xd7\xfd\xac\x7d\x5d\xbc\xfd\x29\
-\x02\x52\x64\x00\x02\x00\xc3\x00\x00\x04\xe3\x06\xcd\x00\x0b\x00\
-\x15\x00\x45\x00\xb2\x00\x00\x00\x2b\xb0\x07\x33\xb2\x01\x02\x00\
-\x2b\xb0\x05\x33\x01\xb0\x16\x2f\xb0\x00\xd6\xb1\x0b\x0d\xe9\xb0\
-\x0b\x10\xb1\x04\x01\x2b\xb1\x07\x0d\xe9\xb1\x17\x01\x2b\xb1\x04\
-\x0b\x11\x12\xb3\x02\x08\x0c\x12\x24\x17\x39\x00\xb1\x01\x00\x11\
-\x12\xb1\x04\x0a\x39\x39\x30\x31\x33\x11\x21\x01\x17\x11\x33\x11\
-\x21\x01\x27\x11\x13\x36\x37\x3e\x01\x3b\x01\x05\x0f\x01\xc3\x01\
-\x00\x02\x31\x50\x9f\xff\x00\xfd\xcf\x50\x6f\x44\x5c\x77\x2f\x16\
-\xc9\xfe\xbc\x2d\x1f\x05\x8d\xfb\xa6\xa4\x04\xfe\xfa\x73\x04\x5a\
-\xa4\xfb\x02\x06\x14\x27\x36\x46\x16\xa2\x14\x03\x00\x00\x00\x00\
-\x02\x00\xa4\x00\x00\x03\x7d\x05\x1f\x00\x18\x00\x1c\x00\x50\x00\
-\xb2\x00\x00\x00\x2b\xb0\x0c\x33\xb2\x05\x01\x00\x2b\xb0\x01\x33\
-\xb1\x14\x03\xe9\x01\xb0\x1d\x2f\xb0\x00\xd6\xb1\x18\x0d\xe9\xb0\
-\x02\x32\xb0\x18\x10\xb1\x0d\x01\x2b\xb1\x0c\x0d\xe9\xb1\x1e\x01\
-\x2b\xb1\x0d\x18\x11\x12\xb3\x05\x19\x1a\x1c\x24\x17\x39\xb0\x0c\
-\x11\xb0\x1b\x39\x00\xb1\x14\x00\x11\x12\xb0\x03\x39\x30\x31\x33\
-\x11\x33\x15\x36\x33\x32\x1e\x03\x15\x11\x23\x11\x34\x2e\x03\x23\
-\x22\x06\x15\x11\x13\x01\x33\x01\xa4\x95\x77\xb4\x4c\x6d\x39\x1f\
-\x08\xa0\x02\x16\x27\x50\x3a\x6d\x63\x1c\x01\x11\x9f\xfe\xcf\x03\
-\x9a\x90\x9a\x2d\x42\x64\x4e\x35\xfd\xb2\x02\x3f\x23\x29\x4c\x2d\
-\x23\xb8\x83\xfe\x14\x04\x14\x01\x0b\xfe\xf5\x00\x02\x00\xc3\x00\
-\x00\x04\xe3\x07\x1d\x00\x0b\x00\x12\x00\x45\x00\xb2\x00\x00\x00\
-\x2b\xb0\x07\x33\xb2\x01\x02\x00\x2b\xb0\x05\x33\x01\xb0\x13\x2f\
-\xb0\x00\xd6\xb1\x0b\x0d\xe9\xb0\x0b\x10\xb1\x04\x01\x2b\xb1\x07\
-\x0d\xe9\xb1\x14\x01\x2b\xb1\x04\x0b\x11\x12\xb3\x02\x08\x0c\x10\
-\x24\x17\x39\x00\xb1\x01\x00\x11\x12\xb1\x04\x0a\x39\x39\x30\x31\
-\x33\x11\x21\x01\x17\x11\x33\x11\x21\x01\x27\x11\x13\x33\x17\x37\
-\x33\x03\x23\xc3\x01\x00\x02\x31\x50\x9f\xff\x00\xfd\xcf\x50\x2d\
-\x7d\xc7\xc7\x7d\xfa\x94\x05\x8d\xfb\xa6\xa4\x04\xfe\xfa\x73\x04\
-\x5a\xa4\xfb\x02\x07\x1d\xe4\xe4\xfe\xb4\x00\x00\x02\x00\x85\x00\
-\x00\x03\x7b\x05\x1d\x00\x0e\x00\x27\x00\x55\x00\xb2\x0f\x00\x00\
-\x2b\xb0\x1b\x33\xb2\x14\x01\x00\x2b\xb0\x10\x33\xb1\x23\x03\xe9\
-\x01\xb0\x28\x2f\xb0\x0f\xd6\xb1\x27\x0d\xe9\xb0\x11\x32\xb0\x27\
-\x10\xb1\x1c\x01\x2b\xb1\x1b\x0d\xe9\xb1\x29\x01\x2b\xb1\x27\x0f\
-\x11\x12\xb0\x01\x39\xb0\x1c\x11\xb2\x03\x14\x02\x39\x39\x39\xb0\
-\x1b\x12\xb0\x05\x39\x00\xb1\x23\x0f\x11\x12\xb0\x12\x39\x30\x31\
-\x13\x33\x17\x37\x33\x17\x06\x07\x06\x2b\x01\x22\x26\x27\x26\x03\
-\x11\x33\x15\x36\x33\x32\x1e\x03\x15\x11\x23\x11\x34\x2e\x03\x23\
-\x22\x06\x15\x11\x85\x7f\xcd\xcb\x47\x38\xfc\x0f\x0a\x10\x4a\x17\
-\x33\x6c\x44\x10\x95\x7d\xae\x4c\x6d\x39\x1f\x08\xa0\x02\x16\x27\
-\x50\x3a\x6d\x63\x05\x1d\x8c\x8c\x02\xb4\x07\x04\x1f\x50\x31\xfb\
-\x04\x03\x9a\x90\x9a\x2d\x42\x64\x4e\x35\xfd\xb2\x02\x3f\x23\x29\
-\x4c\x2d\x23\xb8\x83\xfe\x14\x00\x04\x00\x71\xff\xd3\x05\x6f\x06\
-\xcf\x00\x0b\x00\x16\x00\x1f\x00\x30\x00\x50\x00\xb2\x09\x00\x00\
-\x2b\xb1\x0f\x08\xe9\xb2\x03\x02\x00\x2b\xb1\x15\x08\xe9\x01\xb0\
-\x31\x2f\xb0\x00\xd6\xb1\x0d\x0e\xe9\xb0\x0d\x10\xb1\x12\x01\x2b\
-\xb1\x06\x0e\xe9\xb1\x32\x01\x2b\xb1\x12\x0d\x11\x12\xb6\x03\x09\
-\x17\x1c\x20\x29\x2f\x24\x17\x39\xb0\x06\x11\xb0\x2d\x39\x00\xb1\
-\x15\x0f\x11\x12\xb1\x06\x00\x39\x39\x30\x31\x13\x10\x00\x21\x20\
-\x00\x11\x10\x00\x21\x20\x00\x12\x10\x12\x33\x32\x00\x11\x10\x00\
-\x23\x22\x27\x24\x37\x36\x3b\x01\x05\x0f\x01\x33\x3e\x08\x32\x3b\
-\x01\x17\x05\x0f\x01\x71\x01\x7b\x01\x06\x01\x02\x01\x7b\xfe\x81\
-\xff\x00\xfe\xfe\xfe\x83\xb8\xfe\xc9\xc3\x01\x05\xfe\xf2\xba\xb8\
-\x9e\x01\x31\x0c\x0a\x13\xca\xfe\xbd\x2f\x1d\xbf\x2b\x56\x35\x33\
-\x1f\x1c\x11\x0e\x0a\x09\x06\x8b\x3d\xfe\xbd\x2d\x1f\x02\xc3\x01\
-\x3d\x01\xba\xfe\x46\xfe\xc3\xfe\xbe\xfe\x52\x01\xb1\x02\x68\xfd\
-\xe7\xfe\x85\x01\x77\x01\x10\x01\x0c\x01\x4c\xdd\xb0\x05\x04\xa2\
-\x14\x03\x19\x31\x21\x1f\x10\x10\x09\x06\x02\x02\xa2\x14\x03\x00\
-\x04\x00\x3d\xff\xe9\x03\xe1\x05\x1f\x00\x0a\x00\x15\x00\x19\x00\
-\x1d\x00\x55\x00\xb2\x09\x00\x00\x2b\xb1\x0e\x08\xe9\xb2\x03\x01\
-\x00\x2b\xb1\x13\x03\xe9\x01\xb0\x1e\x2f\xb0\x00\xd6\xb1\x0b\x0d\
-\xe9\xb0\x0b\x10\xb1\x10\x01\x2b\xb1\x06\x0d\xe9\xb1\x1f\x01\x2b\
-\xb1\x0b\x00\x11\x12\xb0\x16\x39\xb0\x10\x11\xb5\x08\x09\x03\x18\
-\x1a\x1d\x24\x17\x39\xb0\x06\x12\xb0\x1b\x39\x00\xb1\x13\x0e\x11\
-\x12\xb1\x06\x00\x39\x39\x30\x31\x13\x34\x00\x33\x32\x00\x15\x14\
-\x00\x20\x00\x37\x14\x16\x32\x36\x35\x34\x26\x23\x22\x06\x11\x01\
-\x33\x01\x33\x01\x33\x01\x3d\x01\x09\xb8\xc1\x01\x02\xfe\xf1\xfe\
-\x98\xfe\xf3\xa0\xae\xe6\xae\xae\x73\x71\xb0\x01\x11\x9f\xfe\xcf\
-\xd5\x01\x11\x9f\xfe\xcf\x01\xc5\xcf\x01\x1c\xfe\xd7\xc4\xcb\xfe\
-\xf1\x01\x11\xdf\xb4\xb8\xba\xb2\xac\xac\xac\x01\x8f\x01\x0b\xfe\
-\xf5\x01\x0b\xfe\xf5\x00\x00\x00\x02\x00\x37\xff\xd3\x07\x6f\x05\
-\xba\x00\x1e\x00\x2b\x00\x85\x00\xb2\x18\x00\x00\x2b\xb1\x13\x0b\
-\xe9\xb2\x1b\x00\x00\x2b\xb1\x22\x03\xe9\xb2\x06\x02\x00\x2b\xb1\
-\x0b\x08\xe9\xb2\x03\x02\x00\x2b\xb1\x2a\x03\xe9\xb4\x0d\x10\x1b\
-\x03\x0d\x2b\xb1\x0d\x03\xe9\x01\xb0\x2c\x2f\xb0\x00\xd6\xb1\x20\
-\x15\xe9\xb0\x20\x10\xb1\x25\x01\x2b\xb1\x11\x15\xe9\xb0\x0c\x32\
-\xb2\x11\x25\x0a\x2b\xb3\x40\x11\x0f\x09\x2b\xb1\x2d\x01\x2b\xb1\
-\x25\x20\x11\x12\xb1\x03\x1b\x39\x39\xb0\x11\x11\xb0\x18\x39\x00\
-\xb1\x10\x13\x11\x12\xb0\x20\x39\xb0\x0d\x11\xb0\x00\x39\xb0\x0b\
-\x12\xb0\x1f\x39\xb0\x06\x11\xb0\x2b\x39\x30\x31\x13\x10\x00\x21\
-\x32\x16\x33\x21\x15\x23\x27\x21\x27\x11\x21\x15\x21\x11\x33\x37\
-\x21\x37\x33\x15\x21\x0e\x01\x23\x22\x24\x02\x12\x10\x00\x33\x32\
-\x36\x35\x11\x34\x26\x27\x23\x06\x37\x01\x96\x01\x12\x39\xd1\x4e\
-\x03\x1b\x75\x31\xfe\x17\x4c\x02\xa2\xfd\x5e\xb0\x31\x01\x8b\x2d\
-\x5f\xfc\x9b\x2d\xc4\x3e\xae\xfe\xcd\xc3\xb2\x01\x25\xd9\x8b\x53\
-\x50\x7f\x27\xc1\x02\xc3\x01\x42\x01\xb5\x2d\x87\x02\x02\xfe\x19\
-\x7f\xfd\xeb\x02\x02\x93\x02\x2b\xbe\x01\x5f\x01\xf5\xfd\xf0\xfe\
-\x7b\x95\xf0\x01\xf0\xe5\x8f\x04\x08\x00\x00\x00\x03\x00\x3d\xff\
-\xe9\x05\xfe\x03\xb0\x00\x26\x00\x32\x00\x38\x00\x84\x00\xb2\x24\
-\x00\x00\x2b\xb0\x1f\x33\xb1\x2a\x03\xe9\xb0\x1a\x32\xb2\x03\x01\
-\x00\x2b\xb0\x08\x33\xb1\x30\x03\xe9\xb0\x36\x32\xb4\x33\x0e\x24\
-\x03\x0d\x2b\xb1\x33\x05\xe9\x01\xb0\x39\x2f\xb0\x00\xd6\xb1\x27\
-\x10\xe9\xb0\x27\x10\xb1\x2d\x01\x2b\xb1\x0e\x0d\xe9\xb2\x0e\x2d\
-\x0a\x2b\xb3\x40\x0e\x0d\x09\x2b\xb1\x3a\x01\x2b\xb1\x2d\x27\x11\
-\x12\xb1\x24\x03\x39\x39\xb0\x0e\x11\xb1\x05\x21\x39\x39\x00\xb1\
-\x2a\x24\x11\x12\xb0\x1d\x39\xb0\x0e\x11\xb1\x1c\x21\x39\x39\xb0\
-\x33\x12\xb2\x00\x27\x2d\x39\x39\x39\xb0\x30\x11\xb0\x05\x39\x30\
-\x31\x13\x34\x12\x33\x32\x17\x3e\x01\x33\x32\x1e\x02\x15\x21\x14\
-\x1e\x07\x17\x16\x33\x32\x37\x17\x06\x07\x22\x27\x0e\x01\x23\x22\
-\x00\x37\x14\x16\x33\x32\x36\x35\x34\x26\x23\x22\x06\x05\x21\x26\
-\x23\x22\x06\x3d\xfc\xb5\xdb\x89\x37\xb9\x66\x3b\x6b\x6e\x42\xfd\
-\xa6\x02\x04\x06\x0a\x11\x18\x1d\x2b\x19\x3d\x4a\x96\x86\x0d\x8b\
-\xa0\xe5\x90\x3b\xc1\x6a\xae\xfe\xfd\x96\x9e\x7d\x6f\xa7\xa0\x76\
-\x79\xa2\x02\xdb\x01\xd7\x29\xb0\x52\x91\x01\xcd\xc5\x01\x1e\xcb\
-\x5a\x71\x29\x62\xcf\x93\x02\x1f\x15\x29\x22\x2b\x29\x29\x25\x11\
-\x27\x71\x87\x68\x01\xcf\x60\x6f\x01\x17\xd9\xa4\xcd\xb9\xb8\xa2\
-\xb6\xb8\x46\xfe\x87\x00\x00\x00\x03\x00\xc3\x00\x00\x04\xf0\x06\
-\xcd\x00\x0f\x00\x1a\x00\x23\x00\x5e\x00\xb2\x00\x00\x00\x2b\xb0\
-\x0b\x33\xb2\x01\x02\x00\x2b\xb1\x1a\x05\xe9\xb4\x0e\x10\x00\x01\
-\x0d\x2b\xb1\x0e\x03\xe9\x01\xb0\x24\x2f\xb0\x00\xd6\xb1\x0f\x15\
-\xe9\xb0\x10\x32\xb0\x0f\x10\xb1\x14\x01\x2b\xb1\x07\x13\xe9\xb1\
-\x25\x01\x2b\xb1\x14\x0f\x11\x12\xb3\x0d\x0a\x1b\x20\x24\x17\x39\
-\xb0\x07\x11\xb0\x0c\x39\x00\xb1\x10\x0e\x11\x12\xb0\x0a\x39\xb0\
-\x1a\x11\xb0\x07\x39\x30\x31\x33\x11\x21\x32\x1e\x02\x15\x14\x06\
-\x07\x01\x23\x01\x21\x19\x01\x21\x32\x36\x35\x34\x2e\x02\x23\x21\
-\x37\x24\x37\x36\x3b\x01\x05\x0f\x01\xc3\x01\xce\x93\xe0\x79\x39\
-\xb4\xaa\x01\x98\xb9\xfe\x81\xfe\xbd\x01\x0e\xd7\xb6\x24\x52\xa2\
-\x6f\xfe\xec\x02\x01\x31\x0c\x0a\x13\xc9\xfe\xbc\x2d\x1f\x05\x8d\
-\x4b\x79\x7d\x3c\x77\xcc\x31\xfd\x64\x02\x87\xfd\x79\x03\x06\xa2\
-\x66\x2d\x56\x54\x36\xf9\xb0\x05\x04\xa2\x14\x03\x00\x00\x00\x00\
-\x02\x00\xa6\x00\x00\x02\x9c\x05\x1f\x00\x0e\x00\x12\x00\x39\x00\
-\xb2\x00\x00\x00\x2b\xb2\x07\x01\x00\x2b\xb0\x01\x33\xb1\x08\x09\
-\xe9\x01\xb0\x13\x2f\xb0\x00\xd6\xb1\x0e\x11\xe9\xb0\x02\x32\xb1\
-\x14\x01\x2b\xb1\x0e\x00\x11\x12\xb1\x0f\x12\x39\x39\x00\xb1\x08\
-\x00\x11\x12\xb0\x03\x39\x30\x31\x33\x11\x33\x15\x3e\x02\x37\x15\
-\x0e\x03\x15\x11\x03\x01\x33\x01\xa6\x8f\x19\x45\xa6\x63\x35\x6b\
-\x75\x48\x8b\x01\x11\x9f\xfe\xcf\x03\x9a\xb9\x27\x48\x52\x02\x89\
-\x02\x23\x4c\x9c\x68\xfe\x5a\x04\x14\x01\x0b\xfe\xf5\x00\x00\x00\
-\x03\x00\xc3\x00\x00\x04\xf0\x07\x1d\x00\x0f\x00\x16\x00\x21\x00\
-\x65\x00\xb2\x00\x00\x00\x2b\xb0\x0b\x33\xb2\x01\x02\x00\x2b\xb1\
-\x21\x05\xe9\xb4\x0e\x17\x00\x01\x0d\x2b\xb1\x0e\x03\xe9\x01\xb0\
-\x22\x2f\xb0\x00\xd6\xb1\x0f\x15\xe9\xb0\x17\x32\xb0\x0f\x10\xb1\
-\x1b\x01\x2b\xb1\x07\x13\xe9\xb1\x23\x01\x2b\xb1\x0f\x00\x11\x12\
-\xb0\x10\x39\xb0\x1b\x11\xb4\x0d\x0a\x11\x14\x16\x24\x17\x39\xb0\
-\x07\x12\xb0\x0c\x39\x00\xb1\x17\x0e\x11\x12\xb0\x0a\x39\xb0\x21\
-\x11\xb0\x07\x39\x30\x31\x33\x11\x21\x32\x1e\x02\x15\x14\x06\x07\
-\x01\x23\x01\x21\x11\x03\x33\x17\x37\x33\x03\x23\x03\x21\x32\x36\
-\x35\x34\x2e\x02\x23\x21\xc3\x01\xce\x93\xe0\x79\x39\xb4\xaa\x01\
-\x98\xb9\xfe\x81\xfe\xbd\x46\x7b\xc9\xc5\x81\xfc\x94\xb4\x01\x0e\
-\xd7\xb6\x24\x52\xa2\x6f\xfe\xec\x05\x8d\x4b\x79\x7d\x3c\x77\xcc\
-\x31\xfd\x64\x02\x87\xfd\x79\x07\x1d\xe4\xe4\xfe\xb4\xfd\x35\xa2\
-\x66\x2d\x56\x54\x36\x00\x00\x00\x02\x00\x7b\x00\x00\x03\x11\x05\
-\x1d\x00\x0e\x00\x1d\x00\x37\x00\xb2\x0f\x00\x00\x2b\xb2\x16\x01\
-\x00\x2b\xb0\x10\x33\xb1\x17\x09\xe9\x01\xb0\x1e\x2f\xb0\x0f\xd6\
-\xb1\x1d\x11\xe9\xb0\x11\x32\xb1\x1f\x01\x2b\xb1\x1d\x0f\x11\x12\
-\xb0\x01\x39\x00\xb1\x17\x0f\x11\x12\xb0\x12\x39\x30\x31\x13\x33\
-\x17\x37\x33\x17\x06\x07\x06\x2b\x01\x22\x26\x27\x26\x03\x11\x33\
-\x15\x3e\x02\x37\x15\x0e\x03\x15\x11\x7b\x7f\xcd\xcb\x47\x38\xfc\
-\x0f\x0a\x10\x4a\x17\x33\x6c\x44\x02\x8f\x19\x45\xa6\x63\x35\x6b\
-\x75\x48\x05\x1d\x8c\x8c\x02\xb4\x07\x04\x1f\x50\x31\xfb\x04\x03\
-\x9a\xb9\x27\x48\x52\x02\x89\x02\x23\x4c\x9c\x68\xfe\x5a\x00\x00\
-\x02\x00\x5a\xff\xd3\x03\xfe\x06\xcd\x00\x27\x00\x30\x00\xb0\x00\
-\xb2\x26\x00\x00\x2b\xb1\x03\x0a\xe9\xb2\x11\x02\x00\x2b\xb1\x17\
-\x09\xe9\x01\xb0\x31\x2f\xb0\x0e\xd6\xb1\x1a\x0d\xe9\xb0\x1a\x10\
-\xb1\x06\x01\x2b\xb1\x23\x13\xe9\xb1\x32\x01\x2b\xb0\x36\x1a\xba\
-\xee\xec\xc2\x52\x00\x15\x2b\x0a\x0e\xb0\x0b\x10\xb0\x09\xc0\xb1\
-\x1d\x04\xf9\xb0\x1f\xc0\xb3\x1e\x1d\x1f\x13\x2b\xb2\x1e\x1d\x1f\
-\x20\x8a\x20\x8a\x23\x06\x0e\x11\x12\x39\x00\xb4\x09\x0b\x1d\x1e\
-\x1f\x2e\x2e\x2e\x2e\x2e\x01\xb4\x09\x0b\x1d\x1e\x1f\x2e\x2e\x2e\
-\x2e\x2e\xb0\x40\x1a\x01\xb1\x1a\x0e\x11\x12\xb0\x01\x39\xb0\x06\
-\x11\xb5\x03\x11\x17\x26\x28\x2d\x24\x17\x39\xb0\x23\x12\xb1\x13\
-\x14\x39\x39\x00\xb1\x03\x26\x11\x12\xb0\x00\x39\xb0\x17\x11\xb3\
-\x01\x0e\x14\x23\x24\x17\x39\xb0\x11\x12\xb0\x13\x39\x30\x31\x3f\
-\x01\x16\x33\x32\x36\x35\x34\x26\x27\x26\x27\x2e\x01\x35\x34\x24\
-\x33\x32\x17\x07\x2e\x01\x23\x22\x06\x15\x14\x16\x17\x1e\x01\x17\
-\x1e\x01\x15\x14\x00\x23\x22\x03\x24\x37\x36\x3b\x01\x05\x0f\x01\
-\x5a\x1f\xd7\xdf\x85\xa6\x60\x50\x04\xfa\x7d\xbe\x01\x00\xce\xc1\
-\xb6\x1c\x56\x94\x73\x85\xa4\x5d\x47\x1d\xf0\x27\x71\xa1\xfe\xfc\
-\xcb\xf6\x1e\x01\x31\x0c\x0a\x13\xc8\xfe\xbd\x2d\x1f\x60\xaa\xaa\
-\xa4\x6b\x50\x85\x20\x02\x42\x21\xca\x94\x9e\xf5\x62\xaa\x42\x41\
-\x91\x61\x48\x76\x1d\x0c\x39\x11\x2f\xcf\x8d\xae\xfe\xfe\x06\x41\
-\xb0\x05\x04\xa2\x14\x03\x00\x00\x02\x00\x37\xff\xe9\x02\xe1\x05\
-\x1f\x00\x2f\x00\x33\x00\xd2\x00\xb2\x2e\x00\x00\x2b\xb1\x05\x03\
-\xe9\xb2\x14\x01\x00\x2b\xb1\x22\x07\xe9\x01\xb0\x34\x2f\xb0\x12\
-\xd6\xb1\x24\x10\xe9\xb0\x24\x10\xb1\x08\x01\x2b\xb1\x2c\x0f\xe9\
-\xb1\x35\x01\x2b\xb0\x36\x1a\xba\xf4\xac\xc1\x03\x00\x15\x2b\x0a\
-\x0e\xb0\x11\x10\xb0\x0e\xc0\xb1\x26\x0d\xf9\xb0\x28\xc0\xb0\x11\
-\x10\xb3\x0f\x11\x0e\x13\x2b\xb3\x10\x11\x0e\x13\x2b\xb0\x26\x10\
-\xb3\x27\x26\x28\x13\x2b\xb2\x27\x26\x28\x20\x8a\x20\x8a\x23\x06\
-\x0e\x11\x12\x39\xb2\x10\x11\x0e\x11\x12\x39\xb0\x0f\x39\x00\xb5\
-\x10\x26\x0e\x0f\x27\x28\x2e\x2e\x2e\x2e\x2e\x2e\x01\xb5\x10\x26\
-\x0e\x0f\x27\x28\x2e\x2e\x2e\x2e\x2e\x2e\xb0\x40\x1a\x01\xb1\x24\
-\x12\x11\x12\xb0\x01\x39\xb0\x08\x11\xb5\x05\x14\x1b\x30\x31\x33\
-\x24\x17\x39\xb0\x2c\x12\xb2\x16\x19\x32\x39\x39\x39\x00\xb1\x05\
-\x2e\x11\x12\xb0\x00\x39\xb0\x22\x11\xb3\x01\x12\x17\x2c\x24\x17\
-\x39\xb0\x14\x12\xb0\x16\x39\x30\x31\x3f\x01\x1e\x02\x33\x32\x36\
-\x35\x34\x2e\x05\x23\x24\x35\x10\x21\x32\x17\x07\x2e\x09\x23\x22\
-\x15\x14\x17\x1e\x01\x17\x1e\x01\x15\x10\x21\x26\x11\x01\x33\x01\
-\x37\x19\x33\x3e\x89\x49\x6a\x53\x13\x22\x23\x2f\x1f\x29\x02\xfe\
-\xc3\x01\x4f\x96\x97\x16\x06\x25\x0c\x23\x11\x22\x19\x25\x21\x29\
-\x16\xa8\x66\x0e\xb9\x2b\x44\x70\xfe\xae\xae\x01\x11\x9f\xfe\xcf\
-\x46\x8b\x1f\x21\x27\x52\x38\x1b\x2a\x1f\x17\x0e\x08\x08\x39\xde\
-\x01\x0c\x3f\x88\x02\x13\x06\x0e\x07\x0a\x06\x06\x04\x02\x7b\x58\
-\x23\x04\x24\x13\x1d\x7f\x66\xfe\xe7\x01\x04\x2a\x01\x0b\xfe\xf5\
-\x00\x00\x00\x00\x02\x00\x5a\xff\xd3\x03\xfe\x07\x33\x00\x27\x00\
-\x2e\x00\xb6\x00\xb2\x26\x00\x00\x2b\xb1\x03\x0a\xe9\xb2\x11\x02\
-\x00\x2b\xb1\x17\x09\xe9\x01\xb0\x2f\x2f\xb0\x0e\xd6\xb1\x1a\x0d\
-\xe9\xb0\x1a\x10\xb1\x06\x01\x2b\xb1\x23\x13\xe9\xb1\x30\x01\x2b\
-\xb0\x36\x1a\xba\xee\xec\xc2\x52\x00\x15\x2b\x0a\x0e\xb0\x0b\x10\
-\xb0\x09\xc0\xb1\x1d\x04\xf9\xb0\x1f\xc0\xb3\x1e\x1d\x1f\x13\x2b\
-\xb2\x1e\x1d\x1f\x20\x8a\x20\x8a\x23\x06\x0e\x11\x12\x39\x00\xb4\
-\x09\x0b\x1d\x1e\x1f\x2e\x2e\x2e\x2e\x2e\x01\xb4\x09\x0b\x1d\x1e\
-\x1f\x2e\x2e\x2e\x2e\x2e\xb0\x40\x1a\x01\xb1\x1a\x0e\x11\x12\xb1\
-\x01\x28\x39\x39\xb0\x06\x11\xb7\x03\x11\x17\x26\x29\x2a\x2c\x2e\
-\x24\x17\x39\xb0\x23\x12\xb2\x13\x14\x2b\x39\x39\x39\x00\xb1\x03\
-\x26\x11\x12\xb0\x00\x39\xb0\x17\x11\xb3\x01\x0e\x14\x23\x24\x17\
-\x39\xb0\x11\x12\xb0\x13\x39\x30\x31\x3f\x01\x16\x33\x32\x36\x35\
-\x34\x26\x27\x26\x27\x2e\x01\x35\x34\x24\x33\x32\x17\x07\x2e\x01\
-\x23\x22\x06\x15\x14\x16\x17\x1e\x01\x17\x1e\x01\x15\x14\x00\x23\
-\x22\x03\x13\x33\x13\x23\x27\x07\x5a\x1f\xd7\xdf\x85\xa6\x60\x50\
-\x04\xfa\x7d\xbe\x01\x00\xce\xc1\xb6\x1c\x56\x94\x73\x85\xa4\x5d\
-\x47\x1d\xf0\x27\x71\xa1\xfe\xfc\xcb\xf6\x39\xfd\x9c\xe3\x7c\xc1\
-\xc1\x60\xaa\xaa\xa4\x6b\x50\x85\x20\x02\x42\x21\xca\x94\x9e\xf5\
-\x62\xaa\x42\x41\x91\x61\x48\x76\x1d\x0c\x39\x11\x2f\xcf\x8d\xae\
-\xfe\xfe\x05\xfe\x01\x62\xfe\x9e\xfa\xfa\x00\x00\x02\x00\x37\xff\
-\xe9\x02\xe1\x05\x33\x00\x38\x00\x3f\x00\x70\x00\xb2\x37\x00\x00\
-\x2b\xb1\x09\x03\xe9\xb2\x1a\x01\x00\x2b\xb1\x28\x07\xe9\x01\xb0\
-\x40\x2f\xb0\x15\xd6\xb1\x2b\x0f\xe9\xb0\x2b\x10\xb1\x0c\x01\x2b\
-\xb1\x32\x0f\xe9\xb1\x41\x01\x2b\xb1\x2b\x15\x11\x12\xb3\x03\x01\
-\x39\x3f\x24\x17\x39\xb0\x0c\x11\xb7\x09\x11\x1a\x22\x2e\x3a\x3b\
-\x3e\x24\x17\x39\xb0\x32\x12\xb3\x1c\x20\x3c\x3d\x24\x17\x39\x00\
-\xb1\x09\x37\x11\x12\xb0\x00\x39\xb0\x28\x11\xb3\x01\x15\x1d\x32\
-\x24\x17\x39\xb0\x1a\x12\xb0\x1c\x39\x30\x31\x3f\x01\x1e\x06\x33\
-\x32\x36\x35\x34\x26\x27\x2e\x01\x27\x2e\x01\x35\x34\x3e\x02\x33\
-\x32\x17\x07\x2e\x09\x23\x22\x06\x15\x14\x1e\x01\x17\x1e\x01\x15\
-\x14\x0e\x02\x23\x26\x03\x01\x33\x01\x23\x27\x07\x37\x19\x04\x2d\
-\x17\x33\x2b\x39\x40\x22\x66\x59\x4a\x29\x14\x8e\x22\x54\x81\x1c\
-\x44\x8d\x62\x93\x98\x16\x02\x2b\x06\x27\x0f\x24\x15\x27\x1e\x29\
-\x17\x5e\x4e\x6d\xc4\x29\x4a\x68\x1c\x44\x8d\x61\xb4\x8b\x01\x00\
-\x7c\x01\x00\x7c\xc3\xc1\x46\x8b\x02\x1b\x0c\x19\x0e\x10\x07\x57\
-\x35\x33\x44\x0c\x06\x1d\x0a\x1b\x81\x60\x2f\x54\x58\x33\x3f\x88\
-\x02\x13\x04\x10\x05\x0e\x02\x0a\x02\x02\x4c\x31\x44\x3b\x22\x13\
-\x21\x83\x5c\x2f\x5a\x5a\x38\x01\x04\x28\x01\x21\xfe\xdf\xcb\xcb\
-\x00\x00\x00\x00\x02\x00\x5a\xfe\x77\x03\xfe\x05\xba\x00\x27\x00\
-\x2b\x00\xb0\x00\xb2\x26\x00\x00\x2b\xb1\x03\x0a\xe9\xb2\x11\x02\
-\x00\x2b\xb1\x17\x09\xe9\x01\xb0\x2c\x2f\xb0\x0e\xd6\xb1\x1a\x0d\
-\xe9\xb0\x1a\x10\xb1\x06\x01\x2b\xb1\x23\x13\xe9\xb1\x2d\x01\x2b\
-\xb0\x36\x1a\xba\xee\xec\xc2\x52\x00\x15\x2b\x0a\x0e\xb0\x0b\x10\
-\xb0\x09\xc0\xb1\x1d\x04\xf9\xb0\x1f\xc0\xb3\x1e\x1d\x1f\x13\x2b\
-\xb2\x1e\x1d\x1f\x20\x8a\x20\x8a\x23\x06\x0e\x11\x12\x39\x00\xb4\
-\x09\x0b\x1d\x1e\x1f\x2e\x2e\x2e\x2e\x2e\x01\xb4\x09\x0b\x1d\x1e\
-\x1f\x2e\x2e\x2e\x2e\x2e\xb0\x40\x1a\x01\xb1\x1a\x0e\x11\x12\xb0\
-\x01\x39\xb0\x06\x11\xb5\x03\x11\x17\x26\x28\x2a\x24\x17\x39\xb0\
-\x23\x12\xb1\x13\x14\x39\x39\x00\xb1\x03\x26\x11\x12\xb0\x00\x39\
-\xb0\x17\x11\xb3\x01\x0e\x14\x23\x24\x17\x39\xb0\x11\x12\xb0\x13\
-\x39\x30\x31\x3f\x01\x16\x33\x32\x36\x35\x34\x26\x27\x26\x27\x2e\
-\x01\x35\x34\x36\x33\x32\x17\x07\x2e\x01\x23\x22\x06\x15\x14\x16\
-\x17\x1e\x01\x17\x1e\x01\x15\x14\x00\x23\x22\x1b\x01\x33\x03\x5a\
-\x1f\xd3\xe3\x85\xa6\x60\x50\x04\xfa\x7d\xbe\xfe\xd0\xc1\xb6\x1c\
-\x56\x94\x73\x89\xa0\x5d\x47\x1d\xf0\x27\x6f\xa3\xff\x00\xcf\xf6\
-\x29\x98\x7d\x85\x60\xaa\xaa\xa4\x6b\x50\x85\x20\x02\x42\x21\xca\
-\x94\x9e\xf5\x62\xaa\x42\x41\x95\x5f\x48\x74\x1d\x0c\x39\x11\x2f\
-\xcd\x8f\xac\xfe\xfc\xfe\xa4\x01\x5a\xfe\xa6\x00\x02\x00\x37\xfe\
-\x77\x02\xe1\x03\xb0\x00\x2f\x00\x33\x00\xd2\x00\xb2\x2e\x00\x00\
-\x2b\xb1\x05\x03\xe9\xb2\x14\x01\x00\x2b\xb1\x22\x07\xe9\x01\xb0\
-\x34\x2f\xb0\x12\xd6\xb1\x24\x10\xe9\xb0\x24\x10\xb1\x08\x01\x2b\
-\xb1\x2c\x0f\xe9\xb1\x35\x01\x2b\xb0\x36\x1a\xba\xf4\xac\xc1\x03\
-\x00\x15\x2b\x0a\x0e\xb0\x11\x10\xb0\x0e\xc0\xb1\x26\x0d\xf9\xb0\
-\x28\xc0\xb0\x11\x10\xb3\x0f\x11\x0e\x13\x2b\xb3\x10\x11\x0e\x13\
-\x2b\xb0\x26\x10\xb3\x27\x26\x28\x13\x2b\xb2\x27\x26\x28\x20\x8a\
-\x20\x8a\x23\x06\x0e\x11\x12\x39\xb2\x10\x11\x0e\x11\x12\x39\xb0\
-\x0f\x39\x00\xb5\x10\x26\x0e\x0f\x27\x28\x2e\x2e\x2e\x2e\x2e\x2e\
-\x01\xb5\x10\x26\x0e\x0f\x27\x28\x2e\x2e\x2e\x2e\x2e\x2e\xb0\x40\
-\x1a\x01\xb1\x24\x12\x11\x12\xb1\x01\x30\x39\x39\xb0\x08\x11\xb5\
-\x05\x14\x1b\x31\x32\x33\x24\x17\x39\xb0\x2c\x12\xb1\x16\x19\x39\
-\x39\x00\xb1\x05\x2e\x11\x12\xb0\x00\x39\xb0\x22\x11\xb3\x01\x12\
-\x17\x2c\x24\x17\x39\xb0\x14\x12\xb0\x16\x39\x30\x31\x3f\x01\x1e\
-\x02\x33\x32\x36\x35\x34\x2e\x05\x23\x24\x35\x10\x21\x32\x17\x07\
-\x2e\x09\x23\x22\x15\x14\x17\x1e\x01\x17\x1e\x01\x15\x10\x21\x26\
-\x03\x13\x33\x03\x37\x19\x33\x3e\x89\x49\x6a\x53\x13\x22\x23\x2f\
-\x1f\x29\x02\xfe\xc3\x01\x4f\x96\x97\x16\x06\x25\x0c\x23\x11\x22\
-\x19\x25\x21\x29\x16\xa8\x66\x0c\xbd\x2b\x42\x70\xfe\xae\xae\x25\
-\x98\x7d\x85\x46\x8b\x1f\x21\x27\x52\x38\x1b\x2a\x1f\x17\x0e\x08\
-\x08\x39\xde\x01\x0c\x3f\x88\x02\x13\x06\x0e\x07\x0a\x06\x06\x04\
-\x02\x7b\x58\x23\x04\x22\x15\x1d\x7f\x66\xfe\xe7\x01\xfe\x8d\x01\
-\x5a\xfe\xa6\x00\x02\x00\x5a\xff\xd3\x03\xfe\x07\x1d\x00\x27\x00\
-\x2e\x00\xb6\x00\xb2\x26\x00\x00\x2b\xb1\x03\x0a\xe9\xb2\x11\x02\
-\x00\x2b\xb1\x17\x09\xe9\x01\xb0\x2f\x2f\xb0\x0e\xd6\xb1\x1a\x0d\
-\xe9\xb0\x1a\x10\xb1\x06\x01\x2b\xb1\x23\x13\xe9\xb1\x30\x01\x2b\
-\xb0\x36\x1a\xba\xee\xec\xc2\x52\x00\x15\x2b\x0a\x0e\xb0\x0b\x10\
-\xb0\x09\xc0\xb1\x1d\x04\xf9\xb0\x1f\xc0\xb3\x1e\x1d\x1f\x13\x2b\
-\xb2\x1e\x1d\x1f\x20\x8a\x20\x8a\x23\x06\x0e\x11\x12\x39\x00\xb4\
-\x09\x0b\x1d\x1e\x1f\x2e\x2e\x2e\x2e\x2e\x01\xb4\x09\x0b\x1d\x1e\
-\x1f\x2e\x2e\x2e\x2e\x2e\xb0\x40\x1a\x01\xb1\x1a\x0e\x11\x12\xb1\
-\x01\x28\x39\x39\xb0\x06\x11\xb7\x03\x11\x17\x26\x29\x2b\x2d\x2e\
-\x24\x17\x39\xb0\x23\x12\xb2\x13\x14\x2c\x39\x39\x39\x00\xb1\x03\
-\x26\x11\x12\xb0\x00\x39\xb0\x17\x11\xb3\x01\x0e\x14\x23\x24\x17\
-\x39\xb0\x11\x12\xb0\x13\x39\x30\x31\x3f\x01\x16\x33\x32\x36\x35\
-\x34\x26\x27\x26\x27\x2e\x01\x35\x34\x24\x33\x32\x17\x07\x2e\x01\
-\x23\x22\x06\x15\x14\x16\x17\x1e\x01\x17\x1e\x01\x15\x14\x00\x23\
-\x22\x03\x33\x17\x37\x33\x03\x23\x5a\x1f\xd7\xdf\x85\xa6\x60\x50\
-\x04\xfa\x7d\xbe\x01\x00\xce\xc1\xb6\x1c\x56\x94\x73\x85\xa4\x5d\
-\x47\x1d\xf0\x27\x71\xa1\xfe\xfc\xcb\xf6\x45\x7d\xc6\xc7\x7d\xfa\
-\x93\x60\xaa\xaa\xa4\x6b\x50\x85\x20\x02\x42\x21\xca\x94\x9e\xf5\
-\x62\xaa\x42\x41\x91\x61\x48\x76\x1d\x0c\x39\x11\x2f\xcf\x8d\xae\
-\xfe\xfe\x07\x4a\xe4\xe4\xfe\xb4\x00\x00\x00\x00\x02\x00\x37\xff\
-\xe9\x02\xe1\x05\x1d\x00\x36\x00\x45\x00\xfb\x00\xb2\x35\x00\x00\
-\x2b\xb1\x03\x03\xe9\xb2\x1c\x01\x00\x2b\xb1\x2a\x07\xe9\x01\xb0\
-\x46\x2f\xb0\x1a\xd6\xb1\x2c\x0f\xe9\xb0\x2c\x10\xb1\x05\x01\x2b\
-\xb1\x33\x0f\xe9\xb1\x47\x01\x2b\xb0\x36\x1a\xba\xec\xb0\xc2\xfc\
-\x00\x15\x2b\x0a\x0e\xb0\x14\x10\xb0\x0c\xc0\xb1\x2e\x17\xf9\xb0\
-\x30\xc0\xba\xf1\x4c\xc1\xb6\x00\x15\x2b\x0b\xb0\x14\x10\xb3\x0d\
-\x14\x0c\x13\x2b\xb3\x0e\x14\x0c\x13\x2b\xb3\x12\x14\x0c\x13\x2b\
-\xb3\x13\x14\x0c\x13\x2b\xb0\x2e\x10\xb3\x2f\x2e\x30\x13\x2b\xb2\
-\x2f\x2e\x30\x20\x8a\x20\x8a\x23\x06\x0e\x11\x12\x39\xb2\x13\x14\
-\x0c\x11\x12\x39\xb0\x12\x39\xb0\x0d\x39\xb0\x0e\x39\x00\x40\x09\
-\x30\x0c\x0d\x0e\x12\x13\x14\x2e\x2f\x2e\x2e\x2e\x2e\x2e\x2e\x2e\
-\x2e\x2e\x01\x40\x09\x30\x0c\x0d\x0e\x12\x13\x14\x2e\x2f\x2e\x2e\
-\x2e\x2e\x2e\x2e\x2e\x2e\x2e\xb0\x40\x1a\x01\xb1\x2c\x1a\x11\x12\
-\xb1\x01\x38\x39\x39\xb0\x05\x11\xb3\x1c\x23\x39\x3a\x24\x17\x39\
-\xb0\x33\x12\xb2\x1e\x21\x3c\x39\x39\x39\x00\xb1\x03\x35\x11\x12\
-\xb0\x00\x39\xb0\x2a\x11\xb3\x01\x1a\x1f\x33\x24\x17\x39\xb0\x1c\
-\x12\xb0\x1e\x39\x30\x31\x3f\x01\x16\x17\x32\x35\x34\x2e\x07\x2f\
-\x01\x2e\x06\x27\x26\x35\x10\x21\x32\x17\x07\x2e\x09\x23\x22\x15\
-\x14\x1e\x01\x17\x1e\x01\x15\x10\x21\x26\x03\x33\x17\x37\x33\x17\
-\x06\x07\x06\x2b\x01\x22\x26\x27\x26\x37\x19\xa6\xa0\xba\x08\x0d\
-\x14\x10\x1b\x13\x18\x0c\x0b\x0a\x06\x4c\x1a\x44\x23\x33\x27\x12\
-\x2d\x01\x4d\x98\x98\x19\x06\x25\x0c\x23\x11\x22\x19\x25\x21\x29\
-\x16\xa8\x6a\xc5\x23\x4e\x6c\xfe\xb0\xb0\xaa\x7f\xcd\xcb\x48\x37\
-\xfc\x0e\x0a\x11\x4a\x17\x33\x6c\x44\x46\x8b\x66\x01\x8c\x10\x1f\
-\x16\x15\x10\x0d\x08\x08\x04\x02\x02\x02\x0c\x09\x10\x12\x1d\x25\
-\x19\x3f\x4c\x01\x0c\x3f\x88\x02\x13\x06\x0e\x07\x0a\x06\x06\x04\
-\x02\x7b\x44\x3d\x22\x0f\x23\x83\x60\xfe\xe7\x01\x05\x33\x8c\x8c\
-\x02\xb4\x07\x04\x1f\x50\x31\x00\x02\x00\x48\xfe\x77\x05\x25\x05\
-\x83\x00\x09\x00\x0d\x00\x46\x00\xb2\x07\x00\x00\x2b\xb2\x01\x02\
-\x00\x2b\xb1\x00\x09\xe9\xb0\x03\x32\x01\xb0\x0e\x2f\xb0\x07\xd6\
-\xb1\x06\x0e\xe9\xb2\x06\x07\x0a\x2b\xb3\x40\x06\x02\x09\x2b\xb2\
-\x07\x06\x0a\x2b\xb3\x40\x07\x01\x09\x2b\xb1\x0f\x01\x2b\xb1\x06\
-\x07\x11\x12\xb2\x0b\x0c\x0d\x39\x39\x39\x00\x30\x31\x13\x35\x21\
-\x15\x21\x27\x11\x23\x11\x07\x1b\x01\x33\x03\x48\x04\xdd\xfe\xdd\
-\xf0\xb6\xf2\x78\x97\x7d\x85\x04\xfc\x87\x87\x02\xfb\x02\x04\xfe\
-\x02\xf9\x7b\x01\x5a\xfe\xa6\x00\x02\x00\x25\xfe\x77\x02\xa8\x04\
-\x91\x00\x14\x00\x18\x00\x68\x00\xb2\x10\x00\x00\x2b\xb1\x0b\x08\
-\xe9\xb2\x01\x01\x00\x2b\xb0\x05\x33\xb1\x00\x06\xe9\xb0\x07\x32\
-\xb2\x01\x00\x0a\x2b\xb3\x40\x01\x03\x09\x2b\x01\xb0\x19\x2f\xb0\
-\x13\xd6\xb0\x02\x32\xb1\x09\x10\xe9\xb0\x04\x32\xb2\x09\x13\x0a\
-\x2b\xb3\x40\x09\x07\x09\x2b\xb2\x13\x09\x0a\x2b\xb3\x40\x13\x00\
-\x09\x2b\xb1\x1a\x01\x2b\xb1\x09\x13\x11\x12\xb0\x15\x39\x00\xb1\
-\x0b\x10\x11\x12\xb0\x0e\x39\xb0\x00\x11\xb0\x0d\x39\x30\x31\x13\
-\x35\x33\x11\x33\x11\x21\x15\x21\x11\x14\x37\x32\x37\x17\x06\x23\
-\x22\x26\x35\x11\x1b\x01\x33\x03\x25\xb0\x8f\x01\x21\xfe\xdf\x6d\
-\x56\x60\x21\x91\xa0\x60\x46\x1f\x97\x7d\x85\x03\x17\x78\x01\x02\
-\xfe\xfe\x78\xfd\xfb\xa6\x01\x43\x79\x4e\x90\x81\x02\x1d\xfb\x60\
-\x01\x5a\xfe\xa6\x00\x00\x00\x00\x02\x00\x48\x00\x00\x05\x25\x07\
-\x1d\x00\x09\x00\x10\x00\x46\x00\xb2\x07\x00\x00\x2b\xb2\x01\x02\
-\x00\x2b\xb1\x00\x09\xe9\xb0\x03\x32\x01\xb0\x11\x2f\xb0\x07\xd6\
-\xb1\x06\x0e\xe9\xb2\x06\x07\x0a\x2b\xb3\x40\x06\x02\x09\x2b\xb2\
-\x07\x06\x0a\x2b\xb3\x40\x07\x01\x09\x2b\xb1\x12\x01\x2b\xb1\x06\
-\x07\x11\x12\xb2\x0c\x0f\x10\x39\x39\x39\x00\x30\x31\x13\x35\x21\
-\x15\x21\x27\x11\x23\x11\x07\x13\x33\x17\x37\x33\x03\x23\x48\x04\
-\xdd\xfe\xdd\xf0\xb6\xf2\x08\x7b\xc9\xc5\x81\xfc\x94\x04\xfc\x87\
-\x87\x02\xfb\x02\x04\xfe\x02\x02\x21\xe4\xe4\xfe\xb4\x00\x00\x00\
-\x02\x00\x25\xff\xe9\x02\xdb\x05\x3d\x00\x14\x00\x1f\x00\x80\x00\
-\xb2\x10\x00\x00\x2b\xb1\x0b\x08\xe9\xb2\x01\x01\x00\x2b\xb0\x05\
-\x33\xb1\x00\x06\xe9\xb0\x07\x32\xb2\x01\x00\x0a\x2b\xb3\x40\x01\
-\x03\x09\x2b\x01\xb0\x20\x2f\xb0\x13\xd6\xb0\x02\x32\xb1\x09\x10\
-\xe9\xb0\x04\x32\xb2\x09\x13\x0a\x2b\xb3\x40\x09\x07\x09\x2b\xb2\
-\x13\x09\x0a\x2b\xb3\x40\x13\x00\x09\x2b\xb0\x09\x10\xb1\x17\x01\
-\x2b\xb0\x15\x32\xb1\x1a\x14\xe9\xb1\x21\x01\x2b\xb1\x17\x09\x11\
-\x12\xb0\x10\x39\xb0\x1a\x11\xb2\x0d\x0e\x16\x39\x39\x39\x00\xb1\
-\x0b\x10\x11\x12\xb0\x0e\x39\xb0\x00\x11\xb0\x0d\x39\x30\x31\x13\
-\x35\x33\x11\x33\x11\x21\x15\x21\x11\x14\x37\x32\x37\x17\x06\x23\
-\x22\x26\x35\x11\x25\x37\x23\x35\x33\x15\x0e\x03\x07\x25\xb0\x8f\
-\x01\x21\xfe\xdf\x6d\x56\x60\x21\x91\xa0\x5e\x48\x01\x5e\x35\x35\
-\xac\x02\x0a\x0c\x29\x15\x03\x17\x78\x01\x02\xfe\xfe\x78\xfd\xfb\
-\xa6\x01\x43\x79\x4e\x8c\x85\x02\x1d\xd0\xaa\xac\x8d\x14\x21\x1b\
-\x4e\x2b\x00\x00\x02\x00\xc1\xff\xd3\x04\xbe\x06\xb3\x00\x1f\x00\
-\x23\x00\x50\x00\xb2\x1b\x00\x00\x2b\xb1\x0b\x05\xe9\xb2\x01\x02\
-\x00\x2b\xb0\x14\x33\xb0\x20\x2f\xb1\x21\x08\xe9\x01\xb0\x24\x2f\
-\xb0\x00\xd6\xb1\x03\x0e\xe9\xb0\x03\x10\xb1\x13\x01\x2b\xb1\x16\
-\x0d\xe9\xb1\x25\x01\x2b\xb1\x03\x00\x11\x12\xb1\x20\x21\x39\x39\
-\xb0\x13\x11\xb1\x0b\x1b\x39\x39\xb0\x16\x12\xb1\x22\x23\x39\x39\
-\x00\x30\x31\x13\x11\x33\x11\x14\x06\x15\x14\x1e\x02\x33\x32\x3e\
-\x02\x35\x34\x26\x35\x11\x33\x11\x14\x0e\x02\x23\x22\x2e\x02\x13\
-\x35\x21\x15\xc1\xb8\x02\x43\x6d\x68\x36\x39\x71\x6c\x44\x02\xa1\
-\x5c\x95\xb0\x58\x5a\xb1\x99\x60\x73\x03\x1b\x01\xf6\x03\x97\xfc\
-\xae\x0c\x2f\x0c\x7d\xb4\x59\x24\x29\x5a\xae\x75\x06\x18\x06\x03\
-\x7d\xfc\x61\x83\xd5\x7f\x44\x41\x7f\xda\x04\xc3\x83\x83\x00\x00\
-\x02\x00\x9f\xff\xe9\x03\x81\x04\xee\x00\x03\x00\x1b\x00\x54\x00\
-\xb2\x13\x00\x00\x2b\xb2\x16\x00\x00\x2b\xb1\x0a\x05\xe9\xb2\x05\
-\x01\x00\x2b\xb0\x10\x33\xb0\x00\x2f\xb1\x01\x08\xe9\x01\xb0\x1c\
-\x2f\xb0\x04\xd6\xb0\x00\x32\xb1\x07\x0d\xe9\xb0\x07\x10\xb1\x0f\
-\x01\x2b\xb0\x13\x32\xb1\x12\x0d\xe9\xb0\x02\x32\xb1\x1d\x01\x2b\
-\xb1\x0f\x07\x11\x12\xb0\x16\x39\x00\xb1\x05\x0a\x11\x12\xb0\x14\
-\x39\x30\x31\x13\x35\x21\x15\x01\x11\x33\x11\x1e\x01\x33\x32\x36\
-\x37\x36\x35\x11\x33\x11\x23\x35\x06\x23\x22\x2e\x03\x9f\x02\xe2\
-\xfd\x23\xa0\x02\x3f\x62\x6a\x82\x08\x02\xa0\x9c\x8b\xdb\x3d\x57\
-\x2b\x16\x02\x04\x6b\x83\x83\xfc\x8f\x02\x95\xfd\x52\x48\x3d\x71\
-\x4a\x14\x27\x02\x3d\xfc\x71\x62\x79\x27\x32\x58\x33\x00\x00\x00\
-\x02\x00\xc1\xff\xd3\x04\xbe\x07\x1d\x00\x1f\x00\x2d\x00\x6b\x00\
-\xb2\x1b\x00\x00\x2b\xb1\x0b\x05\xe9\xb2\x01\x02\x00\x2b\xb0\x14\
-\x33\xb0\x2b\x2f\xb1\x24\x09\xe9\xb2\x24\x2b\x0a\x2b\xb3\x40\x24\
-\x28\x09\x2b\xb0\x20\x32\x01\xb0\x2e\x2f\xb0\x00\xd6\xb1\x03\x0e\
-\xe9\xb3\x20\x03\x00\x08\x2b\xb4\x21\x16\x00\x32\x04\x2b\xb0\x03\
-\x10\xb1\x27\x01\x2b\xb4\x28\x0f\x00\x20\x04\x2b\xb0\x28\x10\xb1\
-\x13\x0b\x2b\xb1\x16\x0d\xe9\xb1\x2f\x01\x2b\xb1\x27\x00\x11\x12\
-\xb2\x0b\x1b\x2b\x39\x39\x39\x00\x30\x31\x13\x11\x33\x11\x14\x06\
-\x15\x14\x1e\x02\x33\x32\x3e\x02\x35\x34\x26\x35\x11\x33\x11\x14\
-\x0e\x02\x23\x22\x2e\x02\x13\x33\x1e\x01\x33\x32\x36\x37\x33\x0e\
-\x01\x23\x22\x26\xc1\xb8\x02\x43\x6d\x68\x36\x39\x71\x6c\x44\x02\
-\xa1\x5c\x95\xb0\x58\x5a\xb1\x99\x60\xa4\x7d\x06\x87\x52\x58\x7f\
-\x06\x7f\x04\xcf\x89\x8b\xcf\x01\xf6\x03\x97\xfc\xae\x0c\x2f\x0c\
-\x7d\xb4\x59\x24\x29\x5a\xae\x75\x06\x18\x06\x03\x7d\xfc\x61\x83\
-\xd5\x7f\x44\x41\x7f\xda\x05\xb0\x5e\x65\x69\x5a\x93\xb9\xb9\x00\
-\x02\x00\xa4\xff\xe9\x03\x7d\x05\x1d\x00\x17\x00\x27\x00\x78\x00\
-\xb2\x0f\x00\x00\x2b\xb2\x12\x00\x00\x2b\xb1\x06\x05\xe9\xb2\x01\
-\x01\x00\x2b\xb0\x0c\x33\xb0\x26\x2f\xb1\x1e\x09\xe9\xb2\x1e\x26\
-\x0a\x2b\xb3\x40\x1e\x23\x09\x2b\xb0\x18\x32\x01\xb0\x28\x2f\xb0\
-\x00\xd6\xb1\x03\x0d\xe9\xb3\x18\x03\x00\x08\x2b\xb4\x19\x16\x00\
-\x32\x04\x2b\xb0\x03\x10\xb1\x0b\x01\x2b\xb1\x0f\x22\x32\x32\xb1\
-\x0e\x0d\xe9\xb4\x23\x0f\x00\x20\x04\x2b\xb1\x29\x01\x2b\xb1\x0b\
-\x03\x11\x12\xb4\x12\x1d\x1e\x25\x26\x24\x17\x39\x00\xb1\x01\x06\
-\x11\x12\xb0\x10\x39\x30\x31\x37\x11\x33\x11\x1e\x01\x33\x32\x36\
-\x37\x36\x35\x11\x33\x11\x23\x35\x06\x23\x22\x2e\x03\x13\x33\x1e\
-\x03\x32\x3e\x02\x37\x33\x0e\x01\x20\x26\xa4\xa0\x02\x3f\x62\x6a\
-\x82\x08\x02\xa0\x9c\x8b\xdb\x3d\x57\x2b\x16\x02\x10\x7d\x04\x35\
-\x4e\x3d\x36\x3b\x4c\x35\x04\x7f\x04\xd1\xfe\xf2\xcf\xfa\x02\x95\
-\xfd\x52\x48\x3d\x71\x4a\x14\x27\x02\x3d\xfc\x71\x62\x79\x27\x32\
-\x58\x33\x04\x50\x2f\x42\x1d\x0a\x0a\x1d\x42\x2f\x85\x9c\x9c\x00\
-\x03\x00\xc1\xff\xd3\x04\xbe\x07\x1b\x00\x1f\x00\x2b\x00\x30\x00\
-\x77\x00\xb2\x1b\x00\x00\x2b\xb1\x0b\x05\xe9\xb2\x01\x02\x00\x2b\
-\xb0\x14\x33\xb3\x19\x01\x2e\x0e\x2b\xb1\x29\x03\xe9\xb0\x30\x2f\
-\xb1\x23\x03\xe9\x01\xb0\x31\x2f\xb0\x00\xd6\xb1\x03\x0e\xe9\xb0\
-\x03\x10\xb1\x20\x01\x2b\xb1\x2d\x16\xe9\xb0\x2d\x10\xb1\x2f\x01\
-\x2b\xb1\x26\x16\xe9\xb0\x26\x10\xb1\x13\x01\x2b\xb1\x16\x0d\xe9\
-\xb1\x32\x01\x2b\xb1\x2f\x2d\x11\x12\xb3\x1b\x23\x29\x0b\x24\x17\
-\x39\x00\xb1\x29\x0b\x11\x12\xb1\x06\x10\x39\x39\xb1\x30\x01\x11\
-\x12\xb1\x20\x26\x39\x39\x30\x31\x13\x11\x33\x11\x14\x06\x15\x14\
-\x1e\x02\x33\x32\x3e\x02\x35\x34\x26\x35\x11\x33\x11\x14\x0e\x02\
-\x23\x22\x2e\x02\x01\x34\x36\x33\x32\x16\x15\x14\x06\x23\x22\x26\
-\x36\x14\x32\x34\x23\xc1\xb8\x02\x43\x6d\x68\x36\x39\x71\x6c\x44\
-\x02\xa1\x5c\x95\xb0\x58\x5a\xb1\x99\x60\x01\x20\x89\x5b\x62\x81\
-\x8b\x58\x64\x80\x73\xe1\x6e\x01\xf6\x03\x97\xfc\xae\x0c\x2f\x0c\
-\x7d\xb4\x59\x24\x29\x5a\xae\x75\x06\x18\x06\x03\x7d\xfc\x61\x83\
-\xd5\x7f\x44\x41\x7f\xda\x04\xca\x62\x82\x8a\x5a\x62\x81\x87\xc3\
-\xcd\xcd\x00\x00\x03\x00\xa4\xff\xe9\x03\x7d\x05\x1d\x00\x17\x00\
-\x23\x00\x2e\x00\x8a\x00\xb2\x0f\x00\x00\x2b\xb2\x12\x00\x00\x2b\
-\xb1\x06\x05\xe9\xb2\x01\x01\x00\x2b\xb0\x0c\x33\xb0\x21\x2f\xb4\
-\x27\x0c\x00\x17\x04\x2b\xb0\x2c\x2f\xb4\x1b\x0c\x00\x17\x04\x2b\
-\x01\xb0\x2f\x2f\xb0\x00\xd6\xb1\x03\x0d\xe9\xb3\x18\x03\x00\x08\
-\x2b\xb1\x24\x16\xe9\xb0\x03\x10\xb1\x0b\x01\x2b\xb0\x0f\x32\xb1\
-\x0e\x0d\xe9\xb3\x1e\x0e\x0b\x08\x2b\xb1\x2a\x16\xe9\xb0\x2a\x2f\
-\xb1\x1e\x16\xe9\xb1\x30\x01\x2b\xb1\x24\x18\x11\x12\xb0\x12\x39\
-\xb0\x2a\x11\xb2\x06\x21\x1b\x39\x39\x39\x00\xb1\x01\x0f\x11\x12\
-\xb0\x10\x39\xb1\x2c\x27\x11\x12\xb1\x18\x1e\x39\x39\x30\x31\x37\
-\x11\x33\x11\x1e\x01\x33\x32\x36\x37\x36\x35\x11\x33\x11\x23\x35\
-\x06\x23\x22\x2e\x03\x13\x34\x36\x33\x32\x16\x15\x14\x06\x23\x22\
-\x26\x37\x14\x16\x33\x32\x36\x34\x26\x23\x22\x06\xa4\xa0\x02\x3f\
-\x62\x6a\x82\x08\x02\xa0\x9c\x8b\xdb\x3d\x57\x2b\x16\x02\x89\x7d\
-\x66\x68\x7b\x7d\x66\x68\x7b\x72\x33\x3e\x3b\x36\x34\x3d\x33\x3e\
-\xfa\x02\x95\xfd\x52\x48\x3d\x71\x4a\x14\x27\x02\x3d\xfc\x71\x62\
-\x79\x27\x32\x58\x33\x03\xaa\x3f\x67\x6b\x3d\x3f\x67\x6b\x3b\x25\
-\x3e\x40\x4a\x3d\x35\x00\x00\x00\x03\x00\xc1\xff\xd3\x04\xe2\x06\
-\xcf\x00\x1f\x00\x30\x00\x41\x00\x46\x00\xb2\x1b\x00\x00\x2b\xb1\
-\x0b\x05\xe9\xb2\x01\x02\x00\x2b\xb0\x14\x33\x01\xb0\x42\x2f\xb0\
-\x00\xd6\xb1\x03\x0e\xe9\xb0\x03\x10\xb1\x13\x01\x2b\xb1\x16\x0d\
-\xe9\xb1\x43\x01\x2b\xb1\x03\x00\x11\x12\xb0\x20\x39\xb0\x13\x11\
-\xb7\x0b\x1b\x22\x2d\x30\x31\x3a\x40\x24\x17\x39\x00\x30\x31\x13\
-\x11\x33\x11\x14\x06\x15\x14\x1e\x02\x33\x32\x3e\x02\x35\x34\x26\
-\x35\x11\x33\x11\x14\x0e\x02\x23\x22\x2e\x02\x13\x3e\x08\x32\x3b\
-\x01\x17\x05\x0f\x01\x33\x3e\x08\x32\x3b\x01\x17\x05\x0f\x01\xc1\
-\xb8\x02\x43\x6d\x68\x36\x39\x71\x6c\x44\x02\xa1\x5c\x95\xb0\x58\
-\x5a\xb1\x99\x60\xa8\x2b\x56\x35\x33\x1f\x1d\x10\x0f\x0a\x08\x06\
-\x8b\x3e\xfe\xbc\x2d\x1f\xbf\x2b\x56\x35\x33\x1f\x1d\x10\x0f\x0a\
-\x08\x06\x8b\x3e\xfe\xbc\x2d\x1f\x01\xf6\x03\x97\xfc\xae\x0c\x2f\
-\x0c\x7d\xb4\x59\x24\x29\x5a\xae\x75\x06\x18\x06\x03\x7d\xfc\x61\
-\x83\xd5\x7f\x44\x41\x7f\xda\x04\xa7\x19\x31\x21\x1f\x10\x10\x09\
-\x06\x02\x02\xa2\x14\x03\x19\x31\x21\x1f\x10\x10\x09\x06\x02\x02\
-\xa2\x14\x03\x00\x03\x00\xa4\xff\xe9\x03\xf3\x05\x1f\x00\x17\x00\
-\x1b\x00\x1f\x00\x5a\x00\xb2\x0f\x00\x00\x2b\xb2\x12\x00\x00\x2b\
-\xb1\x06\x05\xe9\xb2\x01\x01\x00\x2b\xb0\x0c\x33\x01\xb0\x20\x2f\
-\xb0\x00\xd6\xb1\x03\x0d\xe9\xb0\x03\x10\xb1\x0b\x01\x2b\xb0\x0f\
-\x32\xb1\x0e\x0d\xe9\xb1\x21\x01\x2b\xb1\x03\x00\x11\x12\xb0\x18\
-\x39\xb0\x0b\x11\xb5\x12\x19\x1a\x1b\x1c\x1f\x24\x17\x39\xb0\x0e\
-\x12\xb0\x1d\x39\x00\xb1\x01\x06\x11\x12\xb0\x10\x39\x30\x31\x37\
-\x11\x33\x11\x1e\x01\x33\x32\x36\x37\x36\x35\x11\x33\x11\x23\x35\
-\x06\x23\x22\x2e\x03\x13\x01\x33\x01\x33\x01\x33\x01\xa4\xa0\x02\
-\x3f\x62\x6a\x82\x08\x02\xa0\x9c\x8b\xdb\x3d\x57\x2b\x16\x02\x49\
-\x01\x11\x9f\xfe\xcf\xd7\x01\x11\x9f\xfe\xcf\xfa\x02\x95\xfd\x52\
-\x48\x3d\x71\x4a\x14\x27\x02\x3d\xfc\x71\x62\x79\x27\x32\x58\x33\
-\x03\x47\x01\x0b\xfe\xf5\x01\x0b\xfe\xf5\x00\x00\x03\x00\x04\x00\
-\x00\x05\x4c\x06\xcd\x00\x0b\x00\x0f\x00\x13\x00\x53\x00\xb2\x0a\
-\x00\x00\x2b\xb2\x00\x02\x00\x2b\xb0\x06\x33\xb0\x0c\x2f\xb0\x10\
-\x33\xb1\x0d\x04\xe9\xb0\x11\x32\x01\xb0\x14\x2f\xb0\x0c\xd6\xb1\
-\x0f\x0e\xe9\xb0\x0f\x10\xb1\x0a\x01\x2b\xb1\x09\x15\xe9\xb0\x09\
-\x10\xb1\x10\x01\x2b\xb1\x13\x0e\xe9\xb1\x15\x01\x2b\xb1\x09\x0a\
-\x11\x12\xb0\x04\x39\x00\xb1\x00\x0a\x11\x12\xb0\x04\x39\x30\x31\
-\x13\x33\x01\x16\x17\x36\x01\x33\x01\x11\x23\x11\x03\x35\x33\x15\
-\x33\x35\x33\x15\x04\xd7\x01\x2d\xa4\x0e\x48\x01\x96\xb4\xfd\xb6\
-\xb2\xca\xb8\xd7\xb8\x05\x8d\xfe\x4c\xf6\x1a\x7f\x02\x45\xfc\xac\
-\xfd\xc7\x02\x39\x03\xdd\xb7\xb7\xb7\xb7\x00\x00\x02\x00\x71\x00\
-\x00\x04\x7b\x06\xcd\x00\x19\x00\x23\x00\x26\x00\xb2\x00\x00\x00\
-\x2b\xb1\x15\x08\xe9\xb2\x08\x02\x00\x2b\xb1\x07\x03\xe9\x01\xb0\
-\x24\x2f\xb1\x25\x01\x2b\x00\xb1\x08\x07\x11\x12\xb0\x13\x39\x30\
-\x31\x33\x35\x34\x36\x37\x01\x05\x21\x35\x21\x15\x1c\x01\x06\x14\
-\x0e\x04\x07\x01\x21\x37\x21\x15\x01\x36\x37\x3e\x01\x3b\x01\x05\
-\x0f\x01\x71\x06\x14\x02\xfa\xfe\xb0\xfe\x58\x03\xe4\x02\x02\x03\
-\x06\x02\x0a\x02\xfd\x06\x01\xaa\x2f\x01\x46\xfd\x10\x44\x5c\x77\
-\x2f\x16\xc9\xfe\xbd\x30\x1c\x33\x1d\x14\x1d\x04\x8d\x02\x81\x31\
-\x06\x0a\x0a\x05\x08\x04\x0a\x04\x0f\x04\xfb\x75\x02\x87\x06\x14\
-\x27\x36\x46\x16\xa2\x14\x03\x00\x02\x00\x37\x00\x00\x03\x35\x05\
-\x1f\x00\x0c\x00\x10\x00\x2e\x00\xb2\x00\x00\x00\x2b\xb1\x08\x03\
-\xe9\xb2\x05\x01\x00\x2b\xb1\x04\x07\xe9\x01\xb0\x11\x2f\xb1\x12\
-\x01\x2b\x00\xb1\x08\x00\x11\x12\xb0\x01\x39\xb1\x05\x04\x11\x12\
-\xb0\x07\x39\x30\x31\x33\x35\x01\x07\x21\x35\x21\x15\x01\x21\x37\
-\x33\x15\x09\x01\x33\x01\x37\x02\x21\x3d\xfe\x39\x02\xdb\xfd\xe1\
-\x01\x9c\x2b\x5e\xfd\xdf\x01\x11\x9f\xfe\xcf\x54\x02\xc3\x03\x7b\
-\x52\xfd\x42\x02\x81\x04\x14\x01\x0b\xfe\xf5\x00\x02\x00\x71\x00\
-\x00\x04\x7b\x06\xf0\x00\x19\x00\x1d\x00\x34\x00\xb2\x00\x00\x00\
-\x2b\xb1\x15\x08\xe9\xb2\x08\x02\x00\x2b\xb1\x07\x03\xe9\xb0\x1a\
-\x2f\xb1\x1b\x04\xe9\x01\xb0\x1e\x2f\xb0\x1a\xd6\xb1\x1d\x0e\xe9\
-\xb1\x1f\x01\x2b\x00\xb1\x08\x07\x11\x12\xb0\x13\x39\x30\x31\x33\
-\x35\x34\x36\x37\x01\x05\x21\x35\x21\x15\x1c\x01\x06\x14\x0e\x04\
-\x07\x01\x21\x37\x21\x15\x01\x35\x33\x15\x71\x06\x14\x02\xfa\xfe\
-\xb0\xfe\x58\x03\xe4\x02\x02\x03\x06\x02\x0a\x02\xfd\x06\x01\xaa\
-\x2f\x01\x46\xfd\xd3\xb8\x33\x1d\x14\x1d\x04\x8d\x02\x81\x31\x06\
-\x0a\x0a\x05\x08\x04\x0a\x04\x0f\x04\xfb\x75\x02\x87\x06\x39\xb7\
-\xb7\x00\x00\x00\x02\x00\x37\x00\x00\x03\x35\x05\x6f\x00\x0c\x00\
-\x10\x00\x44\x00\xb2\x00\x00\x00\x2b\xb1\x08\x03\xe9\xb2\x05\x01\
-\x00\x2b\xb1\x04\x07\xe9\xb0\x0d\x2f\xb1\x0e\x04\xe9\x01\xb0\x11\
-\x2f\xb0\x0d\xd6\xb1\x10\x0e\xe9\xb1\x12\x01\x2b\xb1\x10\x0d\x11\
-\x12\xb0\x03\x39\x00\xb1\x08\x00\x11\x12\xb0\x01\x39\xb1\x05\x04\
-\x11\x12\xb0\x07\x39\x30\x31\x33\x35\x01\x07\x21\x35\x21\x15\x01\
-\x21\x37\x33\x15\x01\x35\x33\x15\x37\x02\x21\x3d\xfe\x39\x02\xdb\
-\xfd\xe1\x01\x9c\x2b\x5e\xfe\x53\xb8\x54\x02\xc3\x03\x7b\x52\xfd\
-\x42\x02\x81\x04\xb8\xb7\xb7\x00\x02\x00\x71\x00\x00\x04\x7b\x07\
-\x1d\x00\x19\x00\x20\x00\x26\x00\xb2\x00\x00\x00\x2b\xb1\x15\x08\
-\xe9\xb2\x08\x02\x00\x2b\xb1\x07\x03\xe9\x01\xb0\x21\x2f\xb1\x22\
-\x01\x2b\x00\xb1\x08\x07\x11\x12\xb0\x13\x39\x30\x31\x33\x35\x34\
-\x36\x37\x01\x05\x21\x35\x21\x15\x1c\x01\x06\x14\x0e\x04\x07\x01\
-\x21\x37\x21\x15\x01\x33\x17\x37\x33\x03\x23\x71\x06\x14\x02\xfa\
-\xfe\xb0\xfe\x58\x03\xe4\x02\x02\x03\x06\x02\x0a\x02\xfd\x06\x01\
-\xaa\x2f\x01\x46\xfc\xb4\x7b\xc9\xc5\x81\xfc\x94\x33\x1d\x14\x1d\
-\x04\x8d\x02\x81\x31\x06\x0a\x0a\x05\x08\x04\x0a\x04\x0f\x04\xfb\
-\x75\x02\x87\x07\x1d\xe4\xe4\xfe\xb4\x00\x00\x00\x02\x00\x37\x00\
-\x00\x03\x35\x05\x1d\x00\x0c\x00\x1b\x00\x2e\x00\xb2\x00\x00\x00\
-\x2b\xb1\x08\x03\xe9\xb2\x05\x01\x00\x2b\xb1\x04\x07\xe9\x01\xb0\
-\x1c\x2f\xb1\x1d\x01\x2b\x00\xb1\x08\x00\x11\x12\xb0\x01\x39\xb1\
-\x05\x04\x11\x12\xb0\x07\x39\x30\x31\x33\x35\x01\x07\x21\x35\x21\
-\x15\x01\x21\x37\x33\x15\x01\x33\x17\x37\x33\x17\x06\x07\x06\x2b\
-\x01\x22\x26\x27\x26\x37\x02\x21\x3d\xfe\x39\x02\xdb\xfd\xe1\x01\
-\x9c\x2b\x5e\xfd\x42\x7f\xcd\xcb\x47\x38\xfc\x0f\x0a\x10\x4a\x17\
-\x33\x6c\x44\x54\x02\xc3\x03\x7b\x52\xfd\x42\x02\x81\x05\x1d\x8c\
-\x8c\x02\xb4\x07\x04\x1f\x50\x31\x00\x00\x00\x00\x01\x00\x0c\xfe\
-\x5c\x04\xe9\x05\xdd\x00\x31\x01\x1f\x00\xb2\x0c\x01\x00\x2b\xb1\
-\x0d\x26\x33\x33\xb1\x0b\x06\xe9\xb1\x0a\x29\x32\x32\xb0\x30\x2f\
-\xb1\x03\x08\xe9\xb0\x20\x2f\xb1\x1c\x03\xe9\x01\xb0\x32\x2f\xb1\
-\x33\x01\x2b\xb0\x36\x1a\xba\x3e\x97\xf2\xa3\x00\x15\x2b\x0a\xb0\
-\x0a\x2e\x0e\xb0\x14\xc0\x05\xb1\x29\x11\xf9\x0e\xb0\x24\xc0\xba\
-\x3d\xc1\xef\x31\x00\x15\x2b\x0a\x05\xb0\x26\x2e\xb1\x29\x24\x08\
-\xb0\x24\xc0\x0e\xb1\x12\x18\xf9\xb1\x0a\x14\x08\xb0\x14\xc0\x05\
-\xb0\x0a\x10\xb3\x0d\x0a\x14\x13\x2b\xba\x3e\x83\xf2\x48\x00\x15\
-\x2b\x0b\xb3\x0e\x0a\x14\x13\x2b\xb3\x0f\x0a\x14\x13\x2b\xb3\x10\
-\x0a\x14\x13\x2b\xb3\x11\x0a\x14\x13\x2b\xb1\x12\x14\x08\xb3\x12\
-\x0a\x14\x13\x2b\xba\x3e\x83\xf2\x48\x00\x15\x2b\x0b\xb3\x13\x0a\
-\x14\x13\x2b\xb1\x0a\x14\x08\xb0\x12\x10\xb3\x13\x12\x14\x13\x2b\
-\xb2\x0e\x0a\x14\x20\x8a\x20\x8a\x23\x06\x11\x12\x39\xb0\x0f\x39\
-\xb0\x10\x39\xb0\x11\x39\x00\xb7\x24\x0e\x0f\x10\x11\x12\x13\x14\
-\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x01\x40\x0c\x0a\x0d\x24\x26\x29\
-\x0e\x0f\x10\x11\x12\x13\x14\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\
-\x2e\x2e\x2e\xb0\x40\x1a\x01\x00\xb1\x03\x30\x11\x12\xb0\x00\x39\
-\xb0\x0b\x11\xb0\x01\x39\xb1\x20\x0c\x11\x12\xb1\x18\x1e\x39\x39\
-\xb0\x1c\x11\xb0\x1d\x39\x30\x31\x13\x37\x16\x17\x32\x3e\x02\x3f\
-\x01\x13\x23\x37\x33\x3e\x08\x37\x3e\x03\x32\x17\x07\x26\x23\x22\
-\x0e\x01\x07\x06\x03\x33\x07\x23\x03\x06\x07\x0e\x02\x23\x22\x0c\
-\x46\x3f\x4c\x2f\x4a\x27\x16\x03\x04\xc4\x97\x18\x98\x06\x12\x09\
-\x0c\x04\x0a\x04\x08\x09\x06\x10\x37\x5d\x8d\xa0\x4b\x20\x58\x44\
-\x3d\x63\x29\x0c\x0a\x44\xea\x19\xe1\xb4\x19\x19\x12\x3b\x85\x4c\
-\x80\xfe\xa2\x7d\x3f\x01\x21\x2f\x31\x11\x10\x03\x96\x78\x21\x56\
-\x25\x37\x15\x23\x0e\x16\x11\x0c\x23\x4a\x5c\x39\x16\x8a\x23\x37\
-\x35\x19\x19\xfe\xcd\x78\xfc\xb2\x77\x2d\x27\x4e\x54\x00\x00\x00\
-\x02\x00\x5a\xfe\x42\x03\xfe\x05\xba\x00\x27\x00\x30\x00\xd3\x00\
-\xb2\x26\x00\x00\x2b\xb1\x03\x0a\xe9\xb2\x11\x02\x00\x2b\xb1\x17\
-\x09\xe9\xb0\x30\x2f\xb1\x28\x06\xe9\xb2\x30\x28\x0a\x2b\xb3\x40\
-\x30\x2d\x09\x2b\x01\xb0\x31\x2f\xb0\x0e\xd6\xb1\x1a\x0d\xe9\xb0\
-\x1a\x10\xb1\x30\x01\x2b\xb0\x2e\x32\xb1\x2a\x16\xe9\xb4\x2d\x16\
-\x00\x14\x04\x2b\xb0\x2a\x10\xb1\x06\x01\x2b\xb1\x23\x13\xe9\xb1\
-\x32\x01\x2b\xb0\x36\x1a\xba\xee\xec\xc2\x52\x00\x15\x2b\x0a\x0e\
-\xb0\x0b\x10\xb0\x09\xc0\xb1\x1d\x04\xf9\xb0\x1f\xc0\xb3\x1e\x1d\
-\x1f\x13\x2b\xb2\x1e\x1d\x1f\x20\x8a\x20\x8a\x23\x06\x0e\x11\x12\
-\x39\x00\xb4\x09\x0b\x1d\x1e\x1f\x2e\x2e\x2e\x2e\x2e\x01\xb4\x09\
-\x0b\x1d\x1e\x1f\x2e\x2e\x2e\x2e\x2e\xb0\x40\x1a\x01\xb1\x2a\x0e\
-\x11\x12\xb5\x01\x03\x11\x17\x26\x2f\x24\x17\x39\xb1\x23\x06\x11\
-\x12\xb1\x13\x14\x39\x39\x00\xb1\x03\x26\x11\x12\xb0\x00\x39\xb0\
-\x17\x11\xb3\x01\x0e\x14\x23\x24\x17\x39\xb0\x11\x12\xb0\x13\x39\
-\x30\x31\x3f\x01\x16\x33\x32\x36\x35\x34\x26\x27\x26\x27\x2e\x01\
-\x35\x34\x24\x33\x32\x17\x07\x2e\x01\x23\x22\x06\x15\x14\x16\x17\
-\x1e\x01\x17\x1e\x01\x15\x14\x00\x23\x22\x17\x33\x15\x0e\x01\x07\
-\x23\x37\x23\x5a\x1f\xd7\xdf\x85\xa6\x60\x50\x04\xfa\x7d\xbe\x01\
-\x00\xce\xc1\xb6\x1c\x56\x94\x73\x85\xa4\x5d\x47\x1d\xf0\x27\x71\
-\xa1\xfe\xfc\xcb\xf6\xb9\x77\x06\x32\x04\x3b\x25\x25\x60\xaa\xaa\
-\xa4\x6b\x50\x85\x20\x02\x42\x21\xca\x94\x9e\xf5\x62\xaa\x42\x41\
-\x91\x61\x48\x76\x1d\x0c\x39\x11\x2f\xcf\x8d\xae\xfe\xfe\x66\x65\
-\x2d\x89\x10\xb2\x00\x00\x00\x00\x02\x00\x37\xfe\x58\x02\xe1\x03\
-\xb0\x00\x38\x00\x41\x00\x98\x00\xb2\x37\x00\x00\x2b\xb1\x09\x03\
-\xe9\xb2\x1a\x01\x00\x2b\xb1\x28\x07\xe9\xb0\x41\x2f\xb1\x39\x06\
-\xe9\xb2\x41\x39\x0a\x2b\xb3\x40\x41\x3e\x09\x2b\x01\xb0\x42\x2f\
-\xb0\x15\xd6\xb1\x2b\x0f\xe9\xb0\x2b\x10\xb1\x41\x01\x2b\xb0\x3f\
-\x32\xb1\x3b\x16\xe9\xb4\x3e\x16\x00\x14\x04\x2b\xb0\x3b\x10\xb1\
-\x0c\x01\x2b\xb1\x32\x0f\xe9\xb1\x43\x01\x2b\xb1\x41\x2b\x11\x12\
-\xb0\x11\x39\xb1\x3b\x15\x11\x12\xb4\x01\x09\x1a\x28\x40\x24\x17\
-\x39\xb0\x0c\x11\xb2\x22\x25\x2e\x39\x39\x39\xb0\x32\x12\xb1\x1c\
-\x20\x39\x39\x00\xb1\x09\x37\x11\x12\xb0\x00\x39\xb0\x28\x11\xb3\
-\x01\x15\x1d\x32\x24\x17\x39\xb0\x1a\x12\xb0\x1c\x39\x30\x31\x3f\
-\x01\x1e\x06\x33\x32\x36\x35\x34\x26\x27\x2e\x01\x27\x2e\x01\x35\
-\x34\x3e\x02\x33\x32\x17\x07\x2e\x09\x23\x22\x06\x15\x14\x1e\x01\
-\x17\x1e\x01\x15\x14\x0e\x02\x23\x26\x17\x33\x15\x0e\x01\x07\x23\
-\x37\x23\x37\x19\x04\x2d\x17\x33\x2b\x39\x40\x22\x66\x59\x4a\x29\
-\x14\x8e\x22\x54\x81\x1c\x44\x8d\x62\x93\x98\x16\x02\x2b\x06\x27\
-\x0f\x24\x15\x27\x1e\x29\x17\x5e\x4e\x6d\xc4\x29\x4a\x68\x1c\x44\
-\x8d\x61\xb4\x73\x77\x06\x32\x04\x3b\x25\x25\x46\x8b\x02\x1b\x0c\
-\x19\x0e\x10\x07\x57\x35\x33\x44\x0c\x06\x1d\x0a\x1b\x81\x60\x2f\
-\x54\x58\x33\x3f\x88\x02\x13\x04\x10\x05\x0e\x02\x0a\x02\x02\x4c\
-\x31\x44\x3b\x22\x13\x21\x83\x5c\x2f\x5a\x5a\x38\x01\x67\x65\x2d\
-\x89\x10\xb2\x00\x02\x00\x48\xfe\x6f\x05\x25\x05\x83\x00\x09\x00\
-\x12\x00\x68\x00\xb2\x07\x00\x00\x2b\xb2\x01\x02\x00\x2b\xb1\x00\
-\x09\xe9\xb0\x03\x32\xb0\x12\x2f\xb1\x0a\x06\xe9\xb2\x12\x0a\x0a\
-\x2b\xb3\x40\x12\x0f\x09\x2b\x01\xb0\x13\x2f\xb0\x07\xd6\xb1\x06\
-\x0e\xe9\xb2\x06\x07\x0a\x2b\xb3\x40\x06\x02\x09\x2b\xb2\x07\x06\
-\x0a\x2b\xb3\x40\x07\x01\x09\x2b\xb3\x12\x06\x07\x08\x2b\xb0\x10\
-\x33\xb1\x0c\x16\xe9\xb4\x0f\x16\x00\x14\x04\x2b\xb1\x14\x01\x2b\
-\xb1\x0f\x12\x11\x12\xb0\x11\x39\x00\x30\x31\x13\x35\x21\x15\x21\
-\x27\x11\x23\x11\x07\x01\x33\x15\x0e\x01\x07\x23\x37\x23\x48\x04\
-\xdd\xfe\xdd\xf0\xb6\xf2\x01\x11\x77\x06\x32\x04\x3b\x25\x25\x04\
-\xfc\x87\x87\x02\xfb\x02\x04\xfe\x02\xfa\x9e\x65\x2d\x89\x10\xb2\
-\x00\x00\x00\x00\x02\x00\x25\xfe\x58\x02\xa8\x04\x91\x00\x13\x00\
-\x1c\x00\x9c\x00\xb2\x10\x00\x00\x2b\xb1\x0b\x08\xe9\xb2\x01\x01\
-\x00\x2b\xb0\x05\x33\xb1\x00\x06\xe9\xb0\x07\x32\xb2\x01\x00\x0a\
-\x2b\xb3\x40\x01\x04\x09\x2b\xb0\x1c\x2f\xb1\x14\x06\xe9\xb2\x1c\
-\x14\x0a\x2b\xb3\x40\x1c\x19\x09\x2b\x01\xb0\x1d\x2f\xb0\x12\xd6\
-\xb0\x02\x32\xb1\x09\x10\xe9\xb1\x04\x19\x32\x32\xb2\x09\x12\x0a\
-\x2b\xb3\x40\x09\x07\x09\x2b\xb2\x12\x09\x0a\x2b\xb3\x40\x12\x00\
-\x09\x2b\xb0\x09\x10\xb4\x1a\x16\x00\x14\x04\x2b\xb0\x1a\x2f\xb0\
-\x14\x33\xb3\x1c\x09\x12\x08\x2b\xb1\x16\x16\xe9\xb1\x1e\x01\x2b\
-\xb1\x09\x1a\x11\x12\xb0\x1b\x39\xb0\x16\x11\xb0\x10\x39\x00\xb1\
-\x0b\x10\x11\x12\xb0\x0e\x39\xb0\x00\x11\xb0\x0d\x39\x30\x31\x13\
-\x35\x33\x11\x33\x11\x21\x15\x21\x11\x14\x33\x32\x37\x17\x06\x23\
-\x22\x19\x01\x13\x33\x15\x0e\x01\x07\x23\x37\x23\x25\xb0\x8f\x01\
-\x21\xfe\xdf\x6f\x56\x5e\x21\x91\x9e\xa8\x5a\x77\x06\x32\x04\x3b\
-\x25\x25\x03\x17\x78\x01\x02\xfe\xfe\x78\xfe\x08\xb2\x43\x79\x4e\
-\x01\x07\x02\x27\xfc\x6c\x65\x2d\x89\x10\xb2\x00\x01\x00\xc1\x04\
-\x12\x03\x3d\x05\x33\x00\x06\x00\x2b\x00\xb0\x00\x2f\xb0\x03\x33\
-\xb4\x01\x04\x00\x0f\x04\x2b\x01\xb0\x07\x2f\xb0\x00\xd6\xb4\x03\
-\x0e\x00\x07\x04\x2b\xb1\x08\x01\x2b\x00\xb1\x01\x00\x11\x12\xb0\
-\x05\x39\x30\x31\x13\x01\x33\x01\x23\x27\x07\xc1\x01\x00\x7c\x01\
-\x00\x7c\xc3\xc1\x04\x12\x01\x21\xfe\xdf\xcb\xcb\x00\x00\x00\x00\
-\x01\x00\xb4\x04\x5c\x03\x4a\x05\x1d\x00\x0e\x00\x28\x00\xb0\x0a\
-\x2f\xb1\x00\x04\xe9\xb0\x03\x32\x01\xb0\x0f\x2f\xb0\x00\xd6\xb4\
-\x05\x0e\x00\x07\x04\x2b\xb1\x10\x01\x2b\x00\xb1\x00\x0a\x11\x12\
-\xb0\x02\x39\x30\x31\x13\x33\x17\x37\x33\x17\x06\x07\x06\x2b\x01\
-\x22\x26\x27\x26\xb4\x7f\xcd\xcb\x47\x38\xfc\x0f\x0a\x10\x4a\x17\
-\x33\x6c\x44\x05\x1d\x8c\x8c\x02\xb4\x07\x04\x1f\x50\x31\x00\x00\
-\x01\x00\xa4\x03\xfc\x03\x5a\x05\x1d\x00\x0f\x00\x43\x00\xb0\x0e\
-\x2f\xb1\x06\x09\xe9\xb2\x06\x0e\x0a\x2b\xb3\x40\x06\x0b\x09\x2b\
-\xb0\x00\x32\x01\xb0\x10\x2f\xb0\x00\xd6\xb4\x01\x16\x00\x32\x04\
-\x2b\xb0\x01\x10\xb1\x0a\x01\x2b\xb4\x0b\x0f\x00\x20\x04\x2b\xb1\
-\x11\x01\x2b\xb1\x0a\x01\x11\x12\xb1\x0d\x0e\x39\x39\x00\x30\x31\
-\x13\x33\x1e\x03\x32\x3e\x02\x37\x33\x0e\x01\x20\x26\xa4\x7d\x04\
-\x35\x4e\x3d\x36\x3b\x4c\x35\x04\x7f\x04\xd1\xfe\xf2\xcf\x05\x1d\
-\x2f\x42\x1d\x0a\x0a\x1d\x42\x2f\x85\x9c\x9c\x00\x01\x00\xde\x04\
-\xb8\x01\x96\x05\x6f\x00\x03\x00\x22\x00\xb0\x00\x2f\xb1\x01\x04\
-\xe9\xb1\x01\x04\xe9\x01\xb0\x04\x2f\xb0\x00\xd6\xb1\x03\x0e\xe9\
-\xb1\x03\x0e\xe9\xb1\x05\x01\x2b\x00\x30\x31\x13\x35\x33\x15\xde\
-\xb8\x04\xb8\xb7\xb7\x00\x00\x00\x02\x01\xc5\x03\xcf\x03\x8b\x05\
-\x1d\x00\x0b\x00\x16\x00\x46\x00\xb0\x09\x2f\xb4\x0f\x0c\x00\x17\
-\x04\x2b\xb0\x14\x2f\xb4\x03\x0c\x00\x17\x04\x2b\x01\xb0\x17\x2f\
-\xb0\x00\xd6\xb1\x0c\x16\xe9\xb0\x0c\x10\xb1\x12\x01\x2b\xb1\x06\
-\x16\xe9\xb1\x18\x01\x2b\xb1\x12\x0c\x11\x12\xb1\x09\x03\x39\x39\
-\x00\xb1\x14\x0f\x11\x12\xb1\x00\x06\x39\x39\x30\x31\x01\x34\x36\
-\x33\x32\x16\x15\x14\x06\x23\x22\x26\x37\x14\x16\x33\x32\x36\x34\
-\x26\x23\x22\x06\x01\xc5\x7d\x66\x68\x7b\x7d\x66\x68\x7b\x72\x33\
-\x3e\x3b\x36\x34\x3d\x33\x3e\x04\x77\x3f\x67\x6b\x3d\x3f\x67\x6b\
-\x3b\x25\x3e\x40\x4a\x3d\x35\x00\x01\xff\xc5\xfe\x4a\x01\xa6\x00\
-\x62\x00\x14\x00\x1a\x00\xb0\x12\x2f\xb1\x0d\x0b\xe9\x01\xb0\x15\
-\x2f\xb0\x00\xd6\xb1\x09\x13\xe9\xb1\x16\x01\x2b\x00\x30\x31\x03\
-\x34\x3e\x01\x37\x17\x0e\x02\x15\x14\x17\x16\x33\x32\x37\x17\x06\
-\x23\x22\x26\x3b\x60\xdb\x1d\x37\x14\x8e\x45\x04\x17\x28\x4a\x43\
-\x69\x6a\xa4\x52\x81\xfe\xf4\x42\x74\x9e\x1a\x62\x12\x69\x4c\x25\
-\x06\x10\x1d\x65\x48\xb4\x62\x00\x01\x00\xaa\x04\x3b\x03\x54\x05\
-\x1d\x00\x12\x00\x45\x00\xb0\x10\x2f\xb1\x03\x03\xe9\xb0\x09\x32\
-\xb3\x06\x03\x10\x08\x2b\xb1\x0d\x03\xe9\xb0\x00\x32\x01\xb0\x13\
-\x2f\xb0\x00\xd6\xb4\x12\x16\x00\x32\x04\x2b\xb0\x12\x10\xb1\x09\
-\x01\x2b\xb4\x0a\x16\x00\x32\x04\x2b\xb1\x14\x01\x2b\xb1\x09\x12\
-\x11\x12\xb1\x03\x0d\x39\x39\x00\x30\x31\x13\x3e\x01\x33\x32\x16\
-\x33\x32\x36\x37\x33\x0e\x01\x23\x22\x26\x23\x22\x07\xaa\x02\x77\
-\x50\x37\xae\x2b\x27\x2b\x02\x7d\x02\x77\x50\x37\xae\x2b\x4c\x08\
-\x04\x3b\x64\x7e\x65\x3a\x2b\x62\x80\x63\x63\x00\x02\x00\xdb\x04\
-\x14\x03\xe1\x05\x1f\x00\x03\x00\x07\x00\x21\x00\xb0\x00\x2f\xb0\
-\x04\x33\xb4\x01\x04\x00\x10\x04\x2b\x01\xb0\x08\x2f\xb1\x09\x01\
-\x2b\x00\xb1\x01\x00\x11\x12\xb0\x05\x39\x30\x31\x13\x01\x33\x01\
-\x33\x01\x33\x01\xdb\x01\x11\x9f\xfe\xcf\xd7\x01\x11\x9f\xfe\xcf\
-\x04\x14\x01\x0b\xfe\xf5\x01\x0b\xfe\xf5\x00\x00\x01\x00\x1b\x03\
-\xf6\x01\x77\x05\x8d\x00\x03\x00\x22\x00\xb2\x01\x02\x00\x2b\xb4\
-\x00\x04\x00\x0b\x04\x2b\x01\xb0\x04\x2f\xb0\x00\xd6\xb4\x02\x0e\
-\x00\x0c\x04\x2b\xb1\x05\x01\x2b\x00\x30\x31\x1b\x01\x33\x03\x1b\
-\xba\xa2\xdf\x03\xf6\x01\x97\xfe\x69\x00\x00\x00\x01\x00\x31\xfe\
-\x66\x01\x8d\x00\x00\x00\x03\x00\x22\x00\xb2\x01\x00\x00\x2b\xb4\
-\x00\x04\x00\x0a\x04\x2b\x01\xb0\x04\x2f\xb0\x00\xd6\xb4\x02\x0e\
-\x00\x0c\x04\x2b\xb1\x05\x01\x2b\x00\x30\x31\x1b\x01\x33\x03\x31\
-\xdd\x7f\xbc\xfe\x66\x01\x9a\xfe\x66\x00\x00\x00\x01\x00\x21\xfe\
-\x19\x00\xc1\xff\x77\x00\x05\x00\x28\x00\xb0\x04\x2f\xb4\x00\x04\
-\x00\x0c\x04\x2b\xb4\x00\x04\x00\x0c\x04\x2b\x01\xb0\x06\x2f\xb0\
-\x05\xd6\xb1\x02\x0d\xe9\xb1\x02\x0d\xe9\xb1\x07\x01\x2b\x00\x30\
-\x31\x17\x33\x15\x14\x22\x35\x21\xa0\xa0\x89\xfc\x62\x60\x00\x00\
-\x02\x00\xb6\xff\x00\x01\x77\x03\x8d\x00\x0c\x00\x17\x00\x40\x00\
-\xb0\x16\x2f\xb1\x10\x04\xe9\x01\xb0\x18\x2f\xb0\x02\xd6\xb4\x0a\
-\x16\x00\x32\x04\x2b\xb0\x13\x32\xb0\x0a\x10\xb1\x05\x15\xe9\xb0\
-\x05\x2f\xb0\x0d\x33\xb1\x19\x01\x2b\xb1\x02\x05\x11\x12\xb0\x07\
-\x39\xb0\x0a\x11\xb3\x08\x0c\x10\x16\x24\x17\x39\x00\x30\x31\x17\
-\x36\x3f\x01\x26\x35\x34\x36\x32\x16\x15\x14\x07\x02\x34\x36\x33\
-\x32\x16\x15\x14\x06\x23\x22\xb6\x42\x02\x02\x35\x2d\x49\x3a\x69\
-\x47\x35\x21\x25\x2f\x34\x20\x25\xa6\x4c\x5e\x02\x21\x2f\x23\x31\
-\x4a\x5c\x96\x6e\x04\x17\x45\x31\x33\x21\x23\x33\x00\x00\x00\x00\
-\x01\xff\xf0\x03\xf6\x01\x4c\x05\x8d\x00\x03\x00\x22\x00\xb2\x01\
-\x02\x00\x2b\xb4\x00\x04\x00\x0b\x04\x2b\x01\xb0\x04\x2f\xb0\x00\
-\xd6\xb4\x02\x0e\x00\x0c\x04\x2b\xb1\x05\x01\x2b\x00\x30\x31\x03\
-\x13\x33\x03\x10\xba\xa2\xdf\x03\xf6\x01\x97\xfe\x69\x00\x00\x00\
-\x03\x00\x19\x03\xf6\x02\x1f\x05\x8d\x00\x09\x00\x0d\x00\x17\x00\
-\x48\x00\xb2\x0b\x02\x00\x2b\xb0\x08\x2f\xb0\x16\x33\xb1\x03\x03\
-\xe9\xb0\x10\x32\x01\xb0\x18\x2f\xb0\x01\xd6\xb4\x05\x16\x00\x32\
-\x04\x2b\xb0\x05\x10\xb1\x0f\x01\x2b\xb4\x13\x0f\x00\x20\x04\x2b\
-\xb1\x19\x01\x2b\xb1\x0f\x05\x11\x12\xb2\x0a\x0b\x0d\x39\x39\x39\
-\xb0\x13\x11\xb0\x0c\x39\x00\x30\x31\x12\x34\x36\x32\x16\x15\x14\
-\x06\x23\x22\x17\x13\x33\x03\x36\x34\x36\x32\x16\x15\x14\x06\x23\
-\x22\x19\x22\x36\x25\x21\x1d\x1b\x5b\xba\xa2\xe0\x8c\x25\x35\x25\
-\x23\x1d\x1b\x04\x35\x31\x27\x25\x18\x1b\x27\x18\x01\x97\xfe\x69\
-\x3f\x31\x27\x25\x18\x1b\x27\x00\x03\xff\xf0\x00\x00\x05\x19\x05\
-\x8d\x00\x03\x00\x0b\x00\x10\x00\x31\x00\xb2\x04\x00\x00\x2b\xb0\
-\x07\x33\xb2\x01\x02\x00\x2b\xb0\x05\x33\xb4\x0a\x0c\x04\x01\x0d\
-\x2b\xb1\x0a\x05\xe9\x01\xb0\x11\x2f\xb1\x12\x01\x2b\x00\xb1\x01\
-\x0c\x11\x12\xb1\x00\x0f\x39\x39\x30\x31\x03\x13\x33\x0b\x01\x01\
-\x33\x01\x23\x03\x21\x03\x13\x21\x02\x27\x06\x10\xba\xa2\xdf\x36\
-\x02\x17\xb6\x02\x15\xbd\x9e\xfd\xaf\x9c\xc7\x01\xfb\xf2\x0b\x1b\
-\x03\xf6\x01\x97\xfe\x69\xfc\x0a\x05\x8d\xfa\x73\x01\xa2\xfe\x5e\
-\x02\x14\x02\x9e\x4c\x7d\x00\x00\x01\x00\xc5\x02\xe3\x01\x6f\x03\
-\x8d\x00\x0a\x00\x22\x00\xb0\x09\x2f\xb1\x03\x04\xe9\xb1\x03\x04\
-\xe9\x01\xb0\x0b\x2f\xb0\x01\xd6\xb1\x06\x14\xe9\xb1\x06\x14\xe9\
-\xb1\x0c\x01\x2b\x00\x30\x31\x12\x34\x36\x33\x32\x16\x15\x14\x06\
-\x23\x22\xc5\x35\x21\x25\x2f\x34\x20\x25\x03\x17\x45\x31\x33\x21\
-\x23\x33\x00\x00\x02\xff\xf0\x00\x00\x05\xc7\x05\x8d\x00\x03\x00\
-\x16\x00\x57\x00\xb2\x04\x00\x00\x2b\xb1\x12\x0b\xe9\xb2\x05\x02\
-\x00\x2b\xb0\x01\x33\xb1\x0a\x08\xe9\xb4\x0c\x0f\x04\x01\x0d\x2b\
-\xb1\x0c\x03\xe9\x01\xb0\x17\x2f\xb0\x04\xd6\xb1\x10\x0e\xe9\xb0\
-\x0b\x32\xb2\x10\x04\x0a\x2b\xb3\x40\x10\x16\x09\x2b\xb3\x40\x10\
-\x06\x09\x2b\xb3\x40\x10\x0e\x09\x2b\xb1\x18\x01\x2b\x00\xb1\x0a\
-\x0c\x11\x12\xb1\x03\x00\x39\x39\x30\x31\x03\x13\x33\x03\x01\x11\
-\x21\x15\x23\x27\x21\x27\x11\x21\x15\x21\x11\x33\x37\x21\x37\x33\
-\x15\x10\xba\xa2\xdf\x01\xaa\x03\x93\x75\x33\xfe\x15\x48\x02\xa4\
-\xfd\x5c\xae\x31\x01\x8d\x2d\x5f\x03\xf6\x01\x97\xfe\x69\xfc\x0a\
-\x05\x87\x87\x02\x02\xfe\x1b\x7d\xfd\xed\x02\x02\x93\x00\x00\x00\
-\x02\xff\xf0\x00\x00\x06\x3f\x05\x8d\x00\x03\x00\x0f\x00\x49\x00\
-\xb2\x04\x00\x00\x2b\xb0\x0b\x33\xb2\x01\x02\x00\x2b\xb1\x05\x09\
-\x33\x33\xb4\x07\x0e\x04\x01\x0d\x2b\xb1\x07\x03\xe9\x01\xb0\x10\
-\x2f\xb0\x04\xd6\xb1\x0f\x0e\xe9\xb0\x06\x32\xb0\x0f\x10\xb1\x0c\
-\x01\x2b\xb0\x08\x32\xb1\x0b\x0e\xe9\xb1\x11\x01\x2b\x00\xb1\x01\
-\x07\x11\x12\xb0\x00\x39\x30\x31\x03\x13\x33\x03\x01\x11\x33\x11\
-\x21\x11\x33\x11\x23\x11\x21\x11\x10\xba\xa2\xdf\x01\xaa\xb8\x02\
-\xb8\xb8\xb8\xfd\x48\x03\xf6\x01\x97\xfe\x69\xfc\x0a\x05\x8d\xfd\
-\x96\x02\x6a\xfa\x73\x02\xa4\xfd\x5c\x00\x00\x00\x02\xff\xf0\x00\
-\x00\x02\xcf\x05\x8d\x00\x03\x00\x07\x00\x28\x00\xb2\x04\x00\x00\
-\x2b\xb2\x01\x02\x00\x2b\xb0\x05\x33\x01\xb0\x08\x2f\xb0\x04\xd6\
-\xb1\x07\x0e\xe9\xb1\x09\x01\x2b\x00\xb1\x01\x04\x11\x12\xb0\x00\
-\x39\x30\x31\x03\x13\x33\x03\x01\x11\x33\x11\x10\xba\xa2\xdf\x01\
-\xaa\xb8\x03\xf6\x01\x97\xfe\x69\xfc\x0a\x05\x8d\xfa\x73\x00\x00\
-\x03\xff\xf0\xff\xd3\x06\x19\x05\xba\x00\x03\x00\x0f\x00\x1a\x00\
-\x52\x00\xb2\x0d\x00\x00\x2b\xb1\x13\x08\xe9\xb2\x01\x02\x00\x2b\
-\xb2\x07\x02\x00\x2b\xb1\x19\x08\xe9\x01\xb0\x1b\x2f\xb0\x04\xd6\
-\xb1\x11\x0e\xe9\xb0\x11\x10\xb1\x16\x01\x2b\xb1\x0a\x0e\xe9\xb1\
-\x1c\x01\x2b\xb1\x11\x04\x11\x12\xb0\x02\x39\xb0\x16\x11\xb1\x07\
-\x0d\x39\x39\x00\xb1\x19\x13\x11\x12\xb3\x03\x04\x0a\x00\x24\x17\
-\x39\x30\x31\x03\x13\x33\x03\x13\x10\x00\x21\x20\x00\x11\x10\x00\
-\x21\x20\x00\x12\x10\x12\x33\x32\x00\x11\x10\x00\x23\x22\x10\xba\
-\xa2\xdf\xae\x01\x7b\x01\x06\x01\x02\x01\x7b\xfe\x81\xff\x00\xfe\
-\xfe\xfe\x83\xb8\xfe\xc9\xc3\x01\x05\xfe\xf2\xba\xb8\x03\xf6\x01\
-\x97\xfe\x69\xfe\xcd\x01\x3d\x01\xba\xfe\x46\xfe\xc3\xfe\xbe\xfe\
-\x52\x01\xb1\x02\x68\xfd\xe7\xfe\x85\x01\x77\x01\x10\x01\x0c\x01\
-\x4c\x00\x00\x00\x02\xff\xf0\x00\x00\x07\x1b\x05\xba\x00\x03\x00\
-\x2f\x00\xd3\x00\xb2\x24\x00\x00\x2b\xb2\x01\x02\x00\x2b\xb2\x07\
-\x02\x00\x2b\xb0\x14\x33\xb1\x2c\x09\xe9\xb0\x1b\x32\xb2\x2c\x07\
-\x0a\x2b\xb3\x40\x2c\x17\x09\x2b\xb0\x04\x32\x01\xb0\x30\x2f\xb0\
-\x04\xd6\xb1\x2f\x0d\xe9\xb0\x2f\x10\xb1\x24\x01\x2b\xb0\x27\x32\
-\xb1\x23\x0e\xe9\xb0\x23\x10\xb1\x18\x01\x2b\xb1\x17\x0d\xe9\xb1\
-\x31\x01\x2b\xb0\x36\x1a\xba\xc1\x6e\xf2\x8b\x00\x15\x2b\x0a\x04\
-\xb0\x27\x2e\x0e\xb0\x29\xc0\xb1\x0d\x1b\xf9\xb0\x0b\xc0\xb0\x0b\
-\x10\xb3\x0c\x0b\x0d\x13\x2b\xb0\x29\x10\xb3\x28\x29\x27\x13\x2b\
-\xb2\x0c\x0b\x0d\x20\x8a\x20\x8a\x23\x06\x0e\x11\x12\x39\xb2\x28\
-\x29\x27\x11\x12\x39\x00\xb5\x0d\x0b\x0c\x27\x28\x29\x2e\x2e\x2e\
-\x2e\x2e\x2e\x01\xb4\x0d\x0b\x0c\x28\x29\x2e\x2e\x2e\x2e\x2e\xb0\
-\x40\x1a\x01\xb1\x24\x2f\x11\x12\xb0\x07\x39\xb0\x23\x11\xb0\x0f\
-\x39\xb0\x18\x12\xb0\x14\x39\x00\xb1\x2c\x24\x11\x12\xb2\x03\x00\
-\x0f\x39\x39\x39\x30\x31\x03\x13\x33\x03\x25\x3e\x01\x33\x32\x1e\
-\x03\x17\x16\x15\x3e\x03\x33\x32\x16\x17\x23\x2e\x01\x23\x22\x0e\
-\x04\x15\x11\x23\x11\x34\x2e\x04\x23\x22\x06\x07\x10\xba\xa2\xdf\
-\x01\x5a\x02\xbe\x85\x4e\x7d\x46\x35\x14\x0b\x02\x0a\x2b\x4e\x87\
-\x58\x85\xbf\x02\xa0\x04\x65\x3f\x3b\x5d\x37\x23\x10\x04\xb6\x05\
-\x10\x23\x37\x5c\x3c\x46\x60\x04\x03\xf6\x01\x97\xfe\x69\x7b\x8f\
-\xba\x45\x5e\x88\x5e\x33\x0a\x04\x52\x93\x8f\x56\xb8\x91\x5e\x62\
-\x35\x66\x6b\x93\x67\x43\xfd\x12\x02\xec\x44\x66\x95\x6b\x66\x35\
-\x68\x58\x00\x00\x02\xff\xf0\x00\x00\x06\x14\x05\xba\x00\x03\x00\
-\x2b\x00\x8c\x00\xb2\x04\x00\x00\x2b\xb0\x1b\x33\xb1\x07\x0a\xe9\
-\xb0\x17\x32\xb2\x01\x02\x00\x2b\xb2\x10\x02\x00\x2b\xb1\x24\x03\
-\xe9\x01\xb0\x2c\x2f\xb0\x0d\xd6\xb1\x26\x0e\xe9\xb2\x26\x0d\x0a\
-\x2b\xb3\x40\x26\x2b\x09\x2b\xb2\x0d\x26\x0a\x2b\xb3\x40\x0d\x04\
-\x09\x2b\xb0\x26\x10\xb1\x21\x01\x2b\xb1\x12\x0e\xe9\xb2\x12\x21\
-\x0a\x2b\xb3\x40\x12\x1b\x09\x2b\xb2\x21\x12\x0a\x2b\xb3\x40\x21\
-\x1c\x09\x2b\xb1\x2d\x01\x2b\xb1\x26\x0d\x11\x12\xb1\x0b\x02\x39\
-\x39\xb0\x21\x11\xb4\x0f\x10\x15\x17\x08\x24\x17\x39\x00\xb1\x24\
-\x07\x11\x12\xb5\x03\x00\x0d\x12\x1f\x29\x24\x17\x39\x30\x31\x03\
-\x13\x33\x03\x13\x35\x33\x17\x33\x2e\x03\x35\x34\x00\x20\x00\x15\
-\x14\x0e\x02\x07\x33\x37\x33\x15\x21\x36\x12\x36\x12\x35\x34\x24\
-\x20\x04\x15\x14\x1e\x01\x12\x17\x10\xba\xa2\xdf\x97\x56\x2d\xe1\
-\x1b\x76\x6a\x52\x01\x68\x02\x10\x01\x6b\x52\x6a\x77\x1b\xe1\x2b\
-\x58\xfe\x0b\x02\x5c\x6f\x5a\xfe\xfe\xfe\x93\xfe\xfa\x5c\x6f\x5c\
-\x02\x03\xf6\x01\x97\xfe\x69\xfc\x0a\x91\x02\x5c\xe2\xa6\xdb\x64\
-\xd5\x01\x33\xfe\xcd\xd5\x64\xdb\xa6\xe1\x5d\x02\x91\x75\x01\x06\
-\xc7\x01\x00\x6e\xb0\xdd\xdf\xae\x6f\xff\xc7\xfe\xf8\x73\x00\x00\
-\x04\xff\xb0\xff\xe9\x02\x00\x05\x8d\x00\x07\x00\x0b\x00\x19\x00\
-\x24\x00\x89\x00\xb2\x17\x00\x00\x2b\xb2\x09\x02\x00\x2b\xb2\x0d\
-\x01\x00\x2b\xb4\x22\x1d\x0d\x09\x0d\x2b\xb0\x02\x33\xb1\x22\x03\
-\xe9\xb0\x06\x32\x01\xb0\x25\x2f\xb0\x01\xd6\xb4\x05\x0f\x00\x20\
-\x04\x2b\xb0\x05\x10\xb1\x0c\x01\x2b\xb1\x0f\x0d\xe9\xb0\x0f\x10\
-\xb1\x13\x01\x2b\xb1\x14\x16\xe9\xb3\x1f\x14\x13\x08\x2b\xb4\x1a\
-\x16\x00\x32\x04\x2b\xb0\x1a\x2f\xb4\x1f\x16\x00\x32\x04\x2b\xb1\
-\x26\x01\x2b\xb1\x0c\x05\x11\x12\xb0\x08\x39\xb0\x0f\x11\xb1\x09\
-\x0b\x39\x39\xb0\x1a\x12\xb0\x17\x39\xb0\x1f\x11\xb0\x0a\x39\x00\
-\xb1\x22\x0d\x11\x12\xb1\x08\x0b\x39\x39\x30\x31\x02\x34\x36\x32\
-\x16\x14\x06\x22\x17\x13\x33\x0b\x01\x11\x33\x11\x14\x17\x36\x37\
-\x33\x0e\x01\x23\x22\x26\x13\x34\x36\x32\x16\x15\x14\x06\x23\x22\
-\x26\x50\x29\x31\x25\x25\x35\x5a\xba\xa2\xdf\x56\xa0\x50\x42\x07\
-\x71\x02\x81\x52\x54\x81\xe3\x25\x35\x23\x20\x1d\x1b\x25\x04\x33\
-\x35\x25\x27\x31\x27\x18\x01\x97\xfe\x69\xfc\xf8\x02\xa1\xfd\x61\
-\x7d\x09\x04\x73\x73\x85\x8a\x03\xdb\x1d\x22\x25\x18\x1b\x27\x27\
-\x00\x00\x00\x00\x02\x00\x37\x00\x00\x05\x19\x05\x8d\x00\x07\x00\
-\x0c\x00\x2c\x00\xb2\x00\x00\x00\x2b\xb0\x03\x33\xb2\x01\x02\x00\
-\x2b\xb4\x06\x08\x00\x01\x0d\x2b\xb1\x06\x05\xe9\x01\xb0\x0d\x2f\
-\xb1\x0e\x01\x2b\x00\xb1\x01\x08\x11\x12\xb0\x0b\x39\x30\x31\x33\
-\x01\x33\x01\x23\x03\x21\x03\x13\x21\x02\x27\x06\x37\x02\x17\xb6\
-\x02\x15\xbd\x9e\xfd\xaf\x9c\xc7\x01\xfb\xf2\x0b\x1b\x05\x8d\xfa\
-\x73\x01\xa2\xfe\x5e\x02\x14\x02\x9e\x4c\x7d\x00\x03\x00\xc5\x00\
-\x00\x04\xe1\x05\x8d\x00\x12\x00\x1e\x00\x28\x00\x63\x00\xb2\x00\
-\x00\x00\x2b\xb1\x13\x05\xe9\xb2\x01\x02\x00\x2b\xb1\x27\x05\xe9\
-\xb4\x1f\x1d\x00\x01\x0d\x2b\xb1\x1f\x03\xe9\x01\xb0\x29\x2f\xb0\
-\x00\xd6\xb1\x13\x14\xe9\xb0\x1f\x32\xb0\x13\x10\xb1\x17\x01\x2b\
-\xb1\x0d\x13\xe9\xb0\x23\x20\xd6\x11\xb1\x07\x0d\xe9\xb1\x2a\x01\
-\x2b\xb1\x23\x13\x11\x12\xb0\x0a\x39\x00\xb1\x1d\x13\x11\x12\xb0\
-\x0d\x39\xb0\x1f\x11\xb0\x0a\x39\xb0\x27\x12\xb0\x07\x39\x30\x31\
-\x33\x11\x21\x32\x1e\x02\x15\x14\x06\x07\x1e\x01\x15\x14\x04\x07\
-\x06\x23\x25\x21\x32\x36\x35\x34\x26\x27\x26\x2b\x01\x07\x35\x33\
-\x32\x36\x35\x34\x26\x2b\x01\x07\xc5\x01\xc6\x8d\xdc\x79\x3b\xb0\
-\xa8\xa4\xed\xfe\xfc\xb4\x23\x45\xfe\xb0\x01\x22\xd1\xd5\xd5\x95\
-\x12\x57\xf3\x02\xf5\xc1\xdf\xd3\xd7\xe9\x02\x05\x8d\x45\x6f\x77\
-\x39\x66\xb1\x2b\x1b\xc2\x89\x96\xd4\x13\x04\x73\xac\x64\x71\x9f\
-\x0f\x02\x4c\xcb\xa0\x64\x5a\x9a\x48\x00\x00\x00\x01\x00\xc1\x00\
-\x00\x03\xfe\x05\x87\x00\x08\x00\x2c\x00\xb2\x00\x00\x00\x2b\xb2\
-\x01\x02\x00\x2b\xb1\x06\x08\xe9\x01\xb0\x09\x2f\xb0\x00\xd6\xb1\
-\x08\x0e\xe9\xb2\x08\x00\x0a\x2b\xb3\x40\x08\x02\x09\x2b\xb1\x0a\
-\x01\x2b\x00\x30\x31\x33\x11\x21\x15\x23\x27\x21\x27\x11\xc1\x03\
-\x3d\x66\x32\xfe\x48\x35\x05\x87\x87\x02\x02\xfa\xfc\x00\x00\x00\
-\x02\x00\x54\x00\x00\x06\x52\x05\x8d\x00\x03\x00\x0b\x00\x22\x00\
-\xb2\x00\x00\x00\x2b\xb1\x04\x04\xe9\xb2\x01\x02\x00\x2b\x01\xb0\
-\x0c\x2f\xb1\x0d\x01\x2b\x00\xb1\x01\x04\x11\x12\xb0\x08\x39\x30\
-\x31\x33\x01\x33\x01\x25\x21\x01\x03\x27\x23\x07\x03\x54\x02\xa2\
-\xba\x02\xa2\xfa\xf2\x03\xf1\xfe\x9e\x7f\x17\x02\x16\x7f\x05\x8d\
-\xfa\x73\xac\x02\xf6\x01\x1c\x40\x44\xfe\xe4\x00\x01\x00\xc1\x00\
-\x00\x04\x71\x05\x87\x00\x12\x00\x4a\x00\xb2\x00\x00\x00\x2b\xb1\
-\x0e\x0b\xe9\xb2\x01\x02\x00\x2b\xb1\x06\x08\xe9\xb4\x08\x0b\x00\
-\x01\x0d\x2b\xb1\x08\x03\xe9\x01\xb0\x13\x2f\xb0\x00\xd6\xb1\x0c\
-\x0e\xe9\xb0\x07\x32\xb2\x0c\x00\x0a\x2b\xb3\x40\x0c\x12\x09\x2b\
-\xb3\x40\x0c\x02\x09\x2b\xb3\x40\x0c\x0a\x09\x2b\xb1\x14\x01\x2b\
-\x00\x30\x31\x33\x11\x21\x15\x23\x27\x21\x27\x11\x21\x15\x21\x11\
-\x33\x37\x21\x37\x33\x15\xc1\x03\x93\x75\x33\xfe\x15\x48\x02\xa4\
-\xfd\x5c\xae\x31\x01\x8d\x2d\x5f\x05\x87\x87\x02\x02\xfe\x1b\x7d\
-\xfd\xed\x02\x02\x93\x00\x00\x00\x01\x00\x71\x00\x00\x04\x7b\x05\
-\x8d\x00\x19\x00\x26\x00\xb2\x00\x00\x00\x2b\xb1\x15\x08\xe9\xb2\
-\x08\x02\x00\x2b\xb1\x07\x03\xe9\x01\xb0\x1a\x2f\xb1\x1b\x01\x2b\
-\x00\xb1\x08\x07\x11\x12\xb0\x13\x39\x30\x31\x33\x35\x34\x36\x37\
-\x01\x05\x21\x35\x21\x15\x1c\x01\x06\x14\x0e\x04\x07\x01\x21\x37\
-\x21\x15\x71\x06\x14\x02\xfa\xfe\xb0\xfe\x58\x03\xe4\x02\x02\x03\
-\x06\x02\x0a\x02\xfd\x06\x01\xaa\x2f\x01\x46\x33\x1d\x14\x1d\x04\
-\x8d\x02\x81\x31\x06\x0a\x0a\x05\x08\x04\x0a\x04\x0f\x04\xfb\x75\
-\x02\x87\x00\x00\x01\x00\xc1\x00\x00\x04\xe9\x05\x8d\x00\x0b\x00\
-\x3f\x00\xb2\x00\x00\x00\x2b\xb0\x07\x33\xb2\x01\x02\x00\x2b\xb0\
-\x05\x33\xb4\x03\x0a\x00\x01\x0d\x2b\xb1\x03\x03\xe9\x01\xb0\x0c\
-\x2f\xb0\x00\xd6\xb1\x0b\x0e\xe9\xb0\x02\x32\xb0\x0b\x10\xb1\x08\
-\x01\x2b\xb0\x04\x32\xb1\x07\x0e\xe9\xb1\x0d\x01\x2b\x00\x30\x31\
-\x33\x11\x33\x11\x21\x11\x33\x11\x23\x11\x21\x11\xc1\xb8\x02\xb8\
-\xb8\xb8\xfd\x48\x05\x8d\xfd\x96\x02\x6a\xfa\x73\x02\xa4\xfd\x5c\
-\x00\x00\x00\x00\x03\x00\x71\xff\xd3\x05\xc5\x05\xba\x00\x0a\x00\
-\x15\x00\x19\x00\x56\x00\xb2\x09\x00\x00\x2b\xb1\x0e\x03\xe9\xb2\
-\x03\x02\x00\x2b\xb1\x14\x03\xe9\xb4\x17\x16\x09\x03\x0d\x2b\xb1\
-\x17\x04\xe9\x01\xb0\x1a\x2f\xb0\x00\xd6\xb1\x0b\x14\xe9\xb0\x0b\
-\x10\xb1\x11\x01\x2b\xb1\x06\x14\xe9\xb1\x1b\x01\x2b\xb1\x11\x0b\
-\x11\x12\xb4\x08\x09\x03\x16\x18\x24\x17\x39\x00\xb1\x17\x16\x11\
-\x12\xb3\x06\x0b\x11\x00\x24\x17\x39\x30\x31\x13\x10\x00\x21\x20\
-\x00\x11\x10\x00\x20\x00\x13\x10\x00\x33\x32\x00\x11\x10\x00\x20\
-\x00\x13\x35\x21\x15\x71\x01\x95\x01\x17\x01\x14\x01\x94\xfe\x6a\
-\xfd\xd7\xfe\x6b\xac\x01\x33\xcb\xcd\x01\x31\xfe\xce\xfe\x67\xfe\
-\xcf\x72\x03\x17\x02\xc3\x01\x3f\x01\xb8\xfe\x4a\xfe\xbf\xfe\xc1\
-\xfe\x4f\x01\xb3\x01\x3d\xfe\xe5\xfe\xac\x01\x58\x01\x17\x01\x1b\
-\x01\x5f\xfe\x9d\xfe\x99\xac\xac\x00\x00\x00\x00\x01\x00\xc1\x00\
-\x00\x01\x79\x05\x8d\x00\x03\x00\x21\x00\xb2\x00\x00\x00\x2b\xb2\
-\x01\x02\x00\x2b\x01\xb0\x04\x2f\xb0\x00\xd6\xb1\x03\x0e\xe9\xb1\
-\x03\x0e\xe9\xb1\x05\x01\x2b\x00\x30\x31\x33\x11\x33\x11\xc1\xb8\
-\x05\x8d\xfa\x73\x00\x00\x00\x00\x01\x00\xc3\x00\x00\x05\x35\x05\
-\x8d\x00\x0c\x00\x30\x00\xb2\x00\x00\x00\x2b\xb0\x08\x33\xb2\x01\
-\x02\x00\x2b\xb0\x04\x33\x01\xb0\x0d\x2f\xb0\x00\xd6\xb1\x0c\x15\
-\xe9\xb0\x02\x32\xb1\x0e\x01\x2b\x00\xb1\x01\x00\x11\x12\xb1\x03\
-\x0a\x39\x39\x30\x31\x33\x11\x33\x11\x01\x33\x01\x15\x01\x23\x09\
-\x01\x11\xc3\xb0\x02\xe7\xbf\xfd\xdb\x02\x41\xc0\xfe\x0e\xfe\xf0\
-\x05\x8d\xfd\x09\x02\xf7\xfd\xcf\x02\xfc\xa6\x02\xe7\xfe\xec\xfe\
-\x2d\x00\x00\x00\x01\x00\x37\x00\x00\x04\xa8\x05\x8d\x00\x0a\x00\
-\x21\x00\xb2\x00\x00\x00\x2b\xb0\x03\x33\xb2\x01\x02\x00\x2b\x01\
-\xb0\x0b\x2f\xb1\x0c\x01\x2b\x00\xb1\x01\x00\x11\x12\xb0\x07\x39\
-\x30\x31\x33\x01\x33\x01\x23\x01\x02\x27\x06\x03\x01\x37\x01\xe0\
-\xb2\x01\xdf\xc3\xfe\xfc\x77\x10\x06\x79\xfe\xf4\x05\x8d\xfa\x73\
-\x03\x14\x01\x81\x69\x3f\xfe\x70\xfc\xd1\x00\x00\x01\x00\xcd\x00\
-\x00\x06\x33\x05\x8d\x00\x16\x00\x42\x00\xb2\x00\x00\x00\x2b\xb0\
-\x0b\x33\xb2\x01\x02\x00\x2b\xb0\x09\x33\x01\xb0\x17\x2f\xb0\x00\
-\xd6\xb1\x16\x0d\xe9\xb0\x16\x10\xb1\x0c\x01\x2b\xb1\x0b\x0d\xe9\
-\xb1\x18\x01\x2b\xb1\x0c\x16\x11\x12\xb1\x02\x09\x39\x39\x00\xb1\
-\x01\x00\x11\x12\xb1\x05\x0e\x39\x39\x30\x31\x33\x11\x33\x01\x12\
-\x17\x33\x36\x13\x01\x33\x11\x23\x11\x27\x07\x03\x01\x23\x01\x02\
-\x27\x11\xcd\xe9\x01\x3c\x83\x0a\x02\x0a\x81\x01\x3c\xeb\xa0\x02\
-\x14\x7b\xfe\xc5\x94\xfe\xcd\x83\x10\x05\x8d\xfc\xcb\xfe\x9c\x38\
-\x48\x01\x52\x03\x37\xfa\x73\x04\xbc\x42\x4c\xfe\xb0\xfc\xcb\x03\
-\x1d\x01\x64\x50\xfb\x02\x00\x00\x01\x00\xc3\x00\x00\x04\xe3\x05\
-\x8d\x00\x0b\x00\x42\x00\xb2\x00\x00\x00\x2b\xb0\x07\x33\xb2\x01\
-\x02\x00\x2b\xb0\x05\x33\x01\xb0\x0c\x2f\xb0\x00\xd6\xb1\x0b\x0d\
-\xe9\xb0\x0b\x10\xb1\x04\x01\x2b\xb1\x07\x0d\xe9\xb1\x0d\x01\x2b\
-\xb1\x04\x0b\x11\x12\xb1\x02\x08\x39\x39\x00\xb1\x01\x00\x11\x12\
-\xb1\x04\x0a\x39\x39\x30\x31\x33\x11\x21\x01\x17\x11\x33\x11\x21\
-\x01\x27\x11\xc3\x01\x00\x02\x31\x50\x9f\xff\x00\xfd\xcf\x50\x05\
-\x8d\xfb\xa6\xa4\x04\xfe\xfa\x73\x04\x5a\xa4\xfb\x02\x00\x00\x00\
-\x03\x00\x54\x00\x00\x04\xfc\x05\x83\x00\x03\x00\x07\x00\x0b\x00\
-\x29\x00\xb2\x00\x00\x00\x2b\xb1\x01\x0b\xe9\xb2\x05\x02\x00\x2b\
-\xb1\x04\x0b\xe9\xb4\x09\x08\x00\x05\x0d\x2b\xb1\x09\x0b\xe9\x01\
-\xb0\x0c\x2f\xb1\x0d\x01\x2b\x00\x30\x31\x33\x35\x21\x15\x01\x35\
-\x21\x15\x01\x35\x21\x15\x54\x04\xa8\xfb\x62\x04\x94\xfb\xef\x03\
-\x8e\x9a\x9a\x04\xe9\x9a\x9a\xfd\xa8\x98\x98\x00\x02\x00\x71\xff\
-\xd3\x05\x6f\x05\xba\x00\x0b\x00\x16\x00\x44\x00\xb2\x09\x00\x00\
-\x2b\xb1\x0f\x08\xe9\xb2\x03\x02\x00\x2b\xb1\x15\x08\xe9\x01\xb0\
-\x17\x2f\xb0\x00\xd6\xb1\x0d\x0e\xe9\xb0\x0d\x10\xb1\x12\x01\x2b\
-\xb1\x06\x0e\xe9\xb1\x18\x01\x2b\xb1\x12\x0d\x11\x12\xb1\x03\x09\
-\x39\x39\x00\xb1\x15\x0f\x11\x12\xb1\x06\x00\x39\x39\x30\x31\x13\
-\x10\x00\x21\x20\x00\x11\x10\x00\x21\x20\x00\x12\x10\x12\x33\x32\
-\x00\x11\x10\x00\x23\x22\x71\x01\x7b\x01\x06\x01\x02\x01\x7b\xfe\
-\x81\xff\x00\xfe\xfe\xfe\x83\xb8\xfe\xc9\xc3\x01\x05\xfe\xf2\xba\
-\xb8\x02\xc3\x01\x3d\x01\xba\xfe\x46\xfe\xc3\xfe\xbe\xfe\x52\x01\
-\xb1\x02\x68\xfd\xe7\xfe\x85\x01\x77\x01\x10\x01\x0c\x01\x4c\x00\
-\x01\x00\xc1\x00\x00\x04\xe9\x05\x87\x00\x07\x00\x2f\x00\xb2\x00\
-\x00\x00\x2b\xb0\x03\x33\xb2\x01\x02\x00\x2b\xb1\x06\x03\xe9\x01\
-\xb0\x08\x2f\xb0\x00\xd6\xb1\x07\x0e\xe9\xb0\x07\x10\xb1\x04\x01\
-\x2b\xb1\x03\x0e\xe9\xb1\x09\x01\x2b\x00\x30\x31\x33\x11\x21\x11\
-\x23\x11\x21\x11\xc1\x04\x28\xb8\xfd\x48\x05\x87\xfa\x79\x05\x0a\
-\xfa\xf6\x00\x00\x02\x00\xc3\x00\x00\x04\xa8\x05\x8d\x00\x0f\x00\
-\x1c\x00\x4a\x00\xb2\x00\x00\x00\x2b\xb2\x01\x02\x00\x2b\xb1\x1c\
-\x05\xe9\xb4\x0e\x10\x00\x01\x0d\x2b\xb1\x0e\x06\xe9\x01\xb0\x1d\
-\x2f\xb0\x01\xd6\xb1\x10\x15\xe9\xb0\x0e\x32\xb0\x10\x10\xb1\x16\
-\x01\x2b\xb1\x07\x13\xe9\xb1\x1e\x01\x2b\xb1\x16\x10\x11\x12\xb0\
-\x0a\x39\x00\xb1\x1c\x10\x11\x12\xb0\x07\x39\x30\x31\x33\x11\x21\
-\x32\x17\x1e\x01\x15\x14\x00\x23\x22\x26\x2b\x01\x11\x03\x21\x32\
-\x3e\x02\x35\x34\x2e\x02\x23\x21\xc3\x01\xe3\xbc\x7f\x5e\x69\xfe\
-\xf8\xf2\x0a\x2d\x0d\xef\x06\x01\x10\x6a\xa0\x4e\x25\x21\x4b\xa0\
-\x71\xfe\xf0\x05\x8d\x50\x3b\xac\x64\xa0\xfe\xfc\x02\xfd\xb0\x02\
-\xc7\x39\x60\x61\x31\x2d\x5c\x62\x3e\x00\x00\x00\x01\x00\x71\x00\
-\x00\x05\x54\x05\x8d\x00\x10\x00\x2a\x00\xb2\x00\x00\x00\x2b\xb1\
-\x0c\x0a\xe9\xb2\x04\x02\x00\x2b\xb1\x09\x08\xe9\x01\xb0\x11\x2f\
-\xb1\x12\x01\x2b\x00\xb1\x09\x0c\x11\x12\xb2\x01\x03\x0b\x39\x39\
-\x39\x30\x31\x33\x01\x35\x01\x35\x21\x15\x23\x27\x21\x27\x09\x01\
-\x21\x37\x33\x15\x71\x01\xdb\xfe\x25\x04\xe3\xa6\x39\xfd\x4c\x67\
-\x01\xc7\xfe\x77\x02\xeb\x35\x9c\x02\xac\x02\x02\x5a\x85\x87\x02\
-\x02\xfd\xbb\xfd\xca\x02\x91\x00\x01\x00\x48\x00\x00\x05\x25\x05\
-\x83\x00\x09\x00\x3a\x00\xb2\x07\x00\x00\x2b\xb2\x01\x02\x00\x2b\
-\xb1\x00\x09\xe9\xb0\x03\x32\x01\xb0\x0a\x2f\xb0\x07\xd6\xb1\x06\
-\x0e\xe9\xb2\x06\x07\x0a\x2b\xb3\x40\x06\x02\x09\x2b\xb2\x07\x06\
-\x0a\x2b\xb3\x40\x07\x01\x09\x2b\xb1\x0b\x01\x2b\x00\x30\x31\x13\
-\x35\x21\x15\x21\x27\x11\x23\x11\x07\x48\x04\xdd\xfe\xdd\xf0\xb6\
-\xf2\x04\xfc\x87\x87\x02\xfb\x02\x04\xfe\x02\x00\x01\x00\x71\x00\
-\x00\x05\xc5\x05\xba\x00\x2b\x00\xca\x00\xb2\x20\x00\x00\x2b\xb2\
-\x03\x02\x00\x2b\xb0\x10\x33\xb1\x28\x09\xe9\xb0\x17\x32\xb2\x28\
-\x03\x0a\x2b\xb3\x40\x28\x13\x09\x2b\xb0\x00\x32\x01\xb0\x2c\x2f\
-\xb0\x00\xd6\xb1\x2b\x0d\xe9\xb0\x2b\x10\xb1\x20\x01\x2b\xb0\x23\
-\x32\xb1\x1f\x0e\xe9\xb0\x1f\x10\xb1\x14\x01\x2b\xb1\x13\x0d\xe9\
-\xb1\x2d\x01\x2b\xb0\x36\x1a\xba\xc1\x6e\xf2\x8b\x00\x15\x2b\x0a\
-\x04\xb0\x23\x2e\x0e\xb0\x25\xc0\xb1\x09\x1b\xf9\xb0\x07\xc0\xb0\
-\x07\x10\xb3\x08\x07\x09\x13\x2b\xb0\x25\x10\xb3\x24\x25\x23\x13\
-\x2b\xb2\x08\x07\x09\x20\x8a\x20\x8a\x23\x06\x0e\x11\x12\x39\xb2\
-\x24\x25\x23\x11\x12\x39\x00\xb5\x09\x07\x08\x23\x24\x25\x2e\x2e\
-\x2e\x2e\x2e\x2e\x01\xb4\x09\x07\x08\x24\x25\x2e\x2e\x2e\x2e\x2e\
-\xb0\x40\x1a\x01\xb1\x20\x2b\x11\x12\xb0\x03\x39\xb0\x1f\x11\xb0\
-\x0b\x39\xb0\x14\x12\xb0\x10\x39\x00\xb1\x28\x20\x11\x12\xb0\x0b\
-\x39\x30\x31\x13\x3e\x01\x33\x32\x1e\x03\x17\x16\x15\x3e\x03\x33\
-\x32\x16\x17\x23\x2e\x01\x23\x22\x0e\x04\x15\x11\x23\x11\x34\x2e\
-\x04\x23\x22\x06\x07\x71\x02\xbe\x85\x4e\x7d\x46\x35\x14\x0b\x02\
-\x0a\x2b\x4e\x87\x58\x85\xbf\x02\xa0\x04\x65\x3f\x3b\x5d\x37\x23\
-\x10\x04\xb6\x05\x10\x23\x37\x5c\x3c\x46\x60\x04\x04\x71\x8f\xba\
-\x45\x5e\x88\x5e\x33\x0a\x04\x52\x93\x8f\x56\xb8\x91\x5e\x62\x35\
-\x66\x6b\x93\x67\x43\xfd\x12\x02\xec\x44\x66\x95\x6b\x66\x35\x68\
-\x58\x00\x00\x00\x03\x00\x71\x00\x00\x05\x54\x05\x8d\x00\x13\x00\
-\x1a\x00\x26\x00\x6c\x00\xb2\x10\x00\x00\x2b\xb2\x04\x02\x00\x2b\
-\xb4\x11\x17\x10\x04\x0d\x2b\xb0\x1b\x33\xb1\x11\x03\xe9\xb0\x0e\
-\x32\xb4\x03\x18\x10\x04\x0d\x2b\xb0\x26\x33\xb1\x03\x03\xe9\xb0\
-\x06\x32\x01\xb0\x27\x2f\xb0\x00\xd6\xb1\x14\x15\xe9\xb0\x14\x10\
-\xb1\x10\x01\x2b\xb1\x03\x17\x32\x32\xb1\x0f\x14\xe9\xb1\x05\x1b\
-\x32\x32\xb0\x0f\x10\xb1\x21\x01\x2b\xb1\x0b\x15\xe9\xb1\x28\x01\
-\x2b\x00\xb1\x18\x17\x11\x12\xb3\x0b\x00\x20\x21\x24\x17\x39\x30\
-\x31\x13\x34\x00\x37\x35\x33\x15\x16\x17\x1e\x01\x15\x14\x00\x07\
-\x15\x23\x35\x26\x00\x37\x14\x16\x17\x11\x0e\x01\x01\x3e\x04\x34\
-\x2e\x03\x27\x71\x01\x37\xdf\xac\x79\x46\xa6\xbc\xfe\xdb\xfc\xac\
-\xd5\xfe\xbf\xb2\xc0\xa4\xa8\xbc\x02\x10\x5e\x8e\x49\x2e\x0c\x0a\
-\x2e\x49\x90\x5e\x02\xc7\xba\x01\x1b\x16\xdb\xd9\x12\x1b\x3f\xf6\
-\x8b\xb2\xfe\xe5\x21\xd9\xdb\x14\x01\x15\xc3\x8d\xc5\x1b\x02\xd9\
-\x19\xc8\xfe\x06\x10\x48\x50\x62\x44\x41\x44\x62\x4e\x4a\x10\x00\
-\x01\x00\x1d\x00\x00\x05\x37\x05\x8d\x00\x0d\x00\x26\x00\xb2\x00\
-\x00\x00\x2b\xb0\x0a\x33\xb2\x03\x02\x00\x2b\xb0\x06\x33\x01\xb0\
-\x0e\x2f\xb1\x0f\x01\x2b\x00\xb1\x03\x00\x11\x12\xb1\x05\x0c\x39\
-\x39\x30\x31\x33\x01\x35\x01\x33\x09\x01\x33\x01\x15\x01\x23\x09\
-\x01\x1d\x02\x25\xfd\xf7\xd7\x01\x8c\x01\x81\xc4\xfe\x13\x02\x43\
-\xd7\xfe\x3c\xfe\x45\x02\xec\x02\x02\x9f\xfd\xea\x02\x16\xfd\x61\
-\x02\xfd\x14\x02\x71\xfd\x8f\x00\x01\x00\x71\x00\x00\x05\xc5\x05\
-\x8d\x00\x38\x00\x91\x00\xb2\x2b\x00\x00\x2b\xb2\x0c\x02\x00\x2b\
-\xb4\x29\x0e\x2b\x0c\x0d\x2b\xb0\x0b\x33\xb1\x29\x03\xe9\xb0\x2c\
-\x32\xb4\x01\x00\x2b\x0c\x0d\x2b\xb0\x20\x33\xb1\x01\x03\xe9\xb0\
-\x1e\x32\x01\xb0\x39\x2f\xb0\x35\xd6\xb1\x07\x13\xe9\xb2\x35\x07\
-\x0a\x2b\xb3\x40\x35\x00\x09\x2b\xb0\x07\x10\xb1\x2b\x01\x2b\xb0\
-\x0b\x32\xb1\x2a\x14\xe9\xb0\x0d\x32\xb0\x2a\x10\xb1\x19\x01\x2b\
-\xb0\x16\x32\xb1\x25\x14\xe9\xb2\x25\x19\x0a\x2b\xb3\x40\x25\x20\
-\x09\x2b\xb1\x3a\x01\x2b\xb1\x07\x35\x11\x12\xb0\x06\x39\xb1\x19\
-\x2a\x11\x12\xb0\x17\x39\x00\xb1\x00\x0e\x11\x12\xb3\x07\x1a\x25\
-\x35\x24\x17\x39\x30\x31\x13\x35\x33\x32\x1e\x06\x17\x11\x33\x11\
-\x3e\x08\x34\x35\x3e\x03\x3b\x01\x15\x0e\x04\x07\x06\x02\x07\x15\
-\x23\x35\x23\x2e\x04\x27\x2e\x04\x71\x95\x23\x29\x33\x1d\x08\x0a\
-\x29\x7b\x69\xac\x2d\x4b\x38\x2b\x1c\x15\x0a\x06\x02\x02\x19\x35\
-\x31\x2f\x8a\x31\x3c\x19\x08\x04\x04\x19\xd4\xd5\xac\x03\x27\x4b\
-\x83\x61\x56\x0e\x02\x04\x08\x19\x3d\x04\x6a\x7f\x08\x33\x66\xc7\
-\xb8\xbf\x8f\x1d\x04\x2f\xfb\xcf\x0c\x2b\x30\x45\x35\x59\x33\x5c\
-\x25\x56\x08\x71\x87\x3b\x0e\x7f\x04\x35\x62\x5a\x87\x25\xc1\xfe\
-\xf2\x1f\xdb\xdb\x06\x13\x45\x65\xc0\x7d\x1d\x7f\x56\x62\x37\x00\
-\x01\x00\x5a\x00\x00\x05\x6a\x05\xba\x00\x27\x00\x83\x00\xb2\x00\
-\x00\x00\x2b\xb0\x17\x33\xb1\x03\x0a\xe9\xb0\x13\x32\xb2\x0c\x02\
-\x00\x2b\xb1\x20\x03\xe9\x01\xb0\x28\x2f\xb0\x09\xd6\xb1\x22\x0e\
-\xe9\xb2\x22\x09\x0a\x2b\xb3\x40\x22\x27\x09\x2b\xb2\x09\x22\x0a\
-\x2b\xb3\x40\x09\x00\x09\x2b\xb0\x22\x10\xb1\x1d\x01\x2b\xb1\x0e\
-\x0e\xe9\xb2\x0e\x1d\x0a\x2b\xb3\x40\x0e\x17\x09\x2b\xb2\x1d\x0e\
-\x0a\x2b\xb3\x40\x1d\x18\x09\x2b\xb1\x29\x01\x2b\xb1\x22\x09\x11\
-\x12\xb0\x07\x39\xb0\x1d\x11\xb4\x0b\x0c\x11\x13\x04\x24\x17\x39\
-\x00\xb1\x20\x03\x11\x12\xb3\x09\x0e\x1b\x25\x24\x17\x39\x30\x31\
-\x33\x35\x33\x17\x33\x2e\x03\x35\x34\x00\x20\x00\x15\x14\x0e\x02\
-\x07\x33\x37\x33\x15\x21\x36\x12\x36\x12\x35\x34\x24\x20\x04\x15\
-\x14\x1e\x01\x12\x17\x5a\x56\x2d\xe1\x1b\x76\x6a\x52\x01\x68\x02\
-\x10\x01\x6b\x52\x6a\x77\x1b\xe1\x2b\x58\xfe\x0b\x02\x5c\x6f\x5a\
-\xfe\xfe\xfe\x93\xfe\xfa\x5c\x6f\x5c\x02\x91\x02\x5c\xe2\xa6\xdb\
-\x64\xd5\x01\x33\xfe\xcd\xd5\x64\xdb\xa6\xe1\x5d\x02\x91\x75\x01\
-\x06\xc7\x01\x00\x6e\xb0\xdd\xdf\xae\x6f\xff\xc7\xfe\xf8\x73\x00\
-\x03\x00\x27\x00\x00\x02\x10\x06\x93\x00\x08\x00\x0c\x00\x16\x00\
-\x59\x00\xb2\x09\x00\x00\x2b\xb2\x0a\x02\x00\x2b\xb0\x07\x2f\xb0\
-\x15\x33\xb1\x03\x04\xe9\xb0\x0f\x32\x01\xb0\x17\x2f\xb0\x09\xd6\
-\xb1\x0c\x0e\xe9\xb3\x05\x0c\x09\x08\x2b\xb1\x01\x14\xe9\xb0\x01\
-\x2f\xb1\x05\x14\xe9\xb3\x0e\x0c\x09\x08\x2b\xb1\x12\x14\xe9\xb1\
-\x18\x01\x2b\xb1\x09\x01\x11\x12\xb1\x03\x07\x39\x39\xb1\x12\x0c\
-\x11\x12\xb1\x0f\x15\x39\x39\x00\x30\x31\x12\x34\x36\x32\x16\x14\
-\x06\x23\x22\x13\x11\x33\x11\x02\x34\x36\x32\x16\x15\x14\x06\x23\
-\x22\x27\x31\x4a\x2f\x33\x21\x25\x69\xb8\x13\x30\x49\x31\x35\x21\
-\x25\x06\x1b\x45\x33\x33\x45\x32\xfa\x17\x05\x8d\xfa\x73\x06\x1b\
-\x45\x33\x35\x21\x23\x31\x00\x00\x03\x00\x71\x00\x00\x05\xc5\x06\
-\x93\x00\x2b\x00\x36\x00\x41\x00\xf5\x00\xb2\x20\x00\x00\x2b\xb2\
-\x03\x02\x00\x2b\xb0\x10\x33\xb1\x28\x09\xe9\xb0\x17\x32\xb2\x28\
-\x03\x0a\x2b\xb3\x40\x28\x13\x09\x2b\xb0\x00\x32\xb0\x34\x2f\xb0\
-\x3f\x33\xb1\x2f\x04\xe9\xb0\x39\x32\x01\xb0\x42\x2f\xb0\x00\xd6\
-\xb1\x2b\x0d\xe9\xb0\x2b\x10\xb1\x2c\x01\x2b\xb1\x31\x14\xe9\xb0\
-\x31\x10\xb1\x20\x0b\x2b\xb0\x23\x32\xb1\x1f\x0e\xe9\xb0\x1f\x10\
-\xb1\x37\x0b\x2b\xb1\x3c\x14\xe9\xb0\x3c\x10\xb1\x14\x01\x2b\xb1\
-\x13\x0d\xe9\xb1\x43\x01\x2b\xb0\x36\x1a\xba\xc1\x6e\xf2\x8b\x00\
-\x15\x2b\x0a\x04\xb0\x23\x2e\x0e\xb0\x25\xc0\xb1\x09\x1b\xf9\xb0\
-\x07\xc0\xb0\x07\x10\xb3\x08\x07\x09\x13\x2b\xb0\x25\x10\xb3\x24\
-\x25\x23\x13\x2b\xb2\x08\x07\x09\x20\x8a\x20\x8a\x23\x06\x0e\x11\
-\x12\x39\xb2\x24\x25\x23\x11\x12\x39\x00\xb5\x09\x07\x08\x23\x24\
-\x25\x2e\x2e\x2e\x2e\x2e\x2e\x01\xb4\x09\x07\x08\x24\x25\x2e\x2e\
-\x2e\x2e\x2e\xb0\x40\x1a\x01\xb1\x2c\x2b\x11\x12\xb1\x28\x03\x39\
-\x39\xb1\x1f\x31\x11\x12\xb0\x0b\x39\xb1\x14\x3c\x11\x12\xb1\x10\
-\x17\x39\x39\x00\xb1\x28\x20\x11\x12\xb0\x0b\x39\x30\x31\x13\x3e\
-\x01\x33\x32\x1e\x03\x17\x16\x15\x3e\x03\x33\x32\x16\x17\x23\x2e\
-\x01\x23\x22\x0e\x04\x15\x11\x23\x11\x34\x2e\x04\x23\x22\x06\x07\
-\x01\x34\x36\x32\x16\x15\x14\x06\x23\x22\x26\x25\x34\x36\x32\x16\
-\x15\x14\x06\x23\x22\x26\x71\x02\xbe\x85\x4e\x7d\x46\x35\x14\x0b\
-\x02\x0a\x2b\x4e\x87\x58\x85\xbf\x02\xa0\x04\x65\x3f\x3b\x5d\x37\
-\x23\x10\x04\xb6\x05\x10\x23\x37\x5c\x3c\x46\x60\x04\x01\x04\x32\
-\x45\x33\x33\x21\x25\x31\x01\x63\x33\x46\x31\x33\x21\x25\x31\x04\
-\x71\x8f\xba\x45\x5e\x88\x5e\x33\x0a\x04\x52\x93\x8f\x56\xb8\x91\
-\x5e\x62\x35\x66\x6b\x93\x67\x43\xfd\x12\x02\xec\x44\x66\x95\x6b\
-\x66\x35\x68\x58\x01\xce\x25\x2f\x31\x25\x23\x31\x33\x23\x25\x2f\
-\x31\x25\x23\x31\x33\x00\x00\x00\x03\x00\x54\xff\xe9\x04\xe3\x05\
-\x8d\x00\x1e\x00\x32\x00\x36\x00\xa4\x00\xb2\x1c\x00\x00\x2b\xb0\
-\x17\x33\xb1\x22\x0b\xe9\xb0\x11\x32\xb2\x1c\x00\x00\x2b\xb4\x13\
-\x04\x00\x14\x04\x2b\xb2\x34\x02\x00\x2b\xb2\x03\x01\x00\x2b\xb1\
-\x0b\x0c\x33\x33\xb1\x2f\x0b\xe9\x01\xb0\x37\x2f\xb0\x00\xd6\xb1\
-\x1f\x0d\xe9\xb0\x1f\x10\xb1\x0b\x01\x2b\xb1\x0c\x0d\xe9\xb1\x38\
-\x01\x2b\xb0\x36\x1a\xba\x3c\xcd\xec\x05\x00\x15\x2b\x0a\x0e\xb0\
-\x0b\x10\xb0\x0a\xc0\xb0\x0c\x10\xb0\x0d\xc0\x00\xb1\x0a\x0d\x2e\
-\x2e\x01\xb1\x0a\x0d\x2e\x2e\xb0\x40\x1a\x01\xb1\x0b\x1f\x11\x12\
-\xb6\x03\x0f\x19\x1c\x26\x33\x35\x24\x17\x39\xb0\x0c\x11\xb1\x13\
-\x17\x39\x39\x00\xb1\x2f\x13\x11\x12\xb5\x00\x0f\x09\x19\x1a\x26\
-\x24\x17\x39\xb1\x34\x03\x11\x12\xb0\x33\x39\x30\x31\x13\x34\x12\
-\x33\x32\x1e\x03\x17\x3f\x01\x33\x03\x0f\x01\x16\x17\x36\x37\x33\
-\x0e\x01\x23\x22\x27\x23\x06\x23\x22\x02\x37\x1e\x01\x33\x32\x3e\
-\x01\x35\x34\x27\x2e\x05\x23\x22\x06\x07\x1b\x01\x33\x03\x54\xe3\
-\x9e\x3d\x6d\x46\x41\x1f\x12\x2f\x46\xa0\x63\x3d\x2f\x4a\x4b\x29\
-\x09\x9f\x04\x7d\x50\xa2\x59\x03\x87\xbc\x98\xe5\xa0\x04\x85\x52\
-\x44\x7e\x40\x10\x10\x0f\x25\x1f\x31\x3b\x23\x50\x83\x06\xe1\xba\
-\xa2\xdf\x01\xc7\xcb\x01\x12\x35\x44\x6d\x43\x2f\x83\xd5\xfe\xd3\
-\xa0\x68\xe3\x07\x06\x2b\x60\x6d\xcf\xcf\x01\x0f\xc0\xa2\x93\x73\
-\x6e\x0f\x08\x3b\x39\x2a\x68\x2f\x40\x1a\x8b\x98\x02\x0f\x01\x97\
-\xfe\x69\x00\x00\x02\x00\x54\xff\xe9\x03\x19\x05\x8d\x00\x1e\x00\
-\x22\x00\x70\x00\xb2\x1c\x00\x00\x2b\xb1\x17\x0b\xe9\xb2\x20\x02\
-\x00\x2b\xb2\x07\x01\x00\x2b\xb1\x0c\x0b\xe9\xb4\x12\x11\x1c\x07\
-\x0d\x2b\xb1\x12\x03\xe9\x01\xb0\x23\x2f\xb0\x04\xd6\xb1\x0f\x0d\
-\xe9\xb0\x0f\x10\xb0\x14\x20\xd6\x11\xb1\x00\x0d\xe9\xb0\x00\x2f\
-\xb1\x14\x0d\xe9\xb1\x24\x01\x2b\xb1\x0f\x14\x11\x12\xb0\x02\x39\
-\x00\xb1\x12\x17\x11\x12\xb2\x00\x19\x1a\x39\x39\x39\xb1\x0c\x1c\
-\x11\x12\xb2\x04\x09\x0a\x39\x39\x39\xb1\x20\x07\x11\x12\xb0\x1f\
-\x39\x30\x31\x37\x34\x37\x26\x35\x34\x36\x33\x32\x17\x07\x26\x23\
-\x22\x06\x15\x14\x21\x15\x20\x15\x14\x16\x33\x32\x37\x17\x06\x23\
-\x22\x26\x1b\x01\x33\x03\x54\xa4\x87\xbe\x85\xae\x9c\x73\x75\x62\
-\x48\x5e\x01\x09\xfe\xdb\x78\x48\x7d\x79\x71\xa4\xc1\x83\xdd\xe0\
-\xba\xa2\xdf\xe5\x91\x51\x56\x81\x6f\x97\xa0\x71\x71\x4e\x33\x83\
-\x7d\x81\x3f\x3a\x71\x71\xa0\x81\x03\x8c\x01\x97\xfe\x69\x00\x00\
-\x02\x00\x37\xfe\x71\x03\xc5\x05\x8d\x00\x20\x00\x24\x00\x8d\x00\
-\xb2\x18\x00\x00\x2b\xb2\x22\x02\x00\x2b\xb0\x0c\x2f\xb4\x07\x13\
-\x18\x22\x0d\x2b\xb0\x1e\x33\xb4\x07\x0b\x00\x27\x04\x2b\xb0\x03\
-\x32\xb2\x13\x07\x0a\x2b\xb3\x40\x13\x00\x09\x2b\x01\xb0\x25\x2f\
-\xb0\x00\xd6\xb1\x20\x11\xe9\xb0\x20\x10\xb1\x18\x01\x2b\xb1\x17\
-\x0d\xe9\xb0\x17\x10\xb1\x0c\x01\x2b\xb1\x0b\x0d\xe9\xb1\x26\x01\
-\x2b\xb1\x20\x00\x11\x12\xb0\x01\x39\xb0\x18\x11\xb0\x03\x39\xb0\
-\x17\x12\xb0\x05\x39\xb0\x0c\x11\xb4\x07\x13\x21\x22\x24\x24\x17\
-\x39\xb0\x0b\x12\xb0\x23\x39\x00\xb1\x13\x18\x11\x12\xb1\x05\x10\
-\x39\x39\xb1\x22\x07\x11\x12\xb0\x21\x39\x30\x31\x13\x3e\x01\x33\
-\x32\x17\x36\x33\x32\x16\x15\x11\x23\x11\x34\x36\x35\x34\x26\x23\
-\x22\x06\x07\x11\x23\x11\x34\x2e\x02\x27\x06\x07\x01\x13\x33\x03\
-\x37\x08\x7b\x42\x7b\x35\x58\x98\x77\xb2\xa2\x02\x6f\x41\x4c\x5c\
-\x06\xa2\x02\x06\x13\x10\x25\x04\x01\x0d\xba\xa2\xdf\x02\xd7\x81\
-\x64\xa8\xa8\xd9\xd5\xfc\x63\x03\x83\x04\x14\x06\x8b\x7e\x83\x5d\
-\xfd\xc5\x02\x3d\x3b\x38\x48\x21\x06\x02\x46\x01\x1f\x01\x97\xfe\
-\x69\x00\x00\x00\x02\x00\x2f\xff\xe9\x01\xfe\x05\x8d\x00\x03\x00\
-\x11\x00\x47\x00\xb2\x0f\x00\x00\x2b\xb2\x01\x02\x00\x2b\xb2\x05\
-\x01\x00\x2b\x01\xb0\x12\x2f\xb0\x04\xd6\xb1\x07\x0d\xe9\xb0\x07\
-\x10\xb1\x0b\x01\x2b\xb1\x0c\x16\xe9\xb1\x13\x01\x2b\xb1\x07\x04\
-\x11\x12\xb1\x01\x03\x39\x39\xb0\x0b\x11\xb1\x02\x0f\x39\x39\x00\
-\xb1\x01\x05\x11\x12\xb0\x00\x39\x30\x31\x1b\x01\x33\x0b\x01\x11\
-\x33\x11\x14\x17\x36\x37\x33\x0e\x01\x23\x22\x26\x2f\xba\xa2\xdf\
-\x58\xa0\x50\x42\x07\x71\x02\x81\x52\x54\x81\x03\xf6\x01\x97\xfe\
-\x69\xfc\xf8\x02\xa1\xfd\x61\x7d\x09\x04\x73\x73\x85\x8a\x00\x00\
-\x04\x00\x54\xff\xe9\x03\xa8\x05\x8d\x00\x1b\x00\x27\x00\x2b\x00\
-\x35\x00\x8d\x00\xb2\x12\x00\x00\x2b\xb4\x07\x0b\x00\x26\x04\x2b\
-\xb2\x29\x02\x00\x2b\xb2\x00\x01\x00\x2b\xb0\x0c\x33\xb4\x25\x1f\
-\x00\x29\x0d\x2b\xb0\x2f\x33\xb1\x25\x03\xe9\xb0\x33\x32\x01\xb0\
-\x36\x2f\xb0\x17\xd6\xb1\x04\x13\xe9\xb0\x22\x32\xb0\x04\x10\xb4\
-\x1c\x0f\x00\x20\x04\x2b\xb0\x1c\x2f\xb0\x04\x10\xb1\x2c\x01\x2b\
-\xb4\x32\x16\x00\x32\x04\x2b\xb0\x32\x10\xb1\x0a\x01\x2b\xb1\x0f\
-\x0d\xe9\xb1\x37\x01\x2b\xb1\x32\x17\x11\x12\xb5\x01\x07\x0c\x12\
-\x28\x2a\x24\x17\x39\xb1\x0f\x0a\x11\x12\xb0\x0d\x39\x00\xb1\x00\
-\x07\x11\x12\xb0\x17\x39\xb0\x25\x11\xb1\x28\x2b\x39\x39\x30\x31\
-\x13\x33\x1e\x02\x17\x16\x33\x32\x36\x35\x34\x27\x33\x16\x17\x14\
-\x02\x23\x22\x26\x27\x2e\x02\x27\x2e\x01\x37\x34\x36\x33\x32\x16\
-\x15\x14\x06\x23\x22\x26\x17\x13\x33\x03\x37\x34\x36\x33\x32\x16\
-\x14\x06\x22\x26\x54\xb6\x3d\x23\x09\x1c\x39\x6f\x5e\x73\x7d\xb4\
-\x68\x01\xcf\xa2\x96\xbc\x16\x02\x04\x1f\x23\x08\x25\x8d\x25\x1b\
-\x1d\x22\x22\x1d\x1b\x25\x81\xbb\xa2\xe0\x8c\x20\x1d\x19\x27\x23\
-\x35\x25\x03\x8f\x89\xfc\xbe\x42\x7f\xb2\x90\xe5\xdd\xd9\xe7\xcd\
-\xfe\xe7\xec\xa4\x0c\x9c\xa4\x5c\x14\x4e\xcb\x19\x26\x27\x16\x1b\
-\x27\x25\x3d\x01\x97\xfe\x69\x58\x17\x28\x25\x35\x25\x25\x00\x00\
-\x02\x00\x54\xff\xe9\x04\xe3\x03\xa4\x00\x1e\x00\x32\x00\x95\x00\
-\xb2\x1c\x00\x00\x2b\xb0\x17\x33\xb1\x22\x0b\xe9\xb0\x11\x32\xb2\
-\x1c\x00\x00\x2b\xb4\x13\x04\x00\x14\x04\x2b\xb2\x03\x01\x00\x2b\
-\xb1\x0b\x0c\x33\x33\xb1\x2f\x0b\xe9\x01\xb0\x33\x2f\xb0\x00\xd6\
-\xb1\x1f\x0d\xe9\xb0\x1f\x10\xb1\x0b\x01\x2b\xb1\x0c\x0d\xe9\xb1\
-\x34\x01\x2b\xb0\x36\x1a\xba\x3c\xcd\xec\x05\x00\x15\x2b\x0a\x0e\
-\xb0\x0b\x10\xb0\x0a\xc0\xb0\x0c\x10\xb0\x0d\xc0\x00\xb1\x0a\x0d\
-\x2e\x2e\x01\xb1\x0a\x0d\x2e\x2e\xb0\x40\x1a\x01\xb1\x0b\x1f\x11\
-\x12\xb4\x03\x0f\x19\x1c\x26\x24\x17\x39\xb0\x0c\x11\xb1\x13\x17\
-\x39\x39\x00\xb1\x2f\x13\x11\x12\xb5\x00\x0f\x09\x19\x1a\x26\x24\
-\x17\x39\x30\x31\x13\x34\x12\x33\x32\x1e\x03\x17\x3f\x01\x33\x03\
-\x0f\x01\x16\x17\x36\x37\x33\x0e\x01\x23\x22\x27\x23\x06\x23\x22\
-\x02\x37\x1e\x01\x33\x32\x3e\x01\x35\x34\x27\x2e\x05\x23\x22\x06\
-\x07\x54\xe3\x9e\x3d\x6d\x46\x41\x1f\x12\x2f\x46\xa0\x63\x3d\x2f\
-\x4a\x4b\x29\x09\x9f\x04\x7d\x50\xa2\x59\x03\x87\xbc\x98\xe5\xa0\
-\x04\x85\x52\x44\x7e\x40\x10\x10\x0f\x25\x1f\x31\x3b\x23\x50\x83\
-\x06\x01\xc7\xcb\x01\x12\x35\x44\x6d\x43\x2f\x83\xd5\xfe\xd3\xa0\
-\x68\xe3\x07\x06\x2b\x60\x6d\xcf\xcf\x01\x0f\xc0\xa2\x93\x73\x6e\
-\x0f\x08\x3b\x39\x2a\x68\x2f\x40\x1a\x8b\x98\x00\x02\x00\x54\xfe\
-\xe3\x03\xa8\x05\xdd\x00\x18\x00\x35\x00\x8e\x00\xb2\x16\x00\x00\
-\x2b\xb1\x1e\x06\xe9\xb2\x16\x1e\x0a\x2b\xb3\x40\x16\x18\x09\x2b\
-\xb0\x29\x2f\xb1\x2a\x0c\xe9\xb0\x2f\x2f\xb1\x0a\x05\xe9\x01\xb0\
-\x36\x2f\xb0\x00\xd6\xb1\x18\x0d\xe9\xb0\x19\x32\xb0\x18\x10\xb1\
-\x21\x01\x2b\xb1\x13\x0d\xe9\xb3\x0d\x13\x21\x08\x2b\xb1\x2d\x0d\
-\xe9\xb0\x2d\x2f\xb1\x0d\x0d\xe9\xb2\x2d\x0d\x0a\x2b\xb3\x40\x2d\
-\x29\x09\x2b\xb1\x37\x01\x2b\xb1\x18\x00\x11\x12\xb0\x04\x39\xb0\
-\x2d\x11\xb3\x0a\x16\x11\x1e\x24\x17\x39\xb0\x21\x12\xb0\x15\x39\
-\x00\xb1\x29\x1e\x11\x12\xb1\x13\x17\x39\x39\xb0\x2a\x11\xb0\x11\
-\x39\xb0\x2f\x12\xb0\x0d\x39\x30\x31\x13\x11\x34\x3e\x06\x33\x32\
-\x16\x15\x14\x0e\x01\x07\x04\x11\x14\x04\x20\x27\x19\x01\x14\x17\
-\x1e\x01\x33\x32\x36\x35\x34\x2e\x05\x23\x35\x3e\x01\x35\x10\x23\
-\x22\x0e\x03\x15\x54\x02\x08\x15\x23\x37\x4e\x6c\x44\xae\xc9\x4a\
-\x40\x33\x01\x23\xfe\xfe\xfe\xb8\x6a\x0c\x14\x84\x66\x75\x95\x25\
-\x2f\x58\x3f\x6b\x2f\x2d\x91\xbb\xd5\x3d\x55\x2d\x16\x04\xfe\xe3\
-\x04\xbd\x46\x4f\x7d\x48\x60\x37\x36\x16\xa4\xcc\x50\x7f\x31\x21\
-\x4c\xfe\xa4\xc5\xf6\x98\xfe\x62\x02\xdb\x50\x33\x52\x87\xbd\x85\
-\x48\x74\x48\x35\x19\x0e\x02\x69\x04\x87\x77\x01\x00\x2b\x3a\x6e\
-\x56\x4c\x00\x00\x01\x00\x37\xfe\xa2\x04\x1b\x03\xa4\x00\x2b\x00\
-\x4c\x00\xb2\x0c\x01\x00\x2b\xb0\x03\x33\xb1\x0d\x0b\xe9\xb0\x29\
-\x32\xb2\x0c\x01\x00\x2b\xb4\x00\x04\x00\x14\x04\x2b\x01\xb0\x2c\
-\x2f\xb0\x20\xd6\xb4\x19\x0e\x00\x13\x04\x2b\xb3\x13\x19\x20\x08\
-\x2b\xb1\x24\x0d\xe9\xb0\x24\x2f\xb1\x13\x0d\xe9\xb1\x2d\x01\x2b\
-\xb1\x13\x24\x11\x12\xb1\x09\x1c\x39\x39\x00\x30\x31\x13\x3e\x01\
-\x33\x32\x1e\x03\x17\x12\x36\x37\x15\x0e\x01\x07\x0e\x01\x15\x17\
-\x1e\x03\x15\x14\x06\x23\x22\x2e\x01\x35\x34\x3e\x01\x35\x34\x02\
-\x27\x26\x27\x06\x07\x37\x02\x83\x4e\x2d\x50\x3a\x41\x29\x21\x7f\
-\xd3\x7d\x58\x79\x44\x3b\x3e\x02\x02\x09\x08\x06\x48\x29\x19\x2a\
-\x2d\x14\x15\x69\x39\x1b\x25\x2d\x0a\x02\xcf\x62\x73\x3a\x51\x98\
-\x7b\x66\x01\x29\xd7\x04\xa0\x04\x7f\x9a\x85\xd1\x1c\x13\x12\x40\
-\x4f\x6b\x35\x4a\x35\x0e\x3c\x33\x60\xa2\x5e\x0a\x3f\x01\xcb\x48\
-\x21\x08\x08\x2d\x00\x00\x00\x00\x02\x00\x4a\xff\xe9\x03\x85\x05\
-\xc5\x00\x30\x00\x3c\x00\x65\x00\xb2\x21\x00\x00\x2b\xb1\x34\x03\
-\xe9\xb0\x13\x2f\xb1\x03\x03\xe9\x01\xb0\x3d\x2f\xb0\x24\xd6\xb0\
-\x00\x32\xb1\x31\x0d\xe9\xb1\x16\x0f\xe9\xb0\x31\x10\xb1\x37\x01\
-\x2b\xb1\x1e\x0d\xe9\xb1\x3e\x01\x2b\xb1\x37\x31\x11\x12\x40\x09\
-\x0b\x03\x13\x11\x1b\x21\x1c\x2b\x29\x24\x17\x39\xb0\x1e\x11\xb1\
-\x0d\x0f\x39\x39\x00\xb1\x13\x34\x11\x12\xb5\x0b\x00\x0f\x1e\x24\
-\x3a\x24\x17\x39\xb0\x03\x11\xb0\x0a\x39\x30\x31\x13\x34\x36\x33\
-\x32\x1e\x08\x17\x07\x26\x25\x26\x23\x22\x06\x15\x14\x1e\x01\x17\
-\x05\x07\x16\x15\x14\x02\x23\x22\x02\x35\x34\x3e\x02\x37\x2e\x06\
-\x13\x14\x16\x33\x32\x36\x35\x34\x26\x23\x22\x06\x4a\xa2\x6a\x0e\
-\x19\x19\x1e\x1d\x33\x2b\x54\x4a\x7f\x39\x41\x27\xfe\x9f\x3b\x29\
-\x3b\x52\x29\x1a\x1d\x01\x83\x02\xc3\xec\xa2\xa0\xed\x19\x39\x7b\
-\x54\x14\x5d\x25\x45\x1d\x25\x0e\xaa\x81\x68\x6a\x88\x81\x67\x68\
-\x8b\x04\xaa\x73\xa8\x02\x05\x0c\x0c\x1f\x18\x34\x2d\x4d\x23\x6b\
-\x14\xd8\x25\x5d\x39\x25\x3d\x13\x12\xea\x06\x8d\xfa\xbe\xfe\xf7\
-\x01\x07\xc0\x37\x71\x7f\x6f\x20\x0c\x36\x19\x31\x22\x36\x3d\xfd\
-\x19\x85\xb3\xcb\x8e\x85\xb2\xcd\x00\x00\x00\x00\x01\x00\x54\xff\
-\xe9\x03\x19\x03\xa4\x00\x1e\x00\x6b\x00\xb2\x1c\x00\x00\x2b\xb1\
-\x17\x0b\xe9\xb2\x07\x01\x00\x2b\xb1\x0c\x0b\xe9\xb4\x12\x11\x1c\
-\x07\x0d\x2b\xb1\x12\x03\xe9\x01\xb0\x1f\x2f\xb0\x04\xd6\xb1\x0f\
-\x0d\xe9\xb0\x0f\x10\xb0\x14\x20\xd6\x11\xb1\x00\x0d\xe9\xb0\x00\
-\x2f\xb1\x14\x0d\xe9\xb1\x20\x01\x2b\xb1\x0f\x14\x11\x12\xb0\x02\
-\x39\x00\xb1\x17\x1c\x11\x12\xb0\x1a\x39\xb0\x12\x11\xb1\x00\x19\
-\x39\x39\xb0\x11\x12\xb0\x02\x39\xb0\x0c\x11\xb2\x09\x04\x0a\x39\
-\x39\x39\x30\x31\x37\x34\x37\x26\x35\x34\x36\x33\x32\x17\x07\x26\
-\x23\x22\x06\x15\x14\x21\x15\x20\x15\x14\x16\x33\x32\x37\x17\x06\
-\x23\x22\x26\x54\xa4\x87\xbe\x85\xae\x9c\x73\x75\x62\x48\x5e\x01\
-\x09\xfe\xdb\x78\x48\x7d\x79\x71\xa4\xc1\x83\xdd\xe5\x91\x51\x56\
-\x81\x6f\x97\xa0\x71\x71\x4e\x33\x83\x7d\x81\x3f\x3a\x71\x71\xa0\
-\x81\x00\x00\x00\x01\x00\x54\xfe\xc7\x03\x6f\x05\xe5\x00\x32\x00\
-\x81\x00\xb2\x30\x00\x00\x2b\xb4\x15\x04\x00\x3e\x04\x2b\xb2\x1c\
-\x00\x00\x2b\xb0\x22\x2f\xb1\x23\x0b\xe9\xb0\x02\x2f\xb1\x08\x0a\
-\xe9\x01\xb0\x33\x2f\xb0\x00\xd6\xb1\x12\x0d\xe9\xb0\x12\x10\xb0\
-\x06\x20\xd6\x11\xb1\x05\x0d\xe9\xb0\x05\x2f\xb1\x06\x0d\xe9\xb0\
-\x12\x10\xb1\x2c\x01\x2b\xb1\x1d\x0d\xe9\xb2\x2c\x1d\x0a\x2b\xb3\
-\x40\x2c\x22\x09\x2b\xb1\x34\x01\x2b\xb1\x2c\x06\x11\x12\xb2\x02\
-\x15\x30\x39\x39\x39\xb0\x1d\x11\xb1\x0b\x0c\x39\x39\x00\xb1\x30\
-\x23\x11\x12\xb0\x1d\x39\xb1\x02\x15\x11\x12\xb1\x00\x12\x39\x39\
-\x30\x31\x13\x10\x01\x22\x26\x27\x33\x16\x3b\x01\x32\x37\x17\x0e\
-\x04\x15\x14\x16\x17\x32\x1e\x05\x15\x14\x0e\x02\x23\x35\x33\x3a\
-\x01\x3e\x04\x35\x2e\x01\x2b\x01\x22\x02\x54\x01\x73\x8f\xc3\x04\
-\x9f\x06\x9c\x02\x93\xbf\x60\x5e\x8f\xb8\x79\x54\x6c\x5e\x02\x3e\
-\x46\x60\x54\x4c\x2b\x4e\x7f\x7f\x42\x06\x06\x30\x22\x34\x25\x22\
-\x13\x08\x4e\x75\x0c\xc9\xd9\x01\xc9\x01\x89\x01\x7f\x8d\x87\x85\
-\x85\x81\x48\x78\xc1\xb6\xf0\x76\x6a\xa9\x10\x02\x08\x11\x23\x31\
-\x52\x33\x44\x60\x31\x14\x99\x02\x04\x0d\x10\x1f\x12\x27\x25\x01\
-\x15\x00\x00\x00\x01\x00\x37\xfe\x71\x03\xc5\x03\xbc\x00\x20\x00\
-\x72\x00\xb2\x18\x00\x00\x2b\xb0\x0c\x2f\xb0\x13\x2f\xb0\x1e\x33\
-\xb4\x07\x0b\x00\x27\x04\x2b\xb0\x03\x32\xb2\x13\x07\x0a\x2b\xb3\
-\x40\x13\x00\x09\x2b\x01\xb0\x21\x2f\xb0\x00\xd6\xb1\x20\x11\xe9\
-\xb0\x20\x10\xb1\x18\x01\x2b\xb1\x17\x0d\xe9\xb0\x17\x10\xb1\x0c\
-\x01\x2b\xb1\x0b\x0d\xe9\xb1\x22\x01\x2b\xb1\x20\x00\x11\x12\xb0\
-\x01\x39\xb0\x18\x11\xb0\x03\x39\xb0\x17\x12\xb0\x05\x39\xb0\x0c\
-\x11\xb1\x07\x13\x39\x39\x00\xb1\x13\x18\x11\x12\xb1\x05\x10\x39\
-\x39\x30\x31\x13\x3e\x01\x33\x32\x17\x36\x33\x32\x16\x15\x11\x23\
-\x11\x34\x36\x35\x34\x26\x23\x22\x06\x07\x11\x23\x11\x34\x2e\x02\
-\x27\x06\x07\x37\x08\x7b\x42\x7b\x35\x58\x98\x77\xb2\xa2\x02\x6f\
-\x41\x4c\x5c\x06\xa2\x02\x06\x13\x10\x25\x04\x02\xd7\x81\x64\xa8\
-\xa8\xd9\xd5\xfc\x63\x03\x83\x04\x14\x06\x8b\x7e\x83\x5d\xfd\xc5\
-\x02\x3d\x3b\x38\x48\x21\x06\x02\x46\x00\x00\x00\x03\x00\x54\xff\
-\xe9\x03\xa8\x05\xdd\x00\x14\x00\x24\x00\x33\x00\x4f\x00\xb2\x10\
-\x00\x00\x2b\xb1\x1e\x0b\xe9\xb0\x24\x2f\xb1\x25\x06\xe9\xb0\x2d\
-\x2f\xb1\x06\x0b\xe9\x01\xb0\x34\x2f\xb0\x00\xd6\xb1\x15\x0d\xe9\
-\xb0\x25\x32\xb0\x15\x10\xb1\x23\x01\x2b\xb0\x26\x32\xb1\x0b\x0d\
-\xe9\xb1\x35\x01\x2b\xb1\x23\x15\x11\x12\xb1\x10\x06\x39\x39\x00\
-\xb1\x25\x24\x11\x12\xb1\x00\x0b\x39\x39\x30\x31\x13\x34\x3e\x03\
-\x33\x32\x1e\x02\x15\x14\x02\x0e\x01\x23\x22\x2e\x02\x37\x1e\x07\
-\x33\x32\x3e\x02\x35\x21\x35\x21\x2e\x05\x23\x22\x0e\x04\x54\x16\
-\x3c\x5c\x9a\x62\x79\xb0\x5a\x27\x2b\x5c\xae\x75\x79\xb0\x5a\x27\
-\xa2\x02\x02\x0a\x0e\x19\x27\x35\x4a\x2d\x4e\x6a\x3a\x18\xfd\xee\
-\x02\x10\x02\x08\x13\x22\x38\x58\x39\x3b\x5b\x37\x23\x10\x06\x02\
-\xe1\x6a\xc7\xd1\x98\x62\x8f\xee\xf6\x85\x91\xff\x00\xe5\x86\x8e\
-\xed\xf6\x39\x3f\x1f\x83\x33\x6b\x33\x3f\x19\x54\xa2\xc7\x85\x77\
-\x42\x57\x87\x58\x58\x2b\x2f\x62\x58\x8d\x46\x00\x01\x00\x54\xff\
-\xe9\x01\xfe\x03\x8f\x00\x0d\x00\x30\x00\xb2\x0b\x00\x00\x2b\xb2\
-\x01\x01\x00\x2b\x01\xb0\x0e\x2f\xb0\x00\xd6\xb1\x03\x0d\xe9\xb0\
-\x03\x10\xb1\x07\x01\x2b\xb1\x08\x16\xe9\xb1\x0f\x01\x2b\xb1\x07\
-\x03\x11\x12\xb0\x0b\x39\x00\x30\x31\x37\x11\x33\x11\x14\x17\x36\
-\x37\x33\x0e\x01\x23\x22\x26\x54\xa0\x50\x42\x07\x71\x02\x81\x52\
-\x54\x81\xee\x02\xa1\xfd\x61\x7d\x09\x04\x73\x73\x85\x8a\x00\x00\
-\x01\x00\x71\x00\x00\x03\x98\x03\x8f\x00\x11\x00\x34\x00\xb2\x00\
-\x00\x00\x2b\xb0\x0d\x33\xb2\x07\x01\x00\x2b\xb0\x01\x33\xb1\x08\
-\x0b\xe9\x01\xb0\x12\x2f\xb0\x00\xd6\xb1\x11\x0d\xe9\xb0\x02\x32\
-\xb1\x13\x01\x2b\x00\xb1\x08\x00\x11\x12\xb1\x03\x0f\x39\x39\x30\
-\x31\x33\x11\x33\x11\x00\x37\x36\x17\x15\x22\x06\x0f\x01\x01\x23\
-\x01\x07\x11\x71\x9f\x01\x4c\x0a\x5c\x9e\x52\x3f\x29\xee\x01\xe0\
-\xe2\xfe\x90\x36\x03\x8f\xfe\x77\x01\x3b\x09\x46\x01\x91\x17\x26\
-\xe0\xfe\x1f\x01\x71\x32\xfe\xc1\x00\x00\x00\x00\x01\x00\x37\x00\
-\x00\x03\xc7\x05\xc7\x00\x16\x00\x2e\x00\xb2\x00\x00\x00\x2b\xb0\
-\x13\x33\xb0\x06\x2f\xb4\x0f\x0b\x00\x26\x04\x2b\x01\xb0\x17\x2f\
-\xb1\x18\x01\x2b\x00\xb1\x06\x00\x11\x12\xb1\x0c\x15\x39\x39\xb0\
-\x0f\x11\xb0\x0d\x39\x30\x31\x33\x01\x36\x37\x34\x02\x23\x22\x0e\
-\x02\x0f\x01\x27\x36\x33\x32\x16\x17\x01\x23\x09\x01\x37\x01\x83\
-\x08\x01\xbb\x45\x0a\x19\x1d\x0c\x13\x12\x1b\x54\x4c\x68\xb1\x5a\
-\x01\x7d\xae\xff\x00\xfe\xce\x03\x56\x10\x0f\x27\x01\x89\x08\x17\
-\x0a\x13\x10\xa0\x4e\xf8\xee\xfc\x1f\x02\xa2\xfd\x5e\x00\x00\x00\
-\x01\x00\x54\xfe\x71\x04\x56\x03\x8f\x00\x26\x00\x5f\x00\xb2\x22\
-\x00\x00\x2b\xb0\x1b\x33\xb2\x01\x01\x00\x2b\xb0\x0c\x33\xb0\x00\
-\x2f\x01\xb0\x27\x2f\xb0\x00\xd6\xb1\x26\x0d\xe9\xb0\x02\x32\xb0\
-\x26\x10\xb1\x0b\x01\x2b\xb1\x0e\x0d\xe9\xb0\x0e\x10\xb1\x13\x01\
-\x2b\xb1\x17\x16\xe9\xb1\x28\x01\x2b\xb1\x0b\x26\x11\x12\xb0\x22\
-\x39\xb0\x0e\x11\xb0\x1d\x39\xb0\x13\x12\xb0\x1b\x39\x00\xb1\x01\
-\x22\x11\x12\xb2\x06\x1d\x25\x39\x39\x39\x30\x31\x13\x11\x33\x11\
-\x14\x16\x33\x32\x3e\x02\x35\x11\x33\x11\x14\x33\x32\x36\x3d\x01\
-\x33\x16\x15\x14\x0e\x01\x07\x26\x27\x0e\x03\x07\x2e\x01\x27\x11\
-\x54\xa0\x93\x54\x21\x48\x4f\x32\x9f\x40\x1b\x24\x71\x02\x17\x62\
-\x52\x89\x2f\x23\x46\x49\x23\x23\x56\x62\x2f\xfe\x71\x05\x1e\xfd\
-\xe4\x71\x79\x17\x31\x68\x46\x02\x10\xfd\x58\x66\x29\x21\x10\x0e\
-\x1b\x25\x47\x54\x09\x0c\x86\x31\x3e\x1a\x06\x03\x06\x3c\x39\xfe\
-\x0d\x00\x00\x00\x01\x00\x00\x00\x00\x03\x8d\x03\x8f\x00\x1d\x00\
-\x8d\x00\xb2\x1a\x00\x00\x2b\xb2\x00\x01\x00\x2b\xb0\x11\x33\x01\
-\xb0\x1e\x2f\xb0\x0f\xd6\xb1\x14\x0d\xe9\xb1\x1f\x01\x2b\xb0\x36\
-\x1a\xba\xc3\x31\xec\x0b\x00\x15\x2b\x0a\xb0\x1a\x2e\x0e\xb0\x1b\
-\xc0\xb1\x0a\x11\xf9\xb0\x06\xc0\xb0\x06\x10\xb3\x07\x06\x0a\x13\
-\x2b\xb3\x08\x06\x0a\x13\x2b\xb3\x09\x06\x0a\x13\x2b\xb2\x07\x06\
-\x0a\x20\x8a\x20\x8a\x23\x06\x0e\x11\x12\x39\xb0\x08\x39\xb0\x09\
-\x39\x00\xb5\x0a\x1b\x06\x07\x08\x09\x2e\x2e\x2e\x2e\x2e\x2e\x01\
-\xb6\x0a\x1a\x1b\x06\x07\x08\x09\x2e\x2e\x2e\x2e\x2e\x2e\x2e\xb0\
-\x40\x1a\x01\xb1\x14\x0f\x11\x12\xb0\x12\x39\x00\x30\x31\x11\x33\
-\x1e\x07\x17\x3e\x03\x37\x34\x27\x33\x16\x07\x14\x0e\x02\x07\x23\
-\x03\x2e\x01\xd9\x14\x19\x19\x18\x15\x25\x22\x42\x21\x10\x7b\x33\
-\x3a\x02\x1f\xa0\x1d\x01\x4e\x51\xa0\x1b\xa0\xd2\x23\x3c\x03\x8f\
-\x12\x1d\x1e\x38\x35\x73\x6e\xcd\x64\x17\xa5\x52\x9e\x4b\x02\xd3\
-\xb8\x0e\x58\xd1\x89\xec\x2b\x02\x7d\x68\x56\x00\x01\x00\x54\xfe\
-\xc1\x03\x6f\x05\xf2\x00\x39\x00\xad\x00\xb2\x37\x00\x00\x2b\xb4\
-\x23\x04\x00\x3e\x04\x2b\xb2\x2a\x00\x00\x2b\xb0\x2e\x2f\xb1\x2f\
-\x0b\xe9\xb0\x1d\x2f\xb1\x1c\x0b\xe9\xb0\x12\x2f\xb1\x11\x0b\xe9\
-\xb0\x09\x32\x01\xb0\x3a\x2f\xb0\x00\xd6\xb1\x20\x0d\xe9\xb0\x20\
-\x10\xb0\x0a\x20\xd6\x11\xb1\x09\x0d\xe9\xb0\x09\x2f\xb1\x0a\x0d\
-\xe9\xb0\x20\x10\xb1\x05\x0b\x2b\xb4\x16\x16\x00\x32\x04\x2b\xb0\
-\x16\x10\xb1\x32\x01\x2b\xb1\x2b\x0d\xe9\xb2\x32\x2b\x0a\x2b\xb3\
-\x40\x32\x2e\x09\x2b\xb1\x3b\x01\x2b\xb1\x16\x00\x11\x12\xb0\x07\
-\x39\xb0\x32\x11\xb4\x03\x1c\x1d\x23\x37\x24\x17\x39\xb0\x2b\x12\
-\xb1\x11\x12\x39\x39\x00\xb1\x37\x2f\x11\x12\xb0\x2b\x39\xb1\x1d\
-\x23\x11\x12\xb0\x00\x39\xb0\x1c\x11\xb0\x03\x39\xb0\x12\x12\xb1\
-\x07\x05\x39\x39\x30\x31\x13\x34\x36\x37\x26\x35\x34\x37\x26\x27\
-\x33\x1e\x02\x3b\x01\x36\x25\x17\x06\x07\x06\x17\x14\x1e\x01\x17\
-\x16\x17\x15\x06\x04\x15\x14\x16\x17\x32\x1e\x05\x15\x14\x06\x07\
-\x35\x3e\x01\x35\x34\x27\x26\x2b\x01\x22\x02\x54\xba\x7d\x93\x4e\
-\xd1\x04\x9f\x04\x0f\x2f\x29\x14\x52\x01\x0f\x27\xf4\x3a\x77\x01\
-\x10\x54\x4a\x44\x6a\xc3\xfe\xe8\x72\x5b\x02\x3d\x46\x5e\x54\x4c\
-\x2b\xb7\x8b\x4e\x54\x0a\x21\xa2\x0c\xc9\xd9\x01\xa2\xa6\xeb\x3e\
-\x6f\x93\x60\x54\x1b\xb0\x14\x17\x17\x02\x40\x9c\x39\x17\x33\x5a\
-\x1b\x37\x4c\x10\x0e\x01\x9f\x02\xd1\xa4\x62\x92\x0e\x02\x08\x11\
-\x23\x31\x52\x33\x68\x83\x04\x99\x02\x2f\x23\x14\x0d\x31\x01\x02\
-\x00\x00\x00\x00\x02\x00\x54\xff\xe9\x03\xe1\x03\xa4\x00\x0a\x00\
-\x14\x00\x46\x00\xb2\x08\x00\x00\x2b\xb1\x0e\x0b\xe9\xb2\x03\x01\
-\x00\x2b\xb1\x13\x0b\xe9\x01\xb0\x15\x2f\xb0\x00\xd6\xb1\x0b\x0d\
-\xe9\xb0\x0b\x10\xb1\x10\x01\x2b\xb1\x05\x0d\xe9\xb1\x16\x01\x2b\
-\xb1\x10\x0b\x11\x12\xb2\x03\x02\x08\x39\x39\x39\x00\xb1\x13\x0e\
-\x11\x12\xb1\x00\x05\x39\x39\x30\x31\x13\x34\x00\x20\x00\x15\x14\
-\x00\x23\x22\x00\x37\x14\x16\x32\x36\x35\x34\x26\x22\x06\x54\x01\
-\x0c\x01\x75\x01\x0c\xfe\xf4\xba\xc3\xfe\xfc\xa0\xb0\xed\xae\xa5\
-\xfe\xa8\x01\xc9\xc7\x01\x14\xfe\xed\xca\xc7\xfe\xe9\x01\x1d\xc1\
-\x87\xb7\xb6\x88\x7f\xbe\xbe\x00\x01\x00\x10\xff\xe9\x04\x7b\x03\
-\x8f\x00\x1c\x00\x6c\x00\xb2\x0f\x00\x00\x2b\xb0\x18\x33\xb1\x09\
-\x0b\xe9\xb2\x09\x0f\x0a\x2b\xb3\x40\x09\x0c\x09\x2b\xb2\x02\x01\
-\x00\x2b\xb1\x1a\x0b\xe9\xb1\x04\x16\x32\x32\x01\xb0\x1d\x2f\xb0\
-\x19\xd6\xb1\x18\x0d\xe9\xb0\x18\x10\xb1\x15\x01\x2b\xb1\x06\x0d\
-\xe9\xb0\x06\x10\xb1\x0b\x01\x2b\xb1\x0c\x16\xe9\xb1\x1e\x01\x2b\
-\xb1\x0b\x06\x11\x12\xb0\x0f\x39\xb0\x0c\x11\xb1\x04\x03\x39\x39\
-\x00\xb1\x1a\x09\x11\x12\xb0\x1c\x39\xb0\x02\x11\xb0\x00\x39\x30\
-\x31\x13\x36\x33\x21\x15\x23\x11\x14\x16\x33\x32\x37\x33\x0e\x01\
-\x23\x22\x2e\x03\x35\x11\x23\x11\x23\x11\x06\x07\x10\x8b\xab\x03\
-\x0e\xf6\x3c\x1a\x4a\x0e\x6f\x02\x87\x54\x12\x2e\x45\x34\x27\xf5\
-\xa0\x60\x7f\x03\x5c\x33\x99\xfd\xf6\x3b\x30\x5a\x6f\x83\x09\x20\
-\x38\x68\x46\x01\xfe\xfc\xf3\x03\x0d\x02\x2d\x00\x02\x00\x54\xfe\
-\x71\x03\x6f\x03\xa4\x00\x11\x00\x1d\x00\x4e\x00\xb2\x0e\x00\x00\
-\x2b\xb1\x15\x03\xe9\xb2\x08\x01\x00\x2b\xb1\x1b\x03\xe9\xb0\x00\
-\x2f\x01\xb0\x1e\x2f\xb0\x00\xd6\xb1\x11\x0d\xe9\xb0\x12\x32\xb0\
-\x11\x10\xb1\x18\x01\x2b\xb1\x0b\x0d\xe9\xb1\x1f\x01\x2b\xb1\x18\
-\x11\x11\x12\xb0\x08\x39\x00\xb1\x15\x0e\x11\x12\xb0\x10\x39\xb0\
-\x1b\x11\xb1\x0b\x0a\x39\x39\x30\x31\x13\x11\x34\x37\x3e\x03\x33\
-\x32\x12\x10\x02\x2b\x01\x22\x27\x19\x01\x14\x16\x33\x32\x36\x35\
-\x34\x26\x23\x22\x06\x54\x39\x10\x30\x52\x7b\x47\xae\xe0\xe0\xae\
-\x04\x7d\x6c\x85\x6a\x71\x7b\x83\x6b\x68\x85\xfe\x71\x03\x39\xa4\
-\x73\x21\x3f\x50\x33\xfe\xe3\xfe\x7f\xfe\xe3\x5d\xfe\x2b\x03\x58\
-\x98\xc7\xd3\x88\x9a\xc6\xc9\x00\x01\x00\x52\xfe\xf6\x03\x37\x03\
-\x8f\x00\x1f\x00\x6a\x00\xb2\x05\x01\x00\x2b\xb4\x06\x0b\x00\x27\
-\x04\x2b\xb0\x16\x2f\xb1\x17\x0b\xe9\xb0\x1d\x2f\xb1\x0e\x0b\xe9\
-\x01\xb0\x20\x2f\xb0\x00\xd6\xb1\x0a\x0d\xe9\xb0\x0a\x10\xb1\x19\
-\x01\x2b\xb1\x12\x0d\xe9\xb0\x05\x32\xb2\x19\x12\x0a\x2b\xb3\x40\
-\x19\x16\x09\x2b\xb1\x21\x01\x2b\xb1\x19\x0a\x11\x12\xb1\x0e\x1c\
-\x39\x39\x00\xb1\x17\x16\x11\x12\xb0\x14\x39\xb0\x1d\x11\xb1\x12\
-\x1b\x39\x39\xb1\x06\x0e\x11\x12\xb1\x00\x0d\x39\x39\x30\x31\x13\
-\x34\x3e\x01\x24\x33\x15\x20\x07\x06\x14\x16\x17\x1e\x02\x17\x16\
-\x15\x14\x06\x0f\x01\x35\x32\x35\x34\x2e\x01\x27\x2e\x01\x52\x41\
-\x9a\x01\x35\xd5\xfe\x5c\x74\x2f\x66\x50\x0c\x69\x6a\x35\x7d\x9b\
-\x4e\x4e\x96\x63\xa6\x29\x77\x9b\x01\x96\x56\x9f\xa2\x62\xa1\xbb\
-\x4c\xb4\x89\x0e\x02\x02\x13\x16\x37\x71\x5c\x69\x06\x06\x99\x3a\
-\x23\x14\x04\x0a\x23\xd8\x00\x00\x02\x00\x54\xff\xe9\x04\x52\x03\
-\x8f\x00\x0f\x00\x19\x00\x4c\x00\xb2\x0d\x00\x00\x2b\xb1\x13\x0b\
-\xe9\xb2\x05\x01\x00\x2b\xb4\x17\x0b\x00\x27\x04\x2b\xb0\x07\x32\
-\x01\xb0\x1a\x2f\xb0\x00\xd6\xb1\x10\x0d\xe9\xb0\x10\x10\xb1\x15\
-\x01\x2b\xb1\x0a\x0d\xe9\xb1\x1b\x01\x2b\xb1\x15\x10\x11\x12\xb0\
-\x0d\x39\xb0\x0a\x11\xb0\x08\x39\x00\xb1\x17\x13\x11\x12\xb0\x00\
-\x39\x30\x31\x13\x34\x3e\x02\x33\x21\x15\x23\x16\x07\x14\x00\x23\
-\x22\x00\x37\x14\x16\x32\x36\x10\x26\x23\x22\x06\x54\x33\x69\xc4\
-\x81\x02\x1d\xe1\x6f\x01\xfe\xf4\xb8\xba\xfe\xf3\xa0\xb0\xed\xae\
-\xb0\x76\x7f\xa6\x01\xbc\x4a\x9a\x91\x5e\xa1\x89\xa9\xc7\xfe\xf4\
-\x01\x0e\xc5\x83\xb0\xae\x01\x06\xb1\xb7\x00\x00\x01\xff\xee\xff\
-\xe9\x03\x54\x03\x8f\x00\x1c\x00\x41\x00\xb2\x11\x00\x00\x2b\xb1\
-\x09\x0b\xe9\xb2\x09\x11\x0a\x2b\xb3\x40\x09\x0e\x09\x2b\xb2\x02\
-\x01\x00\x2b\xb1\x18\x0b\xe9\xb0\x04\x32\x01\xb0\x1d\x2f\xb0\x16\
-\xd6\xb1\x06\x0d\xe9\xb1\x1e\x01\x2b\x00\xb1\x18\x09\x11\x12\xb0\
-\x1c\x39\xb0\x02\x11\xb0\x00\x39\x30\x31\x03\x36\x33\x21\x15\x21\
-\x11\x14\x16\x33\x32\x36\x3f\x01\x33\x0e\x01\x23\x22\x2e\x02\x35\
-\x11\x23\x22\x0e\x01\x07\x12\x75\x8f\x02\x62\xfe\x95\x34\x1c\x21\
-\x29\x04\x02\x71\x04\x85\x4e\x1b\x3d\x4e\x33\x54\x2f\x44\x23\x2d\
-\x03\x5a\x35\x99\xfd\xfa\x3f\x30\x2d\x17\x16\x75\x7d\x13\x33\x77\
-\x56\x01\xfa\x0a\x0f\x12\x00\x00\x01\x00\x54\xff\xe9\x03\xa8\x03\
-\x8f\x00\x1b\x00\x4a\x00\xb2\x12\x00\x00\x2b\xb4\x07\x0b\x00\x26\
-\x04\x2b\xb2\x00\x01\x00\x2b\xb0\x0c\x33\x01\xb0\x1c\x2f\xb0\x17\
-\xd6\xb1\x04\x13\xe9\xb0\x04\x10\xb1\x0a\x01\x2b\xb1\x0f\x0d\xe9\
-\xb1\x1d\x01\x2b\xb1\x0a\x04\x11\x12\xb1\x0c\x12\x39\x39\xb0\x0f\
-\x11\xb0\x0d\x39\x00\xb1\x00\x07\x11\x12\xb0\x17\x39\x30\x31\x13\
-\x33\x1e\x02\x17\x16\x33\x32\x36\x35\x34\x27\x33\x16\x17\x14\x02\
-\x23\x22\x26\x27\x2e\x02\x27\x2e\x01\x54\xb6\x3d\x23\x09\x1c\x39\
-\x6f\x5e\x73\x7d\xb4\x68\x01\xcf\xa2\x96\xbc\x16\x02\x04\x1f\x23\
-\x08\x25\x03\x8f\x89\xfc\xbe\x42\x7f\xb2\x90\xe5\xdd\xd9\xe7\xcd\
-\xfe\xe7\xec\xa4\x0c\x9c\xa4\x5c\x14\x4e\x00\x00\x02\x00\x54\xfe\
-\x71\x04\x52\x03\xa4\x00\x19\x00\x25\x00\x73\x00\xb2\x17\x00\x00\
-\x2b\xb0\x14\x33\xb1\x08\x03\xe9\xb0\x1e\x32\xb2\x02\x01\x00\x2b\
-\xb2\x0c\x01\x00\x2b\xb1\x24\x03\xe9\xb0\x16\x2f\x01\xb0\x26\x2f\
-\xb0\x00\xd6\xb1\x05\x0f\xe9\xb0\x05\x10\xb1\x16\x01\x2b\xb0\x08\
-\x32\xb1\x15\x0d\xe9\xb0\x1a\x32\xb0\x15\x10\xb1\x21\x01\x2b\xb1\
-\x11\x0f\xe9\xb1\x27\x01\x2b\xb1\x05\x00\x11\x12\xb0\x02\x39\xb0\
-\x16\x11\xb0\x03\x39\xb1\x21\x15\x11\x12\xb1\x0c\x24\x39\x39\x00\
-\xb1\x24\x08\x11\x12\xb2\x00\x05\x11\x39\x39\x39\x30\x31\x13\x34\
-\x37\x33\x06\x15\x14\x16\x17\x11\x34\x36\x33\x32\x1e\x02\x15\x14\
-\x00\x07\x11\x23\x11\x26\x00\x01\x14\x16\x15\x11\x3e\x01\x37\x35\
-\x10\x23\x22\x54\x73\xb6\xa8\x98\x95\xbc\x6d\x52\x7b\x3d\x1d\xfe\
-\xfa\xa8\xa2\xa8\xfe\xfa\x02\x4e\x02\x87\x9e\x08\xa4\x8b\x01\xd1\
-\xec\xd2\xd7\xeb\x77\xc5\x20\x01\xca\xb6\xb3\x5e\x96\x95\x4a\xcb\
-\xff\x00\x16\xfe\x81\x01\x7f\x19\x00\xff\x01\x2b\x08\x14\x03\xfe\
-\x5d\x1b\xb6\x6c\x2b\x01\x4c\x00\x01\x00\x54\xfe\x56\x04\x1b\x03\
-\xaa\x00\x29\x00\x30\x00\xb2\x0c\x01\x00\x2b\xb0\x15\x33\xb1\x08\
-\x0b\xe9\xb0\x22\x2f\xb0\x00\x33\xb1\x1f\x0b\xe9\x01\xb0\x2a\x2f\
-\xb1\x2b\x01\x2b\x00\xb1\x08\x1f\x11\x12\xb4\x01\x14\x17\x18\x28\
-\x24\x17\x39\x30\x31\x13\x01\x35\x2e\x04\x23\x22\x06\x23\x35\x32\
-\x36\x33\x32\x1e\x02\x17\x01\x33\x01\x15\x1e\x03\x33\x32\x36\x33\
-\x17\x15\x07\x22\x2e\x02\x27\x01\x54\x01\x89\x2b\x2d\x54\x3f\x5a\
-\x30\x02\x0e\x04\x02\x29\x0a\x48\x81\x71\x4d\x34\x01\x1c\xb9\xfe\
-\x76\x37\x46\x61\x62\x35\x02\x0e\x05\x02\x38\x48\x80\x6f\x50\x31\
-\xfe\xe1\xfe\x5c\x02\xaa\x02\x64\x67\xa2\x52\x3f\x02\xa0\x06\x50\
-\x9e\x97\x71\x01\xf0\xfd\x56\x02\x81\x96\x9f\x48\x02\x44\x5c\x06\
-\x50\x9e\x97\x71\xfe\x10\x00\x00\x01\x00\x54\xfe\x71\x04\x52\x05\
-\xc7\x00\x1b\x00\x6f\x00\xb2\x19\x00\x00\x2b\xb0\x16\x33\xb1\x08\
-\x03\xe9\xb0\x0b\x32\xb2\x09\x02\x00\x2b\xb2\x02\x01\x00\x2b\xb0\
-\x10\x33\xb0\x18\x2f\x01\xb0\x1c\x2f\xb0\x00\xd6\xb4\x05\x0f\x00\
-\x20\x04\x2b\xb0\x02\x20\xd6\x11\xb1\x03\x0d\xe9\xb0\x05\x10\xb1\
-\x18\x01\x2b\xb0\x08\x32\xb1\x17\x0f\xe9\xb0\x0a\x32\xb0\x17\x10\
-\xb1\x0e\x01\x2b\xb4\x13\x0f\x00\x20\x04\x2b\xb1\x1d\x01\x2b\xb1\
-\x0e\x17\x11\x12\xb0\x10\x39\x00\xb1\x02\x08\x11\x12\xb1\x00\x13\
-\x39\x39\x30\x31\x13\x34\x37\x33\x06\x15\x14\x16\x17\x11\x33\x11\
-\x3e\x01\x35\x34\x27\x33\x16\x15\x14\x00\x07\x11\x23\x11\x26\x00\
-\x54\x39\xa0\x5a\xac\x8d\x90\x8d\xaa\x5a\xa0\x39\xff\x00\xb6\x90\
-\xb6\xfe\xfe\x02\x29\xac\xba\xb8\xb0\xa0\xf6\x20\x05\x56\xfa\xaa\
-\x21\xf5\xa0\xb0\xb8\xba\xac\xe5\xfe\xc8\x1c\xfe\x81\x01\x7f\x1d\
-\x01\x37\x00\x00\x01\x00\x44\xff\xe9\x05\x0e\x03\x8f\x00\x35\x00\
-\x6a\x00\xb2\x33\x00\x00\x2b\xb0\x2d\x33\xb1\x11\x03\xe9\xb0\x1a\
-\x32\xb2\x02\x01\x00\x2b\xb0\x27\x33\x01\xb0\x36\x2f\xb0\x00\xd6\
-\xb1\x0e\x0d\xe9\xb0\x0e\x10\xb1\x14\x01\x2b\xb1\x17\x0f\xe9\xb0\
-\x17\x10\xb1\x1d\x01\x2b\xb1\x2a\x0d\xe9\xb1\x37\x01\x2b\xb1\x14\
-\x0e\x11\x12\xb1\x02\x03\x39\x39\xb0\x17\x11\xb1\x2f\x31\x39\x39\
-\xb0\x1d\x12\xb2\x27\x28\x2d\x39\x39\x39\x00\xb1\x02\x11\x11\x12\
-\xb4\x00\x15\x2a\x2f\x31\x24\x17\x39\x30\x31\x13\x10\x13\x33\x0e\
-\x09\x15\x14\x16\x33\x32\x36\x3d\x01\x33\x15\x14\x16\x33\x32\x36\
-\x35\x34\x2e\x06\x2f\x01\x33\x12\x11\x14\x06\x23\x22\x27\x26\x27\
-\x06\x07\x22\x26\x44\xfb\xbf\x02\x31\x15\x33\x1b\x2d\x18\x23\x10\
-\x0d\x67\x54\x4a\x7a\x90\x7d\x45\x54\x67\x0f\x1c\x1d\x31\x1d\x3b\
-\x13\x1a\x1d\xc0\xfa\xcc\x8c\x9a\x6e\x02\x02\x66\xa6\x8d\xcd\x01\
-\x6d\x01\x21\x01\x01\x04\x35\x17\x3d\x27\x43\x34\x47\x42\x4c\x25\
-\x68\x98\x84\x95\x9a\x9c\x98\x7f\x98\x68\x29\x54\x50\x44\x4c\x2f\
-\x45\x19\x1d\x1e\xfe\xfe\xfe\xe0\xa6\xde\x8c\x04\x02\x91\x01\xde\
-\x00\x00\x00\x00\x03\xff\xa6\xff\xe9\x02\x00\x05\x00\x00\x0a\x00\
-\x17\x00\x21\x00\x5a\x00\xb2\x16\x00\x00\x2b\xb2\x0c\x01\x00\x2b\
-\xb0\x09\x2f\xb0\x20\x33\xb1\x03\x04\xe9\xb0\x1a\x32\x01\xb0\x22\
-\x2f\xb0\x01\xd6\xb1\x06\x14\xe9\xb0\x06\x10\xb1\x0b\x01\x2b\xb1\
-\x0e\x0d\xe9\xb0\x0e\x10\xb1\x19\x01\x2b\xb1\x1d\x14\xe9\xb3\x12\
-\x1d\x19\x08\x2b\xb1\x13\x16\xe9\xb1\x23\x01\x2b\xb1\x0e\x0b\x11\
-\x12\xb0\x16\x39\xb1\x1d\x19\x11\x12\xb0\x15\x39\x00\x30\x31\x02\
-\x34\x36\x33\x32\x16\x15\x14\x06\x23\x22\x13\x11\x33\x11\x14\x17\
-\x36\x37\x33\x0e\x01\x22\x26\x12\x34\x36\x32\x16\x15\x14\x06\x23\
-\x22\x5a\x35\x21\x25\x2f\x33\x21\x25\x7f\xa0\x50\x42\x07\x71\x02\
-\x81\xa4\x83\xc3\x2f\x49\x32\x36\x20\x25\x04\x89\x46\x31\x33\x21\
-\x23\x33\xfc\x96\x02\xa3\xfd\x61\x7d\x09\x04\x73\x73\x85\x88\x04\
-\x16\x46\x33\x35\x21\x23\x31\x00\x03\x00\x54\xff\xe9\x03\xa8\x05\
-\x00\x00\x1b\x00\x25\x00\x2f\x00\x71\x00\xb2\x12\x00\x00\x2b\xb4\
-\x07\x0b\x00\x26\x04\x2b\xb2\x00\x01\x00\x2b\xb0\x0c\x33\xb0\x24\
-\x2f\xb0\x2e\x33\xb1\x1f\x04\xe9\xb0\x28\x32\x01\xb0\x30\x2f\xb0\
-\x17\xd6\xb1\x04\x13\xe9\xb0\x1d\x20\xd6\x11\xb1\x21\x14\xe9\xb0\
-\x04\x10\xb1\x27\x01\x2b\xb1\x2b\x14\xe9\xb0\x2b\x10\xb1\x0a\x01\
-\x2b\xb1\x0f\x0d\xe9\xb1\x31\x01\x2b\xb1\x21\x1d\x11\x12\xb0\x01\
-\x39\xb0\x27\x11\xb1\x12\x07\x39\x39\xb0\x2b\x12\xb0\x0c\x39\x00\
-\xb1\x00\x07\x11\x12\xb0\x17\x39\x30\x31\x13\x33\x1e\x02\x17\x16\
-\x33\x32\x36\x35\x34\x27\x33\x16\x17\x14\x02\x23\x22\x26\x27\x2e\
-\x02\x27\x2e\x01\x12\x34\x36\x32\x16\x15\x14\x06\x23\x22\x24\x34\
-\x36\x32\x16\x15\x14\x06\x23\x22\x54\xb6\x3d\x23\x09\x1c\x39\x6f\
-\x5e\x73\x7d\xb4\x68\x01\xcf\xa2\x96\xbc\x16\x02\x04\x1f\x23\x08\
-\x25\x83\x2f\x4a\x31\x33\x21\x25\x01\x42\x31\x46\x33\x35\x21\x25\
-\x03\x8f\x89\xfc\xbe\x42\x7f\xb2\x90\xe5\xdd\xd9\xe7\xcd\xfe\xe7\
-\xec\xa4\x0c\x9c\xa4\x5c\x14\x4e\x01\x04\x46\x33\x35\x21\x23\x31\
-\x33\x46\x31\x31\x25\x23\x31\x00\x03\x00\x54\xff\xe9\x03\xe1\x05\
-\x8d\x00\x0a\x00\x14\x00\x18\x00\x55\x00\xb2\x08\x00\x00\x2b\xb1\
-\x0e\x0b\xe9\xb2\x16\x02\x00\x2b\xb2\x03\x01\x00\x2b\xb1\x13\x0b\
-\xe9\x01\xb0\x19\x2f\xb0\x00\xd6\xb1\x0b\x0d\xe9\xb0\x0b\x10\xb1\
-\x10\x01\x2b\xb1\x05\x0d\xe9\xb1\x1a\x01\x2b\xb1\x10\x0b\x11\x12\
-\xb4\x03\x02\x08\x15\x17\x24\x17\x39\x00\xb1\x13\x0e\x11\x12\xb1\
-\x00\x05\x39\x39\xb1\x16\x03\x11\x12\xb0\x15\x39\x30\x31\x13\x34\
-\x00\x20\x00\x15\x14\x00\x23\x22\x00\x37\x14\x16\x32\x36\x35\x34\
-\x26\x22\x06\x1b\x01\x33\x03\x54\x01\x0c\x01\x75\x01\x0c\xfe\xf4\
-\xba\xc3\xfe\xfc\xa0\xb0\xed\xae\xa5\xfe\xa8\xa4\xba\xa2\xdf\x01\
-\xc9\xc7\x01\x14\xfe\xed\xca\xc7\xfe\xe9\x01\x1d\xc1\x87\xb7\xb6\
-\x88\x7f\xbe\xbe\x01\xb0\x01\x97\xfe\x69\x00\x00\x02\x00\x54\xff\
-\xe9\x03\xa8\x05\x8d\x00\x1b\x00\x1f\x00\x5f\x00\xb2\x12\x00\x00\
-\x2b\xb4\x07\x0b\x00\x26\x04\x2b\xb2\x1d\x02\x00\x2b\xb2\x00\x01\
-\x00\x2b\xb0\x0c\x33\x01\xb0\x20\x2f\xb0\x17\xd6\xb1\x04\x13\xe9\
-\xb0\x04\x10\xb1\x0a\x01\x2b\xb1\x0f\x0d\xe9\xb1\x21\x01\x2b\xb1\
-\x04\x17\x11\x12\xb0\x01\x39\xb0\x0a\x11\xb4\x0c\x12\x1d\x1e\x1f\
-\x24\x17\x39\xb0\x0f\x12\xb0\x0d\x39\x00\xb1\x00\x07\x11\x12\xb0\
-\x17\x39\xb0\x1d\x11\xb0\x1c\x39\x30\x31\x13\x33\x1e\x02\x17\x16\
-\x33\x32\x36\x35\x34\x27\x33\x16\x17\x14\x02\x23\x22\x26\x27\x2e\
-\x02\x27\x2e\x01\x25\x13\x33\x03\x54\xb6\x3d\x23\x09\x1c\x39\x6f\
-\x5e\x73\x7d\xb4\x68\x01\xcf\xa2\x96\xbc\x16\x02\x04\x1f\x23\x08\
-\x25\x01\x0f\xba\xa2\xdf\x03\x8f\x89\xfc\xbe\x42\x7f\xb2\x90\xe5\
-\xdd\xd9\xe7\xcd\xfe\xe7\xec\xa4\x0c\x9c\xa4\x5c\x14\x4e\x73\x01\
-\x97\xfe\x69\x00\x02\x00\x44\xff\xe9\x05\x0e\x05\x8d\x00\x35\x00\
-\x39\x00\x7b\x00\xb2\x33\x00\x00\x2b\xb0\x2d\x33\xb1\x11\x03\xe9\
-\xb0\x1a\x32\xb2\x37\x02\x00\x2b\xb2\x02\x01\x00\x2b\xb0\x27\x33\
-\x01\xb0\x3a\x2f\xb0\x00\xd6\xb1\x0e\x0d\xe9\xb0\x0e\x10\xb1\x14\
-\x01\x2b\xb1\x17\x0f\xe9\xb0\x17\x10\xb1\x1d\x01\x2b\xb1\x2a\x0d\
-\xe9\xb1\x3b\x01\x2b\xb1\x14\x0e\x11\x12\xb2\x02\x03\x36\x39\x39\
-\x39\xb0\x17\x11\xb3\x2f\x31\x37\x39\x24\x17\x39\xb0\x1d\x12\xb3\
-\x27\x28\x2d\x38\x24\x17\x39\x00\xb1\x02\x11\x11\x12\xb4\x00\x15\
-\x2a\x2f\x31\x24\x17\x39\xb0\x37\x11\xb0\x36\x39\x30\x31\x13\x10\
-\x13\x33\x0e\x09\x15\x14\x16\x33\x32\x36\x3d\x01\x33\x15\x14\x16\
-\x33\x32\x36\x35\x34\x2e\x06\x2f\x01\x33\x12\x11\x14\x06\x23\x22\
-\x27\x26\x27\x06\x07\x22\x26\x01\x13\x33\x03\x44\xfb\xbf\x02\x31\
-\x15\x33\x1b\x2d\x18\x23\x10\x0d\x67\x54\x4a\x7a\x90\x7d\x45\x54\
-\x67\x0f\x1c\x1d\x31\x1d\x3b\x13\x1a\x1d\xc0\xfa\xcc\x8c\x9a\x6e\
-\x02\x02\x66\xa6\x8d\xcd\x01\xe1\xba\xa2\xdf\x01\x6d\x01\x21\x01\
-\x01\x04\x35\x17\x3d\x27\x43\x34\x47\x42\x4c\x25\x68\x98\x84\x95\
-\x9a\x9c\x98\x7f\x98\x68\x29\x54\x50\x44\x4c\x2f\x45\x19\x1d\x1e\
-\xfe\xfe\xfe\xe0\xa6\xde\x8c\x04\x02\x91\x01\xde\x03\x2f\x01\x97\
-\xfe\x69\x00\x00\x03\x00\x54\xff\xe9\x03\xa8\x05\xdd\x00\x14\x00\
-\x24\x00\x33\x00\x4f\x00\xb2\x10\x00\x00\x2b\xb1\x1e\x0b\xe9\xb0\
-\x24\x2f\xb1\x25\x06\xe9\xb0\x2d\x2f\xb1\x06\x0b\xe9\x01\xb0\x34\
-\x2f\xb0\x00\xd6\xb1\x15\x0d\xe9\xb0\x25\x32\xb0\x15\x10\xb1\x23\
-\x01\x2b\xb0\x26\x32\xb1\x0b\x0d\xe9\xb1\x35\x01\x2b\xb1\x23\x15\
-\x11\x12\xb1\x10\x06\x39\x39\x00\xb1\x25\x24\x11\x12\xb1\x00\x0b\
-\x39\x39\x30\x31\x13\x34\x3e\x03\x33\x32\x1e\x02\x15\x14\x02\x0e\
-\x01\x23\x22\x2e\x02\x37\x1e\x07\x33\x32\x3e\x02\x35\x21\x35\x21\
-\x2e\x05\x23\x22\x0e\x04\x54\x16\x3c\x5c\x9a\x62\x79\xb0\x5a\x27\
-\x2b\x5c\xae\x75\x79\xb0\x5a\x27\xa2\x02\x02\x0a\x0e\x19\x27\x35\
-\x4a\x2d\x4e\x6a\x3a\x18\xfd\xee\x02\x10\x02\x08\x13\x22\x38\x58\
-\x39\x3b\x5b\x37\x23\x10\x06\x02\xe1\x6a\xc7\xd1\x98\x62\x8f\xee\
-\xf6\x85\x91\xff\x00\xe5\x86\x8e\xed\xf6\x39\x3f\x1f\x83\x33\x6b\
-\x33\x3f\x19\x54\xa2\xc7\x85\x77\x42\x57\x87\x58\x58\x2b\x2f\x62\
-\x58\x8d\x46\x00\x02\x00\x44\x00\x00\x03\xba\x05\xa4\x00\x10\x00\
-\x1b\x00\x61\x00\xb2\x0c\x00\x00\x2b\xb2\x03\x02\x00\x2b\xb1\x1a\
-\x0b\xe9\xb4\x0e\x14\x0c\x03\x0d\x2b\xb1\x0e\x0b\xe9\xb0\x09\x32\
-\x01\xb0\x1c\x2f\xb0\x00\xd6\xb1\x12\x0e\xe9\xb0\x12\x10\xb1\x0c\
-\x01\x2b\xb1\x0b\x0e\xe9\xb0\x0b\x10\xb1\x17\x01\x2b\xb1\x06\x0e\
-\xe9\xb1\x1d\x01\x2b\xb1\x0b\x0c\x11\x12\xb2\x03\x14\x1a\x39\x39\
-\x39\xb0\x17\x11\xb0\x09\x39\x00\xb1\x1a\x14\x11\x12\xb1\x06\x00\
-\x39\x39\x30\x31\x13\x34\x12\x33\x32\x00\x15\x14\x02\x07\x23\x11\
-\x23\x11\x23\x26\x02\x12\x14\x16\x33\x32\x36\x35\x34\x26\x23\x22\
-\x44\xfe\xbe\xb4\x01\x06\xc4\x9a\x02\xb6\x02\x96\xc8\xb8\x93\x71\
-\x73\x8f\x98\x6c\x71\x03\xd1\xba\x01\x19\xfe\xef\xc2\xa2\xfe\xfc\
-\x21\xfd\xf6\x02\x0a\x21\x01\x00\x01\x23\xf6\xb8\xba\x79\x81\xb0\
-\x00\x00\x00\x00\x02\x00\x64\xff\x7d\x03\x98\x04\xe7\x00\x15\x00\
-\x21\x00\x5b\x00\xb0\x10\x2f\xb4\x19\x04\x00\x07\x04\x2b\xb0\x1f\
-\x2f\xb1\x03\x0c\xe9\x01\xb0\x22\x2f\xb0\x00\xd6\xb1\x16\x0f\xe9\
-\xb0\x16\x10\xb1\x12\x01\x2b\xb4\x0a\x0e\x00\x0e\x04\x2b\xb0\x0a\
-\x10\xb1\x1c\x01\x2b\xb1\x06\x0f\xe9\xb1\x23\x01\x2b\xb1\x0a\x12\
-\x11\x12\xb2\x03\x19\x1f\x39\x39\x39\x00\xb1\x19\x10\x11\x12\xb1\
-\x09\x13\x39\x39\xb0\x1f\x11\xb1\x00\x06\x39\x39\x30\x31\x13\x34\
-\x24\x33\x32\x16\x15\x14\x06\x07\x11\x14\x0e\x01\x07\x06\x23\x22\
-\x35\x11\x2e\x01\x37\x14\x16\x33\x32\x36\x35\x34\x26\x23\x22\x06\
-\x64\x01\x19\xac\x9c\xd3\xa2\x63\x04\x22\x23\x35\x3a\x73\x7f\x85\
-\x8c\xbc\x7d\x6f\x76\xbe\x7d\x6f\x74\x03\x44\xc3\xe0\xc4\xa6\x98\
-\xbc\x29\xfe\x3b\x21\x26\x3c\x16\x25\x77\x01\xf1\x23\xbf\xb4\x9a\
-\xa2\x90\x77\x9a\xa3\x91\x00\x00\x02\x00\x48\x00\x00\x04\x14\x05\
-\x83\x00\x0d\x00\x29\x00\x3b\x00\xb2\x09\x00\x00\x2b\xb1\x15\x0b\
-\xe9\xb2\x06\x02\x00\x2b\xb4\x1e\x0b\x00\x26\x04\x2b\x01\xb0\x2a\
-\x2f\xb0\x00\xd6\xb1\x0e\x0e\xe9\xb0\x0e\x10\xb1\x19\x01\x2b\xb1\
-\x08\x0e\xe9\xb1\x2b\x01\x2b\x00\xb1\x1e\x15\x11\x12\xb0\x00\x39\
-\x30\x31\x13\x34\x12\x36\x37\x36\x33\x21\x11\x21\x22\x27\x26\x02\
-\x37\x14\x1e\x02\x17\x16\x3b\x01\x3e\x01\x35\x11\x34\x2e\x01\x23\
-\x2a\x03\x0e\x03\x07\x06\x02\x48\x62\xd7\x91\x1f\x3c\x01\xa7\xfe\
-\x54\x9a\x64\x8b\x97\xb8\x1f\x41\x7d\x54\x0e\x1d\x23\xa2\x3d\x18\
-\x5d\x64\x06\x27\x0a\x21\x0c\x1b\x12\x17\x0a\x71\x62\x02\xc1\xa4\
-\x01\x28\xdd\x15\x04\xfa\x7d\x3f\x56\x01\x61\xcb\x58\xab\xa5\x6f\
-\x08\x02\x02\x0c\x23\x03\xe5\x12\x11\x08\x04\x04\x06\x08\x06\x3b\
-\xfe\xd7\x00\x00\x01\x00\x71\x00\x00\x03\x8d\x03\xbe\x00\x1e\x00\
-\x6f\x00\xb2\x19\x00\x00\x2b\xb0\x16\x2f\xb1\x15\x0b\xe9\xb0\x0c\
-\x2f\xb1\x06\x0a\xe9\xb0\x06\x10\xb1\x09\x0b\xe9\x01\xb0\x1f\x2f\
-\xb0\x00\xd6\xb4\x0f\x0f\x00\x20\x04\x2b\xb0\x0f\x10\xb1\x19\x01\
-\x2b\xb1\x18\x0d\xe9\xb3\x17\x18\x19\x08\x2b\xb1\x1a\x0f\xe9\xb0\
-\x1a\x2f\xb1\x17\x0f\xe9\xb2\x17\x1a\x0a\x2b\xb3\x40\x17\x15\x09\
-\x2b\xb1\x20\x01\x2b\xb1\x17\x1a\x11\x12\xb0\x0c\x39\x00\xb1\x15\
-\x16\x11\x12\xb0\x1a\x39\xb0\x09\x11\xb1\x00\x0f\x39\x39\x30\x31\
-\x13\x34\x3e\x02\x3f\x02\x17\x15\x22\x26\x23\x22\x06\x15\x14\x1e\
-\x02\x3b\x01\x15\x27\x13\x23\x13\x2e\x03\x71\x54\x8b\xa0\x58\x70\
-\x5f\x76\x75\xe9\x1d\xa2\x80\x31\x60\x58\x40\xa8\x61\x0f\xa2\x10\
-\x3f\x73\x75\x45\x02\x7f\x4e\x7b\x47\x27\x04\x02\x02\x02\x9f\x14\
-\x6c\x46\x33\x42\x1e\x09\x9f\x04\xfe\xb8\x01\x56\x0a\x25\x42\x70\
-\x00\x00\x00\x00\x01\x00\xc1\x00\x00\x04\x37\x05\x87\x00\x0c\x00\
-\x40\x00\xb2\x00\x00\x00\x2b\xb2\x01\x02\x00\x2b\xb1\x06\x08\xe9\
-\xb4\x0b\x08\x00\x01\x0d\x2b\xb1\x0b\x03\xe9\x01\xb0\x0d\x2f\xb0\
-\x00\xd6\xb1\x0c\x0e\xe9\xb0\x07\x32\xb2\x0c\x00\x0a\x2b\xb3\x40\
-\x0c\x02\x09\x2b\xb3\x40\x0c\x0a\x09\x2b\xb1\x0e\x01\x2b\x00\x30\
-\x31\x33\x11\x21\x15\x23\x27\x21\x27\x11\x21\x15\x21\x11\xc1\x03\
-\x76\x70\x31\xfe\x24\x41\x02\x68\xfd\x98\x05\x87\x87\x02\x02\xfd\
-\xfe\x7d\xfd\x7b\x00\x00\x00\x00\x01\x00\x71\xfe\x71\x03\x8d\x03\
-\x8f\x00\x16\x00\x40\x00\xb2\x05\x01\x00\x2b\xb4\x08\x0b\x00\x27\
-\x04\x2b\xb0\x00\x2f\xb0\x15\x2f\xb4\x11\x0b\x00\x26\x04\x2b\x01\
-\xb0\x17\x2f\xb0\x00\xd6\xb1\x16\x0d\xe9\xb0\x10\x32\xb2\x16\x00\
-\x0a\x2b\xb3\x40\x16\x07\x09\x2b\xb3\x40\x16\x14\x09\x2b\xb1\x18\
-\x01\x2b\x00\x30\x31\x13\x11\x34\x37\x36\x33\x21\x15\x21\x22\x06\
-\x22\x0e\x01\x07\x06\x07\x15\x21\x17\x15\x21\x11\x71\x66\x42\x5e\
-\x02\x16\xfd\xf6\x0a\x1d\x0c\x11\x10\x0c\x12\x01\x01\x6f\x02\xfe\
-\x8f\xfe\x71\x04\x1a\x8f\x48\x2d\xa1\x02\x05\x0c\x0c\x17\x31\xc4\
-\x02\xa0\xfd\x50\x00\x00\x00\x00\x01\x00\x71\xfe\xd7\x02\xa8\x04\
-\xaa\x00\x0c\x00\x66\x00\x01\xb0\x0d\x2f\xb0\x00\xd6\xb4\x05\x16\
-\x00\x32\x04\x2b\xb1\x02\x11\xe9\xb0\x05\x10\xb1\x0c\x01\x2b\xb1\
-\x06\x0f\xe9\xb0\x06\x10\xb1\x09\x11\xe9\xb0\x09\x2f\xb1\x0e\x01\
-\x2b\xb0\x36\x1a\xba\x11\x4a\xc2\x61\x00\x15\x2b\x0a\x04\xb0\x05\
-\x2e\xb0\x0c\x2e\xb0\x05\x10\xb1\x00\x1d\xf9\xb0\x0c\x10\xb1\x06\
-\x1d\xf9\x02\xb3\x00\x05\x06\x0c\x2e\x2e\x2e\x2e\xb0\x40\x1a\x01\
-\xb1\x0c\x09\x11\x12\xb0\x08\x39\x00\x30\x31\x13\x11\x33\x06\x02\
-\x15\x25\x11\x23\x27\x36\x12\x35\x71\x99\x02\x1a\x01\xba\x98\x02\
-\x02\x1b\x01\x44\x03\x66\x9a\xfe\x1d\x6a\x7c\xfc\x98\x02\x9a\x01\
-\xe3\x6b\x00\x00\x01\x00\x3d\x00\x00\x04\xe1\x05\x8d\x00\x0d\x00\
-\x80\x00\xb2\x00\x00\x00\x2b\xb3\x06\x09\x0a\x0d\x24\x17\x33\xb2\
-\x05\x02\x00\x2b\x01\xb0\x0e\x2f\xb0\x00\xd6\xb1\x0d\x0f\xe9\xb0\
-\x0d\x10\xb1\x0a\x01\x2b\xb1\x09\x0f\xe9\xb1\x0f\x01\x2b\xb0\x36\
-\x1a\xba\x3d\x8e\xee\x7c\x00\x15\x2b\x0a\x0e\xb0\x00\x10\xb0\x01\
-\xc0\xb0\x0d\x10\xb0\x0c\xc0\xba\x3d\x98\xee\x9d\x00\x15\x2b\x0a\
-\xb0\x0a\x10\xb0\x0b\xc0\xb0\x09\x10\xb0\x08\xc0\x00\xb3\x01\x08\
-\x0b\x0c\x2e\x2e\x2e\x2e\x01\xb3\x01\x08\x0b\x0c\x2e\x2e\x2e\x2e\
-\xb0\x40\x1a\x01\xb1\x0a\x0d\x11\x12\xb1\x04\x05\x39\x39\x00\x30\
-\x31\x33\x01\x2f\x02\x35\x01\x23\x01\x03\x23\x13\x0b\x01\x3d\x01\
-\x1f\x66\x11\x02\x03\xfe\xb6\xfe\xb6\x81\x83\xa8\xcd\xf7\x03\xe7\
-\x8e\x1a\x23\xdb\xfa\x73\x01\xc9\xfe\x37\x02\x4a\x01\x1a\xfc\x9c\
-\x00\x00\x00\x00\x01\x00\x56\x00\x00\x05\x71\x05\xc7\x00\x27\x00\
-\x52\x00\xb2\x13\x00\x00\x2b\xb0\x0d\x2f\xb1\x0e\x0b\xe9\x01\xb0\
-\x28\x2f\xb0\x00\xd6\xb0\x0d\x32\xb1\x27\x0d\xe9\xb0\x27\x10\xb1\
-\x18\x01\x2b\xb1\x17\x0d\xe9\xb0\x17\x10\xb1\x13\x01\x2b\xb1\x12\
-\x0d\xe9\xb1\x29\x01\x2b\xb1\x18\x27\x11\x12\xb1\x09\x05\x39\x39\
-\xb0\x17\x11\xb2\x07\x1d\x21\x39\x39\x39\xb0\x13\x12\xb0\x1b\x39\
-\x00\x30\x31\x13\x34\x3e\x03\x3f\x01\x2e\x04\x23\x35\x20\x08\x01\
-\x11\x23\x10\x03\x06\x03\x23\x36\x12\x37\x26\x27\x0e\x04\x07\x0e\
-\x01\x07\x15\x56\x44\x83\x81\xb6\x37\x3a\x35\x23\x92\x71\xb6\x5e\
-\x01\x6d\x02\x5c\x01\x52\xa0\xa2\xf6\x06\xa0\x02\xc3\x98\x3f\x8c\
-\x23\x1f\x2f\x1c\x61\x2f\x91\x7f\x02\x01\xc1\x5a\x95\x7b\x5a\x79\
-\x2d\x33\x23\x19\x4b\x23\x25\x9a\xfe\x6a\xfd\x5a\xfe\x75\x01\x4a\
-\x01\x5e\xb2\xfe\xeb\xae\x01\x23\x62\x6d\x8b\x1d\x18\x23\x10\x40\
-\x20\x60\xaf\x72\x02\x00\x00\x00\x02\x00\xc1\x00\x00\x04\x71\x06\
-\xcf\x00\x12\x00\x18\x00\x52\x00\xb2\x00\x00\x00\x2b\xb1\x0e\x0b\
-\xe9\xb2\x01\x02\x00\x2b\xb1\x06\x08\xe9\xb4\x08\x0b\x00\x01\x0d\
-\x2b\xb1\x08\x03\xe9\x01\xb0\x19\x2f\xb0\x00\xd6\xb1\x0c\x0e\xe9\
-\xb0\x07\x32\xb2\x0c\x00\x0a\x2b\xb3\x40\x0c\x12\x09\x2b\xb3\x40\
-\x0c\x02\x09\x2b\xb3\x40\x0c\x0a\x09\x2b\xb1\x1a\x01\x2b\xb1\x0c\
-\x00\x11\x12\xb0\x13\x39\x00\x30\x31\x33\x11\x21\x15\x23\x27\x21\
-\x27\x11\x21\x15\x21\x11\x33\x37\x21\x37\x33\x15\x01\x33\x05\x23\
-\x27\x26\xc1\x03\x93\x75\x33\xfe\x15\x48\x02\xa4\xfd\x5c\xae\x31\
-\x01\x8d\x2d\x5f\xfc\xb2\xe5\x01\x40\x96\x1c\x2b\x05\x8d\x87\x02\
-\x02\xfe\x19\x7f\xfd\xeb\x02\x02\x93\x06\xcf\xbb\x03\x10\x00\x00\
-\x03\x00\xc1\x00\x00\x04\x71\x06\xcb\x00\x12\x00\x16\x00\x1a\x00\
-\x6c\x00\xb2\x00\x00\x00\x2b\xb1\x0e\x0b\xe9\xb2\x01\x02\x00\x2b\
-\xb1\x06\x08\xe9\xb4\x08\x0b\x00\x01\x0d\x2b\xb1\x08\x03\xe9\xb0\
-\x13\x2f\xb0\x17\x33\xb1\x14\x04\xe9\xb0\x18\x32\x01\xb0\x1b\x2f\
-\xb0\x00\xd6\xb1\x0c\x0e\xe9\xb0\x07\x32\xb2\x0c\x00\x0a\x2b\xb3\
-\x40\x0c\x12\x09\x2b\xb3\x40\x0c\x02\x09\x2b\xb3\x40\x0c\x0a\x09\
-\x2b\xb3\x13\x0c\x00\x08\x2b\xb1\x16\x0e\xe9\xb0\x0c\x10\xb1\x17\
-\x01\x2b\xb1\x1a\x0e\xe9\xb1\x1c\x01\x2b\x00\x30\x31\x33\x11\x21\
-\x15\x23\x27\x21\x27\x11\x21\x15\x21\x11\x33\x37\x21\x37\x33\x15\
-\x01\x35\x33\x15\x33\x35\x33\x15\xc1\x03\x93\x75\x33\xfe\x15\x48\
-\x02\xa4\xfd\x5c\xae\x31\x01\x8d\x2d\x5f\xfc\xf8\xb8\xd5\xb8\x05\
-\x8d\x87\x02\x02\xfe\x19\x7f\xfd\xeb\x02\x02\x93\x06\x14\xb7\xb7\
-\xb7\xb7\x00\x00\x01\x00\x48\xff\xd3\x06\x42\x05\x8d\x00\x33\x00\
-\x75\x00\xb2\x2f\x00\x00\x2b\xb0\x18\x33\xb2\x16\x00\x00\x2b\xb1\
-\x1d\x03\xe9\xb2\x01\x02\x00\x2b\xb1\x32\x08\xe9\xb0\x03\x32\xb4\
-\x08\x29\x16\x01\x0d\x2b\xb1\x08\x03\xe9\x01\xb0\x34\x2f\xb0\x2f\
-\xd6\xb1\x2e\x0e\xe9\xb0\x05\x32\xb2\x2e\x2f\x0a\x2b\xb3\x40\x2e\
-\x02\x09\x2b\xb2\x2f\x2e\x0a\x2b\xb3\x40\x2f\x01\x09\x2b\xb0\x2e\
-\x10\xb1\x21\x01\x2b\xb1\x0f\x0d\xe9\xb1\x35\x01\x2b\xb1\x21\x2e\
-\x11\x12\xb2\x08\x16\x18\x39\x39\x39\x00\xb1\x08\x16\x11\x12\xb1\
-\x06\x19\x39\x39\x30\x31\x13\x35\x21\x15\x21\x27\x11\x36\x33\x32\
-\x1e\x03\x1d\x01\x14\x07\x0e\x03\x23\x22\x27\x37\x16\x17\x16\x33\
-\x32\x37\x36\x3d\x01\x34\x2e\x04\x23\x22\x07\x06\x15\x11\x23\x11\
-\x07\x23\x07\x48\x04\xdf\xfe\x46\x5b\xa6\xfa\x66\x96\x54\x31\x0f\
-\x0f\x0e\x35\x5f\x97\x5e\x75\x85\x25\x5e\x3d\x1f\x25\x9c\x41\x1f\
-\x04\x13\x2d\x47\x7b\x52\x8b\x57\x56\xb6\xf2\x9f\x2d\x05\x06\x87\
-\x85\x02\xfd\xfc\xb6\x2d\x43\x69\x60\x3d\x9a\x6a\x36\x33\x62\x67\
-\x3d\x2d\x8b\x31\x06\x04\x91\x42\x83\x91\x23\x2b\x48\x2b\x2f\x16\
-\x5e\x60\xa0\xfe\x21\x05\x0a\x02\x02\x00\x00\x00\x02\x00\xc1\x00\
-\x00\x03\xfe\x06\xcf\x00\x08\x00\x19\x00\x34\x00\xb2\x00\x00\x00\
-\x2b\xb2\x01\x02\x00\x2b\xb1\x06\x08\xe9\x01\xb0\x1a\x2f\xb0\x00\
-\xd6\xb1\x08\x0e\xe9\xb2\x08\x00\x0a\x2b\xb3\x40\x08\x02\x09\x2b\
-\xb1\x1b\x01\x2b\xb1\x08\x00\x11\x12\xb0\x09\x39\x00\x30\x31\x33\
-\x11\x21\x15\x23\x27\x21\x27\x11\x03\x36\x37\x3e\x01\x3b\x01\x17\
-\x04\x07\x06\x07\x23\x22\x06\x23\x22\xc1\x03\x3d\x66\x32\xfe\x48\
-\x35\x17\x4c\x66\x68\x2a\x16\x8c\x3d\xfe\xa2\x15\x0a\x10\x27\x0a\
-\x27\x0a\x24\x05\x8d\x87\x02\x02\xfa\xf6\x06\x14\x2d\x3c\x3d\x15\
-\x02\xb0\x06\x02\x01\x02\x00\x00\x01\x00\x87\xff\xd3\x04\xb4\x05\
-\xba\x00\x26\x00\x5e\x00\xb2\x24\x00\x00\x2b\xb1\x16\x08\xe9\xb2\
-\x05\x02\x00\x2b\xb1\x0d\x08\xe9\xb4\x13\x10\x24\x05\x0d\x2b\xb1\
-\x13\x03\xe9\x01\xb0\x27\x2f\xb0\x00\xd6\xb1\x13\x0e\xe9\xb0\x10\
-\x32\xb2\x13\x00\x0a\x2b\xb3\x40\x13\x12\x09\x2b\xb1\x28\x01\x2b\
-\x00\xb1\x16\x24\x11\x12\xb0\x21\x39\xb0\x13\x11\xb0\x20\x39\xb0\
-\x10\x12\xb0\x00\x39\xb0\x0d\x11\xb0\x0a\x39\xb0\x05\x12\xb0\x09\
-\x39\x30\x31\x13\x34\x12\x3e\x01\x33\x32\x1e\x01\x17\x07\x2e\x01\
-\x23\x22\x00\x07\x21\x15\x21\x16\x00\x33\x32\x3e\x07\x37\x17\x0e\
-\x01\x23\x20\x00\x87\x75\xbc\xe2\x6e\x50\x5c\x94\x56\x1f\x5c\x94\
-\x6c\xcd\xfe\xfa\x0e\x02\xc0\xfd\x40\x0e\x01\x06\xcd\x23\x3b\x39\
-\x25\x33\x15\x35\x0a\x3c\x06\x0c\x6f\x9f\x7f\xfe\xdb\xfe\x85\x02\
-\xc7\xa8\x01\x22\xbd\x6c\x06\x1e\x21\xaa\x39\x33\xfe\xa8\xd9\x7f\
-\xd9\xfe\xa8\x02\x0c\x04\x15\x06\x1f\x08\x25\x04\x8f\x42\x2f\x01\
-\xc3\x00\x00\x00\x01\x00\x5a\xff\xd3\x03\xfe\x05\xba\x00\x27\x00\
-\xae\x00\xb2\x26\x00\x00\x2b\xb1\x03\x0a\xe9\xb2\x11\x02\x00\x2b\
-\xb1\x17\x09\xe9\x01\xb0\x28\x2f\xb0\x0e\xd6\xb1\x1a\x0d\xe9\xb0\
-\x1a\x10\xb1\x06\x01\x2b\xb1\x23\x13\xe9\xb1\x29\x01\x2b\xb0\x36\
-\x1a\xba\xee\xec\xc2\x52\x00\x15\x2b\x0a\x0e\xb0\x0b\x10\xb0\x09\
-\xc0\xb1\x1d\x04\xf9\xb0\x1f\xc0\xb3\x1e\x1d\x1f\x13\x2b\xb2\x1e\
-\x1d\x1f\x20\x8a\x20\x8a\x23\x06\x0e\x11\x12\x39\x00\xb4\x09\x0b\
-\x1d\x1e\x1f\x2e\x2e\x2e\x2e\x2e\x01\xb4\x09\x0b\x1d\x1e\x1f\x2e\
-\x2e\x2e\x2e\x2e\xb0\x40\x1a\x01\xb1\x1a\x0e\x11\x12\xb0\x01\x39\
-\xb0\x06\x11\xb3\x03\x11\x17\x26\x24\x17\x39\xb0\x23\x12\xb1\x13\
-\x14\x39\x39\x00\xb1\x03\x26\x11\x12\xb0\x00\x39\xb0\x17\x11\xb3\
-\x01\x0e\x14\x23\x24\x17\x39\xb0\x11\x12\xb0\x13\x39\x30\x31\x3f\
-\x01\x16\x33\x32\x36\x35\x34\x26\x27\x26\x27\x2e\x01\x35\x34\x24\
-\x33\x32\x17\x07\x2e\x01\x23\x22\x06\x15\x14\x16\x17\x1e\x01\x17\
-\x1e\x01\x15\x14\x00\x23\x22\x5a\x1f\xd7\xdf\x85\xa6\x60\x50\x04\
-\xfa\x7d\xbe\x01\x00\xce\xc1\xb6\x1c\x56\x94\x73\x85\xa4\x5d\x47\
-\x1d\xf0\x27\x71\xa1\xfe\xfc\xcb\xf6\x60\xaa\xaa\xa4\x6b\x50\x85\
-\x20\x02\x42\x21\xca\x94\x9e\xf5\x62\xaa\x42\x41\x91\x61\x48\x76\
-\x1d\x0c\x39\x11\x2f\xcf\x8d\xae\xfe\xfe\x00\x00\x01\x00\xc1\x00\
-\x00\x01\x79\x05\x8d\x00\x03\x00\x21\x00\xb2\x00\x00\x00\x2b\xb2\
-\x01\x02\x00\x2b\x01\xb0\x04\x2f\xb0\x00\xd6\xb1\x03\x0e\xe9\xb1\
-\x03\x0e\xe9\xb1\x05\x01\x2b\x00\x30\x31\x33\x11\x33\x11\xc1\xb8\
-\x05\x8d\xfa\x73\x00\x00\x00\x00\x03\xff\xfa\x00\x00\x02\x40\x06\
-\xcb\x00\x03\x00\x07\x00\x0b\x00\x40\x00\xb2\x04\x00\x00\x2b\xb2\
-\x05\x02\x00\x2b\xb0\x00\x2f\xb0\x08\x33\xb1\x01\x04\xe9\xb0\x09\
-\x32\x01\xb0\x0c\x2f\xb0\x00\xd6\xb1\x03\x0e\xe9\xb0\x03\x10\xb1\
-\x04\x01\x2b\xb1\x07\x0e\xe9\xb0\x07\x10\xb1\x08\x01\x2b\xb1\x0b\
-\x0e\xe9\xb1\x0d\x01\x2b\x00\x30\x31\x03\x35\x33\x15\x13\x11\x33\
-\x11\x13\x35\x33\x15\x06\xb8\x0f\xb8\x0f\xb8\x06\x14\xb7\xb7\xf9\
-\xec\x05\x8d\xfa\x73\x06\x14\xb7\xb7\x00\x00\x00\x01\x00\x54\xff\
-\xd3\x03\x1b\x05\x8d\x00\x11\x00\x2f\x00\xb2\x10\x00\x00\x2b\xb1\
-\x05\x03\xe9\xb2\x09\x02\x00\x2b\x01\xb0\x12\x2f\xb0\x08\xd6\xb1\
-\x0b\x15\xe9\xb1\x13\x01\x2b\x00\xb1\x05\x10\x11\x12\xb0\x00\x39\
-\xb0\x09\x11\xb0\x01\x39\x30\x31\x3f\x01\x1e\x02\x33\x32\x36\x35\
-\x11\x33\x11\x14\x0e\x02\x23\x22\x54\x1b\x25\x22\x7d\x44\x66\x8b\
-\xb3\x40\x6e\x77\x44\xb4\x29\x9a\x21\x1d\x33\x6c\x84\x04\x4b\xfb\
-\xb0\x68\x96\x4b\x21\x00\x00\x00\x02\x00\x27\x00\x00\x07\xd9\x05\
-\x8d\x00\x21\x00\x30\x00\x58\x00\xb2\x1a\x00\x00\x2b\xb0\x00\x33\
-\xb1\x22\x05\xe9\xb0\x01\x32\xb2\x1a\x00\x00\x2b\xb1\x04\x08\xe9\
-\xb2\x0c\x02\x00\x2b\xb1\x1c\x08\xe9\xb4\x0e\x2f\x1a\x0c\x0d\x2b\
-\xb1\x0e\x03\xe9\x01\xb0\x31\x2f\xb0\x0c\xd6\xb1\x1c\x0f\xe9\xb0\
-\x1c\x10\xb1\x1a\x01\x2b\xb1\x22\x0e\xe9\xb0\x0d\x32\xb0\x22\x10\
-\xb1\x26\x01\x2b\xb1\x14\x13\xe9\xb1\x32\x01\x2b\x00\x30\x31\x33\
-\x35\x33\x32\x3e\x05\x37\x12\x11\x21\x11\x21\x32\x17\x1e\x01\x15\
-\x14\x0e\x02\x23\x21\x11\x21\x10\x03\x0e\x01\x23\x25\x33\x32\x36\
-\x35\x34\x2e\x02\x23\x22\x06\x2b\x01\x07\x27\x4e\x23\x18\x40\x1e\
-\x36\x1e\x25\x0f\x35\x03\x23\x01\x0a\xa2\x6a\x5e\x77\x33\x67\xc4\
-\x81\xfe\x3d\xfe\x17\x52\x33\xac\x79\x04\x4a\xe1\xb0\xb2\x23\x4b\
-\x9a\x66\x08\x19\x08\xaa\x02\x81\x02\x0e\x1d\x3e\x56\x87\x58\x01\
-\x60\x02\x0c\xfd\x96\x3c\x33\xb6\x6f\x3f\x81\x7f\x50\x05\x0a\xfd\
-\xe1\xfe\x9a\xe5\xa0\x73\xb4\x66\x2b\x58\x5d\x39\x02\x4e\x00\x00\
-\x02\x00\xc1\x00\x00\x07\xb6\x05\x8d\x00\x16\x00\x25\x00\x61\x00\
-\xb2\x13\x00\x00\x2b\xb0\x00\x33\xb1\x17\x05\xe9\xb2\x01\x02\x00\
-\x2b\xb0\x05\x33\xb4\x03\x15\x13\x01\x0d\x2b\xb0\x20\x33\xb1\x03\
-\x03\xe9\xb0\x07\x32\x01\xb0\x26\x2f\xb0\x00\xd6\xb1\x16\x0e\xe9\
-\xb0\x02\x32\xb0\x16\x10\xb1\x13\x01\x2b\xb0\x04\x32\xb1\x17\x0e\
-\xe9\xb0\x06\x32\xb0\x17\x10\xb1\x1b\x01\x2b\xb1\x0d\x13\xe9\xb1\
-\x27\x01\x2b\x00\xb1\x15\x17\x11\x12\xb1\x0d\x1b\x39\x39\x30\x31\
-\x33\x11\x33\x11\x21\x11\x33\x11\x21\x32\x17\x1e\x01\x15\x14\x0e\
-\x02\x23\x21\x11\x21\x11\x25\x33\x32\x36\x35\x34\x2e\x02\x23\x22\
-\x06\x2b\x01\x07\xc1\xb8\x02\x9b\xb7\x01\x0c\xa0\x6a\x5e\x77\x33\
-\x66\xc5\x7f\xfe\x3b\xfd\x65\x03\x52\xe1\xb0\xb4\x22\x4e\x9a\x66\
-\x06\x19\x08\xac\x02\x05\x8d\xfd\x96\x02\x6a\xfd\x96\x3c\x33\xb6\
-\x6f\x3f\x83\x7d\x50\x02\xa4\xfd\x5c\x73\xb4\x66\x2b\x58\x5d\x39\
-\x02\x4c\x00\x00\x01\x00\x48\x00\x00\x05\x48\x05\x8d\x00\x1e\x00\
-\x64\x00\xb2\x1b\x00\x00\x2b\xb0\x0f\x33\xb2\x01\x02\x00\x2b\xb1\
-\x1d\x08\xe9\xb0\x03\x32\xb2\x08\x01\x00\x2b\xb1\x16\x03\xe9\x01\
-\xb0\x1f\x2f\xb0\x1b\xd6\xb1\x1a\x0e\xe9\xb0\x05\x32\xb2\x1a\x1b\
-\x0a\x2b\xb3\x40\x1a\x02\x09\x2b\xb2\x1b\x1a\x0a\x2b\xb3\x40\x1b\
-\x01\x09\x2b\xb0\x1a\x10\xb1\x10\x01\x2b\xb1\x0f\x0d\xe9\xb1\x20\
-\x01\x2b\xb1\x10\x1a\x11\x12\xb0\x08\x39\x00\xb1\x16\x1b\x11\x12\
-\xb0\x06\x39\x30\x31\x13\x35\x21\x15\x21\x27\x11\x36\x33\x32\x1e\
-\x03\x15\x11\x23\x11\x34\x2e\x02\x23\x22\x06\x15\x11\x23\x11\x21\
-\x07\x48\x04\xc0\xfe\x27\x64\x89\xba\x58\x7b\x40\x21\x06\xa0\x0c\
-\x2d\x69\x52\x6d\x7c\xb7\xfe\xa8\x29\x05\x06\x87\x85\x02\xfe\x04\
-\x96\x33\x44\x6c\x48\x33\xfd\xba\x02\x3f\x2f\x44\x4c\x29\xb4\x87\
-\xfe\x14\x05\x08\x02\x00\x00\x00\x02\x00\xc3\x00\x00\x05\x35\x06\
-\xcf\x00\x0c\x00\x18\x00\x30\x00\xb2\x00\x00\x00\x2b\xb0\x08\x33\
-\xb2\x01\x02\x00\x2b\xb0\x04\x33\x01\xb0\x19\x2f\xb0\x00\xd6\xb1\
-\x0c\x15\xe9\xb0\x02\x32\xb1\x1a\x01\x2b\x00\xb1\x01\x00\x11\x12\
-\xb1\x03\x0a\x39\x39\x30\x31\x33\x11\x33\x11\x01\x33\x01\x15\x01\
-\x23\x09\x01\x11\x13\x25\x33\x17\x04\x06\x2b\x01\x22\x06\x23\x22\
-\xc3\xb0\x02\xe7\xbf\xfd\xdb\x02\x41\xc0\xfe\x0e\xfe\xf0\xa6\x01\
-\x3f\x8b\x5a\xfe\xe3\x57\x19\x29\x0a\x27\x0a\x23\x05\x8d\xfd\x09\
-\x02\xf7\xfd\xcf\x02\xfc\xa6\x02\xe7\xfe\xec\xfe\x2d\x06\x14\xbb\
-\x02\x8f\x2a\x02\x00\x00\x00\x00\x02\x00\xc1\x00\x00\x04\xcb\x06\
-\xcf\x00\x0c\x00\x12\x00\x45\x00\xb2\x00\x00\x00\x2b\xb0\x07\x33\
-\xb2\x01\x02\x00\x2b\xb0\x05\x33\x01\xb0\x13\x2f\xb0\x00\xd6\xb1\
-\x03\x15\xe9\xb0\x03\x10\xb1\x08\x01\x2b\xb1\x07\x14\xe9\xb1\x14\
-\x01\x2b\xb1\x08\x03\x11\x12\xb3\x05\x0c\x0d\x0f\x24\x17\x39\x00\
-\xb1\x01\x00\x11\x12\xb1\x03\x0a\x39\x39\x30\x31\x33\x11\x33\x11\
-\x37\x01\x33\x11\x23\x11\x27\x07\x01\x03\x33\x05\x23\x27\x26\xc1\
-\xb0\x47\x02\x19\xfa\xae\x02\x48\xfd\xe7\x18\xe5\x01\x40\x96\x1d\
-\x2a\x05\x8d\xfb\x02\x9c\x04\x62\xfa\x73\x04\xbc\x42\x9c\xfb\x9e\
-\x06\xcf\xbb\x03\x10\x00\x00\x00\x02\x00\x1d\x00\x00\x05\x37\x07\
-\x1d\x00\x18\x00\x29\x00\x5f\x00\xb2\x13\x00\x00\x2b\xb1\x14\x08\
-\xe9\xb2\x00\x02\x00\x2b\xb0\x07\x33\xb0\x28\x2f\xb1\x1f\x09\xe9\
-\xb2\x1f\x28\x0a\x2b\xb3\x40\x1f\x19\x09\x2b\xb0\x24\x32\x01\xb0\
-\x2a\x2f\xb0\x19\xd6\xb4\x1a\x16\x00\x32\x04\x2b\xb0\x1a\x10\xb1\
-\x24\x01\x2b\xb4\x25\x16\x00\x32\x04\x2b\xb1\x2b\x01\x2b\xb1\x24\
-\x1a\x11\x12\xb3\x04\x18\x27\x28\x24\x17\x39\x00\xb1\x00\x14\x11\
-\x12\xb0\x04\x39\x30\x31\x13\x33\x00\x12\x17\x36\x13\x01\x33\x01\
-\x0e\x05\x07\x06\x2b\x01\x35\x33\x32\x36\x37\x01\x33\x1e\x03\x33\
-\x32\x3e\x02\x37\x33\x0e\x01\x20\x26\x1d\xc2\x01\x27\xdf\x0f\x0a\
-\x71\x01\x24\xa4\xfe\x7b\x02\x35\x15\x37\x29\x3d\x21\x56\x94\x6a\
-\x7d\x54\x58\x23\xfe\xbe\x7d\x04\x35\x4c\x3d\x1b\x1d\x3b\x4e\x35\
-\x04\x7d\x04\xd1\xfe\xf6\xd3\x05\x8d\xfd\xdf\xfe\x38\x50\x5e\x01\
-\x15\x02\xc6\xfc\x67\x06\x7d\x2d\x6f\x3b\x48\x17\x3b\x85\x35\x32\
-\x06\x31\x2d\x42\x1b\x0a\x0a\x1b\x42\x2d\x85\x98\x9a\x00\x00\x00\
-\x01\x00\xc1\xfe\x71\x04\xcb\x05\x8d\x00\x0b\x00\x40\x00\xb2\x00\
-\x00\x00\x2b\xb0\x07\x33\xb1\x03\x09\xe9\xb2\x01\x02\x00\x2b\xb0\
-\x05\x33\xb0\x0a\x2f\x01\xb0\x0c\x2f\xb0\x00\xd6\xb1\x03\x0e\xe9\
-\xb0\x03\x10\xb1\x0a\x01\x2b\xb1\x09\x11\xe9\xb0\x09\x10\xb1\x04\
-\x01\x2b\xb1\x07\x0e\xe9\xb1\x0d\x01\x2b\x00\x30\x31\x33\x11\x33\
-\x11\x21\x11\x33\x11\x21\x11\x23\x11\xc1\xb8\x02\x9b\xb7\xfe\x47\
-\x99\x05\x8d\xfa\xfc\x05\x04\xfa\x73\xfe\x71\x01\x8f\x00\x00\x00\
-\x02\x00\x37\x00\x00\x05\x19\x05\x8d\x00\x07\x00\x0c\x00\x2c\x00\
-\xb2\x00\x00\x00\x2b\xb0\x03\x33\xb2\x01\x02\x00\x2b\xb4\x06\x08\
-\x00\x01\x0d\x2b\xb1\x06\x05\xe9\x01\xb0\x0d\x2f\xb1\x0e\x01\x2b\
-\x00\xb1\x01\x08\x11\x12\xb0\x0b\x39\x30\x31\x33\x01\x33\x01\x23\
-\x03\x21\x03\x13\x21\x02\x27\x06\x37\x02\x17\xb6\x02\x15\xbd\x9e\
-\xfd\xaf\x9c\xc7\x01\xfb\xf2\x0b\x1b\x05\x8d\xfa\x73\x01\xa2\xfe\
-\x5e\x02\x14\x02\x9e\x4c\x7d\x00\x02\x00\xc5\x00\x00\x04\xe1\x05\
-\x8d\x00\x13\x00\x22\x00\x53\x00\xb2\x00\x00\x00\x2b\xb1\x14\x05\
-\xe9\xb2\x01\x02\x00\x2b\xb1\x06\x08\xe9\xb4\x08\x21\x00\x01\x0d\
-\x2b\xb1\x08\x03\xe9\x01\xb0\x23\x2f\xb0\x00\xd6\xb1\x14\x14\xe9\
-\xb0\x07\x32\xb2\x14\x00\x0a\x2b\xb3\x40\x14\x02\x09\x2b\xb0\x14\
-\x10\xb1\x18\x01\x2b\xb1\x0e\x13\xe9\xb1\x24\x01\x2b\x00\xb1\x21\
-\x14\x11\x12\xb1\x0e\x18\x39\x39\x30\x31\x33\x11\x21\x15\x23\x27\
-\x21\x27\x11\x21\x32\x1e\x02\x15\x14\x04\x07\x06\x23\x25\x21\x32\
-\x36\x35\x34\x2e\x02\x23\x22\x06\x2b\x01\x07\xc5\x03\xaa\x79\x33\
-\xfe\x02\x54\x01\x4b\x91\xe0\x79\x3b\xfe\xfe\xb8\x23\x43\xfe\xb0\
-\x01\x22\xd3\xd3\x2d\x5e\xb2\x75\x08\x1f\x08\xe5\x02\x05\x8d\x87\
-\x02\x02\xfe\x19\x50\x7f\x85\x42\x98\xde\x13\x04\x73\xb2\x68\x2d\
-\x5d\x58\x37\x02\x4c\x00\x00\x00\x03\x00\xc5\x00\x00\x04\xe1\x05\
-\x8d\x00\x12\x00\x1e\x00\x28\x00\x63\x00\xb2\x00\x00\x00\x2b\xb1\
-\x13\x05\xe9\xb2\x01\x02\x00\x2b\xb1\x27\x05\xe9\xb4\x1f\x1d\x00\
-\x01\x0d\x2b\xb1\x1f\x03\xe9\x01\xb0\x29\x2f\xb0\x00\xd6\xb1\x13\
-\x14\xe9\xb0\x1f\x32\xb0\x13\x10\xb1\x17\x01\x2b\xb1\x0d\x13\xe9\
-\xb0\x23\x20\xd6\x11\xb1\x07\x0d\xe9\xb1\x2a\x01\x2b\xb1\x23\x13\
-\x11\x12\xb0\x0a\x39\x00\xb1\x1d\x13\x11\x12\xb0\x0d\x39\xb0\x1f\
-\x11\xb0\x0a\x39\xb0\x27\x12\xb0\x07\x39\x30\x31\x33\x11\x21\x32\
-\x1e\x02\x15\x14\x06\x07\x1e\x01\x15\x14\x04\x07\x06\x23\x25\x21\
-\x32\x36\x35\x34\x26\x27\x26\x2b\x01\x07\x35\x33\x32\x36\x35\x34\
-\x26\x2b\x01\x07\xc5\x01\xc6\x8d\xdc\x79\x3b\xb0\xa8\xa4\xed\xfe\
-\xfc\xb4\x23\x45\xfe\xb0\x01\x22\xd1\xd5\xd5\x95\x12\x57\xf3\x02\
-\xf5\xc1\xdf\xd3\xd7\xe9\x02\x05\x8d\x45\x6f\x77\x39\x66\xb1\x2b\
-\x1b\xc2\x89\x96\xd4\x13\x04\x73\xac\x64\x71\x9f\x0f\x02\x4c\xcb\
-\xa0\x64\x5a\x9a\x48\x00\x00\x00\x01\x00\xc1\x00\x00\x03\xfe\x05\
-\x8d\x00\x08\x00\x2c\x00\xb2\x00\x00\x00\x2b\xb2\x01\x02\x00\x2b\
-\xb1\x06\x08\xe9\x01\xb0\x09\x2f\xb0\x00\xd6\xb1\x08\x0e\xe9\xb2\
-\x08\x00\x0a\x2b\xb3\x40\x08\x02\x09\x2b\xb1\x0a\x01\x2b\x00\x30\
-\x31\x33\x11\x21\x15\x23\x27\x21\x27\x11\xc1\x03\x3d\x66\x32\xfe\
-\x48\x35\x05\x8d\x87\x02\x02\xfa\xf6\x00\x00\x00\x02\x00\x48\xfe\
-\x71\x05\x87\x05\x8d\x00\x11\x00\x1f\x00\x64\x00\xb2\x0f\x00\x00\
-\x2b\xb1\x12\x09\xe9\xb1\x00\x0a\x32\x32\xb2\x08\x02\x00\x2b\xb1\
-\x15\x08\xe9\xb0\x11\x2f\xb0\x0c\x33\x01\xb0\x20\x2f\xb0\x11\xd6\
-\xb1\x10\x0f\xe9\xb0\x10\x10\xb1\x07\x01\x2b\xb4\x18\x0f\x00\x20\
-\x04\x2b\xb0\x18\x10\xb1\x13\x01\x2b\xb1\x0a\x0e\xe9\xb0\x0a\x10\
-\xb1\x0d\x01\x2b\xb1\x0c\x0f\xe9\xb1\x21\x01\x2b\xb1\x07\x10\x11\
-\x12\xb0\x12\x39\xb0\x18\x11\xb1\x19\x1b\x39\x39\x00\x30\x31\x37\
-\x33\x3e\x02\x37\x36\x13\x35\x21\x11\x33\x11\x23\x11\x21\x11\x23\
-\x01\x21\x11\x21\x14\x0e\x07\x07\x48\x6c\x33\x42\x60\x1b\x1f\x06\
-\x03\x25\x99\x83\xfb\xc7\x83\x01\x14\x02\xd9\xfe\x19\x02\x02\x06\
-\x0d\x10\x1d\x25\x33\x1f\x89\x3d\x5f\xfa\xa4\xb6\x01\xa6\x6e\xfa\
-\xfc\xfd\xe8\x01\x8f\xfe\x71\x02\x18\x04\x81\x0a\x87\x44\x97\x67\
-\x99\x79\x8b\x7f\x38\x00\x00\x00\x01\x00\xc1\x00\x00\x04\x71\x05\
-\x8d\x00\x12\x00\x4a\x00\xb2\x00\x00\x00\x2b\xb1\x0e\x0b\xe9\xb2\
-\x01\x02\x00\x2b\xb1\x06\x08\xe9\xb4\x08\x0b\x00\x01\x0d\x2b\xb1\
-\x08\x03\xe9\x01\xb0\x13\x2f\xb0\x00\xd6\xb1\x0c\x0e\xe9\xb0\x07\
-\x32\xb2\x0c\x00\x0a\x2b\xb3\x40\x0c\x12\x09\x2b\xb3\x40\x0c\x02\
-\x09\x2b\xb3\x40\x0c\x0a\x09\x2b\xb1\x14\x01\x2b\x00\x30\x31\x33\
-\x11\x21\x15\x23\x27\x21\x27\x11\x21\x15\x21\x11\x33\x37\x21\x37\
-\x33\x15\xc1\x03\x93\x75\x33\xfe\x15\x48\x02\xa4\xfd\x5c\xae\x31\
-\x01\x8d\x2d\x5f\x05\x8d\x87\x02\x02\xfe\x19\x7f\xfd\xeb\x02\x02\
-\x93\x00\x00\x00\x01\x00\x54\x00\x00\x08\x8b\x05\x8d\x00\x13\x00\
-\x3a\x00\xb2\x00\x00\x00\x2b\xb1\x0b\x0f\x33\x33\xb2\x02\x02\x00\
-\x2b\xb1\x05\x08\x33\x33\x01\xb0\x14\x2f\xb0\x10\xd6\xb0\x04\x32\
-\xb1\x0f\x15\xe9\xb0\x06\x32\xb1\x15\x01\x2b\x00\xb1\x02\x00\x11\
-\x12\xb3\x04\x07\x0d\x12\x24\x17\x39\x30\x31\x33\x09\x01\x33\x01\
-\x11\x33\x11\x01\x33\x09\x01\x23\x09\x01\x11\x23\x11\x09\x01\x54\
-\x02\x42\xfd\xdb\xbe\x02\xe8\xb0\x02\xe9\xbf\xfd\xdb\x02\x41\xc0\
-\xfe\x0e\xfe\xee\xb0\xfe\xef\xfe\x0e\x03\x5c\x02\x31\xfd\x09\x02\
-\xf7\xfd\x09\x02\xf7\xfd\xcf\xfc\xa4\x02\xe7\xfe\xec\xfe\x2d\x01\
-\xd3\x01\x14\xfd\x19\x00\x00\x00\x01\x00\x66\xff\xd3\x04\x8d\x05\
-\xba\x00\x33\x00\x61\x00\xb2\x31\x00\x00\x2b\xb1\x06\x05\xe9\xb2\
-\x20\x02\x00\x2b\xb1\x16\x05\xe9\xb4\x0e\x0d\x31\x20\x0d\x2b\xb1\
-\x0e\x03\xe9\x01\xb0\x34\x2f\xb0\x14\xd6\xb1\x25\x0d\xe9\xb0\x09\
-\x20\xd6\x11\xb1\x2e\x13\xe9\xb2\x09\x2e\x0a\x2b\xb3\x40\x09\x0d\
-\x09\x2b\xb1\x35\x01\x2b\x00\xb1\x0d\x06\x11\x12\xb2\x00\x01\x2e\
-\x39\x39\x39\xb0\x0e\x11\xb0\x2b\x39\xb0\x16\x12\xb3\x14\x1c\x1d\
-\x25\x24\x17\x39\x30\x31\x3f\x01\x1e\x03\x33\x32\x36\x35\x34\x26\
-\x2b\x01\x35\x33\x16\x33\x32\x36\x35\x10\x25\x22\x0e\x03\x07\x27\
-\x3e\x01\x33\x32\x1e\x02\x15\x14\x0e\x03\x07\x1e\x01\x15\x14\x04\
-\x23\x22\x26\x66\x48\x37\x36\x6a\x85\x5e\xb2\xcb\xc6\xcf\xc3\x8c\
-\x08\x10\xa4\xdd\xfe\xbf\x48\x81\x4a\x5a\x16\x23\x4e\x75\xe1\xa2\
-\x64\x9a\x91\x50\x0a\x29\x4a\x8b\x60\xb2\xef\xfe\xcf\xf6\xae\xcb\
-\x9e\x7d\x3d\x34\x4a\x1a\xbc\x73\x71\xbe\x7f\x02\x9d\x7d\x01\x0c\
-\x01\x21\x1f\x4a\x16\x27\x89\x5c\x54\x1e\x4c\x9e\x75\x1b\x36\x56\
-\x48\x4e\x19\x1f\xce\x87\xa6\xfa\x52\x00\x00\x00\x01\x00\xc1\x00\
-\x00\x04\xcb\x05\x8d\x00\x0c\x00\x42\x00\xb2\x00\x00\x00\x2b\xb0\
-\x07\x33\xb2\x01\x02\x00\x2b\xb0\x05\x33\x01\xb0\x0d\x2f\xb0\x00\
-\xd6\xb1\x03\x15\xe9\xb0\x03\x10\xb1\x08\x01\x2b\xb1\x07\x14\xe9\
-\xb1\x0e\x01\x2b\xb1\x08\x03\x11\x12\xb1\x05\x0c\x39\x39\x00\xb1\
-\x01\x00\x11\x12\xb1\x03\x0a\x39\x39\x30\x31\x33\x11\x33\x11\x37\
-\x01\x33\x11\x23\x11\x27\x07\x01\xc1\xb0\x47\x02\x19\xfa\xae\x02\
-\x48\xfd\xe7\x05\x8d\xfb\x02\x9c\x04\x62\xfa\x73\x04\xbc\x42\x9c\
-\xfb\x9e\x00\x00\x02\x00\xc1\x00\x00\x04\xcb\x07\x1d\x00\x0c\x00\
-\x1c\x00\x81\x00\xb2\x00\x00\x00\x2b\xb0\x07\x33\xb2\x01\x02\x00\
-\x2b\xb0\x05\x33\xb0\x1a\x2f\xb1\x12\x09\xe9\xb2\x12\x1a\x0a\x2b\
-\xb3\x40\x12\x0d\x09\x2b\xb0\x16\x32\x01\xb0\x1d\x2f\xb0\x00\xd6\
-\xb1\x03\x15\xe9\xb3\x0d\x03\x00\x08\x2b\xb4\x0e\x0f\x00\x20\x04\
-\x2b\xb0\x03\x10\xb1\x08\x01\x2b\xb1\x07\x14\xe9\xb3\x17\x07\x08\
-\x08\x2b\xb4\x16\x16\x00\x32\x04\x2b\xb0\x16\x2f\xb4\x17\x16\x00\
-\x32\x04\x2b\xb1\x1e\x01\x2b\xb1\x16\x00\x11\x12\xb1\x0c\x1a\x39\
-\x39\xb0\x17\x11\xb0\x05\x39\x00\xb1\x01\x00\x11\x12\xb1\x03\x0a\
-\x39\x39\x30\x31\x33\x11\x33\x11\x37\x01\x33\x11\x23\x11\x27\x07\
-\x01\x03\x33\x1e\x02\x33\x32\x3e\x01\x37\x33\x0e\x01\x23\x22\x26\
-\xc1\xb0\x47\x02\x19\xfa\xae\x02\x48\xfd\xe7\x50\x7f\x06\x5f\x50\
-\x27\x29\x51\x5f\x06\x7d\x04\xd1\x85\x87\xd2\x05\x8d\xfb\x02\x9c\
-\x04\x62\xfa\x73\x04\xbc\x42\x9c\xfb\x9e\x07\x1d\x3d\x48\x0f\x0f\
-\x47\x3e\x85\x98\x98\x00\x00\x00\x01\x00\xc3\x00\x00\x05\x35\x05\
-\x8d\x00\x0c\x00\x30\x00\xb2\x00\x00\x00\x2b\xb0\x08\x33\xb2\x01\
-\x02\x00\x2b\xb0\x04\x33\x01\xb0\x0d\x2f\xb0\x00\xd6\xb1\x0c\x15\
-\xe9\xb0\x02\x32\xb1\x0e\x01\x2b\x00\xb1\x01\x00\x11\x12\xb1\x03\
-\x0a\x39\x39\x30\x31\x33\x11\x33\x11\x01\x33\x01\x15\x01\x23\x09\
-\x01\x11\xc3\xb0\x02\xe7\xbf\xfd\xdb\x02\x41\xc0\xfe\x0e\xfe\xf0\
-\x05\x8d\xfd\x09\x02\xf7\xfd\xcf\x02\xfc\xa6\x02\xe7\xfe\xec\xfe\
-\x2d\x00\x00\x00\x01\x00\x27\x00\x00\x04\xee\x05\x8d\x00\x16\x00\
-\x33\x00\xb2\x00\x00\x00\x2b\xb0\x0e\x33\xb1\x01\x03\xe9\xb2\x0c\
-\x02\x00\x2b\xb1\x11\x08\xe9\x01\xb0\x17\x2f\xb0\x0c\xd6\xb1\x11\
-\x0f\xe9\xb0\x11\x10\xb1\x0f\x01\x2b\xb1\x0e\x0e\xe9\xb1\x18\x01\
-\x2b\x00\x30\x31\x33\x35\x33\x32\x3e\x05\x37\x12\x11\x21\x11\x23\
-\x11\x21\x10\x03\x0e\x01\x23\x27\x4e\x23\x18\x40\x1e\x36\x1e\x25\
-\x0f\x35\x03\x23\xb7\xfe\x17\x52\x33\xac\x79\x81\x02\x0e\x1d\x3e\
-\x56\x87\x58\x01\x60\x02\x0c\xfa\x73\x05\x0a\xfd\xe1\xfe\x9a\xe5\
-\xa0\x00\x00\x00\x01\x00\xcd\x00\x00\x06\x33\x05\x8d\x00\x16\x00\
-\x42\x00\xb2\x00\x00\x00\x2b\xb0\x0b\x33\xb2\x01\x02\x00\x2b\xb0\
-\x09\x33\x01\xb0\x17\x2f\xb0\x00\xd6\xb1\x16\x0d\xe9\xb0\x16\x10\
-\xb1\x0c\x01\x2b\xb1\x0b\x0d\xe9\xb1\x18\x01\x2b\xb1\x0c\x16\x11\
-\x12\xb1\x02\x09\x39\x39\x00\xb1\x01\x00\x11\x12\xb1\x05\x0e\x39\
-\x39\x30\x31\x33\x11\x33\x01\x12\x17\x33\x36\x13\x01\x33\x11\x23\
-\x11\x27\x07\x03\x01\x23\x01\x02\x27\x11\xcd\xe9\x01\x3c\x83\x0a\
-\x02\x0a\x81\x01\x3c\xeb\xa0\x02\x14\x7b\xfe\xc5\x94\xfe\xcd\x83\
-\x10\x05\x8d\xfc\xcb\xfe\x9c\x38\x48\x01\x52\x03\x37\xfa\x73\x04\
-\xbc\x42\x4c\xfe\xb0\xfc\xcb\x03\x1d\x01\x64\x50\xfb\x02\x00\x00\
-\x01\x00\xc1\x00\x00\x04\xcb\x05\x8d\x00\x0b\x00\x3f\x00\xb2\x00\
-\x00\x00\x2b\xb0\x07\x33\xb2\x01\x02\x00\x2b\xb0\x05\x33\xb4\x03\
-\x0a\x00\x01\x0d\x2b\xb1\x03\x03\xe9\x01\xb0\x0c\x2f\xb0\x00\xd6\
-\xb1\x0b\x0e\xe9\xb0\x02\x32\xb0\x0b\x10\xb1\x08\x01\x2b\xb0\x04\
-\x32\xb1\x07\x0e\xe9\xb1\x0d\x01\x2b\x00\x30\x31\x33\x11\x33\x11\
-\x21\x11\x33\x11\x23\x11\x21\x11\xc1\xb8\x02\x9b\xb7\xb7\xfd\x65\
-\x05\x8d\xfd\x96\x02\x6a\xfa\x73\x02\xa4\xfd\x5c\x00\x00\x00\x00\
-\x02\x00\x71\xff\xd3\x05\x6f\x05\xba\x00\x0b\x00\x16\x00\x44\x00\
-\xb2\x09\x00\x00\x2b\xb1\x0f\x08\xe9\xb2\x03\x02\x00\x2b\xb1\x15\
-\x08\xe9\x01\xb0\x17\x2f\xb0\x00\xd6\xb1\x0d\x0e\xe9\xb0\x0d\x10\
-\xb1\x12\x01\x2b\xb1\x06\x0e\xe9\xb1\x18\x01\x2b\xb1\x12\x0d\x11\
-\x12\xb1\x03\x09\x39\x39\x00\xb1\x15\x0f\x11\x12\xb1\x06\x00\x39\
-\x39\x30\x31\x13\x10\x00\x21\x20\x00\x11\x10\x00\x21\x20\x00\x12\
-\x10\x12\x33\x32\x00\x11\x10\x00\x23\x22\x71\x01\x7b\x01\x06\x01\
-\x02\x01\x7b\xfe\x81\xff\x00\xfe\xfe\xfe\x83\xb8\xfe\xc9\xc3\x01\
-\x05\xfe\xf2\xba\xb8\x02\xc3\x01\x3d\x01\xba\xfe\x46\xfe\xc3\xfe\
-\xbe\xfe\x52\x01\xb1\x02\x68\xfd\xe7\xfe\x85\x01\x77\x01\x10\x01\
-\x0c\x01\x4c\x00\x01\x00\xc1\x00\x00\x04\xcb\x05\x8d\x00\x07\x00\
-\x2f\x00\xb2\x00\x00\x00\x2b\xb0\x03\x33\xb2\x01\x02\x00\x2b\xb1\
-\x06\x08\xe9\x01\xb0\x08\x2f\xb0\x00\xd6\xb1\x07\x0e\xe9\xb0\x07\
-\x10\xb1\x04\x01\x2b\xb1\x03\x0e\xe9\xb1\x09\x01\x2b\x00\x30\x31\
-\x33\x11\x21\x11\x23\x11\x21\x11\xc1\x04\x0a\xb7\xfd\x65\x05\x8d\
-\xfa\x73\x05\x0a\xfa\xf6\x00\x00\x02\x00\xc3\x00\x00\x04\xa8\x05\
-\x8d\x00\x0f\x00\x1c\x00\x4a\x00\xb2\x00\x00\x00\x2b\xb2\x01\x02\
-\x00\x2b\xb1\x1c\x05\xe9\xb4\x0e\x10\x00\x01\x0d\x2b\xb1\x0e\x06\
-\xe9\x01\xb0\x1d\x2f\xb0\x01\xd6\xb1\x10\x15\xe9\xb0\x0e\x32\xb0\
-\x10\x10\xb1\x16\x01\x2b\xb1\x07\x13\xe9\xb1\x1e\x01\x2b\xb1\x16\
-\x10\x11\x12\xb0\x0a\x39\x00\xb1\x1c\x10\x11\x12\xb0\x07\x39\x30\
-\x31\x33\x11\x21\x32\x17\x1e\x01\x15\x14\x00\x23\x22\x26\x2b\x01\
-\x11\x03\x21\x32\x3e\x02\x35\x34\x2e\x02\x23\x21\xc3\x01\xe3\xbc\
-\x7f\x5e\x69\xfe\xf8\xf2\x0a\x2d\x0d\xef\x06\x01\x10\x6a\xa0\x4e\
-\x25\x21\x4b\xa0\x71\xfe\xf0\x05\x8d\x50\x3b\xac\x64\xa0\xfe\xfc\
-\x02\xfd\xb0\x02\xc7\x39\x60\x61\x31\x2d\x5c\x62\x3e\x00\x00\x00\
-\x01\x00\x87\xff\xd3\x04\xb4\x05\xba\x00\x22\x00\x3d\x00\xb2\x20\
-\x00\x00\x2b\xb1\x13\x08\xe9\xb2\x05\x02\x00\x2b\xb1\x0d\x08\xe9\
-\x01\xb0\x23\x2f\xb0\x00\xd6\xb1\x10\x0e\xe9\xb1\x24\x01\x2b\x00\
-\xb1\x13\x20\x11\x12\xb0\x1d\x39\xb0\x0d\x11\xb2\x00\x0a\x1c\x39\
-\x39\x39\xb0\x05\x12\xb0\x09\x39\x30\x31\x13\x34\x12\x3e\x01\x33\
-\x32\x1e\x01\x17\x07\x2e\x01\x23\x22\x00\x11\x10\x00\x33\x32\x3e\
-\x06\x37\x17\x0e\x01\x23\x20\x00\x87\x75\xbc\xe2\x6e\x50\x5c\x94\
-\x56\x1f\x5c\x92\x6e\xcd\xfe\xe9\x01\x19\xd1\x27\x46\x31\x3b\x1d\
-\x37\x0e\x3e\x06\x0c\x6f\x9f\x7f\xfe\xdb\xfe\x85\x02\xc7\xa8\x01\
-\x22\xbd\x6c\x06\x1e\x21\xaa\x37\x35\xfe\x94\xfe\xfc\xfe\xfa\xfe\
-\x95\x06\x06\x15\x08\x21\x08\x27\x04\x8f\x42\x2f\x01\xc3\x00\x00\
-\x01\x00\x48\x00\x00\x05\x25\x05\x8d\x00\x0d\x00\x3a\x00\xb2\x09\
-\x00\x00\x2b\xb2\x01\x02\x00\x2b\xb1\x0c\x08\xe9\xb0\x03\x32\x01\
-\xb0\x0e\x2f\xb0\x09\xd6\xb1\x08\x0e\xe9\xb2\x08\x09\x0a\x2b\xb3\
-\x40\x08\x02\x09\x2b\xb2\x09\x08\x0a\x2b\xb3\x40\x09\x01\x09\x2b\
-\xb1\x0f\x01\x2b\x00\x30\x31\x13\x35\x21\x15\x23\x27\x23\x27\x11\
-\x23\x11\x07\x23\x07\x48\x04\xdd\x58\x2b\xa0\xf0\xb8\xf0\x9f\x2d\
-\x05\x06\x87\x87\x02\x02\xfa\xf6\x05\x0a\x02\x02\x00\x00\x00\x00\
-\x01\x00\x1d\x00\x00\x05\x37\x05\x8d\x00\x18\x00\x25\x00\xb2\x13\
-\x00\x00\x2b\xb1\x14\x08\xe9\xb2\x00\x02\x00\x2b\xb0\x07\x33\x01\
-\xb0\x19\x2f\xb1\x1a\x01\x2b\x00\xb1\x00\x14\x11\x12\xb0\x04\x39\
-\x30\x31\x13\x33\x00\x12\x17\x36\x13\x01\x33\x01\x0e\x05\x07\x06\
-\x2b\x01\x35\x33\x32\x36\x37\x1d\xc2\x01\x27\xdf\x0f\x0a\x71\x01\
-\x24\xa4\xfe\x7b\x02\x35\x15\x37\x29\x3d\x21\x56\x94\x6a\x7d\x54\
-\x58\x23\x05\x8d\xfd\xdf\xfe\x38\x50\x5e\x01\x15\x02\xc6\xfc\x67\
-\x06\x7d\x2d\x6f\x3b\x48\x17\x3b\x85\x35\x32\x00\x03\x00\x71\x00\
-\x00\x06\x35\x05\x8d\x00\x1c\x00\x2f\x00\x3c\x00\xdd\x00\xb2\x16\
-\x00\x00\x2b\xb2\x05\x02\x00\x2b\xb4\x17\x27\x16\x05\x0d\x2b\xb0\
-\x30\x33\xb1\x17\x03\xe9\xb0\x14\x32\xb1\x07\x05\x10\x20\xc0\x2f\
-\xb1\x3c\x03\xe9\xb1\x28\x29\x32\x32\x01\xb0\x3d\x2f\xb0\x00\xd6\
-\xb1\x1d\x15\xe9\xb0\x1d\x10\xb1\x16\x01\x2b\xb1\x04\x28\x32\x32\
-\xb1\x15\x14\xe9\xb1\x06\x30\x32\x32\xb0\x15\x10\xb1\x34\x01\x2b\
-\xb1\x0c\x15\xe9\xb1\x3e\x01\x2b\xb0\x36\x1a\xba\x07\x37\xc0\x68\
-\x00\x15\x2b\x0a\x0e\xb0\x28\x10\xb0\x2b\xc0\x04\xb1\x04\x1e\xf9\
-\x0e\xb0\x01\xc0\xb0\x01\x10\xb3\x02\x01\x04\x13\x2b\x05\xb0\x2b\
-\x10\xb3\x29\x2b\x28\x13\x2b\xba\x08\x20\xc0\x85\x00\x15\x2b\x0b\
-\xb3\x2a\x2b\x28\x13\x2b\xb2\x02\x01\x04\x20\x8a\x20\x8a\x23\x06\
-\x0e\x11\x12\x39\xb2\x2a\x2b\x28\x11\x12\x39\x00\xb3\x02\x04\x2a\
-\x2b\x2e\x2e\x2e\x2e\x01\xb3\x02\x29\x2a\x2b\x2e\x2e\x2e\x2e\xb0\
-\x40\x1a\x01\x00\xb1\x27\x17\x11\x12\xb0\x18\x39\xb0\x3c\x11\xb0\
-\x00\x39\xb0\x07\x12\xb0\x08\x39\x30\x31\x13\x10\x25\x36\x37\x35\
-\x33\x15\x16\x04\x17\x16\x07\x14\x0e\x05\x07\x15\x23\x35\x26\x27\
-\x26\x27\x26\x37\x14\x1e\x05\x17\x16\x33\x11\x0e\x06\x01\x36\x37\
-\x36\x11\x34\x2e\x05\x27\x71\x02\x08\x2f\x56\xac\xb2\x01\x0a\x5b\
-\x75\x01\x35\x4c\x7b\x68\x94\x56\x3d\xac\xe3\x75\x5a\x42\x99\xb2\
-\x27\x33\x5c\x42\x6e\x2d\x2f\x10\x09\x31\x27\x7b\x42\x66\x35\x2b\
-\x02\x87\xaa\x4c\xe5\x29\x35\x62\x42\x79\x2d\x33\x02\xe3\x01\xc9\
-\x3b\x04\x05\x9d\x9d\x08\x4a\x63\x81\xd7\x64\xa2\x68\x50\x29\x1b\
-\x08\x02\xd7\xd7\x0c\x2b\x23\x37\x85\xf8\x4c\x7a\x50\x3c\x1e\x17\
-\x04\x04\x02\x03\x1f\x04\x02\x15\x1d\x3b\x50\x7d\xfe\x21\x0e\x1d\
-\x56\x01\x10\x4e\x7b\x4e\x3d\x1d\x14\x05\x04\x00\x01\x00\x1d\x00\
-\x00\x05\x37\x05\x8d\x00\x0d\x00\x26\x00\xb2\x00\x00\x00\x2b\xb0\
-\x0a\x33\xb2\x03\x02\x00\x2b\xb0\x06\x33\x01\xb0\x0e\x2f\xb1\x0f\
-\x01\x2b\x00\xb1\x03\x00\x11\x12\xb1\x05\x0c\x39\x39\x30\x31\x33\
-\x01\x35\x01\x33\x09\x01\x33\x01\x15\x01\x23\x09\x01\x1d\x02\x25\
-\xfd\xf7\xd7\x01\x8c\x01\x81\xc4\xfe\x13\x02\x43\xd7\xfe\x3c\xfe\
-\x45\x02\xec\x02\x02\x9f\xfd\xea\x02\x16\xfd\x61\x02\xfd\x14\x02\
-\x71\xfd\x8f\x00\x01\x00\xc1\xfe\x71\x05\x64\x05\x8d\x00\x0b\x00\
-\x40\x00\xb2\x00\x00\x00\x2b\xb1\x03\x09\xe9\xb0\x07\x32\xb2\x01\
-\x02\x00\x2b\xb0\x05\x33\xb0\x0a\x2f\x01\xb0\x0c\x2f\xb0\x00\xd6\
-\xb1\x03\x0e\xe9\xb0\x03\x10\xb1\x04\x01\x2b\xb1\x07\x0e\xe9\xb0\
-\x07\x10\xb1\x0a\x01\x2b\xb1\x09\x0f\xe9\xb1\x0d\x01\x2b\x00\x30\
-\x31\x33\x11\x33\x11\x21\x11\x33\x11\x33\x11\x23\x11\xc1\xb8\x02\
-\x9b\xb7\x99\x83\x05\x8d\xfa\xfc\x05\x04\xfa\xfc\xfd\xe8\x01\x8f\
-\x00\x00\x00\x00\x01\x00\xc1\x00\x00\x04\xcb\x05\x8d\x00\x0f\x00\
-\x39\x00\xb2\x0a\x00\x00\x2b\xb2\x01\x02\x00\x2b\xb0\x07\x33\xb4\
-\x0c\x05\x0a\x01\x0d\x2b\xb1\x0c\x06\xe9\x01\xb0\x10\x2f\xb0\x00\
-\xd6\xb1\x03\x0e\xe9\xb0\x03\x10\xb1\x0a\x01\x2b\xb0\x06\x32\xb1\
-\x09\x0e\xe9\xb1\x11\x01\x2b\x00\x30\x31\x13\x11\x33\x11\x14\x17\
-\x21\x11\x33\x11\x23\x11\x21\x22\x27\x26\xc1\xb8\xcf\x01\xcc\xb7\
-\xb7\xfe\x3a\xb8\x79\x5c\x03\x98\x01\xf5\xfe\x17\xbc\x01\x02\xa6\
-\xfa\x73\x02\x6f\x6a\x50\x00\x00\x01\x00\xc1\x00\x00\x07\xe7\x05\
-\x8d\x00\x0b\x00\x3f\x00\xb2\x00\x00\x00\x2b\xb1\x03\x09\xe9\xb0\
-\x07\x32\xb2\x01\x02\x00\x2b\xb1\x05\x09\x33\x33\x01\xb0\x0c\x2f\
-\xb0\x00\xd6\xb1\x03\x15\xe9\xb0\x03\x10\xb1\x04\x01\x2b\xb1\x07\
-\x15\xe9\xb0\x07\x10\xb1\x08\x01\x2b\xb1\x0b\x15\xe9\xb1\x0d\x01\
-\x2b\x00\x30\x31\x33\x11\x33\x11\x21\x11\x33\x11\x21\x11\x33\x11\
-\xc1\xb0\x02\x8b\xb0\x02\x8b\xb0\x05\x8d\xfa\xfc\x05\x04\xfa\xfc\
-\x05\x04\xfa\x73\x00\x00\x00\x00\x01\x00\xc1\xfe\x71\x08\x81\x05\
-\x8d\x00\x0f\x00\x4f\x00\xb2\x00\x00\x00\x2b\xb1\x03\x09\xe9\xb1\
-\x07\x0b\x32\x32\xb2\x01\x02\x00\x2b\xb1\x05\x09\x33\x33\xb0\x0e\
-\x2f\x01\xb0\x10\x2f\xb0\x00\xd6\xb1\x03\x15\xe9\xb0\x03\x10\xb1\
-\x04\x01\x2b\xb1\x07\x15\xe9\xb0\x07\x10\xb1\x08\x01\x2b\xb1\x0b\
-\x15\xe9\xb0\x0b\x10\xb1\x0e\x01\x2b\xb1\x0d\x0f\xe9\xb1\x11\x01\
-\x2b\x00\x30\x31\x33\x11\x33\x11\x21\x11\x33\x11\x21\x11\x33\x11\
-\x33\x11\x23\x11\xc1\xb0\x02\x8b\xb0\x02\x8b\xb0\x9a\x83\x05\x8d\
-\xfa\xfc\x05\x04\xfa\xfc\x05\x04\xfa\xfc\xfd\xe8\x01\x8f\x00\x00\
-\x02\x00\x48\x00\x00\x06\x7d\x05\x8d\x00\x13\x00\x22\x00\x53\x00\
-\xb2\x0f\x00\x00\x2b\xb1\x14\x05\xe9\xb2\x01\x02\x00\x2b\xb1\x12\
-\x08\xe9\xb4\x03\x21\x0f\x01\x0d\x2b\xb1\x03\x03\xe9\x01\xb0\x23\
-\x2f\xb0\x0f\xd6\xb1\x14\x14\xe9\xb0\x02\x32\xb2\x0f\x14\x0a\x2b\
-\xb3\x40\x0f\x01\x09\x2b\xb0\x14\x10\xb1\x18\x01\x2b\xb1\x09\x13\
-\xe9\xb1\x24\x01\x2b\x00\xb1\x21\x14\x11\x12\xb1\x09\x18\x39\x39\
-\x30\x31\x13\x35\x21\x11\x21\x32\x1e\x02\x15\x14\x04\x07\x06\x23\
-\x21\x11\x07\x23\x07\x01\x21\x32\x36\x35\x34\x2e\x02\x23\x22\x06\
-\x2b\x01\x07\x48\x02\xc4\x01\x4e\x91\xe0\x77\x3b\xfe\xfe\xb8\x23\
-\x44\xfe\x04\xf6\x9f\x2d\x02\x6e\x01\x23\xd3\xd3\x2d\x5c\xb2\x75\
-\x08\x1f\x08\xe8\x02\x05\x06\x87\xfd\x96\x50\x7f\x85\x42\x98\xde\
-\x13\x04\x05\x0a\x02\x02\xfb\x6d\xb4\x66\x2d\x5d\x58\x37\x02\x4e\
-\x00\x00\x00\x00\x03\x00\xc5\x00\x00\x06\x4e\x05\x8d\x00\x0e\x00\
-\x1d\x00\x21\x00\x55\x00\xb2\x00\x00\x00\x2b\xb0\x1e\x33\xb1\x0f\
-\x05\xe9\xb2\x01\x02\x00\x2b\xb0\x1f\x33\xb4\x03\x1c\x00\x01\x0d\
-\x2b\xb1\x03\x03\xe9\x01\xb0\x22\x2f\xb0\x00\xd6\xb1\x0f\x14\xe9\
-\xb0\x02\x32\xb0\x0f\x10\xb1\x13\x01\x2b\xb1\x09\x13\xe9\xb0\x09\
-\x10\xb1\x1e\x01\x2b\xb1\x21\x0e\xe9\xb1\x23\x01\x2b\x00\xb1\x1c\
-\x0f\x11\x12\xb1\x09\x13\x39\x39\x30\x31\x33\x11\x33\x11\x21\x32\
-\x1e\x02\x15\x14\x04\x07\x06\x23\x25\x21\x32\x36\x35\x34\x2e\x02\
-\x23\x22\x06\x2b\x01\x07\x01\x11\x33\x11\xc5\xac\x01\x4b\x91\xe0\
-\x79\x3b\xfe\xfe\xb8\x23\x43\xfe\xb0\x01\x22\xd3\xd3\x2d\x5e\xb2\
-\x75\x08\x1f\x08\xe5\x02\x04\x25\xb8\x05\x8d\xfd\x96\x50\x7f\x85\
-\x42\x98\xde\x13\x04\x73\xb2\x68\x2d\x5d\x58\x37\x02\x4c\xfd\xa8\
-\x05\x8d\xfa\x73\x00\x00\x00\x00\x02\x00\xc5\x00\x00\x04\xe1\x05\
-\x8d\x00\x0e\x00\x1d\x00\x44\x00\xb2\x00\x00\x00\x2b\xb1\x0f\x05\
-\xe9\xb2\x01\x02\x00\x2b\xb4\x03\x1c\x00\x01\x0d\x2b\xb1\x03\x03\
-\xe9\x01\xb0\x1e\x2f\xb0\x00\xd6\xb1\x0f\x14\xe9\xb0\x02\x32\xb0\
-\x0f\x10\xb1\x13\x01\x2b\xb1\x09\x13\xe9\xb1\x1f\x01\x2b\x00\xb1\
-\x1c\x0f\x11\x12\xb1\x09\x13\x39\x39\x30\x31\x33\x11\x33\x11\x21\
-\x32\x1e\x02\x15\x14\x04\x07\x06\x23\x25\x21\x32\x36\x35\x34\x2e\
-\x02\x23\x22\x06\x2b\x01\x07\xc5\xac\x01\x4b\x91\xe0\x79\x3b\xfe\
-\xfe\xb8\x23\x43\xfe\xb0\x01\x22\xd3\xd3\x2d\x5e\xb2\x75\x08\x1f\
-\x08\xe5\x02\x05\x8d\xfd\x96\x50\x7f\x85\x42\x98\xde\x13\x04\x73\
-\xb2\x68\x2d\x5d\x58\x37\x02\x4c\x00\x00\x00\x00\x01\x00\x66\xff\
-\xd3\x04\x93\x05\xba\x00\x24\x00\x5e\x00\xb2\x22\x00\x00\x2b\xb1\
-\x0b\x08\xe9\xb2\x1c\x02\x00\x2b\xb1\x15\x08\xe9\xb4\x10\x11\x22\
-\x1c\x0d\x2b\xb1\x10\x03\xe9\x01\xb0\x25\x2f\xb0\x0f\xd6\xb0\x12\
-\x32\xb1\x1f\x0e\xe9\xb2\x0f\x1f\x0a\x2b\xb3\x40\x0f\x10\x09\x2b\
-\xb1\x26\x01\x2b\x00\xb1\x0b\x22\x11\x12\xb0\x00\x39\xb0\x10\x11\
-\xb0\x01\x39\xb0\x11\x12\xb0\x1f\x39\xb0\x15\x11\xb0\x18\x39\xb0\
-\x1c\x12\xb0\x19\x39\x30\x31\x3f\x01\x1e\x08\x33\x32\x3e\x01\x37\
-\x21\x35\x21\x26\x00\x23\x22\x06\x07\x27\x3e\x01\x33\x20\x00\x11\
-\x10\x00\x21\x22\x26\x66\x0d\x06\x3b\x0a\x36\x14\x33\x25\x3a\x3b\
-\x23\x89\xdb\x73\x0a\xfd\x3e\x02\xc2\x0e\xfe\xf1\xc4\x6d\x95\x5c\
-\x1d\x75\xa1\x7f\x01\x0e\x01\x73\xfe\x86\xfe\xdb\x7f\xa0\x44\x8f\
-\x04\x25\x08\x1f\x06\x15\x04\x0c\x02\xac\xfa\x8b\x7f\xe3\x01\x4e\
-\x35\x37\xaa\x2b\x1a\xfe\x3c\xfe\xd1\xfe\xcf\xfe\x3d\x2f\x00\x00\
-\x02\x00\xc1\xff\xd3\x07\xe1\x05\xba\x00\x12\x00\x1d\x00\x6c\x00\
-\xb2\x00\x00\x00\x2b\xb2\x0d\x00\x00\x2b\xb1\x16\x08\xe9\xb2\x01\
-\x02\x00\x2b\xb2\x07\x02\x00\x2b\xb1\x1b\x08\xe9\xb4\x11\x03\x0d\
-\x07\x0d\x2b\xb1\x11\x03\xe9\x01\xb0\x1e\x2f\xb0\x00\xd6\xb1\x12\
-\x0e\xe9\xb0\x02\x32\xb0\x12\x10\xb1\x10\x01\x2b\xb0\x04\x32\xb1\
-\x13\x0e\xe9\xb0\x13\x10\xb1\x18\x01\x2b\xb1\x0a\x0e\xe9\xb1\x1f\
-\x01\x2b\xb1\x18\x13\x11\x12\xb1\x0d\x07\x39\x39\x00\xb1\x03\x11\
-\x11\x12\xb2\x0a\x13\x18\x39\x39\x39\x30\x31\x33\x11\x33\x11\x21\
-\x12\x00\x33\x20\x00\x11\x10\x00\x21\x22\x00\x03\x21\x11\x01\x10\
-\x00\x20\x00\x11\x10\x00\x23\x22\x00\xc1\xb8\x01\x6c\x1f\x01\x77\
-\xe7\x01\x02\x01\x7d\xfe\x83\xfe\xfe\xe5\xfe\x89\x21\xfe\x94\x02\
-\x21\x01\x06\x01\x85\x01\x06\xfe\xf2\xbb\xb8\xfe\xf0\x05\x8d\xfd\
-\x73\x01\x48\x01\x72\xfe\x4c\xfe\xbd\xfe\xc3\xfe\x4d\x01\x6a\x01\
-\x46\xfd\x7d\x02\xdf\xfe\xee\xfe\x8b\x01\x77\x01\x10\x01\x0c\x01\
-\x4c\xfe\xb4\x00\x02\x00\x37\x00\x00\x04\x64\x05\x8d\x00\x0f\x00\
-\x1a\x00\x5b\x00\xb2\x00\x00\x00\x2b\xb0\x0b\x33\xb2\x09\x02\x00\
-\x2b\xb1\x18\x05\xe9\xb4\x15\x0e\x00\x09\x0d\x2b\xb1\x15\x06\xe9\
-\x01\xb0\x1b\x2f\xb0\x04\xd6\xb1\x10\x13\xe9\xb0\x10\x10\xb1\x0c\
-\x01\x2b\xb0\x16\x32\xb1\x0b\x15\xe9\xb1\x1c\x01\x2b\xb1\x10\x04\
-\x11\x12\xb0\x0f\x39\xb0\x0c\x11\xb1\x01\x0e\x39\x39\x00\xb1\x15\
-\x0e\x11\x12\xb0\x01\x39\xb0\x18\x11\xb0\x04\x39\x30\x31\x33\x01\
-\x2e\x01\x35\x34\x3e\x02\x33\x21\x11\x23\x11\x23\x01\x13\x14\x1e\
-\x02\x33\x21\x11\x21\x22\x06\x37\x01\xf6\xcb\xf1\x3b\x79\xdf\x92\
-\x01\xce\xb2\xd9\xfe\x27\x17\x24\x52\xa4\x6f\x01\x12\xfe\xee\xd7\
-\xb2\x02\x91\x19\xe3\x8e\x3d\x79\x75\x47\xfa\x73\x02\x8d\xfd\x73\
-\x04\x1b\x2f\x59\x58\x35\x02\x15\x9e\x00\x00\x00\x02\x00\x5a\xff\
-\xe9\x03\x33\x03\xb0\x00\x1b\x00\x27\x00\x75\x00\xb2\x14\x00\x00\
-\x2b\xb2\x19\x00\x00\x2b\xb1\x1f\x03\xe9\xb2\x0f\x01\x00\x2b\xb1\
-\x0a\x07\xe9\xb4\x23\x05\x19\x0f\x0d\x2b\xb1\x23\x0c\xe9\x01\xb0\
-\x28\x2f\xb0\x00\xd6\xb1\x1c\x10\xe9\xb0\x1c\x10\xb1\x22\x01\x2b\
-\xb1\x05\x14\x32\x32\xb1\x13\x0d\xe9\xb1\x29\x01\x2b\xb1\x1c\x00\
-\x11\x12\xb1\x0c\x0d\x39\x39\xb0\x22\x11\xb2\x0a\x0f\x19\x39\x39\
-\x39\xb0\x13\x12\xb0\x11\x39\x00\xb1\x05\x19\x11\x12\xb1\x00\x15\
-\x39\x39\xb0\x0a\x11\xb0\x0c\x39\xb0\x0f\x12\xb0\x0d\x39\x30\x31\
-\x37\x34\x3e\x02\x33\x35\x26\x27\x26\x23\x22\x07\x27\x36\x33\x32\
-\x16\x17\x11\x23\x35\x0e\x02\x23\x22\x26\x37\x14\x16\x33\x32\x36\
-\x3d\x01\x22\x0e\x02\x5a\x73\xba\xb2\x5a\x04\x31\x33\x4e\x9e\x95\
-\x0c\x9a\xa7\x8d\xbf\x08\x9b\x08\x3c\xac\x64\x75\x75\x96\x6c\x52\
-\x58\x8d\x3f\x83\x8b\x56\xe7\x4c\x71\x37\x1b\x45\x83\x3a\x3d\x68\
-\x89\x5a\xba\x85\xfd\x8f\x48\x08\x25\x32\xa6\x5a\x37\x4a\x4a\x58\
-\x81\x10\x21\x44\x00\x00\x00\x00\x02\x00\x3d\xff\xe9\x03\xc1\x05\
-\xc7\x00\x22\x00\x2e\x00\xbd\x00\xb2\x1e\x00\x00\x2b\xb1\x26\x08\
-\xe9\xb2\x07\x02\x00\x2b\xb2\x18\x01\x00\x2b\xb1\x2c\x03\xe9\x01\
-\xb0\x2f\x2f\xb0\x00\xd6\xb1\x23\x0d\xe9\xb0\x23\x10\xb1\x29\x01\
-\x2b\xb1\x1b\x0d\xe9\xb1\x30\x01\x2b\xb0\x36\x1a\xba\x07\x89\xc0\
-\x72\x00\x15\x2b\x0a\xb0\x07\x2e\x0e\xb0\x04\xc0\xb1\x0a\x0a\xf9\
-\xb0\x0d\xc0\xb0\x04\x10\xb3\x05\x04\x07\x13\x2b\xb0\x0d\x10\xb3\
-\x0b\x0d\x0a\x13\x2b\xb3\x0c\x0d\x0a\x13\x2b\xb2\x05\x04\x07\x20\
-\x8a\x20\x8a\x23\x06\x0e\x11\x12\x39\xb2\x0b\x0d\x0a\x11\x12\x39\
-\xb0\x0c\x39\x00\xb4\x05\x0a\x0d\x0b\x0c\x2e\x2e\x2e\x2e\x2e\x01\
-\xb5\x05\x07\x0a\x0d\x0b\x0c\x2e\x2e\x2e\x2e\x2e\x2e\xb0\x40\x1a\
-\x01\xb1\x23\x00\x11\x12\xb0\x16\x39\xb0\x29\x11\xb1\x18\x1e\x39\
-\x39\xb0\x1b\x12\xb0\x08\x39\x00\xb1\x2c\x26\x11\x12\xb1\x1b\x16\
-\x39\x39\x30\x31\x13\x35\x12\x37\x12\x25\x36\x25\x15\x14\x07\x06\
-\x04\x07\x0e\x05\x07\x06\x15\x36\x33\x32\x00\x15\x14\x00\x23\x22\
-\x24\x27\x26\x37\x14\x16\x33\x32\x36\x35\x34\x26\x23\x22\x06\x3d\
-\x08\x1b\x48\x01\x1f\x10\x01\x9a\x3c\x14\xfe\xe1\x21\x37\x58\x39\
-\x25\x1b\x08\x06\x08\x79\xc6\xb4\x01\x0b\xfe\xf5\xb8\xa4\xfe\xfe\
-\x16\x05\xa0\xa0\x81\x73\xae\xa4\x7d\x7f\xa2\x01\xe3\x50\x01\x48\
-\x7f\x01\x66\x3a\x04\x29\x2f\x4a\x13\x06\x23\x06\x0c\x33\x52\x46\
-\x6c\x33\x30\x46\x20\xb0\xfe\xdf\xcc\xc9\xfe\xef\xe6\xb4\x21\x33\
-\xa0\xca\xba\xb2\x9e\xba\xbe\x00\x03\x00\xa6\x00\x00\x03\x91\x03\
-\x8f\x00\x13\x00\x1b\x00\x23\x00\x63\x00\xb2\x00\x00\x00\x2b\xb1\
-\x14\x03\xe9\xb2\x01\x01\x00\x2b\xb1\x23\x06\xe9\xb4\x1c\x1b\x00\
-\x01\x0d\x2b\xb1\x1c\x05\xe9\x01\xb0\x24\x2f\xb0\x00\xd6\xb1\x14\
-\x11\xe9\xb0\x1c\x32\xb0\x14\x10\xb1\x17\x01\x2b\xb1\x0d\x0f\xe9\
-\xb0\x20\x20\xd6\x11\xb1\x07\x0f\xe9\xb1\x25\x01\x2b\xb1\x20\x14\
-\x11\x12\xb0\x0a\x39\x00\xb1\x1b\x14\x11\x12\xb0\x0d\x39\xb0\x1c\
-\x11\xb0\x0a\x39\xb0\x23\x12\xb0\x07\x39\x30\x31\x33\x11\x21\x32\
-\x1e\x02\x15\x14\x06\x07\x1e\x01\x15\x14\x07\x0e\x02\x23\x27\x33\
-\x20\x35\x34\x26\x2b\x01\x35\x33\x32\x36\x35\x34\x2b\x01\xa6\x01\
-\x7f\x3d\x5f\x6a\x39\x4b\x6b\x7b\x68\x47\x25\x71\x58\x43\xda\xbb\
-\x01\x08\x9a\xa5\x84\x32\x87\xe1\xe5\xb5\x03\x8f\x0e\x2b\x60\x4a\
-\x39\x50\x2d\x31\x6b\x46\x7b\x47\x25\x25\x08\x7d\x9a\x3d\x66\x73\
-\x39\x42\x6f\x00\x01\x00\xa4\x00\x00\x03\x08\x03\x8f\x00\x06\x00\
-\x2c\x00\xb2\x00\x00\x00\x2b\xb2\x01\x01\x00\x2b\xb1\x04\x07\xe9\
-\x01\xb0\x07\x2f\xb0\x00\xd6\xb1\x06\x0d\xe9\xb2\x06\x00\x0a\x2b\
-\xb3\x40\x06\x02\x09\x2b\xb1\x08\x01\x2b\x00\x30\x31\x33\x11\x21\
-\x15\x21\x27\x11\xa4\x02\x64\xfe\x89\x4d\x03\x8f\x7b\x03\xfc\xe9\
-\x00\x00\x00\x00\x02\x00\x37\xfe\xb4\x04\x14\x03\x8f\x00\x0e\x00\
-\x16\x00\x61\x00\xb2\x0c\x00\x00\x2b\xb1\x0f\x03\xe9\xb1\x00\x07\
-\x32\x32\xb2\x0c\x0f\x0a\x2b\xb3\x40\x0c\x0e\x09\x2b\xb0\x09\x32\
-\xb2\x05\x01\x00\x2b\xb1\x12\x03\xe9\x01\xb0\x17\x2f\xb0\x0e\xd6\
-\xb1\x0d\x0f\xe9\xb0\x0d\x10\xb1\x04\x01\x2b\xb1\x14\x0f\xe9\xb0\
-\x14\x10\xb1\x10\x01\x2b\xb1\x07\x11\xe9\xb0\x07\x10\xb1\x0a\x0b\
-\x2b\xb1\x09\x0f\xe9\xb1\x18\x01\x2b\xb1\x04\x0d\x11\x12\xb0\x0f\
-\x39\x00\x30\x31\x37\x33\x36\x12\x11\x35\x21\x11\x33\x11\x23\x11\
-\x21\x11\x23\x01\x21\x11\x21\x0e\x03\x37\x5a\x6f\x48\x02\x45\x87\
-\x83\xfd\x29\x83\x01\x11\x01\xac\xfe\xdf\x02\x04\x0f\x3f\x7d\x6f\
-\x01\x47\x01\x50\x0c\xfc\xee\xfe\x37\x01\x4c\xfe\xb4\x01\xc9\x02\
-\x93\x0e\xb6\x98\xdf\x00\x00\x00\x02\x00\x46\xff\xe9\x03\x50\x03\
-\xb0\x00\x14\x00\x1d\x00\x4f\x00\xb2\x12\x00\x00\x2b\xb1\x0d\x03\
-\xe9\xb2\x03\x01\x00\x2b\xb1\x1b\x03\xe9\xb4\x15\x0a\x12\x03\x0d\
-\x2b\xb1\x15\x05\xe9\x01\xb0\x1e\x2f\xb0\x00\xd6\xb1\x0a\x0f\xe9\
-\xb2\x0a\x00\x0a\x2b\xb3\x40\x0a\x09\x09\x2b\xb1\x1f\x01\x2b\x00\
-\xb1\x0d\x12\x11\x12\xb0\x10\x39\xb0\x0a\x11\xb0\x0f\x39\xb0\x15\
-\x12\xb0\x00\x39\x30\x31\x13\x34\x12\x33\x32\x1e\x02\x17\x15\x21\
-\x1e\x01\x33\x32\x37\x17\x06\x07\x22\x02\x13\x21\x2e\x03\x23\x22\
-\x06\x46\xf7\xa6\x3d\x6f\x71\x4a\x06\xfd\x85\x06\xb0\x79\x9c\x9b\
-\x0d\x9c\xa8\xc3\xfb\x99\x01\xfc\x0c\x40\x50\x3f\x1d\x68\x88\x01\
-\xcf\xcb\x01\x16\x27\x5a\xb4\x7d\x3b\x9a\xc1\x71\x87\x68\x01\x01\
-\x21\x01\x29\x50\x6f\x2f\x10\xa0\x00\x00\x00\x00\x01\x00\x21\x00\
-\x00\x05\xc5\x03\x8f\x00\x13\x00\x3a\x00\xb2\x00\x00\x00\x2b\xb1\
-\x0b\x0f\x33\x33\xb2\x02\x01\x00\x2b\xb1\x05\x08\x33\x33\x01\xb0\
-\x14\x2f\xb0\x10\xd6\xb0\x04\x32\xb1\x0f\x10\xe9\xb0\x06\x32\xb1\
-\x15\x01\x2b\x00\xb1\x02\x00\x11\x12\xb3\x04\x07\x0d\x12\x24\x17\
-\x39\x30\x31\x33\x09\x01\x33\x01\x11\x33\x11\x01\x33\x09\x01\x23\
-\x01\x07\x11\x23\x11\x27\x01\x21\x01\x89\xfe\xa4\xb8\x01\xa0\x93\
-\x01\xa6\xb9\xfe\xa3\x01\x8a\xa8\xfe\xbe\xa2\x93\x9c\xfe\xbf\x02\
-\x2d\x01\x62\xfe\x5a\x01\xa6\xfe\x54\x01\xac\xfe\x9e\xfd\xd3\x01\
-\xcb\xa2\xfe\xd7\x01\x2f\x9c\xfe\x35\x00\x00\x00\x01\x00\x39\xff\
-\xe9\x03\x48\x03\xb0\x00\x34\x00\x5f\x00\xb2\x33\x00\x00\x2b\xb1\
-\x04\x08\xe9\xb2\x1e\x01\x00\x2b\xb1\x17\x03\xe9\xb4\x0f\x0e\x33\
-\x1e\x0d\x2b\xb1\x0f\x05\xe9\x01\xb0\x35\x2f\xb0\x15\xd6\xb1\x26\
-\x0f\xe9\xb0\x07\x20\xd6\x11\xb1\x2e\x0f\xe9\xb1\x36\x01\x2b\x00\
-\xb1\x04\x33\x11\x12\xb0\x00\x39\xb0\x0e\x11\xb1\x01\x2e\x39\x39\
-\xb0\x0f\x12\xb0\x2b\x39\xb0\x17\x11\xb2\x1a\x23\x26\x39\x39\x39\
-\xb0\x1e\x12\xb0\x1b\x39\x30\x31\x3f\x01\x1e\x01\x33\x32\x36\x35\
-\x34\x2e\x01\x27\x26\x2b\x01\x35\x33\x32\x3e\x02\x37\x26\x21\x22\
-\x06\x07\x27\x3e\x01\x33\x32\x1e\x02\x17\x14\x16\x15\x14\x0e\x02\
-\x07\x1e\x01\x15\x14\x0e\x02\x23\x22\x39\x3a\x48\x7c\x5c\xa0\x87\
-\x14\x62\x54\x1b\x5a\x60\x74\x23\x4a\x64\x44\x04\x04\xfe\xef\x62\
-\x5e\x56\x39\x5e\x85\x6f\x44\x63\x90\x58\x0a\x02\x1d\x43\x21\x29\
-\x50\x71\x27\x58\xb7\x7c\xc3\x56\x7f\x37\x31\x66\x41\x19\x37\x48\
-\x0a\x04\x73\x08\x19\x3b\x2b\x7f\x21\x37\x7b\x37\x23\x0a\x27\x62\
-\x4e\x04\x11\x04\x27\x3d\x31\x13\x16\x1d\x75\x56\x31\x5e\x5e\x3a\
-\x00\x00\x00\x00\x01\x00\xa6\x00\x00\x03\xa2\x03\x8f\x00\x09\x00\
-\x42\x00\xb2\x00\x00\x00\x2b\xb0\x06\x33\xb2\x01\x01\x00\x2b\xb0\
-\x04\x33\x01\xb0\x0a\x2f\xb0\x00\xd6\xb1\x03\x11\xe9\xb0\x03\x10\
-\xb1\x07\x01\x2b\xb1\x06\x11\xe9\xb1\x0b\x01\x2b\xb1\x07\x03\x11\
-\x12\xb1\x04\x09\x39\x39\x00\xb1\x01\x00\x11\x12\xb1\x03\x08\x39\
-\x39\x30\x31\x33\x11\x33\x11\x01\x33\x11\x23\x11\x01\xa6\x99\x01\
-\x82\xe1\x9a\xfe\x7f\x03\x8f\xfd\x00\x03\x00\xfc\x71\x03\x00\xfd\
-\x00\x00\x00\x00\x02\x00\xa6\x00\x00\x03\xa2\x05\x1d\x00\x09\x00\
-\x1a\x00\x74\x00\xb2\x00\x00\x00\x2b\xb0\x06\x33\xb2\x01\x01\x00\
-\x2b\xb0\x04\x33\xb0\x19\x2f\xb1\x10\x09\xe9\xb2\x10\x19\x0a\x2b\
-\xb3\x40\x10\x0a\x09\x2b\xb0\x15\x32\x01\xb0\x1b\x2f\xb0\x00\xd6\
-\xb1\x03\x11\xe9\xb0\x0b\x32\xb0\x03\x10\xb4\x0a\x16\x00\x32\x04\
-\x2b\xb0\x0a\x2f\xb0\x03\x10\xb1\x07\x01\x2b\xb0\x15\x32\xb1\x06\
-\x11\xe9\xb4\x16\x16\x00\x32\x04\x2b\xb1\x1c\x01\x2b\xb1\x07\x03\
-\x11\x12\xb3\x04\x09\x18\x19\x24\x17\x39\x00\xb1\x01\x00\x11\x12\
-\xb1\x03\x08\x39\x39\x30\x31\x33\x11\x33\x11\x01\x33\x11\x23\x11\
-\x01\x03\x33\x1e\x03\x33\x32\x3e\x02\x37\x33\x0e\x01\x20\x26\xa6\
-\x99\x01\x82\xe1\x9a\xfe\x7f\xbc\x7d\x04\x35\x4c\x3d\x1b\x1d\x3b\
-\x4e\x35\x04\x7d\x04\xd1\xfe\xf6\xd3\x03\x8f\xfd\x00\x03\x00\xfc\
-\x71\x03\x00\xfd\x00\x05\x1d\x2d\x42\x1b\x0a\x0a\x1b\x42\x2d\x85\
-\x98\x9a\x00\x00\x01\x00\xa6\x00\x00\x03\xc5\x03\x8f\x00\x0b\x00\
-\x30\x00\xb2\x00\x00\x00\x2b\xb0\x07\x33\xb2\x01\x01\x00\x2b\xb0\
-\x04\x33\x01\xb0\x0c\x2f\xb0\x00\xd6\xb1\x0b\x10\xe9\xb0\x02\x32\
-\xb1\x0d\x01\x2b\x00\xb1\x01\x00\x11\x12\xb1\x03\x09\x39\x39\x30\
-\x31\x33\x11\x33\x11\x01\x33\x09\x01\x23\x01\x07\x11\xa6\x93\x01\
-\xa6\xb9\xfe\xa3\x01\x8a\xa8\xfe\xbe\xa2\x03\x8f\xfe\x54\x01\xac\
-\xfe\xa0\xfd\xd1\x01\xcb\xa2\xfe\xd7\x00\x00\x00\x01\x00\x27\x00\
-\x00\x03\x8f\x03\x8f\x00\x11\x00\x3e\x00\xb2\x00\x00\x00\x2b\xb0\
-\x09\x33\xb1\x01\x08\xe9\xb2\x07\x01\x00\x2b\xb1\x0c\x03\xe9\x01\
-\xb0\x12\x2f\xb0\x06\xd6\xb1\x0c\x0f\xe9\xb2\x06\x0c\x0a\x2b\xb3\
-\x40\x06\x00\x09\x2b\xb0\x0c\x10\xb1\x0a\x01\x2b\xb1\x09\x11\xe9\
-\xb1\x13\x01\x2b\x00\x30\x31\x33\x35\x33\x32\x36\x12\x11\x35\x21\
-\x11\x23\x11\x21\x14\x02\x0e\x01\x23\x27\x50\x48\x4f\x3a\x02\x47\
-\x99\xfe\xdf\x2f\x62\x75\x56\x85\x56\x01\x4e\x01\x39\x2d\xfc\x71\
-\x03\x10\xf4\xfe\xc3\xa4\x3b\x00\x01\x00\xa4\x00\x00\x04\xb4\x03\
-\x8f\x00\x10\x00\x42\x00\xb2\x00\x00\x00\x2b\xb0\x06\x33\xb2\x01\
-\x01\x00\x2b\xb0\x04\x33\x01\xb0\x11\x2f\xb0\x00\xd6\xb1\x10\x0d\
-\xe9\xb0\x10\x10\xb1\x07\x01\x2b\xb1\x06\x0d\xe9\xb1\x12\x01\x2b\
-\xb1\x07\x10\x11\x12\xb1\x02\x04\x39\x39\x00\xb1\x01\x00\x11\x12\
-\xb1\x03\x08\x39\x39\x30\x31\x33\x11\x33\x09\x01\x33\x11\x23\x11\
-\x06\x01\x23\x02\x27\x26\x27\x11\xa4\xd9\x01\x29\x01\x29\xe5\xa0\
-\x0c\xfe\xe4\x8a\xe3\x23\x10\x08\x03\x8f\xfd\x2d\x02\xd3\xfc\x71\
-\x03\x27\x58\xfd\x48\x02\x33\x72\x39\x32\xfc\xd9\x00\x00\x00\x00\
-\x01\x00\xa6\x00\x00\x03\x77\x03\x8f\x00\x0b\x00\x3f\x00\xb2\x00\
-\x00\x00\x2b\xb0\x07\x33\xb2\x01\x01\x00\x2b\xb0\x05\x33\xb4\x03\
-\x0a\x00\x01\x0d\x2b\xb1\x03\x05\xe9\x01\xb0\x0c\x2f\xb0\x00\xd6\
-\xb1\x0b\x11\xe9\xb0\x02\x32\xb0\x0b\x10\xb1\x08\x01\x2b\xb0\x04\
-\x32\xb1\x07\x11\xe9\xb1\x0d\x01\x2b\x00\x30\x31\x33\x11\x33\x11\
-\x21\x11\x33\x11\x23\x11\x21\x11\xa6\x99\x01\x9e\x9a\x9a\xfe\x62\
-\x03\x8f\xfe\x9e\x01\x62\xfc\x71\x01\xba\xfe\x46\x00\x00\x00\x00\
-\x02\x00\x3d\xff\xe9\x03\xc1\x03\xb0\x00\x0a\x00\x15\x00\x46\x00\
-\xb2\x09\x00\x00\x2b\xb1\x0e\x08\xe9\xb2\x03\x01\x00\x2b\xb1\x13\
-\x03\xe9\x01\xb0\x16\x2f\xb0\x00\xd6\xb1\x0b\x0d\xe9\xb0\x0b\x10\
-\xb1\x10\x01\x2b\xb1\x06\x0d\xe9\xb1\x17\x01\x2b\xb1\x10\x0b\x11\
-\x12\xb2\x08\x09\x03\x39\x39\x39\x00\xb1\x13\x0e\x11\x12\xb1\x06\
-\x00\x39\x39\x30\x31\x13\x34\x00\x33\x32\x00\x15\x14\x00\x20\x00\
-\x37\x14\x16\x32\x36\x35\x34\x26\x23\x22\x06\x3d\x01\x09\xb8\xc1\
-\x01\x02\xfe\xf1\xfe\x98\xfe\xf3\xa0\xae\xe6\xae\xae\x73\x71\xb0\
-\x01\xc5\xcf\x01\x1c\xfe\xd7\xc4\xcb\xfe\xf1\x01\x11\xdf\xb4\xb8\
-\xba\xb2\xac\xac\xac\x00\x00\x00\x01\x00\xa6\x00\x00\x03\x77\x03\
-\x8f\x00\x07\x00\x2f\x00\xb2\x00\x00\x00\x2b\xb0\x03\x33\xb2\x01\
-\x01\x00\x2b\xb1\x06\x03\xe9\x01\xb0\x08\x2f\xb0\x00\xd6\xb1\x07\
-\x11\xe9\xb0\x07\x10\xb1\x04\x01\x2b\xb1\x03\x11\xe9\xb1\x09\x01\
-\x2b\x00\x30\x31\x33\x11\x21\x11\x23\x11\x21\x11\xa6\x02\xd1\x9a\
-\xfe\x62\x03\x8f\xfc\x71\x03\x10\xfc\xf0\x00\x00\x02\x00\xa6\xfe\
-\x71\x03\xd7\x03\xa4\x00\x0e\x00\x22\x00\x5b\x00\xb2\x0b\x00\x00\
-\x2b\xb1\x12\x03\xe9\xb2\x01\x01\x00\x2b\xb2\x05\x01\x00\x2b\xb1\
-\x18\x08\xe9\xb0\x00\x2f\x01\xb0\x23\x2f\xb0\x00\xd6\xb1\x0e\x0d\
-\xe9\xb1\x02\x0f\x32\x32\xb0\x0e\x10\xb1\x15\x01\x2b\xb1\x08\x0d\
-\xe9\xb1\x24\x01\x2b\xb1\x15\x0e\x11\x12\xb1\x05\x0b\x39\x39\x00\
-\xb1\x12\x0b\x11\x12\xb0\x0d\x39\xb0\x18\x11\xb0\x08\x39\xb0\x01\
-\x12\xb0\x03\x39\x30\x31\x13\x11\x33\x15\x36\x33\x32\x12\x15\x14\
-\x02\x23\x22\x27\x19\x01\x14\x16\x33\x32\x36\x35\x34\x26\x23\x22\
-\x0e\x06\x0f\x01\xa6\x99\x96\xbe\x8d\xb7\xe3\x9a\x98\x7c\x74\x52\
-\x73\xb6\x9b\x7b\x17\x29\x23\x1e\x1b\x14\x13\x0a\x06\x06\xfe\x71\
-\x05\x1e\x64\x79\xfe\xe5\xbe\xd3\xfe\xf1\x75\xfe\x13\x02\x91\x2d\
-\x6f\xc5\x9c\x8b\xcf\x06\x0f\x0e\x12\x11\x14\x0d\x06\x08\x00\x00\
-\x01\x00\x48\xff\xe9\x03\x52\x03\xb0\x00\x18\x00\x3d\x00\xb2\x16\
-\x00\x00\x2b\xb1\x11\x08\xe9\xb2\x03\x01\x00\x2b\xb1\x0b\x08\xe9\
-\x01\xb0\x19\x2f\xb0\x00\xd6\xb1\x0e\x0d\xe9\xb1\x1a\x01\x2b\x00\
-\xb1\x11\x16\x11\x12\xb0\x14\x39\xb0\x0b\x11\xb2\x00\x07\x13\x39\
-\x39\x39\xb0\x03\x12\xb0\x06\x39\x30\x31\x13\x34\x12\x33\x32\x16\
-\x17\x07\x26\x27\x26\x23\x22\x06\x15\x14\x16\x33\x32\x37\x17\x06\
-\x07\x22\x00\x48\xf5\xcd\x60\x7f\x5f\x19\x64\x35\x3b\x53\x8b\x96\
-\xa0\x7f\xa0\xa2\x0a\xa2\xac\xbc\xff\x00\x01\xc9\xbe\x01\x29\x25\
-\x35\x87\x3f\x0f\x10\xd3\x91\x98\xc4\x6e\x89\x68\x01\x01\x19\x00\
-\x01\x00\x33\x00\x00\x03\x77\x03\x8f\x00\x0b\x00\x3a\x00\xb2\x08\
-\x00\x00\x2b\xb2\x01\x01\x00\x2b\xb1\x0a\x03\xe9\xb0\x03\x32\x01\
-\xb0\x0c\x2f\xb0\x08\xd6\xb1\x07\x0d\xe9\xb2\x07\x08\x0a\x2b\xb3\
-\x40\x07\x02\x09\x2b\xb2\x08\x07\x0a\x2b\xb3\x40\x08\x01\x09\x2b\
-\xb1\x0d\x01\x2b\x00\x30\x31\x13\x35\x21\x15\x23\x27\x23\x11\x23\
-\x11\x23\x07\x33\x03\x44\x56\x2b\xd1\xa0\xd1\x2b\x03\x0e\x81\x81\
-\x02\xfc\xf0\x03\x10\x02\x00\x00\x01\x00\x1d\xfe\x5c\x03\x91\x03\
-\x8f\x00\x19\x00\x2b\x00\xb2\x00\x01\x00\x2b\xb0\x07\x33\xb0\x0c\
-\x2f\xb1\x11\x05\xe9\x01\xb0\x1a\x2f\xb1\x1b\x01\x2b\x00\xb1\x11\
-\x0c\x11\x12\xb0\x0e\x39\xb0\x00\x11\xb1\x05\x0f\x39\x39\x30\x31\
-\x13\x33\x1a\x01\x16\x17\x36\x01\x33\x01\x0e\x01\x23\x22\x2f\x01\
-\x16\x33\x32\x36\x37\x36\x37\x36\x34\x27\x1d\xa1\x83\x84\x16\x0c\
-\x04\x01\x0d\x99\xfe\x44\x3b\x67\x4a\x54\x41\x0a\x6d\x28\x37\x38\
-\x39\x0e\x09\x08\x0a\x03\x8f\xfe\xd3\xfe\xac\x58\x50\x8f\x02\x9a\
-\xfb\xb9\x89\x63\x11\x85\x23\x50\x8b\x23\x14\x12\x1d\x15\x00\x00\
-\x03\x00\x48\xfe\x71\x05\xd7\x05\xc7\x00\x19\x00\x2b\x00\x3e\x00\
-\x85\x00\xb2\x17\x00\x00\x2b\xb0\x10\x33\xb1\x1d\x03\xe9\xb0\x35\
-\x32\xb2\x06\x02\x00\x2b\xb2\x03\x01\x00\x2b\xb0\x0a\x33\xb1\x29\
-\x08\xe9\xb0\x3b\x32\xb0\x14\x2f\x01\xb0\x3f\x2f\xb0\x00\xd6\xb1\
-\x1a\x0d\xe9\xb0\x1a\x10\xb1\x14\x01\x2b\xb1\x05\x20\x32\x32\xb1\
-\x13\x11\xe9\xb1\x07\x2c\x32\x32\xb0\x13\x10\xb1\x38\x01\x2b\xb1\
-\x0d\x0d\xe9\xb1\x40\x01\x2b\xb1\x14\x1a\x11\x12\xb1\x03\x17\x39\
-\x39\xb1\x38\x13\x11\x12\xb0\x10\x39\x00\xb1\x1d\x17\x11\x12\xb1\
-\x12\x15\x39\x39\xb0\x29\x11\xb1\x0d\x00\x39\x39\xb0\x03\x12\xb1\
-\x05\x08\x39\x39\x30\x31\x13\x34\x12\x33\x32\x17\x11\x33\x11\x36\
-\x37\x32\x12\x15\x14\x02\x23\x22\x27\x11\x23\x11\x06\x23\x22\x02\
-\x37\x14\x16\x33\x32\x36\x35\x11\x34\x2e\x03\x27\x26\x27\x22\x06\
-\x01\x14\x16\x14\x1e\x02\x17\x16\x33\x32\x36\x35\x34\x26\x23\x22\
-\x06\x15\x48\xc4\x98\x9c\x83\x99\x83\x9c\x98\xc4\xd7\x9e\x8f\x77\
-\x99\x7b\x90\x9a\xd6\x9f\xaf\x70\x4a\x73\x02\x09\x04\x16\x04\x3f\
-\x57\x6f\xae\x02\x75\x02\x08\x04\x0f\x04\x3f\x5d\x79\xa3\xae\x6e\
-\x44\x79\x01\xc9\xc3\x01\x18\x6b\x02\x8e\xfd\x72\x6a\x01\xfe\xe5\
-\xc0\xc7\xfe\xe7\x73\xfe\x15\x01\xeb\x73\x01\x17\xc7\x98\xc7\x65\
-\x3b\x01\x87\x0e\x15\x11\x06\x16\x06\x3b\x01\xc4\xfe\xb1\x0c\x12\
-\x0d\x0e\x06\x15\x06\x4c\xd1\x8e\x96\xc4\x54\x35\x00\x00\x00\x00\
-\x01\x00\x00\x00\x00\x03\xae\x03\x8f\x00\x0e\x00\x26\x00\xb2\x00\
-\x00\x00\x2b\xb0\x0b\x33\xb2\x03\x01\x00\x2b\xb0\x07\x33\x01\xb0\
-\x0f\x2f\xb1\x10\x01\x2b\x00\xb1\x03\x00\x11\x12\xb1\x05\x0d\x39\
-\x39\x30\x31\x31\x01\x35\x01\x33\x01\x33\x01\x33\x01\x15\x01\x23\
-\x09\x01\x01\x8d\xfe\x7f\xaa\x01\x1b\x02\x01\x10\xaa\xfe\x87\x01\
-\x9a\xaa\xfe\xcd\xfe\xd9\x01\xd3\x04\x01\xb8\xfe\xae\x01\x52\xfe\
-\x48\x02\xfe\x2b\x01\x81\xfe\x7f\x00\x00\x00\x00\x01\x00\xa6\xfe\
-\xb4\x04\x29\x03\x8f\x00\x0b\x00\x48\x00\xb2\x00\x00\x00\x2b\xb1\
-\x03\x03\xe9\xb0\x07\x32\xb2\x00\x03\x0a\x2b\xb3\x40\x00\x0a\x09\
-\x2b\xb2\x01\x01\x00\x2b\xb0\x05\x33\x01\xb0\x0c\x2f\xb0\x00\xd6\
-\xb1\x03\x11\xe9\xb0\x03\x10\xb1\x04\x01\x2b\xb1\x07\x11\xe9\xb0\
-\x07\x10\xb1\x0a\x0b\x2b\xb1\x09\x0f\xe9\xb1\x0d\x01\x2b\x00\x30\
-\x31\x33\x11\x33\x11\x21\x11\x33\x11\x33\x11\x23\x11\xa6\x99\x01\
-\xc9\x9a\x87\x83\x03\x8f\xfc\xee\x03\x12\xfc\xee\xfe\x37\x01\x4c\
-\x00\x00\x00\x00\x01\x00\xa6\x00\x00\x03\xa2\x03\x8f\x00\x20\x00\
-\x9b\x00\xb2\x12\x00\x00\x2b\xb2\x01\x01\x00\x2b\xb0\x0f\x33\xb4\
-\x14\x0d\x12\x01\x0d\x2b\xb0\x09\x33\xb1\x14\x05\xe9\x01\xb0\x21\
-\x2f\xb0\x00\xd6\xb1\x03\x11\xe9\xb0\x03\x10\xb1\x12\x01\x2b\xb0\
-\x0e\x32\xb1\x11\x11\xe9\xb1\x22\x01\x2b\xb0\x36\x1a\xba\xec\x5f\
-\xc3\x16\x00\x15\x2b\x0a\xb0\x09\x2e\x0e\xb0\x07\xc0\xb1\x18\x19\
-\xf9\xb0\x1a\xc0\xb0\x07\x10\xb3\x08\x07\x09\x13\x2b\xb0\x1a\x10\
-\xb3\x19\x1a\x18\x13\x2b\xb2\x08\x07\x09\x20\x8a\x20\x8a\x23\x06\
-\x0e\x11\x12\x39\xb2\x19\x1a\x18\x11\x12\x39\x00\xb4\x07\x08\x18\
-\x19\x1a\x2e\x2e\x2e\x2e\x2e\x01\xb5\x07\x08\x09\x18\x19\x1a\x2e\
-\x2e\x2e\x2e\x2e\x2e\xb0\x40\x1a\x01\x00\x30\x31\x13\x11\x33\x11\
-\x14\x1e\x05\x32\x16\x33\x21\x11\x33\x11\x23\x11\x21\x27\x2a\x01\
-\x2e\x04\x27\x2e\x02\xa6\x99\x09\x10\x10\x19\x12\x1d\x0e\x19\x02\
-\x01\x2f\x9a\x9a\xfe\xcd\x12\x10\x0f\x29\x19\x29\x1e\x27\x13\x1d\
-\x1c\x02\x02\x5c\x01\x33\xfe\xc1\x10\x1b\x13\x10\x08\x06\x04\x02\
-\x01\xa1\xfc\x71\x01\x7b\x02\x06\x06\x0d\x12\x19\x10\x1b\x37\x1c\
-\x00\x00\x00\x00\x01\x00\xa6\x00\x00\x05\x77\x03\x8f\x00\x0b\x00\
-\x3f\x00\xb2\x00\x00\x00\x2b\xb1\x03\x03\xe9\xb0\x07\x32\xb2\x01\
-\x01\x00\x2b\xb1\x05\x09\x33\x33\x01\xb0\x0c\x2f\xb0\x00\xd6\xb1\
-\x03\x11\xe9\xb0\x03\x10\xb1\x04\x01\x2b\xb1\x07\x11\xe9\xb0\x07\
-\x10\xb1\x08\x01\x2b\xb1\x0b\x11\xe9\xb1\x0d\x01\x2b\x00\x30\x31\
-\x33\x11\x33\x11\x21\x11\x33\x11\x21\x11\x33\x11\xa6\x99\x01\x84\
-\x99\x01\x81\x9a\x03\x8f\xfc\xee\x03\x12\xfc\xee\x03\x12\xfc\x71\
-\x00\x00\x00\x00\x01\x00\xa6\xfe\xb4\x05\xfe\x03\x8f\x00\x0f\x00\
-\x57\x00\xb2\x00\x00\x00\x2b\xb1\x03\x03\xe9\xb1\x07\x0b\x32\x32\
-\xb2\x00\x03\x0a\x2b\xb3\x40\x00\x0e\x09\x2b\xb2\x01\x01\x00\x2b\
-\xb1\x05\x09\x33\x33\x01\xb0\x10\x2f\xb0\x00\xd6\xb1\x03\x11\xe9\
-\xb0\x03\x10\xb1\x04\x01\x2b\xb1\x07\x11\xe9\xb0\x07\x10\xb1\x08\
-\x01\x2b\xb1\x0b\x11\xe9\xb0\x0b\x10\xb1\x0e\x0b\x2b\xb1\x0d\x0f\
-\xe9\xb1\x11\x01\x2b\x00\x30\x31\x33\x11\x33\x11\x21\x11\x33\x11\
-\x21\x11\x33\x11\x33\x11\x23\x11\xa6\x99\x01\x84\x99\x01\x81\x9a\
-\x87\x83\x03\x8f\xfc\xee\x03\x12\xfc\xee\x03\x12\xfc\xee\xfe\x37\
-\x01\x4c\x00\x00\x02\x00\x33\x00\x00\x04\x73\x03\x8f\x00\x10\x00\
-\x18\x00\x51\x00\xb2\x0d\x00\x00\x2b\xb1\x11\x08\xe9\xb2\x01\x01\
-\x00\x2b\xb1\x0f\x03\xe9\xb4\x03\x18\x0d\x01\x0d\x2b\xb1\x03\x05\
-\xe9\x01\xb0\x19\x2f\xb0\x0d\xd6\xb1\x11\x11\xe9\xb0\x02\x32\xb2\
-\x0d\x11\x0a\x2b\xb3\x40\x0d\x01\x09\x2b\xb0\x11\x10\xb1\x15\x01\
-\x2b\xb1\x07\x0f\xe9\xb1\x1a\x01\x2b\x00\xb1\x18\x11\x11\x12\xb0\
-\x07\x39\x30\x31\x13\x35\x21\x11\x33\x32\x16\x15\x14\x0e\x02\x23\
-\x21\x11\x23\x07\x01\x33\x32\x36\x34\x26\x2b\x01\x33\x01\xf0\xd9\
-\xbc\xbb\x1d\x4a\x9d\x71\xfe\x8b\xd3\x2d\x01\x9a\xc9\x85\x72\x85\
-\x89\xb2\x03\x0e\x81\xfe\x9e\xac\x66\x31\x59\x5a\x37\x03\x10\x02\
-\xfd\x75\x5e\x77\x62\x00\x00\x00\x03\x00\xa6\x00\x00\x04\xcc\x03\
-\x8f\x00\x0c\x00\x15\x00\x19\x00\x53\x00\xb2\x00\x00\x00\x2b\xb0\
-\x16\x33\xb1\x0d\x08\xe9\xb2\x01\x01\x00\x2b\xb0\x17\x33\xb4\x03\
-\x15\x00\x01\x0d\x2b\xb1\x03\x05\xe9\x01\xb0\x1a\x2f\xb0\x00\xd6\
-\xb1\x0d\x11\xe9\xb0\x02\x32\xb0\x0d\x10\xb1\x12\x01\x2b\xb1\x07\
-\x0f\xe9\xb0\x07\x10\xb1\x16\x01\x2b\xb1\x19\x11\xe9\xb1\x1b\x01\
-\x2b\x00\xb1\x15\x0d\x11\x12\xb0\x07\x39\x30\x31\x33\x11\x33\x11\
-\x33\x32\x16\x15\x14\x0e\x02\x23\x27\x33\x32\x37\x36\x34\x26\x2b\
-\x01\x01\x11\x33\x11\xa6\x99\xd8\xc1\xb9\x1e\x4a\x9e\x6e\xde\xb5\
-\xa6\x3f\x29\x87\x89\xb3\x02\xf4\x99\x03\x8f\xfe\x9e\xac\x66\x31\
-\x59\x5a\x37\x83\x3e\x29\x6e\x62\xfe\x46\x03\x8f\xfc\x71\x00\x00\
-\x02\x00\xa6\x00\x00\x03\x91\x03\x8f\x00\x0c\x00\x15\x00\x42\x00\
-\xb2\x00\x00\x00\x2b\xb1\x0d\x08\xe9\xb2\x01\x01\x00\x2b\xb4\x03\
-\x15\x00\x01\x0d\x2b\xb1\x03\x05\xe9\x01\xb0\x16\x2f\xb0\x00\xd6\
-\xb1\x0d\x11\xe9\xb0\x02\x32\xb0\x0d\x10\xb1\x12\x01\x2b\xb1\x07\
-\x0f\xe9\xb1\x17\x01\x2b\x00\xb1\x15\x0d\x11\x12\xb0\x07\x39\x30\
-\x31\x33\x11\x33\x11\x33\x32\x16\x15\x14\x0e\x02\x23\x27\x33\x32\
-\x37\x36\x34\x26\x2b\x01\xa6\x99\xd8\xc1\xb9\x1e\x4a\x9e\x6e\xde\
-\xb5\xa6\x3f\x29\x87\x89\xb3\x03\x8f\xfe\x9e\xac\x66\x31\x59\x5a\
-\x37\x83\x3e\x29\x6e\x62\x00\x00\x01\x00\x39\xff\xe9\x03\x44\x03\
-\xb0\x00\x20\x00\x49\x00\xb2\x1f\x00\x00\x2b\xb1\x03\x08\xe9\xb2\
-\x19\x01\x00\x2b\xb1\x0c\x08\xe9\xb4\x08\x07\x1f\x19\x0d\x2b\xb1\
-\x08\x05\xe9\x01\xb0\x21\x2f\xb1\x22\x01\x2b\x00\xb1\x03\x1f\x11\
-\x12\xb0\x00\x39\xb0\x07\x11\xb0\x01\x39\xb0\x08\x12\xb0\x1c\x39\
-\xb0\x0c\x11\xb0\x15\x39\xb0\x19\x12\xb0\x16\x39\x30\x31\x3f\x01\
-\x16\x37\x32\x36\x37\x21\x35\x21\x2e\x01\x23\x22\x0e\x05\x0f\x01\
-\x27\x3e\x01\x33\x32\x12\x15\x14\x02\x23\x26\x39\x0b\xa4\x9f\x68\
-\xab\x0a\xfe\x10\x01\xe6\x17\x8d\x73\x1d\x35\x25\x2f\x12\x31\x07\
-\x1c\x1b\x18\x58\x81\x64\xcd\xf6\xfe\xbf\xb2\x52\x89\x6f\x01\x9d\
-\xb0\x73\x6d\x93\x06\x02\x13\x04\x1a\x02\x11\x12\x87\x35\x25\xfe\
-\xd7\xbe\xc7\xfe\xe7\x01\x00\x00\x02\x00\xa4\xff\xe9\x05\x98\x03\
-\xb0\x00\x12\x00\x1c\x00\x6f\x00\xb2\x00\x00\x00\x2b\xb2\x0d\x00\
-\x00\x2b\xb1\x16\x08\xe9\xb2\x01\x01\x00\x2b\xb2\x07\x01\x00\x2b\
-\xb1\x1b\x03\xe9\xb4\x03\x11\x0d\x07\x0d\x2b\xb1\x03\x05\xe9\x01\
-\xb0\x1d\x2f\xb0\x00\xd6\xb1\x12\x0d\xe9\xb0\x02\x32\xb0\x12\x10\
-\xb1\x10\x01\x2b\xb1\x13\x0d\xe9\xb0\x13\x10\xb1\x18\x01\x2b\xb1\
-\x0a\x0d\xe9\xb1\x1e\x01\x2b\xb1\x13\x10\x11\x12\xb0\x04\x39\xb0\
-\x18\x11\xb1\x0d\x07\x39\x39\x00\xb1\x03\x11\x11\x12\xb2\x0a\x13\
-\x18\x39\x39\x39\x30\x31\x33\x11\x33\x11\x33\x3e\x01\x33\x32\x00\
-\x15\x14\x00\x23\x22\x00\x27\x23\x11\x01\x14\x16\x32\x36\x35\x34\
-\x26\x22\x06\xa4\xa0\xdd\x1f\xf1\xa6\xb8\x01\x09\xfe\xfb\xbc\xb0\
-\xfe\xf6\x06\xd3\x01\x72\xae\xe6\xae\xae\xe6\xae\x03\x8f\xfe\x9e\
-\x9e\xe5\xfe\xe1\xce\xc5\xfe\xeb\x01\x03\xce\xfe\x46\x01\xd9\xb4\
-\xb8\xb8\xb4\xac\xac\xac\x00\x00\x02\x00\x21\x00\x00\x03\x75\x03\
-\x8f\x00\x11\x00\x1d\x00\x61\x00\xb2\x00\x00\x00\x2b\xb0\x0d\x33\
-\xb2\x0b\x01\x00\x2b\xb1\x19\x03\xe9\xb4\x10\x16\x00\x0b\x0d\x2b\
-\xb1\x10\x05\xe9\x01\xb0\x1e\x2f\xb0\x06\xd6\xb1\x12\x0f\xe9\xb0\
-\x12\x10\xb1\x0e\x01\x2b\xb0\x17\x32\xb1\x0d\x11\xe9\xb1\x1f\x01\
-\x2b\xb1\x12\x06\x11\x12\xb0\x11\x39\xb0\x0e\x11\xb1\x01\x10\x39\
-\x39\x00\xb1\x16\x10\x11\x12\xb0\x01\x39\xb0\x19\x11\xb0\x06\x39\
-\xb0\x0b\x12\xb0\x08\x39\x30\x31\x33\x01\x2e\x03\x35\x34\x36\x37\
-\x36\x33\x21\x11\x23\x11\x23\x01\x13\x14\x17\x16\x3b\x01\x11\x23\
-\x22\x0e\x02\x21\x01\x7f\x54\x73\x37\x15\x92\xaa\x1b\x35\x01\x5c\
-\x9a\xaa\xfe\xae\x3e\x49\x3f\x84\xb2\xcb\x35\x45\x50\x29\x01\x96\
-\x0e\x3d\x4e\x44\x25\x5a\x91\x0a\x02\xfc\x71\x01\x8d\xfe\x73\x02\
-\x96\x50\x25\x21\x01\x10\x06\x16\x35\x00\x00\x00\x03\x00\x46\xff\
-\xe9\x03\x50\x05\x1f\x00\x14\x00\x1d\x00\x21\x00\x4f\x00\xb2\x12\
-\x00\x00\x2b\xb1\x0d\x03\xe9\xb2\x03\x01\x00\x2b\xb1\x1b\x03\xe9\
-\xb4\x15\x0a\x12\x03\x0d\x2b\xb1\x15\x05\xe9\x01\xb0\x22\x2f\xb0\
-\x00\xd6\xb1\x0a\x0f\xe9\xb2\x0a\x00\x0a\x2b\xb3\x40\x0a\x09\x09\
-\x2b\xb1\x23\x01\x2b\x00\xb1\x0d\x12\x11\x12\xb0\x10\x39\xb0\x0a\
-\x11\xb0\x0f\x39\xb0\x15\x12\xb0\x00\x39\x30\x31\x13\x34\x12\x33\
-\x32\x1e\x02\x17\x15\x21\x1e\x01\x33\x32\x37\x17\x06\x07\x22\x02\
-\x13\x21\x2e\x03\x23\x22\x06\x13\x33\x01\x23\x46\xf7\xa6\x3d\x6f\
-\x71\x4a\x06\xfd\x85\x06\xb0\x79\x9c\x9b\x0d\x9c\xa8\xc3\xfb\x99\
-\x01\xfc\x0c\x40\x50\x3f\x1d\x68\x88\x45\x9f\x01\x11\x7d\x01\xcf\
-\xcb\x01\x16\x27\x5a\xb4\x7d\x3b\x9a\xc1\x71\x87\x68\x01\x01\x21\
-\x01\x29\x50\x6f\x2f\x10\xa0\x02\x8e\xfe\xf5\x00\x04\x00\x46\xff\
-\xe9\x03\x50\x05\x48\x00\x14\x00\x18\x00\x21\x00\x25\x00\x8b\x00\
-\xb2\x12\x00\x00\x2b\xb1\x0d\x03\xe9\xb2\x03\x01\x00\x2b\xb1\x1f\
-\x03\xe9\xb4\x19\x0a\x12\x03\x0d\x2b\xb1\x19\x05\xe9\xb0\x15\x2f\
-\xb0\x22\x33\xb1\x16\x04\xe9\xb0\x23\x32\x01\xb0\x26\x2f\xb0\x15\
-\xd6\xb1\x18\x0e\xe9\xb3\x0a\x18\x15\x08\x2b\xb1\x00\x0f\xe9\xb0\
-\x00\x2f\xb1\x0a\x0f\xe9\xb2\x0a\x00\x0a\x2b\xb3\x40\x0a\x09\x09\
-\x2b\xb0\x18\x10\xb1\x22\x01\x2b\xb1\x25\x0e\xe9\xb1\x27\x01\x2b\
-\xb1\x18\x0a\x11\x12\xb0\x19\x39\xb0\x22\x11\xb3\x0d\x12\x03\x1f\
-\x24\x17\x39\xb0\x25\x12\xb0\x1a\x39\x00\xb1\x0a\x0d\x11\x12\xb0\
-\x0f\x39\xb0\x19\x11\xb0\x00\x39\x30\x31\x13\x34\x12\x33\x32\x1e\
-\x02\x17\x15\x21\x1e\x01\x33\x32\x37\x17\x06\x07\x22\x02\x13\x35\
-\x33\x15\x03\x21\x2e\x03\x23\x22\x06\x01\x35\x33\x15\x46\xf7\xa6\
-\x3d\x6f\x71\x4a\x06\xfd\x85\x06\xb0\x79\x9c\x9b\x0d\x9c\xa8\xc3\
-\xfb\x5e\xb8\x7d\x01\xfc\x0c\x40\x50\x3f\x1d\x68\x88\x01\x3f\xb8\
-\x01\xcf\xcb\x01\x16\x27\x5a\xb4\x7d\x3b\x9a\xc1\x71\x87\x68\x01\
-\x01\x21\x03\x87\xb7\xb7\xfd\xa2\x50\x6f\x2f\x10\xa0\x02\x00\xb7\
-\xb7\x00\x00\x00\x01\x00\x25\xfe\x71\x03\x9e\x05\xc7\x00\x29\x00\
-\x80\x00\xb2\x28\x00\x00\x2b\xb2\x03\x02\x00\x2b\xb2\x0b\x01\x00\
-\x2b\xb1\x23\x03\xe9\xb0\x18\x2f\xb1\x19\x05\xe9\xb4\x01\x00\x23\
-\x03\x0d\x2b\xb0\x07\x33\xb1\x01\x06\xe9\xb0\x05\x32\x01\xb0\x2a\
-\x2f\xb0\x29\xd6\xb0\x02\x32\xb1\x09\x11\xe9\xb1\x04\x26\x32\x32\
-\xb2\x29\x09\x0a\x2b\xb3\x40\x29\x00\x09\x2b\xb0\x09\x10\xb1\x1c\
-\x01\x2b\xb1\x12\x0d\xe9\xb0\x06\x32\xb2\x1c\x12\x0a\x2b\xb3\x40\
-\x1c\x18\x09\x2b\xb1\x2b\x01\x2b\xb1\x1c\x09\x11\x12\xb0\x0b\x39\
-\xb0\x12\x11\xb0\x0f\x39\x00\xb1\x23\x28\x11\x12\xb0\x09\x39\x30\
-\x31\x13\x35\x33\x35\x33\x15\x21\x15\x21\x11\x36\x33\x32\x1e\x03\
-\x1d\x01\x14\x07\x06\x02\x04\x07\x35\x36\x00\x11\x35\x34\x2e\x03\
-\x23\x22\x06\x15\x11\x23\x11\x25\x7d\x9b\x02\x61\xfd\x9f\x81\xb5\
-\x52\x78\x3a\x21\x06\x0d\x17\x8a\xfe\xf9\xa5\xb0\x01\x08\x02\x17\
-\x2b\x58\x3f\x56\x87\xa2\x04\x6f\x78\xe0\xe0\x78\xfe\x9d\x98\x33\
-\x44\x6c\x48\x31\x65\x68\x5e\xa6\xfe\xd7\xdb\x02\x72\x06\x01\x7b\
-\x01\x63\x78\x23\x29\x4e\x2b\x23\x91\xb1\xfe\x1b\x04\x6f\x00\x00\
-\x02\x00\x9e\x00\x00\x03\x06\x05\x1f\x00\x03\x00\x0a\x00\x37\x00\
-\xb2\x04\x00\x00\x2b\xb2\x05\x01\x00\x2b\xb1\x08\x07\xe9\x01\xb0\
-\x0b\x2f\xb0\x04\xd6\xb0\x00\x32\xb1\x0a\x0d\xe9\xb2\x0a\x04\x0a\
-\x2b\xb3\x40\x0a\x06\x09\x2b\xb1\x0c\x01\x2b\xb1\x0a\x04\x11\x12\
-\xb0\x03\x39\x00\x30\x31\x13\x01\x33\x01\x03\x11\x21\x15\x21\x27\
-\x11\x9e\x01\x11\x9f\xfe\xcf\x7b\x02\x64\xfe\x89\x4d\x04\x14\x01\
-\x0b\xfe\xf5\xfb\xec\x03\x8f\x7b\x03\xfc\xe9\x00\x01\x00\x3d\xff\
-\xe9\x03\x48\x03\xb0\x00\x1b\x00\x49\x00\xb2\x19\x00\x00\x2b\xb1\
-\x14\x08\xe9\xb2\x03\x01\x00\x2b\xb1\x0b\x08\xe9\xb4\x0e\x11\x19\
-\x03\x0d\x2b\xb1\x0e\x05\xe9\x01\xb0\x1c\x2f\xb1\x1d\x01\x2b\x00\
-\xb1\x14\x19\x11\x12\xb0\x17\x39\xb0\x11\x11\xb0\x16\x39\xb0\x0e\
-\x12\xb0\x00\x39\xb0\x0b\x11\xb0\x07\x39\xb0\x03\x12\xb0\x06\x39\
-\x30\x31\x13\x34\x12\x33\x32\x16\x17\x07\x2e\x02\x23\x22\x06\x07\
-\x21\x15\x21\x1e\x01\x33\x32\x37\x17\x06\x07\x22\x00\x3d\xf6\xcd\
-\x66\x7b\x5c\x18\x39\x30\x74\x4a\x75\x8f\x13\x01\xe6\xfe\x10\x0a\
-\xaa\x69\xa4\x9d\x0d\xa2\xac\xbc\xfe\xff\x01\xc9\xbe\x01\x29\x25\
-\x35\x87\x25\x1a\x1f\x97\x69\x73\xb0\x9d\x6e\x89\x68\x01\x01\x17\
-\x00\x00\x00\x00\x01\x00\x37\xff\xe9\x02\xe1\x03\xb0\x00\x38\x00\
-\x67\x00\xb2\x37\x00\x00\x2b\xb1\x09\x03\xe9\xb2\x1a\x01\x00\x2b\
-\xb1\x28\x07\xe9\x01\xb0\x39\x2f\xb0\x15\xd6\xb1\x2b\x0f\xe9\xb0\
-\x2b\x10\xb1\x0c\x01\x2b\xb1\x32\x0f\xe9\xb1\x3a\x01\x2b\xb1\x2b\
-\x15\x11\x12\xb1\x03\x01\x39\x39\xb0\x0c\x11\xb4\x09\x11\x1a\x22\
-\x2e\x24\x17\x39\xb0\x32\x12\xb1\x1c\x20\x39\x39\x00\xb1\x09\x37\
-\x11\x12\xb0\x00\x39\xb0\x28\x11\xb3\x01\x15\x1d\x32\x24\x17\x39\
-\xb0\x1a\x12\xb0\x1c\x39\x30\x31\x3f\x01\x1e\x06\x33\x32\x36\x35\
-\x34\x26\x27\x2e\x01\x27\x2e\x01\x35\x34\x3e\x02\x33\x32\x17\x07\
-\x2e\x09\x23\x22\x06\x15\x14\x1e\x01\x17\x1e\x01\x15\x14\x0e\x02\
-\x23\x26\x37\x19\x04\x2d\x17\x33\x2b\x39\x40\x22\x66\x59\x4a\x29\
-\x14\x8e\x22\x54\x81\x1c\x44\x8d\x62\x93\x98\x16\x02\x2b\x06\x27\
-\x0f\x24\x15\x27\x1e\x29\x17\x5e\x4e\x6d\xc4\x29\x4a\x68\x1c\x44\
-\x8d\x61\xb4\x46\x8b\x02\x1b\x0c\x19\x0e\x10\x07\x57\x35\x33\x44\
-\x0c\x06\x1d\x0a\x1b\x81\x60\x2f\x54\x58\x33\x3f\x88\x02\x13\x04\
-\x10\x05\x0e\x02\x0a\x02\x02\x4c\x31\x44\x3b\x22\x13\x21\x83\x5c\
-\x2f\x5a\x5a\x38\x01\x00\x00\x00\x02\x00\x98\x00\x00\x01\x50\x05\
-\x6f\x00\x03\x00\x07\x00\x2f\x00\xb2\x04\x00\x00\x2b\xb2\x05\x01\
-\x00\x2b\xb0\x00\x2f\xb1\x01\x04\xe9\x01\xb0\x08\x2f\xb0\x00\xd6\
-\xb0\x04\x32\xb1\x03\x0e\xe9\xb1\x07\x11\xe9\xb1\x03\x0e\xe9\xb1\
-\x09\x01\x2b\x00\x30\x31\x13\x35\x33\x15\x03\x11\x33\x11\x98\xb8\
-\xaa\x99\x04\xb8\xb7\xb7\xfb\x48\x03\x8f\xfc\x71\x00\x00\x00\x00\
-\x03\xff\xd4\x00\x00\x02\x19\x05\x48\x00\x03\x00\x07\x00\x0b\x00\
-\x40\x00\xb2\x04\x00\x00\x2b\xb2\x05\x01\x00\x2b\xb0\x00\x2f\xb0\
-\x08\x33\xb1\x01\x04\xe9\xb0\x09\x32\x01\xb0\x0c\x2f\xb0\x00\xd6\
-\xb1\x03\x0e\xe9\xb0\x03\x10\xb1\x04\x01\x2b\xb1\x07\x11\xe9\xb0\
-\x07\x10\xb1\x08\x01\x2b\xb1\x0b\x0e\xe9\xb1\x0d\x01\x2b\x00\x30\
-\x31\x03\x35\x33\x15\x13\x11\x33\x11\x13\x35\x33\x15\x2c\xb8\x1c\
-\x99\x20\xb8\x04\x91\xb7\xb7\xfb\x6f\x03\x8f\xfc\x71\x04\x91\xb7\
-\xb7\x00\x00\x00\x02\xff\x83\xfe\x5c\x01\x7d\x05\x6f\x00\x0f\x00\
-\x13\x00\x41\x00\xb2\x09\x01\x00\x2b\xb0\x0e\x2f\xb1\x03\x08\xe9\
-\xb0\x10\x2f\xb1\x11\x04\xe9\x01\xb0\x14\x2f\xb0\x08\xd6\xb1\x0b\
-\x11\xe9\xb0\x12\x32\xb0\x0b\x10\xb1\x10\x0e\xe9\xb0\x10\x2f\xb1\
-\x15\x01\x2b\x00\xb1\x03\x0e\x11\x12\xb0\x00\x39\xb0\x09\x11\xb0\
-\x01\x39\x30\x31\x03\x37\x16\x17\x32\x36\x37\x36\x35\x11\x33\x11\
-\x14\x06\x23\x22\x13\x35\x33\x15\x7d\x1f\x50\x50\x3b\x54\x0c\x04\
-\x9a\xa0\x62\x7d\xc9\xb8\xfe\xa2\x7d\x3f\x01\x3c\x2b\x12\x23\x04\
-\x14\xfc\x0b\xaa\x94\x06\x5c\xb7\xb7\x00\x00\x00\x02\x00\x27\x00\
-\x00\x05\xc7\x03\x8f\x00\x1a\x00\x25\x00\x62\x00\xb2\x13\x00\x00\
-\x2b\xb0\x00\x33\xb1\x1b\x08\xe9\xb0\x01\x32\xb2\x07\x01\x00\x2b\
-\xb1\x15\x03\xe9\xb4\x09\x24\x13\x07\x0d\x2b\xb1\x09\x05\xe9\x01\
-\xb0\x26\x2f\xb0\x06\xd6\xb1\x15\x0f\xe9\xb2\x06\x15\x0a\x2b\xb3\
-\x40\x06\x00\x09\x2b\xb0\x15\x10\xb1\x13\x01\x2b\xb1\x1b\x11\xe9\
-\xb0\x08\x32\xb0\x1b\x10\xb1\x20\x01\x2b\xb1\x0d\x0f\xe9\xb1\x27\
-\x01\x2b\x00\xb1\x24\x1b\x11\x12\xb0\x0d\x39\x30\x31\x33\x35\x33\
-\x32\x36\x12\x11\x35\x21\x11\x33\x32\x16\x15\x14\x0e\x02\x23\x21\
-\x11\x21\x14\x02\x0e\x01\x23\x25\x33\x32\x37\x36\x35\x34\x26\x2b\
-\x01\x07\x27\x50\x48\x4f\x3a\x02\x47\xbb\xc3\xba\x1d\x4c\x9d\x73\
-\xfe\xa8\xfe\xdf\x2f\x62\x75\x56\x03\x16\x98\x96\x41\x39\x85\x89\
-\x98\x02\x85\x56\x01\x4e\x01\x39\x2d\xfe\x9e\xac\x66\x31\x59\x5a\
-\x37\x03\x10\xf4\xfe\xc3\xa4\x3b\x83\x31\x2b\x3e\x3b\x62\x72\x00\
-\x02\x00\xa6\x00\x00\x05\xd7\x03\x8f\x00\x14\x00\x1f\x00\x5f\x00\
-\xb2\x11\x00\x00\x2b\xb0\x00\x33\xb1\x15\x08\xe9\xb2\x01\x01\x00\
-\x2b\xb0\x05\x33\xb4\x03\x13\x11\x01\x0d\x2b\xb0\x1d\x33\xb1\x03\
-\x05\xe9\xb0\x07\x32\x01\xb0\x20\x2f\xb0\x00\xd6\xb1\x14\x11\xe9\
-\xb0\x02\x32\xb0\x14\x10\xb1\x11\x01\x2b\xb0\x04\x32\xb1\x15\x11\
-\xe9\xb0\x06\x32\xb0\x15\x10\xb1\x1a\x01\x2b\xb1\x0b\x0f\xe9\xb1\
-\x21\x01\x2b\x00\xb1\x13\x15\x11\x12\xb0\x0b\x39\x30\x31\x33\x11\
-\x33\x11\x21\x11\x33\x11\x33\x32\x16\x15\x14\x0e\x02\x23\x21\x11\
-\x21\x11\x25\x33\x32\x37\x36\x37\x34\x26\x2b\x01\x07\xa6\x99\x01\
-\xc9\x9a\xba\xc3\xb8\x1d\x4b\x9e\x73\xfe\xaa\xfe\x37\x02\x63\x97\
-\x96\x41\x37\x01\x83\x8a\x97\x02\x03\x8f\xfe\x9e\x01\x62\xfe\x9e\
-\xac\x66\x31\x59\x5a\x37\x01\xba\xfe\x46\x83\x31\x29\x40\x3b\x62\
-\x72\x00\x00\x00\x01\x00\x25\x00\x00\x03\x7b\x05\xc7\x00\x23\x00\
-\x73\x00\xb2\x22\x00\x00\x2b\xb0\x12\x33\xb2\x03\x02\x00\x2b\xb2\
-\x0b\x01\x00\x2b\xb1\x1a\x03\xe9\xb4\x01\x00\x1a\x03\x0d\x2b\xb0\
-\x07\x33\xb1\x01\x06\xe9\xb0\x05\x32\x01\xb0\x24\x2f\xb0\x23\xd6\
-\xb0\x02\x32\xb1\x09\x11\xe9\xb1\x04\x1d\x32\x32\xb2\x09\x23\x0a\
-\x2b\xb3\x40\x09\x07\x09\x2b\xb2\x23\x09\x0a\x2b\xb3\x40\x23\x00\
-\x09\x2b\xb0\x09\x10\xb1\x13\x01\x2b\xb1\x12\x0d\xe9\xb1\x25\x01\
-\x2b\xb1\x12\x13\x11\x12\xb0\x0f\x39\x00\xb1\x1a\x22\x11\x12\xb0\
-\x09\x39\x30\x31\x13\x35\x33\x35\x33\x15\x21\x15\x21\x11\x36\x37\
-\x32\x1e\x03\x15\x11\x23\x11\x34\x2e\x03\x23\x22\x06\x15\x14\x16\
-\x15\x11\x23\x11\x25\x7d\x9b\x01\xee\xfe\x12\x7b\xaa\x4e\x6f\x37\
-\x1f\x06\xa0\x02\x16\x27\x50\x3a\x68\x68\x02\xa2\x04\x6f\x78\xe0\
-\xe0\x78\xfe\xa3\x91\x01\x31\x44\x68\x48\x31\xfd\xb2\x02\x3f\x23\
-\x29\x4c\x2d\x23\xb4\x87\x02\x0b\x02\xfe\x23\x04\x6f\x00\x00\x00\
-\x02\x00\xa6\x00\x00\x03\xc5\x05\x1f\x00\x0b\x00\x0f\x00\x38\x00\
-\xb2\x00\x00\x00\x2b\xb0\x07\x33\xb2\x01\x01\x00\x2b\xb0\x04\x33\
-\x01\xb0\x10\x2f\xb0\x00\xd6\xb1\x0b\x10\xe9\xb0\x02\x32\xb1\x11\
-\x01\x2b\xb1\x0b\x00\x11\x12\xb0\x0c\x39\x00\xb1\x01\x00\x11\x12\
-\xb1\x03\x09\x39\x39\x30\x31\x33\x11\x33\x11\x01\x33\x09\x01\x23\
-\x01\x07\x11\x03\x01\x33\x01\xa6\x93\x01\xa6\xb9\xfe\xa3\x01\x8a\
-\xa8\xfe\xbe\xa2\x2f\x01\x11\x9f\xfe\xcf\x03\x8f\xfe\x54\x01\xac\
-\xfe\xa0\xfd\xd1\x01\xcb\xa2\xfe\xd7\x04\x14\x01\x0b\xfe\xf5\x00\
-\x02\x00\xa6\x00\x00\x03\xa2\x05\x1f\x00\x09\x00\x0d\x00\x45\x00\
-\xb2\x00\x00\x00\x2b\xb0\x06\x33\xb2\x01\x01\x00\x2b\xb0\x04\x33\
-\x01\xb0\x0e\x2f\xb0\x00\xd6\xb1\x03\x11\xe9\xb0\x03\x10\xb1\x07\
-\x01\x2b\xb1\x06\x11\xe9\xb1\x0f\x01\x2b\xb1\x07\x03\x11\x12\xb3\
-\x04\x09\x0a\x0c\x24\x17\x39\x00\xb1\x01\x00\x11\x12\xb1\x03\x08\
-\x39\x39\x30\x31\x33\x11\x33\x11\x01\x33\x11\x23\x11\x01\x03\x33\
-\x01\x23\xa6\x99\x01\x82\xe1\x9a\xfe\x7f\x47\x9f\x01\x11\x7d\x03\
-\x8f\xfd\x00\x03\x00\xfc\x71\x03\x00\xfd\x00\x05\x1f\xfe\xf5\x00\
-\x02\x00\x1d\xfe\x5c\x03\x91\x05\x1d\x00\x19\x00\x2a\x00\x78\x00\
-\xb2\x00\x01\x00\x2b\xb0\x07\x33\xb0\x0c\x2f\xb1\x11\x05\xe9\xb0\
-\x29\x2f\xb1\x20\x09\xe9\xb2\x20\x29\x0a\x2b\xb3\x40\x20\x1a\x09\
-\x2b\xb0\x25\x32\x01\xb0\x2b\x2f\xb0\x1a\xd6\xb4\x1b\x16\x00\x32\
-\x04\x2b\xb0\x1b\x10\xb1\x25\x01\x2b\xb4\x26\x16\x00\x32\x04\x2b\
-\xb1\x2c\x01\x2b\xb1\x1b\x1a\x11\x12\xb2\x0c\x11\x01\x39\x39\x39\
-\xb0\x25\x11\xb6\x06\x14\x05\x18\x17\x28\x29\x24\x17\x39\xb0\x26\
-\x12\xb0\x07\x39\x00\xb1\x11\x0c\x11\x12\xb0\x0e\x39\xb0\x00\x11\
-\xb1\x05\x0f\x39\x39\x30\x31\x13\x33\x1a\x01\x16\x17\x36\x01\x33\
-\x01\x0e\x01\x23\x22\x2f\x01\x16\x33\x32\x36\x37\x36\x37\x36\x34\
-\x27\x01\x33\x1e\x03\x33\x32\x3e\x02\x37\x33\x0e\x01\x20\x26\x1d\
-\xa1\x83\x84\x16\x0c\x04\x01\x0d\x99\xfe\x44\x3b\x67\x4a\x54\x41\
-\x0a\x6d\x28\x37\x38\x39\x0e\x09\x08\x0a\xfe\xe3\x7d\x04\x35\x4c\
-\x3d\x1b\x1d\x3b\x4e\x35\x04\x7d\x04\xd1\xfe\xf6\xd3\x03\x8f\xfe\
-\xd3\xfe\xac\x58\x50\x8f\x02\x9a\xfb\xb9\x89\x63\x11\x85\x23\x50\
-\x8b\x23\x14\x12\x1d\x15\x04\xf8\x2d\x42\x1b\x0a\x0a\x1b\x42\x2d\
-\x85\x98\x9a\x00\x01\x00\xa6\xfe\xb4\x03\xa2\x03\x8f\x00\x0b\x00\
-\x48\x00\xb2\x00\x00\x00\x2b\xb0\x07\x33\xb1\x03\x03\xe9\xb2\x00\
-\x03\x0a\x2b\xb3\x40\x00\x0a\x09\x2b\xb2\x01\x01\x00\x2b\xb0\x05\
-\x33\x01\xb0\x0c\x2f\xb0\x00\xd6\xb1\x03\x11\xe9\xb0\x03\x10\xb1\
-\x0a\x01\x2b\xb1\x09\x0f\xe9\xb0\x09\x10\xb1\x04\x01\x2b\xb1\x07\
-\x11\xe9\xb1\x0d\x01\x2b\x00\x30\x31\x33\x11\x33\x11\x21\x11\x33\
-\x11\x21\x11\x23\x11\xa6\x99\x01\xc9\x9a\xfe\xc4\x83\x03\x8f\xfc\
-\xee\x03\x12\xfc\x71\xfe\xb4\x01\x4c\x00\x00\x00\x01\x00\x87\xff\
-\xd3\x06\xcb\x05\xba\x00\x37\x00\x81\x00\xb2\x32\x00\x00\x2b\xb0\
-\x2c\x33\xb1\x0e\x08\xe9\xb0\x15\x32\xb2\x06\x02\x00\x2b\xb0\x20\
-\x33\xb1\x07\x08\xe9\xb0\x1f\x32\x01\xb0\x38\x2f\xb0\x00\xd6\xb1\
-\x09\x0e\xe9\xb2\x09\x00\x0a\x2b\xb3\x40\x09\x06\x09\x2b\xb0\x09\
-\x10\xb1\x10\x01\x2b\xb1\x13\x14\xe9\xb0\x13\x10\xb1\x1b\x01\x2b\
-\xb1\x26\x0e\xe9\xb2\x1b\x26\x0a\x2b\xb3\x40\x1b\x20\x09\x2b\xb1\
-\x39\x01\x2b\xb1\x10\x09\x11\x12\xb0\x32\x39\xb0\x13\x11\xb0\x2f\
-\x39\xb0\x1b\x12\xb0\x2c\x39\x00\xb1\x0e\x32\x11\x12\xb0\x2f\x39\
-\xb0\x07\x11\xb1\x00\x11\x39\x39\x30\x31\x13\x34\x12\x3e\x02\x37\
-\x15\x04\x11\x14\x12\x1e\x01\x33\x32\x37\x11\x33\x11\x16\x17\x33\
-\x32\x3e\x01\x12\x10\x02\x2e\x01\x27\x35\x1e\x03\x1d\x01\x14\x02\
-\x0e\x02\x23\x22\x26\x27\x0e\x01\x23\x22\x2e\x02\x02\x87\x3e\x60\
-\x83\x79\x41\xfe\xdd\x3a\x62\x5c\x36\x85\x62\xac\x62\x83\x04\x33\
-\x5f\x60\x39\x37\x5c\x5c\x35\x8b\xc7\x60\x29\x42\x62\x87\x79\x42\
-\x68\x81\x54\x4e\x87\x64\x42\x79\x89\x62\x42\x02\xc7\xb4\x01\x14\
-\xa0\x67\x22\x02\x83\x0e\xfd\x9a\xba\xfe\xfb\x7b\x31\x3e\x02\x4d\
-\xfd\xb3\x3d\x01\x33\x7b\x01\x04\x01\x71\x01\x04\x81\x35\x02\x83\
-\x02\x8f\xe7\xe0\x79\x22\xb8\xfe\xe5\x9e\x64\x1f\x2f\x42\x42\x2f\
-\x21\x62\xa0\x01\x19\x00\x00\x00\x01\x00\x87\xff\xd3\x06\x04\x03\
-\xbc\x00\x2e\x00\x6c\x00\xb2\x2c\x00\x00\x2b\xb0\x27\x33\xb1\x0c\
-\x08\xe9\xb0\x10\x32\xb0\x04\x2f\xb0\x1d\x33\xb1\x03\x03\xe9\xb0\
-\x1e\x32\x01\xb0\x2f\x2f\xb0\x00\xd6\xb1\x08\x0d\xe9\xb2\x08\x00\
-\x0a\x2b\xb3\x40\x08\x03\x09\x2b\xb0\x08\x10\xb1\x17\x01\x2b\xb1\
-\x24\x0d\xe9\xb2\x17\x24\x0a\x2b\xb3\x40\x17\x1d\x09\x2b\xb1\x30\
-\x01\x2b\xb1\x17\x08\x11\x12\xb1\x27\x2c\x39\x39\x00\xb1\x0c\x2c\
-\x11\x12\xb0\x29\x39\xb0\x04\x11\xb2\x00\x0e\x24\x39\x39\x39\x30\
-\x31\x13\x10\x36\x37\x15\x0e\x01\x0f\x01\x16\x17\x16\x3b\x01\x13\
-\x33\x13\x33\x32\x3e\x03\x37\x2e\x02\x27\x26\x27\x35\x32\x1e\x03\
-\x15\x14\x02\x23\x22\x27\x23\x06\x23\x22\x02\x87\xec\xbe\x79\x85\
-\x0a\x02\x08\x5e\x44\x6c\x1f\x9c\x9b\x9c\x1f\x4a\x6a\x37\x21\x08\
-\x02\x02\x0a\x2f\x2b\x3b\x69\x39\x69\x79\x56\x39\xdb\xd5\x93\x79\
-\x02\x79\x94\xd7\xdb\x01\xc9\x01\x00\xef\x04\x7f\x04\xa3\x8e\x43\
-\xdb\x57\x3d\x01\xd7\xfe\x29\x35\x4a\x71\x4b\x34\x46\x4d\x7f\x29\
-\x39\x04\x7f\x16\x44\x68\xbb\x78\xe9\xfe\xf5\x48\x48\x01\x0a\x00\
-\x02\x00\x10\x00\x00\x05\xc7\x06\x00\x00\x1a\x00\x2a\x00\x6e\x00\
-\xb2\x17\x00\x00\x2b\xb1\x1b\x05\xe9\xb0\x2a\x2f\xb1\x0b\x03\xe9\
-\xb0\x19\x2f\xb0\x07\x33\xb1\x01\x08\xe9\xb0\x05\x32\xb2\x01\x19\
-\x0a\x2b\xb3\x40\x01\x03\x09\x2b\x01\xb0\x2b\x2f\xb0\x17\xd6\xb0\
-\x02\x32\xb1\x1b\x14\xe9\xb1\x04\x0a\x32\x32\xb2\x1b\x17\x0a\x2b\
-\xb3\x40\x1b\x06\x09\x2b\xb2\x17\x1b\x0a\x2b\xb3\x40\x17\x01\x09\
-\x2b\xb0\x1b\x10\xb1\x21\x01\x2b\xb1\x11\x13\xe9\xb1\x2c\x01\x2b\
-\x00\xb1\x2a\x1b\x11\x12\xb1\x11\x21\x39\x39\x30\x31\x13\x35\x21\
-\x35\x33\x15\x21\x15\x23\x27\x21\x11\x21\x32\x17\x1e\x01\x15\x14\
-\x0e\x02\x23\x21\x11\x21\x07\x01\x33\x3e\x01\x37\x36\x35\x34\x2e\
-\x02\x23\x22\x06\x2b\x01\x10\x01\x9a\xac\x02\xb4\xac\x35\xfe\x2d\
-\x01\x4c\xc5\x80\x68\x78\x38\x74\xe2\x93\xfe\x04\xfe\xfe\x2f\x01\
-\xdd\xee\x7f\x64\x50\xa8\x2d\x5f\xb2\x74\x08\x1f\x09\xe7\x04\x93\
-\x88\xe5\xe5\x88\x03\xfe\x8d\x48\x39\xae\x65\x3d\x81\x7f\x52\x04\
-\x96\x03\xfb\xe0\x02\x10\x23\x58\x8d\x2d\x5d\x58\x37\x02\x00\x00\
-\x02\x00\x25\x00\x00\x03\xba\x05\x1d\x00\x14\x00\x1e\x00\x72\x00\
-\xb2\x13\x00\x00\x2b\xb1\x15\x08\xe9\xb2\x01\x01\x00\x2b\xb0\x05\
-\x33\xb1\x00\x06\xe9\xb0\x07\x32\xb2\x01\x00\x0a\x2b\xb3\x40\x01\
-\x03\x09\x2b\xb4\x1e\x09\x13\x03\x0d\x2b\xb1\x1e\x05\xe9\x01\xb0\
-\x1f\x2f\xb0\x13\xd6\xb0\x02\x32\xb1\x15\x11\xe9\xb1\x04\x08\x32\
-\x32\xb2\x15\x13\x0a\x2b\xb3\x40\x15\x07\x09\x2b\xb2\x13\x15\x0a\
-\x2b\xb3\x40\x13\x00\x09\x2b\xb0\x15\x10\xb1\x1a\x01\x2b\xb1\x0d\
-\x0f\xe9\xb1\x20\x01\x2b\x00\xb1\x1e\x15\x11\x12\xb0\x0d\x39\x30\
-\x31\x13\x35\x33\x11\x33\x11\x21\x15\x21\x15\x33\x32\x16\x15\x14\
-\x0e\x02\x23\x21\x11\x13\x33\x32\x37\x36\x35\x34\x26\x2b\x01\x25\
-\xaa\x99\x01\x1b\xfe\xe5\xd7\xc1\xba\x1e\x4a\x9e\x6e\xfe\x89\x99\
-\xb3\xa8\x3f\x27\x85\x89\xb3\x03\x17\x78\x01\x8e\xfe\x72\x78\xea\
-\xac\x66\x31\x59\x5a\x37\x03\x17\xfd\x6c\x3e\x27\x39\x37\x62\x00\
-\x01\x00\xc1\xff\xd3\x07\x27\x05\xba\x00\x2c\x00\x79\x00\xb2\x00\
-\x00\x00\x2b\xb2\x26\x00\x00\x2b\xb1\x18\x08\xe9\xb2\x01\x02\x00\
-\x2b\xb2\x09\x02\x00\x2b\xb1\x0f\x08\xe9\xb4\x2b\x03\x26\x09\x0d\
-\x2b\xb0\x12\x33\xb1\x2b\x03\xe9\xb0\x14\x32\x01\xb0\x2d\x2f\xb0\
-\x00\xd6\xb1\x2c\x0e\xe9\xb0\x02\x32\xb0\x2c\x10\xb1\x2a\x01\x2b\
-\xb0\x04\x32\xb1\x15\x0e\xe9\xb0\x12\x32\xb2\x15\x2a\x0a\x2b\xb3\
-\x40\x15\x14\x09\x2b\xb1\x2e\x01\x2b\xb1\x15\x2a\x11\x12\xb0\x29\
-\x39\x00\xb1\x2b\x00\x11\x12\xb1\x22\x23\x39\x39\xb1\x0f\x03\x11\
-\x12\xb0\x0c\x39\x30\x31\x33\x11\x33\x11\x21\x3e\x02\x24\x33\x32\
-\x17\x07\x2e\x01\x23\x22\x00\x07\x21\x15\x21\x16\x00\x33\x32\x3e\
-\x07\x37\x17\x0e\x01\x23\x22\x24\x02\x27\x21\x11\xc1\xb8\x01\x83\
-\x06\x60\xa2\x01\x00\x96\xb8\xbe\x1e\x5c\x96\x6d\xcd\xfe\xfd\x0f\
-\x02\xc1\xfd\x3f\x0e\x01\x07\xcd\x23\x3b\x39\x25\x33\x15\x35\x0a\
-\x3b\x07\x0c\x71\x9d\x83\xbe\xfe\xcc\xa0\x08\xfe\x7d\x05\x8d\xfd\
-\x79\x79\xf0\xcc\x7f\x45\xaa\x39\x33\xfe\xa8\xd9\x7f\xd9\xfe\xa8\
-\x02\x0c\x04\x15\x06\x1f\x08\x25\x04\x8f\x44\x2d\xd5\x01\x37\xa8\
-\xfd\x79\x00\x00\x01\x00\xa4\xff\xe9\x05\x2d\x03\xb0\x00\x25\x00\
-\x75\x00\xb2\x00\x00\x00\x2b\xb2\x21\x00\x00\x2b\xb1\x1c\x08\xe9\
-\xb2\x01\x01\x00\x2b\xb2\x0a\x01\x00\x2b\xb1\x13\x08\xe9\xb4\x03\
-\x24\x21\x0a\x0d\x2b\xb0\x18\x33\xb1\x03\x05\xe9\xb0\x16\x32\x01\
-\xb0\x26\x2f\xb0\x00\xd6\xb1\x25\x0d\xe9\xb0\x02\x32\xb0\x25\x10\
-\xb1\x23\x01\x2b\xb1\x19\x0d\xe9\xb2\x19\x23\x0a\x2b\xb3\x40\x19\
-\x18\x09\x2b\xb1\x27\x01\x2b\xb1\x19\x23\x11\x12\xb1\x04\x22\x39\
-\x39\x00\xb1\x24\x00\x11\x12\xb1\x1e\x1f\x39\x39\xb1\x13\x03\x11\
-\x12\xb0\x0f\x39\x30\x31\x33\x11\x33\x11\x33\x3e\x04\x33\x32\x1e\
-\x01\x17\x07\x26\x27\x26\x23\x22\x06\x07\x21\x15\x21\x1e\x01\x33\
-\x32\x37\x17\x06\x04\x00\x27\x23\x11\xa4\xa0\xe7\x02\x0e\x40\x58\
-\xa8\x66\x50\x7f\x35\x3c\x17\x68\x3a\x39\x4e\x75\x8b\x14\x01\xe5\
-\xfe\x11\x0a\xa8\x68\xa0\xa4\x0c\x9e\xfe\x9c\xfe\xfe\x08\xdd\x03\
-\x8f\xfe\x9e\x10\x34\x85\x66\x54\x1d\x1a\x23\x87\x42\x0e\x0e\x97\
-\x69\x73\xae\x9f\x6e\x89\x68\x01\x01\x03\xce\xfe\x46\x00\x00\x00\
-\x02\x00\x37\x00\x00\x06\x85\x05\x8d\x00\x0d\x00\x12\x00\x42\x00\
-\xb2\x00\x00\x00\x2b\xb1\x03\x08\x33\x33\xb2\x01\x02\x00\x2b\xb4\
-\x0b\x0e\x00\x01\x0d\x2b\xb1\x0b\x05\xe9\xb0\x05\x32\x01\xb0\x13\
-\x2f\xb0\x09\xd6\xb1\x08\x10\xe9\xb1\x14\x01\x2b\xb1\x08\x09\x11\
-\x12\xb1\x01\x11\x39\x39\x00\xb1\x01\x0e\x11\x12\xb0\x11\x39\x30\
-\x31\x33\x01\x33\x01\x23\x01\x07\x23\x11\x23\x11\x23\x27\x09\x01\
-\x21\x01\x27\x03\x37\x02\xc9\xbc\x02\xc9\xc7\xfe\xfa\x6c\xb6\x96\
-\xb4\x6f\xfe\xfa\x01\x42\x02\x66\xfe\xf6\x29\x85\x05\x8d\xfa\x73\
-\x02\x0e\x02\xfd\xf4\x02\x0c\x02\xfd\xf2\x02\x7f\x02\x1f\x60\xfe\
-\xe3\x00\x00\x00\x02\x00\x1d\x00\x00\x05\x44\x03\x8f\x00\x0b\x00\
-\x10\x00\x40\x00\xb2\x00\x00\x00\x2b\xb1\x03\x07\x33\x33\xb2\x01\
-\x01\x00\x2b\xb4\x0a\x0c\x00\x01\x0d\x2b\xb1\x0a\x05\xe9\xb0\x05\
-\x32\x01\xb0\x11\x2f\xb0\x08\xd6\xb1\x07\x0f\xe9\xb1\x12\x01\x2b\
-\xb1\x07\x08\x11\x12\xb0\x0f\x39\x00\xb1\x01\x0c\x11\x12\xb0\x0f\
-\x39\x30\x31\x33\x01\x33\x01\x23\x03\x23\x11\x23\x11\x23\x03\x13\
-\x21\x02\x27\x06\x1d\x02\x31\xc4\x02\x32\xae\xb3\xef\x8e\xf1\xb2\
-\xf9\x01\xe0\xdb\x15\x4c\x03\x8f\xfc\x71\x01\x21\xfe\xdf\x01\x21\
-\xfe\xdf\x01\x93\x01\x68\x2c\x8a\x00\x00\x00\x00\x02\x00\xc1\x00\
-\x00\x09\x6a\x05\x8d\x00\x15\x00\x1a\x00\x60\x00\xb2\x00\x00\x00\
-\x2b\xb2\x07\x0d\x11\x33\x33\x33\xb2\x01\x02\x00\x2b\xb0\x05\x33\
-\xb4\x10\x16\x00\x01\x0d\x2b\xb0\x03\x33\xb1\x10\x03\xe9\xb1\x09\
-\x13\x32\x32\x01\xb0\x1b\x2f\xb0\x00\xd6\xb1\x15\x0e\xe9\xb0\x02\
-\x32\xb0\x15\x10\xb1\x0e\x01\x2b\xb1\x0d\x10\xe9\xb1\x1c\x01\x2b\
-\xb1\x0e\x15\x11\x12\xb1\x05\x16\x39\x39\xb0\x0d\x11\xb0\x19\x39\
-\x00\xb1\x01\x16\x11\x12\xb0\x19\x39\x30\x31\x33\x11\x33\x11\x21\
-\x01\x33\x01\x23\x01\x23\x15\x21\x11\x23\x11\x21\x01\x23\x01\x21\
-\x11\x01\x21\x00\x27\x07\xc1\xb8\x02\x8f\x01\xa2\xc0\x03\x00\xca\
-\xfe\xe5\x21\xfe\xde\x96\xfe\xb8\xfe\xea\xa4\x01\x19\xfd\xb6\x03\
-\x31\x02\x9a\xfe\xcf\x1d\x6d\x05\x8d\xfc\xf8\x03\x08\xfa\x73\x02\
-\x0c\x04\xfd\xf8\x02\x08\xfd\xf8\x02\x08\xfd\xf8\x02\x85\x02\x3d\
-\x3c\xd3\x00\x00\x02\x00\xa4\x00\x00\x07\x87\x03\x8f\x00\x13\x00\
-\x16\x00\x60\x00\xb2\x00\x00\x00\x2b\xb2\x07\x0b\x0f\x33\x33\x33\
-\xb2\x01\x01\x00\x2b\xb0\x05\x33\xb4\x0e\x14\x00\x01\x0d\x2b\xb0\
-\x03\x33\xb1\x0e\x05\xe9\xb1\x09\x11\x32\x32\x01\xb0\x17\x2f\xb0\
-\x00\xd6\xb1\x13\x0d\xe9\xb0\x02\x32\xb0\x13\x10\xb1\x0c\x01\x2b\
-\xb1\x0b\x0f\xe9\xb1\x18\x01\x2b\xb1\x0c\x13\x11\x12\xb1\x05\x14\
-\x39\x39\xb0\x0b\x11\xb0\x16\x39\x00\xb1\x01\x14\x11\x12\xb0\x16\
-\x39\x30\x31\x33\x11\x33\x11\x21\x01\x33\x01\x23\x03\x21\x11\x23\
-\x11\x21\x03\x23\x13\x21\x11\x01\x21\x01\xa4\xa0\x01\xd9\x01\x4b\
-\xc9\x02\x56\xb0\xbe\xfe\xf9\x8d\xfe\xf6\xbf\xaa\xbd\xfe\x75\x02\
-\x81\x02\x08\xfe\xfc\x03\x8f\xfe\x04\x01\xfc\xfc\x71\x01\x21\xfe\
-\xdf\x01\x21\xfe\xdf\x01\x21\xfe\xdf\x01\x93\x01\x94\x00\x00\x00\
-\x02\x00\x21\x00\x00\x07\x68\x05\x8d\x00\x1e\x00\x21\x00\x3c\x00\
-\xb2\x00\x00\x00\x2b\xb1\x0f\x16\x33\x33\xb2\x07\x02\x00\x2b\xb1\
-\x1f\x08\xe9\x01\xb0\x22\x2f\xb0\x17\xd6\xb1\x16\x0d\xe9\xb1\x23\
-\x01\x2b\xb1\x16\x17\x11\x12\xb0\x20\x39\x00\xb1\x1f\x00\x11\x12\
-\xb4\x06\x09\x15\x18\x20\x24\x17\x39\x30\x31\x33\x01\x3e\x03\x37\
-\x01\x21\x01\x1e\x03\x17\x01\x23\x01\x2e\x02\x23\x11\x23\x11\x22\
-\x0e\x02\x07\x09\x03\x21\x01\x47\x25\x34\x68\xa6\x79\xfe\x16\x04\
-\xcd\xfe\x19\x79\xa7\x69\x31\x23\x01\x47\xb8\xfe\xc3\x1d\x21\x99\
-\x88\x9f\x6a\x84\x48\x12\x14\xfe\xc0\x01\x8d\x01\x63\x01\x66\x02\
-\x21\x3b\x40\x50\x2b\x08\x02\x6e\xfd\x92\x0a\x2c\x4f\x3c\x39\xfd\
-\xdb\x02\x25\x2f\x25\x2b\xfd\x5c\x02\xa4\x13\x2f\x18\x25\xfd\xdb\
-\x05\x0a\xfe\x38\x01\xc8\x00\x00\x02\x00\x21\x00\x00\x06\x35\x03\
-\x8f\x00\x1c\x00\x21\x00\x3c\x00\xb2\x00\x00\x00\x2b\xb1\x0e\x16\
-\x33\x33\xb2\x06\x01\x00\x2b\xb1\x1d\x03\xe9\x01\xb0\x22\x2f\xb0\
-\x17\xd6\xb1\x16\x0f\xe9\xb1\x23\x01\x2b\xb1\x16\x17\x11\x12\xb0\
-\x1f\x39\x00\xb1\x1d\x00\x11\x12\xb4\x05\x08\x15\x18\x1f\x24\x17\
-\x39\x30\x31\x33\x01\x3e\x02\x37\x01\x21\x01\x1e\x02\x17\x16\x01\
-\x23\x00\x27\x26\x27\x26\x27\x11\x23\x11\x0e\x01\x07\x03\x01\x16\
-\x17\x36\x37\x21\x01\x14\x2b\x44\xa6\x70\xfe\x71\x04\x00\xfe\x71\
-\x4e\x4b\x87\x32\x1d\x01\x2a\xac\xfe\xec\x11\x04\x0c\x33\xb0\x8a\
-\x98\x5b\x2b\xfc\x01\x72\xdb\x11\x23\xc9\x01\x5e\x35\x40\x48\x0e\
-\x01\x66\xfe\x9a\x0e\x11\x3f\x31\x1d\xfe\x83\x01\x7b\x0e\x02\x08\
-\x1f\x08\xfe\x46\x01\xba\x08\x1f\x39\xfe\xa6\x03\x10\xcf\x14\x2b\
-\xb8\x00\x00\x00\x02\x00\xc1\x00\x00\x0a\x14\x05\x8d\x00\x21\x00\
-\x24\x00\x6b\x00\xb2\x00\x00\x00\x2b\xb2\x0d\x14\x1b\x33\x33\x33\
-\xb2\x05\x02\x00\x2b\xb0\x01\x33\xb1\x22\x08\xe9\xb4\x03\x20\x00\
-\x05\x0d\x2b\xb1\x13\x16\x33\x33\xb1\x03\x03\xe9\x01\xb0\x25\x2f\
-\xb0\x00\xd6\xb1\x21\x0e\xe9\xb0\x02\x32\xb0\x21\x10\xb1\x15\x01\
-\x2b\xb1\x14\x0d\xe9\xb1\x26\x01\x2b\xb1\x15\x21\x11\x12\xb2\x04\
-\x05\x22\x39\x39\x39\xb0\x14\x11\xb0\x23\x39\x00\xb1\x03\x20\x11\
-\x12\xb1\x07\x08\x39\x39\xb0\x22\x11\xb0\x23\x39\x30\x31\x33\x11\
-\x33\x11\x21\x01\x21\x01\x1e\x03\x17\x01\x23\x01\x2e\x02\x23\x11\
-\x23\x11\x22\x0e\x01\x07\x01\x23\x01\x36\x37\x21\x11\x09\x02\xc1\
-\xb8\x04\x77\xfe\x1a\x04\xcd\xfe\x19\x79\xa7\x69\x31\x21\x01\x49\
-\xb8\xfe\xc1\x1d\x23\x95\x87\xa0\x89\x9a\x21\x1a\xfe\xc2\xb8\x01\
-\x43\x39\x30\xfd\x00\x03\x99\x01\x63\x01\x66\x05\x8d\xfd\x96\x02\
-\x6a\xfd\x92\x0a\x2c\x4f\x3c\x39\xfd\xdb\x02\x25\x2f\x27\x29\xfd\
-\x5c\x02\xa4\x2b\x25\x2f\xfd\xdb\x02\x1b\x5e\x2b\xfd\x5c\x05\x0a\
-\xfe\x38\x01\xc8\x00\x00\x00\x00\x02\x00\xa4\x00\x00\x08\x8b\x03\
-\x8f\x00\x20\x00\x26\x00\x68\x00\xb2\x00\x00\x00\x2b\xb2\x0d\x15\
-\x1b\x33\x33\x33\xb2\x05\x01\x00\x2b\xb0\x01\x33\xb1\x21\x03\xe9\
-\xb4\x03\x1f\x00\x05\x0d\x2b\xb1\x14\x17\x33\x33\xb1\x03\x05\xe9\
-\xb0\x24\x32\x01\xb0\x27\x2f\xb0\x00\xd6\xb1\x20\x0d\xe9\xb0\x02\
-\x32\xb0\x20\x10\xb1\x16\x01\x2b\xb1\x15\x0f\xe9\xb1\x28\x01\x2b\
-\xb1\x16\x20\x11\x12\xb2\x04\x05\x21\x39\x39\x39\xb0\x15\x11\xb1\
-\x23\x24\x39\x39\x00\xb1\x03\x1f\x11\x12\xb0\x07\x39\x30\x31\x33\
-\x11\x33\x11\x21\x01\x21\x01\x1e\x02\x17\x16\x01\x23\x00\x27\x26\
-\x27\x26\x27\x11\x23\x11\x0e\x01\x07\x03\x23\x01\x37\x21\x11\x01\
-\x1e\x01\x17\x36\x37\xa4\xa0\x03\xc6\xfe\x79\x03\xfe\xfe\x73\x50\
-\x47\x89\x32\x1d\x01\x28\xac\xfe\xee\x13\x04\x0c\x2f\xb4\x8a\x98\
-\x59\x2b\xfc\xac\x01\x3d\x2d\xfd\x61\x03\x54\x02\xd0\x17\x23\xc9\
-\x03\x8f\xfe\x9e\x01\x62\xfe\x9a\x0e\x11\x41\x31\x1d\xfe\x85\x01\
-\x7b\x10\x02\x09\x1d\x07\xfe\x46\x01\xba\x08\x1c\x3c\xfe\xa6\x01\
-\x91\x29\xfe\x46\x03\x10\x02\xc2\x1f\x2b\xb8\x00\x01\x00\x1d\xfe\
-\x5c\x04\x1b\x06\xbe\x00\x3f\x00\x7b\x00\xb0\x0d\x2f\xb1\x0e\x03\
-\xe9\x01\xb0\x40\x2f\xb0\x00\xd6\xb1\x3a\x11\xe9\xb3\x1a\x3a\x00\
-\x08\x2b\xb1\x19\x0d\xe9\xb0\x3a\x10\xb1\x14\x01\x2b\xb1\x26\x14\
-\xe9\xb2\x14\x26\x0a\x2b\xb3\x40\x14\x0d\x09\x2b\xb0\x26\x10\xb0\
-\x2c\x20\xd6\x11\xb1\x0a\x11\xe9\xb0\x0a\x2f\xb1\x2c\x11\xe9\xb1\
-\x41\x01\x2b\xb1\x19\x1a\x11\x12\xb3\x1f\x37\x3c\x3d\x24\x17\x39\
-\xb0\x14\x11\xb7\x08\x07\x1e\x20\x22\x24\x29\x36\x24\x17\x39\xb0\
-\x26\x12\xb2\x23\x31\x32\x39\x39\x39\x00\xb1\x0e\x0d\x11\x12\xb0\
-\x29\x39\x30\x31\x17\x34\x37\x3e\x01\x37\x36\x37\x3e\x01\x35\x10\
-\x21\x23\x35\x33\x32\x37\x3e\x01\x35\x10\x27\x22\x06\x07\x27\x3e\
-\x02\x37\x03\x33\x17\x37\x33\x03\x04\x11\x14\x06\x07\x1e\x01\x15\
-\x14\x0e\x07\x23\x04\x07\x06\x15\x14\x17\x07\x2e\x01\x1d\x52\x1f\
-\x62\xf1\x75\x4a\x66\x79\xfe\x98\x8a\x67\x5c\x27\x48\x74\xf8\x64\
-\xa8\x16\x9e\x0e\x7f\x7f\x44\xf2\x7f\xe3\xe2\x7d\xee\x01\x35\x97\
-\x9e\xa6\xc9\x11\x25\x22\x3e\x25\x47\x1b\x48\x02\xfe\x35\x04\x2f\
-\x48\x35\x5c\x50\xfc\x5a\x42\x19\x26\x58\x2b\x1b\x25\x77\x72\x01\
-\x19\x7f\x0e\x19\x87\x6c\x01\x0a\x01\x71\x75\x1d\x60\x8b\x3a\x0c\
-\x01\x0e\xe1\xe1\xfe\xf6\x27\xfe\xae\x6d\xb7\x30\x19\xc4\xa6\x2f\
-\x52\x41\x33\x2d\x1d\x21\x0c\x19\xaa\x02\x1d\x35\x46\x0a\x35\x04\
-\x6b\x00\x00\x00\x01\x00\x25\xfe\x5c\x03\x48\x04\x6d\x00\x41\x00\
-\xf5\x00\xb2\x28\x01\x00\x2b\xb1\x15\x03\xe9\xb2\x1b\x01\x00\x2b\
-\xb0\x0e\x2f\xb1\x0f\x05\xe9\x01\xb0\x42\x2f\xb0\x00\xd6\xb1\x3c\
-\x10\xe9\xb0\x3c\x10\xb1\x09\x01\x2b\xb1\x2f\x0f\xe9\xb0\x2f\x10\
-\xb0\x2b\x20\xd6\x11\xb1\x13\x0d\xe9\xb0\x13\x2f\xb1\x2b\x0d\xe9\
-\xb0\x24\x32\xb1\x43\x01\x2b\xb0\x36\x1a\xba\x11\xed\xc2\x90\x00\
-\x15\x2b\x0a\x0e\xb0\x04\x10\xb0\x06\xc0\xb1\x39\x07\xf9\xb0\x35\
-\xc0\xb0\x04\x10\xb3\x05\x04\x06\x13\x2b\xb0\x39\x10\xb3\x36\x39\
-\x35\x13\x2b\xb3\x37\x39\x35\x13\x2b\xb3\x38\x39\x35\x13\x2b\xb2\
-\x05\x04\x06\x20\x8a\x20\x8a\x23\x06\x0e\x11\x12\x39\xb2\x38\x39\
-\x35\x11\x12\x39\xb0\x36\x39\xb0\x37\x39\x00\xb6\x38\x04\x05\x06\
-\x35\x36\x37\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x01\xb6\x38\x04\x05\x06\
-\x35\x36\x37\x2e\x2e\x2e\x2e\x2e\x2e\x2e\xb0\x40\x1a\x01\xb1\x3c\
-\x00\x11\x12\xb1\x18\x20\x39\x39\xb0\x13\x11\x40\x09\x0d\x0e\x17\
-\x1c\x21\x22\x28\x3e\x3f\x24\x17\x39\xb0\x09\x12\xb1\x23\x2d\x39\
-\x39\x00\xb1\x0f\x0e\x11\x12\xb0\x2d\x39\xb0\x15\x11\xb2\x17\x18\
-\x2b\x39\x39\x39\x30\x31\x17\x34\x36\x37\x3e\x04\x35\x34\x27\x26\
-\x07\x23\x35\x33\x32\x36\x35\x34\x23\x06\x07\x27\x3e\x01\x3f\x01\
-\x23\x22\x26\x27\x33\x17\x37\x33\x07\x0e\x01\x07\x1e\x01\x15\x14\
-\x07\x16\x15\x14\x0e\x06\x23\x04\x07\x06\x07\x14\x17\x07\x2e\x01\
-\x25\x60\x44\x35\xa0\x70\x6f\x3b\x56\x42\x88\x73\x5a\x75\x85\xc7\
-\xb0\x2f\x8d\x1f\xa3\x67\x31\x29\x10\x55\xbe\x7f\xdf\xe4\x7c\xeb\
-\x1d\x0c\x23\xb4\x8a\x73\xa2\x17\x1f\x33\x29\x3d\x21\x35\x02\xfe\
-\xe3\x14\x35\x01\x6b\x58\x54\x54\xe7\x50\x72\x1b\x14\x29\x1f\x2f\
-\x4c\x35\x60\x34\x25\x01\x73\x48\x39\x79\x02\x71\x0d\x5c\x74\x0f\
-\x04\x39\x90\x94\x94\xaf\x14\x04\x02\x02\x92\x60\x64\x4c\x4e\xb2\
-\x2b\x4a\x33\x2f\x1d\x1a\x0b\x10\x52\x0a\x21\x39\x5e\x0f\x58\x04\
-\x71\x00\x00\x00\x01\x00\x71\x00\x00\x05\xc5\x05\x8d\x00\x38\x00\
-\x91\x00\xb2\x2b\x00\x00\x2b\xb2\x0c\x02\x00\x2b\xb4\x29\x0e\x2b\
-\x0c\x0d\x2b\xb0\x0b\x33\xb1\x29\x03\xe9\xb0\x2c\x32\xb4\x01\x00\
-\x2b\x0c\x0d\x2b\xb0\x20\x33\xb1\x01\x03\xe9\xb0\x1e\x32\x01\xb0\
-\x39\x2f\xb0\x35\xd6\xb1\x07\x13\xe9\xb2\x35\x07\x0a\x2b\xb3\x40\
-\x35\x00\x09\x2b\xb0\x07\x10\xb1\x2b\x01\x2b\xb0\x0b\x32\xb1\x2a\
-\x14\xe9\xb0\x0d\x32\xb0\x2a\x10\xb1\x19\x01\x2b\xb0\x16\x32\xb1\
-\x25\x14\xe9\xb2\x25\x19\x0a\x2b\xb3\x40\x25\x20\x09\x2b\xb1\x3a\
-\x01\x2b\xb1\x07\x35\x11\x12\xb0\x06\x39\xb1\x19\x2a\x11\x12\xb0\
-\x17\x39\x00\xb1\x00\x0e\x11\x12\xb3\x07\x1a\x25\x35\x24\x17\x39\
-\x30\x31\x13\x35\x33\x32\x1e\x06\x17\x11\x33\x11\x3e\x08\x34\x35\
-\x3e\x03\x3b\x01\x15\x0e\x04\x07\x06\x02\x07\x15\x23\x35\x23\x2e\
-\x04\x27\x2e\x04\x71\x95\x23\x29\x33\x1d\x08\x0a\x29\x7b\x69\xac\
-\x2d\x4b\x38\x2b\x1c\x15\x0a\x06\x02\x02\x19\x35\x31\x2f\x8a\x31\
-\x3c\x19\x08\x04\x04\x19\xd4\xd5\xac\x03\x27\x4b\x83\x61\x56\x0e\
-\x02\x04\x08\x19\x3d\x04\x6a\x7f\x08\x33\x66\xc7\xb8\xbf\x8f\x1d\
-\x04\x2f\xfb\xcf\x0c\x2b\x30\x45\x35\x59\x33\x5c\x25\x56\x08\x71\
-\x87\x3b\x0e\x7f\x04\x35\x62\x5a\x87\x25\xc1\xfe\xf2\x1f\xdb\xdb\
-\x06\x13\x45\x65\xc0\x7d\x1d\x7f\x56\x62\x37\x00\x01\x00\x37\xfe\
-\x71\x04\xe1\x05\xc7\x00\x38\x00\x92\x00\xb2\x2f\x00\x00\x2b\xb1\
-\x2a\x2c\x33\x33\xb1\x0d\x03\xe9\xb0\x10\x32\xb2\x0e\x02\x00\x2b\
-\xb2\x04\x01\x00\x2b\xb0\x1a\x33\xb1\x38\x03\xe9\xb0\x1e\x32\xb0\
-\x2e\x2f\x01\xb0\x39\x2f\xb0\x34\xd6\xb1\x0a\x0d\xe9\xb2\x34\x0a\
-\x0a\x2b\xb3\x40\x34\x01\x09\x2b\xb0\x34\x10\xb0\x36\x20\xd6\x11\
-\xb1\x07\x0d\xe9\xb0\x0a\x10\xb1\x0d\x01\x2b\xb0\x2e\x32\xb1\x10\
-\x11\xe9\xb0\x2c\x32\xb0\x10\x10\xb1\x13\x01\x2b\xb1\x24\x0d\xe9\
-\xb2\x24\x13\x0a\x2b\xb3\x40\x24\x1d\x09\x2b\xb0\x13\x10\xb0\x16\
-\x20\xd6\x11\xb1\x21\x0d\xe9\xb1\x3a\x01\x2b\x00\xb1\x38\x0d\x11\
-\x12\xb3\x07\x16\x24\x33\x24\x17\x39\x30\x31\x13\x35\x32\x36\x33\
-\x32\x16\x15\x14\x02\x15\x14\x16\x17\x11\x33\x11\x3e\x01\x35\x34\
-\x02\x35\x34\x3e\x01\x33\x32\x16\x33\x15\x23\x22\x15\x14\x16\x15\
-\x14\x0e\x04\x0f\x01\x11\x23\x11\x2e\x03\x34\x36\x35\x34\x23\x37\
-\x06\x17\x06\x85\x71\x1f\x90\x7e\x9a\x7d\x8f\x1c\x1e\x77\x60\x06\
-\x17\x06\x29\x50\x1f\x2f\x4a\x5a\x5a\x4a\x18\x19\xa0\x7d\xb2\x5a\
-\x25\x1f\x4e\x03\x27\x7d\x02\x92\x4b\x10\xfe\xff\x37\x79\x8d\x0e\
-\x05\x5a\xfa\xa6\x0e\x8d\x79\x37\x01\x00\x11\x29\x5a\x5a\x02\x7d\
-\x60\x0e\xf8\x44\x50\x83\x50\x3b\x1f\x10\x02\x02\xfe\x85\x01\x7b\
-\x0a\x52\x79\x78\x88\xf5\x0f\x62\x00\x00\x00\x00\x03\x00\x71\xff\
-\xd3\x05\x6f\x05\xba\x00\x0b\x00\x16\x00\x1f\x00\x57\x00\xb2\x09\
-\x00\x00\x2b\xb1\x1c\x08\xe9\xb2\x03\x02\x00\x2b\xb1\x13\x08\xe9\
-\xb4\x0c\x17\x09\x03\x0d\x2b\xb1\x0c\x03\xe9\x01\xb0\x20\x2f\xb0\
-\x00\xd6\xb1\x17\x0e\xe9\xb0\x0c\x32\xb0\x17\x10\xb1\x1f\x01\x2b\
-\xb0\x0d\x32\xb1\x06\x0e\xe9\xb1\x21\x01\x2b\xb1\x1f\x17\x11\x12\
-\xb2\x03\x09\x13\x39\x39\x39\x00\xb1\x0c\x17\x11\x12\xb1\x06\x00\
-\x39\x39\x30\x31\x13\x10\x00\x21\x20\x00\x11\x10\x00\x21\x20\x00\
-\x13\x21\x2e\x04\x23\x22\x02\x0f\x01\x14\x1e\x02\x33\x32\x00\x13\
-\x71\x01\x7b\x01\x06\x01\x02\x01\x7b\xfe\x81\xff\x00\xfe\xfe\xfe\
-\x83\xb8\x03\x8d\x0e\x5a\x67\x7f\x56\x22\xae\xf4\x1d\x06\x37\x69\
-\xb6\x6f\xb0\x01\x06\x10\x02\xc3\x01\x3d\x01\xba\xfe\x46\xfe\xc3\
-\xfe\xbe\xfe\x52\x01\xb1\x01\x9f\x87\xcf\x6a\x44\x10\xfe\xf2\xc5\
-\xc0\x52\xc1\xbc\x7d\x01\x42\x01\x0a\x00\x00\x00\x03\x00\x3d\xff\
-\xd3\x03\xc1\x03\xbc\x00\x0a\x00\x12\x00\x19\x00\x56\x00\xb2\x08\
-\x00\x00\x2b\xb1\x0e\x03\xe9\xb0\x12\x2f\xb1\x13\x05\xe9\xb0\x17\
-\x2f\xb1\x03\x03\xe9\x01\xb0\x1a\x2f\xb0\x00\xd6\xb1\x0b\x10\xe9\
-\xb0\x0b\x10\xb1\x11\x01\x2b\xb1\x06\x10\xe9\xb1\x1b\x01\x2b\xb1\
-\x11\x0b\x11\x12\xb3\x08\x03\x13\x14\x24\x17\x39\x00\xb1\x12\x0e\
-\x11\x12\xb0\x06\x39\xb0\x13\x11\xb0\x00\x39\xb0\x17\x12\xb0\x05\
-\x39\x30\x31\x13\x34\x00\x33\x32\x00\x10\x00\x23\x22\x00\x37\x14\
-\x16\x33\x32\x36\x37\x21\x37\x21\x2e\x01\x23\x22\x06\x3d\x01\x0b\
-\xb6\xb4\x01\x0f\xfe\xf1\xb4\xba\xfe\xf9\x96\xa2\x89\x71\xb6\x06\
-\xfd\xa8\x0a\x02\x42\x1d\xa4\x5e\x60\xa6\x01\xc5\xd7\x01\x20\xfe\
-\xde\xfe\x56\xfe\xe3\x01\x23\xba\x83\xd9\xb2\xb4\x73\x85\x8b\x89\
-\x00\x00\x00\x00\x01\x00\x1d\x00\x00\x05\x8d\x05\x8d\x00\x16\x00\
-\x27\x00\xb2\x16\x00\x00\x2b\xb2\x0f\x02\x00\x2b\xb0\x00\x33\xb1\
-\x11\x03\xe9\x01\xb0\x17\x2f\xb1\x18\x01\x2b\x00\xb1\x11\x16\x11\
-\x12\xb1\x0a\x04\x39\x39\x30\x31\x13\x33\x01\x12\x17\x36\x37\x13\
-\x36\x37\x3e\x04\x3b\x01\x15\x22\x06\x07\x01\x23\x1d\xbe\x01\x40\
-\x93\x0c\x0a\x5f\xd3\x0a\x12\x1f\x1f\x35\x2b\x40\x27\x76\x62\x31\
-\x21\xfe\x2f\xbc\x05\x8d\xfc\xcd\xfe\x6d\x38\x42\xfa\x02\x29\x19\
-\x30\x52\x4c\x67\x2b\x20\x7d\x24\x50\xfb\x64\x00\x01\x00\x1d\x00\
-\x00\x03\xc5\x03\xa4\x00\x10\x00\x27\x00\xb2\x10\x00\x00\x2b\xb2\
-\x00\x01\x00\x2b\xb2\x08\x01\x00\x2b\xb1\x0b\x03\xe9\x01\xb0\x11\
-\x2f\xb1\x12\x01\x2b\x00\xb1\x0b\x10\x11\x12\xb0\x03\x39\x30\x31\
-\x13\x33\x00\x17\x36\x12\x37\x36\x3b\x01\x15\x23\x22\x06\x07\x01\
-\x23\x1d\xa4\x01\x0a\x10\x0a\xb3\x35\x3b\x77\x46\x04\x3f\x20\x12\
-\xfe\xe5\xbc\x03\x8f\xfd\x46\x46\x31\x01\xe8\x81\x7b\x7d\x17\x2f\
-\xfd\x1f\x00\x00\x03\x00\x1d\x00\x00\x05\x8d\x06\xcf\x00\x16\x00\
-\x1c\x00\x22\x00\x27\x00\xb2\x16\x00\x00\x2b\xb2\x0f\x02\x00\x2b\
-\xb0\x00\x33\xb1\x11\x03\xe9\x01\xb0\x23\x2f\xb1\x24\x01\x2b\x00\
-\xb1\x11\x16\x11\x12\xb1\x0a\x04\x39\x39\x30\x31\x13\x33\x01\x12\
-\x17\x36\x37\x13\x36\x37\x3e\x04\x3b\x01\x15\x22\x06\x07\x01\x23\
-\x01\x33\x05\x23\x27\x26\x37\x33\x05\x23\x27\x26\x1d\xbe\x01\x40\
-\x93\x0c\x0a\x5f\xd3\x0a\x12\x1f\x1f\x35\x2b\x40\x27\x76\x62\x31\
-\x21\xfe\x2f\xbc\xfe\x3b\xe3\x01\x42\x95\x1d\x2b\x0e\xe4\x01\x3f\
-\x93\x1d\x2b\x05\x8d\xfc\xcd\xfe\x6d\x38\x42\xfa\x02\x29\x19\x30\
-\x52\x4c\x67\x2b\x20\x7d\x24\x50\xfb\x64\x06\xcf\xbb\x03\x10\xa8\
-\xbb\x03\x10\x00\x03\xff\xf6\x00\x00\x03\xc7\x05\x1f\x00\x03\x00\
-\x14\x00\x18\x00\x27\x00\xb2\x14\x00\x00\x2b\xb2\x04\x01\x00\x2b\
-\xb2\x0d\x01\x00\x2b\xb1\x0e\x03\xe9\x01\xb0\x19\x2f\xb1\x1a\x01\
-\x2b\x00\xb1\x0e\x14\x11\x12\xb0\x07\x39\x30\x31\x03\x33\x01\x23\
-\x05\x33\x00\x17\x36\x13\x3e\x01\x3b\x01\x15\x0e\x02\x07\x01\x23\
-\x03\x33\x01\x23\x0a\xa0\x01\x10\x7d\xfe\xf6\xa4\x01\x0a\x10\x0e\
-\xb1\x42\x57\x56\x3c\x2b\x3a\x16\x0f\xfe\xfa\xbc\x2f\xa0\x01\x10\
-\x7d\x05\x1f\xfe\xf5\x85\xfd\x46\x46\x44\x01\xd1\xac\x54\x7d\x04\
-\x29\x27\x27\xfd\x54\x05\x1f\xfe\xf5\x00\x00\x00\x02\x00\x71\xff\
-\x7f\x07\x1b\x06\x0e\x00\x27\x00\x46\x00\x9d\x00\xb2\x20\x00\x00\
-\x2b\xb0\x18\x33\xb1\x2e\x09\xe9\xb0\x31\x32\xb2\x20\x2e\x0a\x2b\
-\xb3\x40\x20\x1c\x09\x2b\xb2\x2e\x20\x0a\x2b\xb3\x40\x2e\x30\x09\
-\x2b\xb2\x06\x02\x00\x2b\xb0\x0e\x33\xb1\x42\x08\xe9\xb0\x3f\x32\
-\xb2\x42\x06\x0a\x2b\xb3\x40\x42\x41\x09\x2b\xb2\x06\x42\x0a\x2b\
-\xb3\x40\x06\x09\x09\x2b\x01\xb0\x47\x2f\xb0\x00\xd6\xb1\x28\x0e\
-\xe9\xb0\x28\x10\xb1\x2e\x01\x2b\xb1\x1f\x41\x32\x32\xb1\x31\x13\
-\xe9\xb1\x1a\x3f\x32\x32\xb0\x31\x10\xb1\x39\x01\x2b\xb1\x10\x0e\
-\xe9\xb1\x48\x01\x2b\xb1\x2e\x28\x11\x12\xb0\x06\x39\xb0\x31\x11\
-\xb1\x0d\x20\x39\x39\xb0\x39\x12\xb0\x0e\x39\x00\xb1\x42\x2e\x11\
-\x12\xb1\x10\x00\x39\x39\x30\x31\x13\x34\x3e\x02\x24\x3f\x01\x36\
-\x33\x32\x16\x1f\x02\x04\x11\x14\x0e\x05\x07\x22\x23\x06\x23\x22\
-\x26\x2f\x01\x2e\x06\x37\x14\x1e\x01\x17\x16\x17\x35\x33\x15\x3e\
-\x06\x35\x34\x2e\x03\x27\x15\x23\x35\x0e\x03\x71\x27\x68\xa8\x01\
-\x14\xb5\x02\x08\x4a\x25\x28\x02\x05\x02\x03\x00\x3a\x5e\x83\x87\
-\x9c\x7b\x3f\x06\x04\x08\x4a\x25\x29\x04\x02\x56\x73\xb0\x77\x89\
-\x52\x37\xb8\x14\x61\x58\x85\xf6\xa8\x77\xba\x79\x56\x2d\x18\x04\
-\x1c\x4e\x7f\xd3\x8d\xa8\xac\xee\x7b\x33\x02\xbe\x7d\xcf\xc9\x8b\
-\x58\x02\x02\x54\x2b\x14\x15\x02\x0a\xfd\x10\x8f\xe5\x96\x70\x3c\
-\x23\x0e\x04\x54\x2b\x14\x15\x06\x0e\x29\x3c\x70\x96\xe1\xb9\x73\
-\xa6\xcb\x3f\x60\x0f\x73\x73\x06\x3a\x49\x73\x64\x8c\x5a\x3f\x64\
-\xa2\x9c\x6b\x45\x04\x72\x72\x06\x5e\xa8\xc0\x00\x02\x00\x3d\xff\
-\xa2\x04\xa4\x03\xf8\x00\x1b\x00\x2d\x00\x97\x00\xb2\x16\x00\x00\
-\x2b\xb0\x1a\x33\xb1\x22\x08\xe9\xb0\x1f\x32\xb3\x0e\x16\x18\x0e\
-\x2b\xb4\x20\x04\x00\x0e\x04\x2b\xb2\x06\x01\x00\x2b\xb0\x0c\x33\
-\xb1\x2b\x03\xe9\xb0\x28\x32\xb2\x2b\x06\x0a\x2b\xb3\x40\x2b\x2a\
-\x09\x2b\xb2\x06\x2b\x0a\x2b\xb3\x40\x06\x08\x09\x2b\x01\xb0\x2e\
-\x2f\xb0\x00\xd6\xb1\x1c\x0d\xe9\xb0\x1c\x10\xb1\x1f\x01\x2b\xb1\
-\x06\x2a\x32\x32\xb1\x22\x0f\xe9\xb1\x0c\x28\x32\x32\xb0\x22\x10\
-\xb1\x25\x01\x2b\xb1\x14\x0d\xe9\xb1\x2f\x01\x2b\xb1\x1f\x1c\x11\
-\x12\xb0\x1a\x39\xb0\x22\x11\xb0\x16\x39\x00\xb1\x20\x22\x11\x12\
-\xb1\x1e\x23\x39\x39\xb0\x2b\x11\xb3\x14\x00\x1c\x25\x24\x17\x39\
-\x30\x31\x13\x34\x3e\x03\x37\x36\x33\x32\x1e\x01\x15\x1e\x06\x15\
-\x10\x05\x06\x23\x22\x27\x24\x13\x14\x16\x17\x35\x33\x15\x3e\x01\
-\x35\x34\x26\x27\x15\x23\x35\x0e\x01\x3d\x0d\x39\x62\xbf\x83\x0a\
-\x40\x1f\x22\x06\x66\xa3\x64\x4a\x20\x13\x02\xfe\x14\x0a\x3d\x42\
-\x08\xfe\x16\xa0\x89\xc1\x91\xbe\x8c\x8d\xbd\x91\xbc\x8e\x01\xc3\
-\x44\x6a\x8d\x62\x4a\x04\x4a\x25\x1b\x0a\x04\x31\x40\x64\x4c\x70\
-\x30\x26\xfe\x35\x0c\x4a\x4a\x0c\x01\xe3\xa8\xba\x0a\x64\x64\x08\
-\xba\xa8\x9e\xb4\x06\x64\x64\x06\xb4\x00\x00\x00\x02\x00\x87\xff\
-\xd3\x06\xcb\x07\x4a\x00\x37\x00\x63\x00\xe4\x00\xb2\x32\x00\x00\
-\x2b\xb0\x2c\x33\xb1\x0e\x08\xe9\xb0\x15\x32\xb2\x06\x02\x00\x2b\
-\xb0\x20\x33\xb1\x07\x08\xe9\xb0\x1f\x32\xb2\x56\x02\x00\x2b\xb0\
-\x45\x2f\xb1\x43\x0c\xe9\xb0\x5b\x2f\xb1\x3b\x04\xe9\x01\xb0\x64\
-\x2f\xb0\x00\xd6\xb1\x09\x0e\xe9\xb2\x09\x00\x0a\x2b\xb3\x40\x09\
-\x06\x09\x2b\xb0\x09\x10\xb1\x5f\x01\x2b\xb4\x5e\x16\x00\x14\x04\
-\x2b\xb0\x5e\x10\xb1\x10\x01\x2b\xb1\x13\x14\xe9\xb3\x58\x13\x10\
-\x08\x2b\xb1\x52\x16\xe9\xb0\x13\x10\xb1\x1b\x01\x2b\xb1\x26\x0e\
-\xe9\xb2\x1b\x26\x0a\x2b\xb3\x40\x1b\x20\x09\x2b\xb1\x65\x01\x2b\
-\xb1\x5f\x09\x11\x12\xb3\x0e\x32\x38\x63\x24\x17\x39\xb0\x5e\x11\
-\xb0\x61\x39\xb1\x13\x10\x11\x12\xb4\x2f\x3b\x54\x56\x5b\x24\x17\
-\x39\xb1\x52\x58\x11\x12\xb0\x50\x39\xb0\x1b\x11\xb3\x2c\x3f\x44\
-\x4d\x24\x17\x39\x00\xb1\x07\x0e\x11\x12\xb1\x00\x11\x39\x39\xb0\
-\x06\x11\xb0\x54\x39\xb1\x43\x45\x11\x12\xb2\x38\x5e\x63\x39\x39\
-\x39\xb0\x5b\x11\xb4\x3f\x4d\x52\x58\x5f\x24\x17\x39\x30\x31\x13\
-\x34\x12\x3e\x02\x37\x15\x04\x11\x14\x12\x1e\x01\x33\x32\x37\x11\
-\x33\x11\x16\x17\x33\x32\x3e\x01\x12\x10\x02\x2e\x01\x27\x35\x1e\
-\x03\x1d\x01\x14\x02\x0e\x02\x23\x22\x26\x27\x0e\x01\x23\x22\x2e\
-\x02\x02\x01\x36\x24\x33\x32\x17\x1e\x04\x3b\x01\x15\x22\x2e\x06\
-\x27\x26\x27\x16\x15\x14\x07\x23\x27\x36\x35\x34\x26\x23\x22\x06\
-\x07\x27\x36\x37\x06\x07\x87\x3e\x60\x83\x79\x41\xfe\xdd\x3a\x62\
-\x5c\x36\x85\x62\xac\x62\x83\x04\x33\x5f\x60\x39\x37\x5c\x5c\x35\
-\x8b\xc7\x60\x29\x42\x62\x87\x79\x42\x68\x81\x54\x4e\x87\x64\x42\
-\x79\x89\x62\x42\x01\x33\x27\x01\x04\xa8\xec\x8b\x0a\x25\x15\x2b\
-\x3f\x2f\x02\x27\x49\x34\x35\x1c\x27\x0f\x1c\x02\x1f\x35\x10\x8f\
-\x02\x4a\x6a\x22\x1b\x1f\x45\x02\x4c\x02\x33\xb6\x31\x02\xc7\xb4\
-\x01\x14\xa0\x67\x22\x02\x83\x0e\xfd\x9a\xba\xfe\xfb\x7b\x31\x3e\
-\x02\x4d\xfd\xb3\x3d\x01\x33\x7b\x01\x04\x01\x71\x01\x04\x81\x35\
-\x02\x83\x02\x8f\xe7\xe0\x79\x22\xb8\xfe\xe5\x9e\x64\x1f\x2f\x42\
-\x42\x2f\x21\x62\xa0\x01\x19\x04\x03\x8d\xab\x9c\x0c\x2f\x13\x1a\
-\x0b\x6a\x0c\x0f\x1e\x13\x27\x10\x27\x02\x1f\x1c\x29\x1a\x71\x95\
-\x49\x6a\x32\x1b\x24\x45\x50\x4a\x52\x3b\x2f\x94\x00\x00\x00\x00\
-\x02\x00\x87\xff\xd3\x06\x04\x05\x4a\x00\x2e\x00\x5f\x00\xd7\x00\
-\xb2\x2c\x00\x00\x2b\xb0\x27\x33\xb1\x0c\x08\xe9\xb0\x10\x32\xb0\
-\x04\x2f\xb0\x1d\x33\xb1\x03\x03\xe9\xb0\x1e\x32\xb0\x3a\x2f\xb1\
-\x39\x05\xe9\xb0\x56\x2f\xb1\x32\x04\xe9\x01\xb0\x60\x2f\xb0\x00\
-\xd6\xb1\x08\x0d\xe9\xb2\x08\x00\x0a\x2b\xb3\x40\x08\x03\x09\x2b\
-\xb0\x08\x10\xb1\x5a\x01\x2b\xb4\x59\x16\x00\x14\x04\x2b\xb0\x59\
-\x10\xb1\x53\x01\x2b\xb1\x45\x16\xe9\xb0\x45\x10\xb1\x17\x01\x2b\
-\xb1\x24\x0d\xe9\xb2\x17\x24\x0a\x2b\xb3\x40\x17\x1d\x09\x2b\xb1\
-\x61\x01\x2b\xb1\x5a\x08\x11\x12\xb3\x0d\x2c\x2f\x5f\x24\x17\x39\
-\xb0\x59\x11\xb0\x5d\x39\xb0\x53\x12\xb5\x0e\x29\x2a\x47\x32\x49\
-\x24\x17\x39\xb0\x45\x11\xb1\x0f\x43\x39\x39\xb0\x17\x12\xb4\x10\
-\x27\x34\x39\x40\x24\x17\x39\x00\xb1\x04\x0c\x11\x12\xb2\x00\x0e\
-\x24\x39\x39\x39\xb0\x03\x11\xb1\x47\x4a\x39\x39\xb1\x39\x3a\x11\
-\x12\xb4\x2f\x4c\x50\x59\x5f\x24\x17\x39\xb0\x56\x11\xb2\x40\x53\
-\x5a\x39\x39\x39\x30\x31\x13\x10\x36\x37\x15\x0e\x01\x0f\x01\x16\
-\x17\x16\x3b\x01\x13\x33\x13\x33\x32\x3e\x03\x37\x2e\x02\x27\x26\
-\x27\x35\x32\x1e\x03\x15\x14\x02\x23\x22\x27\x23\x06\x23\x22\x02\
-\x13\x36\x24\x33\x32\x17\x1e\x03\x33\x15\x22\x2e\x04\x27\x26\x27\
-\x16\x17\x14\x07\x23\x27\x35\x3e\x07\x35\x34\x26\x23\x22\x06\x07\
-\x27\x3e\x01\x37\x06\x07\x87\xec\xbe\x79\x85\x0a\x02\x08\x5e\x44\
-\x6c\x1f\x9c\x9b\x9c\x1f\x4a\x6a\x37\x21\x08\x02\x02\x0a\x2f\x2b\
-\x3b\x69\x39\x69\x79\x56\x39\xdb\xd5\x93\x79\x02\x79\x94\xd7\xdb\
-\xd1\x27\x01\x02\xa8\xee\x89\x02\x31\x19\x47\x2f\x2d\x52\x33\x39\
-\x15\x29\x02\x1f\x35\x10\x01\x90\x02\x4b\x02\x1c\x0a\x19\x0a\x13\
-\x08\x06\x25\x18\x25\x3c\x08\x4c\x02\x15\x1f\xb6\x30\x01\xc9\x01\
-\x00\xef\x04\x7f\x04\xa3\x8e\x43\xdb\x57\x3d\x01\xd7\xfe\x29\x35\
-\x4a\x71\x4b\x34\x46\x4d\x7f\x29\x39\x04\x7f\x16\x44\x68\xbb\x78\
-\xe9\xfe\xf5\x48\x48\x01\x0a\x03\x37\x8d\xa9\x9c\x04\x3d\x13\x1d\
-\x6c\x14\x19\x2f\x17\x35\x02\x21\x1c\x29\x1a\x66\xa0\x49\x02\x02\
-\x1d\x0a\x1b\x0e\x19\x12\x15\x0a\x19\x27\x48\x4e\x4a\x33\x33\x25\
-\x33\x8e\x00\x00\x02\x00\x87\xff\xd3\x06\xcb\x07\x1d\x00\x37\x00\
-\x43\x00\xbf\x00\xb2\x32\x00\x00\x2b\xb0\x2c\x33\xb1\x0e\x08\xe9\
-\xb0\x15\x32\xb2\x06\x02\x00\x2b\xb0\x20\x33\xb1\x07\x08\xe9\xb0\
-\x1f\x32\xb0\x38\x2f\xb1\x3b\x3f\x33\x33\xb4\x39\x04\x00\x0f\x04\
-\x2b\xb0\x39\x10\xb1\x42\x05\xe9\xb0\x3d\x32\x01\xb0\x44\x2f\xb0\
-\x00\xd6\xb1\x09\x0e\xe9\xb2\x09\x00\x0a\x2b\xb3\x40\x09\x06\x09\
-\x2b\xb0\x09\x10\xb1\x38\x01\x2b\xb1\x43\x16\xe9\xb0\x43\x10\xb1\
-\x10\x01\x2b\xb0\x40\x32\xb1\x13\x14\xe9\xb1\x3f\x0f\xe9\xb0\x13\
-\x10\xb1\x3c\x01\x2b\xb1\x3b\x16\xe9\xb0\x3b\x10\xb1\x1b\x01\x2b\
-\xb1\x26\x0e\xe9\xb2\x1b\x26\x0a\x2b\xb3\x40\x1b\x20\x09\x2b\xb1\
-\x45\x01\x2b\xb1\x43\x38\x11\x12\xb1\x0e\x32\x39\x39\xb1\x13\x10\
-\x11\x12\xb0\x2f\x39\xb1\x3b\x3c\x11\x12\xb0\x2c\x39\x00\xb1\x07\
-\x0e\x11\x12\xb1\x00\x11\x39\x39\xb1\x38\x32\x11\x12\xb0\x2f\x39\
-\x30\x31\x13\x34\x12\x3e\x02\x37\x15\x04\x11\x14\x12\x1e\x01\x33\
-\x32\x37\x11\x33\x11\x16\x17\x33\x32\x3e\x01\x12\x10\x02\x2e\x01\
-\x27\x35\x1e\x03\x1d\x01\x14\x02\x0e\x02\x23\x22\x26\x27\x0e\x01\
-\x23\x22\x2e\x02\x02\x01\x11\x21\x11\x23\x35\x23\x15\x23\x35\x23\
-\x15\x87\x3e\x60\x83\x79\x41\xfe\xdd\x3a\x62\x5c\x36\x85\x62\xac\
-\x62\x83\x04\x33\x5f\x60\x39\x37\x5c\x5c\x35\x8b\xc7\x60\x29\x42\
-\x62\x87\x79\x42\x68\x81\x54\x4e\x87\x64\x42\x79\x89\x62\x42\x01\
-\xc7\x02\xb6\x73\xa1\x8e\xa1\x02\xc7\xb4\x01\x14\xa0\x67\x22\x02\
-\x83\x0e\xfd\x9a\xba\xfe\xfb\x7b\x31\x3e\x02\x4d\xfd\xb3\x3d\x01\
-\x33\x7b\x01\x04\x01\x71\x01\x04\x81\x35\x02\x83\x02\x8f\xe7\xe0\
-\x79\x22\xb8\xfe\xe5\x9e\x64\x1f\x2f\x42\x42\x2f\x21\x62\xa0\x01\
-\x19\x03\xf1\x01\x1d\xfe\xe3\xaa\xaa\xaa\xaa\x00\x02\x00\x87\xff\
-\xd3\x06\x04\x05\x1f\x00\x2e\x00\x3a\x00\xcc\x00\xb2\x2c\x00\x00\
-\x2b\xb0\x27\x33\xb1\x0c\x08\xe9\xb0\x10\x32\xb0\x04\x2f\xb0\x1d\
-\x33\xb1\x03\x03\xe9\xb0\x1e\x32\xb0\x2f\x2f\xb1\x32\x36\x33\x33\
-\xb4\x30\x04\x00\x0f\x04\x2b\xb0\x30\x10\xb1\x39\x05\xe9\xb0\x34\
-\x32\x01\xb0\x3b\x2f\xb0\x00\xd6\xb1\x08\x0d\xe9\xb2\x08\x00\x0a\
-\x2b\xb3\x40\x08\x03\x09\x2b\xb0\x08\x10\xb1\x2f\x01\x2b\xb1\x3a\
-\x16\xe9\xb0\x3a\x10\xb1\x37\x01\x2b\xb1\x36\x0f\xe9\xb0\x36\x10\
-\xb1\x33\x01\x2b\xb1\x32\x16\xe9\xb0\x32\x10\xb1\x17\x01\x2b\xb1\
-\x24\x0d\xe9\xb2\x17\x24\x0a\x2b\xb3\x40\x17\x1d\x09\x2b\xb1\x3c\
-\x01\x2b\xb1\x2f\x08\x11\x12\xb1\x06\x09\x39\x39\xb0\x3a\x11\xb1\
-\x0d\x2c\x39\x39\xb0\x37\x12\xb0\x0e\x39\xb0\x36\x11\xb1\x29\x2a\
-\x39\x39\xb0\x33\x12\xb1\x10\x0f\x39\x39\xb0\x32\x11\xb0\x27\x39\
-\x00\xb1\x04\x0c\x11\x12\xb2\x00\x0e\x24\x39\x39\x39\xb1\x2f\x2c\
-\x11\x12\xb0\x29\x39\x30\x31\x13\x10\x36\x37\x15\x0e\x01\x0f\x01\
-\x16\x17\x16\x3b\x01\x13\x33\x13\x33\x32\x3e\x03\x37\x2e\x02\x27\
-\x26\x27\x35\x32\x1e\x03\x15\x14\x02\x23\x22\x27\x23\x06\x23\x22\
-\x02\x01\x11\x21\x11\x23\x35\x23\x15\x23\x35\x23\x15\x87\xec\xbe\
-\x79\x85\x0a\x02\x08\x5e\x44\x6c\x1f\x9c\x9b\x9c\x1f\x4a\x6a\x37\
-\x21\x08\x02\x02\x0a\x2f\x2b\x3b\x69\x39\x69\x79\x56\x39\xdb\xd5\
-\x93\x79\x02\x79\x94\xd7\xdb\x01\x65\x02\xb6\x73\xa2\x8d\xa2\x01\
-\xc9\x01\x00\xef\x04\x7f\x04\xa3\x8e\x43\xdb\x57\x3d\x01\xd7\xfe\
-\x29\x35\x4a\x71\x4b\x34\x46\x4d\x7f\x29\x39\x04\x7f\x16\x44\x68\
-\xbb\x78\xe9\xfe\xf5\x48\x48\x01\x0a\x03\x23\x01\x1f\xfe\xe1\xac\
-\xac\xac\xac\x00\x01\x00\x87\xfe\x44\x04\xf6\x05\xba\x00\x23\x00\
-\xb9\x00\xb2\x03\x02\x00\x2b\xb1\x09\x08\xe9\x01\xb0\x24\x2f\xb0\
-\x00\xd6\xb1\x0e\x13\xe9\xb0\x0e\x10\xb1\x1b\x01\x2b\xb1\x16\x0f\
-\xe9\xb1\x25\x01\x2b\xb0\x36\x1a\xba\xf0\x39\xc1\xfa\x00\x15\x2b\
-\x0a\x0e\xb0\x21\x10\xb0\x1e\xc0\xb1\x0f\x17\xf9\xb0\x12\xc0\xb3\
-\x10\x0f\x12\x13\x2b\xb3\x11\x0f\x12\x13\x2b\xb0\x21\x10\xb3\x1f\
-\x21\x1e\x13\x2b\xb3\x20\x21\x1e\x13\x2b\xb2\x10\x0f\x12\x20\x8a\
-\x20\x8a\x23\x06\x0e\x11\x12\x39\xb0\x11\x39\xb2\x20\x21\x1e\x11\
-\x12\x39\xb0\x1f\x39\x00\xb6\x10\x1e\x11\x12\x1f\x20\x21\x2e\x2e\
-\x2e\x2e\x2e\x2e\x2e\x01\xb6\x10\x1e\x11\x12\x1f\x20\x21\x2e\x2e\
-\x2e\x2e\x2e\x2e\x2e\xb0\x40\x1a\x01\xb1\x1b\x0e\x11\x12\xb2\x03\
-\x09\x19\x39\x39\x39\xb0\x16\x11\xb2\x06\x05\x18\x39\x39\x39\x00\
-\xb1\x03\x09\x11\x12\xb0\x05\x39\x30\x31\x13\x10\x00\x21\x32\x17\
-\x07\x2e\x01\x23\x22\x0e\x02\x15\x10\x05\x1e\x02\x17\x16\x15\x14\
-\x07\x27\x36\x35\x34\x26\x27\x2e\x02\x27\x24\x87\x01\x58\x01\x42\
-\xc5\xb8\x1f\x5e\x94\x6e\x83\xc5\x73\x37\x01\x64\x2d\xda\xae\x54\
-\x5c\x5a\x63\x2f\x5a\x70\x2d\xde\xba\x50\xfe\xfe\x02\xaa\x01\x64\
-\x01\xac\x45\xaa\x3b\x31\x68\xb6\xe0\x83\xfe\x10\x72\x0e\x25\x44\
-\x47\x58\x5f\x5c\x3f\x39\x23\x29\x25\x5e\x27\x0e\x27\x41\x3e\xcb\
-\x00\x00\x00\x00\x01\x00\x3d\xfe\x5c\x03\x7d\x04\x2d\x00\x2c\x00\
-\x46\x00\xb2\x0a\x01\x00\x2b\xb1\x03\x03\xe9\x01\xb0\x2d\x2f\xb0\
-\x00\xd6\xb1\x10\x10\xe9\xb0\x10\x10\xb1\x24\x01\x2b\xb1\x1d\x11\
-\xe9\xb1\x2e\x01\x2b\xb1\x24\x10\x11\x12\xb5\x0a\x03\x19\x20\x21\
-\x2a\x24\x17\x39\xb0\x1d\x11\xb1\x07\x06\x39\x39\x00\xb1\x03\x0a\
-\x11\x12\xb0\x06\x39\x30\x31\x13\x34\x12\x33\x32\x16\x17\x07\x2e\
-\x01\x23\x22\x0e\x03\x15\x1e\x08\x17\x1e\x01\x15\x14\x06\x07\x27\
-\x3e\x01\x35\x34\x2e\x02\x27\x26\x27\x26\x3d\xd7\xcd\x7d\x7d\x62\
-\x18\x52\x73\x68\x50\x73\x3b\x21\x08\x02\x0c\x1f\x16\x38\x1e\x4c\
-\x21\x5e\x11\x98\x9f\x5e\x5a\x50\x3d\x2f\x0e\x2b\x60\x48\xa0\x2f\
-\xf4\x02\x1f\xe1\x01\x2d\x25\x4c\x87\x48\x31\x3f\x54\x81\x58\x3a\
-\x39\x5c\x48\x35\x2d\x1b\x1d\x0c\x1b\x06\x2d\xb2\x66\x4c\x73\x04\
-\x50\x06\x48\x25\x14\x2d\x3e\x3d\x15\x2f\x18\x79\x00\x00\x00\x00\
-\x01\x00\x17\xfe\x4e\x03\x02\x01\xb2\x00\x14\x00\x16\x00\xb2\x0e\
-\x00\x00\x2b\xb2\x04\x00\x00\x2b\x01\xb0\x15\x2f\xb1\x16\x01\x2b\
-\x00\x30\x31\x13\x37\x27\x37\x17\x37\x27\x37\x17\x37\x33\x17\x07\
-\x17\x07\x27\x07\x17\x07\x27\x07\x17\xb8\x79\x40\x81\x81\x8e\x40\
-\x95\xb7\x02\x6a\xb8\x79\x40\x81\x81\x8d\x3f\x98\xb4\xfe\x96\xe5\
-\x52\x5e\x56\xa0\x60\x5e\x64\xe3\x48\xe5\x52\x5e\x56\xa0\x60\x5e\
-\x64\xe3\x00\x00\x01\xfe\x85\x04\x14\x01\x79\x05\x4a\x00\x0a\x00\
-\x3d\x00\xb0\x08\x2f\xb4\x05\x04\x00\x10\x04\x2b\xb0\x05\x10\xb0\
-\x01\x20\xd6\x11\xb4\x00\x04\x00\x10\x04\x2b\x01\xb0\x0b\x2f\xb0\
-\x00\xd6\xb1\x0a\x0f\xe9\xb0\x0a\x10\xb1\x04\x01\x2b\xb1\x07\x0f\
-\xe9\x00\xb1\x01\x08\x11\x12\xb1\x04\x09\x39\x39\x30\x31\x01\x11\
-\x33\x17\x05\x35\x33\x11\x23\x25\x15\xfe\x85\x50\x31\x01\xf0\x83\
-\x83\xfe\x12\x04\x14\x01\x03\x03\x5a\x90\xfe\xfe\x5c\x90\x00\x00\
-\x01\xfb\xd7\x03\xbc\x00\x00\x05\x4a\x00\x1f\x00\x2d\x00\xb0\x0f\
-\x2f\xb1\x0e\x05\xe9\xb0\x1b\x2f\xb1\x03\x0c\xe9\xb2\x1b\x03\x0a\
-\x2b\xb3\x40\x1b\x00\x09\x2b\x01\xb0\x20\x2f\x00\xb1\x1b\x0e\x11\
-\x12\xb2\x0b\x07\x18\x39\x39\x39\x30\x31\x01\x36\x24\x33\x32\x17\
-\x1e\x07\x33\x15\x22\x2e\x06\x35\x26\x2b\x01\x22\x0e\x01\x07\xfb\
-\xd7\x27\x01\x04\xa8\xf0\x8b\x02\x1f\x08\x1c\x11\x23\x1e\x2b\x19\
-\x25\x45\x34\x35\x1f\x27\x0e\x1f\x5c\xb0\x04\x3d\x75\x7f\x19\x04\
-\x14\x8d\xa9\xa0\x02\x29\x08\x21\x08\x17\x08\x08\x6b\x0f\x12\x21\
-\x16\x29\x11\x27\x02\x68\x1c\x61\x4e\x00\x00\x00\x01\xfd\x1d\x04\
-\x14\xfe\xa6\x05\xe7\x00\x12\x00\x31\x00\xb0\x0f\x2f\xb1\x03\x03\
-\xe9\x01\xb0\x13\x2f\xb0\x00\xd6\xb4\x12\x16\x00\x14\x04\x2b\xb0\
-\x12\x10\xb1\x0c\x01\x2b\xb1\x06\x16\xe9\xb1\x0c\x12\x11\x12\xb3\
-\x08\x03\x0a\x09\x24\x17\x39\x00\x30\x31\x01\x3e\x01\x33\x32\x16\
-\x15\x14\x07\x27\x35\x36\x27\x34\x26\x23\x22\x06\x07\xfd\x1d\x06\
-\x73\x43\x4e\x7f\x98\x49\x6f\x01\x35\x25\x23\x49\x05\x05\x39\x5a\
-\x54\x6a\x50\x87\x92\x4a\x02\x6f\x41\x21\x35\x35\x43\x00\x00\x00\
-\x01\xfc\xe5\x04\x14\xfe\x6f\x05\xe7\x00\x13\x00\x30\x00\xb0\x0b\
-\x2f\xb1\x03\x03\xe9\x01\xb0\x14\x2f\xb0\x00\xd6\xb1\x0e\x16\xe9\
-\xb0\x0e\x10\xb1\x08\x01\x2b\xb4\x07\x16\x00\x14\x04\x2b\xb1\x08\
-\x0e\x11\x12\xb2\x03\x10\x12\x39\x39\x39\x00\x30\x31\x01\x34\x36\
-\x33\x32\x16\x1f\x01\x07\x2e\x01\x23\x22\x06\x15\x14\x17\x15\x07\
-\x26\xfc\xe5\x7f\x4e\x44\x66\x0e\x05\x4c\x04\x48\x27\x21\x39\x71\
-\x4c\x96\x05\x2d\x52\x68\x4d\x3e\x23\x4b\x3d\x3b\x31\x25\x3f\x71\
-\x02\x4a\x9e\x00\x08\xf7\x50\xfd\x96\xff\xc9\x06\x6a\x00\x08\x00\
-\x12\x00\x1c\x00\x26\x00\x30\x00\x3b\x00\x46\x00\x52\x00\x93\x00\
-\xb2\x30\x02\x00\x2b\xb1\x2a\x04\xe9\xb0\x25\x2f\xb1\x20\x04\xe9\
-\xb0\x39\x2f\xb0\x10\x33\xb4\x34\x04\x00\x14\x04\x2b\xb0\x0b\x32\
-\xb0\x50\x2f\xb0\x07\x33\xb4\x4a\x04\x00\x14\x04\x2b\xb0\x02\x32\
-\xb0\x44\x2f\xb0\x1a\x33\xb4\x3f\x04\x00\x14\x04\x2b\xb0\x15\x32\
-\x01\xb0\x53\x2f\xb0\x01\xd6\xb4\x05\x0e\x00\x1e\x04\x2b\xb0\x05\
-\x10\xb1\x09\x01\x2b\xb0\x13\x32\xb1\x0e\x0e\xe9\xb0\x18\x32\xb0\
-\x0e\x10\xb1\x1d\x01\x2b\xb0\x27\x32\xb1\x22\x0e\xe9\xb0\x2d\x32\
-\xb0\x22\x10\xb1\x31\x01\x2b\xb0\x3c\x32\xb1\x37\x0e\xe9\xb0\x41\
-\x32\xb0\x37\x10\xb1\x47\x01\x2b\xb4\x4d\x0e\x00\x1e\x04\x2b\x00\
-\x30\x31\x00\x34\x36\x32\x16\x15\x14\x06\x22\x13\x34\x36\x32\x16\
-\x15\x14\x06\x22\x26\x11\x34\x36\x32\x16\x15\x14\x06\x22\x26\x01\
-\x34\x36\x32\x16\x15\x14\x06\x22\x26\x10\x34\x36\x33\x32\x16\x15\
-\x14\x06\x22\x01\x34\x36\x33\x32\x16\x14\x06\x23\x22\x26\x11\x34\
-\x36\x33\x32\x16\x14\x06\x23\x22\x26\x01\x34\x36\x33\x32\x16\x15\
-\x14\x06\x23\x22\x26\xf7\x50\x3d\x52\x3e\x3e\x52\xe4\x3b\x52\x3d\
-\x3b\x52\x3d\x3b\x52\x3d\x3b\x52\x3d\x02\xb6\x3b\x52\x3e\x3c\x52\
-\x3d\x39\x2b\x29\x3e\x3c\x52\x02\x79\x3e\x29\x2d\x37\x39\x2b\x2d\
-\x3a\x3c\x2b\x2d\x37\x39\x2b\x29\x3e\x01\x1f\x3d\x29\x2d\x3a\x3e\
-\x29\x2b\x3b\x01\xd5\x56\x3b\x3b\x2b\x29\x3d\xfd\x8f\x29\x3d\x3b\
-\x2b\x29\x3d\x3b\x05\xd9\x29\x3d\x3b\x2b\x29\x3d\x3b\xf9\x50\x29\
-\x3b\x39\x2b\x29\x3d\x3b\x08\x08\x56\x3b\x3b\x2b\x29\x3b\xf9\x89\
-\x2b\x3b\x3d\x52\x3d\x3d\x05\xd7\x29\x3d\x3d\x52\x3d\x3b\xfd\x54\
-\x2b\x3b\x3d\x29\x2b\x3b\x3d\x00\x08\xf6\xec\xfd\x2b\x00\x31\x06\
-\xd5\x00\x12\x00\x25\x00\x37\x00\x4a\x00\x5e\x00\x70\x00\x81\x00\
-\x93\x01\x32\x00\xb2\x28\x02\x00\x2b\xb2\x5c\x02\x00\x2b\xb1\x56\
-\x04\xe9\xb0\x48\x2f\xb1\x3b\x04\xe9\xb0\x6e\x2f\xb1\x62\x04\xe9\
-\xb0\x1d\x32\xb0\x23\x20\xd6\x11\xb4\x15\x0c\x00\x17\x04\x2b\xb0\
-\x18\x32\xb0\x10\x2f\xb1\x8a\x92\x33\x33\xb4\x0a\x04\x00\x14\x04\
-\x2b\xb1\x02\x85\x32\x32\xb0\x35\x2f\xb0\x7f\x33\xb4\x2f\x04\x00\
-\x14\x04\x2b\xb0\x2f\x10\xb0\x74\x20\xd6\x11\xb4\x7b\x0c\x00\x17\
-\x04\x2b\xb2\x7b\x74\x0a\x2b\xb3\x40\x7b\x78\x09\x2b\x01\xb0\x94\
-\x2f\xb0\x07\xd6\xb1\x0d\x0e\xe9\xb0\x0d\x10\xb1\x1b\x01\x2b\xb1\
-\x20\x0e\xe9\xb0\x32\x32\xb0\x26\x20\xd6\x11\xb4\x2d\x16\x00\x14\
-\x04\x2b\xb2\x2d\x26\x0a\x2b\xb3\x40\x2d\x2a\x09\x2b\xb0\x20\x10\
-\xb1\x38\x01\x2b\xb0\x4b\x32\xb1\x3e\x0e\xe9\xb1\x51\x59\x32\x32\
-\xb0\x3e\x10\xb1\x71\x01\x2b\xb0\x5f\x32\xb1\x83\x01\x2b\xb4\x8f\
-\x0e\x00\x1e\x04\x2b\xb2\x8f\x83\x0a\x2b\xb3\x00\x8f\x88\x09\x2b\
-\xb1\x26\x0d\x11\x12\xb0\x15\x39\xb0\x2d\x11\xb0\x23\x39\xb1\x20\
-\x1b\x11\x12\xb2\x19\x28\x35\x39\x39\x39\xb1\x3e\x38\x11\x12\xb0\
-\x56\x39\xb1\x83\x71\x11\x12\xb3\x65\x74\x7b\x7c\x24\x17\x39\x00\
-\xb1\x23\x3b\x11\x12\xb0\x69\x39\xb0\x15\x11\xb1\x65\x6c\x39\x39\
-\xb1\x62\x6e\x11\x12\xb2\x1b\x20\x25\x39\x39\x39\xb1\x0a\x10\x11\
-\x12\xb1\x07\x8f\x39\x39\xb1\x2f\x35\x11\x12\xb3\x26\x2d\x71\x76\
-\x24\x17\x39\x30\x31\x01\x34\x3b\x01\x1e\x02\x17\x3e\x01\x33\x32\
-\x16\x15\x14\x06\x23\x22\x26\x01\x36\x33\x32\x16\x3b\x01\x26\x35\
-\x34\x36\x32\x16\x15\x14\x06\x23\x22\x27\x13\x34\x37\x16\x17\x14\
-\x06\x15\x36\x17\x32\x16\x15\x14\x06\x23\x22\x26\x01\x34\x36\x33\
-\x32\x16\x15\x14\x06\x23\x22\x2f\x01\x3e\x02\x37\x2e\x01\x11\x34\
-\x36\x33\x32\x1f\x01\x15\x0e\x02\x07\x1e\x01\x15\x14\x06\x23\x22\
-\x26\x01\x34\x36\x33\x32\x16\x15\x14\x07\x26\x35\x34\x36\x35\x06\
-\x27\x22\x26\x11\x34\x36\x33\x32\x17\x06\x23\x22\x26\x23\x16\x14\
-\x06\x23\x22\x26\x00\x34\x36\x33\x32\x16\x15\x14\x07\x23\x2e\x02\
-\x27\x0e\x01\x23\x22\xf6\xec\x0e\x06\x08\x0f\x20\x1b\x02\x42\x22\
-\x2b\x3a\x3e\x27\x3f\x8d\x01\x1e\x06\x0f\x04\x41\x1f\x13\x23\x39\
-\x56\x3b\x76\x46\x6d\x0a\x58\x2d\x0e\x01\x13\x27\x25\x29\x3d\x3b\
-\x2b\x3d\x38\x02\xc7\x3d\x29\x2b\x3a\x87\x27\x08\x09\x04\x02\x19\
-\x31\x19\x3b\x32\x89\x25\x08\x08\x02\x02\x16\x33\x19\x3b\x34\x3e\
-\x29\x2b\x39\x02\xb6\x3c\x2b\x3f\x35\x2d\x0e\x12\x27\x26\x29\x3c\
-\x75\x46\x75\x01\x06\x0a\x02\x4e\x29\x23\x39\x2b\x29\x3e\x01\x1f\
-\x39\x2d\x3f\x8e\x0e\x06\x0a\x11\x1f\x18\x04\x40\x23\x2b\x02\x50\
-\x12\x04\x16\x34\x1a\x3b\x31\x3d\x29\x2b\x3b\x8d\xfc\xb4\x0e\x0e\
-\x27\x27\x29\x3d\x3b\x2b\x3f\x3a\x25\x06\x52\x7d\x02\x06\x0a\x02\
-\x4e\x29\x21\x01\x3b\x2b\x29\x3d\x70\xf9\x1b\x2d\x37\x3d\x27\x3d\
-\x94\x08\x0c\x08\x11\x23\x1b\x02\x41\x08\x2b\x3d\x94\x08\x06\x06\
-\x0a\x0f\x23\x1b\x02\x41\x23\x2d\x37\x3d\xf9\x4c\x29\x3b\x6e\x46\
-\x79\x06\x04\x0c\x02\x4e\x29\x21\x01\x3b\x05\xd9\x3f\x3a\x29\x10\
-\x10\x27\x52\x3b\x39\xfd\x2d\x4e\x3f\x8f\x27\x0a\x08\x02\x1a\x32\
-\x18\x3b\x2f\x00\x02\x00\xc1\xfe\x71\x05\x44\x07\x1d\x00\x10\x00\
-\x20\x00\x95\x00\xb2\x00\x00\x00\x2b\xb0\x0b\x33\xb2\x01\x02\x00\
-\x2b\xb0\x05\x33\xb0\x0a\x2f\xb0\x1e\x2f\xb1\x16\x09\xe9\xb2\x16\
-\x1e\x0a\x2b\xb3\x40\x16\x11\x09\x2b\xb0\x1a\x32\x01\xb0\x21\x2f\
-\xb0\x00\xd6\xb1\x03\x15\xe9\xb3\x11\x03\x00\x08\x2b\xb4\x12\x0f\
-\x00\x20\x04\x2b\xb0\x03\x10\xb1\x0c\x01\x2b\xb1\x07\x14\xe9\xb3\
-\x1b\x07\x0c\x08\x2b\xb4\x1a\x16\x00\x32\x04\x2b\xb0\x1a\x2f\xb4\
-\x1b\x16\x00\x32\x04\x2b\xb3\x0a\x07\x0c\x08\x2b\xb1\x09\x0f\xe9\
-\xb1\x22\x01\x2b\xb1\x12\x11\x11\x12\xb0\x10\x39\xb0\x1a\x11\xb0\
-\x1e\x39\xb0\x1b\x12\xb0\x05\x39\x00\xb1\x01\x00\x11\x12\xb3\x03\
-\x07\x08\x0e\x24\x17\x39\x30\x31\x33\x11\x33\x11\x37\x01\x33\x11\
-\x33\x11\x23\x11\x23\x11\x27\x07\x01\x03\x33\x1e\x02\x33\x32\x3e\
-\x01\x37\x33\x0e\x01\x23\x22\x26\xc1\xb0\x47\x02\x19\xfa\x79\x83\
-\xa4\x02\x48\xfd\xe7\x50\x7f\x06\x5f\x50\x27\x29\x51\x5f\x06\x7d\
-\x04\xd1\x85\x87\xd2\x05\x8d\xfb\x02\x9c\x04\x62\xfa\xf8\xfd\xec\
-\x01\x8f\x04\xbc\x42\x9c\xfb\x9e\x07\x1d\x3d\x48\x0f\x0f\x47\x3e\
-\x85\x98\x98\x00\x02\x00\xa6\xfe\xb4\x04\x10\x05\x1d\x00\x0d\x00\
-\x1e\x00\x80\x00\xb2\x00\x00\x00\x2b\xb0\x0a\x33\xb2\x01\x01\x00\
-\x2b\xb0\x04\x33\xb0\x1d\x2f\xb1\x14\x09\xe9\xb2\x14\x1d\x0a\x2b\
-\xb3\x40\x14\x0e\x09\x2b\xb0\x19\x32\x01\xb0\x1f\x2f\xb0\x00\xd6\
-\xb1\x03\x11\xe9\xb0\x0f\x32\xb0\x03\x10\xb4\x0e\x16\x00\x32\x04\
-\x2b\xb0\x0e\x2f\xb0\x03\x10\xb1\x0b\x01\x2b\xb0\x19\x32\xb1\x06\
-\x11\xe9\xb4\x1a\x16\x00\x32\x04\x2b\xb3\x09\x06\x0b\x08\x2b\xb1\
-\x08\x0f\xe9\xb1\x20\x01\x2b\xb1\x0b\x0e\x11\x12\xb2\x04\x0d\x1c\
-\x39\x39\x39\x00\xb1\x01\x00\x11\x12\xb3\x03\x06\x07\x0c\x24\x17\
-\x39\x30\x31\x33\x11\x33\x11\x01\x33\x11\x33\x11\x23\x11\x23\x11\
-\x01\x03\x33\x1e\x03\x33\x32\x3e\x02\x37\x33\x0e\x01\x20\x26\xa6\
-\x99\x01\x82\xe1\x6e\x83\x85\xfe\x7f\xbc\x7d\x04\x35\x4c\x3d\x1b\
-\x1d\x3b\x4e\x35\x04\x7d\x04\xd1\xfe\xf6\xd3\x03\x8f\xfd\x00\x03\
-\x00\xfc\xee\xfe\x37\x01\x4c\x03\x00\xfd\x00\x05\x1d\x2d\x42\x1b\
-\x0a\x0a\x1b\x42\x2d\x85\x98\x9a\x00\x00\x00\x00\x02\x00\x10\x00\
-\x00\x05\xc7\x05\x8d\x00\x16\x00\x26\x00\x70\x00\xb2\x15\x00\x00\
-\x2b\xb1\x17\x05\xe9\xb2\x03\x02\x00\x2b\xb4\x09\x26\x15\x03\x0d\
-\x2b\xb1\x09\x03\xe9\xb4\x01\x00\x15\x03\x0d\x2b\xb0\x07\x33\xb1\
-\x01\x06\xe9\xb0\x05\x32\x01\xb0\x27\x2f\xb0\x15\xd6\xb0\x02\x32\
-\xb1\x17\x14\xe9\xb1\x04\x08\x32\x32\xb2\x17\x15\x0a\x2b\xb3\x40\
-\x17\x07\x09\x2b\xb2\x15\x17\x0a\x2b\xb3\x40\x15\x00\x09\x2b\xb0\
-\x17\x10\xb1\x1d\x01\x2b\xb1\x0f\x13\xe9\xb1\x28\x01\x2b\x00\xb1\
-\x26\x17\x11\x12\xb1\x0f\x1d\x39\x39\x30\x31\x13\x35\x21\x35\x33\
-\x15\x21\x15\x21\x11\x21\x32\x17\x1e\x01\x15\x14\x0e\x02\x23\x21\
-\x11\x13\x33\x3e\x01\x37\x36\x35\x34\x2e\x02\x23\x22\x06\x2b\x01\
-\x10\x01\x9a\xac\x02\xb4\xfd\x4c\x01\x4c\xc5\x80\x68\x78\x38\x74\
-\xe2\x93\xfe\x04\xac\xee\x7f\x64\x50\xa8\x2d\x5f\xb2\x74\x08\x1f\
-\x09\xe7\x04\x3f\x79\xd5\xd5\x79\xfe\xe4\x48\x39\xae\x65\x3d\x81\
-\x7f\x52\x04\x3f\xfc\x34\x02\x10\x23\x58\x8d\x2d\x5d\x58\x37\x02\
-\x00\x00\x00\x00\x02\x00\x25\x00\x00\x03\xba\x05\x1d\x00\x14\x00\
-\x1e\x00\x72\x00\xb2\x13\x00\x00\x2b\xb1\x15\x08\xe9\xb2\x01\x01\
-\x00\x2b\xb0\x05\x33\xb1\x00\x06\xe9\xb0\x07\x32\xb2\x01\x00\x0a\
-\x2b\xb3\x40\x01\x03\x09\x2b\xb4\x1e\x09\x13\x03\x0d\x2b\xb1\x1e\
-\x05\xe9\x01\xb0\x1f\x2f\xb0\x13\xd6\xb0\x02\x32\xb1\x15\x11\xe9\
-\xb1\x04\x08\x32\x32\xb2\x15\x13\x0a\x2b\xb3\x40\x15\x07\x09\x2b\
-\xb2\x13\x15\x0a\x2b\xb3\x40\x13\x00\x09\x2b\xb0\x15\x10\xb1\x1a\
-\x01\x2b\xb1\x0d\x0f\xe9\xb1\x20\x01\x2b\x00\xb1\x1e\x15\x11\x12\
-\xb0\x0d\x39\x30\x31\x13\x35\x33\x11\x33\x11\x21\x15\x21\x15\x33\
-\x32\x16\x15\x14\x0e\x02\x23\x21\x11\x13\x33\x32\x37\x36\x35\x34\
-\x26\x2b\x01\x25\xaa\x99\x01\x79\xfe\x87\xd7\xc1\xba\x1e\x4a\x9e\
-\x6e\xfe\x89\x99\xb3\xa8\x3f\x27\x85\x89\xb3\x03\x17\x78\x01\x8e\
-\xfe\x72\x78\xea\xac\x66\x31\x59\x5a\x37\x03\x17\xfd\x6c\x3e\x27\
-\x39\x37\x62\x00\x02\x00\xc3\x00\x00\x04\xb6\x05\x8d\x00\x13\x00\
-\x22\x00\x71\x00\xb2\x00\x00\x00\x2b\xb2\x01\x02\x00\x2b\xb1\x22\
-\x05\xe9\xb2\x18\x01\x00\x2b\xb4\x14\x12\x00\x18\x0d\x2b\xb1\x14\
-\x06\xe9\x01\xb0\x23\x2f\xb0\x01\xd6\xb1\x14\x15\xe9\xb0\x12\x32\
-\xb0\x14\x10\xb1\x1c\x01\x2b\xb1\x07\x13\xe9\xb1\x24\x01\x2b\xb1\
-\x1c\x14\x11\x12\xb1\x0c\x09\x39\x39\xb0\x07\x11\xb0\x0b\x39\x00\
-\xb1\x12\x00\x11\x12\xb1\x0a\x0b\x39\x39\xb0\x14\x11\xb1\x09\x0c\
-\x39\x39\xb0\x18\x12\xb1\x19\x1a\x39\x39\xb0\x22\x11\xb1\x07\x1c\
-\x39\x39\x30\x31\x33\x11\x21\x32\x1e\x02\x15\x14\x07\x17\x07\x25\
-\x06\x27\x22\x26\x2b\x01\x11\x03\x21\x37\x27\x37\x17\x33\x36\x35\
-\x34\x2e\x02\x23\x21\xc3\x01\xe3\x87\xd1\x71\x39\xcd\xdb\x50\xfe\
-\xf6\x60\x50\x0c\x2d\x0d\xeb\x06\x01\x39\x33\x99\x50\xd2\x05\x93\
-\x23\x50\x9f\x6d\xfe\xf2\x05\x8d\x50\x81\x87\x41\xcb\x8f\xbb\x5c\
-\xe1\x17\x01\x02\xfd\xb0\x02\xc7\x06\x83\x5e\xb6\x60\x9a\x31\x60\
-\x5e\x3a\x00\x00\x02\x00\xa6\xfe\x71\x04\x58\x03\xa4\x00\x13\x00\
-\x24\x00\x6d\x00\xb2\x10\x00\x00\x2b\xb0\x0c\x33\xb1\x18\x03\xe9\
-\xb2\x01\x01\x00\x2b\xb2\x05\x01\x00\x2b\xb1\x22\x08\xe9\xb0\x00\
-\x2f\x01\xb0\x25\x2f\xb0\x00\xd6\xb1\x13\x0d\xe9\xb1\x02\x14\x32\
-\x32\xb0\x13\x10\xb1\x1f\x01\x2b\xb1\x08\x0d\xe9\xb1\x26\x01\x2b\
-\xb1\x1f\x13\x11\x12\xb0\x05\x39\xb0\x08\x11\xb2\x0a\x0d\x0e\x39\
-\x39\x39\x00\xb1\x18\x10\x11\x12\xb1\x0b\x12\x39\x39\xb0\x22\x11\
-\xb3\x0a\x08\x0e\x0d\x24\x17\x39\xb0\x01\x12\xb0\x03\x39\x30\x31\
-\x13\x11\x33\x15\x36\x33\x32\x12\x15\x14\x07\x17\x07\x27\x23\x06\
-\x07\x22\x27\x19\x01\x14\x17\x16\x17\x32\x37\x27\x37\x17\x36\x35\
-\x34\x26\x23\x22\x07\xa6\x99\x91\xc3\x8d\xb7\x2f\xb0\x52\x9e\x02\
-\x71\x9d\x9a\x78\x12\x44\x70\x83\x5d\xd1\x52\xb8\x10\x9f\x75\x79\
-\x62\xfe\x71\x05\x1e\x64\x79\xfe\xe5\xbe\x6a\x80\x95\x60\x89\x8b\
-\x01\x75\xfe\x13\x02\xaa\x31\x1d\x64\x01\x77\xb0\x61\x9e\x46\x31\
-\x8d\xcb\x75\x00\x01\x00\xc1\x00\x00\x04\x1b\x07\x1d\x00\x07\x00\
-\x37\x00\xb2\x00\x00\x00\x2b\xb2\x01\x02\x00\x2b\xb1\x06\x08\xe9\
-\xb2\x01\x06\x0a\x2b\xb3\x40\x01\x03\x09\x2b\x01\xb0\x08\x2f\xb0\
-\x00\xd6\xb1\x07\x0e\xe9\xb0\x07\x10\xb1\x02\x01\x2b\xb1\x05\x0f\
-\xe9\xb1\x09\x01\x2b\x00\x30\x31\x33\x11\x21\x11\x33\x11\x21\x11\
-\xc1\x02\xd7\x83\xfd\x5e\x05\x8d\x01\x90\xfd\xed\xfa\xf6\x00\x00\
-\x01\x00\xa4\x00\x00\x03\x08\x04\x5c\x00\x07\x00\x37\x00\xb2\x00\
-\x00\x00\x2b\xb2\x01\x01\x00\x2b\xb1\x06\x03\xe9\xb2\x01\x06\x0a\
-\x2b\xb3\x40\x01\x03\x09\x2b\x01\xb0\x08\x2f\xb0\x00\xd6\xb1\x07\
-\x0d\xe9\xb0\x07\x10\xb1\x02\x01\x2b\xb1\x05\x0f\xe9\xb1\x09\x01\
-\x2b\x00\x30\x31\x33\x11\x21\x35\x33\x11\x21\x11\xa4\x01\xdf\x85\
-\xfe\x3c\x03\x8f\xcd\xfe\xb4\xfc\xf0\x00\x00\x00\x01\x00\x25\x00\
-\x00\x03\xfc\x05\x8d\x00\x10\x00\x54\x00\xb2\x0f\x00\x00\x2b\xb2\
-\x03\x02\x00\x2b\xb1\x08\x08\xe9\xb4\x01\x00\x0f\x03\x0d\x2b\xb0\
-\x0c\x33\xb1\x01\x06\xe9\xb0\x0a\x32\x01\xb0\x11\x2f\xb0\x0f\xd6\
-\xb0\x02\x32\xb1\x0e\x0e\xe9\xb0\x09\x32\xb2\x0e\x0f\x0a\x2b\xb3\
-\x40\x0e\x0c\x09\x2b\xb3\x40\x0e\x04\x09\x2b\xb2\x0f\x0e\x0a\x2b\
-\xb3\x40\x0f\x00\x09\x2b\xb1\x12\x01\x2b\x00\x30\x31\x13\x35\x33\
-\x11\x21\x15\x23\x27\x21\x27\x11\x33\x15\x23\x11\x23\x11\x25\x99\
-\x03\x3e\x66\x32\xfe\x4a\x37\xeb\xeb\xb9\x02\xa8\x77\x02\x6e\x87\
-\x02\x02\xfe\x15\x77\xfd\x58\x02\xa8\x00\x00\x00\x01\x00\x25\x00\
-\x00\x03\x06\x03\x8f\x00\x0e\x00\x54\x00\xb2\x0d\x00\x00\x2b\xb2\
-\x03\x01\x00\x2b\xb1\x06\x07\xe9\xb4\x01\x00\x0d\x03\x0d\x2b\xb0\
-\x0a\x33\xb1\x01\x05\xe9\xb0\x08\x32\x01\xb0\x0f\x2f\xb0\x0d\xd6\
-\xb0\x02\x32\xb1\x0c\x0d\xe9\xb0\x07\x32\xb2\x0c\x0d\x0a\x2b\xb3\
-\x40\x0c\x0a\x09\x2b\xb3\x40\x0c\x04\x09\x2b\xb2\x0d\x0c\x0a\x2b\
-\xb3\x40\x0d\x00\x09\x2b\xb1\x10\x01\x2b\x00\x30\x31\x13\x35\x33\
-\x11\x21\x15\x21\x27\x15\x33\x15\x23\x11\x23\x11\x25\x7d\x02\x64\
-\xfe\x89\x4b\xcc\xcc\xa2\x01\xba\x73\x01\x62\x7b\x03\xea\x73\xfe\
-\x46\x01\xba\x00\x01\x00\xc1\xfe\x44\x05\x37\x05\x8d\x00\x20\x00\
-\x63\x00\xb2\x00\x00\x00\x2b\xb2\x18\x00\x00\x2b\xb2\x01\x02\x00\
-\x2b\xb1\x06\x08\xe9\xb0\x10\x2f\xb1\x16\x03\xe9\xb4\x08\x1f\x00\
-\x01\x0d\x2b\xb1\x08\x03\xe9\x01\xb0\x21\x2f\xb0\x00\xd6\xb1\x20\
-\x0e\xe9\xb0\x07\x32\xb2\x20\x00\x0a\x2b\xb3\x40\x20\x02\x09\x2b\
-\xb0\x20\x10\xb1\x19\x01\x2b\xb1\x0d\x13\xe9\xb1\x22\x01\x2b\xb1\
-\x19\x20\x11\x12\xb1\x10\x12\x39\x39\x00\xb1\x00\x16\x11\x12\xb0\
-\x13\x39\x30\x31\x33\x11\x21\x15\x23\x27\x21\x27\x11\x33\x20\x17\
-\x16\x07\x14\x00\x23\x22\x27\x37\x1e\x01\x33\x32\x12\x35\x34\x02\
-\x27\x26\x2b\x01\x11\xc1\x03\x93\x75\x33\xfe\x15\x48\xf6\x01\xa6\
-\xac\x77\x01\xfe\xe2\xe0\x85\x7b\x25\x4a\x48\x49\x98\xc0\xe7\xdd\
-\x2f\x5c\xc9\x05\x8d\x87\x02\x02\xfe\x19\xe6\x9e\xf1\xfe\xfe\x94\
-\x2d\x8b\x25\x14\x01\x1e\xc9\xd3\x01\x0a\x19\x04\xfd\x5c\x00\x00\
-\x01\x00\xa4\xfe\x5c\x03\xd7\x03\x8f\x00\x1b\x00\x5e\x00\xb2\x00\
-\x00\x00\x2b\xb2\x01\x01\x00\x2b\xb1\x04\x07\xe9\xb0\x0f\x2f\xb1\
-\x14\x03\xe9\xb4\x06\x1a\x00\x01\x0d\x2b\xb1\x06\x05\xe9\x01\xb0\
-\x1c\x2f\xb0\x00\xd6\xb1\x1b\x0d\xe9\xb0\x05\x32\xb2\x1b\x00\x0a\
-\x2b\xb3\x40\x1b\x02\x09\x2b\xb0\x1b\x10\xb1\x17\x01\x2b\xb1\x0c\
-\x0f\xe9\xb1\x1d\x01\x2b\xb1\x17\x1b\x11\x12\xb1\x0f\x11\x39\x39\
-\x00\xb1\x00\x14\x11\x12\xb0\x12\x39\x30\x31\x33\x11\x21\x15\x21\
-\x27\x15\x33\x32\x1e\x02\x15\x14\x02\x23\x22\x27\x37\x16\x33\x32\
-\x36\x35\x10\x05\x23\x11\xa4\x02\x64\xfe\x89\x4d\xd3\x81\xb6\x60\
-\x29\xd3\xc2\x5a\x59\x23\x58\x3a\x7b\x89\xfe\xa8\xac\x03\x8f\x7b\
-\x03\xea\x52\x8d\x9e\x5c\xc7\xfe\xcf\x15\x87\x1b\xdb\x96\x01\x6d\
-\x01\xfe\x46\x00\x01\x00\x54\xfe\x71\x08\x98\x05\x8d\x00\x17\x00\
-\x5c\x00\xb2\x00\x00\x00\x2b\xb1\x0f\x13\x33\x33\xb2\x02\x02\x00\
-\x2b\xb1\x05\x08\x33\x33\xb0\x0e\x2f\x01\xb0\x18\x2f\xb0\x14\xd6\
-\xb0\x04\x32\xb1\x13\x15\xe9\xb0\x06\x32\xb0\x13\x10\xb1\x0e\x01\
-\x2b\xb1\x0d\x0f\xe9\xb1\x19\x01\x2b\xb1\x0e\x13\x11\x12\xb1\x08\
-\x0a\x39\x39\xb0\x0d\x11\xb1\x0b\x09\x39\x39\x00\xb1\x02\x00\x11\
-\x12\xb5\x04\x07\x0b\x0c\x11\x16\x24\x17\x39\x30\x31\x33\x09\x01\
-\x33\x01\x11\x33\x11\x01\x33\x09\x01\x33\x11\x23\x11\x23\x09\x01\
-\x11\x23\x11\x09\x01\x54\x02\x42\xfd\xdb\xbe\x02\xe8\xb0\x02\xe9\
-\xbf\xfd\xdb\x01\xe7\x67\x84\x49\xfe\x0e\xfe\xee\xb0\xfe\xef\xfe\
-\x0e\x03\x5c\x02\x31\xfd\x09\x02\xf7\xfd\x09\x02\xf7\xfd\xcf\xfd\
-\x29\xfd\xec\x01\x8f\x02\xe7\xfe\xec\xfe\x2d\x01\xd3\x01\x14\xfd\
-\x19\x00\x00\x00\x01\x00\x21\xfe\xb4\x05\xc5\x03\x8f\x00\x17\x00\
-\x59\x00\xb2\x00\x00\x00\x2b\xb1\x0f\x13\x33\x33\xb2\x02\x01\x00\
-\x2b\xb1\x05\x08\x33\x33\x01\xb0\x18\x2f\xb0\x14\xd6\xb0\x04\x32\
-\xb1\x13\x10\xe9\xb0\x06\x32\xb0\x13\x10\xb1\x0e\x01\x2b\xb1\x0d\
-\x0f\xe9\xb1\x19\x01\x2b\xb1\x0e\x13\x11\x12\xb1\x08\x0a\x39\x39\
-\xb0\x0d\x11\xb1\x0b\x09\x39\x39\x00\xb1\x02\x00\x11\x12\xb5\x04\
-\x07\x0b\x0c\x11\x16\x24\x17\x39\x30\x31\x33\x09\x01\x33\x01\x11\
-\x33\x11\x01\x33\x09\x01\x33\x11\x23\x11\x23\x01\x07\x11\x23\x11\
-\x27\x01\x21\x01\x89\xfe\xa4\xb8\x01\xa0\x93\x01\xa6\xb9\xfe\xa3\
-\x01\x32\x58\x83\x25\xfe\xbe\xa2\x93\x9c\xfe\xbf\x02\x2d\x01\x62\
-\xfe\x5a\x01\xa6\xfe\x54\x01\xac\xfe\x9e\xfe\x50\xfe\x37\x01\x4c\
-\x01\xcb\xa2\xfe\xd7\x01\x2f\x9c\xfe\x35\x00\x00\x02\x00\x66\xfe\
-\x44\x04\x8d\x05\xba\x00\x33\x00\x37\x00\x61\x00\xb2\x31\x00\x00\
-\x2b\xb1\x06\x05\xe9\xb2\x22\x02\x00\x2b\xb1\x18\x05\xe9\xb4\x10\
-\x0f\x31\x22\x0d\x2b\xb1\x10\x03\xe9\x01\xb0\x38\x2f\xb0\x16\xd6\
-\xb1\x25\x0d\xe9\xb0\x09\x20\xd6\x11\xb1\x2e\x13\xe9\xb2\x09\x2e\
-\x0a\x2b\xb3\x40\x09\x0f\x09\x2b\xb1\x39\x01\x2b\x00\xb1\x0f\x06\
-\x11\x12\xb2\x00\x01\x2e\x39\x39\x39\xb0\x10\x11\xb0\x2b\x39\xb0\
-\x18\x12\xb3\x16\x1e\x1f\x25\x24\x17\x39\x30\x31\x3f\x01\x1e\x03\
-\x33\x32\x36\x35\x34\x2e\x02\x2b\x01\x35\x33\x16\x33\x32\x36\x35\
-\x10\x25\x22\x0e\x03\x07\x27\x3e\x01\x33\x32\x04\x15\x14\x0e\x03\
-\x07\x1e\x01\x15\x14\x04\x23\x22\x26\x1b\x01\x33\x03\x66\x48\x37\
-\x36\x6a\x85\x5e\xb2\xcb\x22\x52\xaa\x77\xc3\x8c\x08\x10\xa4\xdd\
-\xfe\xbf\x48\x81\x4a\x5a\x16\x23\x4e\x75\xe1\xa2\xdd\x01\x02\x0a\
-\x29\x48\x8d\x60\xb2\xef\xfe\xcf\xf6\xae\xcb\xaf\x97\x7d\x85\x9e\
-\x7d\x3d\x34\x4a\x1a\xbc\x73\x29\x5c\x66\x44\x7f\x02\x9d\x7d\x01\
-\x0c\x01\x21\x1f\x4a\x16\x27\x89\x5c\x54\xa8\xd5\x1b\x34\x58\x48\
-\x4e\x19\x1f\xce\x87\xa4\xfc\x52\xfe\x1f\x01\x8d\xfe\x73\x00\x00\
-\x02\x00\x39\xfe\x44\x03\x48\x03\xb0\x00\x34\x00\x38\x00\x5f\x00\
-\xb2\x33\x00\x00\x2b\xb1\x04\x08\xe9\xb2\x1e\x01\x00\x2b\xb1\x17\
-\x03\xe9\xb4\x0f\x0e\x33\x1e\x0d\x2b\xb1\x0f\x05\xe9\x01\xb0\x39\
-\x2f\xb0\x15\xd6\xb1\x26\x0f\xe9\xb0\x07\x20\xd6\x11\xb1\x2e\x0f\
-\xe9\xb1\x3a\x01\x2b\x00\xb1\x04\x33\x11\x12\xb0\x00\x39\xb0\x0e\
-\x11\xb1\x01\x2e\x39\x39\xb0\x0f\x12\xb0\x2b\x39\xb0\x17\x11\xb2\
-\x1a\x23\x26\x39\x39\x39\xb0\x1e\x12\xb0\x1b\x39\x30\x31\x3f\x01\
-\x1e\x01\x33\x32\x36\x35\x34\x2e\x01\x27\x26\x2b\x01\x35\x33\x32\
-\x3e\x02\x37\x26\x21\x22\x06\x07\x27\x3e\x01\x33\x32\x1e\x02\x17\
-\x14\x16\x15\x14\x0e\x02\x07\x1e\x01\x15\x14\x0e\x02\x23\x22\x03\
-\x13\x33\x03\x39\x3a\x48\x7c\x5c\xa0\x87\x14\x62\x54\x1b\x5a\x60\
-\x74\x23\x4a\x64\x44\x04\x04\xfe\xef\x62\x5e\x56\x39\x5e\x85\x6f\
-\x44\x63\x90\x58\x0a\x02\x1d\x43\x21\x29\x50\x71\x27\x58\xb7\x7c\
-\xc3\x1b\x96\x7f\x85\x56\x7f\x37\x31\x66\x41\x19\x37\x48\x0a\x04\
-\x73\x08\x19\x3b\x2b\x7f\x21\x37\x7b\x37\x23\x0a\x27\x62\x4e\x04\
-\x11\x04\x27\x3d\x31\x13\x16\x1d\x75\x56\x31\x5e\x5e\x3a\xfe\x5b\
-\x01\x8d\xfe\x73\x00\x00\x00\x00\x01\x00\xc3\xfe\x71\x05\x42\x05\
-\x8d\x00\x10\x00\x55\x00\xb2\x00\x00\x00\x2b\xb0\x0c\x33\xb2\x01\
-\x02\x00\x2b\xb0\x04\x33\xb0\x0b\x2f\x01\xb0\x11\x2f\xb0\x00\xd6\
-\xb1\x10\x15\xe9\xb0\x02\x32\xb0\x10\x10\xb1\x0b\x01\x2b\xb1\x0a\
-\x0f\xe9\xb1\x12\x01\x2b\xb1\x0b\x10\x11\x12\xb2\x04\x06\x07\x39\
-\x39\x39\xb0\x0a\x11\xb1\x08\x05\x39\x39\x00\xb1\x01\x00\x11\x12\
-\xb3\x03\x08\x09\x0e\x24\x17\x39\x30\x31\x33\x11\x33\x11\x01\x33\
-\x01\x15\x01\x33\x11\x23\x11\x23\x09\x01\x11\xc3\xb0\x02\xe7\xbf\
-\xfd\xdb\x01\xe7\x67\x84\x49\xfe\x0e\xfe\xf0\x05\x8d\xfd\x09\x02\
-\xf7\xfd\xcf\x02\xfd\x2b\xfd\xec\x01\x8f\x02\xe7\xfe\xec\xfe\x2d\
-\x00\x00\x00\x00\x01\x00\xa6\xfe\xb4\x03\xc5\x03\x8f\x00\x0f\x00\
-\x50\x00\xb2\x00\x00\x00\x2b\xb0\x0b\x33\xb2\x01\x01\x00\x2b\xb0\
-\x04\x33\x01\xb0\x10\x2f\xb0\x00\xd6\xb1\x0f\x10\xe9\xb0\x02\x32\
-\xb0\x0f\x10\xb1\x0a\x01\x2b\xb1\x09\x0f\xe9\xb1\x11\x01\x2b\xb1\
-\x0a\x0f\x11\x12\xb1\x04\x06\x39\x39\xb0\x09\x11\xb1\x07\x05\x39\
-\x39\x00\xb1\x01\x00\x11\x12\xb3\x03\x07\x08\x0d\x24\x17\x39\x30\
-\x31\x33\x11\x33\x11\x01\x33\x09\x01\x33\x11\x23\x11\x23\x01\x07\
-\x11\xa6\x93\x01\xa6\xb9\xfe\xa3\x01\x2f\x5b\x86\x22\xfe\xbe\xa2\
-\x03\x8f\xfe\x54\x01\xac\xfe\xa0\xfe\x4e\xfe\x37\x01\x4c\x01\xcb\
-\xa2\xfe\xd7\x00\x01\x00\xc3\x00\x00\x06\x0a\x05\x8d\x00\x15\x00\
-\x69\x00\xb2\x00\x00\x00\x2b\xb0\x0d\x33\xb2\x01\x02\x00\x2b\xb0\
-\x09\x33\xb2\x03\x01\x00\x2b\xb0\x07\x33\xb1\x14\x03\xe9\xb0\x0f\
-\x32\xb2\x14\x03\x0a\x2b\xb3\x40\x14\x12\x09\x2b\xb2\x03\x14\x0a\
-\x2b\xb3\x40\x03\x05\x09\x2b\x01\xb0\x16\x2f\xb0\x00\xd6\xb1\x15\
-\x15\xe9\xb0\x02\x32\xb0\x15\x10\xb1\x12\x01\x2b\xb0\x04\x32\xb4\
-\x11\x16\x00\x33\x04\x2b\xb0\x06\x32\xb1\x17\x01\x2b\x00\xb1\x03\
-\x14\x11\x12\xb1\x0b\x0c\x39\x39\x30\x31\x33\x11\x33\x11\x33\x11\
-\x33\x11\x33\x01\x33\x01\x15\x01\x23\x01\x23\x11\x23\x11\x23\x11\
-\xc3\xb0\xe5\x79\x43\x02\x13\xc7\xfd\xaa\x02\x72\xc4\xfd\xb8\x2d\
-\x79\xe5\x05\x8d\xfe\x0f\x01\x16\xfe\xea\x01\xf1\xfd\xcf\x02\xfc\
-\xa6\x03\x1f\xfe\xcd\x01\x33\xfc\xe1\x00\x00\x00\x01\x00\xa6\x00\
-\x00\x04\xd1\x03\x8f\x00\x15\x00\x68\x00\xb2\x00\x00\x00\x2b\xb0\
-\x0d\x33\xb2\x01\x01\x00\x2b\xb0\x09\x33\xb4\x03\x14\x00\x01\x0d\
-\x2b\xb0\x0f\x33\xb1\x03\x05\xe9\xb0\x07\x32\xb2\x14\x03\x0a\x2b\
-\xb3\x40\x14\x12\x09\x2b\xb2\x03\x14\x0a\x2b\xb3\x40\x03\x05\x09\
-\x2b\x01\xb0\x16\x2f\xb0\x00\xd6\xb1\x15\x11\xe9\xb0\x02\x32\xb0\
-\x15\x10\xb1\x12\x01\x2b\xb0\x04\x32\xb1\x11\x16\xe9\xb0\x06\x32\
-\xb1\x17\x01\x2b\x00\xb1\x03\x14\x11\x12\xb1\x0b\x0c\x39\x39\x30\
-\x31\x33\x11\x33\x11\x33\x35\x33\x15\x33\x01\x33\x01\x15\x01\x23\
-\x01\x23\x15\x23\x35\x23\x11\xa6\x99\xec\x71\x31\x01\x21\xb8\xfe\
-\xa6\x01\x85\xa6\xfe\xa2\x31\x71\xec\x03\x8f\xfe\xd7\xa2\xa2\x01\
-\x29\xfe\xa0\x04\xfd\xd5\x01\xf6\xb4\xb4\xfe\x0a\x00\x00\x00\x00\
-\x01\x00\x25\x00\x00\x05\x35\x05\x8d\x00\x14\x00\x5e\x00\xb2\x13\
-\x00\x00\x2b\xb0\x0e\x33\xb2\x03\x02\x00\x2b\xb0\x0a\x33\xb4\x01\
-\x00\x13\x03\x0d\x2b\xb0\x07\x33\xb1\x01\x06\xe9\xb0\x05\x32\x01\
-\xb0\x15\x2f\xb0\x13\xd6\xb0\x02\x32\xb1\x12\x15\xe9\xb1\x04\x08\
-\x32\x32\xb2\x12\x13\x0a\x2b\xb3\x40\x12\x07\x09\x2b\xb2\x13\x12\
-\x0a\x2b\xb3\x40\x13\x00\x09\x2b\xb1\x16\x01\x2b\x00\xb1\x00\x13\
-\x11\x12\xb2\x09\x0c\x10\x39\x39\x39\x30\x31\x13\x35\x33\x11\x33\
-\x11\x33\x15\x23\x11\x01\x33\x01\x15\x01\x23\x09\x01\x11\x23\x11\
-\x25\x9e\xb0\xeb\xeb\x02\xe7\xc1\xfd\xd9\x02\x41\xbe\xfe\x0c\xfe\
-\xf0\xb0\x03\xfc\x79\x01\x18\xfe\xe8\x79\xfe\x9a\x02\xf7\xfd\xcf\
-\x02\xfc\xa6\x02\xe7\xfe\xec\xfe\x2d\x03\xfc\x00\x01\x00\x25\x00\
-\x00\x03\xfc\x05\xc7\x00\x13\x00\x5e\x00\xb2\x12\x00\x00\x2b\xb0\
-\x0d\x33\xb2\x03\x02\x00\x2b\xb2\x0a\x01\x00\x2b\xb4\x00\x01\x0a\
-\x03\x0d\x2b\xb0\x05\x33\xb1\x00\x06\xe9\xb0\x07\x32\x01\xb0\x14\
-\x2f\xb0\x12\xd6\xb0\x02\x32\xb1\x09\x10\xe9\xb1\x04\x10\x32\x32\
-\xb2\x09\x12\x0a\x2b\xb3\x40\x09\x07\x09\x2b\xb2\x12\x09\x0a\x2b\
-\xb3\x40\x12\x00\x09\x2b\xb1\x15\x01\x2b\x00\xb1\x0a\x12\x11\x12\
-\xb1\x09\x0f\x39\x39\x30\x31\x13\x35\x33\x35\x33\x15\x33\x15\x23\
-\x11\x01\x33\x09\x01\x23\x01\x07\x03\x23\x11\x25\x85\x93\xc1\xc1\
-\x01\xd3\xbf\xfe\x87\x01\xa6\xac\xfe\xa2\xb9\x02\x8d\x04\x6f\x78\
-\xe0\xe0\x78\xfd\x6a\x01\xb6\xfe\x9e\xfd\xd3\x01\xcf\xae\xfe\xdf\
-\x04\x6f\x00\x00\x01\x00\x48\x00\x00\x06\xd1\x05\x8d\x00\x11\x00\
-\x41\x00\xb2\x0d\x00\x00\x2b\xb0\x08\x33\xb2\x01\x02\x00\x2b\xb0\
-\x04\x33\xb1\x10\x08\xe9\x01\xb0\x12\x2f\xb0\x0d\xd6\xb1\x0c\x15\
-\xe9\xb0\x02\x32\xb2\x0d\x0c\x0a\x2b\xb3\x40\x0d\x01\x09\x2b\xb1\
-\x13\x01\x2b\x00\xb1\x10\x0d\x11\x12\xb2\x06\x03\x0a\x39\x39\x39\
-\x30\x31\x13\x35\x21\x11\x01\x33\x01\x15\x01\x23\x09\x01\x11\x23\
-\x11\x07\x23\x07\x48\x02\xc6\x02\xe8\xc0\xfd\xd9\x02\x42\xbf\xfe\
-\x0d\xfe\xef\xb0\xf4\x9f\x2d\x05\x06\x87\xfd\x09\x02\xf7\xfd\xcf\
-\x02\xfc\xa6\x02\xe7\xfe\xec\xfe\x2d\x05\x0a\x02\x02\x00\x00\x00\
-\x01\x00\x33\x00\x00\x04\xa6\x03\x8f\x00\x0f\x00\x41\x00\xb2\x0c\
-\x00\x00\x2b\xb0\x07\x33\xb2\x01\x01\x00\x2b\xb0\x04\x33\xb1\x0e\
-\x03\xe9\x01\xb0\x10\x2f\xb0\x0c\xd6\xb1\x0b\x10\xe9\xb0\x02\x32\
-\xb2\x0c\x0b\x0a\x2b\xb3\x40\x0c\x01\x09\x2b\xb1\x11\x01\x2b\x00\
-\xb1\x0e\x0c\x11\x12\xb2\x06\x03\x09\x39\x39\x39\x30\x31\x13\x35\
-\x21\x11\x01\x33\x09\x01\x23\x01\x07\x11\x23\x11\x23\x07\x33\x01\
-\xea\x01\xa6\xb8\xfe\xa4\x01\x87\xa6\xfe\xbe\xa1\x94\xd3\x2d\x03\
-\x0e\x81\xfe\x54\x01\xac\xfe\xa0\xfd\xd1\x01\xcb\xa2\xfe\xd7\x03\
-\x10\x02\x00\x00\x01\x00\xc1\xfe\x71\x05\x64\x05\x8d\x00\x0f\x00\
-\x57\x00\xb2\x00\x00\x00\x2b\xb0\x0b\x33\xb2\x01\x02\x00\x2b\xb0\
-\x05\x33\xb0\x0a\x2f\xb4\x03\x0e\x00\x01\x0d\x2b\xb1\x03\x03\xe9\
-\x01\xb0\x10\x2f\xb0\x00\xd6\xb1\x0f\x0e\xe9\xb0\x02\x32\xb0\x0f\
-\x10\xb1\x0c\x01\x2b\xb0\x04\x32\xb1\x07\x0e\xe9\xb0\x07\x10\xb1\
-\x0a\x01\x2b\xb1\x09\x0f\xe9\xb1\x11\x01\x2b\x00\xb1\x0e\x00\x11\
-\x12\xb1\x07\x08\x39\x39\x30\x31\x33\x11\x33\x11\x21\x11\x33\x11\
-\x33\x11\x23\x11\x23\x11\x21\x11\xc1\xb8\x02\x9b\xb7\x99\x83\xcd\
-\xfd\x65\x05\x8d\xfd\x96\x02\x6a\xfa\xf2\xfd\xf2\x01\x8f\x02\xa4\
-\xfd\x5c\x00\x00\x01\x00\xa6\xfe\xb4\x04\x27\x03\x8f\x00\x0f\x00\
-\x54\x00\xb2\x00\x00\x00\x2b\xb0\x0b\x33\xb2\x01\x01\x00\x2b\xb0\
-\x05\x33\xb4\x03\x0e\x00\x01\x0d\x2b\xb1\x03\x05\xe9\x01\xb0\x10\
-\x2f\xb0\x00\xd6\xb1\x0f\x11\xe9\xb0\x02\x32\xb0\x0f\x10\xb1\x0c\
-\x01\x2b\xb0\x04\x32\xb1\x07\x11\xe9\xb0\x07\x10\xb1\x0a\x0b\x2b\
-\xb1\x09\x0f\xe9\xb1\x11\x01\x2b\x00\xb1\x0e\x00\x11\x12\xb1\x07\
-\x08\x39\x39\x30\x31\x33\x11\x33\x11\x21\x11\x33\x11\x33\x11\x23\
-\x11\x23\x11\x21\x11\xa6\x99\x01\xc9\x9a\x85\x83\x9c\xfe\x37\x03\
-\x8f\xfe\x9e\x01\x62\xfc\xee\xfe\x37\x01\x4c\x01\xba\xfe\x46\x00\
-\x01\x00\xc1\x00\x00\x06\xdf\x05\x8d\x00\x10\x00\x4e\x00\xb2\x00\
-\x00\x00\x2b\xb0\x0c\x33\xb2\x06\x02\x00\x2b\xb0\x01\x33\xb1\x0a\
-\x08\xe9\xb4\x03\x0f\x00\x06\x0d\x2b\xb1\x03\x03\xe9\x01\xb0\x11\
-\x2f\xb0\x00\xd6\xb1\x10\x0e\xe9\xb0\x02\x32\xb0\x10\x10\xb1\x0e\
-\x01\x2b\xb0\x04\x32\xb1\x0b\x0e\xe9\xb2\x0b\x0e\x0a\x2b\xb3\x40\
-\x0b\x06\x09\x2b\xb1\x12\x01\x2b\x00\x30\x31\x33\x11\x33\x11\x21\
-\x11\x21\x15\x23\x27\x23\x27\x11\x23\x11\x21\x11\xc1\xb8\x02\x9b\
-\x02\xcb\x56\x2d\xa0\xf1\xb7\xfd\x65\x05\x8d\xfd\x96\x02\x6a\x87\
-\x02\x02\xfa\xf6\x02\xa4\xfd\x5c\x00\x00\x00\x00\x01\x00\xa6\x00\
-\x00\x04\xf8\x03\x8f\x00\x0f\x00\x4e\x00\xb2\x00\x00\x00\x2b\xb0\
-\x0b\x33\xb2\x05\x01\x00\x2b\xb0\x01\x33\xb1\x0a\x03\xe9\xb4\x03\
-\x0e\x00\x05\x0d\x2b\xb1\x03\x05\xe9\x01\xb0\x10\x2f\xb0\x00\xd6\
-\xb1\x0f\x11\xe9\xb0\x02\x32\xb0\x0f\x10\xb1\x0d\x01\x2b\xb0\x04\
-\x32\xb1\x0a\x11\xe9\xb2\x0a\x0d\x0a\x2b\xb3\x40\x0a\x06\x09\x2b\
-\xb1\x11\x01\x2b\x00\x30\x31\x33\x11\x33\x11\x21\x11\x21\x15\x23\
-\x27\x23\x11\x23\x11\x21\x11\xa6\x99\x01\xc9\x01\xf0\x56\x2f\xd1\
-\x9a\xfe\x37\x03\x8f\xfe\x9e\x01\x62\x81\x02\xfc\xf0\x01\xba\xfe\
-\x46\x00\x00\x00\x01\x00\xc1\xfe\x44\x08\x1b\x05\x8d\x00\x2e\x00\
-\xc7\x00\xb2\x00\x00\x00\x2b\xb0\x2a\x33\xb2\x20\x00\x00\x2b\xb2\
-\x01\x02\x00\x2b\xb1\x2d\x08\xe9\xb0\x0b\x2f\xb1\x1e\x03\xe9\xb4\
-\x04\x26\x00\x01\x0d\x2b\xb1\x04\x03\xe9\x01\xb0\x2f\x2f\xb0\x00\
-\xd6\xb1\x2e\x0e\xe9\xb0\x2e\x10\xb1\x2b\x01\x2b\xb1\x2a\x0e\xe9\
-\xb0\x02\x32\xb0\x2a\x10\xb1\x21\x01\x2b\xb1\x08\x13\xe9\xb1\x30\
-\x01\x2b\xb0\x36\x1a\xba\xef\x78\xc2\x2c\x00\x15\x2b\x0a\x0e\xb0\
-\x11\x10\xb0\x0f\xc0\xb1\x18\x08\xf9\xb0\x1a\xc0\xb0\x11\x10\xb3\
-\x10\x11\x0f\x13\x2b\xb0\x18\x10\xb3\x19\x18\x1a\x13\x2b\xb2\x19\
-\x18\x1a\x20\x8a\x20\x8a\x23\x06\x0e\x11\x12\x39\xb2\x10\x11\x0f\
-\x11\x12\x39\x00\xb5\x0f\x10\x11\x18\x19\x1a\x2e\x2e\x2e\x2e\x2e\
-\x2e\x01\xb5\x0f\x10\x11\x18\x19\x1a\x2e\x2e\x2e\x2e\x2e\x2e\xb0\
-\x40\x1a\x01\xb1\x21\x2a\x11\x12\xb1\x0b\x13\x39\x39\x00\xb1\x00\
-\x1e\x11\x12\xb0\x14\x39\x30\x31\x33\x11\x21\x11\x33\x20\x17\x16\
-\x11\x14\x00\x23\x22\x2e\x05\x27\x37\x1e\x08\x33\x32\x12\x35\x34\
-\x02\x27\x26\x23\x22\x06\x23\x11\x23\x11\x21\x11\xc1\x04\x0a\x77\
-\x01\x5e\xb2\xc9\xfe\xdf\xdf\x1d\x31\x2b\x1d\x29\x0e\x2d\x04\x25\
-\x04\x1c\x0b\x1a\x0f\x1a\x17\x20\x21\x15\x98\xbe\xf8\xdb\x44\x41\
-\x0c\x36\x0e\xb7\xfd\x65\x05\x8d\xfd\x96\x94\xa6\xfe\xc3\xfc\xfe\
-\x94\x02\x06\x04\x0c\x04\x0f\x02\x8b\x02\x11\x04\x0c\x04\x08\x04\
-\x04\x02\x01\x1c\xc9\xdf\x01\x02\x17\x06\x02\xfd\x5c\x05\x0a\xfa\
-\xf6\x00\x00\x00\x01\x00\xa6\xfe\x5c\x05\xa6\x03\x8f\x00\x1d\x00\
-\x6e\x00\xb2\x00\x00\x00\x2b\xb0\x19\x33\xb2\x0a\x00\x00\x2b\xb2\
-\x01\x01\x00\x2b\xb1\x1c\x03\xe9\xb0\x0d\x2f\xb1\x12\x03\xe9\xb4\
-\x03\x18\x00\x01\x0d\x2b\xb1\x03\x05\xe9\x01\xb0\x1e\x2f\xb0\x00\
-\xd6\xb1\x1d\x11\xe9\xb0\x1d\x10\xb1\x1a\x01\x2b\xb1\x19\x11\xe9\
-\xb0\x02\x32\xb0\x19\x10\xb1\x15\x01\x2b\xb1\x09\x0f\xe9\xb1\x1f\
-\x01\x2b\xb1\x19\x1a\x11\x12\xb1\x0f\x10\x39\x39\xb0\x15\x11\xb1\
-\x0d\x12\x39\x39\x00\xb1\x00\x12\x11\x12\xb0\x10\x39\x30\x31\x33\
-\x11\x21\x11\x33\x32\x1e\x02\x15\x14\x0e\x01\x23\x22\x27\x37\x16\
-\x33\x32\x36\x35\x10\x21\x23\x11\x23\x11\x21\x11\xa6\x02\xfc\x41\
-\x81\xb9\x60\x29\x52\xbe\x86\x5a\x58\x23\x5c\x35\x7d\x88\xfe\xa5\
-\x1a\x9a\xfe\x37\x03\x8f\xfe\x9e\x52\x8d\x9e\x5c\x7d\xdf\x9c\x15\
-\x87\x1b\xdd\x96\x01\x6a\xfe\x46\x03\x10\xfc\xf0\x00\x00\x00\x00\
-\x02\x00\x71\xff\x3d\x05\xfe\x05\xba\x00\x3f\x00\x52\x00\x7f\x00\
-\xb2\x36\x00\x00\x2b\xb1\x1c\x08\xe9\xb2\x06\x02\x00\x2b\xb1\x0b\
-\x08\xe9\xb2\x4a\x01\x00\x2b\xb1\x26\x03\xe9\xb0\x30\x2f\xb1\x2f\
-\x03\xe9\x01\xb0\x53\x2f\xb0\x00\xd6\xb1\x14\x0e\xe9\xb0\x14\x10\
-\xb1\x23\x01\x2b\xb1\x40\x0f\xe9\xb0\x40\x10\xb1\x47\x01\x2b\xb1\
-\x2a\x10\xe9\xb1\x54\x01\x2b\xb1\x40\x23\x11\x12\xb4\x0b\x1c\x06\
-\x1f\x36\x24\x17\x39\xb0\x47\x11\xb4\x09\x26\x08\x34\x2d\x24\x17\
-\x39\x00\xb1\x1c\x36\x11\x12\xb0\x2d\x39\xb0\x4a\x11\xb2\x00\x23\
-\x42\x39\x39\x39\xb1\x0b\x26\x11\x12\xb0\x09\x39\x30\x31\x13\x34\
-\x3e\x03\x33\x20\x17\x07\x26\x23\x22\x0e\x05\x1d\x01\x14\x1e\x05\
-\x33\x32\x36\x33\x2e\x02\x35\x10\x36\x33\x32\x16\x1d\x01\x10\x02\
-\x07\x16\x21\x15\x2e\x02\x27\x06\x23\x22\x2e\x07\x05\x16\x17\x3e\
-\x03\x35\x34\x26\x23\x22\x0e\x04\x14\x07\x71\x25\x5e\x97\xf0\xa0\
-\x01\x06\x93\x56\x7d\xc4\x66\xa3\x66\x4a\x25\x14\x02\x04\x12\x25\
-\x4a\x66\xa0\x65\x06\x18\x06\x2f\x2f\x08\xc1\xbe\xd5\x9a\xb9\xae\
-\xa0\x01\x00\x7b\xa6\xdf\x50\x54\x3f\x6f\xb6\x85\x69\x41\x31\x17\
-\x0c\x02\x02\xef\x08\x71\x66\x8e\x47\x1d\x5a\x87\x31\x4c\x31\x23\
-\x10\x0d\x02\x02\xc3\x89\xd9\xc4\x84\x4d\x60\x71\x4e\x2f\x43\x6f\
-\x5c\x83\x4a\x37\x1b\x3f\x56\x94\x64\x79\x4a\x33\x02\x4c\xba\x73\
-\x56\x01\x10\xe4\xc3\xa6\x10\xfe\xe7\xfe\xc5\x4a\x4c\x7d\x02\x11\
-\x4a\x41\x08\x27\x39\x60\x59\x7e\x5d\x83\x44\x98\xfe\x89\x19\x70\
-\xa6\xac\x6e\x6d\x7b\x1d\x25\x4c\x2d\x60\x1f\x2d\x00\x00\x00\x00\
-\x02\x00\x3d\xff\x3f\x03\xc5\x03\xb0\x00\x33\x00\x3e\x00\x81\x00\
-\xb2\x07\x01\x00\x2b\xb1\x0d\x03\xe9\xb0\x2c\x2f\xb1\x2b\x06\xe9\
-\xb0\x3b\x2f\xb1\x20\x05\xe9\x01\xb0\x3f\x2f\xb0\x00\xd6\xb1\x12\
-\x0d\xe9\xb0\x12\x10\xb1\x1a\x01\x2b\xb4\x34\x0f\x00\x20\x04\x2b\
-\xb0\x34\x10\xb1\x38\x01\x2b\xb1\x23\x0f\xe9\xb0\x2b\x32\xb1\x40\
-\x01\x2b\xb1\x1a\x12\x11\x12\xb0\x14\x39\xb0\x34\x11\xb2\x0d\x18\
-\x2e\x39\x39\x39\xb0\x38\x12\xb3\x0b\x20\x0a\x29\x24\x17\x39\x00\
-\xb1\x3b\x2b\x11\x12\xb6\x12\x00\x1a\x23\x18\x2e\x36\x24\x17\x39\
-\xb1\x0d\x20\x11\x12\xb0\x0b\x39\xb0\x07\x11\xb0\x0a\x39\x30\x31\
-\x13\x34\x3e\x04\x3f\x01\x16\x17\x07\x26\x23\x22\x0e\x02\x15\x14\
-\x1e\x03\x17\x26\x35\x34\x3e\x03\x33\x32\x16\x15\x14\x0e\x03\x07\
-\x16\x33\x15\x20\x27\x22\x2e\x03\x25\x16\x17\x36\x11\x34\x26\x23\
-\x22\x0e\x01\x3d\x07\x18\x37\x56\x92\x60\x40\x75\x64\x4c\x52\x58\
-\x5a\x77\x39\x17\x04\x1b\x31\x64\x48\x1b\x0b\x20\x38\x60\x42\x8b\
-\x73\x2b\x36\x5a\x2f\x25\x6d\xa6\xfe\xcf\x7b\x4a\x71\x8b\x58\x3e\
-\x02\x00\x04\x1d\xd5\x31\x3f\x3b\x3e\x0d\x01\xb4\x3b\x59\x7f\x5a\
-\x56\x33\x04\x02\x04\x2b\x73\x23\x35\x66\x69\x46\x39\x48\x72\x46\
-\x39\x06\x5e\x7f\x39\x56\x5c\x3c\x27\x75\x6f\x64\x9c\x56\x41\x13\
-\x0c\x4a\x77\xaa\x0f\x35\x5e\xb0\x1d\x8b\x58\x25\x01\x20\x33\x38\
-\x44\x4a\x00\x00\x02\x00\x87\xfe\x44\x04\xb4\x05\xba\x00\x20\x00\
-\x24\x00\x3d\x00\xb2\x1e\x00\x00\x2b\xb1\x11\x08\xe9\xb2\x03\x02\
-\x00\x2b\xb1\x0b\x08\xe9\x01\xb0\x25\x2f\xb0\x00\xd6\xb1\x0e\x0e\
-\xe9\xb1\x26\x01\x2b\x00\xb1\x11\x1e\x11\x12\xb0\x1b\x39\xb0\x0b\
-\x11\xb2\x00\x08\x1a\x39\x39\x39\xb0\x03\x12\xb0\x07\x39\x30\x31\
-\x13\x10\x00\x21\x32\x1e\x01\x17\x07\x2e\x01\x23\x22\x00\x11\x10\
-\x00\x33\x32\x3e\x06\x37\x17\x0e\x01\x23\x20\x00\x01\x13\x33\x03\
-\x87\x01\x81\x01\x00\x50\x5c\x94\x56\x1f\x5c\x94\x6c\xcd\xfe\xe9\
-\x01\x19\xd1\x27\x46\x31\x3b\x1d\x37\x0e\x3e\x06\x0c\x6f\x9f\x7f\
-\xfe\xdb\xfe\x85\x01\xbf\x95\x7f\x85\x02\xc7\x01\x3f\x01\xb4\x06\
-\x1e\x21\xaa\x39\x33\xfe\x94\xfe\xfc\xfe\xfa\xfe\x95\x06\x06\x15\
-\x08\x21\x08\x27\x04\x8f\x42\x2f\x01\xc3\xfc\xae\x01\x8d\xfe\x73\
-\x00\x00\x00\x00\x02\x00\x48\xfe\x44\x03\x52\x03\xb0\x00\x18\x00\
-\x1c\x00\x3d\x00\xb2\x16\x00\x00\x2b\xb1\x11\x08\xe9\xb2\x03\x01\
-\x00\x2b\xb1\x0b\x08\xe9\x01\xb0\x1d\x2f\xb0\x00\xd6\xb1\x0e\x0d\
-\xe9\xb1\x1e\x01\x2b\x00\xb1\x11\x16\x11\x12\xb0\x14\x39\xb0\x0b\
-\x11\xb2\x00\x07\x13\x39\x39\x39\xb0\x03\x12\xb0\x06\x39\x30\x31\
-\x13\x34\x12\x33\x32\x16\x17\x07\x26\x27\x26\x23\x22\x06\x15\x14\
-\x16\x33\x32\x37\x17\x06\x07\x22\x00\x1b\x01\x33\x03\x48\xf5\xcd\
-\x64\x7e\x5c\x19\x64\x35\x3b\x53\x8b\x96\xa0\x7f\xa0\xa2\x0a\xa2\
-\xac\xbc\xff\x00\xe1\x95\x7f\x85\x01\xc9\xbe\x01\x29\x27\x33\x87\
-\x3f\x0f\x10\xd3\x91\x98\xc4\x6e\x89\x68\x01\x01\x19\xfd\x42\x01\
-\x8d\xfe\x73\x00\x01\x00\x48\xfe\x71\x05\x25\x05\x8d\x00\x11\x00\
-\x4f\x00\xb2\x01\x02\x00\x2b\xb1\x10\x08\xe9\xb0\x03\x32\xb0\x0b\
-\x2f\x01\xb0\x12\x2f\xb0\x0d\xd6\xb1\x08\x0e\xe9\xb2\x0d\x08\x0a\
-\x2b\xb3\x40\x0d\x01\x09\x2b\xb0\x08\x10\xb1\x0b\x01\x2b\xb1\x0a\
-\x0f\xe9\xb2\x0a\x0b\x0a\x2b\xb3\x40\x0a\x02\x09\x2b\xb1\x13\x01\
-\x2b\x00\xb1\x10\x0b\x11\x12\xb2\x08\x0c\x0d\x39\x39\x39\x30\x31\
-\x13\x35\x21\x15\x23\x27\x23\x27\x11\x33\x11\x23\x11\x23\x11\x07\
-\x23\x07\x48\x04\xdd\x58\x2b\xa0\xf0\x94\x83\xc9\xf0\x9f\x2d\x05\
-\x06\x87\x87\x02\x02\xfb\x7b\xfd\xec\x01\x8f\x05\x0a\x02\x02\x00\
-\x01\x00\x33\xfe\xb4\x03\x77\x03\x8f\x00\x0f\x00\x40\x00\xb2\x01\
-\x01\x00\x2b\xb1\x0e\x03\xe9\xb0\x03\x32\x01\xb0\x10\x2f\xb0\x0c\
-\xd6\xb1\x07\x0d\xe9\xb2\x0c\x07\x0a\x2b\xb3\x40\x0c\x01\x09\x2b\
-\xb0\x07\x10\xb1\x0a\x01\x2b\xb1\x09\x0f\xe9\xb2\x09\x0a\x0a\x2b\
-\xb3\x40\x09\x02\x09\x2b\xb1\x11\x01\x2b\x00\x30\x31\x13\x35\x21\
-\x15\x23\x27\x23\x11\x33\x11\x23\x11\x23\x11\x23\x07\x33\x03\x44\
-\x56\x2b\xd1\x89\x83\xa6\xd1\x2b\x03\x0e\x81\x81\x02\xfd\x6d\xfe\
-\x37\x01\x4c\x03\x10\x02\x00\x00\x01\x00\x04\x00\x00\x05\x4c\x05\
-\x8d\x00\x0b\x00\x30\x00\xb2\x0a\x00\x00\x2b\xb2\x00\x02\x00\x2b\
-\xb0\x06\x33\x01\xb0\x0c\x2f\xb0\x0a\xd6\xb1\x09\x15\xe9\xb1\x0d\
-\x01\x2b\xb1\x09\x0a\x11\x12\xb0\x04\x39\x00\xb1\x00\x0a\x11\x12\
-\xb0\x04\x39\x30\x31\x13\x33\x01\x16\x17\x36\x01\x33\x01\x11\x23\
-\x11\x04\xd7\x01\x2d\xa4\x0e\x48\x01\x96\xb4\xfd\xb6\xb2\x05\x8d\
-\xfe\x4c\xf6\x1a\x7f\x02\x45\xfc\xac\xfd\xc7\x02\x39\x00\x00\x00\
-\x01\x00\x04\xfe\x71\x03\xa8\x03\x8f\x00\x0e\x00\x30\x00\xb2\x00\
-\x01\x00\x2b\xb0\x06\x33\xb0\x0c\x2f\x01\xb0\x0f\x2f\xb0\x0c\xd6\
-\xb1\x0b\x11\xe9\xb1\x10\x01\x2b\xb1\x0b\x0c\x11\x12\xb1\x05\x04\
-\x39\x39\x00\xb1\x00\x0c\x11\x12\xb0\x04\x39\x30\x31\x13\x33\x1a\
-\x01\x17\x36\x01\x33\x01\x0f\x01\x11\x23\x11\x27\x04\xa8\xb0\x6f\
-\x10\x08\x01\x23\xa2\xfe\x8d\x10\x02\x9a\x02\x03\x8f\xfe\x62\xfe\
-\xd4\x5f\x79\x02\xb0\xfc\x9a\x29\x33\xfe\xa4\x01\x5c\x33\x00\x00\
-\x01\x00\x04\x00\x00\x05\x4c\x05\x8d\x00\x11\x00\x5d\x00\xb2\x0d\
-\x00\x00\x2b\xb2\x00\x02\x00\x2b\xb0\x06\x33\xb4\x0f\x10\x0d\x00\
-\x0d\x2b\xb0\x08\x33\xb1\x0f\x06\xe9\xb0\x0a\x32\x01\xb0\x12\x2f\
-\xb0\x0d\xd6\xb0\x11\x32\xb1\x0c\x15\xe9\xb0\x08\x32\xb2\x0c\x0d\
-\x0a\x2b\xb3\x40\x0c\x0a\x09\x2b\xb2\x0d\x0c\x0a\x2b\xb3\x40\x0d\
-\x0f\x09\x2b\xb1\x13\x01\x2b\xb1\x0c\x0d\x11\x12\xb0\x04\x39\x00\
-\xb1\x00\x10\x11\x12\xb0\x04\x39\x30\x31\x13\x33\x01\x16\x17\x36\
-\x01\x33\x01\x21\x15\x21\x11\x23\x11\x21\x35\x21\x04\xd7\x01\x2d\
-\xa4\x0e\x48\x01\x96\xb4\xfd\xb6\x01\x17\xfe\xe9\xb2\xfe\xe7\x01\
-\x19\x05\x8d\xfe\x4c\xf6\x1a\x7f\x02\x45\xfc\xac\x78\xfe\x3f\x01\
-\xc1\x78\x00\x00\x01\x00\x04\xfe\x71\x03\xa8\x03\x8f\x00\x11\x00\
-\x5b\x00\xb2\x10\x00\x00\x2b\xb0\x08\x33\xb1\x0f\x06\xe9\xb0\x0a\
-\x32\xb2\x00\x01\x00\x2b\xb0\x06\x33\xb0\x0d\x2f\x01\xb0\x12\x2f\
-\xb0\x0d\xd6\xb0\x11\x32\xb1\x0c\x11\xe9\xb0\x08\x32\xb2\x0c\x0d\
-\x0a\x2b\xb3\x40\x0c\x0a\x09\x2b\xb2\x0d\x0c\x0a\x2b\xb3\x40\x0d\
-\x0f\x09\x2b\xb1\x13\x01\x2b\xb1\x0c\x0d\x11\x12\xb1\x05\x04\x39\
-\x39\x00\xb1\x00\x10\x11\x12\xb0\x04\x39\x30\x31\x13\x33\x1a\x01\
-\x17\x36\x01\x33\x01\x33\x15\x23\x11\x23\x11\x23\x35\x33\x04\xa8\
-\xb0\x6f\x10\x08\x01\x23\xa2\xfe\x7b\xb2\xb2\x9a\xb2\xb2\x03\x8f\
-\xfe\x62\xfe\xd4\x5f\x79\x02\xb0\xfc\x71\x79\xfe\xea\x01\x16\x79\
-\x00\x00\x00\x00\x01\x00\x1d\xfe\x71\x05\x37\x05\x8d\x00\x11\x00\
-\x3d\x00\xb2\x00\x00\x00\x2b\xb0\x0e\x33\xb2\x03\x02\x00\x2b\xb0\
-\x06\x33\xb0\x0d\x2f\x01\xb0\x12\x2f\xb0\x0d\xd6\xb1\x0c\x0f\xe9\
-\xb1\x13\x01\x2b\xb1\x0c\x0d\x11\x12\xb1\x0a\x07\x39\x39\x00\xb1\
-\x03\x00\x11\x12\xb3\x05\x0a\x0b\x10\x24\x17\x39\x30\x31\x33\x01\
-\x35\x01\x33\x09\x01\x33\x01\x15\x01\x33\x11\x23\x11\x23\x09\x01\
-\x1d\x02\x25\xfd\xf7\xd7\x01\x8c\x01\x81\xc4\xfe\x13\x01\xd9\x6a\
-\x83\x54\xfe\x3c\xfe\x45\x02\xec\x02\x02\x9f\xfd\xea\x02\x16\xfd\
-\x61\x02\xfd\x9d\xfd\xe8\x01\x8f\x02\x71\xfd\x8f\x00\x00\x00\x00\
-\x01\x00\x00\xfe\xb4\x03\xae\x03\x8f\x00\x12\x00\x3a\x00\xb2\x00\
-\x00\x00\x2b\xb0\x0f\x33\xb2\x03\x01\x00\x2b\xb0\x07\x33\x01\xb0\
-\x13\x2f\xb0\x0e\xd6\xb1\x0d\x0f\xe9\xb1\x14\x01\x2b\xb1\x0d\x0e\
-\x11\x12\xb1\x0b\x08\x39\x39\x00\xb1\x03\x00\x11\x12\xb3\x05\x0b\
-\x0c\x11\x24\x17\x39\x30\x31\x31\x01\x35\x01\x33\x01\x33\x01\x33\
-\x01\x15\x01\x33\x11\x23\x11\x23\x09\x01\x01\x8d\xfe\x7f\xaa\x01\
-\x1b\x02\x01\x10\xaa\xfe\x87\x01\x2e\x6c\x83\x27\xfe\xcd\xfe\xd9\
-\x01\xd3\x04\x01\xb8\xfe\xae\x01\x52\xfe\x48\x02\xfe\xa8\xfe\x37\
-\x01\x4c\x01\x81\xfe\x7f\x00\x00\x01\x00\x0a\xfe\x71\x07\x00\x05\
-\x8d\x00\x15\x00\x5d\x00\xb2\x11\x00\x00\x2b\xb1\x08\x09\xe9\xb0\
-\x0c\x32\xb2\x01\x02\x00\x2b\xb0\x0a\x33\xb1\x14\x08\xe9\xb0\x03\
-\x32\xb0\x0f\x2f\x01\xb0\x16\x2f\xb0\x11\xd6\xb1\x08\x0e\xe9\xb2\
-\x08\x11\x0a\x2b\xb3\x40\x08\x02\x09\x2b\xb2\x11\x08\x0a\x2b\xb3\
-\x40\x11\x01\x09\x2b\xb0\x08\x10\xb1\x09\x01\x2b\xb1\x0c\x0e\xe9\
-\xb0\x0c\x10\xb1\x0f\x01\x2b\xb1\x0e\x0f\xe9\xb1\x17\x01\x2b\x00\
-\x30\x31\x13\x35\x21\x15\x23\x27\x21\x27\x11\x21\x11\x33\x11\x33\
-\x11\x23\x11\x21\x11\x07\x21\x07\x0a\x04\x79\x50\x2b\xfe\xdd\x43\
-\x03\x0e\xb6\x9a\x83\xfb\x6f\x44\xfe\xdd\x2d\x05\x06\x87\x87\x02\
-\x02\xfb\x7f\x05\x04\xfa\xfc\xfd\xe8\x01\x8f\x05\x0a\x02\x02\x00\
-\x01\x00\x33\xfe\xb4\x05\x2d\x03\x8f\x00\x0f\x00\x5a\x00\xb2\x0e\
-\x00\x00\x2b\xb1\x05\x08\xe9\xb0\x09\x32\xb2\x01\x01\x00\x2b\xb0\
-\x07\x33\xb1\x00\x03\xe9\xb0\x03\x32\x01\xb0\x10\x2f\xb0\x0e\xd6\
-\xb1\x05\x11\xe9\xb2\x05\x0e\x0a\x2b\xb3\x40\x05\x02\x09\x2b\xb2\
-\x0e\x05\x0a\x2b\xb3\x40\x0e\x01\x09\x2b\xb0\x05\x10\xb1\x06\x01\
-\x2b\xb1\x09\x11\xe9\xb0\x09\x10\xb1\x0c\x0b\x2b\xb1\x0b\x0f\xe9\
-\xb1\x11\x01\x2b\x00\x30\x31\x13\x35\x21\x15\x25\x11\x21\x11\x33\
-\x11\x33\x11\x23\x11\x21\x11\x33\x02\xa4\xfe\xfc\x02\x39\x9a\x87\
-\x83\xfc\x8f\x03\x0e\x81\x81\x02\xfd\x73\x03\x0c\xfc\xee\xfe\x37\
-\x01\x4c\x03\x10\x00\x00\x00\x00\x01\x00\xc1\xfe\x71\x05\x5a\x05\
-\x8d\x00\x13\x00\x46\x00\xb2\x01\x02\x00\x2b\xb0\x07\x33\xb0\x0c\
-\x2f\xb0\x10\x2f\xb1\x05\x06\xe9\x01\xb0\x14\x2f\xb0\x00\xd6\xb1\
-\x03\x0e\xe9\xb0\x03\x10\xb1\x0e\x01\x2b\xb0\x06\x32\xb1\x09\x0e\
-\xe9\xb0\x09\x10\xb1\x0c\x01\x2b\xb1\x0b\x0f\xe9\xb1\x15\x01\x2b\
-\x00\xb1\x10\x0c\x11\x12\xb0\x09\x39\x30\x31\x13\x11\x33\x11\x14\
-\x17\x21\x11\x33\x11\x33\x11\x23\x11\x23\x11\x21\x22\x27\x26\xc1\
-\xb8\xcf\x01\xcc\xb7\x8f\x83\xc3\xfe\x3a\xb8\x79\x5c\x03\x98\x01\
-\xf5\xfe\x17\xbc\x01\x02\xa6\xfa\xf2\xfd\xf2\x01\x8f\x02\x6f\x6a\
-\x50\x00\x00\x00\x01\x00\xa6\xfe\xb4\x04\x29\x03\x8f\x00\x24\x00\
-\x9d\x00\xb2\x01\x01\x00\x2b\xb0\x0f\x33\xb0\x18\x2f\xb1\x0d\x05\
-\xe9\xb0\x09\x32\x01\xb0\x25\x2f\xb0\x00\xd6\xb1\x03\x11\xe9\xb0\
-\x03\x10\xb1\x16\x01\x2b\xb0\x0e\x32\xb1\x11\x11\xe9\xb0\x11\x10\
-\xb1\x14\x0b\x2b\xb1\x13\x0f\xe9\xb1\x26\x01\x2b\xb0\x36\x1a\xba\
-\xec\x5f\xc3\x16\x00\x15\x2b\x0a\xb0\x09\x2e\x0e\xb0\x07\xc0\xb1\
-\x1c\x19\xf9\xb0\x1e\xc0\xb0\x07\x10\xb3\x08\x07\x09\x13\x2b\xb0\
-\x1e\x10\xb3\x1d\x1e\x1c\x13\x2b\xb2\x08\x07\x09\x20\x8a\x20\x8a\
-\x23\x06\x0e\x11\x12\x39\xb2\x1d\x1e\x1c\x11\x12\x39\x00\xb4\x07\
-\x08\x1c\x1d\x1e\x2e\x2e\x2e\x2e\x2e\x01\xb5\x07\x08\x09\x1c\x1d\
-\x1e\x2e\x2e\x2e\x2e\x2e\x2e\xb0\x40\x1a\x01\x00\x30\x31\x13\x11\
-\x33\x11\x14\x1e\x05\x32\x16\x33\x21\x11\x33\x11\x33\x11\x23\x11\
-\x23\x11\x21\x27\x2a\x01\x2e\x04\x27\x2e\x02\xa6\x99\x09\x10\x10\
-\x19\x12\x1d\x0e\x19\x02\x01\x2f\x9a\x87\x83\x9e\xfe\xcd\x12\x10\
-\x0f\x29\x19\x29\x1e\x27\x13\x1d\x1c\x02\x02\x5c\x01\x33\xfe\xc1\
-\x10\x1b\x13\x10\x08\x06\x04\x02\x01\xa1\xfc\xee\xfe\x37\x01\x4c\
-\x01\x7b\x02\x06\x06\x0d\x12\x19\x10\x1b\x37\x1c\x00\x00\x00\x00\
-\x01\x00\xc1\x00\x00\x04\xcb\x05\x8d\x00\x16\x00\x66\x00\xb2\x0e\
-\x00\x00\x2b\xb2\x01\x02\x00\x2b\xb0\x0b\x33\xb4\x14\x05\x0e\x01\
-\x0d\x2b\xb0\x09\x33\xb1\x14\x06\xe9\xb0\x0f\x32\xb2\x14\x05\x0a\
-\x2b\xb3\x40\x14\x12\x09\x2b\xb2\x05\x14\x0a\x2b\xb3\x40\x05\x07\
-\x09\x2b\x01\xb0\x17\x2f\xb0\x00\xd6\xb1\x03\x0e\xe9\xb0\x03\x10\
-\xb1\x12\x01\x2b\xb0\x06\x32\xb1\x11\x16\xe9\xb0\x08\x32\xb0\x11\
-\x10\xb1\x0e\x01\x2b\xb0\x0a\x32\xb1\x0d\x0e\xe9\xb1\x18\x01\x2b\
-\x00\x30\x31\x13\x11\x33\x11\x14\x17\x33\x11\x33\x11\x21\x11\x33\
-\x11\x23\x11\x21\x11\x23\x11\x23\x2e\x01\xc1\xb8\xd3\x3f\x77\x01\
-\x12\xb7\xb7\xfe\xee\x77\x41\xb6\xd3\x03\x96\x01\xf7\xfe\x17\xbc\
-\x01\x01\x27\xfe\xd9\x02\xa6\xfa\x73\x02\x6f\xfe\xd9\x01\x27\x02\
-\xb0\x00\x00\x00\x01\x00\xa6\x00\x00\x03\xa2\x03\x8f\x00\x1b\x00\
-\x66\x00\xb2\x11\x00\x00\x2b\xb2\x01\x01\x00\x2b\xb0\x0e\x33\xb4\
-\x16\x08\x11\x01\x0d\x2b\xb0\x0c\x33\xb1\x16\x05\xe9\xb0\x12\x32\
-\xb2\x16\x08\x0a\x2b\xb3\x40\x16\x15\x09\x2b\xb2\x08\x16\x0a\x2b\
-\xb3\x40\x08\x0a\x09\x2b\x01\xb0\x1c\x2f\xb0\x00\xd6\xb1\x03\x11\
-\xe9\xb0\x03\x10\xb1\x15\x01\x2b\xb0\x09\x32\xb1\x14\x16\xe9\xb0\
-\x0b\x32\xb0\x14\x10\xb1\x11\x01\x2b\xb0\x0d\x32\xb1\x10\x11\xe9\
-\xb1\x1d\x01\x2b\x00\x30\x31\x13\x11\x33\x11\x14\x1e\x02\x3b\x01\
-\x35\x33\x15\x33\x11\x33\x11\x23\x11\x23\x15\x23\x35\x22\x27\x2e\
-\x02\xa6\x99\x05\x16\x42\x33\x1d\x72\xaa\x9a\x9a\xaa\x72\xa8\x61\
-\x1d\x1c\x04\x02\x5c\x01\x33\xfe\xcf\x12\x19\x2d\x18\xac\xac\x01\
-\xa1\xfc\x71\x01\x7b\xaa\xaa\x54\x1b\x37\x1c\x00\x01\x00\xc1\x00\
-\x00\x04\xcb\x05\x8d\x00\x18\x00\x4d\x00\xb2\x00\x00\x00\x2b\xb0\
-\x0c\x33\xb2\x01\x02\x00\x2b\xb2\x12\x01\x00\x2b\xb1\x05\x03\xe9\
-\x01\xb0\x19\x2f\xb0\x00\xd6\xb1\x18\x0e\xe9\xb0\x02\x32\xb0\x18\
-\x10\xb1\x0d\x01\x2b\xb1\x0c\x0e\xe9\xb1\x1a\x01\x2b\xb1\x0d\x18\
-\x11\x12\xb0\x05\x39\xb0\x0c\x11\xb0\x09\x39\x00\xb1\x12\x00\x11\
-\x12\xb0\x03\x39\x30\x31\x33\x11\x33\x11\x36\x33\x32\x1e\x03\x15\
-\x11\x23\x11\x26\x27\x26\x23\x22\x0e\x02\x15\x11\xc1\xb8\xb4\xfa\
-\x75\xa6\x51\x30\x08\xb7\x02\x20\x48\xe3\x37\x6d\x69\x41\x05\x8d\
-\xfd\xf6\xaa\x3f\x56\x8a\x5e\x46\xfd\x96\x02\x68\x87\x3c\x85\x2d\
-\x60\xbb\x7c\xfe\x14\x00\x00\x00\x01\x00\xa4\x00\x00\x03\x7d\x05\
-\xc7\x00\x18\x00\x47\x00\xb2\x00\x00\x00\x2b\xb0\x0c\x33\xb2\x01\
-\x02\x00\x2b\xb2\x05\x01\x00\x2b\xb1\x14\x03\xe9\x01\xb0\x19\x2f\
-\xb0\x01\xd6\xb1\x03\x11\xe9\xb0\x17\x32\xb0\x03\x10\xb1\x0d\x01\
-\x2b\xb1\x0c\x0d\xe9\xb1\x1a\x01\x2b\xb1\x0c\x0d\x11\x12\xb0\x09\
-\x39\x00\xb1\x14\x00\x11\x12\xb0\x03\x39\x30\x31\x33\x11\x33\x11\
-\x36\x37\x32\x1e\x03\x15\x11\x23\x11\x34\x2e\x03\x23\x22\x06\x15\
-\x11\xa4\x99\x7b\xac\x4e\x6f\x37\x1f\x06\xa0\x02\x16\x27\x50\x3a\
-\x6d\x63\x05\xc7\xfd\x4b\x91\x01\x31\x44\x68\x48\x31\xfd\xb2\x02\
-\x3f\x23\x29\x4c\x2d\x23\xb8\x83\xfe\x14\x00\x00\x02\x00\x25\xff\
-\xd3\x06\x1f\x05\xba\x00\x2c\x00\x36\x00\x6b\x00\xb2\x24\x00\x00\
-\x2b\xb1\x1f\x03\xe9\xb2\x12\x02\x00\x2b\xb1\x34\x03\xe9\xb4\x2d\
-\x19\x24\x12\x0d\x2b\xb1\x2d\x03\xe9\x01\xb0\x37\x2f\xb0\x00\xd6\
-\xb1\x0b\x0f\xe9\xb0\x0b\x10\xb1\x27\x01\x2b\xb0\x0f\x32\xb1\x1c\
-\x14\xe9\xb0\x2d\x32\xb1\x38\x01\x2b\xb1\x0b\x00\x11\x12\xb0\x08\
-\x39\xb0\x27\x11\xb0\x09\x39\x00\xb1\x19\x1f\x11\x12\xb2\x21\x22\
-\x27\x39\x39\x39\xb0\x2d\x11\xb0\x2a\x39\xb0\x34\x12\xb2\x00\x0f\
-\x09\x39\x39\x39\x30\x31\x13\x34\x3e\x06\x37\x06\x07\x14\x1e\x01\
-\x17\x36\x00\x33\x32\x1e\x02\x12\x15\x21\x14\x06\x15\x10\x00\x33\
-\x20\x25\x17\x04\x21\x20\x00\x11\x34\x36\x35\x2e\x01\x05\x21\x2e\
-\x04\x23\x22\x06\x25\x04\x06\x10\x0d\x1e\x15\x33\x11\x10\x01\x13\
-\x56\x47\x27\x01\x56\xec\x50\x95\xa6\x79\x50\xfb\xe5\x02\x01\x1d\
-\xcd\x01\x04\x01\x18\x0c\xfe\xf4\xfe\xe8\xfe\xdd\xfe\x87\x02\xa8\
-\x89\x01\xeb\x03\x6b\x0c\x52\x61\x78\x52\x27\x91\xfb\x03\xc3\x0e\
-\x14\x11\x12\x0a\x15\x0c\x1b\x0a\x25\x1a\x19\x35\x4c\x15\xf2\x01\
-\x5e\x20\x63\x9b\xfe\xf5\xae\x02\x0c\x02\xfe\xee\xfe\x8f\x89\x87\
-\x7f\x01\xc3\x01\x2f\x06\x18\x06\x1b\x84\x26\x7b\xbb\x5e\x39\x0e\
-\xf4\x00\x00\x00\x02\x00\x29\xff\xe9\x04\x25\x03\xb0\x00\x1e\x00\
-\x27\x00\x78\x00\xb2\x19\x00\x00\x2b\xb1\x14\x03\xe9\xb2\x0a\x01\
-\x00\x2b\xb1\x25\x03\xe9\xb4\x1f\x11\x19\x0a\x0d\x2b\xb0\x1c\x33\
-\xb1\x1f\x05\xe9\xb0\x07\x32\x01\xb0\x28\x2f\xb0\x00\xd6\xb1\x05\
-\x16\xe9\xb0\x05\x10\xb1\x1c\x01\x2b\xb1\x11\x0f\xe9\xb2\x11\x1c\
-\x0a\x2b\xb3\x40\x11\x0f\x09\x2b\xb1\x29\x01\x2b\xb1\x05\x00\x11\
-\x12\xb0\x02\x39\xb0\x1c\x11\xb0\x03\x39\xb0\x11\x12\xb0\x07\x39\
-\x00\xb1\x14\x19\x11\x12\xb0\x17\x39\xb0\x11\x11\xb0\x16\x39\xb1\
-\x25\x1f\x11\x12\xb1\x00\x03\x39\x39\x30\x31\x13\x34\x3f\x01\x06\
-\x15\x14\x17\x3e\x01\x33\x32\x1e\x02\x1f\x01\x21\x1e\x01\x33\x32\
-\x37\x17\x06\x07\x22\x00\x27\x2e\x01\x25\x21\x2e\x03\x23\x22\x06\
-\x29\x0e\x6d\x08\x89\x25\xe5\x89\x3b\x71\x6f\x4a\x06\x02\xfd\x85\
-\x06\xb0\x79\x9c\x9b\x0d\x9c\xa8\xb6\xfe\xfe\x06\x64\x8e\x01\x8b\
-\x01\xfc\x0c\x40\x50\x3f\x1d\x68\x88\x02\x4c\x0a\x25\x3d\x19\x05\
-\x46\x1b\xb2\xc5\x27\x5a\xb2\x7b\x3f\x9a\xc1\x71\x87\x68\x01\x01\
-\x0b\xd1\x0a\x44\x20\x50\x6f\x2f\x10\xa0\x00\x00\x02\x00\x25\xfe\
-\x52\x06\x1f\x05\xba\x00\x3f\x00\x49\x00\x96\x00\xb2\x26\x00\x00\
-\x2b\xb1\x1f\x07\xe9\xb2\x36\x00\x00\x2b\xb2\x12\x02\x00\x2b\xb1\
-\x47\x03\xe9\xb0\x31\x2f\xb1\x2c\x03\xe9\xb4\x40\x19\x26\x12\x0d\
-\x2b\xb1\x40\x03\xe9\x01\xb0\x4a\x2f\xb0\x00\xd6\xb1\x0b\x0f\xe9\
-\xb0\x0b\x10\xb1\x3a\x01\x2b\xb0\x0f\x32\xb1\x1c\x14\xe9\xb0\x40\
-\x32\xb0\x1c\x10\xb1\x34\x01\x2b\xb1\x29\x16\xe9\xb1\x4b\x01\x2b\
-\xb1\x0b\x00\x11\x12\xb0\x08\x39\xb0\x3a\x11\xb0\x09\x39\xb1\x29\
-\x34\x11\x12\xb1\x12\x47\x39\x39\x00\xb1\x26\x2c\x11\x12\xb1\x2e\
-\x34\x39\x39\xb1\x19\x1f\x11\x12\xb2\x21\x22\x3a\x39\x39\x39\xb0\
-\x40\x11\xb0\x3d\x39\xb0\x47\x12\xb2\x00\x0f\x09\x39\x39\x39\x30\
-\x31\x13\x34\x3e\x06\x37\x06\x07\x14\x1e\x01\x17\x36\x00\x33\x32\
-\x1e\x02\x12\x15\x21\x14\x06\x15\x10\x00\x33\x20\x25\x17\x0e\x02\
-\x23\x0e\x01\x15\x14\x16\x33\x32\x37\x17\x06\x23\x2e\x01\x35\x34\
-\x37\x26\x24\x02\x35\x34\x36\x35\x2e\x01\x05\x21\x2e\x04\x23\x22\
-\x06\x25\x04\x06\x10\x0d\x1e\x15\x33\x11\x10\x01\x13\x56\x47\x27\
-\x01\x56\xec\x50\x95\xa6\x79\x50\xfb\xe5\x02\x01\x1d\xcd\x01\x04\
-\x01\x18\x0c\x6f\xcc\x7f\x02\x23\x68\x2d\x29\x25\x47\x21\x5a\x48\
-\x62\x56\x7b\xc7\xfe\xd5\x8b\x02\xa8\x89\x01\xeb\x03\x6b\x0c\x52\
-\x61\x78\x52\x27\x91\xfb\x03\xc3\x0e\x14\x11\x12\x0a\x15\x0c\x1b\
-\x0a\x25\x1a\x19\x35\x4c\x15\xf2\x01\x5e\x20\x63\x9b\xfe\xf5\xae\
-\x02\x0c\x02\xfe\xee\xfe\x8f\x89\x87\x33\x3a\x10\x0c\x67\x39\x25\
-\x31\x1d\x79\x25\x02\x6f\x41\x79\x56\x0e\xea\x01\x45\xb5\x06\x18\
-\x06\x1b\x84\x26\x7b\xbb\x5e\x39\x0e\xf4\x00\x00\x02\x00\x29\xfe\
-\x4e\x04\x25\x03\xb0\x00\x30\x00\x39\x00\xab\x00\xb2\x2b\x00\x00\
-\x2b\xb1\x14\x03\xe9\xb2\x0a\x01\x00\x2b\xb1\x37\x03\xe9\xb0\x25\
-\x2f\xb1\x20\x08\xe9\xb4\x31\x11\x2b\x0a\x0d\x2b\xb0\x2e\x33\xb1\
-\x31\x05\xe9\xb0\x07\x32\x01\xb0\x3a\x2f\xb0\x00\xd6\xb1\x05\x16\
-\xe9\xb0\x05\x10\xb1\x2e\x01\x2b\xb1\x11\x0f\xe9\xb2\x11\x2e\x0a\
-\x2b\xb3\x40\x11\x0f\x09\x2b\xb0\x11\x10\xb1\x28\x01\x2b\xb1\x1d\
-\x16\xe9\xb1\x3b\x01\x2b\xb1\x05\x00\x11\x12\xb0\x02\x39\xb0\x2e\
-\x11\xb0\x03\x39\xb0\x11\x12\xb0\x07\x39\xb0\x28\x11\xb0\x31\x39\
-\xb0\x1d\x12\xb3\x14\x0a\x2b\x37\x24\x17\x39\x00\xb1\x2b\x20\x11\
-\x12\xb2\x1d\x22\x28\x39\x39\x39\xb0\x14\x11\xb1\x17\x19\x39\x39\
-\xb0\x11\x12\xb0\x16\x39\xb0\x31\x11\xb0\x2f\x39\xb0\x37\x12\xb1\
-\x00\x03\x39\x39\x30\x31\x13\x34\x3f\x01\x06\x15\x14\x17\x3e\x01\
-\x33\x32\x1e\x02\x1f\x01\x21\x1e\x01\x33\x32\x37\x17\x0e\x04\x15\
-\x14\x16\x33\x32\x37\x17\x06\x23\x22\x26\x35\x34\x37\x07\x2e\x01\
-\x27\x2e\x01\x25\x21\x2e\x03\x23\x22\x06\x29\x0e\x6d\x08\x89\x25\
-\xe9\x85\x3b\x71\x6f\x4a\x06\x02\xfd\x85\x06\xb0\x79\x9c\x9b\x0d\
-\x14\x69\x40\x4c\x24\x31\x39\x27\x54\x21\x6d\x3f\x60\x71\x7d\x38\
-\x9e\xff\x06\x62\x90\x01\x8b\x01\xfc\x0c\x40\x50\x3f\x1d\x68\x88\
-\x02\x4c\x0a\x25\x3d\x19\x05\x46\x1b\xb6\xc1\x27\x5c\xb2\x7b\x3d\
-\x9a\xc1\x71\x87\x0e\x3e\x29\x3f\x44\x25\x27\x3d\x1f\x79\x29\x6a\
-\x54\x77\x69\x03\x08\xfd\xd7\x08\x46\x20\x50\x6f\x2f\x10\xa0\x00\
-\x01\x00\xc1\x00\x00\x01\x79\x05\x8d\x00\x03\x00\x21\x00\xb2\x00\
-\x00\x00\x2b\xb2\x01\x02\x00\x2b\x01\xb0\x04\x2f\xb0\x00\xd6\xb1\
-\x03\x0e\xe9\xb1\x03\x0e\xe9\xb1\x05\x01\x2b\x00\x30\x31\x33\x11\
-\x33\x11\xc1\xb8\x05\x8d\xfa\x73\x00\x00\x00\x00\x02\x00\x54\x00\
-\x00\x08\x8b\x07\x1d\x00\x13\x00\x1f\x00\x81\x00\xb2\x00\x00\x00\
-\x2b\xb1\x0b\x0f\x33\x33\xb2\x02\x02\x00\x2b\xb1\x05\x08\x33\x33\
-\xb0\x1e\x2f\xb1\x18\x09\xe9\xb2\x18\x1e\x0a\x2b\xb3\x40\x18\x1b\
-\x09\x2b\xb0\x14\x32\x01\xb0\x20\x2f\xb0\x14\xd6\xb4\x15\x16\x00\
-\x32\x04\x2b\xb0\x15\x10\xb1\x10\x01\x2b\xb0\x04\x32\xb1\x0f\x15\
-\xe9\xb0\x06\x32\xb0\x0f\x10\xb1\x1a\x01\x2b\xb4\x1b\x0f\x00\x20\
-\x04\x2b\xb1\x21\x01\x2b\xb1\x10\x15\x11\x12\xb0\x1e\x39\xb0\x0f\
-\x11\xb1\x17\x18\x39\x39\xb0\x1a\x12\xb0\x1d\x39\x00\xb1\x02\x00\
-\x11\x12\xb3\x04\x07\x0d\x12\x24\x17\x39\x30\x31\x33\x09\x01\x33\
-\x01\x11\x33\x11\x01\x33\x09\x01\x23\x09\x01\x11\x23\x11\x09\x02\
-\x33\x1e\x01\x32\x36\x37\x33\x0e\x01\x20\x26\x54\x02\x42\xfd\xdb\
-\xbe\x02\xe8\xb0\x02\xe9\xbf\xfd\xdb\x02\x41\xc0\xfe\x0e\xfe\xee\
-\xb0\xfe\xef\xfe\x0e\x02\x00\x7d\x06\x86\xa4\x85\x06\x7f\x04\xcd\
-\xfe\xe9\xcb\x03\x5c\x02\x31\xfd\x09\x02\xf7\xfd\x09\x02\xf7\xfd\
-\xcf\xfc\xa4\x02\xe7\xfe\xec\xfe\x2d\x01\xd3\x01\x14\xfd\x19\x07\
-\x1d\x5e\x65\x64\x5f\x93\xb9\xbb\x00\x00\x00\x00\x02\x00\x21\x00\
-\x00\x05\xc5\x05\x1d\x00\x13\x00\x24\x00\x89\x00\xb2\x00\x00\x00\
-\x2b\xb1\x0b\x0f\x33\x33\xb2\x02\x01\x00\x2b\xb1\x05\x08\x33\x33\
-\xb0\x22\x2f\xb1\x19\x09\xe9\xb2\x19\x22\x0a\x2b\xb3\x40\x19\x1f\
-\x09\x2b\xb0\x14\x32\x01\xb0\x25\x2f\xb0\x14\xd6\xb4\x15\x16\x00\
-\x32\x04\x2b\xb0\x15\x10\xb1\x10\x01\x2b\xb0\x04\x32\xb1\x0f\x10\
-\xe9\xb0\x06\x32\xb0\x0f\x10\xb1\x1e\x01\x2b\xb4\x1f\x16\x00\x32\
-\x04\x2b\xb1\x26\x01\x2b\xb1\x15\x14\x11\x12\xb1\x12\x01\x39\x39\
-\xb1\x0f\x10\x11\x12\xb1\x19\x22\x39\x39\xb1\x1f\x1e\x11\x12\xb1\
-\x0d\x0a\x39\x39\x00\xb1\x02\x00\x11\x12\xb3\x04\x07\x0d\x12\x24\
-\x17\x39\x30\x31\x33\x09\x01\x33\x01\x11\x33\x11\x01\x33\x09\x01\
-\x23\x01\x07\x11\x23\x11\x27\x01\x13\x33\x1e\x02\x33\x32\x3e\x02\
-\x37\x33\x0e\x01\x23\x22\x26\x21\x01\x89\xfe\xa4\xb8\x01\xa0\x93\
-\x01\xa6\xb9\xfe\xa3\x01\x8a\xa8\xfe\xbe\xa2\x93\x9c\xfe\xbf\xcd\
-\x7c\x06\x5d\x52\x27\x1b\x3d\x4d\x36\x04\x7d\x04\xd1\x85\x87\xcf\
-\x02\x2d\x01\x62\xfe\x5a\x01\xa6\xfe\x54\x01\xac\xfe\x9e\xfd\xd3\
-\x01\xcb\xa2\xfe\xd7\x01\x2f\x9c\xfe\x35\x05\x1d\x3d\x4a\x11\x0a\
-\x1d\x42\x2f\x87\x9a\x9c\x00\x00\x01\x00\xc3\xfe\x44\x05\x52\x05\
-\x8d\x00\x23\x00\x71\x00\xb2\x00\x00\x00\x2b\xb2\x1b\x00\x00\x2b\
-\xb2\x01\x02\x00\x2b\xb0\x05\x33\xb0\x0d\x2f\xb1\x19\x03\xe9\xb4\
-\x03\x22\x00\x01\x0d\x2b\xb1\x03\x03\xe9\xb0\x07\x32\x01\xb0\x24\
-\x2f\xb0\x00\xd6\xb1\x23\x15\xe9\xb0\x02\x32\xb0\x23\x10\xb1\x1c\
-\x01\x2b\xb1\x0a\x13\xe9\xb1\x25\x01\x2b\xb1\x1c\x23\x11\x12\xb3\
-\x05\x07\x0d\x15\x24\x17\x39\xb0\x0a\x11\xb0\x06\x39\x00\xb1\x19\
-\x0d\x11\x12\xb0\x15\x39\xb0\x00\x11\xb0\x16\x39\xb0\x22\x12\xb1\
-\x0a\x1c\x39\x39\x30\x31\x33\x11\x33\x11\x33\x01\x33\x01\x04\x00\
-\x11\x14\x00\x23\x22\x2e\x05\x27\x37\x1e\x01\x33\x32\x12\x35\x34\
-\x02\x27\x26\x2b\x01\x11\xc3\xb0\x8b\x02\x5c\xbf\xfd\xa1\x01\x23\
-\x01\x75\xfe\xe5\xe5\x1d\x31\x2d\x1d\x27\x10\x29\x06\x25\x4a\x47\
-\x4a\x98\xc0\xf4\xdd\x2f\x5e\xdb\x05\x8d\xfd\x96\x02\x6a\xfd\x94\
-\x02\xfe\xc4\xfe\xc9\xf6\xfe\x8e\x02\x06\x04\x0c\x04\x0f\x02\x8b\
-\x25\x14\x01\x1c\xc7\xdb\x01\x08\x17\x04\xfd\x5c\x00\x00\x00\x00\
-\x01\x00\xa6\xfe\x5c\x03\xd5\x03\x8f\x00\x1b\x00\x6e\x00\xb2\x00\
-\x00\x00\x2b\xb2\x01\x01\x00\x2b\xb0\x05\x33\xb0\x0f\x2f\xb1\x14\
-\x03\xe9\xb4\x03\x1a\x00\x01\x0d\x2b\xb1\x03\x05\xe9\x01\xb0\x1c\
-\x2f\xb0\x00\xd6\xb1\x1b\x11\xe9\xb0\x02\x32\xb0\x1b\x10\xb1\x17\
-\x01\x2b\xb1\x0a\x0f\xe9\xb0\x06\x32\xb1\x1d\x01\x2b\xb1\x17\x1b\
-\x11\x12\xb3\x05\x07\x0f\x11\x24\x17\x39\x00\xb1\x14\x0f\x11\x12\
-\xb0\x11\x39\xb0\x00\x11\xb0\x12\x39\xb0\x1a\x12\xb1\x0a\x17\x39\
-\x39\xb0\x03\x11\xb1\x07\x08\x39\x39\x30\x31\x33\x11\x33\x11\x33\
-\x01\x33\x01\x1e\x01\x15\x14\x02\x07\x06\x23\x22\x27\x37\x16\x33\
-\x32\x36\x35\x10\x05\x23\x11\xa6\x99\x59\x01\x76\xc1\xfe\x85\xbc\
-\xc5\xb8\x83\x1d\x3e\x5c\x56\x23\x58\x3a\x7b\x89\xfe\xa8\xaf\x03\
-\x8f\xfe\x9e\x01\x62\xfe\x9c\x0e\xfa\xcf\xc5\xfe\xf2\x1f\x06\x15\
-\x87\x1b\xdb\x96\x01\x6d\x01\xfe\x46\x00\x00\x00\x01\x00\x27\xfe\
-\x71\x05\x87\x05\x8d\x00\x16\x00\x6a\x00\xb2\x00\x00\x00\x2b\xb0\
-\x0e\x33\xb1\x01\x03\xe9\xb0\x0b\x32\xb2\x08\x02\x00\x2b\xb1\x11\
-\x08\xe9\xb0\x0d\x2f\xb0\x0c\x33\x01\xb0\x17\x2f\xb0\x06\xd6\xb1\
-\x11\x0f\xe9\xb0\x11\x10\xb1\x0f\x01\x2b\xb1\x0a\x0e\xe9\xb0\x0c\
-\x32\xb0\x0a\x10\xb1\x0d\x11\xe9\xb0\x0d\x2f\xb1\x18\x01\x2b\xb0\
-\x36\x1a\xba\x3d\x82\xee\x50\x00\x15\x2b\x0a\xb0\x0d\x10\xb0\x0e\
-\xc0\xb0\x0c\x10\xb0\x0b\xc0\x03\xb1\x0b\x0e\x2e\x2e\xb0\x40\x1a\
-\x00\x30\x31\x33\x35\x33\x36\x37\x36\x13\x36\x35\x21\x11\x33\x03\
-\x23\x13\x23\x11\x21\x10\x03\x0e\x01\x23\x27\x4e\x5a\x27\xb8\x19\
-\x04\x03\x23\x99\x99\x9a\x73\x90\xfe\x17\x52\x33\xac\x79\x81\x02\
-\x1b\x77\x03\x53\x87\x9e\xfa\xf8\xfd\xec\x01\x8f\x05\x0a\xfd\xe1\
-\xfe\x9a\xe3\xa2\x00\x00\x00\x00\x01\x00\x27\xfe\xb4\x04\x14\x03\
-\x8f\x00\x17\x00\x81\x00\xb2\x00\x00\x00\x2b\xb0\x0e\x33\xb1\x01\
-\x08\xe9\xb2\x08\x01\x00\x2b\xb1\x11\x03\xe9\xb2\x11\x08\x0a\x2b\
-\xb3\x40\x11\x0c\x09\x2b\xb0\x0d\x32\x01\xb0\x18\x2f\xb0\x07\xd6\
-\xb1\x11\x0f\xe9\xb2\x07\x11\x0a\x2b\xb3\x40\x07\x00\x09\x2b\xb0\
-\x11\x10\xb1\x0d\x01\x2b\xb0\x0f\x32\xb1\x0c\x11\xe9\xb0\x09\x32\
-\xb1\x19\x01\x2b\xb0\x36\x1a\xba\x3d\x7b\xee\x39\x00\x15\x2b\x0a\
-\xb0\x0d\x10\xb0\x0e\xc0\x0e\xb0\x0c\x10\xb0\x0b\xc0\x00\xb0\x0b\
-\x2e\x01\xb1\x0b\x0e\x2e\x2e\xb0\x40\x1a\x01\x00\xb1\x01\x00\x11\
-\x12\xb0\x0a\x39\x30\x31\x33\x35\x33\x32\x3e\x01\x12\x3d\x01\x21\
-\x11\x33\x03\x23\x13\x23\x11\x21\x06\x02\x0e\x02\x23\x27\x4e\x37\
-\x42\x3d\x1d\x02\x47\x85\x85\x99\x60\x60\xfe\xdf\x02\x25\x39\x63\
-\x62\x48\x85\x2d\x94\x01\x3b\xfc\x12\xfc\xee\xfe\x37\x01\x4c\x03\
-\x10\xcd\xfe\xe0\xa8\x5e\x1d\x00\x01\x00\xc1\xfe\x44\x04\xcb\x05\
-\x8d\x00\x18\x00\x5b\x00\xb2\x00\x00\x00\x2b\xb2\x01\x02\x00\x2b\
-\xb0\x05\x33\xb0\x0b\x2f\xb1\x12\x08\xe9\xb4\x03\x17\x00\x01\x0d\
-\x2b\xb1\x03\x03\xe9\x01\xb0\x19\x2f\xb0\x00\xd6\xb1\x18\x0e\xe9\
-\xb0\x02\x32\xb0\x18\x10\xb1\x15\x01\x2b\xb0\x04\x32\xb1\x07\x0e\
-\xe9\xb1\x1a\x01\x2b\xb1\x15\x18\x11\x12\xb1\x0b\x0d\x39\x39\x00\
-\xb1\x12\x0b\x11\x12\xb0\x0d\x39\xb0\x00\x11\xb0\x0e\x39\x30\x31\
-\x33\x11\x33\x11\x21\x11\x33\x11\x14\x07\x06\x23\x22\x27\x37\x1e\
-\x02\x33\x32\x36\x35\x11\x21\x11\xc1\xb8\x02\x9b\xb7\x6b\x5e\x87\
-\x68\x6b\x25\x25\x1e\x3e\x27\x3f\x60\xfd\x65\x05\x8d\xfd\x96\x02\
-\x6a\xfa\x0f\xaa\x5c\x52\x2d\x8b\x14\x11\x0e\x58\x70\x03\x13\xfd\
-\x5c\x00\x00\x00\x01\x00\xa6\xfe\x5c\x03\xa2\x03\x8f\x00\x14\x00\
-\x5d\x00\xb2\x00\x00\x00\x2b\xb2\x01\x01\x00\x2b\xb0\x05\x33\xb0\
-\x0a\x2f\xb1\x0f\x08\xe9\xb4\x03\x13\x00\x01\x0d\x2b\xb1\x03\x05\
-\xe9\x01\xb0\x15\x2f\xb0\x00\xd6\xb1\x14\x11\xe9\xb0\x02\x32\xb0\
-\x14\x10\xb1\x11\x01\x2b\xb0\x04\x32\xb1\x07\x11\xe9\xb1\x16\x01\
-\x2b\xb1\x11\x14\x11\x12\xb2\x0a\x0c\x0f\x39\x39\x39\x00\xb1\x0f\
-\x0a\x11\x12\xb0\x0c\x39\xb0\x00\x11\xb0\x0d\x39\x30\x31\x33\x11\
-\x33\x11\x21\x11\x33\x11\x14\x06\x23\x22\x27\x37\x16\x33\x32\x27\
-\x11\x21\x11\xa6\x99\x01\xc9\x9a\x90\x78\x4c\x4e\x23\x42\x33\x71\
-\x01\xfe\x37\x03\x8f\xfe\x9e\x01\x62\xfc\x00\x8b\xa8\x15\x87\x19\
-\xb9\x02\x22\xfe\x46\x00\x00\x00\x01\x00\xc1\xfe\x71\x05\x64\x05\
-\x8d\x00\x0f\x00\x81\x00\xb2\x00\x00\x00\x2b\xb0\x0b\x33\xb2\x01\
-\x02\x00\x2b\xb0\x05\x33\xb0\x0a\x2f\xb0\x09\x33\xb4\x03\x0e\x00\
-\x01\x0d\x2b\xb1\x03\x03\xe9\x01\xb0\x10\x2f\xb0\x00\xd6\xb1\x0f\
-\x0e\xe9\xb0\x02\x32\xb0\x0f\x10\xb1\x0c\x01\x2b\xb0\x04\x32\xb1\
-\x07\x0e\xe9\xb0\x09\x32\xb0\x07\x10\xb1\x0a\x11\xe9\xb0\x0a\x2f\
-\xb1\x11\x01\x2b\xb0\x36\x1a\xba\x3d\x74\xee\x20\x00\x15\x2b\x0a\
-\xb0\x0a\x10\xb0\x0b\xc0\x0e\xb0\x09\x10\xb0\x08\xc0\x00\xb0\x08\
-\x2e\x01\xb1\x08\x0b\x2e\x2e\xb0\x40\x1a\x01\x00\xb1\x0e\x00\x11\
-\x12\xb0\x07\x39\x30\x31\x33\x11\x33\x11\x21\x11\x33\x11\x33\x03\
-\x23\x13\x23\x11\x21\x11\xc1\xb8\x02\x9b\xb7\x99\x99\x9a\x75\x92\
-\xfd\x65\x05\x8d\xfd\x96\x02\x6a\xfa\xf2\xfd\xf2\x01\x8f\x02\xa4\
-\xfd\x5c\x00\x00\x01\x00\xa6\xfe\xb4\x04\x27\x03\x8f\x00\x0f\x00\
-\x7b\x00\xb2\x00\x00\x00\x2b\xb0\x0b\x33\xb2\x01\x01\x00\x2b\xb0\
-\x05\x33\xb4\x03\x0e\x00\x01\x0d\x2b\xb1\x03\x05\xe9\x01\xb0\x10\
-\x2f\xb0\x00\xd6\xb1\x0f\x11\xe9\xb0\x02\x32\xb0\x0f\x10\xb1\x0a\
-\x01\x2b\xb1\x04\x0c\x32\x32\xb1\x09\x11\xe9\xb0\x06\x32\xb1\x11\
-\x01\x2b\xb0\x36\x1a\xba\x3d\x7b\xee\x39\x00\x15\x2b\x0a\x04\xb0\
-\x0a\x2e\x05\xb0\x0b\xc0\x04\xb1\x09\x10\xf9\x0e\xb0\x08\xc0\x00\
-\xb2\x08\x09\x0a\x2e\x2e\x2e\x01\xb1\x08\x0b\x2e\x2e\xb0\x40\x1a\
-\x01\x00\xb1\x0e\x00\x11\x12\xb0\x07\x39\x30\x31\x33\x11\x33\x11\
-\x21\x11\x33\x11\x33\x03\x23\x13\x23\x11\x21\x11\xa6\x99\x01\xc9\
-\x9a\x85\x85\x9a\x60\x60\xfe\x37\x03\x8f\xfe\x9e\x01\x62\xfc\xee\
-\xfe\x37\x01\x4c\x01\xba\xfe\x46\x00\x00\x00\x00\x01\x00\xc1\xfe\
-\x71\x04\xcb\x05\x8d\x00\x13\x00\x46\x00\xb2\x01\x02\x00\x2b\xb0\
-\x07\x33\xb0\x0c\x2f\xb0\x10\x2f\xb1\x05\x06\xe9\x01\xb0\x14\x2f\
-\xb0\x00\xd6\xb1\x03\x0e\xe9\xb0\x03\x10\xb1\x0c\x01\x2b\xb1\x0b\
-\x0f\xe9\xb0\x0b\x10\xb1\x0e\x01\x2b\xb0\x06\x32\xb1\x09\x0e\xe9\
-\xb1\x15\x01\x2b\x00\xb1\x10\x0c\x11\x12\xb0\x09\x39\x30\x31\x13\
-\x11\x33\x11\x14\x17\x21\x11\x33\x11\x23\x11\x23\x11\x33\x11\x21\
-\x22\x27\x26\xc1\xb8\xcf\x01\xcc\xb7\xc3\x83\x8f\xfe\x3a\xb8\x79\
-\x5c\x03\x98\x01\xf5\xfe\x17\xbc\x01\x02\xa6\xfa\x73\xfe\x71\x02\
-\x14\x01\xea\x6a\x50\x00\x00\x00\x01\x00\xa6\xfe\xb4\x03\xa2\x03\
-\x8f\x00\x24\x00\xa7\x00\xb2\x01\x01\x00\x2b\xb0\x0f\x33\xb0\x18\
-\x2f\xb1\x0d\x05\xe9\xb0\x09\x32\x01\xb0\x25\x2f\xb0\x00\xd6\xb1\
-\x03\x11\xe9\xb0\x03\x10\xb1\x14\x01\x2b\xb1\x13\x0f\xe9\xb0\x13\
-\x10\xb1\x16\x0b\x2b\xb0\x0e\x32\xb1\x11\x11\xe9\xb1\x26\x01\x2b\
-\xb0\x36\x1a\xba\xec\x5f\xc3\x16\x00\x15\x2b\x0a\xb0\x09\x2e\x0e\
-\xb0\x07\xc0\xb1\x1c\x19\xf9\xb0\x1e\xc0\xb0\x07\x10\xb3\x08\x07\
-\x09\x13\x2b\xb0\x1e\x10\xb3\x1d\x1e\x1c\x13\x2b\xb2\x08\x07\x09\
-\x20\x8a\x20\x8a\x23\x06\x0e\x11\x12\x39\xb2\x1d\x1e\x1c\x11\x12\
-\x39\x00\xb4\x07\x08\x1c\x1d\x1e\x2e\x2e\x2e\x2e\x2e\x01\xb5\x07\
-\x08\x09\x1c\x1d\x1e\x2e\x2e\x2e\x2e\x2e\x2e\xb0\x40\x1a\x01\xb1\
-\x14\x03\x11\x12\xb1\x0b\x1b\x39\x39\x00\x30\x31\x13\x11\x33\x11\
-\x14\x1e\x05\x32\x16\x33\x21\x11\x33\x11\x23\x11\x23\x11\x33\x35\
-\x21\x27\x2a\x01\x2e\x04\x27\x2e\x02\xa6\x99\x09\x10\x10\x19\x12\
-\x1d\x0e\x19\x02\x01\x2f\x9a\x9c\x83\x85\xfe\xcd\x12\x10\x0f\x29\
-\x19\x29\x1e\x27\x13\x1d\x1c\x02\x02\x5c\x01\x33\xfe\xc1\x10\x1b\
-\x13\x10\x08\x06\x04\x02\x01\xa1\xfc\x71\xfe\xb4\x01\xc9\xfe\x02\
-\x06\x06\x0d\x12\x19\x10\x1b\x37\x1c\x00\x00\x00\x01\x00\xcd\xfe\
-\x71\x06\xd7\x05\x8d\x00\x18\x00\x77\x00\xb2\x00\x00\x00\x2b\xb0\
-\x0e\x33\xb2\x01\x02\x00\x2b\xb0\x08\x33\xb0\x0d\x2f\xb0\x0c\x33\
-\x01\xb0\x19\x2f\xb0\x00\xd6\xb1\x18\x0d\xe9\xb0\x18\x10\xb1\x0f\
-\x01\x2b\xb0\x0d\x32\xb1\x0a\x0d\xe9\xb0\x0c\x32\xb1\x1a\x01\x2b\
-\xb0\x36\x1a\xba\x3d\x1e\xed\x02\x00\x15\x2b\x0a\xb0\x0d\x10\xb0\
-\x0e\xc0\x0e\xb0\x0c\x10\xb0\x0b\xc0\x00\xb0\x0b\x2e\x01\xb1\x0b\
-\x0e\x2e\x2e\xb0\x40\x1a\x01\xb1\x0f\x18\x11\x12\xb1\x02\x08\x39\
-\x39\x00\xb1\x01\x00\x11\x12\xb2\x05\x0a\x10\x39\x39\x39\x30\x31\
-\x33\x11\x33\x01\x12\x17\x36\x13\x01\x33\x11\x33\x03\x23\x13\x23\
-\x11\x07\x03\x01\x23\x01\x02\x27\x11\xcd\xe9\x01\x36\x83\x10\x0c\
-\x85\x01\x38\xe9\xa6\xa6\x99\x7c\x83\x16\x85\xfe\xd1\x94\xfe\xdb\
-\x93\x0e\x05\x8d\xfc\xdb\xfe\x98\x44\x3d\x01\x67\x03\x2d\xfa\xf8\
-\xfd\xec\x01\x8f\x04\xfe\x50\xfe\x94\xfc\xeb\x02\xfa\x01\x93\x44\
-\xfb\x02\x00\x00\x01\x00\xa4\xfe\xb4\x05\x37\x03\x8f\x00\x14\x00\
-\x79\x00\xb2\x00\x00\x00\x2b\xb0\x0a\x33\xb2\x01\x01\x00\x2b\xb0\
-\x04\x33\x01\xb0\x15\x2f\xb0\x00\xd6\xb1\x14\x0d\xe9\xb0\x14\x10\
-\xb1\x0b\x01\x2b\xb0\x09\x32\xb1\x06\x0d\xe9\xb0\x08\x32\xb1\x16\
-\x01\x2b\xb0\x36\x1a\xba\x3d\x94\xee\x91\x00\x15\x2b\x0a\x04\xb0\
-\x09\x2e\x05\xb0\x0a\xc0\x04\xb1\x08\x10\xf9\x0e\xb0\x07\xc0\x00\
-\xb2\x07\x08\x09\x2e\x2e\x2e\x01\xb1\x07\x0a\x2e\x2e\xb0\x40\x1a\
-\x01\xb1\x0b\x14\x11\x12\xb1\x02\x04\x39\x39\x00\xb1\x01\x00\x11\
-\x12\xb2\x03\x06\x0c\x39\x39\x39\x30\x31\x33\x11\x33\x09\x01\x33\
-\x11\x33\x03\x23\x13\x23\x11\x06\x01\x23\x02\x27\x26\x27\x11\xa4\
-\xd9\x01\x29\x01\x29\xe5\x83\x83\x99\x5e\x65\x0c\xfe\xe4\x8a\xe3\
-\x23\x10\x08\x03\x8f\xfd\x2d\x02\xd3\xfc\xee\xfe\x37\x01\x4c\x03\
-\x27\x58\xfd\x48\x02\x33\x72\x39\x32\xfc\xd9\x00\x03\x00\x37\x00\
-\x00\x05\x19\x07\x1d\x00\x07\x00\x13\x00\x18\x00\x77\x00\xb2\x00\
-\x00\x00\x2b\xb0\x03\x33\xb2\x01\x02\x00\x2b\xb4\x06\x14\x00\x01\
-\x0d\x2b\xb1\x06\x05\xe9\xb0\x12\x2f\xb1\x0c\x09\xe9\xb2\x0c\x12\
-\x0a\x2b\xb3\x40\x0c\x0f\x09\x2b\xb0\x08\x32\x01\xb0\x19\x2f\xb0\
-\x08\xd6\xb4\x09\x16\x00\x32\x04\x2b\xb0\x09\x10\xb1\x0e\x01\x2b\
-\xb4\x0f\x0f\x00\x20\x04\x2b\xb1\x1a\x01\x2b\xb1\x09\x08\x11\x12\
-\xb1\x06\x14\x39\x39\xb0\x0e\x11\xb4\x02\x01\x11\x12\x17\x24\x17\
-\x39\xb0\x0f\x12\xb1\x05\x15\x39\x39\x00\xb1\x01\x14\x11\x12\xb0\
-\x17\x39\x30\x31\x33\x01\x33\x01\x23\x03\x21\x03\x13\x33\x1e\x01\
-\x32\x36\x37\x33\x0e\x01\x20\x26\x13\x21\x02\x27\x06\x37\x02\x17\
-\xb6\x02\x15\xbd\x9e\xfd\xaf\x9c\x6e\x7d\x06\x86\xa4\x85\x06\x7f\
-\x04\xcf\xfe\xed\xcd\x55\x01\xfb\xf2\x0b\x1b\x05\x8d\xfa\x73\x01\
-\xa2\xfe\x5e\x07\x1d\x5e\x65\x64\x5f\x96\xb6\xb9\xfb\x8a\x02\x9e\
-\x4c\x7d\x00\x00\x03\x00\x5a\xff\xe9\x03\x5c\x05\x1d\x00\x1b\x00\
-\x2b\x00\x37\x00\xc2\x00\xb2\x14\x00\x00\x2b\xb2\x19\x00\x00\x2b\
-\xb1\x2f\x03\xe9\xb2\x0f\x01\x00\x2b\xb1\x0a\x07\xe9\xb4\x33\x05\
-\x19\x0f\x0d\x2b\xb1\x33\x0c\xe9\xb0\x2a\x2f\xb1\x22\x09\xe9\xb2\
-\x22\x2a\x0a\x2b\xb3\x40\x22\x27\x09\x2b\xb0\x1c\x32\x01\xb0\x38\
-\x2f\xb0\x00\xd6\xb1\x2c\x10\xe9\xb0\x2c\x10\xb0\x1d\x20\xd6\x11\
-\xb4\x1c\x16\x00\x32\x04\x2b\xb0\x1c\x2f\xb4\x1d\x16\x00\x32\x04\
-\x2b\xb0\x2c\x10\xb1\x32\x01\x2b\xb1\x05\x14\x32\x32\xb1\x13\x0d\
-\xe9\xb0\x13\x10\xb0\x27\x20\xd6\x11\xb4\x26\x0f\x00\x20\x04\x2b\
-\xb0\x26\x2f\xb4\x27\x0f\x00\x20\x04\x2b\xb1\x39\x01\x2b\xb1\x1d\
-\x1c\x11\x12\xb0\x0c\x39\xb0\x32\x11\xb6\x0a\x0f\x19\x22\x29\x2a\
-\x2f\x24\x17\x39\xb0\x13\x12\xb0\x11\x39\x00\xb1\x33\x14\x11\x12\
-\xb2\x00\x15\x2c\x39\x39\x39\xb1\x0a\x05\x11\x12\xb0\x0c\x39\xb0\
-\x0f\x11\xb0\x0d\x39\x30\x31\x37\x34\x3e\x02\x33\x35\x26\x27\x26\
-\x23\x22\x07\x27\x36\x33\x32\x16\x17\x11\x23\x35\x0e\x02\x23\x22\
-\x26\x13\x33\x1e\x03\x32\x3e\x02\x37\x33\x0e\x01\x20\x26\x13\x14\
-\x16\x33\x32\x36\x3d\x01\x22\x0e\x02\x5a\x73\xba\xb2\x5a\x04\x31\
-\x33\x4e\x9e\x95\x0c\x9a\xa7\x8d\xbf\x08\x9b\x08\x3c\xac\x64\x75\
-\x75\x4c\x7d\x04\x35\x4e\x3d\x36\x3b\x4c\x35\x04\x7f\x04\xd1\xfe\
-\xf2\xcf\x46\x6c\x52\x58\x8d\x3f\x83\x8b\x56\xe7\x4c\x71\x37\x1b\
-\x45\x83\x3a\x3d\x68\x89\x5a\xba\x85\xfd\x8f\x48\x08\x25\x32\xa6\
-\x04\x8e\x2f\x42\x1d\x0a\x0a\x1d\x42\x2f\x85\x9c\x9c\xfc\x51\x37\
-\x4a\x4a\x58\x81\x10\x21\x44\x00\x04\x00\x37\x00\x00\x05\x19\x06\
-\xcb\x00\x07\x00\x0b\x00\x10\x00\x14\x00\x65\x00\xb2\x00\x00\x00\
-\x2b\xb0\x03\x33\xb2\x01\x02\x00\x2b\xb4\x06\x0c\x00\x01\x0d\x2b\
-\xb1\x06\x05\xe9\xb0\x08\x2f\xb0\x11\x33\xb1\x09\x04\xe9\xb0\x12\
-\x32\x01\xb0\x15\x2f\xb0\x08\xd6\xb1\x0b\x0e\xe9\xb0\x0b\x10\xb1\
-\x11\x01\x2b\xb1\x14\x0e\xe9\xb1\x16\x01\x2b\xb1\x0b\x08\x11\x12\
-\xb0\x0c\x39\xb0\x11\x11\xb2\x01\x02\x0f\x39\x39\x39\xb0\x14\x12\
-\xb1\x05\x0d\x39\x39\x00\xb1\x01\x0c\x11\x12\xb0\x0f\x39\x30\x31\
-\x33\x01\x33\x01\x23\x03\x21\x03\x13\x35\x33\x15\x03\x21\x02\x27\
-\x06\x13\x35\x33\x15\x37\x02\x17\xb6\x02\x15\xbd\x9e\xfd\xaf\x9c\
-\xb7\xb8\xa8\x01\xfb\xf2\x0b\x1b\x9a\xb8\x05\x8d\xfa\x73\x01\xa2\
-\xfe\x5e\x06\x14\xb7\xb7\xfc\x00\x02\x9e\x4c\x7d\x01\x93\xb7\xb7\
-\x00\x00\x00\x00\x04\x00\x5a\xff\xe9\x03\x33\x05\x48\x00\x1b\x00\
-\x1f\x00\x2b\x00\x2f\x00\xa2\x00\xb2\x14\x00\x00\x2b\xb2\x19\x00\
-\x00\x2b\xb1\x23\x03\xe9\xb2\x0f\x01\x00\x2b\xb1\x0a\x07\xe9\xb4\
-\x27\x05\x19\x0f\x0d\x2b\xb1\x27\x0c\xe9\xb0\x1c\x2f\xb0\x2c\x33\
-\xb1\x1d\x04\xe9\xb0\x2d\x32\x01\xb0\x30\x2f\xb0\x1c\xd6\xb1\x1f\
-\x0e\xe9\xb3\x20\x1f\x1c\x08\x2b\xb1\x00\x10\xe9\xb0\x00\x2f\xb1\
-\x20\x10\xe9\xb0\x1f\x10\xb1\x26\x01\x2b\xb1\x05\x14\x32\x32\xb1\
-\x13\x0d\xe9\xb0\x13\x10\xb0\x2f\x20\xd6\x11\xb1\x2c\x0e\xe9\xb0\
-\x2c\x2f\xb1\x2f\x0e\xe9\xb1\x31\x01\x2b\xb1\x1f\x1c\x11\x12\xb0\
-\x19\x39\xb0\x2c\x11\xb2\x0a\x0f\x23\x39\x39\x39\x00\xb1\x27\x14\
-\x11\x12\xb2\x00\x15\x20\x39\x39\x39\xb1\x0a\x05\x11\x12\xb0\x0c\
-\x39\xb0\x0f\x11\xb0\x0d\x39\x30\x31\x37\x34\x3e\x02\x33\x35\x26\
-\x27\x26\x23\x22\x07\x27\x36\x33\x32\x16\x17\x11\x23\x35\x0e\x02\
-\x23\x22\x26\x13\x35\x33\x15\x03\x14\x16\x33\x32\x36\x3d\x01\x22\
-\x0e\x02\x01\x35\x33\x15\x5a\x73\xba\xb2\x5a\x04\x31\x33\x4e\x9e\
-\x95\x0c\x9a\xa7\x8d\xbf\x08\x9b\x08\x3c\xac\x64\x75\x75\x84\xb8\
-\xa6\x6c\x52\x58\x8d\x3f\x83\x8b\x56\x01\x7b\xb8\xe7\x4c\x71\x37\
-\x1b\x45\x83\x3a\x3d\x68\x89\x5a\xba\x85\xfd\x8f\x48\x08\x25\x32\
-\xa6\x04\x02\xb7\xb7\xfc\x58\x37\x4a\x4a\x58\x81\x10\x21\x44\x03\
-\x7b\xb7\xb7\x00\x02\x00\x37\x00\x00\x06\x8b\x05\x8d\x00\x16\x00\
-\x1a\x00\x5e\x00\xb2\x13\x00\x00\x2b\xb0\x00\x33\xb1\x0e\x0b\xe9\
-\xb2\x01\x02\x00\x2b\xb1\x06\x08\xe9\xb0\x19\x32\xb4\x15\x17\x13\
-\x01\x0d\x2b\xb1\x15\x05\xe9\xb4\x08\x0b\x13\x01\x0d\x2b\xb1\x08\
-\x03\xe9\x01\xb0\x1b\x2f\xb0\x13\xd6\xb0\x18\x32\xb1\x0c\x0e\xe9\
-\xb0\x07\x32\xb2\x0c\x13\x0a\x2b\xb3\x40\x0c\x02\x09\x2b\xb3\x40\
-\x0c\x0a\x09\x2b\xb3\x40\x0c\x12\x09\x2b\xb1\x1c\x01\x2b\x00\x30\
-\x31\x33\x01\x21\x15\x23\x27\x21\x27\x11\x21\x15\x21\x11\x33\x37\
-\x21\x37\x33\x15\x21\x11\x21\x03\x13\x21\x11\x23\x37\x02\x46\x03\
-\xf2\x61\x2f\xfe\x5c\x2d\x02\x29\xfd\xd7\x85\x32\x01\x4b\x2b\x50\
-\xfc\xcd\xfe\x33\xba\xeb\x01\x9c\x77\x05\x8d\x87\x02\x02\xfe\x19\
-\x7f\xfd\xeb\x02\x02\x93\x01\xc7\xfe\x39\x02\x39\x02\xd1\x00\x00\
-\x03\x00\x5e\xff\xe9\x05\x8b\x03\xb0\x00\x2e\x00\x45\x00\x4b\x00\
-\x6e\x00\xb2\x2c\x00\x00\x2b\xb0\x28\x33\xb1\x32\x03\xe9\xb0\x23\
-\x32\xb2\x0d\x01\x00\x2b\xb0\x11\x33\xb1\x08\x07\xe9\xb0\x49\x32\
-\xb4\x3a\x03\x2c\x0d\x0d\x2b\xb1\x3a\x05\xe9\xb4\x46\x17\x2c\x0d\
-\x0d\x2b\xb1\x46\x05\xe9\x01\xb0\x4c\x2f\xb0\x00\xd6\xb1\x2f\x10\
-\xe9\xb1\x4d\x01\x2b\xb1\x2f\x00\x11\x12\xb1\x0a\x0b\x39\x39\x00\
-\xb1\x3a\x32\x11\x12\xb3\x1b\x00\x25\x2a\x24\x17\x39\xb0\x03\x11\
-\xb0\x1a\x39\xb1\x08\x46\x11\x12\xb1\x0a\x0f\x39\x39\x30\x31\x37\
-\x34\x24\x37\x35\x26\x27\x26\x23\x22\x07\x27\x36\x33\x32\x17\x36\
-\x33\x32\x1e\x02\x15\x21\x14\x1e\x07\x17\x16\x33\x32\x37\x17\x06\
-\x07\x22\x27\x06\x21\x22\x26\x37\x1e\x01\x33\x32\x3e\x01\x35\x34\
-\x2e\x01\x27\x06\x07\x0e\x07\x15\x01\x21\x26\x23\x22\x06\x5e\x01\
-\x40\xf3\x04\x2f\x33\x4e\xa0\x95\x0c\xa2\xa1\xae\x73\x7d\xba\x3b\
-\x6b\x6d\x41\xfd\xa6\x02\x04\x06\x0b\x10\x19\x1c\x2b\x19\x3d\x4c\
-\x93\x88\x0c\x87\xa2\xc3\x8d\x6d\xfe\xab\x79\x6f\x96\x02\x6a\x50\
-\x35\x61\x56\x02\x04\x03\xba\x75\x12\x1f\x16\x13\x0a\x06\x04\x02\
-\x02\x49\x01\xd5\x29\xb0\x50\x91\xe9\x81\x8c\x04\x41\x83\x38\x3f\
-\x68\x89\x5a\xa0\xa0\x29\x62\xcf\x93\x02\x1f\x15\x29\x22\x2b\x29\
-\x29\x25\x11\x27\x71\x87\x68\x01\x9e\x9e\xaa\x59\x3b\x49\x15\x4a\
-\x3b\x06\x13\x3f\x2d\x04\x29\x06\x0e\x11\x0c\x10\x0b\x0e\x08\x06\
-\x01\x41\xfe\x87\x00\x00\x00\x00\x02\x00\xc1\x00\x00\x04\x71\x07\
-\x1d\x00\x12\x00\x1e\x00\x90\x00\xb2\x00\x00\x00\x2b\xb1\x0e\x0b\
-\xe9\xb2\x01\x02\x00\x2b\xb1\x06\x08\xe9\xb4\x08\x0b\x00\x01\x0d\
-\x2b\xb1\x08\x03\xe9\xb0\x1d\x2f\xb1\x17\x09\xe9\xb2\x17\x1d\x0a\
-\x2b\xb3\x40\x17\x13\x09\x2b\xb0\x19\x32\x01\xb0\x1f\x2f\xb0\x00\
-\xd6\xb1\x0c\x0e\xe9\xb0\x07\x32\xb2\x0c\x00\x0a\x2b\xb3\x40\x0c\
-\x12\x09\x2b\xb3\x40\x0c\x02\x09\x2b\xb3\x40\x0c\x0a\x09\x2b\xb0\
-\x0c\x10\xb0\x14\x20\xd6\x11\xb4\x13\x16\x00\x32\x04\x2b\xb0\x13\
-\x2f\xb4\x14\x16\x00\x32\x04\x2b\xb0\x0c\x10\xb1\x19\x01\x2b\xb4\
-\x1a\x16\x00\x32\x04\x2b\xb1\x20\x01\x2b\xb1\x19\x14\x11\x12\xb1\
-\x1c\x1d\x39\x39\x00\x30\x31\x33\x11\x21\x15\x23\x27\x21\x27\x11\
-\x21\x15\x21\x11\x33\x37\x21\x37\x33\x15\x01\x33\x1e\x01\x32\x36\
-\x37\x33\x0e\x01\x20\x26\xc1\x03\x93\x75\x33\xfe\x15\x48\x02\xa4\
-\xfd\x5c\xae\x31\x01\x8d\x2d\x5f\xfc\xbe\x7d\x06\x87\xa4\x85\x06\
-\x7d\x04\xca\xfe\xe9\xcd\x05\x8d\x87\x02\x02\xfe\x19\x7f\xfd\xeb\
-\x02\x02\x93\x07\x1d\x5e\x65\x64\x5f\x93\xb9\xbb\x00\x00\x00\x00\
-\x03\x00\x46\xff\xe9\x03\x50\x05\x1d\x00\x14\x00\x24\x00\x2d\x00\
-\xa0\x00\xb2\x12\x00\x00\x2b\xb1\x0d\x03\xe9\xb2\x03\x01\x00\x2b\
-\xb1\x2b\x03\xe9\xb4\x25\x0a\x12\x03\x0d\x2b\xb1\x25\x05\xe9\xb0\
-\x23\x2f\xb1\x1b\x09\xe9\xb2\x1b\x23\x0a\x2b\xb3\x40\x1b\x20\x09\
-\x2b\xb0\x15\x32\x01\xb0\x2e\x2f\xb0\x00\xd6\xb1\x0a\x0f\xe9\xb2\
-\x0a\x00\x0a\x2b\xb3\x40\x0a\x09\x09\x2b\xb0\x0a\x10\xb0\x16\x20\
-\xd6\x11\xb4\x15\x16\x00\x32\x04\x2b\xb0\x15\x2f\xb4\x16\x16\x00\
-\x32\x04\x2b\xb0\x0a\x10\xb1\x1f\x01\x2b\xb4\x20\x0f\x00\x20\x04\
-\x2b\xb1\x2f\x01\x2b\xb1\x16\x0a\x11\x12\xb0\x25\x39\xb0\x1f\x11\
-\xb5\x0d\x12\x03\x22\x23\x2b\x24\x17\x39\xb0\x20\x12\xb0\x26\x39\
-\x00\xb1\x0a\x0d\x11\x12\xb0\x0f\x39\xb0\x25\x11\xb0\x00\x39\x30\
-\x31\x13\x34\x12\x33\x32\x1e\x02\x17\x15\x21\x1e\x01\x33\x32\x37\
-\x17\x06\x07\x22\x02\x13\x33\x1e\x03\x32\x3e\x02\x37\x33\x0e\x01\
-\x20\x26\x13\x21\x2e\x03\x23\x22\x06\x46\xf7\xa6\x3d\x6f\x71\x4a\
-\x06\xfd\x85\x06\xb0\x79\x9c\x9b\x0d\x9c\xa8\xc3\xfb\x27\x7d\x04\
-\x35\x4e\x3d\x36\x3b\x4c\x35\x04\x7f\x04\xd1\xfe\xf2\xcf\x6e\x01\
-\xfc\x0c\x40\x50\x3f\x1d\x68\x88\x01\xcf\xcb\x01\x16\x27\x5a\xb4\
-\x7d\x3b\x9a\xc1\x71\x87\x68\x01\x01\x21\x04\x13\x2f\x42\x1d\x0a\
-\x0a\x1d\x42\x2f\x85\x9c\x9c\xfd\x9b\x50\x6f\x2f\x10\xa0\x00\x00\
-\x02\x00\x37\xff\xd3\x05\x02\x05\xba\x00\x21\x00\x28\x00\x45\x00\
-\xb2\x1c\x00\x00\x2b\xb1\x25\x08\xe9\xb2\x15\x02\x00\x2b\xb1\x09\
-\x08\xe9\xb3\x12\x15\x09\x08\x2b\xb1\x11\x04\xe9\xb4\x22\x00\x1c\
-\x15\x0d\x2b\xb1\x22\x03\xe9\x01\xb0\x29\x2f\xb0\x28\xd6\xb0\x01\
-\x32\xb1\x19\x0e\xe9\xb1\x2a\x01\x2b\x00\xb1\x11\x00\x11\x12\xb0\
-\x19\x39\x30\x31\x13\x21\x34\x2e\x03\x27\x26\x23\x22\x0e\x05\x07\
-\x27\x3e\x01\x3b\x01\x32\x00\x11\x10\x00\x21\x22\x2e\x02\x02\x37\
-\x16\x12\x33\x32\x36\x37\x37\x04\x1d\x3d\x56\x71\x54\x25\x29\x33\
-\x31\x4a\x4c\x23\x49\x13\x62\x0c\x1f\x9a\xa3\x85\x34\xf8\x01\x6c\
-\xfe\xa8\xfe\xe3\x50\x95\xa8\x79\x50\xa4\x0a\xe8\xc0\xb0\xf0\x1d\
-\x02\xaa\x8b\xe2\x87\x62\x27\x08\x08\x02\x0e\x04\x1d\x08\x2d\x06\
-\xaa\x2f\x16\xfe\x4a\xfe\xbf\xfe\xa8\xfe\x68\x21\x62\x9c\x01\x0a\
-\x2f\xc1\xfe\xec\xfc\xd9\x00\x00\x02\x00\x3b\xff\xe9\x03\x62\x03\
-\xa4\x00\x16\x00\x1d\x00\x4f\x00\xb2\x13\x00\x00\x2b\xb1\x1a\x08\
-\xe9\xb2\x0d\x01\x00\x2b\xb1\x04\x03\xe9\xb4\x17\x00\x13\x0d\x0d\
-\x2b\xb1\x17\x05\xe9\x01\xb0\x1e\x2f\xb0\x01\xd6\xb1\x10\x0f\xe9\
-\xb2\x01\x10\x0a\x2b\xb3\x40\x01\x16\x09\x2b\xb1\x1f\x01\x2b\x00\
-\xb1\x00\x17\x11\x12\xb0\x10\x39\xb0\x04\x11\xb0\x08\x39\xb0\x0d\
-\x12\xb0\x09\x39\x30\x31\x13\x21\x2e\x01\x23\x22\x0e\x01\x07\x27\
-\x3e\x02\x33\x32\x12\x15\x14\x00\x23\x22\x26\x27\x17\x1e\x01\x33\
-\x32\x36\x37\x3b\x02\x98\x06\xa0\x7d\x48\x6e\x23\x37\x19\x33\x3a\
-\x72\x4a\xbc\xf6\xfe\xfe\xa4\xac\xc8\x0b\x75\x0c\x8a\x6c\x5a\x94\
-\x25\x01\xd3\x8f\xc5\x23\x16\x27\x87\x1f\x1c\x1b\xfe\xe5\xc0\xcf\
-\xfe\xef\xe2\xcf\x3a\x62\x91\x78\x7b\x00\x00\x00\x04\x00\x37\xff\
-\xd3\x04\xfc\x06\xcb\x00\x23\x00\x2d\x00\x31\x00\x35\x00\x8d\x00\
-\xb2\x1e\x00\x00\x2b\xb1\x2a\x08\xe9\xb2\x17\x02\x00\x2b\xb1\x09\
-\x08\xe9\xb4\x24\x00\x1e\x17\x0d\x2b\xb1\x24\x03\xe9\xb0\x2e\x2f\
-\xb0\x32\x33\xb1\x2f\x04\xe9\xb0\x33\x32\x01\xb0\x36\x2f\xb0\x00\
-\xd6\xb1\x24\x13\xe9\xb0\x24\x10\xb1\x2e\x01\x2b\xb1\x31\x0e\xe9\
-\xb0\x31\x10\xb1\x32\x01\x2b\xb1\x35\x0e\xe9\xb0\x35\x10\xb1\x2d\
-\x01\x2b\xb0\x01\x32\xb1\x1b\x0e\xe9\xb1\x37\x01\x2b\xb1\x2e\x24\
-\x11\x12\xb1\x0e\x11\x39\x39\xb0\x31\x11\xb1\x0d\x0c\x39\x39\xb0\
-\x32\x12\xb2\x09\x2a\x1e\x39\x39\x39\x00\xb1\x09\x00\x11\x12\xb1\
-\x13\x1b\x39\x39\xb0\x17\x11\xb0\x14\x39\x30\x31\x13\x21\x34\x2e\
-\x03\x27\x26\x23\x22\x0e\x07\x07\x27\x3e\x01\x3b\x01\x32\x00\x11\
-\x10\x00\x21\x22\x2e\x02\x02\x37\x1e\x04\x33\x32\x12\x37\x01\x35\
-\x33\x15\x33\x35\x33\x15\x37\x04\x17\x3e\x56\x6e\x54\x25\x29\x31\
-\x27\x3e\x3d\x25\x39\x15\x3d\x0c\x4c\x08\x1f\x9a\xa3\x85\x32\xfc\
-\x01\x64\xfe\xaa\xfe\xe3\x50\x93\xa6\x79\x50\xa4\x02\x17\x3d\x5a\
-\x9c\x62\xb6\xea\x1b\xfd\x43\xb8\xd5\xb9\x02\xaa\x8b\xe2\x87\x62\
-\x27\x08\x08\x02\x08\x02\x12\x05\x1c\x04\x25\x04\xaa\x2f\x16\xfe\
-\x46\xfe\xc3\xfe\xa6\xfe\x6a\x21\x62\x9c\x01\x0a\x2f\x2d\x68\x8a\
-\x6a\x4c\x01\x08\xcd\x03\xe9\xb7\xb7\xb7\xb7\x00\x04\x00\x3b\xff\
-\xe9\x03\x62\x05\x48\x00\x16\x00\x1d\x00\x21\x00\x25\x00\x84\x00\
-\xb2\x13\x00\x00\x2b\xb1\x1a\x08\xe9\xb2\x0d\x01\x00\x2b\xb1\x04\
-\x03\xe9\xb4\x17\x00\x13\x0d\x0d\x2b\xb1\x17\x05\xe9\xb0\x1e\x2f\
-\xb0\x22\x33\xb1\x1f\x04\xe9\xb0\x23\x32\x01\xb0\x26\x2f\xb0\x1e\
-\xd6\xb1\x21\x0e\xe9\xb0\x21\x10\xb1\x22\x01\x2b\xb1\x25\x0e\xe9\
-\xb3\x01\x25\x22\x08\x2b\xb1\x10\x0f\xe9\xb2\x01\x10\x0a\x2b\xb3\
-\x40\x01\x16\x09\x2b\xb1\x27\x01\x2b\xb1\x22\x21\x11\x12\xb3\x0d\
-\x04\x1a\x13\x24\x17\x39\xb0\x01\x11\xb0\x1d\x39\x00\xb1\x00\x17\
-\x11\x12\xb0\x10\x39\xb0\x04\x11\xb0\x08\x39\xb0\x0d\x12\xb0\x09\
-\x39\x30\x31\x13\x21\x2e\x01\x23\x22\x0e\x01\x07\x27\x3e\x02\x33\
-\x32\x12\x15\x14\x00\x23\x22\x26\x27\x17\x1e\x01\x33\x32\x36\x37\
-\x01\x35\x33\x15\x33\x35\x33\x15\x3b\x02\x98\x06\xa0\x7d\x48\x6e\
-\x23\x37\x19\x33\x3a\x72\x4a\xbc\xf6\xfe\xfe\xa4\xac\xc8\x0b\x75\
-\x0c\x8a\x6c\x5a\x94\x25\xfd\xec\xb8\xd5\xb8\x01\xd3\x8f\xc5\x23\
-\x16\x27\x87\x1f\x1c\x1b\xfe\xe5\xc0\xcf\xfe\xef\xe2\xcf\x3a\x62\
-\x91\x78\x7b\x03\x31\xb7\xb7\xb7\xb7\x00\x00\x00\x03\x00\x54\x00\
-\x00\x08\x8b\x06\xcd\x00\x13\x00\x17\x00\x1b\x00\x5d\x00\xb2\x00\
-\x00\x00\x2b\xb1\x0b\x0f\x33\x33\xb2\x02\x02\x00\x2b\xb1\x05\x08\
-\x33\x33\xb0\x14\x2f\xb0\x18\x33\xb1\x15\x04\xe9\xb0\x19\x32\x01\
-\xb0\x1c\x2f\xb0\x14\xd6\xb1\x17\x0e\xe9\xb0\x17\x10\xb1\x10\x01\
-\x2b\xb0\x04\x32\xb1\x0f\x15\xe9\xb0\x06\x32\xb0\x0f\x10\xb1\x18\
-\x01\x2b\xb1\x1b\x0e\xe9\xb1\x1d\x01\x2b\x00\xb1\x02\x00\x11\x12\
-\xb3\x04\x07\x0d\x12\x24\x17\x39\x30\x31\x33\x09\x01\x33\x01\x11\
-\x33\x11\x01\x33\x09\x01\x23\x09\x01\x11\x23\x11\x09\x02\x35\x33\
-\x15\x33\x35\x33\x15\x54\x02\x42\xfd\xdb\xbe\x02\xe8\xb0\x02\xe9\
-\xbf\xfd\xdb\x02\x41\xc0\xfe\x0e\xfe\xee\xb0\xfe\xef\xfe\x0e\x02\
-\x39\xb8\xd7\xb8\x03\x5c\x02\x31\xfd\x09\x02\xf7\xfd\x09\x02\xf7\
-\xfd\xcf\xfc\xa4\x02\xe7\xfe\xec\xfe\x2d\x01\xd3\x01\x14\xfd\x19\
-\x06\x16\xb7\xb7\xb7\xb7\x00\x00\x03\x00\x21\x00\x00\x05\xc5\x05\
-\x48\x00\x13\x00\x17\x00\x1b\x00\x6d\x00\xb2\x00\x00\x00\x2b\xb1\
-\x0b\x0f\x33\x33\xb2\x02\x01\x00\x2b\xb1\x05\x08\x33\x33\xb0\x14\
-\x2f\xb0\x18\x33\xb1\x15\x04\xe9\xb0\x19\x32\x01\xb0\x1c\x2f\xb0\
-\x14\xd6\xb1\x17\x0e\xe9\xb0\x17\x10\xb1\x10\x01\x2b\xb0\x04\x32\
-\xb1\x0f\x10\xe9\xb0\x06\x32\xb0\x0f\x10\xb1\x18\x01\x2b\xb1\x1b\
-\x0e\xe9\xb1\x1d\x01\x2b\xb1\x17\x14\x11\x12\xb0\x12\x39\xb1\x1b\
-\x18\x11\x12\xb0\x0d\x39\x00\xb1\x02\x00\x11\x12\xb3\x04\x07\x0d\
-\x12\x24\x17\x39\x30\x31\x33\x09\x01\x33\x01\x11\x33\x11\x01\x33\
-\x09\x01\x23\x01\x07\x11\x23\x11\x27\x09\x01\x35\x33\x15\x33\x35\
-\x33\x15\x21\x01\x89\xfe\xa4\xb8\x01\xa0\x93\x01\xa6\xb9\xfe\xa3\
-\x01\x8a\xa8\xfe\xbe\xa2\x93\x9c\xfe\xbf\x01\x04\xb8\xd6\xb8\x02\
-\x2d\x01\x62\xfe\x5a\x01\xa6\xfe\x54\x01\xac\xfe\x9e\xfd\xd3\x01\
-\xcb\xa2\xfe\xd7\x01\x2f\x9c\xfe\x35\x04\x91\xb7\xb7\xb7\xb7\x00\
-\x03\x00\x66\xff\xd3\x04\x8d\x06\xcb\x00\x33\x00\x37\x00\x3b\x00\
-\x97\x00\xb2\x31\x00\x00\x2b\xb1\x06\x05\xe9\xb2\x20\x02\x00\x2b\
-\xb1\x16\x05\xe9\xb4\x0e\x0d\x31\x20\x0d\x2b\xb1\x0e\x03\xe9\xb0\
-\x34\x2f\xb0\x38\x33\xb1\x35\x04\xe9\xb0\x39\x32\x01\xb0\x3c\x2f\
-\xb0\x34\xd6\xb1\x37\x0e\xe9\xb0\x37\x10\xb1\x38\x01\x2b\xb1\x3b\
-\x0e\xe9\xb0\x3b\x10\xb1\x14\x01\x2b\xb1\x25\x0d\xe9\xb0\x09\x20\
-\xd6\x11\xb1\x2e\x13\xe9\xb2\x09\x2e\x0a\x2b\xb3\x40\x09\x0d\x09\
-\x2b\xb1\x3d\x01\x2b\xb1\x38\x37\x11\x12\xb3\x11\x06\x31\x20\x24\
-\x17\x39\xb0\x3b\x11\xb0\x2b\x39\x00\xb1\x0d\x06\x11\x12\xb2\x00\
-\x01\x2e\x39\x39\x39\xb0\x0e\x11\xb0\x2b\x39\xb0\x16\x12\xb3\x14\
-\x1c\x1d\x25\x24\x17\x39\x30\x31\x3f\x01\x1e\x03\x33\x32\x36\x35\
-\x34\x26\x2b\x01\x35\x33\x16\x33\x32\x36\x35\x10\x25\x22\x0e\x03\
-\x07\x27\x3e\x01\x33\x32\x1e\x02\x15\x14\x0e\x03\x07\x1e\x01\x15\
-\x14\x04\x23\x22\x26\x13\x35\x33\x15\x33\x35\x33\x15\x66\x48\x37\
-\x36\x6a\x85\x5e\xb2\xcb\xc6\xcf\xc3\x8c\x08\x10\xa4\xdd\xfe\xbf\
-\x48\x81\x4a\x5a\x16\x23\x4e\x75\xe1\xa2\x64\x9a\x91\x50\x0a\x29\
-\x4a\x8b\x60\xb2\xef\xfe\xcf\xf6\xae\xcb\x63\xb8\xd6\xb8\x9e\x7d\
-\x3d\x34\x4a\x1a\xbc\x73\x71\xbe\x7f\x02\x9d\x7d\x01\x0c\x01\x21\
-\x1f\x4a\x16\x27\x89\x5c\x54\x1e\x4c\x9e\x75\x1b\x36\x56\x48\x4e\
-\x19\x1f\xce\x87\xa6\xfa\x52\x05\xef\xb7\xb7\xb7\xb7\x00\x00\x00\
-\x03\x00\x39\xff\xe9\x03\x48\x05\x48\x00\x34\x00\x38\x00\x3c\x00\
-\x98\x00\xb2\x33\x00\x00\x2b\xb1\x04\x08\xe9\xb2\x1e\x01\x00\x2b\
-\xb1\x17\x03\xe9\xb4\x0f\x0e\x33\x1e\x0d\x2b\xb1\x0f\x05\xe9\xb0\
-\x35\x2f\xb0\x39\x33\xb1\x36\x04\xe9\xb0\x3a\x32\x01\xb0\x3d\x2f\
-\xb0\x35\xd6\xb1\x38\x0e\xe9\xb0\x38\x10\xb1\x15\x01\x2b\xb1\x26\
-\x0f\xe9\xb3\x3c\x26\x15\x08\x2b\xb1\x39\x0e\xe9\xb0\x39\x2f\xb1\
-\x3c\x0e\xe9\xb0\x15\x10\xb0\x07\x20\xd6\x11\xb1\x2e\x0f\xe9\xb1\
-\x3e\x01\x2b\xb1\x39\x38\x11\x12\xb3\x17\x04\x33\x1e\x24\x17\x39\
-\xb0\x3c\x11\xb0\x2b\x39\x00\xb1\x0e\x04\x11\x12\xb1\x01\x2e\x39\
-\x39\xb0\x0f\x11\xb0\x2b\x39\xb0\x17\x12\xb2\x1a\x23\x26\x39\x39\
-\x39\xb0\x1e\x11\xb0\x1b\x39\x30\x31\x3f\x01\x1e\x01\x33\x32\x36\
-\x35\x34\x2e\x01\x27\x26\x2b\x01\x35\x33\x32\x3e\x02\x37\x26\x21\
-\x22\x06\x07\x27\x3e\x01\x33\x32\x1e\x02\x17\x14\x16\x15\x14\x0e\
-\x02\x07\x1e\x01\x15\x14\x0e\x02\x23\x22\x03\x35\x33\x15\x33\x35\
-\x33\x15\x39\x3a\x48\x7c\x5c\xa0\x87\x14\x62\x54\x1b\x5a\x60\x74\
-\x23\x4a\x64\x44\x04\x04\xfe\xef\x62\x5e\x56\x39\x5e\x85\x6f\x44\
-\x63\x90\x58\x0a\x02\x1d\x43\x21\x29\x50\x71\x27\x58\xb7\x7c\xc3\
-\x2f\xb8\xd6\xb8\x56\x7f\x37\x31\x66\x41\x19\x37\x48\x0a\x04\x73\
-\x08\x19\x3b\x2b\x7f\x21\x37\x7b\x37\x23\x0a\x27\x62\x4e\x04\x11\
-\x04\x27\x3d\x31\x13\x16\x1d\x75\x56\x31\x5e\x5e\x3a\x04\xa8\xb7\
-\xb7\xb7\xb7\x00\x01\x00\x54\xff\xd3\x04\x19\x05\x8d\x00\x22\x00\
-\x55\x00\xb2\x20\x00\x00\x2b\xb1\x06\x08\xe9\xb2\x17\x02\x00\x2b\
-\xb4\x14\x0b\x00\x27\x04\x2b\x01\xb0\x23\x2f\xb0\x00\xd6\xb0\x15\
-\x32\xb1\x01\x0d\xe9\xb0\x01\x10\xb1\x09\x01\x2b\xb1\x1d\x0e\xe9\
-\xb0\x17\x32\xb1\x24\x01\x2b\xb1\x09\x01\x11\x12\xb5\x10\x12\x14\
-\x19\x1a\x20\x24\x17\x39\x00\xb1\x14\x06\x11\x12\xb3\x00\x01\x18\
-\x1d\x24\x17\x39\x30\x31\x13\x37\x1e\x03\x33\x32\x36\x35\x34\x26\
-\x2f\x01\x37\x07\x23\x35\x01\x35\x23\x05\x35\x21\x15\x01\x15\x16\
-\x00\x15\x14\x04\x23\x22\x26\x54\xa0\x0a\x46\x66\x50\x2b\x8b\xb2\
-\x76\x8a\x3f\x02\x4e\x77\x01\xf2\xfc\xfd\xfe\x03\xc0\xfe\x0f\xe9\
-\x01\x0d\xfe\xe1\xd7\xc7\xf6\x01\x3f\x0f\x50\x6b\x2d\x10\xa0\x81\
-\x5c\xac\x14\x07\x0c\x02\x7d\x01\xc6\x05\x05\xa6\xa6\xfe\x3a\x0d\
-\x02\xff\x00\x9b\xaa\xfa\xb8\x00\x01\x00\x54\xfe\x5c\x03\x35\x03\
-\x8f\x00\x1a\x00\x33\x00\xb2\x11\x01\x00\x2b\xb1\x0e\x0a\xe9\xb0\
-\x19\x2f\xb1\x03\x08\xe9\x01\xb0\x1b\x2f\xb0\x06\xd6\xb1\x16\x0d\
-\xe9\xb0\x11\x32\xb1\x1c\x01\x2b\x00\xb1\x0e\x03\x11\x12\xb3\x00\
-\x01\x12\x16\x24\x17\x39\x30\x31\x17\x37\x16\x33\x32\x36\x35\x34\
-\x26\x27\x15\x23\x35\x01\x35\x05\x35\x21\x15\x01\x1e\x01\x15\x14\
-\x06\x23\x22\x54\x23\x85\xb4\x60\x86\x79\x69\xa8\x01\x7b\xfd\xcd\
-\x02\xdb\xfe\x94\xa6\xcc\xe3\xa2\xcd\xfe\x87\xaa\x89\x88\x7b\x91\
-\x04\x02\x73\x01\x8f\x04\x04\x8f\x8f\xfe\x7f\x0c\xe6\x9d\xaa\xea\
-\x00\x00\x00\x00\x02\x00\xc1\x00\x00\x04\xcb\x06\xcd\x00\x0c\x00\
-\x10\x00\x59\x00\xb2\x00\x00\x00\x2b\xb0\x07\x33\xb2\x01\x02\x00\
-\x2b\xb0\x05\x33\xb0\x0d\x2f\xb1\x0e\x08\xe9\x01\xb0\x11\x2f\xb0\
-\x00\xd6\xb1\x03\x15\xe9\xb0\x03\x10\xb1\x08\x01\x2b\xb1\x07\x14\
-\xe9\xb1\x12\x01\x2b\xb1\x03\x00\x11\x12\xb1\x0d\x0e\x39\x39\xb0\
-\x08\x11\xb1\x05\x0c\x39\x39\xb0\x07\x12\xb1\x0f\x10\x39\x39\x00\
-\xb1\x01\x00\x11\x12\xb1\x03\x0a\x39\x39\x30\x31\x33\x11\x33\x11\
-\x37\x01\x33\x11\x23\x11\x27\x07\x01\x03\x35\x21\x15\xc1\xb0\x47\
-\x02\x19\xfa\xae\x02\x48\xfd\xe7\x6a\x02\xed\x05\x8d\xfb\x02\x9c\
-\x04\x62\xfa\x73\x04\xbc\x42\x9c\xfb\x9e\x06\x48\x85\x85\x00\x00\
-\x02\x00\xa6\x00\x00\x03\xa2\x05\x75\x00\x09\x00\x0d\x00\x59\x00\
-\xb2\x00\x00\x00\x2b\xb0\x06\x33\xb2\x01\x01\x00\x2b\xb0\x04\x33\
-\xb0\x0a\x2f\xb1\x0b\x08\xe9\x01\xb0\x0e\x2f\xb0\x00\xd6\xb1\x03\
-\x11\xe9\xb0\x03\x10\xb1\x07\x01\x2b\xb1\x06\x11\xe9\xb1\x0f\x01\
-\x2b\xb1\x03\x00\x11\x12\xb1\x0a\x0b\x39\x39\xb0\x07\x11\xb1\x04\
-\x09\x39\x39\xb0\x06\x12\xb1\x0c\x0d\x39\x39\x00\xb1\x01\x00\x11\
-\x12\xb1\x03\x08\x39\x39\x30\x31\x33\x11\x33\x11\x01\x33\x11\x23\
-\x11\x01\x03\x35\x21\x15\xa6\x99\x01\x82\xe1\x9a\xfe\x7f\xbe\x02\
-\xb6\x03\x8f\xfd\x00\x03\x00\xfc\x71\x03\x00\xfd\x00\x04\xf2\x83\
-\x83\x00\x00\x00\x03\x00\xc1\x00\x00\x04\xcb\x06\xcb\x00\x0c\x00\
-\x10\x00\x14\x00\x6b\x00\xb2\x00\x00\x00\x2b\xb0\x07\x33\xb2\x01\
-\x02\x00\x2b\xb0\x05\x33\xb0\x0d\x2f\xb0\x11\x33\xb1\x0e\x04\xe9\
-\xb0\x12\x32\x01\xb0\x15\x2f\xb0\x00\xd6\xb1\x03\x15\xe9\xb0\x03\
-\x10\xb1\x0d\x01\x2b\xb1\x10\x0e\xe9\xb0\x10\x10\xb1\x11\x01\x2b\
-\xb1\x14\x0e\xe9\xb0\x14\x10\xb1\x08\x01\x2b\xb1\x07\x14\xe9\xb1\
-\x16\x01\x2b\xb1\x10\x0d\x11\x12\xb0\x0c\x39\xb1\x14\x11\x11\x12\
-\xb0\x05\x39\x00\xb1\x01\x00\x11\x12\xb1\x03\x0a\x39\x39\x30\x31\
-\x33\x11\x33\x11\x37\x01\x33\x11\x23\x11\x27\x07\x01\x03\x35\x33\
-\x15\x33\x35\x33\x15\xc1\xb0\x47\x02\x19\xfa\xae\x02\x48\xfd\xe7\
-\x16\xb8\xd6\xb8\x05\x8d\xfb\x02\x9c\x04\x62\xfa\x73\x04\xbc\x42\
-\x9c\xfb\x9e\x06\x14\xb7\xb7\xb7\xb7\x00\x00\x00\x03\x00\xa6\x00\
-\x00\x03\xa2\x05\x48\x00\x09\x00\x0d\x00\x11\x00\x70\x00\xb2\x00\
-\x00\x00\x2b\xb0\x06\x33\xb2\x01\x01\x00\x2b\xb0\x04\x33\xb0\x0a\
-\x2f\xb0\x0e\x33\xb1\x0b\x04\xe9\xb0\x0f\x32\x01\xb0\x12\x2f\xb0\
-\x00\xd6\xb1\x03\x11\xe9\xb3\x0a\x03\x00\x08\x2b\xb1\x0d\x0e\xe9\
-\xb0\x03\x10\xb1\x07\x01\x2b\xb1\x06\x11\xe9\xb3\x11\x06\x07\x08\
-\x2b\xb1\x0e\x0e\xe9\xb0\x0e\x2f\xb1\x11\x0e\xe9\xb1\x13\x01\x2b\
-\xb1\x0d\x0a\x11\x12\xb0\x09\x39\xb1\x11\x0e\x11\x12\xb0\x04\x39\
-\x00\xb1\x01\x00\x11\x12\xb1\x03\x08\x39\x39\x30\x31\x33\x11\x33\
-\x11\x01\x33\x11\x23\x11\x01\x03\x35\x33\x15\x33\x35\x33\x15\xa6\
-\x99\x01\x82\xe1\x9a\xfe\x7f\x84\xb8\xd5\xb8\x03\x8f\xfd\x00\x03\
-\x00\xfc\x71\x03\x00\xfd\x00\x04\x91\xb7\xb7\xb7\xb7\x00\x00\x00\
-\x04\x00\x71\xff\xd3\x05\x6f\x06\xcb\x00\x0b\x00\x16\x00\x1a\x00\
-\x1e\x00\x6a\x00\xb2\x09\x00\x00\x2b\xb1\x0f\x08\xe9\xb2\x03\x02\
-\x00\x2b\xb1\x15\x08\xe9\xb0\x17\x2f\xb0\x1b\x33\xb1\x18\x04\xe9\
-\xb0\x1c\x32\x01\xb0\x1f\x2f\xb0\x00\xd6\xb1\x0d\x0e\xe9\xb0\x0d\
-\x10\xb1\x17\x01\x2b\xb1\x1a\x0e\xe9\xb0\x1a\x10\xb1\x1b\x01\x2b\
-\xb1\x1e\x0e\xe9\xb0\x1e\x10\xb1\x12\x01\x2b\xb1\x06\x0e\xe9\xb1\
-\x20\x01\x2b\xb1\x1b\x1a\x11\x12\xb3\x09\x0f\x15\x03\x24\x17\x39\
-\x00\xb1\x15\x0f\x11\x12\xb1\x06\x00\x39\x39\x30\x31\x13\x10\x00\
-\x21\x20\x00\x11\x10\x00\x21\x20\x00\x12\x10\x12\x33\x32\x00\x11\
-\x10\x00\x23\x22\x27\x35\x33\x15\x33\x35\x33\x15\x71\x01\x7b\x01\
-\x06\x01\x02\x01\x7b\xfe\x81\xff\x00\xfe\xfe\xfe\x83\xb8\xfe\xc9\
-\xc3\x01\x05\xfe\xf2\xba\xb8\x6a\xb8\xd7\xb8\x02\xc3\x01\x3d\x01\
-\xba\xfe\x46\xfe\xc3\xfe\xbe\xfe\x52\x01\xb1\x02\x68\xfd\xe7\xfe\
-\x85\x01\x77\x01\x10\x01\x0c\x01\x4c\xdd\xb7\xb7\xb7\xb7\x00\x00\
-\x04\x00\x3d\xff\xe9\x03\xc1\x05\x48\x00\x0a\x00\x15\x00\x19\x00\
-\x1d\x00\x7d\x00\xb2\x09\x00\x00\x2b\xb1\x0e\x08\xe9\xb2\x03\x01\
-\x00\x2b\xb1\x13\x03\xe9\xb0\x16\x2f\xb0\x1a\x33\xb1\x17\x04\xe9\
-\xb0\x1b\x32\x01\xb0\x1e\x2f\xb0\x00\xd6\xb1\x0b\x0d\xe9\xb0\x0b\
-\x10\xb1\x16\x0b\x2b\xb1\x19\x0e\xe9\xb0\x19\x10\xb1\x10\x01\x2b\
-\xb1\x06\x0d\xe9\xb3\x1d\x06\x10\x08\x2b\xb1\x1a\x0e\xe9\xb0\x1a\
-\x2f\xb1\x1d\x0e\xe9\xb1\x1f\x01\x2b\xb1\x19\x0b\x11\x12\xb1\x09\
-\x0d\x39\x39\xb0\x1a\x11\xb1\x13\x03\x39\x39\xb0\x1d\x12\xb1\x08\
-\x0e\x39\x39\x00\xb1\x13\x0e\x11\x12\xb1\x06\x00\x39\x39\x30\x31\
-\x13\x34\x00\x33\x32\x00\x15\x14\x00\x20\x00\x37\x14\x16\x32\x36\
-\x35\x34\x26\x23\x22\x06\x13\x35\x33\x15\x33\x35\x33\x15\x3d\x01\
-\x09\xb8\xc1\x01\x02\xfe\xf1\xfe\x98\xfe\xf3\xa0\xae\xe6\xae\xae\
-\x73\x71\xb0\x01\xb8\xd5\xb8\x01\xc5\xcf\x01\x1c\xfe\xd7\xc4\xcb\
-\xfe\xf1\x01\x11\xdf\xb4\xb8\xba\xb2\xac\xac\xac\x02\x0c\xb7\xb7\
-\xb7\xb7\x00\x00\x03\x00\x71\xff\xd3\x05\x6f\x05\xba\x00\x0b\x00\
-\x16\x00\x1f\x00\x57\x00\xb2\x09\x00\x00\x2b\xb1\x1c\x08\xe9\xb2\
-\x03\x02\x00\x2b\xb1\x13\x08\xe9\xb4\x0c\x17\x09\x03\x0d\x2b\xb1\
-\x0c\x03\xe9\x01\xb0\x20\x2f\xb0\x00\xd6\xb1\x17\x0e\xe9\xb0\x0c\
-\x32\xb0\x17\x10\xb1\x1f\x01\x2b\xb0\x0d\x32\xb1\x06\x0e\xe9\xb1\
-\x21\x01\x2b\xb1\x1f\x17\x11\x12\xb2\x03\x09\x13\x39\x39\x39\x00\
-\xb1\x0c\x17\x11\x12\xb1\x06\x00\x39\x39\x30\x31\x13\x10\x00\x21\
-\x20\x00\x11\x10\x00\x21\x20\x00\x13\x21\x2e\x04\x23\x22\x02\x0f\
-\x01\x14\x1e\x02\x33\x32\x00\x13\x71\x01\x7b\x01\x06\x01\x02\x01\
-\x7b\xfe\x81\xff\x00\xfe\xfe\xfe\x83\xb8\x03\x8d\x0e\x5a\x67\x7f\
-\x56\x22\xae\xf4\x1d\x06\x37\x69\xb6\x6f\xb0\x01\x06\x10\x02\xc3\
-\x01\x3d\x01\xba\xfe\x46\xfe\xc3\xfe\xbe\xfe\x52\x01\xb1\x01\x9f\
-\x87\xcf\x6a\x44\x10\xfe\xf2\xc5\xc0\x52\xc1\xbc\x7d\x01\x42\x01\
-\x0a\x00\x00\x00\x03\x00\x3d\xff\xe9\x03\xc1\x03\xb0\x00\x0a\x00\
-\x11\x00\x1b\x00\x58\x00\xb2\x09\x00\x00\x2b\xb1\x0e\x08\xe9\xb2\
-\x03\x01\x00\x2b\xb1\x18\x03\xe9\xb4\x12\x0b\x09\x03\x0d\x2b\xb1\
-\x12\x05\xe9\x01\xb0\x1c\x2f\xb0\x00\xd6\xb1\x0b\x0d\xe9\xb0\x12\
-\x32\xb0\x0b\x10\xb1\x11\x01\x2b\xb0\x13\x32\xb1\x06\x0d\xe9\xb1\
-\x1d\x01\x2b\xb1\x11\x0b\x11\x12\xb3\x08\x09\x03\x0e\x24\x17\x39\
-\x00\xb1\x12\x0b\x11\x12\xb1\x06\x00\x39\x39\x30\x31\x13\x34\x00\
-\x33\x32\x00\x15\x14\x00\x20\x00\x37\x06\x16\x33\x32\x36\x37\x25\
-\x21\x2e\x03\x22\x0e\x02\x3d\x01\x09\xb8\xc1\x01\x02\xfe\xf1\xfe\
-\x98\xfe\xf3\xa2\x02\x98\x89\x68\xb1\x08\xfd\xc4\x02\x36\x10\x4f\
-\x5e\x3f\x3e\x3d\x5e\x4f\x01\xc5\xcf\x01\x1c\xfe\xd7\xc4\xcb\xfe\
-\xf1\x01\x11\xc0\x79\xd4\xa1\xac\x73\x54\x75\x2d\x0e\x0e\x2d\x73\
-\x00\x00\x00\x00\x05\x00\x71\xff\xd3\x05\x6f\x06\xcb\x00\x0b\x00\
-\x16\x00\x1f\x00\x23\x00\x27\x00\x83\x00\xb2\x09\x00\x00\x2b\xb1\
-\x1c\x08\xe9\xb2\x03\x02\x00\x2b\xb1\x13\x08\xe9\xb4\x0c\x17\x09\
-\x03\x0d\x2b\xb1\x0c\x03\xe9\xb0\x20\x2f\xb0\x24\x33\xb1\x21\x04\
-\xe9\xb0\x25\x32\x01\xb0\x28\x2f\xb0\x00\xd6\xb1\x17\x0e\xe9\xb0\
-\x0c\x32\xb0\x17\x10\xb1\x20\x01\x2b\xb1\x23\x0e\xe9\xb0\x23\x10\
-\xb1\x24\x01\x2b\xb1\x27\x0e\xe9\xb0\x27\x10\xb1\x1f\x01\x2b\xb0\
-\x0d\x32\xb1\x06\x0e\xe9\xb1\x29\x01\x2b\xb1\x24\x23\x11\x12\xb3\
-\x09\x13\x1c\x03\x24\x17\x39\xb1\x1f\x27\x11\x12\xb0\x1e\x39\x00\
-\xb1\x0c\x17\x11\x12\xb1\x06\x00\x39\x39\x30\x31\x13\x10\x00\x21\
-\x20\x00\x11\x10\x00\x21\x20\x00\x13\x21\x2e\x04\x23\x22\x02\x0f\
-\x01\x14\x1e\x02\x33\x32\x00\x13\x01\x35\x33\x15\x33\x35\x33\x15\
-\x71\x01\x7b\x01\x06\x01\x02\x01\x7b\xfe\x81\xff\x00\xfe\xfe\xfe\
-\x83\xb8\x03\x8d\x0e\x5a\x67\x7f\x56\x22\xae\xf4\x1d\x06\x37\x69\
-\xb6\x6f\xb0\x01\x06\x10\xfd\x18\xb8\xd7\xb8\x02\xc3\x01\x3d\x01\
-\xba\xfe\x46\xfe\xc3\xfe\xbe\xfe\x52\x01\xb1\x01\x9f\x87\xcf\x6a\
-\x44\x10\xfe\xf2\xc5\xc0\x52\xc1\xbc\x7d\x01\x42\x01\x0a\x03\x70\
-\xb7\xb7\xb7\xb7\x00\x00\x00\x00\x05\x00\x3d\xff\xe9\x03\xc1\x05\
-\x48\x00\x0a\x00\x0e\x00\x15\x00\x1f\x00\x23\x00\x87\x00\xb2\x09\
-\x00\x00\x2b\xb1\x12\x08\xe9\xb2\x03\x01\x00\x2b\xb1\x1c\x03\xe9\
-\xb4\x16\x0f\x09\x03\x0d\x2b\xb1\x16\x05\xe9\xb0\x0b\x2f\xb0\x20\
-\x33\xb1\x0c\x04\xe9\xb0\x21\x32\x01\xb0\x24\x2f\xb0\x00\xd6\xb1\
-\x0f\x0d\xe9\xb0\x16\x32\xb3\x0b\x0f\x00\x08\x2b\xb1\x0e\x0e\xe9\
-\xb0\x0f\x10\xb1\x20\x01\x2b\xb1\x23\x0e\xe9\xb3\x15\x23\x20\x08\
-\x2b\xb0\x17\x33\xb1\x06\x0d\xe9\xb1\x25\x01\x2b\xb1\x0e\x0f\x11\
-\x12\xb0\x09\x39\xb0\x20\x11\xb3\x03\x12\x1b\x1c\x24\x17\x39\xb0\
-\x23\x12\xb1\x08\x14\x39\x39\x00\xb1\x16\x0f\x11\x12\xb1\x06\x00\
-\x39\x39\x30\x31\x13\x34\x00\x33\x32\x00\x15\x14\x00\x20\x00\x13\
-\x35\x33\x15\x03\x06\x16\x33\x32\x36\x37\x25\x21\x2e\x03\x22\x0e\
-\x02\x01\x35\x33\x15\x3d\x01\x09\xb8\xc1\x01\x02\xfe\xf1\xfe\x98\
-\xfe\xf3\xa1\xb8\xb7\x02\x98\x89\x68\xb1\x08\xfd\xc4\x02\x36\x10\
-\x4f\x5e\x3f\x3e\x3d\x5e\x4f\x01\x76\xb8\x01\xc5\xcf\x01\x1c\xfe\
-\xd7\xc4\xcb\xfe\xf1\x01\x11\x03\x97\xb7\xb7\xfd\x29\x79\xd4\xa1\
-\xac\x73\x54\x75\x2d\x0e\x0e\x2d\x73\x02\x0e\xb7\xb7\x00\x00\x00\
-\x03\x00\x66\xff\xd3\x04\x93\x06\xcb\x00\x24\x00\x28\x00\x2c\x00\
-\x9b\x00\xb2\x22\x00\x00\x2b\xb1\x0b\x08\xe9\xb2\x1c\x02\x00\x2b\
-\xb1\x15\x08\xe9\xb4\x10\x11\x22\x1c\x0d\x2b\xb1\x10\x03\xe9\xb0\
-\x25\x2f\xb0\x29\x33\xb1\x26\x04\xe9\xb0\x2a\x32\x01\xb0\x2d\x2f\
-\xb0\x25\xd6\xb1\x28\x0e\xe9\xb0\x28\x10\xb1\x29\x01\x2b\xb1\x2c\
-\x0e\xe9\xb0\x2c\x10\xb1\x0f\x01\x2b\xb0\x12\x32\xb1\x1f\x0e\xe9\
-\xb2\x0f\x1f\x0a\x2b\xb3\x40\x0f\x10\x09\x2b\xb1\x2e\x01\x2b\xb1\
-\x28\x25\x11\x12\xb1\x06\x08\x39\x39\xb0\x29\x11\xb4\x09\x15\x1c\
-\x22\x0b\x24\x17\x39\xb1\x0f\x2c\x11\x12\xb1\x0e\x13\x39\x39\x00\
-\xb1\x10\x0b\x11\x12\xb0\x01\x39\xb0\x11\x11\xb0\x1f\x39\xb0\x15\
-\x12\xb0\x18\x39\xb0\x1c\x11\xb0\x19\x39\x30\x31\x3f\x01\x1e\x08\
-\x33\x32\x3e\x01\x37\x21\x35\x21\x26\x00\x23\x22\x06\x07\x27\x3e\
-\x01\x33\x20\x00\x11\x10\x00\x21\x22\x26\x13\x35\x33\x15\x33\x35\
-\x33\x15\x66\x0d\x06\x3b\x0a\x36\x14\x33\x25\x3a\x3b\x23\x89\xdb\
-\x73\x0a\xfd\x3e\x02\xc2\x0e\xfe\xf1\xc4\x6d\x95\x5c\x1d\x75\xa1\
-\x7f\x01\x0e\x01\x73\xfe\x86\xfe\xdb\x7f\xa0\x09\xb8\xd5\xb8\x44\
-\x8f\x04\x25\x08\x1f\x06\x15\x04\x0c\x02\xac\xfa\x8b\x7f\xe3\x01\
-\x4e\x35\x37\xaa\x2b\x1a\xfe\x3c\xfe\xd1\xfe\xcf\xfe\x3d\x2f\x06\
-\x12\xb7\xb7\xb7\xb7\x00\x00\x00\x03\x00\x39\xff\xe9\x03\x44\x05\
-\x48\x00\x20\x00\x24\x00\x28\x00\x81\x00\xb2\x1f\x00\x00\x2b\xb1\
-\x03\x08\xe9\xb2\x19\x01\x00\x2b\xb1\x0c\x08\xe9\xb4\x08\x07\x1f\
-\x19\x0d\x2b\xb1\x08\x05\xe9\xb0\x21\x2f\xb0\x25\x33\xb1\x22\x04\
-\xe9\xb0\x26\x32\x01\xb0\x29\x2f\xb0\x21\xd6\xb1\x24\x0e\xe9\xb0\
-\x24\x10\xb1\x25\x01\x2b\xb1\x28\x0e\xe9\xb1\x2a\x01\x2b\xb1\x24\
-\x21\x11\x12\xb3\x08\x0e\x11\x07\x24\x17\x39\xb0\x25\x11\xb1\x19\
-\x0c\x39\x39\xb0\x28\x12\xb2\x05\x09\x06\x39\x39\x39\x00\xb1\x07\
-\x03\x11\x12\xb0\x01\x39\xb0\x08\x11\xb0\x1c\x39\xb0\x0c\x12\xb0\
-\x15\x39\xb0\x19\x11\xb0\x16\x39\x30\x31\x3f\x01\x16\x37\x32\x36\
-\x37\x21\x35\x21\x2e\x01\x23\x22\x0e\x05\x0f\x01\x27\x3e\x01\x33\
-\x32\x12\x15\x14\x02\x23\x26\x03\x35\x33\x15\x33\x35\x33\x15\x39\
-\x0b\xa4\x9f\x68\xab\x0a\xfe\x10\x01\xe6\x17\x8d\x73\x1d\x35\x25\
-\x2f\x12\x31\x07\x1c\x1b\x18\x58\x81\x64\xcd\xf6\xfe\xbf\xb2\x31\
-\xb8\xd6\xb8\x52\x89\x6f\x01\x9d\xb0\x73\x6d\x93\x06\x02\x13\x04\
-\x1a\x02\x11\x12\x87\x35\x25\xfe\xd7\xbe\xc7\xfe\xe7\x01\x04\xa7\
-\xb7\xb7\xb7\xb7\x00\x00\x00\x00\x02\x00\x1d\x00\x00\x05\x37\x06\
-\xcd\x00\x18\x00\x1c\x00\x2c\x00\xb2\x13\x00\x00\x2b\xb1\x14\x08\
-\xe9\xb2\x00\x02\x00\x2b\xb0\x07\x33\xb0\x19\x2f\xb1\x1a\x08\xe9\
-\x01\xb0\x1d\x2f\xb1\x1e\x01\x2b\x00\xb1\x00\x14\x11\x12\xb0\x04\
-\x39\x30\x31\x13\x33\x00\x12\x17\x36\x13\x01\x33\x01\x0e\x05\x07\
-\x06\x2b\x01\x35\x33\x32\x36\x37\x01\x35\x21\x15\x1d\xc2\x01\x27\
-\xdf\x0f\x0a\x71\x01\x24\xa4\xfe\x7b\x02\x35\x15\x37\x29\x3d\x21\
-\x56\x94\x6a\x7d\x54\x58\x23\xfe\x99\x02\xf0\x05\x8d\xfd\xdf\xfe\
-\x38\x50\x5e\x01\x15\x02\xc6\xfc\x67\x06\x7d\x2d\x6f\x3b\x48\x17\
-\x3b\x85\x35\x32\x05\x5c\x85\x85\x00\x00\x00\x00\x02\x00\x1d\xfe\
-\x5c\x03\x91\x05\x75\x00\x19\x00\x1d\x00\x32\x00\xb2\x00\x01\x00\
-\x2b\xb0\x07\x33\xb0\x0c\x2f\xb1\x11\x05\xe9\xb0\x1a\x2f\xb1\x1b\
-\x08\xe9\x01\xb0\x1e\x2f\xb1\x1f\x01\x2b\x00\xb1\x11\x0c\x11\x12\
-\xb0\x0e\x39\xb0\x00\x11\xb1\x05\x0f\x39\x39\x30\x31\x13\x33\x1a\
-\x01\x16\x17\x36\x01\x33\x01\x0e\x01\x23\x22\x2f\x01\x16\x33\x32\
-\x36\x37\x36\x37\x36\x34\x27\x01\x35\x21\x15\x1d\xa1\x83\x84\x16\
-\x0c\x04\x01\x0d\x99\xfe\x44\x3b\x67\x4a\x54\x41\x0a\x6d\x28\x37\
-\x38\x39\x0e\x09\x08\x0a\xfe\xe1\x02\xb8\x03\x8f\xfe\xd3\xfe\xac\
-\x58\x50\x8f\x02\x9a\xfb\xb9\x89\x63\x11\x85\x23\x50\x8b\x23\x14\
-\x12\x1d\x15\x04\xcd\x83\x83\x00\x03\x00\x1d\x00\x00\x05\x37\x06\
-\xcb\x00\x18\x00\x1c\x00\x20\x00\x4e\x00\xb2\x13\x00\x00\x2b\xb1\
-\x14\x08\xe9\xb2\x00\x02\x00\x2b\xb0\x07\x33\xb0\x19\x2f\xb0\x1d\
-\x33\xb1\x1a\x04\xe9\xb0\x1e\x32\x01\xb0\x21\x2f\xb0\x19\xd6\xb1\
-\x1c\x0e\xe9\xb0\x1c\x10\xb1\x1d\x01\x2b\xb1\x20\x0e\xe9\xb1\x22\
-\x01\x2b\xb1\x1d\x1c\x11\x12\xb1\x04\x18\x39\x39\x00\xb1\x00\x14\
-\x11\x12\xb0\x04\x39\x30\x31\x13\x33\x00\x12\x17\x36\x13\x01\x33\
-\x01\x0e\x05\x07\x06\x2b\x01\x35\x33\x32\x36\x37\x01\x35\x33\x15\
-\x33\x35\x33\x15\x1d\xc2\x01\x27\xdf\x0f\x0a\x71\x01\x24\xa4\xfe\
-\x7b\x02\x35\x15\x37\x29\x3d\x21\x56\x94\x6a\x7d\x54\x58\x23\xfe\
-\xf0\xb8\xd5\xb8\x05\x8d\xfd\xdf\xfe\x38\x50\x5e\x01\x15\x02\xc6\
-\xfc\x67\x06\x7d\x2d\x6f\x3b\x48\x17\x3b\x85\x35\x32\x05\x28\xb7\
-\xb7\xb7\xb7\x00\x03\x00\x1d\xfe\x5c\x03\x91\x05\x48\x00\x19\x00\
-\x1d\x00\x21\x00\x68\x00\xb2\x00\x01\x00\x2b\xb0\x07\x33\xb0\x0c\
-\x2f\xb1\x11\x05\xe9\xb0\x1a\x2f\xb0\x1e\x33\xb1\x1b\x04\xe9\xb0\
-\x1f\x32\x01\xb0\x22\x2f\xb0\x1a\xd6\xb1\x1d\x0e\xe9\xb0\x1d\x10\
-\xb1\x1e\x01\x2b\xb1\x21\x0e\xe9\xb1\x23\x01\x2b\xb1\x1d\x1a\x11\
-\x12\xb2\x01\x11\x0c\x39\x39\x39\xb0\x1e\x11\xb4\x06\x14\x05\x18\
-\x17\x24\x17\x39\xb0\x21\x12\xb0\x07\x39\x00\xb1\x11\x0c\x11\x12\
-\xb0\x0e\x39\xb0\x00\x11\xb1\x05\x0f\x39\x39\x30\x31\x13\x33\x1a\
-\x01\x16\x17\x36\x01\x33\x01\x0e\x01\x23\x22\x2f\x01\x16\x33\x32\
-\x36\x37\x36\x37\x36\x34\x27\x03\x35\x33\x15\x33\x35\x33\x15\x1d\
-\xa1\x83\x84\x16\x0c\x04\x01\x0d\x99\xfe\x44\x3b\x67\x4a\x54\x41\
-\x0a\x6d\x28\x37\x38\x39\x0e\x09\x08\x0a\xe5\xb8\xd7\xb8\x03\x8f\
-\xfe\xd3\xfe\xac\x58\x50\x8f\x02\x9a\xfb\xb9\x89\x63\x11\x85\x23\
-\x50\x8b\x23\x14\x12\x1d\x15\x04\x6c\xb7\xb7\xb7\xb7\x00\x00\x00\
-\x03\x00\x1d\x00\x00\x05\x37\x06\xcf\x00\x18\x00\x24\x00\x30\x00\
-\x25\x00\xb2\x13\x00\x00\x2b\xb1\x14\x08\xe9\xb2\x00\x02\x00\x2b\
-\xb0\x07\x33\x01\xb0\x31\x2f\xb1\x32\x01\x2b\x00\xb1\x00\x14\x11\
-\x12\xb0\x04\x39\x30\x31\x13\x33\x00\x12\x17\x36\x13\x01\x33\x01\
-\x0e\x05\x07\x06\x2b\x01\x35\x33\x32\x36\x37\x01\x25\x33\x17\x04\
-\x06\x2b\x01\x22\x06\x23\x22\x2d\x01\x33\x17\x04\x06\x2b\x01\x22\
-\x06\x23\x22\x1d\xc2\x01\x27\xdf\x0f\x0a\x71\x01\x24\xa4\xfe\x7b\
-\x02\x35\x15\x37\x29\x3d\x21\x56\x94\x6a\x7d\x54\x58\x23\xfe\xb4\
-\x01\x3f\x8c\x5a\xfe\xe3\x58\x18\x29\x0a\x28\x0a\x23\x01\x44\x01\
-\x41\x8c\x58\xfe\xe3\x58\x19\x26\x0a\x2a\x0a\x23\x05\x8d\xfd\xdf\
-\xfe\x38\x50\x5e\x01\x15\x02\xc6\xfc\x67\x06\x7d\x2d\x6f\x3b\x48\
-\x17\x3b\x85\x35\x32\x05\x28\xbb\x02\x8f\x2a\x02\x02\xbb\x02\x8f\
-\x2a\x02\x00\x00\x03\x00\x1d\xfe\x5c\x03\xba\x05\x1f\x00\x19\x00\
-\x1d\x00\x21\x00\x2b\x00\xb2\x00\x01\x00\x2b\xb0\x07\x33\xb0\x0c\
-\x2f\xb1\x11\x05\xe9\x01\xb0\x22\x2f\xb1\x23\x01\x2b\x00\xb1\x11\
-\x0c\x11\x12\xb0\x0e\x39\xb0\x00\x11\xb1\x05\x0f\x39\x39\x30\x31\
-\x13\x33\x1a\x01\x16\x17\x36\x01\x33\x01\x0e\x01\x23\x22\x2f\x01\
-\x16\x33\x32\x36\x37\x36\x37\x36\x34\x27\x03\x01\x33\x01\x33\x01\
-\x33\x01\x1d\xa1\x83\x84\x16\x0c\x04\x01\x0d\x99\xfe\x44\x3b\x67\
-\x4a\x54\x41\x0a\x6d\x28\x37\x38\x39\x0e\x09\x08\x0a\xe8\x01\x11\
-\x9f\xfe\xcf\xd7\x01\x11\x9f\xfe\xcf\x03\x8f\xfe\xd3\xfe\xac\x58\
-\x50\x8f\x02\x9a\xfb\xb9\x89\x63\x11\x85\x23\x50\x8b\x23\x14\x12\
-\x1d\x15\x03\xef\x01\x0b\xfe\xf5\x01\x0b\xfe\xf5\x00\x00\x00\x00\
-\x03\x00\xc1\x00\x00\x04\xcb\x06\xcb\x00\x0f\x00\x13\x00\x17\x00\
-\x5c\x00\xb2\x0a\x00\x00\x2b\xb2\x01\x02\x00\x2b\xb0\x07\x33\xb4\
-\x0c\x05\x0a\x01\x0d\x2b\xb1\x0c\x06\xe9\xb0\x10\x2f\xb0\x14\x33\
-\xb1\x11\x04\xe9\xb0\x15\x32\x01\xb0\x18\x2f\xb0\x00\xd6\xb1\x03\
-\x0e\xe9\xb0\x03\x10\xb1\x10\x01\x2b\xb1\x13\x0e\xe9\xb0\x13\x10\
-\xb1\x14\x01\x2b\xb1\x17\x0e\xe9\xb0\x17\x10\xb1\x0a\x01\x2b\xb0\
-\x06\x32\xb1\x09\x0e\xe9\xb1\x19\x01\x2b\x00\x30\x31\x13\x11\x33\
-\x11\x14\x17\x21\x11\x33\x11\x23\x11\x21\x22\x27\x26\x13\x35\x33\
-\x15\x33\x35\x33\x15\xc1\xb8\xcf\x01\xcc\xb7\xb7\xfe\x3a\xb8\x79\
-\x5c\xe3\xb8\xd6\xb8\x03\x98\x01\xf5\xfe\x17\xbc\x01\x02\xa6\xfa\
-\x73\x02\x6f\x6a\x50\x02\xeb\xb7\xb7\xb7\xb7\x00\x03\x00\xa6\x00\
-\x00\x03\xa2\x05\x48\x00\x20\x00\x24\x00\x28\x00\xd3\x00\xb2\x12\
-\x00\x00\x2b\xb2\x01\x01\x00\x2b\xb0\x0f\x33\xb4\x14\x0d\x12\x01\
-\x0d\x2b\xb0\x09\x33\xb1\x14\x05\xe9\xb0\x21\x2f\xb0\x25\x33\xb1\
-\x22\x04\xe9\xb0\x26\x32\x01\xb0\x29\x2f\xb0\x00\xd6\xb1\x03\x11\
-\xe9\xb3\x21\x03\x00\x08\x2b\xb1\x24\x0e\xe9\xb0\x03\x10\xb1\x12\
-\x01\x2b\xb0\x0e\x32\xb1\x11\x11\xe9\xb3\x28\x11\x12\x08\x2b\xb1\
-\x25\x0e\xe9\xb0\x25\x2f\xb1\x28\x0e\xe9\xb1\x2a\x01\x2b\xb0\x36\
-\x1a\xba\xec\x5f\xc3\x16\x00\x15\x2b\x0a\xb0\x09\x2e\x0e\xb0\x07\
-\xc0\xb1\x18\x19\xf9\xb0\x1a\xc0\xb0\x07\x10\xb3\x08\x07\x09\x13\
-\x2b\xb0\x1a\x10\xb3\x19\x1a\x18\x13\x2b\xb2\x08\x07\x09\x20\x8a\
-\x20\x8a\x23\x06\x0e\x11\x12\x39\xb2\x19\x1a\x18\x11\x12\x39\x00\
-\xb4\x07\x08\x18\x19\x1a\x2e\x2e\x2e\x2e\x2e\x01\xb5\x07\x08\x09\
-\x18\x19\x1a\x2e\x2e\x2e\x2e\x2e\x2e\xb0\x40\x1a\x01\xb1\x24\x21\
-\x11\x12\xb1\x0a\x17\x39\x39\xb0\x25\x11\xb0\x0b\x39\x00\x30\x31\
-\x13\x11\x33\x11\x14\x1e\x05\x32\x16\x33\x21\x11\x33\x11\x23\x11\
-\x21\x27\x2a\x01\x2e\x04\x27\x2e\x02\x13\x35\x33\x15\x33\x35\x33\
-\x15\xa6\x99\x09\x10\x10\x19\x12\x1d\x0e\x19\x02\x01\x2f\x9a\x9a\
-\xfe\xcd\x12\x10\x0f\x29\x19\x29\x1e\x27\x13\x1d\x1c\x02\x5d\xb8\
-\xd5\xb8\x02\x5c\x01\x33\xfe\xc1\x10\x1b\x13\x10\x08\x06\x04\x02\
-\x01\xa1\xfc\x71\x01\x7b\x02\x06\x06\x0d\x12\x19\x10\x1b\x37\x1c\
-\x02\x52\xb7\xb7\xb7\xb7\x00\x00\x01\x00\xc1\xfe\x71\x03\xfe\x05\
-\x8d\x00\x0c\x00\x3f\x00\xb2\x01\x02\x00\x2b\xb1\x06\x08\xe9\xb0\
-\x0b\x2f\x01\xb0\x0d\x2f\xb0\x00\xd6\xb1\x08\x0e\xe9\xb0\x08\x10\
-\xb1\x0b\x01\x2b\xb1\x0a\x0f\xe9\xb2\x0a\x0b\x0a\x2b\xb3\x40\x0a\
-\x02\x09\x2b\xb1\x0e\x01\x2b\x00\xb1\x06\x0b\x11\x12\xb1\x00\x08\
-\x39\x39\x30\x31\x33\x11\x21\x15\x23\x27\x21\x27\x11\x33\x11\x23\
-\x11\xc1\x03\x3d\x66\x32\xfe\x48\x35\x93\x83\x05\x8d\x87\x02\x02\
-\xfb\x75\xfd\xf2\x01\x8f\x00\x00\x01\x00\xa4\xfe\xb4\x03\x08\x03\
-\x8f\x00\x0a\x00\x32\x00\xb2\x01\x01\x00\x2b\xb1\x04\x07\xe9\x01\
-\xb0\x0b\x2f\xb0\x00\xd6\xb1\x06\x0d\xe9\xb0\x06\x10\xb1\x09\x01\
-\x2b\xb1\x08\x0f\xe9\xb2\x08\x09\x0a\x2b\xb3\x40\x08\x02\x09\x2b\
-\xb1\x0c\x01\x2b\x00\x30\x31\x33\x11\x21\x15\x21\x27\x11\x33\x11\
-\x23\x11\xa4\x02\x64\xfe\x89\x4d\x89\x83\x03\x8f\x7b\x03\xfd\x66\
-\xfe\x37\x01\x4c\x00\x00\x00\x00\x05\x00\xc5\x00\x00\x06\x4e\x06\
-\xcb\x00\x0e\x00\x1d\x00\x21\x00\x25\x00\x29\x00\x88\x00\xb2\x00\
-\x00\x00\x2b\xb0\x26\x33\xb1\x0f\x05\xe9\xb2\x01\x02\x00\x2b\xb0\
-\x27\x33\xb4\x03\x1c\x00\x01\x0d\x2b\xb1\x03\x03\xe9\xb0\x1e\x2f\
-\xb0\x22\x33\xb1\x1f\x04\xe9\xb0\x23\x32\x01\xb0\x2a\x2f\xb0\x00\
-\xd6\xb1\x0f\x14\xe9\xb0\x02\x32\xb0\x0f\x10\xb1\x1e\x01\x2b\xb1\
-\x21\x0e\xe9\xb0\x21\x10\xb1\x13\x01\x2b\xb1\x09\x13\xe9\xb0\x09\
-\x10\xb0\x25\x20\xd6\x11\xb1\x22\x0e\xe9\xb0\x22\x2f\xb1\x25\x0e\
-\xe9\xb0\x09\x10\xb1\x26\x01\x2b\xb1\x29\x0e\xe9\xb1\x2b\x01\x2b\
-\xb1\x21\x1e\x11\x12\xb0\x18\x39\x00\xb1\x1c\x0f\x11\x12\xb1\x09\
-\x13\x39\x39\x30\x31\x33\x11\x33\x11\x21\x32\x1e\x02\x15\x14\x04\
-\x07\x06\x23\x25\x21\x32\x36\x35\x34\x2e\x02\x23\x22\x06\x2b\x01\
-\x07\x13\x35\x33\x15\x33\x35\x33\x15\x13\x11\x33\x11\xc5\xac\x01\
-\x4b\x91\xe0\x79\x3b\xfe\xfe\xb8\x23\x43\xfe\xb0\x01\x22\xd3\xd3\
-\x2d\x5e\xb2\x75\x08\x1f\x08\xe5\x02\xf8\xb8\xd7\xb8\xe6\xb8\x05\
-\x8d\xfd\x96\x50\x7f\x85\x42\x98\xde\x13\x04\x73\xb2\x68\x2d\x5d\
-\x58\x37\x02\x4c\x03\xbc\xb7\xb7\xb7\xb7\xf9\xec\x05\x8d\xfa\x73\
-\x00\x00\x00\x00\x05\x00\xa6\x00\x00\x04\xcc\x05\x48\x00\x0c\x00\
-\x15\x00\x19\x00\x1d\x00\x21\x00\x74\x00\xb2\x00\x00\x00\x2b\xb0\
-\x1e\x33\xb1\x0d\x08\xe9\xb2\x01\x01\x00\x2b\xb0\x1f\x33\xb4\x03\
-\x15\x00\x01\x0d\x2b\xb1\x03\x05\xe9\xb0\x16\x2f\xb0\x1a\x33\xb1\
-\x17\x04\xe9\xb0\x1b\x32\x01\xb0\x22\x2f\xb0\x00\xd6\xb1\x0d\x11\
-\xe9\xb0\x02\x32\xb0\x0d\x10\xb1\x16\x01\x2b\xb1\x19\x0e\xe9\xb0\
-\x19\x10\xb1\x12\x01\x2b\xb1\x07\x0f\xe9\xb0\x1a\x20\xd6\x11\xb1\
-\x1d\x0e\xe9\xb0\x07\x10\xb1\x1e\x01\x2b\xb1\x21\x11\xe9\xb1\x23\
-\x01\x2b\x00\xb1\x15\x0d\x11\x12\xb0\x07\x39\x30\x31\x33\x11\x33\
-\x11\x33\x32\x16\x15\x14\x0e\x02\x23\x27\x33\x32\x37\x36\x34\x26\
-\x2b\x01\x13\x35\x33\x15\x33\x35\x33\x15\x13\x11\x33\x11\xa6\x99\
-\xd8\xc1\xb9\x1e\x4a\x9e\x6e\xde\xb5\xa6\x3f\x29\x87\x89\xb3\x59\
-\xb8\xd5\xb8\x56\x99\x03\x8f\xfe\x9e\xac\x66\x31\x59\x5a\x37\x83\
-\x3e\x29\x6e\x62\x02\xd7\xb7\xb7\xb7\xb7\xfb\x6f\x03\x8f\xfc\x71\
-\x00\x00\x00\x00\x01\x00\x1d\xfe\x44\x05\x37\x05\x8d\x00\x23\x00\
-\x4b\x00\xb2\x00\x00\x00\x2b\xb2\x03\x02\x00\x2b\xb0\x06\x33\xb0\
-\x11\x2f\xb1\x16\x08\xe9\x01\xb0\x24\x2f\xb0\x19\xd6\xb1\x0e\x0e\
-\xe9\xb1\x25\x01\x2b\xb1\x0e\x19\x11\x12\xb0\x07\x39\x00\xb1\x16\
-\x11\x11\x12\xb0\x13\x39\xb0\x00\x11\xb2\x0e\x14\x19\x39\x39\x39\
-\xb0\x03\x12\xb2\x05\x09\x22\x39\x39\x39\x30\x31\x33\x01\x35\x01\
-\x33\x09\x01\x33\x01\x15\x01\x1e\x02\x15\x14\x06\x23\x22\x27\x37\
-\x16\x33\x32\x36\x35\x34\x2e\x05\x27\x09\x01\x1d\x02\x25\xfd\xf7\
-\xd7\x01\x8c\x01\x81\xc4\xfe\x13\x01\xbc\x27\x29\x37\xb8\x9e\x68\
-\x6b\x25\x5a\x4c\x48\x54\x02\x0d\x08\x1f\x16\x3b\x17\xfe\xc3\xfe\
-\x47\x02\xec\x02\x02\x9f\xfd\xea\x02\x16\xfd\x61\x02\xfd\xc8\x33\
-\x3b\x88\x41\x7b\xbe\x2d\x8b\x33\x62\x5e\x19\x1c\x25\x15\x31\x1f\
-\x52\x1e\x01\xb9\xfd\x8f\x00\x00\x01\x00\x00\xfe\x5c\x03\xae\x03\
-\x8f\x00\x22\x00\x51\x00\xb2\x00\x00\x00\x2b\xb2\x0e\x00\x00\x2b\
-\xb2\x03\x01\x00\x2b\xb0\x07\x33\xb0\x12\x2f\xb1\x17\x03\xe9\x01\
-\xb0\x23\x2f\xb0\x1a\xd6\xb1\x0f\x10\xe9\xb1\x24\x01\x2b\xb1\x0f\
-\x1a\x11\x12\xb0\x08\x39\x00\xb1\x17\x12\x11\x12\xb0\x14\x39\xb0\
-\x00\x11\xb2\x0f\x15\x1a\x39\x39\x39\xb0\x03\x12\xb3\x05\x0a\x20\
-\x21\x24\x17\x39\x30\x31\x31\x01\x35\x01\x33\x01\x33\x01\x33\x01\
-\x15\x16\x17\x1e\x01\x15\x14\x06\x23\x22\x27\x37\x16\x33\x32\x36\
-\x35\x34\x2e\x04\x27\x01\x01\x8d\xfe\x7f\xaa\x01\x1b\x02\x01\x10\
-\xaa\xfe\x87\x37\x5b\xc7\x41\xa2\x66\x4a\x4e\x23\x44\x2d\x2f\x48\
-\x09\x0c\x37\x35\x88\x3f\xfe\xd9\x01\xd3\x04\x01\xb8\xfe\xae\x01\
-\x52\xfe\x48\x02\x3d\x65\xdd\x68\x5d\xa4\x91\x15\x87\x1b\x4c\x62\
-\x21\x27\x25\x4a\x43\xaa\x52\xfe\x7f\x00\x00\x00\x01\x00\x1d\x00\
-\x00\x05\x37\x05\x8d\x00\x11\x00\x3d\x00\xb2\x00\x00\x00\x2b\xb0\
-\x0e\x33\xb2\x05\x02\x00\x2b\xb0\x08\x33\xb4\x03\x02\x00\x05\x0d\
-\x2b\xb0\x0c\x33\xb1\x03\x05\xe9\xb0\x0a\x32\x01\xb0\x12\x2f\xb1\
-\x13\x01\x2b\x00\xb1\x02\x00\x11\x12\xb0\x10\x39\xb1\x05\x03\x11\
-\x12\xb0\x07\x39\x30\x31\x33\x01\x21\x35\x21\x01\x33\x09\x01\x33\
-\x01\x21\x15\x21\x01\x23\x09\x01\x1d\x01\xfc\xfe\x20\x01\xdb\xfe\
-\x25\xd7\x01\x8c\x01\x81\xc4\xfe\x3e\x01\xfc\xfe\x06\x02\x16\xd7\
-\xfe\x3c\xfe\x45\x02\xb4\x73\x02\x66\xfd\xea\x02\x16\xfd\x9a\x73\
-\xfd\x4c\x02\x71\xfd\x8f\x00\x00\x01\x00\x00\x00\x00\x03\xae\x03\
-\x8f\x00\x12\x00\x3d\x00\xb2\x00\x00\x00\x2b\xb0\x0f\x33\xb2\x05\
-\x01\x00\x2b\xb0\x09\x33\xb4\x03\x02\x00\x05\x0d\x2b\xb0\x0d\x33\
-\xb1\x03\x05\xe9\xb0\x0b\x32\x01\xb0\x13\x2f\xb1\x14\x01\x2b\x00\
-\xb1\x02\x00\x11\x12\xb0\x11\x39\xb1\x05\x03\x11\x12\xb0\x07\x39\
-\x30\x31\x31\x01\x21\x35\x21\x01\x33\x01\x33\x01\x33\x01\x21\x15\
-\x21\x01\x23\x09\x01\x01\x79\xfe\xae\x01\x18\xfe\xcd\xaa\x01\x1b\
-\x02\x01\x10\xaa\xfe\xd3\x01\x29\xfe\xa2\x01\x83\xaa\xfe\xcd\xfe\
-\xd9\x01\xba\x73\x01\x62\xfe\xae\x01\x52\xfe\x9e\x73\xfe\x46\x01\
-\x81\xfe\x7f\x00\x01\x00\x14\x01\x8b\x02\x35\x02\x04\x00\x03\x00\
-\x00\x13\x35\x21\x15\x14\x02\x21\x01\x8b\x79\x79\x00\x00\x00\x00\
-\x01\x00\x14\x01\x8b\x02\x35\x02\x04\x00\x03\x00\x00\x13\x35\x21\
-\x15\x14\x02\x21\x01\x8b\x79\x79\x00\x00\x00\x00\x01\x00\x00\x01\
-\xf4\x04\x00\x02\x71\x00\x03\x00\x00\x11\x35\x21\x15\x04\x00\x01\
-\xf4\x7d\x7d\x00\x01\x00\x00\x01\xf4\x04\x00\x02\x71\x00\x03\x00\
-\x16\x00\xb0\x00\x2f\xb1\x01\x07\xe9\xb1\x01\x07\xe9\x01\xb0\x04\
-\x2f\xb0\x05\xd6\x00\x30\x31\x11\x35\x21\x15\x04\x00\x01\xf4\x7d\
-\x7d\x00\x00\x00\x01\x00\x00\x01\xf4\x07\xfe\x02\x71\x00\x03\x00\
-\x16\x00\xb0\x00\x2f\xb1\x01\x07\xe9\xb1\x01\x07\xe9\x01\xb0\x04\
-\x2f\xb0\x05\xd6\x00\x30\x31\x11\x35\x21\x15\x07\xfe\x01\xf4\x7d\
-\x7d\x00\x00\x00\x02\x01\x66\xfe\x02\x02\x9a\x05\xfe\x00\x08\x00\
-\x11\x00\x24\x00\x01\xb0\x12\x2f\xb0\x00\xd6\xb4\x06\x0d\x00\x14\
-\x04\x2b\xb0\x06\x10\xb2\x00\x09\x10\x2b\xb4\x0e\x0d\x00\x14\x04\
-\x2b\xb0\x13\xd6\x00\x30\x31\x01\x11\x34\x33\x32\x15\x11\x14\x22\
-\x37\x11\x34\x32\x15\x11\x14\x23\x22\x01\x66\x2b\x27\x52\xe2\x52\
-\x2b\x27\xfe\x3d\x07\x86\x3b\x3b\xf8\x7a\x3b\x3b\x07\x86\x3b\x3b\
-\xf8\x7a\x3b\x00\x01\x00\xc5\x04\x1c\x01\x71\x05\xc8\x00\x07\x00\
-\x00\x13\x35\x37\x13\x33\x03\x33\x15\xc5\x02\x54\x56\x36\x36\x04\
-\x1c\x8e\x1e\x01\x00\xff\x00\xac\x00\x00\x00\x00\x01\x00\xc5\x04\
-\x1d\x01\x71\x05\xc9\x00\x07\x00\x00\x1b\x01\x23\x35\x33\x15\x07\
-\x03\xc5\x35\x35\xac\x02\x54\x04\x1d\x01\x00\xac\x8f\x1d\xff\x00\
-\x00\x00\x00\x00\x01\x00\xc5\xff\x00\x01\x71\x00\xac\x00\x07\x00\
-\x00\x33\x35\x33\x15\x07\x03\x23\x13\xc5\xac\x02\x54\x56\x35\xac\
-\x8f\x1d\xff\x00\x01\x00\x00\x00\x01\x00\xc5\x04\x1a\x01\x71\x05\
-\xc6\x00\x08\x00\x00\x13\x35\x33\x15\x23\x13\x23\x2f\x01\xc5\xac\
-\x36\x36\x56\x4a\x0a\x05\x37\x8f\xac\xff\x00\xde\x20\x00\x00\x00\
-\x02\x00\x27\x04\x1c\x02\x83\x05\xc8\x00\x07\x00\x0f\x00\x00\x13\
-\x35\x37\x13\x33\x03\x33\x15\x21\x35\x37\x13\x33\x03\x33\x15\x27\
-\x02\x54\x56\x36\x36\x01\x04\x02\x54\x56\x36\x36\x04\x1c\x8e\x1e\
-\x01\x00\xff\x00\xac\x8e\x1e\x01\x00\xff\x00\xac\x00\x00\x00\x00\
-\x02\x00\x25\x04\x1d\x02\x81\x05\xc9\x00\x07\x00\x0f\x00\x00\x1b\
-\x01\x23\x35\x33\x15\x07\x03\x21\x13\x23\x35\x33\x15\x07\x03\x25\
-\x35\x35\xac\x02\x54\x01\x5a\x35\x35\xac\x02\x54\x04\x1d\x01\x00\
-\xac\x8f\x1d\xff\x00\x01\x00\xac\x8f\x1d\xff\x00\x00\x00\x00\x00\
-\x02\x00\x25\xff\x00\x02\x81\x00\xac\x00\x07\x00\x0f\x00\x00\x33\
-\x35\x33\x15\x07\x03\x23\x13\x21\x35\x33\x15\x07\x03\x23\x13\x25\
-\xac\x02\x54\x56\x35\x01\x7b\xac\x02\x54\x56\x35\xac\x8f\x1d\xff\
-\x00\x01\x00\xac\x8f\x1d\xff\x00\x01\x00\x00\x00\x02\x00\x25\x04\
-\x1a\x02\x81\x05\xc6\x00\x08\x00\x11\x00\x00\x13\x35\x33\x15\x23\
-\x13\x23\x2f\x01\x25\x35\x33\x15\x23\x13\x23\x2f\x01\x25\xac\x36\
-\x36\x56\x4a\x0a\x01\xae\xac\x36\x36\x56\x4a\x0a\x05\x37\x8f\xac\
-\xff\x00\xde\x20\x1f\x8f\xac\xff\x00\xde\x20\x00\x01\x00\x71\xfe\
-\x44\x03\x1b\x05\xdd\x00\x2d\x00\x50\x00\xb2\x0a\x06\x00\x2b\xb0\
-\x2b\x2f\xb0\x19\x33\xb4\x03\x0b\x00\x27\x04\x2b\xb0\x13\x32\x01\
-\xb0\x2e\x2f\xb0\x20\xd6\xb0\x07\x32\xb1\x1d\x0c\xe9\xb0\x0c\x32\
-\xb0\x2f\xd6\xb1\x1d\x20\x11\x12\xb4\x05\x06\x10\x1b\x29\x24\x17\
-\x39\x00\xb1\x03\x2b\x11\x12\xb5\x06\x10\x11\x16\x1b\x29\x24\x17\
-\x39\xb0\x0a\x11\xb0\x0f\x39\x30\x31\x13\x34\x36\x33\x32\x16\x17\
-\x03\x34\x36\x32\x16\x15\x14\x0e\x01\x07\x3e\x01\x33\x32\x16\x15\
-\x14\x06\x23\x22\x27\x12\x15\x11\x23\x11\x3c\x02\x3e\x04\x37\x06\
-\x23\x22\x26\x71\x29\x2d\x2b\x87\x1d\x1f\x33\x39\x34\x07\x12\x06\
-\x1f\x91\x1d\x2d\x29\x27\x2f\x10\xbd\x1f\xa0\x02\x02\x04\x04\x0a\
-\x06\xbc\x0e\x2f\x29\x03\x8d\x1d\x33\x16\x04\x01\xbc\x35\x29\x27\
-\x35\x29\x5e\xd1\x66\x02\x1a\x33\x1d\x1f\x33\x1d\xfe\x9a\x4a\xfc\
-\x9a\x03\x66\x1f\x47\x11\x2b\x0c\x35\x2b\x69\x39\x1d\x35\x00\x00\
-\x02\x00\x71\xfe\x5c\x03\x1b\x05\xdd\x00\x29\x00\x55\x00\x90\x00\
-\xb2\x27\x02\x00\x2b\xb0\x19\x33\xb4\x03\x0b\x00\x27\x04\x2b\xb0\
-\x13\x32\xb2\x24\x02\x00\x2b\xb2\x34\x06\x00\x2b\xb2\x53\x03\x00\
-\x2b\xb0\x43\x33\xb4\x2d\x0b\x00\x26\x04\x2b\xb0\x3d\x32\xb2\x50\
-\x03\x00\x2b\x01\xb0\x56\x2f\xb0\x22\xd6\xb2\x08\x32\x4e\x32\x32\
-\x32\xb1\x1e\x0c\xe9\xb2\x0e\x38\x48\x32\x32\x32\xb0\x57\xd6\xb1\
-\x1e\x22\x11\x12\xb7\x05\x11\x1b\x25\x2f\x3b\x45\x51\x24\x17\x39\
-\x00\xb1\x03\x27\x11\x12\xb3\x05\x11\x1b\x25\x24\x17\x39\xb0\x53\
-\x11\xb4\x08\x0a\x10\x48\x4a\x24\x17\x39\xb0\x2d\x12\xb3\x2f\x3b\
-\x45\x51\x24\x17\x39\xb0\x34\x11\xb1\x32\x3a\x39\x39\x30\x31\x37\
-\x34\x36\x33\x32\x17\x2e\x01\x35\x34\x37\x32\x1e\x01\x15\x0e\x01\
-\x07\x36\x17\x32\x16\x15\x14\x06\x23\x22\x27\x1e\x01\x15\x14\x07\
-\x22\x35\x3e\x01\x37\x06\x27\x22\x26\x11\x34\x36\x33\x32\x17\x2e\
-\x01\x35\x34\x33\x32\x1e\x01\x15\x0e\x01\x07\x36\x33\x32\x16\x15\
-\x14\x06\x23\x22\x27\x1e\x01\x15\x14\x23\x22\x2e\x01\x35\x3e\x01\
-\x37\x06\x23\x22\x26\x71\x29\x2f\x1b\xaf\x02\x1a\x50\x10\x1f\x21\
-\x02\x1b\x02\xb0\x1d\x2f\x27\x29\x2d\x10\xbd\x04\x1b\x52\x4e\x02\
-\x18\x02\xbc\x0e\x2f\x29\x29\x2f\x0e\xbc\x04\x18\x50\x10\x1f\x21\
-\x02\x1b\x02\xbc\x11\x2f\x27\x29\x2d\x10\xbd\x04\x1b\x52\x10\x1f\
-\x1f\x02\x18\x02\xbc\x0e\x2f\x29\x3b\x1f\x31\x1a\x29\xf5\x2b\x60\
-\x01\x0b\x2d\x25\x44\xe4\x25\x1b\x01\x31\x1f\x1d\x32\x1c\x42\xdd\
-\x26\x66\x01\x5c\x44\xeb\x21\x1d\x01\x34\x03\xde\x1b\x35\x1d\x46\
-\xdd\x23\x66\x0a\x2d\x25\x44\xe7\x25\x1d\x33\x1f\x1d\x33\x1d\x44\
-\xdb\x25\x68\x0a\x2f\x25\x44\xe9\x21\x1d\x33\x00\x01\x00\x71\x00\
-\x73\x03\x8b\x03\x8d\x00\x0b\x00\x34\x00\xb2\x03\x03\x00\x2b\xb4\
-\x09\x0b\x00\x07\x04\x2b\xb2\x03\x03\x00\x2b\xb4\x09\x0b\x00\x07\
-\x04\x2b\x01\xb0\x0c\x2f\xb0\x00\xd6\xb4\x06\x0f\x00\x07\x04\x2b\
-\xb4\x06\x0f\x00\x07\x04\x2b\xb0\x0d\xd6\x00\x30\x31\x13\x34\x36\
-\x33\x32\x16\x15\x14\x06\x23\x22\x26\x71\xe5\xa8\xac\xe1\xed\xa0\
-\xac\xe1\x02\x00\xa2\xeb\xed\xa0\xaa\xe3\xed\x00\x03\x00\xc5\x00\
-\x00\x05\xe4\x00\xac\x00\x03\x00\x07\x00\x0b\x00\x00\x33\x35\x33\
-\x15\x21\x35\x33\x15\x21\x35\x33\x15\xc5\xac\x01\x8d\xac\x01\x8e\
-\xac\xac\xac\xac\xac\xac\xac\x00\x01\x00\x71\xfe\x73\x03\x8b\x05\
-\xc7\x00\x16\x00\x46\x00\xb2\x06\x06\x00\x2b\xb4\x0b\x0a\x00\x19\
-\x04\x2b\xb0\x11\x2f\x01\xb0\x17\x2f\xb0\x13\xd6\xb4\x0c\x0d\x00\
-\x14\x04\x2b\xb0\x0f\x32\xb0\x0c\x10\xb4\x00\x0f\x00\x07\x04\x2b\
-\xb0\x00\x2f\xb0\x18\xd6\xb1\x0c\x13\x11\x12\xb1\x0d\x11\x39\x39\
-\x00\xb1\x0b\x11\x11\x12\xb0\x00\x39\x30\x31\x13\x34\x3e\x02\x33\
-\x21\x32\x15\x06\x2b\x01\x11\x15\x16\x15\x14\x27\x22\x35\x11\x26\
-\x00\x71\x25\x4f\xa2\x6f\x01\x5c\x39\x06\x2d\x77\x02\x29\x2b\xe7\
-\xfe\xc9\x03\xe1\x48\x9a\x9d\x67\x29\x29\xf9\x52\x06\x06\x07\x42\
-\x01\x3b\x03\x46\x12\x01\x08\x00\x07\x00\x71\xff\xc7\x08\xe1\x06\
-\x00\x00\x0a\x00\x17\x00\x2b\x00\x35\x00\x42\x00\x4e\x00\x5b\x00\
-\xd8\x00\xb2\x14\x05\x00\x2b\xb1\x03\x07\xe9\xb0\x1d\x32\xb0\x58\
-\x2f\xb0\x3f\x33\xb1\x46\x07\xe9\xb0\x2e\x32\x01\xb0\x5c\x2f\xb0\
-\x01\xd6\xb1\x0b\x0d\xe9\xb0\x0b\x10\xb2\x01\x18\x10\x2b\xb4\x23\
-\x0d\x00\x14\x04\x2b\xb0\x23\x10\xb2\x18\x11\x10\x2b\xb1\x06\x0d\
-\xe9\xb0\x06\x10\xb2\x11\x2d\x10\x2b\xb1\x36\x0d\xe9\xb0\x36\x10\
-\xb2\x2d\x3c\x10\x2b\xb1\x31\x0d\xe9\xb0\x31\x10\xb2\x3c\x43\x10\
-\x2b\xb1\x4f\x0d\xe9\xb0\x4f\x10\xb5\x36\x3c\x4f\x55\x00\x0f\x2b\
-\xb1\x49\x0d\xe9\xb0\x5d\xd6\xb0\x36\x1a\xb1\x23\x22\x87\x04\xb0\
-\x23\x2e\xb0\x22\xc0\xb1\x1a\x11\xf9\xb0\x1b\xc0\x02\xb3\x1a\x1b\
-\x22\x23\x2e\x2e\x2e\x2e\x01\xb2\x1a\x1b\x22\x2e\x2e\x2e\xb0\x40\
-\x1a\x01\xb1\x23\x18\x11\x12\xb2\x09\x14\x03\x39\x39\x39\xb1\x3c\
-\x36\x11\x12\xb2\x2f\x34\x20\x39\x39\x39\xb1\x55\x4f\x11\x12\xb1\
-\x4c\x46\x39\x39\x00\xb1\x46\x58\x11\x12\xb0\x09\x39\xb0\x14\x11\
-\xb2\x01\x06\x0e\x39\x39\x39\x30\x31\x12\x10\x36\x33\x32\x16\x15\
-\x14\x06\x23\x22\x03\x14\x1f\x01\x3e\x01\x35\x34\x26\x27\x0e\x01\
-\x15\x13\x34\x37\x01\x36\x33\x32\x16\x15\x14\x07\x01\x14\x0e\x03\
-\x23\x22\x26\x24\x10\x36\x32\x16\x15\x14\x06\x23\x22\x03\x14\x1f\
-\x01\x3e\x01\x35\x34\x26\x27\x0e\x01\x15\x21\x34\x36\x33\x32\x16\
-\x15\x14\x06\x23\x22\x26\x37\x14\x1f\x01\x3e\x01\x35\x34\x26\x27\
-\x0e\x01\x15\x71\xb0\x6e\x73\xa8\xa6\x75\x71\x14\x77\x15\x37\x4e\
-\x50\x44\x35\x48\x5e\x13\x03\x7b\x0e\x19\x10\x17\x19\xfc\x9a\x0f\
-\x04\x0c\x0c\x09\x10\x19\x02\x96\xb0\xe1\xa8\xa6\x74\x71\x14\x76\
-\x15\x37\x4e\x50\x44\x35\x47\x02\x10\xa8\x77\x73\xa7\xa6\x74\x71\
-\xae\x9a\x76\x15\x37\x4e\x4e\x43\x35\x4a\x03\xc5\x01\x5c\xdf\xe7\
-\xa8\xa6\xe8\x01\x7f\xdb\x23\x02\x04\x98\x75\x71\x9b\x02\x06\x7f\
-\x89\xfb\x7f\x04\x25\x05\xca\x19\x17\x10\x12\x27\xfa\x58\x02\x13\
-\x06\x0e\x04\x19\xc6\x01\x5c\xdf\xe7\xa8\xa6\xe7\x01\x7f\xdb\x23\
-\x02\x04\x97\x75\x71\x9b\x02\x06\x7f\x89\xa4\xe9\xe7\xa8\xa6\xe7\
-\xe1\x9e\xdb\x23\x02\x04\x97\x75\x71\x9b\x02\x06\x7f\x89\x00\x00\
-\x09\x00\x71\xff\xc7\x0b\xd9\x06\x00\x00\x0a\x00\x17\x00\x2b\x00\
-\x35\x00\x42\x00\x4c\x00\x59\x00\x65\x00\x72\x01\x10\x00\xb2\x14\
-\x05\x00\x2b\xb1\x03\x07\xe9\xb0\x1d\x32\xb0\x56\x2f\xb1\x3f\x6f\
-\x33\x33\xb1\x46\x07\xe9\xb1\x2e\x5d\x32\x32\x01\xb0\x73\x2f\xb0\
-\x01\xd6\xb1\x0b\x0d\xe9\xb0\x0b\x10\xb2\x01\x18\x10\x2b\xb4\x23\
-\x0d\x00\x14\x04\x2b\xb0\x23\x10\xb2\x18\x11\x10\x2b\xb1\x06\x0d\
-\xe9\xb0\x06\x10\xb2\x11\x2d\x10\x2b\xb1\x36\x0d\xe9\xb0\x36\x10\
-\xb2\x2d\x3c\x10\x2b\xb1\x31\x0d\xe9\xb0\x31\x10\xb2\x3c\x44\x10\
-\x2b\xb1\x4d\x0d\xe9\xb0\x4d\x10\xbd\x00\x36\x00\x3c\x00\x4d\x00\
-\x53\x03\xdb\x00\x0f\x2b\xb1\x49\x0d\xe9\xb0\x49\x10\xbd\x00\x31\
-\x00\x44\x00\x49\x00\x5a\x03\xdb\x00\x0f\x2b\xb1\x66\x0d\xe9\xb0\
-\x66\x10\xb5\x36\x3c\x66\x6c\x00\x0f\x2b\xb1\x60\x0d\xe9\xb0\x74\
-\xd6\xb0\x36\x1a\xb1\x23\x22\x87\x04\xb0\x23\x2e\xb0\x22\xc0\xb1\
-\x1a\x11\xf9\xb0\x1b\xc0\x02\xb3\x1a\x1b\x22\x23\x2e\x2e\x2e\x2e\
-\x01\xb2\x1a\x1b\x22\x2e\x2e\x2e\xb0\x40\x1a\x01\xb1\x23\x18\x11\
-\x12\xb2\x09\x14\x03\x39\x39\x39\xb1\x3c\x36\x11\x12\xb2\x2f\x34\
-\x20\x39\x39\x39\xb1\x53\x4d\x11\x12\xb1\x4c\x46\x39\x39\xb1\x6c\
-\x66\x11\x12\xb1\x63\x5d\x39\x39\x00\xb1\x46\x56\x11\x12\xb0\x09\
-\x39\xb0\x14\x11\xb2\x01\x06\x0e\x39\x39\x39\x30\x31\x12\x10\x36\
-\x33\x32\x16\x15\x14\x06\x23\x22\x03\x14\x1f\x01\x3e\x01\x35\x34\
-\x26\x27\x0e\x01\x15\x13\x34\x37\x01\x36\x33\x32\x16\x15\x14\x07\
-\x01\x14\x0e\x03\x23\x22\x26\x24\x10\x36\x32\x16\x15\x14\x06\x23\
-\x22\x03\x14\x1f\x01\x3e\x01\x35\x34\x26\x27\x0e\x01\x15\x04\x10\
-\x36\x33\x32\x16\x15\x14\x06\x22\x03\x14\x1f\x01\x3e\x01\x35\x34\
-\x26\x27\x0e\x01\x15\x21\x34\x36\x33\x32\x16\x15\x14\x06\x23\x22\
-\x26\x37\x14\x1f\x01\x3e\x01\x35\x34\x26\x27\x0e\x01\x15\x71\xb0\
-\x6e\x73\xa8\xa6\x75\x71\x14\x77\x15\x37\x4e\x50\x44\x35\x48\x5e\
-\x13\x03\x7b\x0e\x19\x10\x17\x19\xfc\x9a\x0f\x04\x0c\x0c\x09\x10\
-\x19\x02\x96\xb0\xe1\xa8\xa6\x74\x71\x14\x76\x15\x37\x4e\x50\x44\
-\x35\x47\x02\x37\xae\x71\x73\xa7\xac\xdd\x17\x79\x15\x37\x4e\x50\
-\x44\x35\x4a\x02\x3a\xa8\x77\x73\xa5\xa6\x72\x71\xae\x99\x77\x15\
-\x42\x43\x50\x44\x35\x48\x03\xc5\x01\x5c\xdf\xe7\xa8\xa6\xe8\x01\
-\x7f\xdb\x23\x02\x04\x98\x75\x71\x9b\x02\x06\x7f\x89\xfb\x7f\x04\
-\x25\x05\xca\x19\x17\x10\x12\x27\xfa\x58\x02\x13\x06\x0e\x04\x19\
-\xc6\x01\x5c\xdf\xe7\xa8\xa6\xe7\x01\x7f\xdb\x23\x02\x04\x97\x75\
-\x71\x9b\x02\x06\x7f\x89\xae\x01\x5c\xdf\xe7\xa8\xae\xdf\x01\x7f\
-\xdb\x23\x02\x04\x97\x75\x71\x9b\x02\x06\x7f\x89\xa4\xe9\xe7\xa8\
-\xa6\xe7\xe1\x9e\xdb\x23\x02\x06\xae\x5e\x6f\x9b\x02\x06\x7f\x89\
-\x00\x00\x00\x00\x01\x00\xe1\x00\x00\x02\xa8\x03\x83\x00\x05\x00\
-\x1a\x00\xb2\x05\x02\x00\x2b\x01\xb0\x06\x2f\xb0\x00\xd6\xb4\x02\
-\x0f\x00\x09\x04\x2b\xb0\x07\xd6\x00\x30\x31\x13\x01\x33\x09\x01\
-\x23\xe1\x01\x4a\x7d\xfe\xd9\x01\x27\x7d\x01\xc3\x01\xc0\xfe\x3e\
-\xfe\x3f\x00\x00\x01\x00\xe1\x00\x00\x02\xa8\x03\x83\x00\x05\x00\
-\x25\x00\xb2\x00\x02\x00\x2b\x01\xb0\x06\x2f\xb0\x00\xd6\xb0\x02\
-\x32\xb4\x04\x0f\x00\x09\x04\x2b\xb0\x07\xd6\xb1\x04\x00\x11\x12\
-\xb0\x01\x39\x00\x30\x31\x33\x09\x01\x33\x09\x01\xe1\x01\x27\xfe\
-\xd9\x7d\x01\x4a\xfe\xb6\x01\xc3\x01\xc0\xfe\x3e\xfe\x3f\x00\x00\
-\x05\x00\x71\x00\x00\x04\xbc\x04\x4c\x00\x11\x00\x45\x00\x55\x00\
-\x65\x00\x78\x01\xde\x00\xb2\x53\x02\x00\x2b\xb1\x3d\x44\x33\x33\
-\xb4\x49\x0b\x00\x11\x04\x2b\xb0\x0e\x2f\xb0\x74\x33\xb4\x06\x0b\
-\x00\x11\x04\x2b\xb1\x69\x6c\x32\x32\xb0\x63\x2f\xb4\x59\x0b\x00\
-\x11\x04\x2b\xb1\x24\x2d\x32\x32\x01\xb0\x79\x2f\xb0\x00\xd6\xb1\
-\x12\x1f\x32\x32\xb4\x0b\x0f\x00\x11\x04\x2b\xb0\x0b\x10\xb2\x00\
-\x46\x10\x2b\xb0\x56\x32\xb4\x4e\x0f\x00\x11\x04\x2b\xb0\x5d\x32\
-\xb0\x4e\x10\xb2\x46\x66\x10\x2b\xb4\x72\x0f\x00\x11\x04\x2b\xb1\
-\x2f\x3b\x32\x32\xb0\x7a\xd6\xb0\x36\x1a\xb1\x15\x2b\x87\xb1\x24\
-\x39\x87\xb0\x24\x2e\xb0\x39\xc0\xb1\x1d\x11\xf9\xb0\x3f\xc0\xb3\
-\x1a\x1d\x3f\x13\x2b\xb1\x1d\x3f\x08\xb0\x15\x10\xb3\x1a\x15\x2b\
-\x13\x2b\x05\xb0\x1d\x10\xb3\x1b\x1d\x3f\x13\x2b\xb3\x1c\x1d\x3f\
-\x13\x2b\xb0\x24\x10\xb3\x25\x24\x39\x13\x2b\xb3\x26\x24\x39\x13\
-\x2b\xb3\x28\x24\x39\x13\x2b\xb3\x29\x24\x39\x13\x2b\xb3\x35\x24\
-\x39\x13\x2b\xb1\x24\x39\x08\xb0\x42\x10\xb3\x35\x42\x31\x13\x2b\
-\x05\xb0\x24\x10\xb3\x36\x24\x39\x13\x2b\xb3\x37\x24\x39\x13\x2b\
-\xb3\x38\x24\x39\x13\x2b\xb0\x1d\x10\xb3\x40\x1d\x3f\x13\x2b\xb2\
-\x15\x15\x2b\x0e\x11\x12\x39\xb0\x16\x39\xb0\x17\x39\xb0\x18\x39\
-\xb0\x19\x39\xb0\x2a\x39\xb0\x2b\x39\xb2\x42\x42\x31\x11\x12\x39\
-\xb0\x41\x39\xb0\x32\x39\xb0\x33\x39\xb0\x31\x39\xb0\x34\x39\xb2\
-\x25\x24\x39\x20\x8a\x20\x8a\x23\x06\x0e\x11\x12\x39\xb0\x26\x39\
-\xb0\x28\x39\xb0\x29\x39\xb0\x36\x39\xb0\x37\x39\xb0\x38\x39\xb2\
-\x1b\x1d\x3f\x11\x12\x39\xb0\x1c\x39\xb0\x40\x39\x00\x40\x1c\x19\
-\x1a\x1d\x26\x28\x29\x2a\x2b\x34\x35\x36\x3f\x40\x41\x42\x15\x16\
-\x17\x18\x1b\x1c\x25\x31\x32\x33\x37\x38\x39\x2e\x2e\x2e\x2e\x2e\
-\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\
-\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x01\x40\x1d\x19\x1a\x1d\x26\x28\x29\
-\x2a\x2b\x34\x35\x36\x3f\x40\x41\x42\x15\x16\x17\x18\x1b\x1c\x24\
-\x25\x31\x32\x33\x37\x38\x39\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\
-\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\
-\x2e\x2e\x2e\x2e\xb0\x40\x1a\x01\x00\xb1\x06\x0e\x11\x12\xb0\x6a\
-\x39\x30\x31\x13\x35\x34\x33\x32\x14\x3b\x01\x32\x16\x1d\x01\x14\
-\x2b\x01\x22\x2e\x01\x13\x34\x3e\x04\x37\x01\x26\x00\x27\x26\x35\
-\x34\x36\x3b\x01\x32\x16\x17\x16\x1f\x01\x33\x01\x36\x33\x32\x15\
-\x14\x0e\x02\x07\x09\x01\x1e\x03\x15\x14\x23\x22\x27\x01\x23\x01\
-\x06\x23\x22\x25\x35\x26\x3b\x01\x32\x16\x1d\x01\x06\x07\x06\x2b\
-\x01\x22\x26\x11\x35\x26\x37\x33\x32\x16\x1d\x01\x06\x07\x06\x2b\
-\x01\x22\x26\x01\x35\x34\x33\x17\x32\x3b\x01\x32\x1e\x01\x1d\x01\
-\x14\x2b\x01\x22\x2e\x01\x71\x39\x02\x02\x7d\x29\x1b\x38\x89\x14\
-\x15\x14\x02\x04\x02\x0a\x06\x13\x06\x01\xba\x2b\xfe\x54\x06\x0c\
-\x16\x11\x02\x0e\x2d\x5c\x75\x60\x8e\x02\x01\xbe\x2b\x12\x27\x0a\
-\x08\x19\x04\xfe\x46\x01\xbc\x02\x17\x0a\x0a\x27\x12\x2d\xfe\x44\
-\x02\xfe\x41\x2b\x12\x1f\x01\x9e\x02\x39\x85\x29\x16\x02\x14\x0c\
-\x17\x85\x27\x16\x02\x39\x85\x29\x16\x04\x12\x0c\x17\x85\x27\x16\
-\x01\xa5\x3a\x02\x02\x02\x7d\x17\x16\x14\x35\x89\x14\x17\x15\x01\
-\xe1\x8c\x39\x02\x1f\x1d\x87\x39\x04\x1a\xfe\x61\x08\x0a\x09\x0a\
-\x08\x10\x06\x01\xbd\x29\x01\xac\x0a\x0e\x0f\x10\x17\x27\x5e\x77\
-\x60\x8e\x01\xbf\x2b\x27\x0a\x13\x0a\x17\x04\xfe\x44\xfe\x43\x02\
-\x14\x0c\x13\x0a\x27\x2d\x01\xbd\xfe\x41\x2b\x37\x8c\x39\x1f\x23\
-\x81\x2b\x08\x08\x1c\x03\x6b\x8b\x39\x01\x1f\x21\x81\x2d\x08\x08\
-\x1c\xfe\x77\x8c\x39\x02\x04\x1b\x1b\x89\x39\x04\x1a\x00\x00\x00\
-\x03\x00\x71\x00\x00\x03\x54\x05\xc7\x00\x22\x00\x26\x00\x34\x00\
-\x80\x00\xb2\x23\x02\x00\x2b\xb4\x24\x0b\x00\x18\x04\x2b\xb2\x03\
-\x06\x00\x2b\xb1\x02\x03\x10\x20\xc0\x2f\xb1\x18\x07\xe9\xb0\x33\
-\x32\x01\xb0\x35\x2f\xb0\x17\xd6\xb1\x02\x23\x32\x32\xb1\x27\x0d\
-\xe9\xb0\x05\x32\xb0\x27\x10\xb0\x12\x20\xd6\x11\xb1\x13\x0c\xe9\
-\xb0\x13\x2f\xb1\x12\x0c\xe9\xb0\x17\x10\xb1\x04\x0c\xe9\xb0\x27\
-\x10\xb2\x17\x2e\x10\x2b\xb1\x0a\x0c\xe9\xb0\x36\xd6\xb1\x2e\x27\
-\x11\x12\xb2\x0d\x25\x26\x39\x39\x39\x00\xb1\x18\x24\x11\x12\xb3\
-\x0a\x12\x22\x27\x24\x17\x39\xb0\x02\x11\xb1\x00\x05\x39\x39\x30\
-\x31\x13\x36\x37\x27\x33\x07\x1e\x03\x15\x14\x0e\x02\x07\x06\x15\
-\x07\x23\x35\x34\x36\x35\x03\x22\x0e\x07\x07\x13\x35\x33\x15\x03\
-\x3e\x05\x35\x34\x2e\x02\x27\x07\x71\x8d\x91\x02\xaa\x02\x5c\x7b\
-\x36\x12\x4a\x5c\x6a\x19\x02\x02\xa6\x19\x0b\x04\x1e\x0d\x1e\x11\
-\x21\x18\x23\x23\x12\xed\xac\x0a\x0a\x36\x10\x21\x0a\x0a\x1a\x3a\
-\x12\x19\x02\x04\xe5\x58\x0b\x7f\x85\x10\x49\x5e\x45\x25\x50\x75\
-\x41\x75\x4a\x0c\x17\xd3\x36\x60\x7d\x02\x02\x4e\x06\x02\x07\x06\
-\x0a\x0e\x13\x16\x0f\xfb\x9c\xac\xac\x03\x68\x08\x2e\x0e\x23\x18\
-\x27\x17\x2d\x3d\x23\x08\x09\x38\x00\x00\x00\x00\x01\x00\x00\xfe\
-\x17\x02\xaa\xff\xbc\x00\x19\x00\x32\x00\xb0\x17\x2f\xb1\x0a\x0b\
-\xe9\x01\xb0\x1a\x2f\xb0\x00\xd6\xb4\x05\x0d\x00\x14\x04\x2b\xb0\
-\x05\x10\xb2\x00\x14\x10\x2b\xb0\x1b\xd6\xb1\x05\x00\x11\x12\xb0\
-\x03\x39\xb0\x14\x11\xb0\x17\x39\x00\x30\x31\x15\x34\x36\x33\x32\
-\x1e\x01\x17\x1e\x01\x33\x32\x36\x37\x36\x37\x36\x33\x32\x16\x15\
-\x14\x06\x23\x22\x26\x2b\x17\x10\x08\x06\x0d\x1b\x7c\x52\x66\x86\
-\x0c\x04\x06\x0a\x08\x17\x29\xbe\x96\x93\xc3\xa6\x2b\x37\x1c\x44\
-\x1d\x44\x5b\x85\x54\x31\x0c\x06\x37\x2b\x75\xce\xce\x00\x00\x00\
-\x01\x00\x0a\x03\xd1\x03\xa4\x05\x1d\x00\x0e\x00\x2d\x00\xb0\x0a\
-\x2f\xb1\x03\x07\xe9\x01\xb0\x0f\x2f\xb0\x00\xd6\xb1\x0e\x0c\xe9\
-\xb0\x0e\x10\xb2\x00\x07\x10\x2b\xb1\x06\x0c\xe9\xb0\x10\xd6\xb1\
-\x07\x0e\x11\x12\xb0\x03\x39\x00\x30\x31\x13\x36\x24\x33\x32\x04\
-\x17\x23\x2e\x01\x23\x22\x0e\x01\x07\x0a\x06\x01\x0b\xbc\xc1\x01\
-\x08\x04\xa2\x06\xb6\x71\x44\x7f\x64\x04\x03\xd1\x91\xbb\xc1\x8b\
-\x62\x67\x27\x61\x41\x00\x00\x00\x01\x00\x73\xfe\x02\x03\x8b\x05\
-\xfe\x00\x0f\x00\x38\x00\x01\xb0\x10\x2f\xb0\x11\xd6\xb0\x36\x1a\
-\xb1\x02\x03\x87\x04\xb0\x02\x2e\xb0\x03\xc0\xb1\x0b\x11\xf9\xb0\
-\x0a\xc0\x02\xb3\x02\x03\x0a\x0b\x2e\x2e\x2e\x2e\x01\xb3\x02\x03\
-\x0a\x0b\x2e\x2e\x2e\x2e\xb0\x40\x1a\x01\x00\x30\x31\x13\x34\x37\
-\x01\x36\x33\x32\x16\x15\x14\x07\x01\x06\x23\x22\x26\x73\x06\x02\
-\xba\x17\x1a\x10\x17\x0c\xfd\x4c\x12\x1f\x0e\x19\xfe\x29\x10\x0f\
-\x07\x81\x35\x19\x10\x04\x25\xf8\x8d\x37\x15\x00\x01\x00\x91\xfd\
-\x83\x02\x75\x06\x00\x00\x2a\x00\x39\x00\xb2\x11\x05\x00\x2b\xb1\
-\x0f\x07\xe9\xb0\x25\x2f\xb1\x23\x07\xe9\xb0\x1a\x2f\xb1\x19\x07\
-\xe9\x01\xb0\x2b\x2f\xb0\x2a\xd6\xb0\x0b\x32\xb1\x20\x0c\xe9\xb0\
-\x13\x32\xb0\x2c\xd6\x00\xb1\x19\x1a\x11\x12\xb1\x05\x07\x39\x39\
-\x30\x31\x37\x34\x3e\x03\x37\x2e\x03\x35\x11\x34\x36\x25\x15\x23\
-\x22\x15\x11\x14\x1e\x02\x33\x15\x22\x06\x07\x06\x07\x11\x14\x16\
-\x3b\x01\x15\x22\x2e\x02\x35\x91\x34\x47\x61\x4b\x23\x2f\x62\x71\
-\x48\xd9\x01\x0b\x61\xe3\x44\x6c\x63\x31\x66\xad\x20\x10\x01\x65\
-\x76\x69\x48\x97\xa0\x65\xb8\x4a\x77\x45\x2e\x12\x02\x02\x1f\x43\
-\x88\x5c\x01\xba\x7b\x81\x02\x7d\x83\xfe\x48\x4e\x71\x35\x15\x7e\
-\x52\x50\x25\x44\xfe\x4e\x68\x9c\x7d\x25\x50\xa0\x6c\x00\x00\x00\
-\x01\x00\x6a\xfe\x00\x02\x4e\x06\x00\x00\x27\x00\x39\x00\xb2\x14\
-\x05\x00\x2b\xb1\x15\x07\xe9\xb0\x27\x2f\xb1\x00\x07\xe9\xb0\x09\
-\x2f\xb1\x0a\x07\xe9\x01\xb0\x28\x2f\xb0\x03\xd6\xb0\x0f\x32\xb1\
-\x24\x0c\xe9\xb0\x18\x32\xb0\x29\xd6\x00\xb1\x0a\x09\x11\x12\xb1\
-\x1d\x1f\x39\x39\x30\x31\x13\x33\x32\x35\x11\x34\x2e\x02\x23\x35\
-\x32\x36\x37\x36\x35\x11\x34\x26\x2b\x01\x35\x04\x16\x15\x11\x14\
-\x0e\x02\x07\x1e\x03\x15\x11\x14\x06\x05\x6a\x61\xe3\x44\x6e\x62\
-\x30\x6a\xb1\x1d\x0c\x77\x6c\x61\x01\x0a\xda\x48\x70\x63\x2f\x2f\
-\x63\x70\x48\xd9\xfe\xf5\xfe\x7d\x83\x01\xb8\x4e\x71\x33\x17\x7e\
-\x5d\x50\x25\x37\x01\xb8\x4e\x35\x7d\x02\x81\x7d\xfe\x48\x5c\x88\
-\x43\x1f\x02\x02\x1f\x43\x88\x5c\xfe\x48\x7b\x83\x02\x00\x00\x00\
-\x03\x00\x73\x00\x00\x03\x8b\x06\x00\x00\x0e\x00\x1c\x00\x2a\x00\
-\x7d\x00\xb2\x28\x02\x00\x2b\xb0\x0c\x33\xb4\x20\x0b\x00\x11\x04\
-\x2b\xb0\x1a\x2f\xb4\x12\x0b\x00\x11\x04\x2b\xb0\x05\x32\x01\xb0\
-\x2b\x2f\xb0\x0f\xd6\xb4\x17\x0f\x00\x11\x04\x2b\xb0\x17\x10\xb2\
-\x0f\x1d\x10\x2b\xb4\x25\x0f\x00\x11\x04\x2b\xb0\x2c\xd6\xb0\x36\
-\x1a\xb1\x02\x03\x87\x04\xb0\x02\x2e\xb0\x03\xc0\xb1\x0a\x11\xf9\
-\xb0\x09\xc0\x02\xb3\x02\x03\x09\x0a\x2e\x2e\x2e\x2e\x01\xb3\x02\
-\x03\x09\x0a\x2e\x2e\x2e\x2e\xb0\x40\x1a\x01\xb1\x17\x0f\x11\x12\
-\xb0\x0c\x39\xb1\x25\x1d\x11\x12\xb0\x05\x39\x00\x30\x31\x37\x34\
-\x37\x01\x36\x33\x32\x16\x14\x07\x01\x06\x23\x22\x26\x13\x35\x34\
-\x3b\x01\x32\x16\x1d\x01\x14\x07\x23\x22\x26\x01\x35\x34\x3b\x01\
-\x32\x16\x1d\x01\x14\x2b\x01\x22\x26\x73\x0a\x02\xb2\x1b\x18\x10\
-\x19\x14\xfd\x54\x1b\x16\x10\x17\x27\x37\x85\x21\x21\x3c\x85\x1f\
-\x1e\x01\xcc\x38\x85\x2b\x16\x3b\x85\x27\x17\x29\x08\x19\x05\x7f\
-\x35\x19\x1c\x29\xfa\x8f\x2d\x17\x05\x24\x8a\x39\x14\x25\x85\x3f\
-\x01\x18\xfb\x23\x88\x39\x1d\x20\x84\x3d\x20\x00\x01\x00\x00\xfd\
-\xfe\x02\xaa\xff\xa4\x00\x19\x00\x31\x00\xb0\x10\x2f\xb1\x03\x0b\
-\xe9\x01\xb0\x1a\x2f\xb0\x00\xd6\xb1\x0b\x01\x2b\xb4\x06\x0d\x00\
-\x14\x04\x2b\xb0\x06\x10\xb0\x1b\xd6\xb1\x0b\x00\x11\x12\xb0\x03\
-\x39\xb0\x06\x11\xb0\x09\x39\x00\x30\x31\x11\x34\x36\x33\x32\x16\
-\x15\x14\x06\x23\x22\x2e\x01\x27\x2e\x01\x23\x22\x06\x07\x06\x07\
-\x06\x23\x22\x26\xc1\x95\x93\xc1\x29\x17\x10\x08\x06\x0f\x1d\x7a\
-\x50\x66\x88\x0c\x04\x06\x0c\x04\x19\x29\xfe\x60\x75\xcf\xcf\x75\
-\x2b\x37\x1f\x47\x1f\x3f\x59\x85\x54\x2f\x0d\x08\x35\x00\x00\x00\
-\x02\x00\x87\xff\xc7\x04\xb4\x06\x00\x00\x1a\x00\x21\x00\x6c\x00\
-\xb2\x15\x02\x00\x2b\xb1\x0e\x07\xe9\xb0\x1e\x32\xb2\x18\x02\x00\
-\x2b\xb2\x04\x05\x00\x2b\xb0\x07\x33\xb1\x1f\x07\xe9\xb0\x0d\x32\
-\x01\xb0\x22\x2f\xb0\x01\xd6\xb1\x1b\x0f\xe9\xb0\x1b\x10\xb2\x01\
-\x17\x10\x2b\xb1\x04\x1e\x32\x32\xb4\x16\x0d\x00\x20\x04\x2b\xb1\
-\x06\x0d\x32\x32\xb0\x23\xd6\xb1\x17\x1b\x11\x12\xb0\x19\x39\x00\
-\xb1\x0e\x15\x11\x12\xb0\x12\x39\xb0\x1f\x11\xb3\x01\x00\x0a\x11\
-\x24\x17\x39\xb0\x04\x12\xb0\x09\x39\x30\x31\x12\x10\x00\x37\x33\
-\x35\x33\x15\x16\x17\x07\x2e\x01\x27\x11\x3e\x01\x37\x17\x0e\x01\
-\x07\x15\x23\x35\x27\x26\x03\x14\x12\x17\x11\x06\x02\x87\x01\x65\
-\xf1\x02\x77\xae\x9a\x1f\x58\x79\x58\x71\x6c\x75\x0c\x68\x8e\x68\
-\x77\x02\xf4\xaa\xf4\xac\xa4\xfc\x01\x98\x02\x5e\x01\xaa\x18\x48\
-\x46\x0c\x39\xaa\x37\x2b\x08\xfb\x23\x0a\x25\x4c\x8f\x3d\x30\x04\
-\x0c\x0e\x02\x19\x02\xd7\xf6\xfe\xa6\x1b\x04\xd5\x1b\xfe\xaf\x00\
-\x02\x00\x71\xff\xe9\x04\xe1\x06\x1b\x00\x60\x00\x6d\x01\x44\x00\
-\xb2\x5e\x02\x00\x2b\xb0\x5a\x33\xb1\x63\x07\xe9\xb0\x53\x32\xb2\
-\x32\x05\x00\x2b\xb1\x22\x07\xe9\xb4\x6c\x03\x5e\x22\x0d\x2b\xb0\
-\x55\x33\xb1\x6c\x07\xe9\xb4\x07\x0e\x5e\x22\x0d\x2b\xb0\x41\x33\
-\xb1\x07\x07\xe9\xb0\x48\x32\xb0\x07\x10\xb4\x11\x1b\x5e\x22\x0d\
-\x2b\xb0\x37\x33\xb1\x11\x07\xe9\xb0\x3d\x32\xb0\x11\x10\x01\xb0\
-\x6e\x2f\xb0\x00\xd6\xb1\x61\x0d\xe9\xb0\x61\x10\xb2\x00\x0f\x10\
-\x2b\xb1\x05\x1c\x32\x32\xb1\x41\x0c\xe9\xb1\x36\x4b\x32\x32\xb0\
-\x41\x10\xb2\x0f\x2f\x10\x2b\xb1\x27\x0c\xe9\xb0\x55\x20\xd6\x11\
-\xb1\x56\x0c\xe9\xb0\x6f\xd6\xb0\x36\x1a\xb1\x5c\x5a\x87\xb0\x5a\
-\x2e\xb0\x5c\xc0\xb1\x51\x0b\xf9\xb0\x4d\xc0\xb0\x4d\x10\xb3\x4e\
-\x4d\x51\x13\x2b\xb3\x4f\x4d\x51\x13\x2b\xb3\x50\x4d\x51\x13\x2b\
-\xb0\x5c\x10\xb3\x5b\x5c\x5a\x13\x2b\xb2\x4e\x4d\x51\x20\x8a\x20\
-\x8a\x23\x06\x0e\x11\x12\x39\xb0\x4f\x39\xb0\x50\x39\xb2\x5b\x5c\
-\x5a\x11\x12\x39\x00\xb6\x4d\x5c\x4e\x4f\x50\x51\x5b\x2e\x2e\x2e\
-\x2e\x2e\x2e\x2e\x01\xb7\x4d\x5c\x4e\x4f\x50\x51\x5a\x5b\x2e\x2e\
-\x2e\x2e\x2e\x2e\x2e\x2e\xb0\x40\x1a\x01\xb1\x0f\x61\x11\x12\xb4\
-\x03\x0a\x14\x5e\x6a\x24\x17\x39\xb1\x2f\x41\x11\x12\xb4\x22\x3b\
-\x46\x53\x59\x24\x17\x39\xb0\x55\x11\xb0\x2e\x39\xb0\x27\x12\xb0\
-\x2a\x39\x00\xb1\x6c\x63\x11\x12\xb0\x00\x39\xb0\x03\x11\xb0\x05\
-\x39\xb1\x1b\x11\x11\x12\xb0\x14\x39\xb0\x32\x11\xb1\x27\x2a\x39\
-\x39\x30\x31\x37\x34\x36\x33\x32\x17\x37\x23\x22\x26\x35\x34\x3e\
-\x01\x3b\x01\x35\x23\x22\x26\x35\x34\x3e\x01\x33\x32\x16\x3b\x01\
-\x11\x34\x37\x3e\x01\x33\x32\x1e\x02\x15\x14\x06\x23\x22\x26\x2f\
-\x01\x23\x2e\x01\x23\x22\x07\x06\x15\x11\x33\x32\x16\x15\x14\x07\
-\x06\x2b\x01\x15\x33\x32\x1e\x01\x15\x14\x07\x06\x2b\x01\x06\x07\
-\x1e\x04\x33\x32\x37\x33\x0e\x01\x23\x22\x26\x27\x06\x23\x22\x26\
-\x37\x14\x17\x32\x3e\x03\x3f\x01\x26\x23\x22\x71\x97\x6f\x21\x47\
-\x06\x81\x29\x24\x08\x27\x20\x81\x83\x29\x24\x08\x27\x20\x02\x0d\
-\x04\x6e\x05\x12\xc7\x8d\x60\x90\x45\x21\x2f\x19\x1f\x22\x02\x04\
-\x11\x02\x6c\x46\x62\x3a\x31\xbb\x2d\x22\x2b\x0a\x2d\xa8\xbb\x21\
-\x24\x0a\x2b\x0a\x2d\xaa\x06\x0e\x06\x4e\x41\x5c\x5a\x25\x60\x01\
-\x9f\x04\xbc\x81\x4a\x89\xa6\x6d\x9b\x48\x66\x99\x1d\x0e\x1f\x16\
-\x19\x0e\x07\x06\x39\x23\x38\x77\x4e\x64\x0e\x29\x26\x17\x0c\x19\
-\x1d\xc0\x27\x17\x0c\x18\x1d\x02\x01\x39\x44\x21\x9c\xe1\x67\x97\
-\x85\x34\x31\x25\x23\x11\x12\xb6\x94\x65\x58\x9f\xfe\xbe\x27\x16\
-\x2d\x0f\x04\xc0\x1b\x19\x0c\x2b\x10\x04\x35\x2a\x02\x27\x1c\x25\
-\x15\xc3\x8f\xb1\x32\x4d\x7f\x51\x43\x14\x01\x09\x08\x0e\x0a\x07\
-\x04\x0e\x00\x00\x05\xff\xa6\x00\x00\x06\x3d\x05\x8d\x00\x35\x00\
-\x39\x00\x3c\x00\x40\x00\x43\x00\xe4\x00\xb2\x2c\x02\x00\x2b\xb0\
-\x2f\x33\xb2\x14\x05\x00\x2b\xb0\x17\x33\xb4\x2d\x37\x2c\x14\x0d\
-\x2b\xb2\x05\x22\x3e\x33\x33\x33\xb1\x2d\x07\xe9\xb2\x29\x31\x41\
-\x32\x32\x32\xb4\x3b\x38\x2c\x14\x0d\x2b\xb2\x07\x20\x3d\x33\x33\
-\x33\xb1\x3b\x07\xe9\xb2\x11\x15\x19\x32\x32\x32\x01\xb0\x44\x2f\
-\xb0\x13\xd6\xb1\x06\x30\x32\x32\xb1\x3c\x0c\xe9\xb1\x2e\x36\x32\
-\x32\xb0\x3c\x10\xb2\x13\x42\x10\x2b\xb1\x16\x3f\x32\x32\xb1\x2b\
-\x0c\xe9\xb1\x18\x21\x32\x32\xb0\x45\xd6\xb0\x36\x1a\xb1\x3c\x2c\
-\x87\xb0\x2c\x2e\x04\xb0\x3c\xc0\xb1\x42\x16\xf9\x05\xb0\x14\xc0\
-\xb0\x14\x10\xb3\x15\x14\x42\x13\x2b\xb0\x3c\x10\xb3\x2d\x3c\x2c\
-\x13\x2b\xb3\x37\x3c\x2c\x13\x2b\xb3\x38\x3c\x2c\x13\x2b\xb3\x3b\
-\x3c\x2c\x13\x2b\xb0\x14\x10\xb3\x3d\x14\x42\x13\x2b\xb3\x3e\x14\
-\x42\x13\x2b\xb3\x41\x14\x42\x13\x2b\x03\x00\xb1\x3c\x42\x2e\x2e\
-\x01\x40\x0a\x14\x15\x2c\x2d\x37\x38\x3b\x3d\x3e\x41\x2e\x2e\x2e\
-\x2e\x2e\x2e\x2e\x2e\x2e\x2e\xb0\x40\x1a\x00\x30\x31\x03\x34\x36\
-\x37\x36\x3b\x01\x11\x23\x22\x2e\x01\x35\x34\x36\x37\x36\x3b\x01\
-\x11\x21\x01\x21\x11\x33\x11\x33\x17\x1e\x01\x15\x14\x07\x23\x11\
-\x33\x17\x1e\x01\x15\x14\x2b\x01\x11\x21\x03\x21\x11\x23\x11\x23\
-\x22\x2e\x01\x25\x21\x03\x21\x35\x33\x03\x01\x13\x33\x11\x03\x17\
-\x35\x5a\x21\x16\x0c\x19\xdf\xed\x21\x25\x08\x21\x16\x0c\x19\xdf\
-\x01\x00\x01\x1d\x01\x66\x9e\xdf\x23\x19\x20\x51\xea\xdf\x23\x19\
-\x20\x51\xea\xff\x00\xa4\xfe\x23\xa0\xed\x21\x25\x08\x01\xdb\x01\
-\x9e\x90\xfe\xf2\xcf\xcf\x01\xbe\x8e\x97\x58\x58\x01\x83\x17\x22\
-\x05\x02\x01\x1a\x1d\x16\x0d\x17\x22\x04\x02\x02\x31\xfd\xcf\x02\
-\x31\xfd\xcf\x02\x02\x25\x16\x3f\x01\xfe\xe6\x02\x02\x25\x17\x3f\
-\xfe\xbc\x01\x44\xfe\xbc\x01\x44\x1c\x17\x4c\x01\x1a\x7f\x01\xa2\
-\xfd\xdf\xfe\xe6\x01\x1a\xfe\x67\xb5\xb5\x00\x00\x07\xff\xe1\x00\
-\x00\x07\xb0\x05\x8d\x00\x2e\x00\x32\x00\x37\x00\x3b\x00\x40\x00\
-\x44\x00\x49\x01\xed\x00\xb2\x29\x02\x00\x2b\xb2\x24\x25\x28\x33\
-\x33\x33\xb2\x0b\x05\x00\x2b\xb4\x0a\x0e\x0f\x12\x13\x24\x17\x33\
-\xb4\x2a\x03\x29\x0b\x0d\x2b\xb6\x1d\x30\x31\x38\x39\x42\x43\x24\
-\x17\x33\xb1\x2a\x07\xe9\xb4\x23\x26\x27\x33\x45\x24\x17\x32\xb4\
-\x09\x04\x29\x0b\x0d\x2b\xb6\x1c\x2f\x32\x3a\x3b\x41\x44\x24\x17\
-\x33\xb1\x09\x07\xe9\xb6\x0c\x0d\x10\x11\x14\x3c\x3d\x24\x17\x32\
-\x01\xb0\x4a\x2f\xb0\x26\xd6\xb1\x45\x0d\xe9\xb0\x4b\xd6\xb0\x36\
-\x1a\xb1\x0a\x29\x87\xb0\x0a\x2e\xb0\x30\x2e\xb0\x0a\x10\xb1\x0b\
-\x18\xf9\xb0\x30\x10\xb1\x29\x18\xf9\xb1\x31\x0e\x87\xb0\x31\x2e\
-\x04\xb0\x40\x2e\x05\xb0\x31\x10\xb1\x28\x15\xf9\xb0\x40\x10\xb1\
-\x0e\x15\xf9\xb1\x3e\x25\x87\xb0\x25\x2e\xb0\x0f\x2e\xb0\x25\x10\
-\xb1\x42\x0d\xf9\xb0\x0f\x10\xb1\x3e\x0d\xf9\xb1\x43\x12\x87\xb0\
-\x43\x2e\xb0\x13\x2e\xb0\x43\x10\xb1\x24\x14\xf9\xb0\x13\x10\xb1\
-\x12\x14\xf9\xb0\x0a\x10\xb3\x03\x0a\x29\x13\x2b\xb3\x04\x0a\x29\
-\x13\x2b\xb3\x09\x0a\x29\x13\x2b\xb0\x0b\x10\xb3\x0c\x0b\x30\x13\
-\x2b\xb0\x31\x10\xb3\x0d\x31\x0e\x13\x2b\xb0\x0f\x10\xb3\x10\x0f\
-\x42\x13\x2b\xb0\x43\x10\xb3\x11\x43\x12\x13\x2b\xb0\x24\x10\xb3\
-\x14\x24\x13\x13\x2b\xb3\x1c\x24\x13\x13\x2b\xb3\x1d\x24\x13\x13\
-\x2b\xb3\x23\x24\x13\x13\x2b\xb0\x28\x10\xb3\x27\x28\x40\x13\x2b\
-\xb0\x0a\x10\xb3\x2a\x0a\x29\x13\x2b\xb0\x0b\x10\xb3\x2f\x0b\x30\
-\x13\x2b\xb0\x31\x10\xb3\x32\x31\x0e\x13\x2b\xb0\x28\x10\xb3\x38\
-\x28\x40\x13\x2b\xb0\x3e\x10\xb3\x39\x3e\x25\x13\x2b\xb3\x3a\x3e\
-\x25\x13\x2b\xb0\x28\x10\xb3\x3b\x28\x40\x13\x2b\xb3\x3c\x28\x40\
-\x13\x2b\xb0\x3e\x10\xb3\x3d\x3e\x25\x13\x2b\xb0\x0f\x10\xb3\x41\
-\x0f\x42\x13\x2b\xb0\x43\x10\xb3\x44\x43\x12\x13\x2b\x03\x40\x25\
-\x03\x04\x09\x0a\x0b\x0c\x0d\x0e\x0f\x10\x11\x12\x13\x14\x1c\x1d\
-\x23\x24\x25\x27\x28\x29\x2a\x2f\x30\x31\x32\x38\x39\x3a\x3b\x3c\
-\x3d\x41\x42\x43\x44\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\
-\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\
-\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\xb0\x40\x1a\x00\xb1\x2a\
-\x29\x11\x12\xb1\x35\x47\x39\x39\xb1\x0b\x09\x11\x12\xb0\x3f\x39\
-\x30\x31\x03\x34\x33\x21\x03\x23\x22\x34\x3b\x01\x03\x33\x13\x21\
-\x13\x33\x13\x21\x13\x33\x03\x33\x32\x1e\x01\x15\x14\x07\x23\x03\
-\x21\x32\x15\x14\x23\x21\x03\x23\x03\x21\x03\x23\x03\x21\x22\x2e\
-\x01\x01\x13\x33\x13\x03\x1f\x01\x36\x3f\x01\x21\x03\x21\x37\x33\
-\x02\x27\x06\x01\x13\x33\x13\x03\x1f\x01\x36\x37\x1f\x52\x01\x08\
-\x52\xbc\x4c\x4e\x94\xa4\xb0\xa4\x01\x68\xa2\xa6\xa4\x01\x72\xa4\
-\x94\xa4\x93\x21\x25\x0a\x4c\xbc\x54\x01\x08\x54\x4c\xfe\xcb\x5e\
-\xb2\x5e\xfe\x02\x5f\xa3\x61\xfe\xcd\x1f\x25\x08\x01\xb7\x4b\x87\
-\x4c\xb2\x13\x10\x02\x21\x9f\x01\xb3\x50\xfe\xed\x23\xcb\x5c\x08\
-\x09\x01\x32\x4d\x90\x4e\xbb\x13\x12\x02\x23\x01\x81\x42\x01\x1a\
-\x7f\x02\x31\xfd\xcf\x02\x31\xfd\xcf\x02\x31\xfd\xcf\x1a\x19\x0c\
-\x3f\x01\xfe\xe6\x42\x3d\xfe\xbc\x01\x44\xfe\xbc\x01\x44\x1a\x17\
-\x01\x68\xfe\xe6\x01\x1a\xfe\x67\x52\x63\x17\x9e\x7f\x01\x1a\x7f\
-\x01\x4a\x58\x3e\xfe\x1d\xfe\xe6\x01\x1a\xfe\x67\x56\x5f\x27\x8e\
-\x00\x00\x00\x00\x03\x00\x48\xff\xae\x04\x6d\x05\xfe\x00\x16\x00\
-\x1f\x00\x30\x00\x7a\x00\xb2\x19\x02\x00\x2b\xb4\x1e\x0a\x00\x19\
-\x04\x2b\xb0\x14\x2f\xb1\x23\x07\xe9\xb0\x2c\x2f\xb1\x03\x07\xe9\
-\xb0\x07\x2f\xb0\x0e\x33\xb1\x08\x07\xe9\xb0\x0c\x32\x01\xb0\x31\
-\x2f\xb0\x00\xd6\xb1\x20\x0c\xe9\xb0\x20\x10\xb2\x00\x11\x10\x2b\
-\xb2\x05\x09\x26\x32\x32\x32\xb1\x10\x0c\xe9\xb0\x0b\x32\xb0\x32\
-\xd6\xb1\x20\x00\x11\x12\xb0\x17\x39\xb0\x11\x11\xb3\x03\x08\x07\
-\x14\x24\x17\x39\x00\xb1\x23\x14\x11\x12\xb1\x11\x10\x39\x39\xb0\
-\x2c\x11\xb1\x00\x12\x39\x39\xb0\x03\x12\xb0\x05\x39\x30\x31\x13\
-\x34\x12\x33\x32\x17\x11\x21\x35\x21\x35\x33\x15\x33\x15\x23\x11\
-\x23\x35\x06\x23\x22\x02\x13\x36\x33\x21\x32\x16\x23\x21\x22\x13\
-\x14\x16\x33\x32\x36\x35\x11\x34\x27\x26\x2b\x01\x22\x0e\x02\x48\
-\xd5\x97\x9c\x8d\xfe\x79\x01\x87\x9c\xcf\xcf\xa2\x85\xaa\x98\xc8\
-\x29\x0a\x2f\x03\x8b\x37\x01\x38\xfc\x73\x33\x72\xac\x69\x56\x85\
-\x2b\x42\x56\x04\x31\x60\x5e\x3a\x01\xfc\xcb\x01\x16\x70\x01\x33\
-\x79\xe5\xe5\x79\xfb\x97\x6b\x81\x01\x1d\xfe\x9d\x25\x52\x02\x50\
-\xb6\xa8\x74\x36\x01\x87\x27\x29\x3d\x25\x4b\x90\x00\x00\x00\x00\
-\x01\x00\x00\x00\x00\x05\x7f\x05\x8d\x00\x28\x00\x6a\x00\xb2\x25\
-\x02\x00\x2b\xb4\x1e\x0b\x00\x27\x04\x2b\xb2\x09\x05\x00\x2b\xb4\
-\x0f\x0b\x00\x27\x04\x2b\xb4\x00\x01\x25\x09\x0d\x2b\xb0\x18\x33\
-\xb1\x00\x0b\xe9\xb0\x1a\x32\xb4\x05\x04\x25\x09\x0d\x2b\xb0\x16\
-\x33\xb1\x05\x0b\xe9\xb0\x14\x32\x01\xb0\x29\x2f\xb0\x02\xd6\xb1\
-\x18\x0c\xe9\xb0\x2a\xd6\xb1\x18\x02\x11\x12\xb1\x06\x28\x39\x39\
-\x00\xb1\x00\x1e\x11\x12\xb1\x22\x23\x39\x39\xb1\x0f\x05\x11\x12\
-\xb1\x0b\x0c\x39\x39\x30\x31\x11\x37\x33\x35\x23\x37\x33\x36\x00\
-\x21\x20\x17\x07\x23\x26\x27\x22\x0e\x02\x07\x21\x07\x21\x15\x21\
-\x07\x21\x16\x04\x33\x32\x37\x36\x37\x15\x06\x21\x20\x00\x27\x3f\
-\x9c\xdb\x3f\xb5\x35\x01\x73\x01\x04\x01\x0a\xd5\x40\x02\xac\xf1\
-\x3d\x86\x97\x85\x27\x03\x52\x40\xfc\xcf\x03\x0e\x41\xfd\x52\x3d\
-\x01\x19\xb4\xf4\xdd\x06\x04\xd1\xfe\xf2\xfe\xfc\xfe\x8d\x35\x02\
-\x0c\x94\x4e\x93\xcf\x01\x3d\xbe\x94\xb2\x01\x21\x4c\x98\x68\x93\
-\x4e\x94\xa6\xc6\xb0\x06\x02\xa0\xb8\x01\x3b\xd1\x00\x00\x00\x00\
-\x03\x00\x87\xff\xc7\x05\xae\x06\x00\x00\x18\x00\x1f\x00\x25\x00\
-\x8d\x00\xb2\x15\x02\x00\x2b\xb0\x12\x33\xb1\x1c\x07\xe9\xb0\x20\
-\x32\xb2\x04\x05\x00\x2b\xb0\x07\x33\xb1\x1d\x07\xe9\xb0\x0d\x32\
-\xb4\x24\x0e\x15\x04\x0d\x2b\xb1\x24\x07\xe9\x01\xb0\x26\x2f\xb0\
-\x00\xd6\xb1\x19\x0f\xe9\xb0\x19\x10\xb2\x00\x14\x10\x2b\xb1\x04\
-\x1c\x32\x32\xb4\x13\x0d\x00\x20\x04\x2b\xb2\x06\x0d\x20\x32\x32\
-\x32\xb0\x13\x10\xb2\x14\x22\x10\x2b\xb1\x10\x0c\xe9\xb0\x27\xd6\
-\xb1\x10\x22\x11\x12\xb1\x0a\x09\x39\x39\x00\xb1\x1c\x15\x11\x12\
-\xb0\x10\x39\xb0\x24\x11\xb0\x21\x39\xb1\x1d\x0e\x11\x12\xb3\x00\
-\x0c\x0a\x19\x24\x17\x39\xb0\x04\x11\xb0\x09\x39\x30\x31\x13\x10\
-\x00\x25\x33\x35\x33\x15\x16\x17\x07\x2e\x01\x27\x11\x21\x11\x06\
-\x05\x15\x23\x35\x23\x24\x00\x13\x14\x00\x17\x11\x06\x00\x01\x36\
-\x37\x11\x21\x07\x87\x01\xac\x01\x1d\x02\x77\xec\xe9\x1f\x91\x94\
-\x91\x01\xe5\xe1\xfe\xfc\x77\x02\xfe\xe5\xfe\x52\xb8\x01\x36\xdd\
-\xd5\xfe\xc2\x02\x8a\xb8\x8d\xfe\xbd\x02\x02\xc7\x01\x31\x01\xae\
-\x12\x48\x46\x08\x5a\xaa\x4e\x2d\x0c\xfd\x2f\xfd\xd1\x52\x10\x0c\
-\x0e\x10\x01\xad\x01\x35\xf2\xfe\x9a\x15\x04\xd9\x12\xfe\xa0\xfc\
-\x97\x0e\x27\x01\x58\x3b\x00\x00\x02\x00\x02\x02\xd3\x05\x33\x06\
-\x2d\x00\x16\x00\x49\x00\x5c\x00\xb2\x15\x05\x00\x2b\xb0\x0b\x33\
-\xb1\x03\x07\xe9\x01\xb0\x4a\x2f\xb0\x13\xd6\xb1\x10\x0c\xe9\xb0\
-\x10\x10\xb2\x13\x17\x10\x2b\xb1\x46\x0c\xe9\xb0\x46\x10\xb2\x17\
-\x33\x10\x2b\xb1\x2e\x0c\xe9\xb0\x4b\xd6\xb1\x17\x10\x11\x12\xb1\
-\x07\x19\x39\x39\xb0\x46\x11\xb0\x21\x39\xb0\x33\x12\xb1\x25\x24\
-\x39\x39\xb0\x2e\x11\xb0\x27\x39\x00\xb1\x03\x15\x11\x12\xb0\x2c\
-\x39\x30\x31\x13\x35\x36\x33\x21\x32\x16\x15\x14\x0e\x01\x23\x22\
-\x26\x2b\x01\x11\x14\x22\x35\x11\x23\x22\x01\x11\x35\x3e\x04\x33\
-\x32\x17\x1e\x01\x17\x33\x13\x37\x36\x17\x32\x1f\x02\x11\x14\x23\
-\x22\x35\x11\x0e\x07\x23\x22\x2e\x07\x27\x11\x14\x22\x02\x0c\x4c\
-\x01\xea\x33\x31\x0a\x2d\x25\x06\x15\x04\x89\xa0\xa6\x4e\x02\xbd\
-\x02\x02\x0a\x11\x1e\x13\x1d\x22\x21\x6f\x12\x02\x98\x0c\x23\x1a\
-\x1d\x23\x0e\x04\x52\x50\x0a\x1a\x0d\x12\x0c\x11\x10\x13\x0e\x0c\
-\x13\x10\x0c\x0f\x0a\x12\x0b\x1a\x08\xa0\x05\xba\x0f\x37\x25\x18\
-\x0c\x19\x1d\x02\xfd\xa8\x58\x5a\x02\x56\xfd\xa0\x02\xba\x0a\x08\
-\x0f\x16\x0f\x0a\x16\x3f\xfd\x29\x01\x50\x15\x17\x01\x16\x1b\x1f\
-\xfd\x46\x50\x50\x01\x58\x17\x3d\x1d\x27\x10\x15\x06\x04\x02\x0b\
-\x08\x14\x11\x26\x1b\x37\x15\xfe\xb4\x5c\x00\x00\x02\x00\x54\x00\
-\x00\x06\x52\x05\x8d\x00\x03\x00\x0b\x00\x00\x33\x01\x33\x01\x25\
-\x21\x01\x03\x27\x23\x07\x03\x54\x02\xa2\xba\x02\xa2\xfa\xf2\x03\
-\xf1\xfe\x9e\x7f\x17\x02\x16\x7f\x05\x8d\xfa\x73\xac\x02\xf6\x01\
-\x1c\x40\x44\xfe\xe4\x00\x00\x00\x01\x00\x2b\xff\x29\x04\x2b\x06\
-\x19\x00\x13\x00\x73\x00\xb2\x0b\x06\x00\x2b\xb4\x05\x0a\x00\x19\
-\x04\x2b\xb0\x13\x2f\x01\xb0\x14\x2f\xb0\x00\xd6\xb0\x15\xd6\xb0\
-\x36\x1a\xb0\x26\x1a\x01\xb1\x13\x00\x2e\xc9\x00\xb1\x00\x13\x2e\
-\xc9\xb0\x36\x1a\xb1\x00\x01\x87\xb0\x00\x10\xb0\x01\xc0\xb0\x13\
-\x10\xb0\x12\xc0\xb1\x0c\x0b\x87\x05\xb0\x0b\x2e\x04\xb0\x0c\xc0\
-\xb1\x03\x11\xf9\xb0\x02\xc0\x02\xb4\x01\x02\x03\x0c\x12\x2e\x2e\
-\x2e\x2e\x2e\x01\xb5\x01\x02\x03\x0b\x0c\x12\x2e\x2e\x2e\x2e\x2e\
-\x2e\xb0\x40\x1a\x01\x00\x30\x31\x37\x01\x13\x01\x36\x3b\x01\x32\
-\x15\x14\x2b\x01\x01\x0e\x02\x2b\x01\x03\x07\x2b\x01\x12\x63\x01\
-\x58\x0c\x31\xbb\x3b\x42\xaa\xfe\x63\x04\x0b\x1a\x19\x16\x61\x64\
-\xc1\x01\xe1\xfe\x06\x05\x4e\x23\x27\x2b\xf9\x9b\x14\x15\x10\x01\
-\xf2\xb3\x00\x00\x01\x00\x00\x00\x00\x03\x8f\x03\x8f\x00\x03\x00\
-\x00\x31\x11\x21\x11\x03\x8f\x03\x8f\xfc\x71\x00\x02\x00\x37\x00\
-\x00\x04\xfe\x05\xdd\x00\x18\x00\x2a\x00\x75\x00\xb2\x17\x02\x00\
-\x2b\xb0\x19\x33\xb2\x09\x06\x00\x2b\xb0\x1d\x33\xb1\x0e\x07\xe9\
-\xb0\x22\x32\xb2\x0b\x06\x00\x2b\xb0\x1f\x33\xb1\x0c\x0b\xe9\xb0\
-\x20\x32\xb2\x01\x03\x00\x2b\xb1\x12\x26\x33\x33\xb1\x00\x07\xe9\
-\xb1\x14\x28\x32\x32\x01\xb0\x2b\x2f\xb0\x17\xd6\xb0\x02\x32\xb1\
-\x16\x0d\xe9\xb0\x11\x32\xb0\x16\x10\xb2\x17\x19\x10\x2b\xb1\x2a\
-\x0d\xe9\xb0\x25\x32\xb0\x2c\xd6\xb1\x19\x16\x11\x12\xb3\x09\x0e\
-\x0b\x13\x24\x17\x39\x00\xb1\x0c\x01\x11\x12\xb0\x06\x39\x30\x31\
-\x13\x35\x33\x35\x34\x26\x35\x34\x36\x33\x32\x17\x15\x26\x23\x22\
-\x06\x15\x11\x33\x15\x23\x11\x23\x11\x01\x11\x34\x36\x33\x32\x17\
-\x15\x26\x23\x22\x06\x15\x11\x33\x15\x23\x11\x37\x98\x02\xcf\x89\
-\x4c\x56\x58\x4e\x46\x79\xe8\xe2\x99\x02\x37\xcd\x87\x4c\x58\x58\
-\x4c\x46\x78\xe7\xe1\x03\x17\x78\x96\x08\x21\x08\xbc\xcb\x16\x8a\
-\x23\x52\x68\xfe\xe9\x78\xfc\xe9\x03\x17\xfc\xe9\x04\x56\xbc\xcb\
-\x16\x8a\x23\x52\x68\xfe\xe9\x78\xfc\xe9\x00\x00\x03\x00\x37\x00\
-\x00\x03\xaa\x05\xdd\x00\x15\x00\x19\x00\x1d\x00\x6d\x00\xb2\x14\
-\x02\x00\x2b\xb0\x1a\x33\xb2\x06\x06\x00\x2b\xb1\x0b\x07\xe9\xb2\
-\x17\x06\x00\x2b\xb4\x16\x0b\x00\x18\x04\x2b\xb2\x01\x03\x00\x2b\
-\xb1\x0f\x1b\x33\x33\xb1\x00\x07\xe9\xb0\x11\x32\x01\xb0\x1e\x2f\
-\xb0\x14\xd6\xb0\x02\x32\xb1\x13\x0d\xe9\xb0\x0e\x32\xb0\x13\x10\
-\xb2\x14\x1a\x10\x2b\xb0\x16\x32\xb1\x1d\x0d\xe9\xb0\x18\x32\xb0\
-\x1f\xd6\xb1\x1a\x13\x11\x12\xb3\x06\x0b\x10\x08\x24\x17\x39\x00\
-\xb1\x0b\x16\x11\x12\xb0\x09\x39\x30\x31\x13\x35\x33\x35\x34\x36\
-\x33\x32\x17\x15\x26\x23\x22\x06\x15\x11\x33\x15\x23\x11\x23\x11\
-\x01\x35\x33\x15\x03\x11\x33\x11\x37\x98\xac\x66\x2f\x4a\x46\x33\
-\x31\x4e\xf8\xf2\x99\x02\x2f\xac\xa4\x9a\x03\x17\x78\xcb\xc5\xbe\
-\x16\x8c\x25\x54\x66\xfe\xe9\x78\xfc\xe9\x03\x17\x02\x06\xac\xac\
-\xfa\xe3\x03\x8f\xfc\x71\x00\x00\x02\x00\x37\x00\x00\x03\xa0\x05\
-\xdd\x00\x17\x00\x1b\x00\x62\x00\xb2\x16\x02\x00\x2b\xb0\x18\x33\
-\xb2\x08\x06\x00\x2b\xb0\x19\x33\xb2\x08\x06\x00\x2b\xb1\x09\x0b\
-\xe9\xb2\x06\x06\x00\x2b\xb1\x0b\x07\xe9\xb2\x01\x03\x00\x2b\xb0\
-\x11\x33\xb1\x00\x07\xe9\xb0\x13\x32\x01\xb0\x1c\x2f\xb0\x16\xd6\
-\xb0\x02\x32\xb1\x15\x0d\xe9\xb0\x10\x32\xb0\x15\x10\xb2\x16\x18\
-\x10\x2b\xb1\x1b\x0d\xe9\xb0\x1d\xd6\xb1\x18\x15\x11\x12\xb3\x06\
-\x0b\x12\x08\x24\x17\x39\x00\x30\x31\x13\x35\x33\x35\x34\x36\x33\
-\x32\x17\x15\x26\x23\x22\x0e\x02\x15\x11\x33\x15\x23\x11\x23\x11\
-\x01\x11\x33\x11\x37\x98\xac\x66\x2f\x4a\x46\x33\x14\x25\x2b\x1b\
-\xf8\xf2\x99\x02\x37\x9a\x03\x17\x78\xcb\xc5\xbe\x16\x8a\x23\x0e\
-\x23\x50\x39\xfe\xe9\x78\xfc\xe9\x03\x17\xfc\xe9\x05\xc7\xfa\x39\
-\x00\x00\x00\x00\x04\x00\x37\x00\x00\x05\xe3\x05\xdd\x00\x16\x00\
-\x28\x00\x2c\x00\x30\x00\x9f\x00\xb2\x15\x02\x00\x2b\xb1\x17\x2d\
-\x33\x33\xb2\x06\x06\x00\x2b\xb0\x1b\x33\xb1\x0b\x07\xe9\xb0\x20\
-\x32\xb2\x2a\x06\x00\x2b\xb4\x29\x0b\x00\x18\x04\x2b\xb2\x08\x06\
-\x00\x2b\xb0\x1d\x33\xb1\x09\x0b\xe9\xb0\x1e\x32\xb2\x01\x03\x00\
-\x2b\xb2\x10\x24\x2e\x33\x33\x33\xb1\x00\x07\xe9\xb1\x12\x26\x32\
-\x32\x01\xb0\x31\x2f\xb0\x15\xd6\xb0\x02\x32\xb1\x14\x0d\xe9\xb0\
-\x0f\x32\xb0\x14\x10\xb2\x15\x17\x10\x2b\xb1\x28\x0d\xe9\xb0\x23\
-\x32\xb0\x28\x10\xb5\x14\x17\x28\x2d\x00\x0f\x2b\xb0\x29\x32\xb1\
-\x30\x0d\xe9\xb0\x2b\x32\xb0\x32\xd6\xb1\x17\x14\x11\x12\xb3\x06\
-\x0b\x08\x11\x24\x17\x39\xb1\x2d\x28\x11\x12\xb3\x1b\x20\x25\x1d\
-\x24\x17\x39\x00\x30\x31\x13\x35\x33\x35\x34\x36\x33\x32\x17\x15\
-\x26\x23\x22\x0e\x01\x15\x11\x33\x15\x23\x11\x23\x11\x01\x11\x34\
-\x36\x33\x32\x17\x15\x26\x23\x22\x06\x15\x11\x33\x15\x23\x11\x01\
-\x35\x33\x15\x03\x11\x33\x11\x37\x98\xb8\x7b\x3f\x4c\x4a\x43\x21\
-\x3d\x40\xf8\xf2\x99\x02\x37\xac\x67\x3f\x3b\x42\x36\x31\x4e\xf7\
-\xf1\x01\x95\xac\xa4\x9a\x03\x17\x78\xc7\xbe\xc9\x16\x8a\x23\x14\
-\x5a\x4c\xfe\xe9\x78\xfc\xe9\x03\x17\xfc\xe9\x04\x50\xcf\xbe\x14\
-\x8e\x25\x54\x66\xfe\xe9\x78\xfc\xe9\x05\x1d\xac\xac\xfa\xe3\x03\
-\x8f\xfc\x71\x00\x03\x00\x37\x00\x00\x05\xd9\x05\xdd\x00\x16\x00\
-\x2c\x00\x30\x00\x8d\x00\xb2\x15\x02\x00\x2b\xb1\x17\x2d\x33\x33\
-\xb2\x06\x06\x00\x2b\xb0\x1d\x33\xb1\x0b\x07\xe9\xb0\x22\x32\xb2\
-\x08\x06\x00\x2b\xb1\x1f\x2e\x33\x33\xb1\x09\x0b\xe9\xb0\x20\x32\
-\xb2\x01\x03\x00\x2b\xb1\x10\x28\x33\x33\xb1\x00\x07\xe9\xb1\x12\
-\x2a\x32\x32\x01\xb0\x31\x2f\xb0\x15\xd6\xb0\x02\x32\xb1\x14\x0d\
-\xe9\xb0\x0f\x32\xb0\x14\x10\xb2\x15\x17\x10\x2b\xb1\x2c\x0d\xe9\
-\xb0\x27\x32\xb0\x2c\x10\xb5\x14\x17\x2c\x2d\x00\x0f\x2b\xb1\x30\
-\x0d\xe9\xb0\x32\xd6\xb1\x17\x14\x11\x12\xb3\x06\x0b\x08\x11\x24\
-\x17\x39\xb1\x2d\x2c\x11\x12\xb3\x1d\x22\x29\x1f\x24\x17\x39\x00\
-\x30\x31\x13\x35\x33\x35\x34\x36\x33\x32\x17\x15\x26\x23\x22\x0e\
-\x01\x15\x11\x33\x15\x23\x11\x23\x11\x01\x11\x34\x3e\x02\x33\x32\
-\x17\x15\x26\x23\x22\x0e\x02\x15\x11\x33\x15\x23\x11\x21\x11\x33\
-\x11\x37\x98\xb8\x7b\x3f\x4c\x4a\x43\x21\x3d\x40\xf8\xf2\x99\x02\
-\x37\x35\x58\x5b\x2d\x2f\x49\x3d\x3b\x14\x26\x2b\x1a\xf7\xf1\x01\
-\x9d\x9a\x03\x17\x78\xc7\xbe\xc9\x16\x8a\x23\x14\x5a\x4c\xfe\xe9\
-\x78\xfc\xe9\x03\x17\xfc\xe9\x04\x50\x6d\xa1\x56\x29\x16\x8a\x23\
-\x0e\x23\x50\x39\xfe\xe9\x78\xfc\xe9\x05\xc7\xfa\x39\x00\x00\x00\
-\x01\x00\x00\x00\x00\xb3\x33\xa8\x98\x34\x25\x5f\x0f\x3c\xf5\x00\
-\x1f\x08\x00\x00\x00\x00\x00\xcc\x63\xfd\xa6\x00\x00\x00\x00\xcc\
-\x63\xfd\xa6\xf6\xec\xfd\x2b\x0b\xd9\x07\x4a\x00\x00\x00\x08\x00\
-\x02\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x07\x4a\xfd\x03\x00\
-\x00\x0c\x4d\xf6\xec\xfe\x87\x0b\xd9\x00\x01\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x02\xab\x06\x14\x00\x14\x00\
-\x00\x00\x00\x02\xa9\x00\x00\x02\xa9\x00\x00\x02\x8d\x00\xf0\x04\
-\x00\x01\x02\x06\xa9\x00\x73\x04\x00\x00\x5a\x06\xa9\x00\x71\x06\
-\x10\x00\x54\x02\x39\x00\xcb\x03\x1c\x00\xa4\x03\x1c\x00\x71\x04\
-\x00\x00\x83\x06\x39\x00\x71\x02\x39\x00\xc5\x02\xa9\x00\x14\x02\
-\x39\x00\xc5\x04\x00\x00\x73\x04\x00\x00\x54\x04\x00\x00\xb8\x04\
-\x00\x00\x54\x04\x00\x00\x54\x04\x00\x00\x37\x04\x00\x00\x4e\x04\
-\x00\x00\x56\x04\x00\x00\x54\x04\x00\x00\x54\x04\x00\x00\x56\x02\
-\x39\x00\xc5\x02\x39\x00\xc5\x06\x39\x00\xaa\x06\x39\x00\x73\x06\
-\x39\x00\xaa\x03\xc6\x00\x71\x05\x56\x00\x71\x05\x56\x00\x37\x05\
-\x56\x00\xc5\x05\x1c\x00\x87\x05\xc6\x00\xc3\x04\xc6\x00\xc1\x04\
-\x8d\x00\xc1\x05\x56\x00\x87\x05\xa9\x00\xc1\x02\x39\x00\xc1\x03\
-\xc6\x00\x54\x05\x8d\x00\xc3\x04\x56\x00\xc1\x07\x00\x00\xcd\x05\
-\xa9\x00\xc3\x05\xe3\x00\x71\x05\x1c\x00\xc3\x05\xe3\x00\x71\x05\
-\x2b\x00\xc3\x04\x70\x00\x5a\x05\x70\x00\x48\x05\x7e\x00\xc1\x05\
-\x56\x00\x1d\x07\x8d\x00\x1d\x05\x56\x00\x1d\x05\x56\x00\x04\x04\
-\xe3\x00\x71\x02\x4f\x00\xcd\x04\x00\x00\x73\x02\x4f\x00\x2b\x04\
-\xe3\x01\x10\x06\x39\x00\xac\x04\x00\x00\xc7\x03\xd7\x00\x5a\x04\
-\x22\x00\xa6\x03\x8d\x00\x48\x04\x22\x00\x48\x03\x8d\x00\x46\x02\
-\x70\x00\x37\x04\x00\x00\x37\x04\x22\x00\xa4\x01\xe9\x00\x98\x02\
-\x22\xff\x83\x03\xe9\x00\xaa\x01\xe9\x00\xa6\x06\x5a\x00\xa4\x04\
-\x22\x00\xa4\x04\x00\x00\x3d\x04\x22\x00\xa6\x04\x22\x00\x48\x02\
-\xbc\x00\xa6\x03\x10\x00\x37\x02\xe3\x00\x25\x04\x22\x00\xa4\x03\
-\xb0\x00\x1d\x05\x76\x00\x1d\x03\xb0\x00\x00\x03\xb0\x00\x1d\x03\
-\x7a\x00\x37\x04\x00\x00\x6a\x02\x39\x00\xf2\x04\x00\x00\x6a\x04\
-\xe3\x00\xaa\x02\xa9\x00\x00\x02\x8d\x00\xf0\x04\x00\x00\x48\x05\
-\x1c\x00\x71\x05\x56\xff\xc9\x03\x8d\x00\x5a\x04\x00\x00\xdc\x08\
-\xe3\x00\x71\x03\x8d\x00\x33\x05\x56\x00\xe1\x05\x56\x00\x73\x02\
-\xa9\x00\x14\x08\xe3\x00\x71\x04\x00\x00\x8d\x02\xa9\x00\x71\x06\
-\x39\x00\x73\x04\x00\x01\x85\x04\x22\x00\xa4\x04\xe3\x00\x71\x01\
-\xe3\x00\x96\x03\x8d\x00\xf0\x03\x8d\x00\x33\x05\x56\x00\xcd\x03\
-\xc6\x00\x71\x05\x56\x00\x37\x05\x56\x00\x37\x05\x56\x00\x37\x05\
-\x56\x00\x37\x05\x56\x00\x37\x05\x56\x00\x37\x06\xe3\x00\x37\x05\
-\x1c\x00\x87\x04\xc6\x00\xc1\x04\xc6\x00\xc1\x04\xc6\x00\xc1\x04\
-\xc6\x00\xc1\x02\x39\xff\xdf\x02\x39\x00\x6f\x02\x39\xff\xdf\x02\
-\x39\xff\xfa\x05\xc6\x00\x00\x05\xa9\x00\xc3\x05\xe3\x00\x71\x05\
-\xe3\x00\x71\x05\xe3\x00\x71\x05\xe3\x00\x71\x05\xe3\x00\x71\x06\
-\x39\x00\x71\x05\x7e\x00\xc1\x05\x7e\x00\xc1\x05\x7e\x00\xc1\x05\
-\x7e\x00\xc1\x05\x56\x00\x04\x04\xa9\x00\xc5\x03\xd7\x00\xa6\x03\
-\xd7\x00\x5a\x03\xd7\x00\x5a\x03\xd7\x00\x5a\x03\xd7\x00\x5a\x03\
-\xd7\x00\x5a\x03\xd7\x00\x5a\x05\xc6\x00\x5e\x03\x8d\x00\x48\x03\
-\x8d\x00\x46\x03\x8d\x00\x46\x03\x8d\x00\x46\x03\x8d\x00\x46\x01\
-\xe9\xff\xbd\x01\xe9\x00\x41\x01\xe9\xff\xb7\x02\x5a\x00\x0b\x04\
-\x00\x00\x3d\x04\x22\x00\xa4\x04\x00\x00\x3d\x04\x00\x00\x3d\x04\
-\x00\x00\x3d\x04\x00\x00\x3d\x04\x00\x00\x3d\x06\x39\x00\x73\x04\
-\x00\x00\x3f\x04\x22\x00\xa4\x04\x22\x00\xa4\x04\x22\x00\xa4\x04\
-\x22\x00\xa4\x03\xb0\x00\x1d\x04\x22\x00\xa6\x03\xb0\x00\x1d\x05\
-\x56\x00\x37\x03\xd7\x00\x5a\x05\x56\x00\x37\x03\xd7\x00\x5a\x05\
-\x56\x00\x37\x03\xd7\x00\x5a\x05\x1c\x00\x87\x03\x8d\x00\x48\x05\
-\x1c\x00\x87\x03\x8d\x00\x48\x05\x1c\x00\x87\x03\x8d\x00\x48\x05\
-\x1c\x00\x87\x03\x8d\x00\x48\x05\xc6\x00\xc3\x05\x10\x00\x48\x05\
-\xc6\x00\x00\x04\x22\x00\x48\x04\xc6\x00\xc1\x03\x8d\x00\x46\x04\
-\xc6\x00\xc1\x03\x8d\x00\x46\x04\xc6\x00\xc1\x03\x8d\x00\x46\x04\
-\xc6\x00\xc1\x03\x8d\x00\x46\x05\x56\x00\x87\x04\x00\x00\x37\x05\
-\x56\x00\x87\x04\x00\x00\x37\x05\x56\x00\x87\x04\x00\x00\x37\x05\
-\xa9\x00\xc1\x04\x22\x00\xa4\x04\x83\x00\x21\x02\x39\xff\xac\x01\
-\xe9\xff\x81\x02\x39\x00\xc1\x01\xe9\x00\xa6\x03\xc6\x00\x54\x02\
-\x22\xff\x83\x04\x56\x00\x12\x01\xe9\x00\x46\x04\x56\x00\xc1\x02\
-\xd7\x00\xa6\x05\x00\x00\x9e\x02\x97\x00\x37\x05\xa9\x00\xc3\x04\
-\x22\x00\xa4\x05\xa9\x00\xc3\x04\x22\x00\x85\x05\xe3\x00\x71\x04\
-\x00\x00\x3d\x07\xc6\x00\x37\x06\x39\x00\x3d\x05\x2b\x00\xc3\x02\
-\xbc\x00\xa6\x05\x2b\x00\xc3\x02\xbc\x00\x7b\x04\x70\x00\x5a\x03\
-\x10\x00\x37\x04\x70\x00\x5a\x03\x10\x00\x37\x04\x70\x00\x5a\x03\
-\x10\x00\x37\x04\x70\x00\x5a\x03\x10\x00\x37\x05\x70\x00\x48\x02\
-\xe3\x00\x25\x05\x70\x00\x48\x02\xe3\x00\x25\x05\x7e\x00\xc1\x04\
-\x22\x00\x9f\x05\x7e\x00\xc1\x04\x22\x00\xa4\x05\x7e\x00\xc1\x04\
-\x22\x00\xa4\x05\x7e\x00\xc1\x04\x22\x00\xa4\x05\x56\x00\x04\x04\
-\xe3\x00\x71\x03\x7a\x00\x37\x04\xe3\x00\x71\x03\x7a\x00\x37\x04\
-\xe3\x00\x71\x03\x7a\x00\x37\x04\xf5\x00\x0c\x04\x70\x00\x5a\x03\
-\x10\x00\x37\x05\x70\x00\x48\x02\xe3\x00\x25\x04\x00\x00\xc1\x04\
-\x00\x00\xb4\x04\x00\x00\xa4\x02\x39\x00\xde\x05\x56\x01\xc5\x02\
-\x39\xff\xc5\x04\x00\x00\xaa\x04\x00\x00\xdb\x01\x8d\x00\x1b\x01\
-\x8d\x00\x31\x00\xe3\x00\x21\x02\x39\x00\xb6\x01\x56\xff\xf0\x02\
-\x39\x00\x19\x05\x56\xff\xf0\x02\x39\x00\xc5\x06\x1c\xff\xf0\x07\
-\x00\xff\xf0\x03\x8f\xff\xf0\x06\x8d\xff\xf0\x07\x8f\xff\xf0\x06\
-\x70\xff\xf0\x02\x1c\xff\xb0\x05\x56\x00\x37\x05\x56\x00\xc5\x04\
-\x56\x00\xc1\x06\xa9\x00\x54\x04\xc6\x00\xc1\x04\xe3\x00\x71\x05\
-\xa9\x00\xc1\x06\x39\x00\x71\x02\x39\x00\xc1\x05\x8d\x00\xc3\x04\
-\xe3\x00\x37\x07\x00\x00\xcd\x05\xa9\x00\xc3\x05\x56\x00\x54\x05\
-\xe3\x00\x71\x05\xa9\x00\xc1\x05\x1c\x00\xc3\x05\xc6\x00\x71\x05\
-\x70\x00\x48\x06\x39\x00\x71\x05\xc6\x00\x71\x05\x56\x00\x1d\x06\
-\x39\x00\x71\x05\xc6\x00\x5a\x02\x39\x00\x27\x06\x39\x00\x71\x05\
-\x10\x00\x54\x03\x70\x00\x54\x04\x1c\x00\x37\x02\x1c\x00\x2f\x04\
-\x00\x00\x54\x05\x10\x00\x54\x04\x00\x00\x54\x04\x70\x00\x37\x03\
-\xc6\x00\x4a\x03\x70\x00\x54\x03\xc6\x00\x54\x04\x1c\x00\x37\x04\
-\x00\x00\x54\x02\x39\x00\x54\x03\xdd\x00\x71\x04\x00\x00\x37\x04\
-\x70\x00\x54\x03\xc6\x00\x00\x03\xc6\x00\x54\x04\x39\x00\x54\x04\
-\xa9\x00\x10\x03\xc6\x00\x54\x03\x8d\x00\x52\x04\x8d\x00\x54\x03\
-\xa9\xff\xee\x04\x00\x00\x54\x04\xa9\x00\x54\x04\x70\x00\x54\x04\
-\xa9\x00\x54\x05\x56\x00\x44\x02\x1c\xff\xa6\x04\x00\x00\x54\x04\
-\x39\x00\x54\x04\x00\x00\x54\x05\x56\x00\x44\x04\x00\x00\x54\x04\
-\x00\x00\x44\x04\x00\x00\x64\x06\x39\x00\x48\x04\x00\x00\x71\x04\
-\x8d\x00\xc1\x04\x00\x00\x71\x03\x1c\x00\x71\x05\x1c\x00\x3d\x05\
-\xc6\x00\x56\x04\xc6\x00\xc1\x04\xc6\x00\xc1\x06\x8d\x00\x48\x04\
-\x56\x00\xc1\x05\x1c\x00\x87\x04\x70\x00\x5a\x02\x39\x00\xc1\x02\
-\x39\xff\xfa\x03\xc6\x00\x54\x08\x4b\x00\x27\x08\x2b\x00\xc1\x06\
-\x1c\x00\x48\x05\x8d\x00\xc3\x05\x8d\x00\xc1\x05\x56\x00\x1d\x05\
-\x8d\x00\xc1\x05\x56\x00\x37\x05\x56\x00\xc5\x05\x56\x00\xc5\x04\
-\x56\x00\xc1\x05\xd2\x00\x48\x04\xc6\x00\xc1\x08\xe3\x00\x54\x04\
-\xe3\x00\x66\x05\x8d\x00\xc1\x05\x8d\x00\xc1\x05\x8d\x00\xc3\x05\
-\xb0\x00\x27\x07\x00\x00\xcd\x05\x8d\x00\xc1\x05\xe3\x00\x71\x05\
-\x8d\x00\xc1\x05\x1c\x00\xc3\x05\x1c\x00\x87\x05\x70\x00\x48\x05\
-\x56\x00\x1d\x06\xa9\x00\x71\x05\x56\x00\x1d\x05\xb0\x00\xc1\x05\
-\x8d\x00\xc1\x08\xa9\x00\xc1\x08\xcc\x00\xc1\x06\xf1\x00\x48\x07\
-\x1c\x00\xc5\x05\x56\x00\xc5\x05\x1c\x00\x66\x08\x53\x00\xc1\x05\
-\x2b\x00\x37\x03\xd7\x00\x5a\x04\x00\x00\x3d\x03\xd7\x00\xa6\x03\
-\x3b\x00\xa4\x04\x4f\x00\x37\x03\x8d\x00\x46\x05\xe9\x00\x21\x03\
-\x8d\x00\x39\x04\x4b\x00\xa6\x04\x4b\x00\xa6\x03\xe9\x00\xa6\x04\
-\x39\x00\x27\x05\x5a\x00\xa4\x04\x22\x00\xa6\x04\x00\x00\x3d\x04\
-\x22\x00\xa6\x04\x22\x00\xa6\x03\x8d\x00\x48\x03\xa9\x00\x33\x03\
-\xb0\x00\x1d\x06\x20\x00\x48\x03\xb0\x00\x00\x04\x62\x00\xa6\x04\
-\x4b\x00\xa6\x06\x20\x00\xa6\x06\x39\x00\xa6\x04\xb8\x00\x33\x05\
-\x76\x00\xa6\x03\xd7\x00\xa6\x03\x8d\x00\x39\x05\xd7\x00\xa4\x04\
-\x1e\x00\x21\x03\x8d\x00\x46\x03\x8d\x00\x46\x03\xe9\x00\x25\x03\
-\x1e\x00\x9e\x03\x83\x00\x3d\x03\x10\x00\x37\x01\xe9\x00\x98\x01\
-\xe9\xff\xd4\x02\x22\xff\x83\x06\x0a\x00\x27\x06\x1e\x00\xa6\x04\
-\x22\x00\x25\x03\xe9\x00\xa6\x04\x4b\x00\xa6\x03\xb0\x00\x1d\x04\
-\x4b\x00\xa6\x07\x53\x00\x87\x06\x8d\x00\x87\x06\x39\x00\x10\x04\
-\x00\x00\x25\x07\x8d\x00\xc1\x05\x70\x00\xa4\x06\xc0\x00\x37\x05\
-\x60\x00\x1d\x09\x6a\x00\xc1\x07\x7c\x00\xa4\x07\x8d\x00\x21\x06\
-\x5a\x00\x21\x0a\x37\x00\xc1\x08\xb0\x00\xa4\x04\x5e\x00\x1d\x03\
-\x7a\x00\x25\x06\x39\x00\x71\x05\x1c\x00\x37\x05\xe3\x00\x71\x04\
-\x00\x00\x3d\x05\xc6\x00\x1d\x03\xef\x00\x1d\x05\xc6\x00\x1d\x03\
-\xef\xff\xf6\x07\x8d\x00\x71\x04\xe3\x00\x3d\x07\x53\x00\x87\x06\
-\x8d\x00\x87\x07\x53\x00\x87\x06\x8d\x00\x87\x05\x1c\x00\x87\x03\
-\x83\x00\x3d\x03\x1c\x00\x17\x00\x00\xfe\x85\x00\x00\xfb\xd7\x00\
-\x00\xfd\x1d\x00\x00\xfc\xe5\x00\x00\xf7\x50\x00\x00\xf6\xec\x05\
-\x8d\x00\xc1\x04\x4b\x00\xa6\x06\x39\x00\x10\x04\x00\x00\x25\x05\
-\x1c\x00\xc3\x04\x22\x00\xa6\x04\x70\x00\xc1\x03\x3b\x00\xa4\x04\
-\x56\x00\x25\x03\x3b\x00\x25\x05\xa9\x00\xc1\x04\x49\x00\xa4\x08\
-\xe3\x00\x54\x05\xe9\x00\x21\x04\xe3\x00\x66\x03\x8d\x00\x39\x05\
-\x8d\x00\xc3\x03\xe9\x00\xa6\x06\x62\x00\xc3\x04\xf7\x00\xa6\x05\
-\x8d\x00\x25\x04\x22\x00\x25\x07\x2b\x00\x48\x04\xc8\x00\x33\x05\
-\xb0\x00\xc1\x04\x62\x00\xa6\x07\x2b\x00\xc1\x05\x2d\x00\xa6\x08\
-\x53\x00\xc1\x06\x18\x00\xa6\x06\x39\x00\x71\x04\x00\x00\x3d\x05\
-\x1c\x00\x87\x03\x8d\x00\x48\x05\x70\x00\x48\x03\xa9\x00\x33\x05\
-\x56\x00\x04\x03\xb0\x00\x04\x05\x56\x00\x04\x03\xb0\x00\x04\x05\
-\x56\x00\x1d\x03\xb0\x00\x00\x07\x4b\x00\x0a\x05\x66\x00\x33\x05\
-\xb0\x00\xc1\x04\x62\x00\xa6\x05\x8d\x00\xc1\x04\x4b\x00\xa6\x05\
-\x8d\x00\xc1\x04\x22\x00\xa4\x06\x5a\x00\x25\x04\x62\x00\x29\x06\
-\x5a\x00\x25\x04\x62\x00\x29\x02\x39\x00\xc1\x08\xe3\x00\x54\x05\
-\xe9\x00\x21\x05\x8d\x00\xc3\x04\x22\x00\xa6\x05\xd2\x00\x27\x04\
-\x4f\x00\x27\x05\x8d\x00\xc1\x04\x4b\x00\xa6\x05\xb0\x00\xc1\x04\
-\x62\x00\xa6\x05\x8d\x00\xc1\x04\x4b\x00\xa6\x07\x20\x00\xcd\x05\
-\x70\x00\xa4\x05\x56\x00\x37\x03\xd7\x00\x5a\x05\x56\x00\x37\x03\
-\xd7\x00\x5a\x06\xe3\x00\x37\x05\xc6\x00\x5e\x04\xc6\x00\xc1\x03\
-\x8d\x00\x46\x05\x5a\x00\x37\x03\xa9\x00\x3b\x05\x56\x00\x37\x03\
-\xa9\x00\x3b\x08\xe3\x00\x54\x05\xe9\x00\x21\x04\xe3\x00\x66\x03\
-\x8d\x00\x39\x04\x5e\x00\x54\x03\x7a\x00\x54\x05\x8d\x00\xc1\x04\
-\x4b\x00\xa6\x05\x8d\x00\xc1\x04\x4b\x00\xa6\x05\xe3\x00\x71\x04\
-\x00\x00\x3d\x05\xe3\x00\x71\x04\x00\x00\x3d\x05\xe3\x00\x71\x04\
-\x00\x00\x3d\x05\x1c\x00\x66\x03\x8d\x00\x39\x05\x56\x00\x1d\x03\
-\xb0\x00\x1d\x05\x56\x00\x1d\x03\xb0\x00\x1d\x05\x56\x00\x1d\x03\
-\xb0\x00\x1d\x05\x8d\x00\xc1\x04\x4b\x00\xa6\x04\x56\x00\xc1\x03\
-\x3b\x00\xa4\x07\x1c\x00\xc5\x05\x76\x00\xa6\x05\x56\x00\x1d\x03\
-\xb0\x00\x00\x05\x56\x00\x1d\x03\xb0\x00\x00\x04\x00\x00\x00\x08\
-\x00\x00\x00\x04\x00\x00\x00\x08\x00\x00\x00\x02\xa9\x00\x00\x02\
-\x00\x00\x00\x01\x56\x00\x00\x04\x00\x00\x00\x02\x39\x00\x00\x01\
-\x99\x00\x00\x00\x39\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x02\xa9\x00\x14\x02\xa9\x00\x14\x04\x00\x00\x00\x04\
-\x00\x00\x00\x08\x00\x00\x00\x04\x00\x01\x66\x02\x39\x00\xc5\x02\
-\x39\x00\xc5\x02\x39\x00\xc5\x02\x39\x00\xc5\x02\xa9\x00\x27\x02\
-\xa9\x00\x25\x02\xa9\x00\x25\x02\xa9\x00\x25\x03\x8d\x00\x71\x03\
-\x8d\x00\x71\x04\x00\x00\x71\x06\xac\x00\xc5\x03\xc6\x00\x71\x01\
-\x75\x00\x00\x09\x53\x00\x71\x0c\x4d\x00\x71\x03\x8d\x00\xe1\x03\
-\x8d\x00\xe1\x05\x2f\x00\x71\x03\xc6\x00\x71\x02\xa9\x00\x00\x03\
-\xb0\x00\x0a\x04\x00\x00\x73\x02\xe3\x00\x91\x02\xe3\x00\x6a\x04\
-\x00\x00\x73\x02\xa9\x00\x00\x01\xd2\x00\x00\x05\x1c\x00\x87\x05\
-\x1c\x00\x71\x05\xe3\xff\xa6\x07\x8d\xff\xe1\x04\x22\x00\x48\x05\
-\xc6\x00\x00\x06\x39\x00\x87\x05\x56\x00\x02\x06\xa9\x00\x54\x03\
-\xc6\x00\x2b\x03\x8f\x00\x00\x04\xa9\x00\x37\x04\x49\x00\x37\x04\
-\x49\x00\x37\x06\x83\x00\x37\x00\x37\x00\x00\x00\x00\x00\xa2\x00\
-\xa2\x00\xa2\x00\xa2\x00\xd6\x01\x12\x02\xb6\x03\x4c\x03\xfa\x04\
-\xaa\x04\xd6\x04\xfe\x05\x2a\x05\xa4\x06\x02\x06\x30\x06\x4e\x06\
-\x6e\x06\x9e\x07\x02\x07\x46\x07\xa8\x08\x0e\x08\x5e\x08\xc2\x09\
-\x3c\x09\x74\x09\xf4\x0a\x78\x0a\xa2\x0a\xd6\x0b\x10\x0b\x46\x0b\
-\x7e\x0b\xe4\x0c\x6e\x0c\xa2\x0d\x12\x0d\x6a\x0d\xb2\x0d\xf8\x0e\
-\x32\x0e\x9e\x0e\xd6\x0e\xf4\x0f\x2a\x0f\x60\x0f\x86\x0f\xd4\x10\
-\x10\x10\x62\x10\xb6\x11\x20\x11\x7c\x12\x10\x12\x42\x12\x8e\x12\
-\xba\x13\x72\x13\xa6\x13\xda\x14\x18\x14\x46\x14\x7c\x14\xae\x14\
-\xd4\x14\xf6\x15\x18\x15\x8e\x15\xf0\x16\x38\x16\x96\x16\xf0\x17\
-\x42\x18\x0c\x18\x56\x18\x82\x18\xc6\x18\xfa\x19\x18\x19\x86\x19\
-\xce\x1a\x1a\x1a\x7c\x1a\xd2\x1b\x04\x1b\x86\x1b\xd8\x1c\x22\x1c\
-\x4a\x1c\x8c\x1c\xc2\x1d\x06\x1d\x38\x1d\xb4\x1d\xd4\x1e\x52\x1e\
-\x96\x1e\x96\x1e\xca\x1f\x44\x20\x08\x20\x9a\x21\x3c\x21\x66\x22\
-\x1c\x22\x94\x22\xbe\x22\xf0\x22\xfe\x23\xb8\x23\xd0\x24\x1e\x24\
-\x76\x24\x96\x24\xe2\x25\x32\x25\x50\x25\x6e\x25\xd6\x26\x00\x26\
-\x66\x26\xac\x26\xf0\x27\x30\x27\xb2\x28\x10\x28\x80\x28\xde\x29\
-\x3e\x29\x96\x29\xec\x2a\x44\x2a\xa6\x2a\xce\x2a\xfe\x2b\x2e\x2b\
-\x68\x2b\xd4\x2c\x52\x2c\xb4\x2d\x16\x2d\x76\x2e\x1c\x2e\x8c\x2f\
-\x0c\x2f\x66\x2f\xc8\x30\x22\x30\x8a\x30\xd0\x31\x20\x31\xc8\x32\
-\x48\x32\xc8\x33\x50\x34\x06\x34\x9a\x35\x46\x35\xea\x36\x3a\x36\
-\x9a\x36\xfc\x37\x66\x37\xea\x38\x12\x38\x3c\x38\x6c\x38\xa6\x39\
-\x20\x39\x9c\x39\xf0\x3a\x4a\x3a\xac\x3b\x32\x3b\xa6\x3c\x02\x3c\
-\x78\x3c\xce\x3d\x26\x3d\x86\x3d\xf2\x3e\x40\x3e\xa2\x3f\x10\x3f\
-\x50\x3f\xd4\x40\x40\x40\xf2\x41\x5a\x42\x02\x42\x6a\x42\xbc\x43\
-\x20\x43\x7a\x43\xe8\x44\x46\x44\xaa\x45\x0c\x45\x68\x45\xe6\x46\
-\x52\x46\xd0\x47\x26\x47\x8c\x47\xe2\x48\x50\x48\xc2\x49\x48\x49\
-\x9e\x4a\x10\x4a\x8a\x4b\x66\x4b\xf6\x4d\x00\x4d\x78\x4e\x5a\x4e\
-\xa2\x4f\x02\x4f\x6a\x4f\x90\x4f\xb6\x4f\xe0\x4f\xfe\x50\x46\x50\
-\x8c\x50\xc6\x50\xf6\x51\x3e\x51\x7a\x51\xb8\x51\xe2\x52\x30\x52\
-\x86\x52\xce\x53\x34\x53\xb0\x54\x14\x54\x9e\x55\x34\x55\xa0\x55\
-\xe0\x56\x4c\x56\x98\x57\x3c\x57\xf2\x58\x96\x59\x2a\x59\xc6\x5a\
-\x7a\x5b\x1e\x5b\xfc\x5c\x3c\x5c\x9c\x5c\xe0\x5d\x52\x5d\xb0\x5e\
-\x08\x5e\x80\x5e\xf8\x5f\x7a\x60\x04\x60\x82\x60\xe6\x61\x36\x61\
-\x84\x61\xbe\x62\x0a\x62\x4c\x62\x96\x62\xde\x63\xb8\x64\x6c\x65\
-\x12\x65\x6a\x65\xe6\x66\x10\x66\x40\x66\x7e\x66\x9c\x66\xe4\x67\
-\x14\x67\x56\x67\x7e\x67\x9e\x67\xbe\x67\xe0\x68\x28\x68\x48\x68\
-\x94\x68\xd4\x68\xfa\x69\x50\x69\x96\x69\xc0\x6a\x22\x6a\xd2\x6b\
-\x60\x6b\xe2\x6c\x16\x6c\x86\x6c\xb0\x6c\xde\x6d\x24\x6d\x62\x6d\
-\x9a\x6d\xfe\x6e\x1c\x6e\x52\x6e\x7e\x6e\xcc\x6f\x08\x6f\x36\x6f\
-\x88\x6f\xb2\x70\x06\x70\x3c\x70\x6e\x71\x12\x71\x88\x71\xbc\x72\
-\x50\x72\xd0\x73\x24\x73\xfc\x74\xa2\x75\x10\x75\x92\x75\xd8\x76\
-\x70\x77\x06\x77\x9a\x78\x04\x78\x8e\x78\xf2\x79\x7a\x79\xe6\x7a\
-\x56\x7a\x88\x7a\xc6\x7b\x08\x7b\x72\x7b\xe6\x7c\x92\x7c\xdc\x7d\
-\x3e\x7d\x94\x7d\xfc\x7e\x4e\x7e\x9c\x7e\xee\x7f\x64\x7f\xbc\x80\
-\x22\x80\xa2\x81\x04\x81\x84\x81\xde\x82\x42\x82\xd2\x83\x42\x83\
-\xa2\x84\x04\x84\x62\x84\xca\x85\x04\x85\x4c\x85\x9a\x85\xfa\x86\
-\x64\x86\xb8\x87\x1a\x87\x9e\x87\xe4\x88\x52\x88\xe6\x89\x04\x89\
-\x3e\x89\x74\x89\xe8\x8a\x52\x8a\xb4\x8a\xfc\x8b\x44\x8b\xb8\x8b\
-\xf0\x8c\x24\x8c\x84\x8c\xf4\x8d\x1e\x8d\x84\x8d\xca\x8e\x14\x8e\
-\x8e\x8e\xca\x8f\x3c\x8f\x72\x8f\xb2\x90\x00\x90\x38\x90\x8a\x90\
-\xb4\x91\x08\x91\x60\x91\x98\x91\xd6\x92\x9e\x92\xd2\x93\x0a\x93\
-\x44\x93\x7c\x93\xc0\x94\x22\x94\x84\x94\xd6\x95\x40\x95\xb2\x96\
-\x0e\x96\x84\x97\x2c\x97\x92\x97\xba\x98\x14\x98\x6e\x98\xb6\x99\
-\x32\x99\x6a\x99\xd2\x9a\x06\x9a\x44\x9a\x88\x9a\xc0\x9b\x0c\x9b\
-\x36\x9b\x98\x9b\xe0\x9c\x14\x9c\x58\x9c\xf8\x9d\x2e\x9d\x6a\x9d\
-\xea\x9e\x22\x9e\x6a\x9e\xbc\x9f\x10\x9f\x54\x9f\xac\xa0\x14\xa0\
-\x76\xa0\xd6\xa1\x5a\xa1\xd8\xa2\x0e\xa2\x62\xa2\xe4\xa3\x10\xa3\
-\x4a\xa3\x8e\xa3\xf8\xa4\x5a\xa4\xc8\xa5\x08\xa5\x48\xa5\xca\xa6\
-\x06\xa6\x9c\xa7\x18\xa7\x90\xa7\xf8\xa8\x7a\xa8\xf0\xa9\x3a\xa9\
-\x7e\xa9\xe2\xaa\x40\xaa\x9c\xaa\xfa\xab\x74\xab\xee\xac\x8a\xad\
-\x62\xad\xf6\xae\x8e\xae\xf6\xaf\x52\xaf\x8e\xaf\xc2\xb0\x12\xb0\
-\x56\xb1\x06\xb1\x96\xb2\x98\xb3\x8a\xb4\x4e\xb5\x0a\xb5\xa2\xb6\
-\x08\xb6\x3a\xb6\x70\xb6\xb6\xb6\xf0\xb7\x2a\xb7\xec\xb9\x52\xb9\
-\xd2\xba\x46\xba\xba\xbb\x22\xbb\x92\xbc\x02\xbc\x30\xbc\x5e\xbc\
-\xa6\xbc\xea\xbd\x50\xbd\xaa\xbe\x0a\xbe\x66\xbe\xe8\xbf\x6c\xbf\
-\xba\xc0\x02\xc0\x5e\xc0\xb8\xc1\x0e\xc1\x62\xc1\xa8\xc1\xea\xc2\
-\x32\xc2\x78\xc2\xbe\xc3\x02\xc3\xaa\xc4\x10\xc4\xc0\xc5\x5a\xc5\
-\xba\xc6\x0a\xc6\x50\xc6\x8c\xc6\xc0\xc6\xf8\xc7\x4a\xc7\x9a\xc7\
-\xe0\xc8\x24\xc8\x78\xc8\xc4\xc9\x0a\xc9\x90\xc9\xea\xca\x46\xca\
-\x94\xca\xde\xcb\x6a\xcb\xe6\xcc\x9e\xcd\x48\xcd\x66\xcd\xe6\xce\
-\x6c\xce\xe0\xcf\x46\xcf\xa4\xd0\x0c\xd0\x62\xd0\xb4\xd1\x12\xd1\
-\x6e\xd1\xb4\xd2\x3e\xd2\xaa\xd3\x0e\xd3\x7a\xd4\x2c\xd4\x8a\xd5\
-\x22\xd5\x80\xd6\x24\xd6\xa0\xd7\x38\xd7\x9c\xd7\xf6\xd8\x8e\xd9\
-\x0e\xd9\x74\xd9\xe0\xda\x80\xdb\x22\xdb\x84\xdb\xca\xdc\x18\xdc\
-\x62\xdc\xbe\xdd\x18\xdd\x88\xdd\xfa\xde\x62\xde\xc2\xdf\x4c\xdf\
-\xd0\xe0\x64\xe0\xe4\xe1\x2e\xe1\x7c\xe1\xda\xe2\x48\xe2\xaa\xe3\
-\x00\xe3\x56\xe3\xfc\xe4\x34\xe4\x64\xe4\xea\xe5\x5a\xe5\xbc\xe6\
-\x1e\xe6\x64\xe6\xaa\xe6\xaa\xe6\xaa\xe6\xaa\xe6\xaa\xe6\xaa\xe6\
-\xaa\xe6\xaa\xe6\xaa\xe6\xaa\xe6\xaa\xe6\xaa\xe6\xaa\xe6\xaa\xe6\
-\xaa\xe6\xb8\xe6\xc6\xe6\xd2\xe6\xea\xe7\x02\xe7\x32\xe7\x46\xe7\
-\x5a\xe7\x6c\xe7\x80\xe7\xa0\xe7\xc0\xe7\xde\xe7\xfe\xe8\x68\xe9\
-\x26\xe9\x56\xe9\x6c\xe9\xb4\xe9\xb4\xea\xa8\xeb\xda\xeb\xfa\xec\
-\x20\xed\xb8\xee\x46\xee\x88\xee\xbc\xee\xf6\xef\x50\xef\xa8\xf0\
-\x26\xf0\x68\xf0\x68\xf0\xd8\xf2\x0a\xf2\xe6\xf4\x5a\xf4\xe0\xf5\
-\x58\xf5\xe4\xf6\x76\xf6\x94\xf6\xf2\xf6\xfe\xf7\x76\xf7\xdc\xf8\
-\x3a\xf8\xd2\xf9\x60\x00\x00\x00\x01\x00\x00\x02\xac\x00\x94\x00\
-\x09\x00\x00\x00\x00\x00\x02\x00\x01\x00\x02\x00\x16\x00\x00\x01\
-\x00\x02\x29\x00\x00\x00\x00\x00\x00\x00\x0c\x00\x96\x00\x03\x00\
-\x01\x04\x09\x00\x00\x00\x56\x00\x00\x00\x03\x00\x01\x04\x09\x00\
-\x01\x00\x1c\x00\x56\x00\x03\x00\x01\x04\x09\x00\x02\x00\x0c\x00\
-\x72\x00\x03\x00\x01\x04\x09\x00\x03\x00\x54\x00\x7e\x00\x03\x00\
-\x01\x04\x09\x00\x04\x00\x2a\x00\xd2\x00\x03\x00\x01\x04\x09\x00\
-\x05\x00\x1c\x00\xfc\x00\x03\x00\x01\x04\x09\x00\x06\x00\x18\x01\
-\x18\x00\x03\x00\x01\x04\x09\x00\x0c\x00\x44\x01\x30\x00\x03\x00\
-\x01\x04\x09\x00\x0d\x01\x9e\x01\x74\x00\x03\x00\x01\x04\x09\x00\
-\x0e\x00\x34\x03\x12\x00\x03\x00\x01\x04\x09\x00\xc8\x00\x16\x03\
-\x46\x00\x03\x00\x01\x04\x09\x00\xc9\x00\x30\x03\x5c\x00\x43\x00\
-\x6f\x00\x6e\x00\x76\x00\x65\x00\x72\x00\x74\x00\x65\x00\x64\x00\
-\x20\x00\x62\x00\x79\x00\x20\x00\x41\x00\x6e\x00\x64\x00\x72\x00\
-\x65\x00\x79\x00\x20\x00\x56\x00\x2e\x00\x20\x00\x50\x00\x61\x00\
-\x6e\x00\x6f\x00\x76\x00\x20\x00\x66\x00\x72\x00\x6f\x00\x6d\x00\
-\x20\x00\x54\x00\x65\x00\x58\x00\x20\x00\x66\x00\x6f\x00\x6e\x00\
-\x74\x00\x73\x00\x43\x00\x4d\x00\x55\x00\x20\x00\x53\x00\x61\x00\
-\x6e\x00\x73\x00\x20\x00\x53\x00\x65\x00\x72\x00\x69\x00\x66\x00\
-\x4d\x00\x65\x00\x64\x00\x69\x00\x75\x00\x6d\x00\x46\x00\x6f\x00\
-\x6e\x00\x74\x00\x46\x00\x6f\x00\x72\x00\x67\x00\x65\x00\x20\x00\
-\x32\x00\x2e\x00\x30\x00\x20\x00\x3a\x00\x20\x00\x43\x00\x4d\x00\
-\x55\x00\x20\x00\x53\x00\x61\x00\x6e\x00\x73\x00\x20\x00\x53\x00\
-\x65\x00\x72\x00\x69\x00\x66\x00\x20\x00\x3a\x00\x20\x00\x31\x00\
-\x38\x00\x2d\x00\x36\x00\x2d\x00\x32\x00\x30\x00\x30\x00\x39\x00\
-\x43\x00\x4d\x00\x55\x00\x20\x00\x53\x00\x61\x00\x6e\x00\x73\x00\
-\x20\x00\x53\x00\x65\x00\x72\x00\x69\x00\x66\x00\x20\x00\x4d\x00\
-\x65\x00\x64\x00\x69\x00\x75\x00\x6d\x00\x56\x00\x65\x00\x72\x00\
-\x73\x00\x69\x00\x6f\x00\x6e\x00\x20\x00\x30\x00\x2e\x00\x37\x00\
-\x2e\x00\x30\x00\x20\x00\x43\x00\x4d\x00\x55\x00\x53\x00\x61\x00\
-\x6e\x00\x73\x00\x53\x00\x65\x00\x72\x00\x69\x00\x66\x00\x68\x00\
-\x74\x00\x74\x00\x70\x00\x3a\x00\x2f\x00\x2f\x00\x63\x00\x6d\x00\
-\x2d\x00\x75\x00\x6e\x00\x69\x00\x63\x00\x6f\x00\x64\x00\x65\x00\
-\x2e\x00\x73\x00\x6f\x00\x75\x00\x72\x00\x63\x00\x65\x00\x66\x00\
-\x6f\x00\x72\x00\x67\x00\x65\x00\x2e\x00\x6e\x00\x65\x00\x74\x00\
-\x2f\x00\x54\x00\x68\x00\x69\x00\x73\x00\x20\x00\x46\x00\x6f\x00\
-\x6e\x00\x74\x00\x20\x00\x53\x00\x6f\x00\x66\x00\x74\x00\x77\x00\
-\x61\x00\x72\x00\x65\x00\x20\x00\x69\x00\x73\x00\x20\x00\x6c\x00\
-\x69\x00\x63\x00\x65\x00\x6e\x00\x73\x00\x65\x00\x64\x00\x20\x00\
-\x75\x00\x6e\x00\x64\x00\x65\x00\x72\x00\x20\x00\x74\x00\x68\x00\
-\x65\x00\x20\x00\x53\x00\x49\x00\x4c\x00\x20\x00\x4f\x00\x70\x00\
-\x65\x00\x6e\x00\x20\x00\x46\x00\x6f\x00\x6e\x00\x74\x00\x20\x00\
-\x4c\x00\x69\x00\x63\x00\x65\x00\x6e\x00\x73\x00\x65\x00\x2c\x00\
-\x20\x00\x56\x00\x65\x00\x72\x00\x73\x00\x69\x00\x6f\x00\x6e\x00\
-\x20\x00\x31\x00\x2e\x00\x31\x00\x2e\x00\x0a\x00\x54\x00\x68\x00\
-\x69\x00\x73\x00\x20\x00\x6c\x00\x69\x00\x63\x00\x65\x00\x6e\x00\
-\x73\x00\x65\x00\x20\x00\x69\x00\x73\x00\x20\x00\x63\x00\x6f\x00\
-\x70\x00\x69\x00\x65\x00\x64\x00\x20\x00\x74\x00\x6f\x00\x67\x00\
-\x65\x00\x74\x00\x68\x00\x65\x00\x72\x00\x20\x00\x77\x00\x69\x00\
-\x74\x00\x68\x00\x20\x00\x74\x00\x68\x00\x69\x00\x73\x00\x20\x00\
-\x66\x00\x6f\x00\x6e\x00\x74\x00\x20\x00\x70\x00\x61\x00\x63\x00\
-\x6b\x00\x61\x00\x67\x00\x65\x00\x20\x00\x69\x00\x6e\x00\x20\x00\
-\x4f\x00\x46\x00\x4c\x00\x2e\x00\x74\x00\x78\x00\x74\x00\x2c\x00\
-\x0a\x00\x61\x00\x6e\x00\x64\x00\x20\x00\x69\x00\x73\x00\x20\x00\
-\x61\x00\x6c\x00\x73\x00\x6f\x00\x20\x00\x61\x00\x76\x00\x61\x00\
-\x69\x00\x6c\x00\x61\x00\x62\x00\x6c\x00\x65\x00\x20\x00\x77\x00\
-\x69\x00\x74\x00\x68\x00\x20\x00\x61\x00\x20\x00\x46\x00\x41\x00\
-\x51\x00\x20\x00\x61\x00\x74\x00\x3a\x00\x20\x00\x68\x00\x74\x00\
-\x74\x00\x70\x00\x3a\x00\x2f\x00\x2f\x00\x73\x00\x63\x00\x72\x00\
-\x69\x00\x70\x00\x74\x00\x73\x00\x2e\x00\x73\x00\x69\x00\x6c\x00\
-\x2e\x00\x6f\x00\x72\x00\x67\x00\x2f\x00\x4f\x00\x46\x00\x4c\x00\
-\x68\x00\x74\x00\x74\x00\x70\x00\x3a\x00\x2f\x00\x2f\x00\x73\x00\
-\x63\x00\x72\x00\x69\x00\x70\x00\x74\x00\x73\x00\x2e\x00\x73\x00\
-\x69\x00\x6c\x00\x2e\x00\x6f\x00\x72\x00\x67\x00\x2f\x00\x4f\x00\
-\x46\x00\x4c\x00\x57\x00\x65\x00\x62\x00\x66\x00\x6f\x00\x6e\x00\
-\x74\x00\x20\x00\x31\x00\x2e\x00\x30\x00\x57\x00\x65\x00\x64\x00\
-\x20\x00\x41\x00\x75\x00\x67\x00\x20\x00\x32\x00\x39\x00\x20\x00\
-\x31\x00\x33\x00\x3a\x00\x31\x00\x31\x00\x3a\x00\x30\x00\x32\x00\
-\x20\x00\x32\x00\x30\x00\x31\x00\x32\x00\x00\x00\x02\x00\x00\x00\
-\x00\x00\x00\xff\x00\x00\x66\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x02\xac\x00\x00\x01\
-\x02\x01\x03\x00\x03\x00\x04\x00\x05\x00\x06\x00\x07\x00\x08\x00\
-\x09\x00\x0a\x00\x0b\x00\x0c\x00\x0d\x00\x0e\x00\x0f\x00\x10\x00\
-\x11\x00\x12\x00\x13\x00\x14\x00\x15\x00\x16\x00\x17\x00\x18\x00\
-\x19\x00\x1a\x00\x1b\x00\x1c\x00\x1d\x00\x1e\x00\x1f\x00\x20\x00\
-\x21\x00\x22\x00\x23\x00\x24\x00\x25\x00\x26\x00\x27\x00\x28\x00\
-\x29\x00\x2a\x00\x2b\x00\x2c\x00\x2d\x00\x2e\x00\x2f\x00\x30\x00\
-\x31\x00\x32\x00\x33\x00\x34\x00\x35\x00\x36\x00\x37\x00\x38\x00\
-\x39\x00\x3a\x00\x3b\x00\x3c\x00\x3d\x00\x3e\x00\x3f\x00\x40\x00\
-\x41\x00\x42\x00\x43\x00\x44\x00\x45\x00\x46\x00\x47\x00\x48\x00\
-\x49\x00\x4a\x00\x4b\x00\x4c\x00\x4d\x00\x4e\x00\x4f\x00\x50\x00\
-\x51\x00\x52\x00\x53\x00\x54\x00\x55\x00\x56\x00\x57\x00\x58\x00\
-\x59\x00\x5a\x00\x5b\x00\x5c\x00\x5d\x00\x5e\x00\x5f\x00\x60\x00\
-\x61\x01\x04\x00\xa3\x00\x84\x00\x85\x00\x96\x00\x86\x00\x8e\x00\
-\x8b\x00\x9d\x00\xa9\x00\xa4\x01\x05\x00\x8a\x00\xda\x00\x83\x00\
-\x93\x00\x8d\x01\x06\x00\x88\x00\xc3\x00\xde\x00\x9e\x00\xaa\x00\
-\xa2\x00\xad\x00\xc9\x00\xc7\x00\xae\x00\x62\x00\x63\x00\x90\x00\
-\x64\x00\xcb\x00\x65\x00\xc8\x00\xca\x00\xcf\x00\xcc\x00\xcd\x00\
-\xce\x00\xe9\x00\x66\x00\xd3\x00\xd0\x00\xd1\x00\xaf\x00\x67\x00\
-\x91\x00\xd6\x00\xd4\x00\xd5\x00\x68\x00\xeb\x00\xed\x00\x89\x00\
-\x6a\x00\x69\x00\x6b\x00\x6d\x00\x6c\x00\x6e\x00\xa0\x00\x6f\x00\
-\x71\x00\x70\x00\x72\x00\x73\x00\x75\x00\x74\x00\x76\x00\x77\x00\
-\xea\x00\x78\x00\x7a\x00\x79\x00\x7b\x00\x7d\x00\x7c\x00\xb8\x00\
-\xa1\x00\x7f\x00\x7e\x00\x80\x00\x81\x00\xec\x00\xee\x00\xba\x01\
-\x07\x01\x08\x01\x09\x01\x0a\x01\x0b\x01\x0c\x00\xfd\x00\xfe\x01\
-\x0d\x01\x0e\x01\x0f\x01\x10\x00\xff\x01\x00\x01\x11\x01\x12\x01\
-\x13\x01\x01\x01\x14\x01\x15\x01\x16\x01\x17\x01\x18\x01\x19\x01\
-\x1a\x01\x1b\x01\x1c\x01\x1d\x00\xf8\x00\xf9\x01\x1e\x01\x1f\x01\
-\x20\x01\x21\x01\x22\x01\x23\x01\x24\x00\xfa\x00\xd7\x01\x25\x01\
-\x26\x01\x27\x01\x28\x01\x29\x01\x2a\x00\xe2\x00\xe3\x01\x2b\x01\
-\x2c\x01\x2d\x01\x2e\x01\x2f\x01\x30\x00\xb0\x00\xb1\x01\x31\x01\
-\x32\x01\x33\x01\x34\x01\x35\x01\x36\x01\x37\x01\x38\x00\xfb\x00\
-\xfc\x00\xe4\x00\xe5\x01\x39\x01\x3a\x01\x3b\x01\x3c\x01\x3d\x01\
-\x3e\x01\x3f\x01\x40\x01\x41\x01\x42\x01\x43\x01\x44\x00\xbb\x01\
-\x45\x01\x46\x01\x47\x01\x48\x00\xe6\x00\xe7\x00\xa6\x01\x49\x01\
-\x4a\x01\x4b\x01\x4c\x00\xd8\x00\xe1\x00\xdb\x00\xdc\x00\xdd\x00\
-\xe0\x00\xd9\x00\xdf\x01\x4d\x01\x4e\x01\x4f\x01\x50\x01\x51\x01\
-\x52\x01\x53\x01\x54\x01\x55\x01\x56\x01\x57\x01\x58\x01\x59\x01\
-\x5a\x01\x5b\x01\x5c\x01\x5d\x01\x5e\x00\xa8\x01\x5f\x01\x60\x01\
-\x61\x01\x62\x01\x63\x01\x64\x01\x65\x01\x66\x01\x67\x01\x68\x01\
-\x69\x01\x6a\x01\x6b\x01\x6c\x01\x6d\x01\x6e\x01\x6f\x01\x70\x01\
-\x71\x00\x9f\x01\x72\x01\x73\x01\x74\x01\x75\x01\x76\x01\x77\x01\
-\x78\x01\x79\x01\x7a\x01\x7b\x01\x7c\x01\x7d\x01\x7e\x01\x7f\x01\
-\x80\x01\x81\x01\x82\x01\x83\x00\x97\x01\x84\x01\x85\x01\x86\x00\
-\x9b\x01\x87\x01\x88\x01\x89\x01\x8a\x01\x8b\x01\x8c\x01\x8d\x01\
-\x8e\x01\x8f\x01\x90\x01\x91\x01\x92\x01\x93\x01\x94\x01\x95\x01\
-\x96\x01\x97\x01\x98\x01\x99\x01\x9a\x01\x9b\x01\x9c\x01\x9d\x01\
-\x9e\x01\x9f\x01\xa0\x01\xa1\x01\xa2\x01\xa3\x01\xa4\x01\xa5\x01\
-\xa6\x01\xa7\x01\xa8\x01\xa9\x01\xaa\x01\xab\x01\xac\x01\xad\x01\
-\xae\x01\xaf\x01\xb0\x01\xb1\x01\xb2\x01\xb3\x01\xb4\x01\xb5\x01\
-\xb6\x01\xb7\x01\xb8\x01\xb9\x01\xba\x01\xbb\x01\xbc\x01\xbd\x01\
-\xbe\x01\xbf\x01\xc0\x01\xc1\x01\xc2\x01\xc3\x01\xc4\x01\xc5\x01\
-\xc6\x01\xc7\x01\xc8\x01\xc9\x01\xca\x01\xcb\x01\xcc\x01\xcd\x01\
-\xce\x01\xcf\x01\xd0\x01\xd1\x01\xd2\x01\xd3\x01\xd4\x01\xd5\x01\
-\xd6\x01\xd7\x01\xd8\x01\xd9\x01\xda\x01\xdb\x01\xdc\x01\xdd\x01\
-\xde\x01\xdf\x01\xe0\x01\xe1\x01\xe2\x01\xe3\x01\xe4\x01\xe5\x01\
-\xe6\x01\xe7\x01\xe8\x01\xe9\x01\xea\x01\xeb\x01\xec\x01\xed\x01\
-\xee\x01\xef\x01\xf0\x01\xf1\x01\xf2\x01\xf3\x01\xf4\x01\xf5\x01\
-\xf6\x01\xf7\x01\xf8\x01\xf9\x01\xfa\x01\xfb\x01\xfc\x01\xfd\x01\
-\xfe\x01\xff\x02\x00\x02\x01\x02\x02\x02\x03\x02\x04\x02\x05\x02\
-\x06\x02\x07\x02\x08\x02\x09\x02\x0a\x02\x0b\x02\x0c\x02\x0d\x02\
-\x0e\x02\x0f\x02\x10\x02\x11\x02\x12\x02\x13\x02\x14\x02\x15\x02\
-\x16\x02\x17\x02\x18\x02\x19\x02\x1a\x02\x1b\x02\x1c\x02\x1d\x02\
-\x1e\x02\x1f\x02\x20\x02\x21\x02\x22\x02\x23\x02\x24\x02\x25\x02\
-\x26\x02\x27\x02\x28\x02\x29\x02\x2a\x02\x2b\x02\x2c\x02\x2d\x02\
-\x2e\x02\x2f\x02\x30\x02\x31\x02\x32\x02\x33\x02\x34\x02\x35\x02\
-\x36\x02\x37\x02\x38\x02\x39\x02\x3a\x02\x3b\x02\x3c\x02\x3d\x02\
-\x3e\x02\x3f\x02\x40\x02\x41\x02\x42\x02\x43\x02\x44\x02\x45\x02\
-\x46\x02\x47\x02\x48\x02\x49\x02\x4a\x02\x4b\x02\x4c\x02\x4d\x02\
-\x4e\x02\x4f\x02\x50\x02\x51\x02\x52\x02\x53\x02\x54\x02\x55\x02\
-\x56\x02\x57\x02\x58\x02\x59\x02\x5a\x02\x5b\x02\x5c\x02\x5d\x02\
-\x5e\x02\x5f\x02\x60\x02\x61\x02\x62\x02\x63\x02\x64\x02\x65\x02\
-\x66\x02\x67\x02\x68\x02\x69\x02\x6a\x02\x6b\x02\x6c\x02\x6d\x02\
-\x6e\x02\x6f\x02\x70\x02\x71\x02\x72\x02\x73\x02\x74\x02\x75\x02\
-\x76\x02\x77\x02\x78\x02\x79\x02\x7a\x02\x7b\x02\x7c\x02\x7d\x02\
-\x7e\x02\x7f\x02\x80\x02\x81\x02\x82\x02\x83\x02\x84\x02\x85\x02\
-\x86\x02\x87\x02\x88\x02\x89\x02\x8a\x02\x8b\x02\x8c\x02\x8d\x02\
-\x8e\x02\x8f\x02\x90\x02\x91\x02\x92\x02\x93\x02\x94\x02\x95\x02\
-\x96\x02\x97\x02\x98\x02\x99\x02\x9a\x02\x9b\x02\x9c\x02\x9d\x02\
-\x9e\x02\x9f\x02\xa0\x02\xa1\x02\xa2\x02\xa3\x02\xa4\x02\xa5\x02\
-\xa6\x02\xa7\x02\xa8\x02\xa9\x00\xb2\x00\xb3\x02\xaa\x00\xb6\x00\
-\xb7\x00\xc4\x02\xab\x00\xb4\x00\xb5\x00\xc5\x02\xac\x00\x82\x00\
-\xc2\x00\x87\x00\xab\x02\xad\x02\xae\x00\xc6\x02\xaf\x00\xbe\x00\
-\xbf\x02\xb0\x02\xb1\x02\xb2\x02\xb3\x00\xbc\x02\xb4\x02\xb5\x02\
-\xb6\x02\xb7\x02\xb8\x02\xb9\x02\xba\x02\xbb\x02\xbc\x02\xbd\x02\
-\xbe\x02\xbf\x00\x8c\x02\xc0\x00\xa5\x02\xc1\x02\xc2\x02\xc3\x02\
-\xc4\x02\xc5\x02\xc6\x06\x67\x6c\x79\x70\x68\x31\x07\x75\x6e\x69\
-\x30\x30\x30\x44\x07\x75\x6e\x69\x30\x30\x41\x30\x07\x75\x6e\x69\
-\x30\x30\x41\x44\x07\x75\x6e\x69\x30\x30\x42\x35\x07\x41\x6d\x61\
-\x63\x72\x6f\x6e\x07\x61\x6d\x61\x63\x72\x6f\x6e\x06\x41\x62\x72\
-\x65\x76\x65\x06\x61\x62\x72\x65\x76\x65\x07\x41\x6f\x67\x6f\x6e\
-\x65\x6b\x07\x61\x6f\x67\x6f\x6e\x65\x6b\x0b\x43\x63\x69\x72\x63\
-\x75\x6d\x66\x6c\x65\x78\x0b\x63\x63\x69\x72\x63\x75\x6d\x66\x6c\
-\x65\x78\x0a\x43\x64\x6f\x74\x61\x63\x63\x65\x6e\x74\x0a\x63\x64\
-\x6f\x74\x61\x63\x63\x65\x6e\x74\x06\x44\x63\x61\x72\x6f\x6e\x06\
-\x64\x63\x61\x72\x6f\x6e\x06\x44\x63\x72\x6f\x61\x74\x07\x45\x6d\
-\x61\x63\x72\x6f\x6e\x07\x65\x6d\x61\x63\x72\x6f\x6e\x0a\x45\x64\
-\x6f\x74\x61\x63\x63\x65\x6e\x74\x0a\x65\x64\x6f\x74\x61\x63\x63\
-\x65\x6e\x74\x07\x45\x6f\x67\x6f\x6e\x65\x6b\x07\x65\x6f\x67\x6f\
-\x6e\x65\x6b\x06\x45\x63\x61\x72\x6f\x6e\x06\x65\x63\x61\x72\x6f\
-\x6e\x0b\x47\x63\x69\x72\x63\x75\x6d\x66\x6c\x65\x78\x0b\x67\x63\
-\x69\x72\x63\x75\x6d\x66\x6c\x65\x78\x0a\x47\x64\x6f\x74\x61\x63\
-\x63\x65\x6e\x74\x0a\x67\x64\x6f\x74\x61\x63\x63\x65\x6e\x74\x0b\
-\x48\x63\x69\x72\x63\x75\x6d\x66\x6c\x65\x78\x0b\x68\x63\x69\x72\
-\x63\x75\x6d\x66\x6c\x65\x78\x04\x68\x62\x61\x72\x07\x49\x6d\x61\
-\x63\x72\x6f\x6e\x07\x69\x6d\x61\x63\x72\x6f\x6e\x0b\x4a\x63\x69\
-\x72\x63\x75\x6d\x66\x6c\x65\x78\x0b\x6a\x63\x69\x72\x63\x75\x6d\
-\x66\x6c\x65\x78\x06\x4c\x61\x63\x75\x74\x65\x06\x6c\x61\x63\x75\
-\x74\x65\x06\x4c\x63\x61\x72\x6f\x6e\x06\x6c\x63\x61\x72\x6f\x6e\
-\x06\x4e\x61\x63\x75\x74\x65\x06\x6e\x61\x63\x75\x74\x65\x06\x4e\
-\x63\x61\x72\x6f\x6e\x06\x6e\x63\x61\x72\x6f\x6e\x0d\x4f\x68\x75\
-\x6e\x67\x61\x72\x75\x6d\x6c\x61\x75\x74\x0d\x6f\x68\x75\x6e\x67\
-\x61\x72\x75\x6d\x6c\x61\x75\x74\x06\x52\x61\x63\x75\x74\x65\x06\
-\x72\x61\x63\x75\x74\x65\x06\x52\x63\x61\x72\x6f\x6e\x06\x72\x63\
-\x61\x72\x6f\x6e\x06\x53\x61\x63\x75\x74\x65\x06\x73\x61\x63\x75\
-\x74\x65\x0b\x53\x63\x69\x72\x63\x75\x6d\x66\x6c\x65\x78\x0b\x73\
-\x63\x69\x72\x63\x75\x6d\x66\x6c\x65\x78\x0c\x54\x63\x6f\x6d\x6d\
-\x61\x61\x63\x63\x65\x6e\x74\x0c\x74\x63\x6f\x6d\x6d\x61\x61\x63\
-\x63\x65\x6e\x74\x06\x54\x63\x61\x72\x6f\x6e\x06\x74\x63\x61\x72\
-\x6f\x6e\x07\x55\x6d\x61\x63\x72\x6f\x6e\x07\x75\x6d\x61\x63\x72\
-\x6f\x6e\x06\x55\x62\x72\x65\x76\x65\x06\x75\x62\x72\x65\x76\x65\
-\x05\x55\x72\x69\x6e\x67\x05\x75\x72\x69\x6e\x67\x0d\x55\x68\x75\
-\x6e\x67\x61\x72\x75\x6d\x6c\x61\x75\x74\x0d\x75\x68\x75\x6e\x67\
-\x61\x72\x75\x6d\x6c\x61\x75\x74\x06\x5a\x61\x63\x75\x74\x65\x06\
-\x7a\x61\x63\x75\x74\x65\x0a\x5a\x64\x6f\x74\x61\x63\x63\x65\x6e\
-\x74\x0a\x7a\x64\x6f\x74\x61\x63\x63\x65\x6e\x74\x0c\x53\x63\x6f\
-\x6d\x6d\x61\x61\x63\x63\x65\x6e\x74\x0c\x73\x63\x6f\x6d\x6d\x61\
-\x61\x63\x63\x65\x6e\x74\x07\x75\x6e\x69\x30\x32\x31\x41\x07\x75\
-\x6e\x69\x30\x32\x31\x42\x07\x75\x6e\x69\x30\x33\x37\x34\x07\x75\
-\x6e\x69\x30\x33\x37\x35\x07\x75\x6e\x69\x30\x33\x37\x41\x07\x75\
-\x6e\x69\x30\x33\x37\x45\x05\x74\x6f\x6e\x6f\x73\x0d\x64\x69\x65\
-\x72\x65\x73\x69\x73\x74\x6f\x6e\x6f\x73\x0a\x41\x6c\x70\x68\x61\
-\x74\x6f\x6e\x6f\x73\x09\x61\x6e\x6f\x74\x65\x6c\x65\x69\x61\x0c\
-\x45\x70\x73\x69\x6c\x6f\x6e\x74\x6f\x6e\x6f\x73\x08\x45\x74\x61\
-\x74\x6f\x6e\x6f\x73\x09\x49\x6f\x74\x61\x74\x6f\x6e\x6f\x73\x0c\
-\x4f\x6d\x69\x63\x72\x6f\x6e\x74\x6f\x6e\x6f\x73\x0c\x55\x70\x73\
-\x69\x6c\x6f\x6e\x74\x6f\x6e\x6f\x73\x0a\x4f\x6d\x65\x67\x61\x74\
-\x6f\x6e\x6f\x73\x11\x69\x6f\x74\x61\x64\x69\x65\x72\x65\x73\x69\
-\x73\x74\x6f\x6e\x6f\x73\x05\x41\x6c\x70\x68\x61\x04\x42\x65\x74\
-\x61\x05\x47\x61\x6d\x6d\x61\x07\x45\x70\x73\x69\x6c\x6f\x6e\x04\
-\x5a\x65\x74\x61\x03\x45\x74\x61\x05\x54\x68\x65\x74\x61\x04\x49\
-\x6f\x74\x61\x05\x4b\x61\x70\x70\x61\x06\x4c\x61\x6d\x62\x64\x61\
-\x02\x4d\x75\x02\x4e\x75\x02\x58\x69\x07\x4f\x6d\x69\x63\x72\x6f\
-\x6e\x02\x50\x69\x03\x52\x68\x6f\x05\x53\x69\x67\x6d\x61\x03\x54\
-\x61\x75\x07\x55\x70\x73\x69\x6c\x6f\x6e\x03\x50\x68\x69\x03\x43\
-\x68\x69\x03\x50\x73\x69\x0c\x49\x6f\x74\x61\x64\x69\x65\x72\x65\
-\x73\x69\x73\x0f\x55\x70\x73\x69\x6c\x6f\x6e\x64\x69\x65\x72\x65\
-\x73\x69\x73\x0a\x61\x6c\x70\x68\x61\x74\x6f\x6e\x6f\x73\x0c\x65\
-\x70\x73\x69\x6c\x6f\x6e\x74\x6f\x6e\x6f\x73\x08\x65\x74\x61\x74\
-\x6f\x6e\x6f\x73\x09\x69\x6f\x74\x61\x74\x6f\x6e\x6f\x73\x14\x75\
-\x70\x73\x69\x6c\x6f\x6e\x64\x69\x65\x72\x65\x73\x69\x73\x74\x6f\
-\x6e\x6f\x73\x05\x61\x6c\x70\x68\x61\x04\x62\x65\x74\x61\x05\x67\
-\x61\x6d\x6d\x61\x05\x64\x65\x6c\x74\x61\x07\x65\x70\x73\x69\x6c\
-\x6f\x6e\x04\x7a\x65\x74\x61\x03\x65\x74\x61\x05\x74\x68\x65\x74\
-\x61\x04\x69\x6f\x74\x61\x05\x6b\x61\x70\x70\x61\x06\x6c\x61\x6d\
-\x62\x64\x61\x02\x6e\x75\x02\x78\x69\x07\x6f\x6d\x69\x63\x72\x6f\
-\x6e\x03\x72\x68\x6f\x06\x73\x69\x67\x6d\x61\x31\x05\x73\x69\x67\
-\x6d\x61\x03\x74\x61\x75\x07\x75\x70\x73\x69\x6c\x6f\x6e\x03\x70\
-\x68\x69\x03\x63\x68\x69\x03\x70\x73\x69\x05\x6f\x6d\x65\x67\x61\
-\x0c\x69\x6f\x74\x61\x64\x69\x65\x72\x65\x73\x69\x73\x0f\x75\x70\
-\x73\x69\x6c\x6f\x6e\x64\x69\x65\x72\x65\x73\x69\x73\x0c\x6f\x6d\
-\x69\x63\x72\x6f\x6e\x74\x6f\x6e\x6f\x73\x0c\x75\x70\x73\x69\x6c\
-\x6f\x6e\x74\x6f\x6e\x6f\x73\x0a\x6f\x6d\x65\x67\x61\x74\x6f\x6e\
-\x6f\x73\x06\x74\x68\x65\x74\x61\x31\x07\x75\x6e\x69\x30\x33\x44\
-\x38\x07\x75\x6e\x69\x30\x33\x44\x39\x07\x75\x6e\x69\x30\x33\x44\
-\x41\x07\x75\x6e\x69\x30\x33\x44\x42\x07\x75\x6e\x69\x30\x33\x44\
-\x43\x07\x75\x6e\x69\x30\x33\x44\x44\x07\x75\x6e\x69\x30\x33\x44\
-\x46\x07\x75\x6e\x69\x30\x33\x45\x30\x07\x75\x6e\x69\x30\x33\x45\
-\x31\x07\x75\x6e\x69\x30\x34\x30\x30\x09\x61\x66\x69\x69\x31\x30\
-\x30\x32\x33\x09\x61\x66\x69\x69\x31\x30\x30\x35\x31\x09\x61\x66\
-\x69\x69\x31\x30\x30\x35\x32\x09\x61\x66\x69\x69\x31\x30\x30\x35\
-\x33\x09\x61\x66\x69\x69\x31\x30\x30\x35\x34\x09\x61\x66\x69\x69\
-\x31\x30\x30\x35\x35\x09\x61\x66\x69\x69\x31\x30\x30\x35\x36\x09\
-\x61\x66\x69\x69\x31\x30\x30\x35\x37\x09\x61\x66\x69\x69\x31\x30\
-\x30\x35\x38\x09\x61\x66\x69\x69\x31\x30\x30\x35\x39\x09\x61\x66\
-\x69\x69\x31\x30\x30\x36\x30\x09\x61\x66\x69\x69\x31\x30\x30\x36\
-\x31\x07\x75\x6e\x69\x30\x34\x30\x44\x09\x61\x66\x69\x69\x31\x30\
-\x30\x36\x32\x09\x61\x66\x69\x69\x31\x30\x31\x34\x35\x09\x61\x66\
-\x69\x69\x31\x30\x30\x31\x37\x09\x61\x66\x69\x69\x31\x30\x30\x31\
-\x38\x09\x61\x66\x69\x69\x31\x30\x30\x31\x39\x09\x61\x66\x69\x69\
-\x31\x30\x30\x32\x30\x09\x61\x66\x69\x69\x31\x30\x30\x32\x31\x09\
-\x61\x66\x69\x69\x31\x30\x30\x32\x32\x09\x61\x66\x69\x69\x31\x30\
-\x30\x32\x34\x09\x61\x66\x69\x69\x31\x30\x30\x32\x35\x09\x61\x66\
-\x69\x69\x31\x30\x30\x32\x36\x09\x61\x66\x69\x69\x31\x30\x30\x32\
-\x37\x09\x61\x66\x69\x69\x31\x30\x30\x32\x38\x09\x61\x66\x69\x69\
-\x31\x30\x30\x32\x39\x09\x61\x66\x69\x69\x31\x30\x30\x33\x30\x09\
-\x61\x66\x69\x69\x31\x30\x30\x33\x31\x09\x61\x66\x69\x69\x31\x30\
-\x30\x33\x32\x09\x61\x66\x69\x69\x31\x30\x30\x33\x33\x09\x61\x66\
-\x69\x69\x31\x30\x30\x33\x34\x09\x61\x66\x69\x69\x31\x30\x30\x33\
-\x35\x09\x61\x66\x69\x69\x31\x30\x30\x33\x36\x09\x61\x66\x69\x69\
-\x31\x30\x30\x33\x37\x09\x61\x66\x69\x69\x31\x30\x30\x33\x38\x09\
-\x61\x66\x69\x69\x31\x30\x30\x33\x39\x09\x61\x66\x69\x69\x31\x30\
-\x30\x34\x30\x09\x61\x66\x69\x69\x31\x30\x30\x34\x31\x09\x61\x66\
-\x69\x69\x31\x30\x30\x34\x32\x09\x61\x66\x69\x69\x31\x30\x30\x34\
-\x33\x09\x61\x66\x69\x69\x31\x30\x30\x34\x34\x09\x61\x66\x69\x69\
-\x31\x30\x30\x34\x35\x09\x61\x66\x69\x69\x31\x30\x30\x34\x36\x09\
-\x61\x66\x69\x69\x31\x30\x30\x34\x37\x09\x61\x66\x69\x69\x31\x30\
-\x30\x34\x38\x09\x61\x66\x69\x69\x31\x30\x30\x34\x39\x09\x61\x66\
-\x69\x69\x31\x30\x30\x36\x35\x09\x61\x66\x69\x69\x31\x30\x30\x36\
-\x36\x09\x61\x66\x69\x69\x31\x30\x30\x36\x37\x09\x61\x66\x69\x69\
-\x31\x30\x30\x36\x38\x09\x61\x66\x69\x69\x31\x30\x30\x36\x39\x09\
-\x61\x66\x69\x69\x31\x30\x30\x37\x30\x09\x61\x66\x69\x69\x31\x30\
-\x30\x37\x32\x09\x61\x66\x69\x69\x31\x30\x30\x37\x33\x09\x61\x66\
-\x69\x69\x31\x30\x30\x37\x34\x09\x61\x66\x69\x69\x31\x30\x30\x37\
-\x35\x09\x61\x66\x69\x69\x31\x30\x30\x37\x36\x09\x61\x66\x69\x69\
-\x31\x30\x30\x37\x37\x09\x61\x66\x69\x69\x31\x30\x30\x37\x38\x09\
-\x61\x66\x69\x69\x31\x30\x30\x37\x39\x09\x61\x66\x69\x69\x31\x30\
-\x30\x38\x30\x09\x61\x66\x69\x69\x31\x30\x30\x38\x31\x09\x61\x66\
-\x69\x69\x31\x30\x30\x38\x32\x09\x61\x66\x69\x69\x31\x30\x30\x38\
-\x33\x09\x61\x66\x69\x69\x31\x30\x30\x38\x34\x09\x61\x66\x69\x69\
-\x31\x30\x30\x38\x35\x09\x61\x66\x69\x69\x31\x30\x30\x38\x36\x09\
-\x61\x66\x69\x69\x31\x30\x30\x38\x37\x09\x61\x66\x69\x69\x31\x30\
-\x30\x38\x38\x09\x61\x66\x69\x69\x31\x30\x30\x38\x39\x09\x61\x66\
-\x69\x69\x31\x30\x30\x39\x30\x09\x61\x66\x69\x69\x31\x30\x30\x39\
-\x31\x09\x61\x66\x69\x69\x31\x30\x30\x39\x32\x09\x61\x66\x69\x69\
-\x31\x30\x30\x39\x33\x09\x61\x66\x69\x69\x31\x30\x30\x39\x34\x09\
-\x61\x66\x69\x69\x31\x30\x30\x39\x35\x09\x61\x66\x69\x69\x31\x30\
-\x30\x39\x36\x09\x61\x66\x69\x69\x31\x30\x30\x39\x37\x07\x75\x6e\
-\x69\x30\x34\x35\x30\x09\x61\x66\x69\x69\x31\x30\x30\x37\x31\x09\
-\x61\x66\x69\x69\x31\x30\x30\x39\x39\x09\x61\x66\x69\x69\x31\x30\
-\x31\x30\x30\x09\x61\x66\x69\x69\x31\x30\x31\x30\x31\x09\x61\x66\
-\x69\x69\x31\x30\x31\x30\x32\x09\x61\x66\x69\x69\x31\x30\x31\x30\
-\x33\x09\x61\x66\x69\x69\x31\x30\x31\x30\x34\x09\x61\x66\x69\x69\
-\x31\x30\x31\x30\x35\x09\x61\x66\x69\x69\x31\x30\x31\x30\x36\x09\
-\x61\x66\x69\x69\x31\x30\x31\x30\x37\x09\x61\x66\x69\x69\x31\x30\
-\x31\x30\x38\x09\x61\x66\x69\x69\x31\x30\x31\x30\x39\x07\x75\x6e\
-\x69\x30\x34\x35\x44\x09\x61\x66\x69\x69\x31\x30\x31\x31\x30\x09\
-\x61\x66\x69\x69\x31\x30\x31\x39\x33\x07\x75\x6e\x69\x30\x34\x36\
-\x30\x07\x75\x6e\x69\x30\x34\x36\x31\x09\x61\x66\x69\x69\x31\x30\
-\x31\x34\x36\x09\x61\x66\x69\x69\x31\x30\x31\x39\x34\x07\x75\x6e\
-\x69\x30\x34\x36\x34\x07\x75\x6e\x69\x30\x34\x36\x35\x07\x75\x6e\
-\x69\x30\x34\x36\x36\x07\x75\x6e\x69\x30\x34\x36\x37\x07\x75\x6e\
-\x69\x30\x34\x36\x38\x07\x75\x6e\x69\x30\x34\x36\x39\x07\x75\x6e\
-\x69\x30\x34\x36\x41\x07\x75\x6e\x69\x30\x34\x36\x42\x07\x75\x6e\
-\x69\x30\x34\x36\x43\x07\x75\x6e\x69\x30\x34\x36\x44\x07\x75\x6e\
-\x69\x30\x34\x36\x45\x07\x75\x6e\x69\x30\x34\x36\x46\x07\x75\x6e\
-\x69\x30\x34\x37\x30\x07\x75\x6e\x69\x30\x34\x37\x31\x09\x61\x66\
-\x69\x69\x31\x30\x31\x34\x37\x09\x61\x66\x69\x69\x31\x30\x31\x39\
-\x35\x09\x61\x66\x69\x69\x31\x30\x31\x34\x38\x09\x61\x66\x69\x69\
-\x31\x30\x31\x39\x36\x07\x75\x6e\x69\x30\x34\x37\x36\x07\x75\x6e\
-\x69\x30\x34\x37\x37\x07\x75\x6e\x69\x30\x34\x37\x41\x07\x75\x6e\
-\x69\x30\x34\x37\x42\x07\x75\x6e\x69\x30\x34\x37\x43\x07\x75\x6e\
-\x69\x30\x34\x37\x44\x07\x75\x6e\x69\x30\x34\x37\x45\x07\x75\x6e\
-\x69\x30\x34\x37\x46\x07\x75\x6e\x69\x30\x34\x38\x30\x07\x75\x6e\
-\x69\x30\x34\x38\x31\x07\x75\x6e\x69\x30\x34\x38\x32\x07\x75\x6e\
-\x69\x30\x34\x38\x33\x07\x75\x6e\x69\x30\x34\x38\x34\x07\x75\x6e\
-\x69\x30\x34\x38\x35\x07\x75\x6e\x69\x30\x34\x38\x36\x07\x75\x6e\
-\x69\x30\x34\x38\x38\x07\x75\x6e\x69\x30\x34\x38\x39\x07\x75\x6e\
-\x69\x30\x34\x38\x41\x07\x75\x6e\x69\x30\x34\x38\x42\x07\x75\x6e\
-\x69\x30\x34\x38\x43\x07\x75\x6e\x69\x30\x34\x38\x44\x07\x75\x6e\
-\x69\x30\x34\x38\x45\x07\x75\x6e\x69\x30\x34\x38\x46\x09\x61\x66\
-\x69\x69\x31\x30\x30\x35\x30\x09\x61\x66\x69\x69\x31\x30\x30\x39\
-\x38\x07\x75\x6e\x69\x30\x34\x39\x32\x07\x75\x6e\x69\x30\x34\x39\
-\x33\x07\x75\x6e\x69\x30\x34\x39\x34\x07\x75\x6e\x69\x30\x34\x39\
-\x35\x07\x75\x6e\x69\x30\x34\x39\x36\x07\x75\x6e\x69\x30\x34\x39\
-\x37\x07\x75\x6e\x69\x30\x34\x39\x38\x07\x75\x6e\x69\x30\x34\x39\
-\x39\x07\x75\x6e\x69\x30\x34\x39\x41\x07\x75\x6e\x69\x30\x34\x39\
-\x42\x07\x75\x6e\x69\x30\x34\x39\x43\x07\x75\x6e\x69\x30\x34\x39\
-\x44\x07\x75\x6e\x69\x30\x34\x39\x45\x07\x75\x6e\x69\x30\x34\x39\
-\x46\x07\x75\x6e\x69\x30\x34\x41\x30\x07\x75\x6e\x69\x30\x34\x41\
-\x31\x07\x75\x6e\x69\x30\x34\x41\x32\x07\x75\x6e\x69\x30\x34\x41\
-\x33\x07\x75\x6e\x69\x30\x34\x41\x34\x07\x75\x6e\x69\x30\x34\x41\
-\x35\x07\x75\x6e\x69\x30\x34\x41\x36\x07\x75\x6e\x69\x30\x34\x41\
-\x37\x07\x75\x6e\x69\x30\x34\x41\x38\x07\x75\x6e\x69\x30\x34\x41\
-\x39\x07\x75\x6e\x69\x30\x34\x41\x41\x07\x75\x6e\x69\x30\x34\x41\
-\x42\x07\x75\x6e\x69\x30\x34\x41\x43\x07\x75\x6e\x69\x30\x34\x41\
-\x44\x07\x75\x6e\x69\x30\x34\x41\x45\x07\x75\x6e\x69\x30\x34\x41\
-\x46\x07\x75\x6e\x69\x30\x34\x42\x30\x07\x75\x6e\x69\x30\x34\x42\
-\x31\x07\x75\x6e\x69\x30\x34\x42\x32\x07\x75\x6e\x69\x30\x34\x42\
-\x33\x07\x75\x6e\x69\x30\x34\x42\x34\x07\x75\x6e\x69\x30\x34\x42\
-\x35\x07\x75\x6e\x69\x30\x34\x42\x36\x07\x75\x6e\x69\x30\x34\x42\
-\x37\x07\x75\x6e\x69\x30\x34\x42\x38\x07\x75\x6e\x69\x30\x34\x42\
-\x39\x07\x75\x6e\x69\x30\x34\x42\x41\x07\x75\x6e\x69\x30\x34\x42\
-\x42\x07\x75\x6e\x69\x30\x34\x42\x43\x07\x75\x6e\x69\x30\x34\x42\
-\x44\x07\x75\x6e\x69\x30\x34\x42\x45\x07\x75\x6e\x69\x30\x34\x42\
-\x46\x07\x75\x6e\x69\x30\x34\x43\x30\x07\x75\x6e\x69\x30\x34\x43\
-\x31\x07\x75\x6e\x69\x30\x34\x43\x32\x07\x75\x6e\x69\x30\x34\x43\
-\x33\x07\x75\x6e\x69\x30\x34\x43\x34\x07\x75\x6e\x69\x30\x34\x43\
-\x35\x07\x75\x6e\x69\x30\x34\x43\x36\x07\x75\x6e\x69\x30\x34\x43\
-\x37\x07\x75\x6e\x69\x30\x34\x43\x38\x07\x75\x6e\x69\x30\x34\x43\
-\x39\x07\x75\x6e\x69\x30\x34\x43\x41\x07\x75\x6e\x69\x30\x34\x43\
-\x42\x07\x75\x6e\x69\x30\x34\x43\x43\x07\x75\x6e\x69\x30\x34\x43\
-\x44\x07\x75\x6e\x69\x30\x34\x43\x45\x07\x75\x6e\x69\x30\x34\x44\
-\x30\x07\x75\x6e\x69\x30\x34\x44\x31\x07\x75\x6e\x69\x30\x34\x44\
-\x32\x07\x75\x6e\x69\x30\x34\x44\x33\x07\x75\x6e\x69\x30\x34\x44\
-\x34\x07\x75\x6e\x69\x30\x34\x44\x35\x07\x75\x6e\x69\x30\x34\x44\
-\x36\x07\x75\x6e\x69\x30\x34\x44\x37\x07\x75\x6e\x69\x30\x34\x44\
-\x38\x09\x61\x66\x69\x69\x31\x30\x38\x34\x36\x07\x75\x6e\x69\x30\
-\x34\x44\x41\x07\x75\x6e\x69\x30\x34\x44\x42\x07\x75\x6e\x69\x30\
-\x34\x44\x43\x07\x75\x6e\x69\x30\x34\x44\x44\x07\x75\x6e\x69\x30\
-\x34\x44\x45\x07\x75\x6e\x69\x30\x34\x44\x46\x07\x75\x6e\x69\x30\
-\x34\x45\x30\x07\x75\x6e\x69\x30\x34\x45\x31\x07\x75\x6e\x69\x30\
-\x34\x45\x32\x07\x75\x6e\x69\x30\x34\x45\x33\x07\x75\x6e\x69\x30\
-\x34\x45\x34\x07\x75\x6e\x69\x30\x34\x45\x35\x07\x75\x6e\x69\x30\
-\x34\x45\x36\x07\x75\x6e\x69\x30\x34\x45\x37\x07\x75\x6e\x69\x30\
-\x34\x45\x38\x07\x75\x6e\x69\x30\x34\x45\x39\x07\x75\x6e\x69\x30\
-\x34\x45\x41\x07\x75\x6e\x69\x30\x34\x45\x42\x07\x75\x6e\x69\x30\
-\x34\x45\x43\x07\x75\x6e\x69\x30\x34\x45\x44\x07\x75\x6e\x69\x30\
-\x34\x45\x45\x07\x75\x6e\x69\x30\x34\x45\x46\x07\x75\x6e\x69\x30\
-\x34\x46\x30\x07\x75\x6e\x69\x30\x34\x46\x31\x07\x75\x6e\x69\x30\
-\x34\x46\x32\x07\x75\x6e\x69\x30\x34\x46\x33\x07\x75\x6e\x69\x30\
-\x34\x46\x34\x07\x75\x6e\x69\x30\x34\x46\x35\x07\x75\x6e\x69\x30\
-\x34\x46\x36\x07\x75\x6e\x69\x30\x34\x46\x37\x07\x75\x6e\x69\x30\
-\x34\x46\x38\x07\x75\x6e\x69\x30\x34\x46\x39\x07\x75\x6e\x69\x30\
-\x34\x46\x43\x07\x75\x6e\x69\x30\x34\x46\x44\x07\x75\x6e\x69\x30\
-\x34\x46\x45\x07\x75\x6e\x69\x30\x34\x46\x46\x07\x75\x6e\x69\x32\
-\x30\x30\x30\x07\x75\x6e\x69\x32\x30\x30\x31\x07\x75\x6e\x69\x32\
-\x30\x30\x32\x07\x75\x6e\x69\x32\x30\x30\x33\x07\x75\x6e\x69\x32\
-\x30\x30\x34\x07\x75\x6e\x69\x32\x30\x30\x35\x07\x75\x6e\x69\x32\
-\x30\x30\x36\x07\x75\x6e\x69\x32\x30\x30\x37\x07\x75\x6e\x69\x32\
-\x30\x30\x38\x07\x75\x6e\x69\x32\x30\x30\x39\x07\x75\x6e\x69\x32\
-\x30\x30\x41\x07\x75\x6e\x69\x32\x30\x30\x42\x09\x61\x66\x69\x69\
-\x36\x31\x36\x36\x34\x07\x61\x66\x69\x69\x33\x30\x31\x07\x75\x6e\
-\x69\x32\x30\x31\x30\x07\x75\x6e\x69\x32\x30\x31\x31\x0a\x66\x69\
-\x67\x75\x72\x65\x64\x61\x73\x68\x07\x75\x6e\x69\x32\x30\x31\x36\
-\x0d\x71\x75\x6f\x74\x65\x72\x65\x76\x65\x72\x73\x65\x64\x07\x75\
-\x6e\x69\x32\x30\x31\x46\x07\x75\x6e\x69\x32\x30\x32\x39\x07\x75\
-\x6e\x69\x32\x30\x32\x46\x07\x75\x6e\x69\x32\x30\x33\x31\x07\x75\
-\x6e\x69\x32\x30\x33\x42\x07\x75\x6e\x69\x32\x30\x33\x44\x07\x75\
-\x6e\x69\x32\x30\x33\x46\x07\x75\x6e\x69\x32\x30\x34\x30\x07\x75\
-\x6e\x69\x32\x30\x34\x35\x07\x75\x6e\x69\x32\x30\x34\x36\x07\x75\
-\x6e\x69\x32\x30\x35\x32\x07\x75\x6e\x69\x32\x30\x35\x34\x07\x75\
-\x6e\x69\x32\x30\x35\x46\x0d\x63\x6f\x6c\x6f\x6e\x6d\x6f\x6e\x65\
-\x74\x61\x72\x79\x04\x6c\x69\x72\x61\x07\x75\x6e\x69\x32\x30\x41\
-\x36\x07\x75\x6e\x69\x32\x30\x41\x39\x04\x64\x6f\x6e\x67\x04\x45\
-\x75\x72\x6f\x07\x75\x6e\x69\x32\x30\x42\x32\x07\x75\x6e\x69\x32\
-\x32\x30\x36\x07\x75\x6e\x69\x45\x30\x30\x30\x07\x75\x6e\x69\x46\
-\x42\x30\x30\x07\x75\x6e\x69\x46\x42\x30\x31\x07\x75\x6e\x69\x46\
-\x42\x30\x32\x07\x75\x6e\x69\x46\x42\x30\x33\x07\x75\x6e\x69\x46\
-\x42\x30\x34\xb8\x01\xff\x85\xb0\x01\x8d\x00\x4b\xb0\x08\x50\x58\
-\xb1\x01\x01\x8e\x59\xb1\x46\x06\x2b\x58\x21\xb0\x10\x59\x4b\xb0\
-\x14\x52\x58\x21\xb0\x80\x59\x1d\xb0\x06\x2b\x5c\x58\x00\xb0\x03\
-\x20\x45\xb0\x03\x2b\x44\xb0\x04\x20\x45\xb2\x03\x17\x02\x2b\xb0\
-\x03\x2b\x44\xb0\x05\x20\x45\xb2\x04\x1c\x02\x2b\xb0\x03\x2b\x44\
-\xb0\x06\x20\x45\xb2\x05\xbc\x02\x2b\xb0\x03\x2b\x44\xb0\x07\x20\
-\x45\xb2\x06\x86\x02\x2b\xb0\x03\x2b\x44\xb0\x08\x20\x45\xb2\x07\
-\x4f\x02\x2b\xb0\x03\x2b\x44\xb0\x09\x20\x45\xb2\x08\x3d\x02\x2b\
-\xb0\x03\x2b\x44\xb0\x0a\x20\x45\xb2\x09\x2c\x02\x2b\xb0\x03\x2b\
-\x44\xb0\x0b\x20\x45\xb2\x0a\x2b\x02\x2b\xb0\x03\x2b\x44\xb0\x0c\
-\x20\x45\xb2\x0b\x32\x02\x2b\xb0\x03\x2b\x44\x01\xb0\x0d\x20\x45\
-\xb0\x03\x2b\x44\xb0\x0e\x20\x45\xb2\x0d\x38\x02\x2b\xb1\x03\x46\
-\x76\x2b\x44\xb0\x0f\x20\x45\xb2\x0e\x38\x02\x2b\xb1\x03\x46\x76\
-\x2b\x44\xb0\x10\x20\x45\xb2\x0f\xa8\x02\x2b\xb1\x03\x46\x76\x2b\
-\x44\xb0\x11\x20\x45\xb2\x10\x43\x02\x2b\xb1\x03\x46\x76\x2b\x44\
-\xb0\x12\x20\x45\xb2\x11\x40\x02\x2b\xb1\x03\x46\x76\x2b\x44\xb0\
-\x13\x20\x45\xb2\x12\x3e\x02\x2b\xb1\x03\x46\x76\x2b\x44\xb0\x14\
-\x20\x45\xb2\x13\x3c\x02\x2b\xb1\x03\x46\x76\x2b\x44\xb0\x15\x20\
-\x45\xb2\x14\x3a\x02\x2b\xb1\x03\x46\x76\x2b\x44\xb0\x16\x20\x45\
-\xb2\x15\x20\x02\x2b\xb1\x03\x46\x76\x2b\x44\x59\xb0\x14\x2b\x00\
-\x01\x50\x3e\x4d\x26\x00\x00\
-"
-
-qt_resource_name = b"\
-\x00\x05\
-\x00\x6d\x65\xb3\
-\x00\x66\
-\x00\x6f\x00\x6e\x00\x74\x00\x73\
-\x00\x0a\
-\x05\xab\x12\x26\
-\x00\x63\
-\x00\x6d\x00\x75\x00\x6e\x00\x73\x00\x73\x00\x2e\x00\x74\x00\x74\x00\x66\
-"
-
-qt_resource_struct_v1 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\
-\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-"
-
-qt_resource_struct_v2 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x90\xd8\x23\x67\xf1\
-"
-
-qt_version = [int(v) for v in QtCore.qVersion().split('.')]
-if qt_version < [5, 8, 0]:
-    rcc_version = 1
-    qt_resource_struct = qt_resource_struct_v1
-else:
-    rcc_version = 2
-    qt_resource_struct = qt_resource_struct_v2
-
-def qInitResources():
-    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-def qCleanupResources():
-    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-qInitResources()
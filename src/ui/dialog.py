@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'src//res//dialog.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_Dialog(object):
+    def setupUi(self, Dialog):
+        Dialog.setObjectName("Dialog")
+        Dialog.resize(398, 240)
+        Dialog.setMinimumSize(QtCore.QSize(398, 240))
+        Dialog.setMaximumSize(QtCore.QSize(398, 240))
+        self.frame = QtWidgets.QFrame(Dialog)
+        self.frame.setGeometry(QtCore.QRect(20, 20, 361, 201))
+        self.frame.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.frame.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame.setObjectName("frame")
+        self.btn_confirm = QtWidgets.QPushButton(self.frame)
+        self.btn_confirm.setEnabled(True)
+        self.btn_confirm.setGeometry(QtCore.QRect(270, 150, 71, 31))
+        font = QtGui.QFont()
+        font.setFamily("CMU Sans Serif")
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        self.btn_confirm.setFont(font)
+        self.btn_confirm.setStyleSheet("background-color: rgb(200, 200, 200);\n"
+"color: #3d3d3d;")
+        self.btn_confirm.setDefault(False)
+        self.btn_confirm.setFlat(False)
+        self.btn_confirm.setObjectName("btn_confirm")
+        self.btn_cancel = QtWidgets.QPushButton(self.frame)
+        self.btn_cancel.setEnabled(True)
+        self.btn_cancel.setGeometry(QtCore.QRect(180, 150, 71, 31))
+        font = QtGui.QFont()
+        font.setFamily("CMU Sans Serif")
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        self.btn_cancel.setFont(font)
+        self.btn_cancel.setStyleSheet("background-color: #ff9580;\n"
+"color: #3d3d3d;")
+        self.btn_cancel.setDefault(False)
+        self.btn_cancel.setFlat(False)
+        self.btn_cancel.setObjectName("btn_cancel")
+        self.scrollArea = QtWidgets.QScrollArea(self.frame)
+        self.scrollArea.setGeometry(QtCore.QRect(20, 20, 321, 111))
+        self.scrollArea.setWidgetResizable(True)
+        self.scrollArea.setObjectName("scrollArea")
+        self.scrollAreaWidgetContents = QtWidgets.QWidget()
+        self.scrollAreaWidgetContents.setGeometry(QtCore.QRect(0, 0, 319, 109))
+        self.scrollAreaWidgetContents.setObjectName("scrollAreaWidgetContents")
+        self.verticalLayout = QtWidgets.QVBoxLayout(self.scrollAreaWidgetContents)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.label_confirm = QtWidgets.QLabel(self.scrollAreaWidgetContents)
+        self.label_confirm.setAlignment(QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft|QtCore.Qt.AlignTop)
+        self.label_confirm.setObjectName("label_confirm")
+        self.verticalLayout.addWidget(self.label_confirm)
+        self.scrollArea.setWidget(self.scrollAreaWidgetContents)
+
+        self.retranslateUi(Dialog)
+        QtCore.QMetaObject.connectSlotsByName(Dialog)
+
+    def retranslateUi(self, Dialog):
+        _translate = QtCore.QCoreApplication.translate
+        Dialog.setWindowTitle(_translate("Dialog", "Confirm changes"))
+        self.btn_confirm.setText(_translate("Dialog", "Confirm"))
+        self.btn_cancel.setText(_translate("Dialog", "Cancel"))
+        self.label_confirm.setText(_translate("Dialog", "TextLabel"))
+
+UI_SHA256 = 'aaa4282075d4d229eee8a77798d701d08a90957baadb3c801c43a180e7de20c9'
@@ -0,0 +1,691 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'src//res//interface.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_MainWindow(object):
+    def setupUi(self, MainWindow):
+        MainWindow.setObjectName("MainWindow")
+        MainWindow.resize(800, 600)
+        MainWindow.setMinimumSize(QtCore.QSize(800, 600))
+        MainWindow.setMaximumSize(QtCore.QSize(800, 600))
+        font = QtGui.QFont()
+        font.setFamily("CMU Sans Serif")
+        font.setBold(False)
+        font.setWeight(50)
+        MainWindow.setFont(font)
+        self.centralwidget = QtWidgets.QWidget(MainWindow)
+        self.centralwidget.setObjectName("centralwidget")
+        self.tab_widget = QtWidgets.QTabWidget(self.centralwidget)
+        self.tab_widget.setGeometry(QtCore.QRect(0, -30, 800, 641))
+        font = QtGui.QFont()
+        font.setFamily("CMU Sans Serif")
+        font.setPointSize(8)
+        font.setBold(False)
+        font.setWeight(50)
+        self.tab_widget.setFont(font)
+        self.tab_widget.setDocumentMode(False)
+        self.tab_widget.setTabsClosable(False)
+        self.tab_widget.setTabBarAutoHide(False)
+        self.tab_widget.setObjectName("tab_widget")
+        self.tab_entries = QtWidgets.QWidget()
+        self.tab_entries.setObjectName("tab_entries")
+        self.table_entries = QtWidgets.QTableView(self.tab_entries)
+        self.table_entries.setGeometry(QtCore.QRect(20, 40, 751, 501))
+        font = QtGui.QFont()
+        font.setFamily("Sans Serif")
+        font.setPointSize(9)
+        font.setBold(False)
+        font.setWeight(50)
+        self.table_entries.setFont(font)
+        self.table_entries.setAutoFillBackground(False)
+        self.table_entries.setStyleSheet("alternate-background-color: #e1e1e1;")
+        self.table_entries.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.table_entries.setFrameShadow(QtWidgets.QFrame.Plain)
+        self.table_entries.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.table_entries.setProperty("showDropIndicator", False)
+        self.table_entries.setDragDropOverwriteMode(False)
+        self.table_entries.setAlternatingRowColors(True)
+        self.table_entries.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
+        self.table_entries.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        self.table_entries.setShowGrid(False)
+        self.table_entries.setGridStyle(QtCore.Qt.SolidLine)
+        self.table_entries.setCornerButtonEnabled(False)
+        self.table_entries.setObjectName("table_entries")
+        self.table_entries.horizontalHeader().setVisible(True)
+        self.table_entries.horizontalHeader().setCascadingSectionResizes(False)
+        self.table_entries.horizontalHeader().setDefaultSectionSize(127)
+        self.table_entries.horizontalHeader().setHighlightSections(True)
+        self.table_entries.horizontalHeader().setMinimumSectionSize(19)
+        self.table_entries.horizontalHeader().setStretchLastSection(True)
+        self.table_entries.verticalHeader().setVisible(False)
+        self.table_entries.verticalHeader().setDefaultSectionSize(32)
+        self.table_entries.verticalHeader().setMinimumSectionSize(32)
+        self.table_entries.verticalHeader().setSortIndicatorShown(False)
+        self.table_entries.verticalHeader().setStretchLastSection(False)
+        self.label_15 = QtWidgets.QLabel(self.tab_entries)
+        self.label_15.setGeometry(QtCore.QRect(30, 10, 91, 31))
+        font = QtGui.QFont()
+        font.setFamily("CMU Sans Serif")
+        font.setPointSize(11)
+        font.setBold(True)
+        font.setWeight(75)
+        self.label_15.setFont(font)
+        self.label_15.setObjectName("label_15")
+        self.search_entries = QtWidgets.QLineEdit(self.tab_entries)
+        self.search_entries.setGeometry(QtCore.QRect(140, 12, 311, 25))
+        font = QtGui.QFont()
+        font.setFamily("Sans Serif")
+        font.setPointSize(9)
+        self.search_entries.setFont(font)
+        self.search_entries.setClearButtonEnabled(True)
+        self.search_entries.setObjectName("search_entries")
+        self.label_4 = QtWidgets.QLabel(self.tab_entries)
+        self.label_4.setGeometry(QtCore.QRect(680, 20, 91, 16))
+        font = QtGui.QFont()
+        font.setFamily("CMU Sans Serif")
+        font.setPointSize(8)
+        font.setBold(False)
+        font.setWeight(50)
+        self.label_4.setFont(font)
+        self.label_4.setStyleSheet("color: #8a8a8a;")
+        self.label_4.setAlignment(QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft|QtCore.Qt.AlignVCenter)
+        self.label_4.setWordWrap(True)
+        self.label_4.setObjectName("label_4")
+        self.tab_widget.addTab(self.tab_entries, "")
+        self.tab_edit_entries = QtWidgets.QWidget()
+        self.tab_edit_entries.setObjectName("tab_edit_entries")
+        self.frame = QtWidgets.QFrame(self.tab_edit_entries)
+        self.frame.setEnabled(True)
+        self.frame.setGeometry(QtCore.QRect(20, 40, 751, 501))
+        self.frame.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.frame.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame.setObjectName("frame")
+        self.view_notes = QtWidgets.QPlainTextEdit(self.frame)
+        self.view_notes.setEnabled(False)
+        self.view_notes.setGeometry(QtCore.QRect(290, 270, 441, 151))
+        font = QtGui.QFont()
+        font.setFamily("CMU Sans Serif")
+        font.setPointSize(9)
+        font.setBold(False)
+        font.setWeight(50)
+        self.view_notes.setFont(font)
+        self.view_notes.setStyleSheet(":disabled {\n"
+"    color: black;\n"
+"    padding: 0.5em;\n"
+"}\n"
+"\n"
+":enabled {\n"
+"    padding: 0.5em;\n"
+"}")
+        self.view_notes.setReadOnly(False)
+        self.view_notes.setPlainText("")
+        self.view_notes.setObjectName("view_notes")
+        self.label_6 = QtWidgets.QLabel(self.frame)
+        self.label_6.setGeometry(QtCore.QRect(300, 250, 221, 21))
+        font = QtGui.QFont()
+        font.setFamily("CMU Sans Serif")
+        font.setPointSize(9)
+        font.setBold(False)
+        font.setWeight(50)
+        self.label_6.setFont(font)
+        self.label_6.setObjectName("label_6")
+        self.btn_view_confirm = QtWidgets.QPushButton(self.frame)
+        self.btn_view_confirm.setEnabled(False)
+        self.btn_view_confirm.setGeometry(QtCore.QRect(620, 450, 111, 31))
+        font = QtGui.QFont()
+        font.setFamily("CMU Sans Serif")
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        self.btn_view_confirm.setFont(font)
+        self.btn_view_confirm.setStyleSheet("background-color: rgb(200, 200, 200);\n"
+"color: #3d3d3d;")
+        self.btn_view_confirm.setDefault(False)
+        self.btn_view_confirm.setFlat(False)
+        self.btn_view_confirm.setObjectName("btn_view_confirm")
+        self.label_7 = QtWidgets.QLabel(self.frame)
+        self.label_7.setGeometry(QtCore.QRect(300, 20, 221, 21))
+        font = QtGui.QFont()
+        font.setFamily("CMU Sans Serif")
+        font.setPointSize(9)
+        font.setBold(False)
+        font.setWeight(50)
+        self.label_7.setFont(font)
+        self.label_7.setObjectName("label_7")
+        self.table_revision = QtWidgets.QTableWidget(self.frame)
+        self.table_revision.setGeometry(QtCore.QRect(290, 40, 441, 191))
+        self.table_revision.setStyleSheet("alternate-background-color: #e1e1e1;")
+        self.table_revision.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.table_revision.setAlternatingRowColors(True)
+        self.table_revision.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
+        self.table_revision.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        self.table_revision.setRowCount(10)
+        self.table_revision.setObjectName("table_revision")
+        self.table_revision.setColumnCount(2)
+        item = QtWidgets.QTableWidgetItem()
+        self.table_revision.setHorizontalHeaderItem(0, item)
+        item = QtWidgets.QTableWidgetItem()
+        self.table_revision.setHorizontalHeaderItem(1, item)
+        self.table_revision.horizontalHeader().setDefaultSectionSize(186)
+        self.table_revision.horizontalHeader().setMinimumSectionSize(186)
+        self.table_revision.horizontalHeader().setStretchLastSection(True)
+        self.table_revision.verticalHeader().setDefaultSectionSize(22)
+        self.table_revision.verticalHeader().setStretchLastSection(False)
+        self.btn_view_remove = QtWidgets.QPushButton(self.frame)
+        self.btn_view_remove.setEnabled(False)
+        self.btn_view_remove.setGeometry(QtCore.QRect(500, 450, 111, 31))
+        font = QtGui.QFont()
+        font.setFamily("CMU Sans Serif")
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        self.btn_view_remove.setFont(font)
+        self.btn_view_remove.setStyleSheet("background-color: #ff9580;\n"
+"color: #3d3d3d;")
+        self.btn_view_remove.setDefault(False)
+        self.btn_view_remove.setFlat(False)
+        self.btn_view_remove.setObjectName("btn_view_remove")
+        self.list_project_users = QtWidgets.QListWidget(self.frame)
+        self.list_project_users.setEnabled(False)
+        self.list_project_users.setGeometry(QtCore.QRect(20, 180, 251, 241))
+        font = QtGui.QFont()
+        font.setFamily("CMU Sans Serif")
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        self.list_project_users.setFont(font)
+        self.list_project_users.setAutoFillBackground(False)
+        self.list_project_users.setStyleSheet(":disabled {\n"
+"    color: black;\n"
+"    padding: 0.2em;\n"
+"}\n"
+"\n"
+":enabled {\n"
+"    padding: 0.2em;\n"
+"}")
+        self.list_project_users.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.list_project_users.setObjectName("list_project_users")
+        self.btn_view_edit = QtWidgets.QPushButton(self.frame)
+        self.btn_view_edit.setEnabled(True)
+        self.btn_view_edit.setGeometry(QtCore.QRect(20, 450, 71, 31))
+        font = QtGui.QFont()
+        font.setFamily("CMU Sans Serif")
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        self.btn_view_edit.setFont(font)
+        self.btn_view_edit.setStyleSheet("background-color: rgb(200, 200, 200);\n"
+"color: #3d3d3d;")
+        self.btn_view_edit.setCheckable(True)
+        self.btn_view_edit.setDefault(False)
+        self.btn_view_edit.setFlat(False)
+        self.btn_view_edit.setObjectName("btn_view_edit")
+        self.label_8 = QtWidgets.QLabel(self.frame)
+        self.label_8.setGeometry(QtCore.QRect(30, 160, 221, 21))
+        font = QtGui.QFont()
+        font.setFamily("CMU Sans Serif")
+        font.setPointSize(9)
+        font.setBold(False)
+        font.setWeight(50)
+        self.label_8.setFont(font)
+        self.label_8.setObjectName("label_8")
+        self.view_urgency = QtWidgets.QLineEdit(self.frame)
+        self.view_urgency.setEnabled(False)
+        self.view_urgency.setGeometry(QtCore.QRect(20, 40, 241, 31))
+        font = QtGui.QFont()
+        font.setFamily("CMU Sans Serif")
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        self.view_urgency.setFont(font)
+        self.view_urgency.setStyleSheet(":disabled {\n"
+"    color: black;\n"
+"    padding-left: .5em;\n"
+"}\n"
+"\n"
+":enabled {\n"
+"    padding-left: .5em;\n"
+"}")
+        self.view_urgency.setText("")
+        self.view_urgency.setEchoMode(QtWidgets.QLineEdit.Normal)
+        self.view_urgency.setPlaceholderText("")
+        self.view_urgency.setObjectName("view_urgency")
+        self.label_16 = QtWidgets.QLabel(self.frame)
+        self.label_16.setGeometry(QtCore.QRect(30, 20, 221, 21))
+        font = QtGui.QFont()
+        font.setFamily("CMU Sans Serif")
+        font.setPointSize(9)
+        font.setBold(False)
+        font.setWeight(50)
+        self.label_16.setFont(font)
+        self.label_16.setObjectName("label_16")
+        self.label_17 = QtWidgets.QLabel(self.frame)
+        self.label_17.setGeometry(QtCore.QRect(30, 90, 221, 21))
+        font = QtGui.QFont()
+        font.setFamily("CMU Sans Serif")
+        font.setPointSize(9)
+        font.setBold(False)
+        font.setWeight(50)
+        self.label_17.setFont(font)
+        self.label_17.setObjectName("label_17")
+        self.btn_view_modify_users = QtWidgets.QPushButton(self.frame)
+        self.btn_view_modify_users.setEnabled(False)
+        self.btn_view_modify_users.setGeometry(QtCore.QRect(110, 450, 141, 31))
+        font = QtGui.QFont()
+        font.setFamily("CMU Sans Serif")
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        self.btn_view_modify_users.setFont(font)
+        self.btn_view_modify_users.setStyleSheet("background-color: rgb(200, 200, 200);\n"
+"color: #3d3d3d;")
+        self.btn_view_modify_users.setCheckable(False)
+        self.btn_view_modify_users.setDefault(False)
+        self.btn_view_modify_users.setFlat(False)
+        self.btn_view_modify_users.setObjectName("btn_view_modify_users")
+        self.view_deadline = QtWidgets.QDateEdit(self.frame)
+        self.view_deadline.setEnabled(False)
+        self.view_deadline.setGeometry(QtCore.QRect(20, 110, 241, 31))
+        self.view_deadline.setStyleSheet(":disabled {\n"
+"    color: black;\n"
+"    padding-left: .5em;\n"
+"}\n"
+"\n"
+":enabled {\n"
+"    padding-left: .5em;\n"
+"}")
+        self.view_deadline.setAccelerated(True)
+        self.view_deadline.setCalendarPopup(True)
+        self.view_deadline.setObjectName("view_deadline")
+        self.label_11 = QtWidgets.QLabel(self.tab_edit_entries)
+        self.label_11.setGeometry(QtCore.QRect(30, 10, 191, 31))
+        font = QtGui.QFont()
+        font.setFamily("CMU Sans Serif")
+        font.setPointSize(11)
+        font.setBold(True)
+        font.setWeight(75)
+        self.label_11.setFont(font)
+        self.label_11.setObjectName("label_11")
+        self.label_3 = QtWidgets.QLabel(self.tab_edit_entries)
+        self.label_3.setGeometry(QtCore.QRect(680, 20, 91, 16))
+        font = QtGui.QFont()
+        font.setFamily("CMU Sans Serif")
+        font.setPointSize(8)
+        font.setBold(False)
+        font.setWeight(50)
+        self.label_3.setFont(font)
+        self.label_3.setStyleSheet("color: #8a8a8a;")
+        self.label_3.setAlignment(QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft|QtCore.Qt.AlignVCenter)
+        self.label_3.setWordWrap(True)
+        self.label_3.setObjectName("label_3")
+        self.tab_widget.addTab(self.tab_edit_entries, "")
+        self.tab_create_entry = QtWidgets.QWidget()
+        self.tab_create_entry.setObjectName("tab_create_entry")
+        self.frame_3 = QtWidgets.QFrame(self.tab_create_entry)
+        self.frame_3.setGeometry(QtCore.QRect(20, 40, 751, 501))
+        self.frame_3.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.frame_3.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame_3.setObjectName("frame_3")
+        self.create_urgency = QtWidgets.QLineEdit(self.frame_3)
+        self.create_urgency.setGeometry(QtCore.QRect(20, 450, 221, 31))
+        font = QtGui.QFont()
+        font.setFamily("CMU Sans Serif")
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        self.create_urgency.setFont(font)
+        self.create_urgency.setStyleSheet("padding-left: .5em;")
+        self.create_urgency.setReadOnly(False)
+        self.create_urgency.setObjectName("create_urgency")
+        self.create_notes = QtWidgets.QPlainTextEdit(self.frame_3)
+        self.create_notes.setGeometry(QtCore.QRect(20, 20, 461, 391))
+        font = QtGui.QFont()
+        font.setFamily("CMU Sans Serif")
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        self.create_notes.setFont(font)
+        self.create_notes.setStyleSheet("padding: .5em;")
+        self.create_notes.setReadOnly(False)
+        self.create_notes.setObjectName("create_notes")
+        self.btn_create_entry = QtWidgets.QPushButton(self.frame_3)
+        self.btn_create_entry.setEnabled(True)
+        self.btn_create_entry.setGeometry(QtCore.QRect(610, 450, 121, 31))
+        font = QtGui.QFont()
+        font.setFamily("CMU Sans Serif")
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        self.btn_create_entry.setFont(font)
+        self.btn_create_entry.setStyleSheet("background-color: rgb(200, 200, 200);\n"
+"color: #3d3d3d;")
+        self.btn_create_entry.setDefault(False)
+        self.btn_create_entry.setFlat(False)
+        self.btn_create_entry.setObjectName("btn_create_entry")
+        self.create_project_users = QtWidgets.QListWidget(self.frame_3)
+        self.create_project_users.setEnabled(True)
+        self.create_project_users.setGeometry(QtCore.QRect(490, 30, 241, 381))
+        self.create_project_users.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.create_project_users.setSelectionMode(QtWidgets.QAbstractItemView.MultiSelection)
+        self.create_project_users.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectItems)
+        self.create_project_users.setObjectName("create_project_users")
+        self.label_18 = QtWidgets.QLabel(self.frame_3)
+        self.label_18.setGeometry(QtCore.QRect(500, 10, 221, 21))
+        font = QtGui.QFont()
+        font.setFamily("CMU Sans Serif")
+        font.setPointSize(9)
+        font.setBold(False)
+        font.setWeight(50)
+        self.label_18.setFont(font)
+        self.label_18.setObjectName("label_18")
+        self.create_deadline = QtWidgets.QDateEdit(self.frame_3)
+        self.create_deadline.setGeometry(QtCore.QRect(260, 450, 221, 31))
+        self.create_deadline.setAccelerated(True)
+        self.create_deadline.setCalendarPopup(True)
+        self.create_deadline.setObjectName("create_deadline")
+        self.label_21 = QtWidgets.QLabel(self.frame_3)
+        self.label_21.setGeometry(QtCore.QRect(260, 430, 51, 21))
+        font = QtGui.QFont()
+        font.setFamily("CMU Sans Serif")
+        font.setPointSize(9)
+        font.setBold(False)
+        font.setWeight(50)
+        self.label_21.setFont(font)
+        self.label_21.setObjectName("label_21")
+        self.label_22 = QtWidgets.QLabel(self.frame_3)
+        self.label_22.setGeometry(QtCore.QRect(20, 430, 51, 21))
+        font = QtGui.QFont()
+        font.setFamily("CMU Sans Serif")
+        font.setPointSize(9)
+        font.setBold(False)
+        font.setWeight(50)
+        self.label_22.setFont(font)
+        self.label_22.setObjectName("label_22")
+        self.label_12 = QtWidgets.QLabel(self.tab_create_entry)
+        self.label_12.setGeometry(QtCore.QRect(30, 10, 181, 31))
+        font = QtGui.QFont()
+        font.setFamily("CMU Sans Serif")
+        font.setPointSize(11)
+        font.setBold(True)
+        font.setWeight(75)
+        self.label_12.setFont(font)
+        self.label_12.setObjectName("label_12")
+        self.label_5 = QtWidgets.QLabel(self.tab_create_entry)
+        self.label_5.setGeometry(QtCore.QRect(680, 20, 91, 16))
+        font = QtGui.QFont()
+        font.setFamily("CMU Sans Serif")
+        font.setPointSize(8)
+        font.setBold(False)
+        font.setWeight(50)
+        self.label_5.setFont(font)
+        self.label_5.setStyleSheet("color: #8a8a8a;")
+        self.label_5.setAlignment(QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft|QtCore.Qt.AlignVCenter)
+        self.label_5.setWordWrap(True)
+        self.label_5.setObjectName("label_5")
+        self.tab_widget.addTab(self.tab_create_entry, "")
+        self.tab_preferences = QtWidgets.QWidget()
+        self.tab_preferences.setObjectName("tab_preferences")
+        self.frame_2 = QtWidgets.QFrame(self.tab_preferences)
+        self.frame_2.setGeometry(QtCore.QRect(20, 40, 751, 501))
+        self.frame_2.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.frame_2.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame_2.setObjectName("frame_2")
+        self.pref_name = QtWidgets.QLineEdit(self.frame_2)
+        self.pref_name.setGeometry(QtCore.QRect(320, 80, 411, 31))
+        font = QtGui.QFont()
+        font.setFamily("CMU Sans Serif")
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        self.pref_name.setFont(font)
+        self.pref_name.setStyleSheet("padding-left: .5em;")
+        self.pref_name.setObjectName("pref_name")
+        self.label_9 = QtWidgets.QLabel(self.frame_2)
+        self.label_9.setGeometry(QtCore.QRect(30, 80, 271, 31))
+        font = QtGui.QFont()
+        font.setFamily("CMU Sans Serif")
+        font.setPointSize(9)
+        font.setBold(False)
+        font.setWeight(50)
+        self.label_9.setFont(font)
+        self.label_9.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
+        self.label_9.setWordWrap(True)
+        self.label_9.setObjectName("label_9")
+        self.btn_update_pref = QtWidgets.QPushButton(self.frame_2)
+        self.btn_update_pref.setEnabled(True)
+        self.btn_update_pref.setGeometry(QtCore.QRect(610, 450, 121, 31))
+        font = QtGui.QFont()
+        font.setFamily("CMU Sans Serif")
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        self.btn_update_pref.setFont(font)
+        self.btn_update_pref.setStyleSheet("background-color: rgb(200, 200, 200);\n"
+"color: #3d3d3d;")
+        self.btn_update_pref.setDefault(False)
+        self.btn_update_pref.setFlat(False)
+        self.btn_update_pref.setObjectName("btn_update_pref")
+        self.label_23 = QtWidgets.QLabel(self.frame_2)
+        self.label_23.setGeometry(QtCore.QRect(30, 30, 271, 31))
+        font = QtGui.QFont()
+        font.setFamily("CMU Sans Serif")
+        font.setPointSize(9)
+        font.setBold(False)
+        font.setWeight(50)
+        self.label_23.setFont(font)
+        self.label_23.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
+        self.label_23.setWordWrap(True)
+        self.label_23.setObjectName("label_23")
+        self.pref_username = QtWidgets.QLineEdit(self.frame_2)
+        self.pref_username.setEnabled(False)
+        self.pref_username.setGeometry(QtCore.QRect(320, 30, 411, 31))
+        font = QtGui.QFont()
+        font.setFamily("CMU Sans Serif")
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        self.pref_username.setFont(font)
+        self.pref_username.setStyleSheet("padding-left: .5em;")
+        self.pref_username.setText("")
+        self.pref_username.setObjectName("pref_username")
+        self.label_13 = QtWidgets.QLabel(self.tab_preferences)
+        self.label_13.setGeometry(QtCore.QRect(30, 10, 191, 31))
+        font = QtGui.QFont()
+        font.setFamily("CMU Sans Serif")
+        font.setPointSize(11)
+        font.setBold(True)
+        font.setWeight(75)
+        self.label_13.setFont(font)
+        self.label_13.setObjectName("label_13")
+        self.label_19 = QtWidgets.QLabel(self.tab_preferences)
+        self.label_19.setGeometry(QtCore.QRect(680, 20, 91, 16))
+        font = QtGui.QFont()
+        font.setFamily("CMU Sans Serif")
+        font.setPointSize(8)
+        font.setBold(False)
+        font.setWeight(50)
+        self.label_19.setFont(font)
+        self.label_19.setStyleSheet("color: #8a8a8a;")
+        self.label_19.setAlignment(QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft|QtCore.Qt.AlignVCenter)
+        self.label_19.setWordWrap(True)
+        self.label_19.setObjectName("label_19")
+        self.tab_widget.addTab(self.tab_preferences, "")
+        self.tab_error_log = QtWidgets.QWidget()
+        self.tab_error_log.setObjectName("tab_error_log")
+        self.frame_4 = QtWidgets.QFrame(self.tab_error_log)
+        self.frame_4.setGeometry(QtCore.QRect(20, 40, 751, 501))
+        self.frame_4.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.frame_4.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame_4.setObjectName("frame_4")
+        self.list_logs = QtWidgets.QListWidget(self.frame_4)
+        self.list_logs.setGeometry(QtCore.QRect(20, 20, 711, 401))
+        self.list_logs.setStyleSheet("padding: .5em;")
+        self.list_logs.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.list_logs.setDefaultDropAction(QtCore.Qt.IgnoreAction)
+        self.list_logs.setAlternatingRowColors(True)
+        self.list_logs.setLayoutMode(QtWidgets.QListView.SinglePass)
+        self.list_logs.setGridSize(QtCore.QSize(0, 24))
+        self.list_logs.setModelColumn(0)
+        self.list_logs.setUniformItemSizes(False)
+        self.list_logs.setObjectName("list_logs")
+        self.btn_clear_logs = QtWidgets.QPushButton(self.frame_4)
+        self.btn_clear_logs.setEnabled(True)
+        self.btn_clear_logs.setGeometry(QtCore.QRect(610, 450, 121, 31))
+        font = QtGui.QFont()
+        font.setFamily("CMU Sans Serif")
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        self.btn_clear_logs.setFont(font)
+        self.btn_clear_logs.setStyleSheet("background-color: rgb(200, 200, 200);\n"
+"color: #3d3d3d;")
+        self.btn_clear_logs.setDefault(False)
+        self.btn_clear_logs.setFlat(False)
+        self.btn_clear_logs.setObjectName("btn_clear_logs")
+        self.label_14 = QtWidgets.QLabel(self.tab_error_log)
+        self.label_14.setGeometry(QtCore.QRect(40, 10, 191, 31))
+        font = QtGui.QFont()
+        font.setFamily("CMU Sans Serif")
+        font.setPointSize(11)
+        font.setBold(True)
+        font.setWeight(75)
+        self.label_14.setFont(font)
+        self.label_14.setObjectName("label_14")
+        self.label_20 = QtWidgets.QLabel(self.tab_error_log)
+        self.label_20.setGeometry(QtCore.QRect(680, 20, 91, 16))
+        font = QtGui.QFont()
+        font.setFamily("CMU Sans Serif")
+        font.setPointSize(8)
+        font.setBold(False)
+        font.setWeight(50)
+        self.label_20.setFont(font)
+        self.label_20.setStyleSheet("color: #8a8a8a;")
+        self.label_20.setAlignment(QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft|QtCore.Qt.AlignVCenter)
+        self.label_20.setWordWrap(True)
+        self.label_20.setObjectName("label_20")
+        self.tab_widget.addTab(self.tab_error_log, "")
+        MainWindow.setCentralWidget(self.centralwidget)
+        self.status_bar = QtWidgets.QStatusBar(MainWindow)
+        font = QtGui.QFont()
+        font.setFamily("CMU Sans Serif")
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        self.status_bar.setFont(font)
+        self.status_bar.setSizeGripEnabled(False)
+        self.status_bar.setObjectName("status_bar")
+        MainWindow.setStatusBar(self.status_bar)
+        self.menuBar = QtWidgets.QMenuBar(MainWindow)
+        self.menuBar.setGeometry(QtCore.QRect(0, 0, 800, 27))
+        font = QtGui.QFont()
+        font.setFamily("CMU Sans Serif")
+        font.setBold(False)
+        font.setWeight(50)
+        self.menuBar.setFont(font)
+        self.menuBar.setStyleSheet("padding-left: .2em; padding-top: .2em; border-bottom: 0; background-color:  #e1e1e1")
+        self.menuBar.setDefaultUp(False)
+        self.menuBar.setObjectName("menuBar")
+        self.menuAbout = QtWidgets.QMenu(self.menuBar)
+        self.menuAbout.setObjectName("menuAbout")
+        self.menuEdit = QtWidgets.QMenu(self.menuBar)
+        self.menuEdit.setObjectName("menuEdit")
+        self.menuView = QtWidgets.QMenu(self.menuBar)
+        self.menuView.setObjectName("menuView")
+        MainWindow.setMenuBar(self.menuBar)
+        self.action_help = QtWidgets.QAction(MainWindow)
+        self.action_help.setObjectName("action_help")
+        self.action_create_entry = QtWidgets.QAction(MainWindow)
+        self.action_create_entry.setObjectName("action_create_entry")
+        self.action_preferences = QtWidgets.QAction(MainWindow)
+        self.action_preferences.setObjectName("action_preferences")
+        self.action_logs = QtWidgets.QAction(MainWindow)
+        self.action_logs.setObjectName("action_logs")
+        self.action_entries = QtWidgets.QAction(MainWindow)
+        self.action_entries.setObjectName("action_entries")
+        self.action_logout = QtWidgets.QAction(MainWindow)
+        self.action_logout.setObjectName("action_logout")
+        self.action_refresh = QtWidgets.QAction(MainWindow)
+        self.action_refresh.setObjectName("action_refresh")
+        self.menuAbout.addAction(self.action_help)
+        self.menuAbout.addAction(self.action_logout)
+        self.menuEdit.addAction(self.action_create_entry)
+        self.menuEdit.addAction(self.action_preferences)
+        self.menuEdit.addAction(self.action_refresh)
+        self.menuView.addAction(self.action_entries)
+        self.menuView.addAction(self.action_logs)
+        self.menuBar.addAction(self.menuEdit.menuAction())
+        self.menuBar.addAction(self.menuView.menuAction())
+        self.menuBar.addAction(self.menuAbout.menuAction())
+
+        self.retranslateUi(MainWindow)
+        self.tab_widget.setCurrentIndex(0)
+        self.list_logs.setCurrentRow(-1)
+        QtCore.QMetaObject.connectSlotsByName(MainWindow)
+
+    def retranslateUi(self, MainWindow):
+        _translate = QtCore.QCoreApplication.translate
+        MainWindow.setWindowTitle(_translate("MainWindow", "Project Management Interface"))
+        self.label_15.setText(_translate("MainWindow", "View Entries"))
+        self.search_entries.setPlaceholderText(_translate("MainWindow", "Search notes..."))
+        self.label_4.setText(_translate("MainWindow", "© 2024 Yusuf A."))
+        self.tab_widget.setTabText(self.tab_widget.indexOf(self.tab_entries), _translate("MainWindow", "View"))
+        self.label_6.setText(_translate("MainWindow", "Notes"))
+        self.btn_view_confirm.setText(_translate("MainWindow", "Confirm changes"))
+        self.label_7.setText(_translate("MainWindow", "Change history"))
+        item = self.table_revision.horizontalHeaderItem(0)
+        item.setText(_translate("MainWindow", "Date modified"))
+        item = self.table_revision.horizontalHeaderItem(1)
+        item.setText(_translate("MainWindow", "Author"))
+        self.btn_view_remove.setText(_translate("MainWindow", "Remove entry"))
+        self.btn_view_edit.setText(_translate("MainWindow", "Edit"))
+        self.label_8.setText(_translate("MainWindow", "Project users"))
+        self.label_16.setText(_translate("MainWindow", "Urgency"))
+        self.label_17.setText(_translate("MainWindow", "Deadline"))
+        self.btn_view_modify_users.setText(_translate("MainWindow", "Modify project users"))
+        self.view_deadline.setDisplayFormat(_translate("MainWindow", "dd MMM yyyy"))
+        self.label_11.setText(_translate("MainWindow", "View/Edit Entry"))
+        self.label_3.setText(_translate("MainWindow", "© 2024 Yusuf A."))
+        self.tab_widget.setTabText(self.tab_widget.indexOf(self.tab_edit_entries), _translate("MainWindow", "View Entry"))
+        self.create_urgency.setPlaceholderText(_translate("MainWindow", "Urgency"))
+        self.create_notes.setPlaceholderText(_translate("MainWindow", "Notes"))
+        self.btn_create_entry.setText(_translate("MainWindow", "Create entry"))
+        self.label_18.setText(_translate("MainWindow", "Allowed project users"))
+        self.create_deadline.setDisplayFormat(_translate("MainWindow", "dd MMM yyyy"))
+        self.label_21.setText(_translate("MainWindow", "Deadline"))
+        self.label_22.setText(_translate("MainWindow", "Urgency"))
+        self.label_12.setText(_translate("MainWindow", "Create Entry"))
+        self.label_5.setText(_translate("MainWindow", "© 2024 Yusuf A."))
+        self.tab_widget.setTabText(self.tab_widget.indexOf(self.tab_create_entry), _translate("MainWindow", "Create Entry"))
+        self.pref_name.setPlaceholderText(_translate("MainWindow", "Name"))
+        self.label_9.setText(_translate("MainWindow", "This name will be referenced in any revisions that you make, otherwise they will use your username."))
+        self.btn_update_pref.setText(_translate("MainWindow", "Update preferences"))
+        self.label_23.setText(_translate("MainWindow", "Logged in as"))
+        self.pref_username.setPlaceholderText(_translate("MainWindow", "Username"))
+        self.label_13.setText(_translate("MainWindow", "Preferences"))
+        self.label_19.setText(_translate("MainWindow", "© 2024 Yusuf A."))
+        self.tab_widget.setTabText(self.tab_widget.indexOf(self.tab_preferences), _translate("MainWindow", "Preferences"))
+        self.btn_clear_logs.setText(_translate("MainWindow", "Clear logs"))
+        self.label_14.setText(_translate("MainWindow", "Application logs"))
+        self.label_20.setText(_translate("MainWindow", "© 2024 Yusuf A."))
+        self.tab_widget.setTabText(self.tab_widget.indexOf(self.tab_error_log), _translate("MainWindow", "Errors"))
+        self.menuAbout.setTitle(_translate("MainWindow", "About"))
+        self.menuEdit.setTitle(_translate("MainWindow", "Edit"))
+        self.menuView.setTitle(_translate("MainWindow", "View"))
+        self.action_help.setText(_translate("MainWindow", "Help"))
+        self.action_create_entry.setText(_translate("MainWindow", "Create new entry"))
+        self.action_preferences.setText(_translate("MainWindow", "Preferences"))
+        self.action_logs.setText(_translate("MainWindow", "Logs"))
+        self.action_entries.setText(_translate("MainWindow", "Entries"))
+        self.action_logout.setText(_translate("MainWindow", "Log out"))
+        self.action_refresh.setText(_translate("MainWindow", "Refresh"))
+
+UI_SHA256 = 'afeba0a777194cf3155da6d38670c65c30b8422fae186c742249541f0bd7d7c9'
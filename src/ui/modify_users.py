@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'src//res//modify_users.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_Form(object):
+    def setupUi(self, Form):
+        Form.setObjectName("Form")
+        Form.resize(552, 530)
+        Form.setMinimumSize(QtCore.QSize(552, 530))
+        Form.setMaximumSize(QtCore.QSize(552, 530))
+        self.frame = QtWidgets.QFrame(Form)
+        self.frame.setGeometry(QtCore.QRect(20, 20, 511, 491))
+        self.frame.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.frame.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame.setObjectName("frame")
+        self.filter_allowed = QtWidgets.QLineEdit(self.frame)
+        self.filter_allowed.setGeometry(QtCore.QRect(20, 30, 201, 25))
+        self.filter_allowed.setClearButtonEnabled(True)
+        self.filter_allowed.setObjectName("filter_allowed")
+        self.list_allowed = QtWidgets.QListView(self.frame)
+        self.list_allowed.setGeometry(QtCore.QRect(20, 60, 201, 361))
+        font = QtGui.QFont()
+        font.setFamily("CMU Sans Serif")
+        font.setBold(False)
+        font.setWeight(50)
+        self.list_allowed.setFont(font)
+        self.list_allowed.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.list_allowed.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
+        self.list_allowed.setUniformItemSizes(True)
+        self.list_allowed.setObjectName("list_allowed")
+        self.filter_all = QtWidgets.QLineEdit(self.frame)
+        self.filter_all.setGeometry(QtCore.QRect(290, 30, 201, 25))
+        self.filter_all.setClearButtonEnabled(True)
+        self.filter_all.setObjectName("filter_all")
+        self.list_all = QtWidgets.QListView(self.frame)
+        self.list_all.setGeometry(QtCore.QRect(290, 60, 201, 361))
+        font = QtGui.QFont()
+        font.setFamily("CMU Sans Serif")
+        self.list_all.setFont(font)
+        self.list_all.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.list_all.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
+        self.list_all.setUniformItemSizes(True)
+        self.list_all.setObjectName("list_all")
+        self.btn_remove = QtWidgets.QPushButton(self.frame)
+        self.btn_remove.setEnabled(True)
+        self.btn_remove.setGeometry(QtCore.QRect(240, 230, 31, 31))
+        font = QtGui.QFont()
+        font.setFamily("CMU Sans Serif")
+        font.setPointSize(7)
+        font.setBold(True)
+        font.setWeight(75)
+        self.btn_remove.setFont(font)
+        self.btn_remove.setStyleSheet("background-color: rgb(200, 200, 200);\n"
+"color: #3d3d3d;")
+        self.btn_remove.setDefault(False)
+        self.btn_remove.setFlat(False)
+        self.btn_remove.setObjectName("btn_remove")
+        self.btn_add = QtWidgets.QPushButton(self.frame)
+        self.btn_add.setEnabled(True)
+        self.btn_add.setGeometry(QtCore.QRect(240, 190, 31, 31))
+        font = QtGui.QFont()
+        font.setFamily("CMU Sans Serif")
+        font.setPointSize(7)
+        font.setBold(True)
+        font.setWeight(75)
+        self.btn_add.setFont(font)
+        self.btn_add.setStyleSheet("background-color: rgb(200, 200, 200);\n"
+"color: #3d3d3d;")
+        self.btn_add.setDefault(False)
+        self.btn_add.setFlat(False)
+        self.btn_add.setObjectName("btn_add")
+        self.label_18 = QtWidgets.QLabel(self.frame)
+        self.label_18.setGeometry(QtCore.QRect(20, 10, 221, 21))
+        font = QtGui.QFont()
+        font.setFamily("CMU Sans Serif")
+        font.setPointSize(9)
+        font.setBold(False)
+        font.setWeight(50)
+        self.label_18.setFont(font)
+        self.label_18.setObjectName("label_18")
+        self.label_19 = QtWidgets.QLabel(self.frame)
+        self.label_19.setGeometry(QtCore.QRect(290, 10, 171, 21))
+        font = QtGui.QFont()
+        font.setFamily("CMU Sans Serif")
+        font.setPointSize(9)
+        font.setBold(False)
+        font.setWeight(50)
+        self.label_19.setFont(font)
+        self.label_19.setObjectName("label_19")
+        self.btn_confirm = QtWidgets.QPushButton(self.frame)
+        self.btn_confirm.setEnabled(True)
+        self.btn_confirm.setGeometry(QtCore.QRect(420, 440, 71, 31))
+        font = QtGui.QFont()
+        font.setFamily("CMU Sans Serif")
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        self.btn_confirm.setFont(font)
+        self.btn_confirm.setStyleSheet("background-color: rgb(200, 200, 200);\n"
+"color: #3d3d3d;")
+        self.btn_confirm.setDefault(False)
+        self.btn_confirm.setFlat(False)
+        self.btn_confirm.setObjectName("btn_confirm")
+        self.btn_cancel = QtWidgets.QPushButton(self.frame)
+        self.btn_cancel.setEnabled(True)
+        self.btn_cancel.setGeometry(QtCore.QRect(340, 440, 71, 31))
+        font = QtGui.QFont()
+        font.setFamily("CMU Sans Serif")
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        self.btn_cancel.setFont(font)
+        self.btn_cancel.setStyleSheet("background-color: #ff9580;\n"
+"color: #3d3d3d;")
+        self.btn_cancel.setDefault(False)
+        self.btn_cancel.setFlat(False)
+        self.btn_cancel.setObjectName("btn_cancel")
+        self.label_3 = QtWidgets.QLabel(self.frame)
+        self.label_3.setGeometry(QtCore.QRect(20, 456, 111, 20))
+        font = QtGui.QFont()
+        font.setFamily("CMU Sans Serif")
+        font.setBold(False)
+        font.setWeight(50)
+        self.label_3.setFont(font)
+        self.label_3.setStyleSheet("color: #8a8a8a;")
+        self.label_3.setAlignment(QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft|QtCore.Qt.AlignTop)
+        self.label_3.setWordWrap(True)
+        self.label_3.setObjectName("label_3")
+
+        self.retranslateUi(Form)
+        QtCore.QMetaObject.connectSlotsByName(Form)
+
+    def retranslateUi(self, Form):
+        _translate = QtCore.QCoreApplication.translate
+        Form.setWindowTitle(_translate("Form", "Change project users"))
+        self.filter_allowed.setPlaceholderText(_translate("Form", "Filter..."))
+        self.filter_all.setPlaceholderText(_translate("Form", "Filter..."))
+        self.btn_remove.setText(_translate("Form", ">>"))
+        self.btn_add.setText(_translate("Form", "<<"))
+        self.label_18.setText(_translate("Form", "Allowed project users"))
+        self.label_19.setText(_translate("Form", "Global user list"))
+        self.btn_confirm.setText(_translate("Form", "Confirm"))
+        self.btn_cancel.setText(_translate("Form", "Cancel"))
+        self.label_3.setText(_translate("Form", "© 2024 Yusuf A."))
+
+UI_SHA256 = '201c8d3dd90257632200a927c9f772116ec51a30f8b8ff9b648c64f7a0501576'
@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'src//res//start.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_MainWindow(object):
+    def setupUi(self, MainWindow):
+        MainWindow.setObjectName("MainWindow")
+        MainWindow.resize(400, 301)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(MainWindow.sizePolicy().hasHeightForWidth())
+        MainWindow.setSizePolicy(sizePolicy)
+        MainWindow.setMinimumSize(QtCore.QSize(400, 301))
+        MainWindow.setMaximumSize(QtCore.QSize(400, 301))
+        font = QtGui.QFont()
+        font.setPointSize(7)
+        MainWindow.setFont(font)
+        MainWindow.setStyleSheet("")
+        self.centralwidget = QtWidgets.QWidget(MainWindow)
+        self.centralwidget.setStyleSheet("")
+        self.centralwidget.setObjectName("centralwidget")
+        self.tabWidget = QtWidgets.QTabWidget(self.centralwidget)
+        self.tabWidget.setGeometry(QtCore.QRect(0, 0, 400, 281))
+        font = QtGui.QFont()
+        font.setFamily("CMU Sans Serif")
+        font.setPointSize(8)
+        self.tabWidget.setFont(font)
+        self.tabWidget.setObjectName("tabWidget")
+        self.tab = QtWidgets.QWidget()
+        self.tab.setObjectName("tab")
+        self.login_username = QtWidgets.QLineEdit(self.tab)
+        self.login_username.setGeometry(QtCore.QRect(90, 100, 221, 31))
+        font = QtGui.QFont()
+        font.setFamily("CMU Sans Serif")
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        self.login_username.setFont(font)
+        self.login_username.setStyleSheet("padding-left: .5em;")
+        self.login_username.setObjectName("login_username")
+        self.login_password = QtWidgets.QLineEdit(self.tab)
+        self.login_password.setGeometry(QtCore.QRect(90, 140, 221, 31))
+        font = QtGui.QFont()
+        font.setFamily("CMU Sans Serif")
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        self.login_password.setFont(font)
+        self.login_password.setStyleSheet("padding-left: .5em;")
+        self.login_password.setEchoMode(QtWidgets.QLineEdit.Password)
+        self.login_password.setObjectName("login_password")
+        self.btn_login = QtWidgets.QPushButton(self.tab)
+        self.btn_login.setGeometry(QtCore.QRect(220, 190, 91, 31))
+        font = QtGui.QFont()
+        font.setFamily("CMU Sans Serif")
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        self.btn_login.setFont(font)
+        self.btn_login.setStyleSheet("background-color: rgb(200, 200, 200);\n"
+"color: #3d3d3d;")
+        self.btn_login.setDefault(False)
+        self.btn_login.setFlat(False)
+        self.btn_login.setObjectName("btn_login")
+        self.label = QtWidgets.QLabel(self.tab)
+        self.label.setGeometry(QtCore.QRect(10, 20, 381, 41))
+        font = QtGui.QFont()
+        font.setFamily("CMU Sans Serif")
+        font.setPointSize(16)
+        font.setBold(False)
+        font.setWeight(50)
+        self.label.setFont(font)
+        self.label.setTextFormat(QtCore.Qt.PlainText)
+        self.label.setAlignment(QtCore.Qt.AlignCenter)
+        self.label.setObjectName("label")
+        self.label_2 = QtWidgets.QLabel(self.tab)
+        self.label_2.setGeometry(QtCore.QRect(10, 50, 381, 31))
+        font = QtGui.QFont()
+        font.setFamily("CMU Sans Serif")
+        font.setPointSize(12)
+        font.setBold(False)
+        font.setWeight(50)
+        self.label_2.setFont(font)
+        self.label_2.setTextFormat(QtCore.Qt.PlainText)
+        self.label_2.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_2.setObjectName("label_2")
+        self.cb_remember_me = QtWidgets.QCheckBox(self.tab)
+        self.cb_remember_me.setGeometry(QtCore.QRect(90, 180, 101, 41))
+        font = QtGui.QFont()
+        font.setFamily("CMU Sans Serif")
+        font.setPointSize(9)
+        self.cb_remember_me.setFont(font)
+        self.cb_remember_me.setObjectName("cb_remember_me")
+        self.tabWidget.addTab(self.tab, "")
+        self.tab_2 = QtWidgets.QWidget()
+        self.tab_2.setObjectName("tab_2")
+        self.label_3 = QtWidgets.QLabel(self.tab_2)
+        self.label_3.setGeometry(QtCore.QRect(0, 20, 401, 41))
+        font = QtGui.QFont()
+        font.setFamily("CMU Sans Serif")
+        font.setPointSize(16)
+        font.setBold(False)
+        font.setWeight(50)
+        self.label_3.setFont(font)
+        self.label_3.setTextFormat(QtCore.Qt.PlainText)
+        self.label_3.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_3.setObjectName("label_3")
+        self.label_4 = QtWidgets.QLabel(self.tab_2)
+        self.label_4.setGeometry(QtCore.QRect(10, 50, 381, 31))
+        font = QtGui.QFont()
+        font.setFamily("CMU Sans Serif")
+        font.setPointSize(12)
+        font.setBold(False)
+        font.setWeight(50)
+        self.label_4.setFont(font)
+        self.label_4.setTextFormat(QtCore.Qt.PlainText)
+        self.label_4.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_4.setObjectName("label_4")
+        self.reg_username = QtWidgets.QLineEdit(self.tab_2)
+        self.reg_username.setGeometry(QtCore.QRect(90, 90, 221, 31))
+        font = QtGui.QFont()
+        font.setFamily("CMU Sans Serif")
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        self.reg_username.setFont(font)
+        self.reg_username.setStyleSheet("padding-left: .5em;")
+        self.reg_username.setObjectName("reg_username")
+        self.reg_password = QtWidgets.QLineEdit(self.tab_2)
+        self.reg_password.setGeometry(QtCore.QRect(90, 130, 221, 31))
+        font = QtGui.QFont()
+        font.setFamily("CMU Sans Serif")
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        self.reg_password.setFont(font)
+        self.reg_password.setStyleSheet("padding-left: .5em;")
+        self.reg_password.setText("")
+        self.reg_password.setEchoMode(QtWidgets.QLineEdit.Password)
+        self.reg_password.setObjectName("reg_password")
+        self.reg_verify = QtWidgets.QLineEdit(self.tab_2)
+        self.reg_verify.setGeometry(QtCore.QRect(90, 170, 221, 31))
+        font = QtGui.QFont()
+        font.setFamily("CMU Sans Serif")
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        self.reg_verify.setFont(font)
+        self.reg_verify.setStyleSheet("padding-left: .5em;")
+        self.reg_verify.setText("")
+        self.reg_verify.setEchoMode(QtWidgets.QLineEdit.Password)
+        self.reg_verify.setObjectName("reg_verify")
+        self.btn_register = QtWidgets.QPushButton(self.tab_2)
+        self.btn_register.setGeometry(QtCore.QRect(220, 220, 91, 31))
+        font = QtGui.QFont()
+        font.setFamily("CMU Sans Serif")
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        self.btn_register.setFont(font)
+        self.btn_register.setStyleSheet("background-color: rgb(200, 200, 200);\n"
+"color: #3d3d3d;")
+        self.btn_register.setObjectName("btn_register")
+        self.tabWidget.addTab(self.tab_2, "")
+        MainWindow.setCentralWidget(self.centralwidget)
+        self.status_bar = QtWidgets.QStatusBar(MainWindow)
+        font = QtGui.QFont()
+        font.setFamily("CMU Sans Serif")
+        font.setPointSize(8)
+        font.setBold(False)
+        font.setWeight(50)
+        self.status_bar.setFont(font)
+        self.status_bar.setObjectName("status_bar")
+        MainWindow.setStatusBar(self.status_bar)
+
+        self.retranslateUi(MainWindow)
+        self.tabWidget.setCurrentIndex(0)
+        QtCore.QMetaObject.connectSlotsByName(MainWindow)
+
+    def retranslateUi(self, MainWindow):
+        _translate = QtCore.QCoreApplication.translate
+        MainWindow.setWindowTitle(_translate("MainWindow", "Project Management"))
+        self.login_username.setPlaceholderText(_translate("MainWindow", "Username"))
+        self.login_password.setPlaceholderText(_translate("MainWindow", "Password"))
+        self.btn_login.setText(_translate("MainWindow", "Login"))
+        self.label.setText(_translate("MainWindow", "Project Management Interface"))
+        self.label_2.setText(_translate("MainWindow", "Login"))
+        self.cb_remember_me.setText(_translate("MainWindow", "Remember me"))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab), _translate("MainWindow", "Login"))
+        self.label_3.setText(_translate("MainWindow", "Project Management Interface"))
+        self.label_4.setText(_translate("MainWindow", "Register"))
+        self.reg_username.setPlaceholderText(_translate("MainWindow", "Username"))
+        self.reg_password.setPlaceholderText(_translate("MainWindow", "Password"))
+        self.reg_verify.setPlaceholderText(_translate("MainWindow", "Verify password"))
+        self.btn_register.setText(_translate("MainWindow", "Register"))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_2), _translate("MainWindow", "Register"))
+
+UI_SHA256 = '9f6f1816ce007ca93233953eb766f3f921dd934f6c9446750e15934c510774d3'
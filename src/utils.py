@@ -1,9 +1,31 @@
+from PyQt5.QtCore import QResource
 from PyQt5.QtGui import QFontDatabase
-import qrc.resources
+from PyQt5 import uic
+import importlib.util
 import hashlib
+import io
+import os
+import re
+
+
+RESOURCE_BUNDLE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "res", "resources.rcc"
+)
+UI_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ui")
+_resources_registered = False
+_ui_forms = {}
+
+
+def register_resources():
+    global _resources_registered
+    if not _resources_registered:
+        if not QResource.registerResource(RESOURCE_BUNDLE):
+            print(f"failed to register resources {RESOURCE_BUNDLE=}")
+        _resources_registered = True
 
 
 def add_font_resource(name):
+    register_resources()
     font_db = QFontDatabase()
     if font_db.addApplicationFont(name) == -1:
         print(f"failed to add font {name=}")
@@ -11,5 +33,49 @@ def add_font_resource(name):
         print(f"successfully loaded font {name=}")
 
 
+def _ui_digest(ui_file):
+    with open(ui_file, "rb") as f_ui:
+        return hashlib.sha256(f_ui.read()).hexdigest()
+
+
+def compile_ui(ui_file, output):
+    source = io.StringIO()
+    uic.compileUi(ui_file, source)
+    with open(output, "w") as out:
+        out.write(re.sub(r"(?m)^import \w+_rc\n", "", source.getvalue()))
+        out.write(f"\nUI_SHA256 = {_ui_digest(ui_file)!r}\n")
+
+
+def _compiled_form(ui_file):
+    if ui_file in _ui_forms:
+        return _ui_forms[ui_file]
+    name = os.path.splitext(os.path.basename(ui_file))[0]
+    compiled = os.path.join(UI_FOLDER, f"{name}.py")
+    form = None
+    if os.path.exists(compiled):
+        spec = importlib.util.spec_from_file_location(f"ui.{name}", compiled)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        if getattr(module, "UI_SHA256", None) == _ui_digest(ui_file):
+            form = next(
+                value for key, value in vars(module).items()
+                if key.startswith("Ui_")
+            )
+        else:
+            print(f"compiled form {compiled} is stale, loading {ui_file}")
+    _ui_forms[ui_file] = form
+    return form
+
+
+def load_ui(ui_file, widget):
+    if (form := _compiled_form(ui_file)) is None:
+        return uic.loadUi(ui_file, widget)
+    ui = form()
+    ui.setupUi(widget)
+    for name, child in vars(ui).items():
+        setattr(widget, name, child)
+    return widget
+
+
 def hash_password(password):
     return hashlib.sha256(password.encode()).hexdigest()
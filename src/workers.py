@@ -0,0 +1,88 @@
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+import logging
+
+
+_log = logging.getLogger(__name__)
+
+
+class _WorkerSignals(QObject):
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(object)
+
+
+class Worker(QRunnable):
+    def __init__(self, fn, *args, **kwargs):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = _WorkerSignals()
+
+    def run(self):
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            _log.exception("Background task %r failed", self.fn)
+            self.signals.failed.emit(e)
+        else:
+            self.signals.finished.emit(result)
+
+
+class TaskRunner(QObject):
+    busy_changed = pyqtSignal(bool)
+    failed = pyqtSignal(object)
+
+    def __init__(self, parent=None, *, max_threads=4):
+        super().__init__(parent)
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(max_threads)
+        self._pending = set()
+        self._generations = {}
+
+    def is_busy(self):
+        return bool(self._pending)
+
+    def submit(self, fn, *args, on_result=None, on_error=None, key=None,
+               **kwargs):
+        worker = Worker(fn, *args, **kwargs)
+        if key is not None:
+            self._generations[key] = self._generations.get(key, 0) + 1
+        generation = self._generations.get(key)
+
+        def finish(handler, value):
+            self._pending.discard(worker)
+            if not self._pending:
+                self.busy_changed.emit(False)
+            if key is not None and self._generations[key] != generation:
+                return
+            if handler is not None:
+                handler(value)
+
+        worker.signals.finished.connect(
+            lambda result: finish(on_result, result)
+        )
+        worker.signals.failed.connect(
+            lambda error: finish(on_error or self.failed.emit, error)
+        )
+        if not self._pending:
+            self.busy_changed.emit(True)
+        self._pending.add(worker)
+        self._pool.start(worker)
+        return worker
+
+    def wait(self, msecs=-1):
+        return self._pool.waitForDone(msecs)
+
+
+class EventBridge(QObject):
+    received = pyqtSignal(object)
+
+    def __init__(self, database, event_type, parent=None):
+        super().__init__(parent)
+        self._unsubscribe = database.subscribe(
+            event_type, self.received.emit
+        )
+
+    def close(self):
+        self._unsubscribe()
@@ -1,6 +1,14 @@
+from sqlalchemy import event, select
+from sqlalchemy.engine import make_url
 from sqlalchemy.exc import IntegrityError
-from src.db import Database, HistoricalProject, User, ProjectEntry
+from src.db import (
+    Database, AsyncDatabase, HistoricalProject, User, ProjectEntry,
+    DatabaseEvent, ProjectCreated, RevisionAdded, RevisionRemoved,
+    MembershipChanged, UserCreated, UserUpdated
+)
+from datetime import datetime
 import unittest
+import asyncio
 import os
 
 
@@ -26,6 +34,23 @@ class TestDatabase(unittest.TestCase):
         users = self.db.users.get_all()
         self.assertTrue(len(users) == 2)
 
+    def test_create_user_single_statement(self):
+        statements = []
+        event.listen(
+            self.db.engine, "before_cursor_execute",
+            lambda *args: statements.append(args[2])
+        )
+        self.db.users.create(username="TestUser", password_hash="Hash")
+        self.assertEqual(len(statements), 1)
+
+    def test_open_missing_database(self):
+        url = make_url(os.environ['SQL_TEST_URI'])
+        with self.assertRaises(ValueError):
+            Database(url.set(database=url.database + "_missing"), create=False)
+        self.assertEqual(
+            Database(os.environ['SQL_TEST_URI'], create=False).version, 0
+        )
+
     def test_create_project(self):
         user1 = self.db.users.create(
             username="TestUser1", password_hash="TestPassword"
@@ -115,3 +140,564 @@ class TestDatabase(unittest.TestCase):
         with self.assertRaises(IndexError):
             self.db.get_project(ProjectEntry.id == 9999)
 
+
+    def test_list_project_summaries(self):
+        user1 = self.db.users.create(username="User1", password_hash="Hash1")
+        user2 = self.db.users.create(
+            username="User2", password_hash="Hash2", full_name="Second"
+        )
+        proj1 = self.db.create_project(owner_id=user1, urgency="Low")
+        proj1.update(urgency="High", updated_by=user1)
+        proj2 = self.db.create_project(owner_id=user2, urgency="Medium")
+        summaries = self.db.list_project_summaries()
+        self.assertEqual([s.id for s in summaries], [proj1.id, proj2.id])
+        self.assertEqual(
+            [s.urgency for s in summaries], ["High", "Medium"]
+        )
+        self.assertEqual(
+            [s.owner_name for s in summaries], ["User1", "User2"]
+        )
+        self.assertEqual(
+            summaries[0].created_at, proj1.get_history()[0].created_at
+        )
+        self.assertEqual(
+            summaries[0].updated_at, proj1.get_latest().created_at
+        )
+        page = self.db.list_project_summaries(after_id=proj1.id, limit=1)
+        self.assertEqual([s.id for s in page], [proj2.id])
+        page = self.db.list_project_summaries(limit=1)
+        self.assertEqual([s.id for s in page], [proj1.id])
+
+    def test_revision_sequence(self):
+        user = self.db.users.create(username="User1", password_hash="Hash1")
+        project = self.db.create_project(owner_id=user, urgency="1")
+        project.update(urgency="2", updated_by=user)
+        project.update(urgency="3", updated_by=user)
+        self.assertEqual([p.seq for p in project.get_history()], [1, 2, 3])
+        latest = project.get_latest()
+        project.remove(HistoricalProject.id == latest.id)
+        project.update(urgency="4", updated_by=user)
+        self.assertEqual([p.seq for p in project.get_history()], [1, 2, 4])
+        first = project.get_history()[0]
+        project.remove(HistoricalProject.id == first.id)
+        self.assertEqual(project.get_latest().urgency, "4")
+        self.assertEqual(project.get_latest().seq, 4)
+
+    def test_user_cache(self):
+        user = self.db.users.create(username="TestUser", password_hash="Hash")
+        cache = self.db.users.cache
+        self.assertEqual(self.db.users.get_by_id(user).username, "TestUser")
+        self.assertEqual((cache.hits, cache.misses), (0, 1))
+        self.db.users.get_by_id(user)
+        self.db.users.get_by_username("TestUser")
+        self.assertEqual((cache.hits, cache.misses), (2, 1))
+        self.db.users.update(user, full_name="Test Full Name")
+        self.assertEqual(
+            self.db.users.get_by_username("TestUser").full_name,
+            "Test Full Name"
+        )
+        self.assertEqual((cache.hits, cache.misses), (2, 2))
+        with self.assertRaises(IndexError):
+            self.db.users.get_by_id(9999)
+
+    def test_user_cache_eviction(self):
+        db = Database(os.environ['SQL_TEST_URI'], user_cache_size=2)
+        users = [
+            db.users.create(username=f"User{i}", password_hash="Hash")
+            for i in range(3)
+        ]
+        for user in users:
+            db.users.get_by_id(user)
+        self.assertEqual(len(db.users.cache), 2)
+        db.users.get_by_id(users[2])
+        db.users.get_by_id(users[0])
+        self.assertEqual(
+            (db.users.cache.hits, db.users.cache.misses), (1, 4)
+        )
+
+    def test_get_many_users(self):
+        users = [
+            self.db.users.create(username=f"User{i}", password_hash="Hash")
+            for i in range(5)
+        ]
+        self.db.users.get_by_id(users[0])
+        retrieved = self.db.users.get_many([*users, users[1], 9999])
+        self.assertEqual(sorted(retrieved), sorted(users))
+        self.assertEqual(retrieved[users[3]].username, "User3")
+        self.assertEqual(self.db.users.cache.hits, 1)
+        self.assertEqual(self.db.users.get_many([]), {})
+
+    def test_shared_session_factory(self):
+        user = self.db.users.create(username="TestUser", password_hash="Hash")
+        self.db.create_project(owner_id=user)
+        self.db.create_project(owner_id=user)
+        factories = {
+            id(project._session_factory)
+            for project in self.db.get_projects()
+        }
+        self.assertEqual(factories, {id(self.db._session_factory)})
+        self.assertIs(
+            self.db.users._session_factory, self.db._session_factory
+        )
+
+    def test_pool_statistics(self):
+        self.db.users.create(username="TestUser", password_hash="Hash")
+        self.db.users.get_all()
+        stats = self.db.pool_statistics()
+        self.assertGreaterEqual(stats["checkouts"], 2)
+        self.assertEqual(stats["checkouts"], stats["checkins"])
+        self.assertGreaterEqual(stats["peak_checked_out"], 1)
+        self.assertGreaterEqual(stats["connects"], 1)
+
+    def test_pool_statistics_in_memory(self):
+        db = Database("sqlite://")
+        db.users.create(username="TestUser", password_hash="Hash")
+        stats = db.pool_statistics()
+        self.assertEqual(stats["pool"], "SingletonThreadPool")
+        self.assertIsInstance(stats["size"], int)
+        self.assertIsNone(stats["overflow"])
+        self.assertEqual(stats["checkouts"], stats["checkins"])
+
+    def test_notes_delta_storage(self):
+        db = Database(os.environ['SQL_TEST_URI'], notes_keyframe_interval=3)
+        user = db.users.create(username="TestUser", password_hash="Hash")
+        lines = [f"line {i}\n" for i in range(50)]
+        project = db.create_project(owner_id=user, notes="".join(lines))
+        expected = ["".join(lines)]
+        for i in range(6):
+            lines[i * 7] = f"edited {i}\n"
+            project.update(user, notes="".join(lines))
+            expected.append("".join(lines))
+        project.update(user, urgency="High")
+        expected.append(expected[-1])
+        history = project.get_history()
+        self.assertEqual([p.notes for p in history], expected)
+        self.assertEqual(
+            [p.notes_depth for p in history], [0, 1, 2, 0, 1, 2, 0, 1]
+        )
+        self.assertEqual(project.get_latest().notes, expected[-1])
+        self.assertEqual(project.get(history[4].id).notes, expected[4])
+
+        project.remove(HistoricalProject.id == history[3].id)
+        del expected[3]
+        self.assertEqual(
+            [p.notes for p in project.get_history()], expected
+        )
+
+    def test_update_copies_latest_revision(self):
+        for keyframe_interval in (1, 2):
+            db = Database(
+                os.environ['SQL_TEST_URI'], drop_before_load=True,
+                notes_keyframe_interval=keyframe_interval
+            )
+            user1 = db.users.create(username="User1", password_hash="Hash")
+            user2 = db.users.create(username="User2", password_hash="Hash")
+            empty = db.create_project(owner_id=user1, urgency="Low")
+            empty.update(user2)
+            self.assertIsNone(empty.get_latest().notes)
+            project = db.create_project(
+                owner_id=user1, users=[user2], notes="notes\n",
+                urgency="High"
+            )
+            for _ in range(3):
+                revision_id = project.update(user2)
+            latest = project.get_latest()
+            self.assertEqual(latest.id, revision_id)
+            self.assertEqual(
+                (latest.notes, latest.urgency, latest.created_by, latest.seq),
+                ("notes\n", "High", user2, 4)
+            )
+            self.assertEqual(
+                sorted(u.id for u in project.get_users()), [user1, user2]
+            )
+
+    def test_repack_notes(self):
+        db = Database(os.environ['SQL_TEST_URI'], notes_keyframe_interval=1)
+        user = db.users.create(username="TestUser", password_hash="Hash")
+        notes = "".join(f"line {i}\n" for i in range(20))
+        project = db.create_project(owner_id=user, notes=notes)
+        for i in range(4):
+            project.update(user, notes=notes + f"line {i}\n")
+        expected = [p.notes for p in project.get_history()]
+        self.assertTrue(all(
+            p.notes_delta is None for p in project.get_history()
+        ))
+        db.notes_keyframe_interval = 4
+        self.assertEqual(db.repack_notes(), 5)
+        history = project.get_history()
+        self.assertEqual([p.notes for p in history], expected)
+        self.assertEqual(
+            [p.notes_delta is None for p in history],
+            [True, False, False, False, True]
+        )
+
+    def test_iter_projects(self):
+        user = self.db.users.create(username="TestUser", password_hash="Hash")
+        projects = [self.db.create_project(owner_id=user) for _ in range(5)]
+        pages, after_id = [], None
+        while page := self.db.iter_projects(after_id=after_id, limit=2):
+            pages.append([project.id for project in page])
+            after_id = page[-1].id
+        self.assertEqual([len(page) for page in pages], [2, 2, 1])
+        self.assertEqual(sum(pages, []), [p.id for p in projects])
+
+    def test_get_history_page(self):
+        db = Database(os.environ['SQL_TEST_URI'], notes_keyframe_interval=4)
+        user = db.users.create(username="TestUser", password_hash="Hash")
+        notes = "".join(f"line {i}\n" for i in range(20))
+        project = db.create_project(owner_id=user, notes=notes)
+        for i in range(6):
+            project.update(user, notes=notes + f"edit {i}\n")
+        history = project.get_history()
+        page = project.get_history_page(limit=3)
+        self.assertEqual([p.seq for p in page], [5, 6, 7])
+        page = project.get_history_page(before_seq=page[0].seq, limit=3)
+        self.assertEqual([p.seq for p in page], [2, 3, 4])
+        self.assertEqual(
+            [p.notes for p in page], [p.notes for p in history[1:4]]
+        )
+        page = project.get_history_page(before_seq=page[0].seq, limit=3)
+        self.assertEqual([p.seq for p in page], [1])
+
+    def test_changes_since(self):
+        version, changes = self.db.changes_since(None)
+        self.assertIsNone(changes)
+        user = self.db.users.create(username="TestUser", password_hash="Hash")
+        project = self.db.create_project(owner_id=user)
+        version, changes = self.db.changes_since(version)
+        self.assertEqual(changes, {"projects": {project.id}, "users": {user}})
+        project.update(user, urgency="High")
+        self.db.users.update(user, full_name="Test Full Name")
+        self.assertEqual(self.db.version, version + 2)
+        _, changes = self.db.changes_since(version)
+        self.assertEqual(changes, {"projects": {project.id}, "users": {user}})
+        _, changes = self.db.changes_since(self.db.version)
+        self.assertEqual(changes, {"projects": set(), "users": set()})
+
+    def test_watermark(self):
+        self.assertEqual(self.db.watermark(), {"projects": 0, "users": 0})
+        user = self.db.users.create(username="TestUser", password_hash="Hash")
+        watermark = self.db.watermark()
+        other = Database(os.environ['SQL_TEST_URI'])
+        project = other.create_project(owner_id=user)
+        self.assertEqual(self.db.watermark()["users"], watermark["users"])
+        self.assertNotEqual(self.db.watermark(), watermark)
+        project.update(user, urgency="High")
+        project.update(user, urgency="Low")
+        watermark = self.db.watermark()
+        other.users.update(user, username="Renamed")
+        self.assertEqual(
+            self.db.watermark(),
+            watermark | {"users": watermark["users"] + 1}
+        )
+        watermark = self.db.watermark()
+        middle = project.get_history()[1].id
+        other.get_project(ProjectEntry.id == project.id).remove(
+            HistoricalProject.id == middle
+        )
+        self.assertEqual(self.db.watermark()["users"], watermark["users"])
+        self.assertNotEqual(self.db.watermark(), watermark)
+        watermark = self.db.watermark()
+        project.remove(HistoricalProject.id == project.get_latest().id)
+        project.update(user, urgency="Again")
+        self.assertNotEqual(self.db.watermark(), watermark)
+        other.engine.dispose()
+
+    def test_events(self):
+        events = []
+        unsubscribe = self.db.subscribe(DatabaseEvent, events.append)
+        revisions = []
+        self.db.subscribe(RevisionAdded, revisions.append)
+        user1 = self.db.users.create(username="User1", password_hash="Hash")
+        user2 = self.db.users.create(username="User2", password_hash="Hash")
+        self.db.users.update(user2, full_name="Second")
+        project = self.db.create_project(owner_id=user1)
+        first = project.get_latest().id
+        project.update(user1, urgency="High")
+        second = project.get_latest().id
+        project.update(user1, users=[user2])
+        third = project.get_latest().id
+        project.remove(HistoricalProject.id == first)
+        self.assertEqual(events, [
+            UserCreated(user1),
+            UserCreated(user2),
+            UserUpdated(user2),
+            ProjectCreated(project.id, first, user1),
+            RevisionAdded(project.id, second, user1),
+            RevisionAdded(project.id, third, user1),
+            MembershipChanged(project.id, third, frozenset({user1, user2})),
+            RevisionRemoved(project.id, first),
+        ])
+        self.assertEqual([e.revision_id for e in revisions], [second, third])
+        unsubscribe()
+        self.db.users.create(username="User3", password_hash="Hash")
+        self.assertEqual(len(events), 8)
+
+    def test_create_projects(self):
+        users = [
+            self.db.users.create(username=f"User{i}", password_hash="Hash")
+            for i in range(3)
+        ]
+        created = []
+        self.db.subscribe(ProjectCreated, created.append)
+        projects = self.db.create_projects([
+            {"owner_id": users[0], "urgency": "Low"},
+            {"owner_id": users[1], "users": users[2:], "notes": "Notes"},
+            {"owner_id": users[2], "users": users[:2]},
+        ])
+        self.assertEqual([p.owner_id for p in projects], users)
+        self.assertEqual([e.project_id for e in created],
+                         [p.id for p in projects])
+        self.assertEqual(projects[0].get_latest().urgency, "Low")
+        self.assertEqual(projects[1].get_latest().notes, "Notes")
+        self.assertEqual(projects[1].get_latest().seq, 1)
+        self.assertEqual(
+            sorted(u.id for u in projects[2].get_users()), users
+        )
+        with self.assertRaises(ValueError):
+            self.db.create_projects([
+                {"owner_id": users[0]},
+                {"owner_id": users[1], "users": [9999]},
+            ])
+        for field in ("colour", "project_id", "seq", "created_by", "id",
+                      "notes_delta", "notes_depth"):
+            with self.assertRaises(ValueError):
+                self.db.create_projects([{"owner_id": users[0], field: 1}])
+        self.assertEqual(len(self.db.get_projects()), 3)
+
+        def statements(count):
+            executed = []
+            listener = lambda *args: executed.append(args[2])
+            event.listen(self.db.engine, "before_cursor_execute", listener)
+            self.db.create_projects([
+                {"owner_id": users[0], "users": users[1:], "notes": "n"}
+            ] * count)
+            event.remove(self.db.engine, "before_cursor_execute", listener)
+            return len(executed)
+        self.assertEqual(statements(50), statements(1))
+        self.assertEqual(
+            [p.get_latest().seq for p in self.db.get_projects()], [1] * 54
+        )
+
+    def test_export_import_records(self):
+        def by_username(records):
+            names = {
+                r["id"]: r["username"] for r in records if r["type"] == "user"
+            }
+            return [
+                {
+                    "owner": names.get(r.get("owner_id")),
+                    "created_by": names.get(r.get("created_by")),
+                    "users": sorted(names[id] for id in r.get("users", [])),
+                    **{k: v for k, v in r.items() if k not in (
+                        "id", "project_id", "owner_id", "created_by", "users"
+                    )}
+                }
+                for r in records if r["type"] != "user"
+            ]
+
+        users = [
+            self.db.users.create(username=f"User{i}", password_hash="Hash")
+            for i in range(3)
+        ]
+        notes = "".join(f"line {i}\n" for i in range(20))
+        for owner in users:
+            project = self.db.create_project(
+                owner_id=owner, users=[u for u in users if u != owner][:1],
+                notes=notes, urgency="Low"
+            )
+            for i in range(3):
+                project.update(owner, notes=notes + f"line {i}\n")
+            project.update(owner, users=users, deadline=datetime(2030, 1, 1))
+        exported = [*self.db.export_records(batch_size=2)]
+        self.assertEqual(
+            [r["type"] for r in exported[:4]],
+            ["user", "user", "user", "project"]
+        )
+        self.assertEqual(sum(r["type"] == "revision" for r in exported), 15)
+
+        db = Database(os.environ['SQL_TEST_URI'], drop_before_load=True)
+        db.users.create(username="User1", password_hash="Existing")
+        counts = db.import_records(exported, batch_size=4)
+        self.assertEqual(
+            counts, {"users": 2, "projects": 3, "revisions": 15}
+        )
+        reexported = [*db.export_records()]
+        self.assertEqual(by_username(reexported), by_username(exported))
+        project = db.get_projects()[2]
+        self.assertEqual(project.get_latest().seq, 5)
+        self.assertEqual(len(project.get_users()), 3)
+        self.assertTrue(any(
+            p.notes_delta is not None for p in project.get_history()
+        ))
+        with self.assertRaises(ValueError):
+            db.import_records([{"type": "project", "id": 1, "owner_id": 99}])
+
+    def test_search_projects(self):
+        user = self.db.users.create(username="TestUser", password_hash="Hash")
+        apples, pears, both = self.db.create_projects([
+            {"owner_id": user, "notes": "apples apples apples\n"},
+            {"owner_id": user, "notes": "pears\n"},
+            {"owner_id": user, "notes": "apples and pears\n"},
+        ])
+        self.assertEqual(
+            [p.id for p in self.db.search_projects("apples")],
+            [apples.id, both.id]
+        )
+        self.assertEqual(
+            [p.id for p in self.db.search_projects("pears appl")], [both.id]
+        )
+        self.assertEqual(self.db.search_projects("  \"*( "), [])
+
+        pears.update(user, notes="plums\n")
+        self.assertEqual(
+            [p.id for p in self.db.search_projects("pears")], [both.id]
+        )
+        pears.remove(HistoricalProject.id == pears.get_latest().id)
+        self.assertEqual(
+            sorted(p.id for p in self.db.search_projects("pears")),
+            [pears.id, both.id]
+        )
+        self.assertEqual(self.db.rebuild_search_index(), 3)
+        self.assertEqual(self.db.search_projects("plums pears"), [])
+        self.assertEqual(self.db.search_projects("apples", limit=1)[0].id,
+                         apples.id)
+
+    def test_projects_for_user(self):
+        user1 = self.db.users.create(username="User1", password_hash="Hash")
+        user2 = self.db.users.create(username="User2", password_hash="Hash")
+        owned, shared, left = self.db.create_projects([
+            {"owner_id": user1},
+            {"owner_id": user1, "users": [user2]},
+            {"owner_id": user1, "users": [user2]},
+        ])
+        left.update(user1, users=[])
+        self.assertEqual(
+            [p.id for p in self.db.projects_for_user(user1)],
+            [owned.id, shared.id, left.id]
+        )
+        self.assertEqual(
+            [p.id for p in self.db.projects_for_user(user2)], [shared.id]
+        )
+
+    def test_membership_cache(self):
+        user1 = self.db.users.create(username="User1", password_hash="Hash")
+        user2 = self.db.users.create(username="User2", password_hash="Hash")
+        project = self.db.create_project(owner_id=user1, users=[user2])
+        first = project.get_latest().id
+        cache = self.db.memberships
+        self.assertTrue(project.has_user(user2))
+        statements = []
+        event.listen(
+            self.db.engine, "before_cursor_execute",
+            lambda *args: statements.append(args[2])
+        )
+        self.assertTrue(project.has_user(user1))
+        self.assertFalse(project.has_user(9999))
+        self.assertTrue(project.has_user(user2, first))
+        self.assertEqual(cache.hits, 3)
+        self.assertEqual(statements, [])
+
+        project.update(user1, users=[])
+        self.assertFalse(project.has_user(user2))
+        self.assertTrue(project.has_user(user2, first))
+        project.update(user1, urgency="High")
+        self.assertFalse(project.has_user(user2))
+        project.remove(HistoricalProject.id == project.get_latest().id)
+        project.remove(HistoricalProject.id == project.get_latest().id)
+        self.assertTrue(project.has_user(user2))
+        self.assertEqual(
+            self.db.get_project(ProjectEntry.id == project.id).get_user_ids(),
+            {user1, user2}
+        )
+
+        other = Database(os.environ['SQL_TEST_URI'])
+        other.get_project(ProjectEntry.id == project.id).update(
+            user1, users=[]
+        )
+        self.assertTrue(project.has_user(user2))
+        cache.forget_latest()
+        self.assertFalse(project.has_user(user2))
+        other.engine.dispose()
+
+    def _query_plan(self, run):
+        statements = []
+
+        def capture(conn, cursor, statement, parameters, context, many):
+            statements.append((statement, parameters))
+
+        event.listen(self.db.engine, "before_cursor_execute", capture)
+        try:
+            run()
+        finally:
+            event.remove(self.db.engine, "before_cursor_execute", capture)
+        statement, parameters = statements[0]
+        with self.db.engine.connect() as connection:
+            return " | ".join(
+                row.detail for row in connection.exec_driver_sql(
+                    f"EXPLAIN QUERY PLAN {statement}", parameters
+                )
+            )
+
+    @unittest.skipUnless(
+        os.environ['SQL_TEST_URI'].startswith("sqlite"),
+        "EXPLAIN QUERY PLAN output is SQLite specific"
+    )
+    def test_index_plans(self):
+        user = self.db.users.create(username="TestUser", password_hash="Hash")
+        project = self.db.create_project(owner_id=user)
+        plan = self._query_plan(lambda: self.db.projects_for_user(user))
+        self.assertIn(
+            "COVERING INDEX ix_project_users_user_project (user_id=?)", plan
+        )
+        self.assertIn(
+            "INDEX ix_project_entries_latest_revision (latest_revision_id=?)",
+            plan
+        )
+
+        def history_by_time():
+            with self.db.engine.connect() as connection:
+                connection.execute(
+                    select(HistoricalProject.id)
+                    .where(HistoricalProject.project_id == project.id)
+                    .order_by(HistoricalProject.created_at)
+                ).all()
+
+        plan = self._query_plan(history_by_time)
+        self.assertIn("ix_historical_projects_project_created_at", plan)
+        self.assertNotIn("TEMP B-TREE", plan)
+        plan = self._query_plan(project.get_history)
+        self.assertIn("ix_historical_projects_project_seq", plan)
+
+
+class TestAsyncDatabase(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.db = await AsyncDatabase.open(
+            os.environ['SQL_TEST_URI'], drop_before_load=True
+        )
+
+    async def asyncTearDown(self):
+        await self.db.dispose()
+
+    async def test_concurrent_lookups(self):
+        users = [
+            await self.db.users.create(
+                username=f"User{i}", password_hash="Hash"
+            )
+            for i in range(4)
+        ]
+        projects = [
+            await self.db.create_project(owner_id=user, users=users[:i])
+            for i, user in enumerate(users)
+        ]
+        await projects[1].update(users[1], urgency="High")
+        members = await asyncio.gather(
+            *(project.get_users() for project in projects)
+        )
+        self.assertEqual([len(m) for m in members], [1, 2, 3, 4])
+        self.assertEqual((await projects[1].get_latest()).urgency, "High")
+        self.assertTrue(await projects[3].has_user(users[0]))
+        by_id = await self.db.users.get_many(users)
+        self.assertEqual(by_id[users[2]].username, "User2")
+        summaries = await self.db.list_project_summaries()
+        self.assertEqual([s.id for s in summaries], [p.id for p in projects])